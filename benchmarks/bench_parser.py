@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+解析器基准测试（golden corpus）
+
+用 corpus.jsonl 中的代表性频道消息（中/英/韩上币公告、下架公告、Alpha Coin、
+预市永续等，种子来自 data.js 的 notes 字段）测量：
+  - extract_listing_info：消息/秒、单条延迟分位数、峰值内存
+  - dedup_listings：条/秒、峰值内存
+  - update_data_js：条/秒、峰值内存
+
+解析结果与 golden.json 不一致、两个频道的紧凑格式（月份分片）编码/解码结果不一致，
+或吞吐低于 baseline.json 超过允许的幅度时，以非零状态码退出。
+
+用法：
+    python benchmarks/bench_parser.py                    # 运行并对比
+    python benchmarks/bench_parser.py --update-golden    # 解析规则有意变更后重新生成 golden
+    python benchmarks/bench_parser.py --update-baseline  # 在基准机器上重新记录吞吐基线
+"""
+
+import argparse
+import copy
+import json
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(BENCH_DIR.parent))
+
+import scraper  # noqa: E402
+
+CORPUS_FILE = BENCH_DIR / 'corpus.jsonl'
+GOLDEN_FILE = BENCH_DIR / 'golden.json'
+BASELINE_FILE = BENCH_DIR / 'baseline.json'
+
+
+def load_corpus():
+    """读取语料，返回 [(message_id, msg_date, text), ...]"""
+    return list(scraper.iter_dump_messages(CORPUS_FILE))
+
+
+def canonical(listings):
+    """
+    golden 对比用的规范形式
+    text 字段只是原文前 300 字符，不参与对比；同一条消息内的顺序受
+    set 迭代顺序影响，按内容排序
+    """
+    stripped = [{key: value for key, value in listing.items() if key != 'text'} for listing in listings]
+    return sorted(stripped, key=lambda listing: json.dumps(listing, ensure_ascii=False, sort_keys=True))
+
+
+def extract_all(corpus):
+    """解析整个语料，返回 {message_id: listings}"""
+    return {
+        str(message_id): scraper.extract_listing_info(text, message_date=msg_date)
+        for message_id, msg_date, text in corpus
+    }
+
+
+def check_golden(corpus):
+    """对比 golden 结果，返回不一致的消息 ID 列表"""
+    golden = json.loads(GOLDEN_FILE.read_text(encoding='utf-8'))
+    results = extract_all(corpus)
+    diverged = []
+    for message_id in sorted(set(golden) | set(results), key=int):
+        if canonical(results.get(message_id, [])) != golden.get(message_id, []):
+            diverged.append(message_id)
+    return diverged
+
+
+def check_compact_roundtrip(corpus):
+    """
+    两个频道的消息 ID 相同但内容不同（第二个频道的第 i 条消息是语料中下一条消息的文本）时，
+    encode_compact → decode_compact 应该原样还原 listing_record，返回不一致的记录数
+    """
+    listings = []
+    for source, shift in (('channel_a', 0), ('channel_b', 1)):
+        for (message_id, msg_date, _), (_, _, text) in zip(corpus, corpus[shift:] + corpus[:shift]):
+            listings.extend(scraper.collect_message_listings(message_id, msg_date, text, source))
+    expected = [scraper.listing_record(listing) for listing in listings]
+    decoded = scraper.decode_compact(scraper.encode_compact(listings))
+    if len(decoded) != len(expected):
+        return max(len(decoded), len(expected))
+    return sum(1 for record, original in zip(decoded, expected) if record != original)
+
+
+def percentile(sorted_values, fraction):
+    """最近秩法分位数"""
+    index = min(len(sorted_values) - 1, max(0, round(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def peak_memory(func):
+    """运行一次 func，返回 tracemalloc 记录的峰值内存（KB）"""
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / 1024
+
+
+def bench_extract(corpus, rounds):
+    latencies = []
+    for _ in range(rounds):
+        for message_id, msg_date, text in corpus:
+            started = time.perf_counter_ns()
+            scraper.extract_listing_info(text, message_date=msg_date)
+            latencies.append(time.perf_counter_ns() - started)
+    latencies.sort()
+    total = sum(latencies) / 1e9
+    return {
+        'items': len(latencies),
+        'per_sec': len(latencies) / total,
+        'p50_us': percentile(latencies, 0.50) / 1000,
+        'p95_us': percentile(latencies, 0.95) / 1000,
+        'p99_us': percentile(latencies, 0.99) / 1000,
+        'peak_kb': peak_memory(lambda: extract_all(corpus)),
+    }
+
+
+def corpus_listings(corpus):
+    """语料解析出的全部 listing（附带消息 ID，与爬取时一致）"""
+    listings = []
+    for message_id, msg_date, text in corpus:
+        listings.extend(scraper.collect_message_listings(message_id, msg_date, text))
+    return listings
+
+
+def bench_dedup(listings, rounds):
+    # dedup_listings 会原地修改记录，每轮使用独立副本（复制不计时）
+    batches = [copy.deepcopy(listings) for _ in range(rounds)]
+    durations = []
+    for batch in batches:
+        started = time.perf_counter()
+        scraper.dedup_listings(batch)
+        durations.append(time.perf_counter() - started)
+    return {
+        'items': len(listings) * rounds,
+        # 按中位数计算吞吐，单轮只有几十毫秒，个别受干扰的轮次不影响结果
+        'per_sec': len(listings) / statistics.median(durations),
+        'median_ms': statistics.median(durations) * 1000,
+        'peak_kb': peak_memory(lambda: scraper.dedup_listings(copy.deepcopy(listings))),
+    }
+
+
+def bench_export(listings, rounds):
+    # 只计 data.js 的写入；预压缩在 save_outputs 中单独进行，不受压缩级别影响
+    with tempfile.TemporaryDirectory() as tmp:
+        # 写到临时目录，不覆盖仓库中的 data.js
+        original_output = scraper.OUTPUT_JS
+        scraper.OUTPUT_JS = str(Path(tmp) / 'data.js')
+        try:
+            durations = []
+            for _ in range(rounds):
+                started = time.perf_counter()
+                scraper.update_data_js(listings)
+                durations.append(time.perf_counter() - started)
+            peak = peak_memory(lambda: scraper.update_data_js(listings))
+        finally:
+            scraper.OUTPUT_JS = original_output
+    return {
+        'items': len(listings) * rounds,
+        'per_sec': len(listings) / statistics.median(durations),
+        'median_ms': statistics.median(durations) * 1000,
+        'peak_kb': peak,
+    }
+
+
+def print_report(report):
+    print(f"{'阶段':<8}{'条目':>10}{'条/秒':>12}{'峰值内存(KB)':>14}  其他")
+    for stage, result in report.items():
+        extra = ', '.join(
+            f"{key}={value:.1f}" for key, value in result.items()
+            if key not in ('items', 'per_sec', 'peak_kb')
+        )
+        print(f"{stage:<8}{result['items']:>10}{result['per_sec']:>12.0f}{result['peak_kb']:>14.1f}  {extra}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='extract_listing_info 基准测试')
+    parser.add_argument('--rounds', type=int, default=5, help='每个阶段重复的轮数（默认：%(default)s）')
+    parser.add_argument('--max-regression', type=float, default=0.25,
+                        help='允许的吞吐下降比例（默认：%(default)s）')
+    parser.add_argument('--update-golden', action='store_true', help='用当前解析结果重新生成 golden.json')
+    parser.add_argument('--update-baseline', action='store_true', help='用本次吞吐重新生成 baseline.json')
+    args = parser.parse_args()
+
+    corpus = load_corpus()
+    print(f"语料：{len(corpus)} 条消息（{CORPUS_FILE.name}）\n")
+
+    if args.update_golden:
+        golden = {message_id: canonical(listings) for message_id, listings in extract_all(corpus).items()}
+        GOLDEN_FILE.write_text(json.dumps(golden, ensure_ascii=False, indent=1, sort_keys=True) + '\n',
+                               encoding='utf-8')
+        print(f"✓ 已更新 {GOLDEN_FILE.name}")
+
+    failed = False
+    diverged = check_golden(corpus)
+    if diverged:
+        failed = True
+        print(f"❌ {len(diverged)} 条消息的解析结果与 golden 不一致：{', '.join(diverged[:20])}")
+    else:
+        print("✓ 解析结果与 golden 一致")
+    mismatched = check_compact_roundtrip(corpus)
+    if mismatched:
+        failed = True
+        print(f"❌ 两个频道的紧凑格式编码/解码后有 {mismatched} 条记录不一致")
+    else:
+        print("✓ 两个频道的紧凑格式编码/解码结果一致")
+    print()
+
+    listings = corpus_listings(corpus)
+    report = {
+        'extract': bench_extract(corpus, args.rounds),
+        'dedup': bench_dedup(listings, args.rounds),
+        'export': bench_export(scraper.dedup_listings(copy.deepcopy(listings)), args.rounds),
+    }
+    print_report(report)
+    print()
+
+    if args.update_baseline:
+        baseline = {stage: {'per_sec': round(result['per_sec'])} for stage, result in report.items()}
+        BASELINE_FILE.write_text(json.dumps(baseline, indent=2) + '\n', encoding='utf-8')
+        print(f"✓ 已更新 {BASELINE_FILE.name}")
+    elif BASELINE_FILE.exists():
+        baseline = json.loads(BASELINE_FILE.read_text(encoding='utf-8'))
+        for stage, result in report.items():
+            expected = baseline.get(stage, {}).get('per_sec')
+            if not expected:
+                continue
+            floor = expected * (1 - args.max_regression)
+            if result['per_sec'] < floor:
+                failed = True
+                print(f"❌ {stage} 吞吐 {result['per_sec']:.0f}/s 低于基线 {expected}/s 的下限 {floor:.0f}/s")
+            else:
+                print(f"✓ {stage} 吞吐 {result['per_sec']:.0f}/s（基线 {expected}/s）")
+
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
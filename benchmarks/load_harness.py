@@ -0,0 +1,631 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+端到端扩展性测试
+
+用本地的假 Telegram 客户端代替 TelegramClient，由合成的公告消息驱动 scrape_channel 的完整路径
+（抓取 → 解析 → 去重 → 排序 → 写出 cex_listings.json / data.js / 月份分片），在不同消息量下测量：
+  - 总耗时和吞吐（消息/秒）
+  - 各阶段耗时（fetch/extract/dedup/sort/write.*，来自 scraper 的运行指标；fetch 包含假客户端生成消息
+    和在事件循环中等待消息源的时间）
+  - 峰值内存（tracemalloc，计时之后单独再运行一遍测量，不影响计时）
+
+假客户端的消息按消息 ID 即时生成，本身几乎不占内存。可以配置每页请求的延迟、
+上币公告的比例、转发重复公告的比例和语言比例（英文/中文/韩文模板）。
+
+另外两种模式同样只用假客户端（不需要安装 telethon），并与 scrape_channel 的结果对比：
+  - backfill：按 ID 范围并行回填（--parallel），中途触发 FloodWait（--flood-waits）
+  - watch：守护模式，分批推送新消息和一条编辑消息，检查按 --debounce 合并发布
+
+用法：
+    python benchmarks/load_harness.py                             # 1k/10k/100k/1M 条消息
+    python benchmarks/load_harness.py --sizes 1000,10000 --latency 0.05
+    python benchmarks/load_harness.py --density 0.3 --languages en=5,zh=3,ko=2 --output scaling.json
+    python benchmarks/load_harness.py --sizes 100000 --baseline scaling.json   # 吞吐下降超过 25% 时失败
+    python benchmarks/load_harness.py --mode backfill --sizes 10000 --parallel 4 --flood-waits 2
+    python benchmarks/load_harness.py --mode watch --sizes 1000 --bursts 3 --debounce 0.2
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from bisect import bisect_right
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from types import SimpleNamespace
+
+BENCH_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(BENCH_DIR.parent))
+
+import scraper  # noqa: E402
+
+DEFAULT_SIZES = (1000, 10000, 100000, 1000000)
+CHECK_SIZES = (1000, 10000)  # backfill/watch 模式还要用 scrape_channel 再抓取一遍对比
+CHANNEL = 'loadtest'
+START_DATE = datetime(2022, 1, 1, tzinfo=timezone.utc)
+
+# 上币公告模板（格式取自频道的真实消息），{date} 为 ISO 日期，{date_en} 为 "Jun 20, 2025" 形式
+LISTING_TEMPLATES = {
+    'en': (
+        "📢 **Binance Futures Will Launch USDⓈ-Margined {token}USDT Perpetual Contract ({date}) **  "
+        "---------- 🔗 [查看来源](https://www.binance.com/en/support/announcement)",
+        "📢 **BYBIT: Listing of {token}USDT on Bybit Perpetual Pre-Market on {date_en}, 10:30AM UTC **",
+        "📢 **BYBIT: New Listing: {token}USDT Perpetual Contract {date_en} **",
+        "📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list {token} ({name}) for spot tradingDetail:  "
+        "at: {date}T03:03:00Z **",
+        "📢 **Kraken will list {token} for spot trading {date}**",
+        "📢 **KuCoin: Introducing {name} ({token}) on spot {date}**",
+    ),
+    'zh': (
+        "📢 **【hyperliquid】 新上线{token}/USDC永续合约，最高可达3倍杠杆 **  ---------- 🕒 __{date} 11:13:20__",
+        "📢 **Bitget 重要通知：上线 {token} 现货 {date}**",
+        "📢 **OKX LISTING:OKX即将上线{token}（{name}）进行现货交易。 **  ---------- 🕒 __{date} 09:00:00__",
+    ),
+    'ko': (
+        "📢 **UPBIT LISTING:[거래] {name}({token}) 신규 거래지원 안내 (KRW, BTC, USDT 마켓) **  "
+        "---------- 🕒 __{date} 14:00:04__",
+        "📢 **Bithumb LISTING:{name}({token}) 원화 마켓 추가 **  ---------- 🕒 __{date} 15:30:00__",
+    ),
+}
+
+# 其他消息：行情、下架、维护等（不应解析出 listing）
+OTHER_TEMPLATES = {
+    'en': (
+        "📢 **Binance Will Delist {token} on {date} **",
+        "📢 **Weekly market recap: BTC up 3%, ETH flat, funding rates neutral **",
+        "📢 **OKX: Scheduled system upgrade on {date} 06:00 UTC **",
+    ),
+    'zh': (
+        "📢 **比特币今日上涨 3%，市场情绪回暖 **",
+        "📢 **Binance 将于 {date} 下架 {token} **",
+    ),
+    'ko': (
+        "📢 **[안내] 디지털 자산 입출금 일시 중단 안내 ({date}) **",
+        "📢 **UPBIT: [거래] {name}({token}) 거래지원 종료 안내 **",
+    ),
+}
+
+NAME_SUFFIXES = ('Protocol', 'Network', 'Finance', 'Labs', 'AI', 'Chain')
+TOKEN_LETTERS = 'ABCDEFGHJKLMNPQRSTUVWXYZ'
+TOKEN_PAIRS = [first + second for first in TOKEN_LETTERS for second in TOKEN_LETTERS]
+MASK64 = (1 << 64) - 1
+
+
+def _mix(value):
+    """splitmix64：把整数打散成均匀的 64 位哈希（消息内容只由消息 ID 决定，不需要保存）"""
+    value = (value + 0x9E3779B97F4A7C15) & MASK64
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & MASK64
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & MASK64
+    return value ^ (value >> 31)
+
+
+def _fraction(bits):
+    return (bits & 0xFFFF) / 65536
+
+
+def parse_languages(spec):
+    """'en=5,zh=3,ko=2' -> [('en', 0.5), ('zh', 0.8), ('ko', 1.0)]（累计比例）"""
+    weights = []
+    for part in spec.split(','):
+        language, _, weight = part.partition('=')
+        language = language.strip()
+        if language not in LISTING_TEMPLATES:
+            raise ValueError(f"未知的语言 {language}（可选：{', '.join(LISTING_TEMPLATES)}）")
+        weights.append((language, float(weight or 1)))
+    total = sum(weight for _, weight in weights)
+    if total <= 0:
+        raise ValueError("语言比例之和必须大于 0")
+    cumulative = []
+    running = 0.0
+    for language, weight in weights:
+        running += weight / total
+        cumulative.append((language, running))
+    return cumulative
+
+
+class AnnouncementGenerator:
+    """
+    合成频道消息
+
+    每条消息由 (seed, 消息 ID) 的哈希决定，任意顺序、任意次数生成的结果都相同：
+    - density 的消息是上币公告，其余是行情、下架等其他消息
+    - repeat 的消息是最近某条消息的转发（文本相同，解析出的 listing 需要去重）
+    - 语言按 languages 的比例选择，代币代码由消息 ID 生成，公告日期在消息发布后 0~7 天
+    """
+
+    def __init__(self, density=0.2, repeat=0.1, languages='en=5,zh=3,ko=2', seed=1, interval=120):
+        self.density = density
+        self.repeat = repeat
+        cumulative = parse_languages(languages)
+        self.languages = [language for language, _ in cumulative]
+        self.bounds = [bound for _, bound in cumulative[:-1]]
+        self.seed = seed
+        self.interval = interval  # 相邻两条消息的发布间隔（秒）
+        self._days = {}  # 天数 -> (ISO 日期, 英文日期)；生成器本身的开销要远小于被测的流水线
+
+    def date(self, message_id):
+        return START_DATE + timedelta(seconds=message_id * self.interval)
+
+    def _day(self, day):
+        strings = self._days.get(day)
+        if strings is None:
+            date = START_DATE + timedelta(days=day)
+            strings = self._days[day] = (date.strftime('%Y-%m-%d'), f"{date.strftime('%b')} {date.day}, {date.year}")
+        return strings
+
+    @staticmethod
+    def token(message_id):
+        """3~6 个字母的代币代码"""
+        value = _mix(message_id ^ 0x5F3759DF)
+        pairs = len(TOKEN_PAIRS)
+        return (TOKEN_PAIRS[(value >> 2) % pairs] + TOKEN_PAIRS[(value >> 22) % pairs]
+                + TOKEN_PAIRS[(value >> 42) % pairs])[:3 + value % 4]
+
+    def text(self, message_id):
+        value = _mix(self.seed * 1000003 + message_id)
+        if message_id > 1 and _fraction(value >> 16) < self.repeat:
+            # 转发最近 64 条消息中的一条
+            return self.text(max(1, message_id - 1 - (value >> 32) % 64))
+        language = self.languages[bisect_right(self.bounds, _fraction(value >> 40))]
+        templates = (LISTING_TEMPLATES if _fraction(value) < self.density else OTHER_TEMPLATES)[language]
+        token = self.token(message_id)
+        date, date_en = self._day(message_id * self.interval // 86400 + (value >> 24) % 8)
+        return templates[(value >> 56) % len(templates)].format(
+            token=token,
+            name=token.capitalize() + ' ' + NAME_SUFFIXES[(value >> 8) % len(NAME_SUFFIXES)],
+            date=date,
+            date_en=date_en,
+        )
+
+
+class FakeMessage:
+    __slots__ = ('id', 'date', 'text', 'edit_date')
+
+    def __init__(self, message_id, date, text):
+        self.id = message_id
+        self.date = date
+        self.text = text
+        self.edit_date = None
+
+
+class FakeFloodWait(Exception):
+    """假客户端的 FloodWait（与 telethon.errors.FloodWaitError 一样带 seconds）"""
+
+    def __init__(self, seconds):
+        super().__init__(f'A wait of {seconds} seconds is required')
+        self.seconds = seconds
+
+
+class FakeEvent:
+    def __init__(self, chats=None):
+        self.chats = chats
+
+
+class FakeNewMessage(FakeEvent):
+    pass
+
+
+class FakeMessageEdited(FakeEvent):
+    pass
+
+
+# 代替 telethon.events 传给 watch_channel
+FAKE_EVENTS = SimpleNamespace(NewMessage=FakeNewMessage, MessageEdited=FakeMessageEdited)
+
+
+class FakeTelegramClient:
+    """
+    本地的 TelegramClient 替身：频道中有 count 条消息（ID 为 1..count），
+    iter_messages 与 Telethon 一样从新到旧按页返回，每页等待 latency 秒模拟一次请求
+
+    - flood_at 中的请求序号（从 1 开始）抛出 FakeFloodWait(flood_seconds)
+    - post()/edit() 在频道中发布新消息或修改消息，并推送给 add_event_handler 注册的回调
+    - run_until_disconnected() 一直等到 disconnect()
+    """
+
+    def __init__(self, count, generator, latency=0.0, page_size=100, flood_at=(), flood_seconds=0):
+        self.count = count
+        self.generator = generator
+        self.latency = latency
+        self.page_size = page_size
+        self.requests = 0
+        self.flood_at = set(flood_at)
+        self.flood_seconds = flood_seconds
+        self.flood_waits = 0
+        self.edited = {}  # 消息 ID -> 编辑后的 FakeMessage
+        self.handlers = []  # (回调, 事件)
+        self.disconnected = None
+
+    def message(self, message_id):
+        edited = self.edited.get(message_id)
+        if edited is not None:
+            return edited
+        return FakeMessage(message_id, self.generator.date(message_id), self.generator.text(message_id))
+
+    async def get_entity(self, channel):
+        return SimpleNamespace(id=1, title=f'Load test ({self.count} messages)', username=channel)
+
+    def add_event_handler(self, callback, event):
+        self.handlers.append((callback, event))
+
+    async def _push(self, channel, message, event_type):
+        for callback, event in self.handlers:
+            if type(event) is event_type and event.chats == channel:
+                await callback(SimpleNamespace(message=message, chat_id=1))
+
+    async def post(self, channel):
+        """发布下一条消息并推送 NewMessage 事件，返回这条消息"""
+        self.count += 1
+        message = self.message(self.count)
+        await self._push(channel, message, FakeNewMessage)
+        return message
+
+    async def edit(self, channel, message_id, text):
+        """修改消息文本并推送 MessageEdited 事件，返回修改后的消息"""
+        original = self.message(message_id)
+        message = FakeMessage(message_id, original.date, text)
+        message.edit_date = original.date + timedelta(hours=1)
+        self.edited[message_id] = message
+        await self._push(channel, message, FakeMessageEdited)
+        return message
+
+    async def run_until_disconnected(self):
+        self.disconnected = self.disconnected or asyncio.Event()
+        await self.disconnected.wait()
+
+    async def iter_messages(self, entity, limit=None, min_id=0, max_id=0, offset_id=0, **kwargs):
+        top = self.count
+        if offset_id:
+            top = min(top, offset_id - 1)
+        if max_id:
+            top = min(top, max_id - 1)
+        bottom = max(min_id, top - limit if limit is not None else 0)
+        message_id = top
+        while message_id > bottom:
+            self.requests += 1
+            if self.latency:
+                await asyncio.sleep(self.latency)
+            if self.requests in self.flood_at:
+                self.flood_waits += 1
+                raise FakeFloodWait(self.flood_seconds)
+            for message_id in range(message_id, max(bottom, message_id - self.page_size), -1):
+                yield self.message(message_id)
+            message_id -= 1
+
+    async def disconnect(self):
+        if self.disconnected is not None:
+            self.disconnected.set()
+
+
+@contextlib.contextmanager
+def working_directory(path):
+    """临时切换工作目录（scraper 的输出文件都是相对路径）"""
+    previous = os.getcwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(previous)
+
+
+@contextlib.contextmanager
+def patched(**values):
+    """临时替换 scraper 的模块级配置，结束后恢复"""
+    original = {name: getattr(scraper, name) for name in values}
+    for name, value in values.items():
+        setattr(scraper, name, value)
+    try:
+        yield
+    finally:
+        for name, value in original.items():
+            setattr(scraper, name, value)
+
+
+def run_once(size, generator, args):
+    """
+    在临时目录中完整运行一次 scrape_channel
+
+    Returns:
+        (总耗时, 去重后的 listing 数, {阶段: 耗时}, 请求数)
+    """
+    client = FakeTelegramClient(size, generator, args.latency)
+
+    async def connect_client():
+        return client
+
+    metrics = scraper.Metrics()
+    with tempfile.TemporaryDirectory() as tmp, working_directory(tmp), patched(
+        connect_client=connect_client,
+        MESSAGE_LIMIT=size,
+        MESSAGE_CACHE=args.message_cache and 'messages.db',
+        LISTING_DB='',
+        METRICS=metrics,
+        _EXTRACT_CACHE=scraper.ExtractionCache(),
+    ):
+        output = contextlib.nullcontext() if args.verbose else contextlib.redirect_stdout(io.StringIO())
+        started = time.perf_counter()
+        with output:
+            listings = asyncio.run(scraper.scrape_channel(workers=args.workers, channels=[CHANNEL]))
+        elapsed = time.perf_counter() - started
+    if listings is None:
+        raise RuntimeError(f"{size} 条消息的运行失败（加 --verbose 查看输出）")
+    stages = {name: stage['seconds'] for name, stage in metrics.stages.items()}
+    return elapsed, len(listings), stages, client.requests
+
+
+def records(listings):
+    """
+    与顺序无关的输出记录，用于对比不同路径的结果（只比较前端记录的字段：
+    转发的重复公告保留哪一条消息的 ID 取决于处理顺序）
+    """
+    return sorted(json.dumps(scraper.listing_record(listing), ensure_ascii=False, sort_keys=True)
+                  for listing in listings)
+
+
+def reference_records(client):
+    """用 scrape_channel 从头抓取 client 当前的全部消息（包括编辑），作为对比的基准"""
+    reference = FakeTelegramClient(client.count, client.generator)
+    reference.edited = dict(client.edited)
+
+    async def connect_client():
+        return reference
+
+    with tempfile.TemporaryDirectory() as tmp, working_directory(tmp), patched(
+        connect_client=connect_client,
+        MESSAGE_LIMIT=reference.count,
+        MESSAGE_CACHE='',
+        LISTING_DB='',
+        _EXTRACT_CACHE=scraper.ExtractionCache(),
+    ), contextlib.redirect_stdout(io.StringIO()):
+        listings = asyncio.run(scraper.scrape_channel(channels=[CHANNEL]))
+    return records(listings)
+
+
+def run_backfill(size, generator, args):
+    """
+    按 ID 范围并行回填 size 条消息，均匀地在 flood_waits 个请求上触发 FloodWait，
+    结果应与 scrape_channel 相同
+    """
+    pages = max(1, size // 100)
+    flood_at = {pages * (i + 1) // (args.flood_waits + 1) + 1 for i in range(args.flood_waits)}
+    client = FakeTelegramClient(size, generator, args.latency, flood_at=flood_at)
+    # FloodWait 要求等待 0 秒（FloodThrottle 仍会多等 1 秒），之后的请求间隔最多 0.05 秒
+    throttle = scraper.FloodThrottle(max_delay=0.05, flood_wait_error=FakeFloodWait)
+    with tempfile.TemporaryDirectory() as tmp, working_directory(tmp), patched(
+        MESSAGE_CACHE=args.message_cache and 'messages.db',
+        LISTING_DB='',
+        _EXTRACT_CACHE=scraper.ExtractionCache(),
+    ):
+        output = contextlib.nullcontext() if args.verbose else contextlib.redirect_stdout(io.StringIO())
+        started = time.perf_counter()
+        with output:
+            asyncio.run(scraper.backfill(workers=args.workers, channels=[CHANNEL], client=client,
+                                         parallel=args.parallel, throttle=throttle))
+        elapsed = time.perf_counter() - started
+        published = json.loads(Path(scraper.OUTPUT_JSON).read_text(encoding='utf-8'))
+    return {
+        'messages': size,
+        'listings': len(published),
+        'requests': client.requests,
+        'flood_waits': throttle.flood_waits,
+        'seconds': elapsed,
+        'same': records(published) == reference_records(client),
+    }
+
+
+def editable_message(client, newest):
+    """
+    在 newest 条最新的消息中找一条能解析出 listing、且最近没有被转发的公告
+    （被转发时另一条消息也有同样的 listing，编辑后哪条保留取决于顺序）
+    """
+    texts = {}
+    for message_id in range(max(1, client.count - newest - 64), client.count + 1):
+        text = client.message(message_id).text
+        texts[text] = texts.get(text, 0) + 1
+    for message_id in range(client.count, client.count - newest, -1):
+        message = client.message(message_id)
+        token = client.generator.token(message_id)
+        if (texts[message.text] == 1 and token in message.text
+                and scraper.extract_listing_info(message.text, message.date.strftime('%Y-%m-%d'))):
+            return message, token
+    return None, None
+
+
+def run_watch(size, generator, args):
+    """
+    守护模式：频道已有 size 条消息，补齐后分 bursts 批推送新消息（每批 burst_size 条，
+    批之间间隔 3 倍 debounce），最后把一条公告的代币改名后推送编辑事件。
+    发布次数不应超过批数 + 2（补齐一次、编辑一次），结果应与重新抓取全部消息相同
+    """
+    client = FakeTelegramClient(size, generator, args.latency)
+    edited = None
+
+    async def scenario():
+        nonlocal edited
+        task = asyncio.ensure_future(scraper.watch_channel(
+            client=client, debounce=args.debounce, workers=args.workers, channels=[CHANNEL], events=FAKE_EVENTS))
+        # 补齐完成后（第一次发布写出检查点）再推送
+        while not Path(scraper.CHECKPOINT_FILE).exists():
+            if task.done():
+                return task.result()
+            await asyncio.sleep(0.01)
+        for _ in range(args.bursts):
+            # 一批消息在半个 debounce 内陆续到达，应该合并成一次发布
+            for _ in range(args.burst_size):
+                await client.post(CHANNEL)
+                await asyncio.sleep(args.debounce / 2 / args.burst_size)
+            await asyncio.sleep(args.debounce * 3)
+        message, token = editable_message(client, args.burst_size)
+        if message is not None:
+            edited = await client.edit(CHANNEL, message.id, message.text.replace(token, token + 'Z'))
+            await asyncio.sleep(args.debounce * 3)
+        await client.disconnect()
+        return await task
+
+    with tempfile.TemporaryDirectory() as tmp, working_directory(tmp), patched(
+        MESSAGE_LIMIT=size,
+        MESSAGE_CACHE=args.message_cache and 'messages.db',
+        LISTING_DB='',
+        _EXTRACT_CACHE=scraper.ExtractionCache(),
+    ):
+        output = contextlib.nullcontext() if args.verbose else contextlib.redirect_stdout(io.StringIO())
+        started = time.perf_counter()
+        with output:
+            watcher = asyncio.run(scenario())
+        elapsed = time.perf_counter() - started
+        if watcher is None:
+            raise RuntimeError(f"{size} 条消息的守护模式运行失败（加 --verbose 查看输出）")
+        published = json.loads(Path(scraper.OUTPUT_JSON).read_text(encoding='utf-8'))
+    return {
+        'messages': client.count,
+        'listings': len(published),
+        'publishes': watcher.publish_count,
+        'edited': edited is not None,
+        'seconds': elapsed,
+        'same': records(published) == reference_records(client),
+    }
+
+
+def measure(size, generator, args):
+    elapsed, listings, stages, requests = run_once(size, generator, args)
+    result = {
+        'messages': size,
+        'listings': listings,
+        'requests': requests,
+        'seconds': elapsed,
+        'per_sec': size / elapsed,
+        'stages': stages,
+        'peak_mb': None,
+    }
+    if args.memory:
+        tracemalloc.start()
+        try:
+            run_once(size, generator, args)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        result['peak_mb'] = peak / 1024 / 1024
+    return result
+
+
+REPORT_STAGES = ('fetch', 'extract', 'dedup', 'sort', 'write.json', 'write.data_js', 'write.shards')
+
+
+def print_row(result):
+    stages = ''.join(f"{result['stages'].get(stage, 0.0):>17.3f}" for stage in REPORT_STAGES)
+    peak = f"{result['peak_mb']:>12.1f}" if result['peak_mb'] is not None else f"{'-':>12}"
+    print(f"{result['messages']:>10}{result['listings']:>10}{result['seconds']:>10.2f}"
+          f"{result['per_sec']:>10.0f}{stages}{peak}", flush=True)
+
+
+def check_baseline(results, path, max_regression):
+    """对比基线中相同消息量的吞吐，返回是否通过"""
+    baseline = {entry['messages']: entry for entry in json.loads(Path(path).read_text(encoding='utf-8'))['results']}
+    passed = True
+    for result in results:
+        expected = baseline.get(result['messages'], {}).get('per_sec')
+        if not expected:
+            continue
+        floor = expected * (1 - max_regression)
+        if result['per_sec'] < floor:
+            passed = False
+            print(f"❌ {result['messages']} 条：吞吐 {result['per_sec']:.0f}/s 低于基线 {expected:.0f}/s 的下限 {floor:.0f}/s")
+        else:
+            print(f"✓ {result['messages']} 条：吞吐 {result['per_sec']:.0f}/s（基线 {expected:.0f}/s）")
+    return passed
+
+
+def run_checks(sizes, generator, args):
+    """backfill / watch 模式：逐个消息量运行并与 scrape_channel 的结果对比，返回是否全部通过"""
+    passed = True
+    for size in sizes:
+        if args.mode == 'backfill':
+            result = run_backfill(size, generator, args)
+            summary = (f"{result['requests']} 次请求，{result['flood_waits']} 次 FloodWait，"
+                       f"并行 {args.parallel}")
+            ok = result['same'] and result['flood_waits'] == args.flood_waits
+        else:
+            result = run_watch(size, generator, args)
+            summary = (f"{args.bursts} 批推送，发布 {result['publishes']} 次，"
+                       f"{'含' if result['edited'] else '没有找到可以'}编辑消息")
+            ok = result['same'] and result['publishes'] <= args.bursts + 2
+        passed = passed and ok
+        print(f"{'✓' if ok else '❌'} {result['messages']} 条消息：{result['listings']} 个 listing，{summary}，"
+              f"耗时 {result['seconds']:.2f}s，与 scrape_channel 的结果{'一致' if result['same'] else '不一致'}",
+              flush=True)
+    return passed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='抓取 → 解析 → 去重 → 写出的端到端扩展性测试')
+    parser.add_argument('--mode', choices=('scrape', 'backfill', 'watch'), default='scrape',
+                        help='scrape：测量吞吐；backfill：并行回填 + FloodWait；watch：守护模式推送事件（默认：%(default)s）')
+    parser.add_argument('--sizes', help=f"逗号分隔的消息数（默认：{','.join(map(str, DEFAULT_SIZES))}，"
+                                        f"backfill/watch 模式为 {','.join(map(str, CHECK_SIZES))}）")
+    parser.add_argument('--latency', type=float, default=0.0, help='每页（100 条）请求的延迟秒数（默认：%(default)s）')
+    parser.add_argument('--density', type=float, default=0.2, help='上币公告占消息的比例（默认：%(default)s）')
+    parser.add_argument('--repeat', type=float, default=0.1, help='转发重复公告的比例（默认：%(default)s）')
+    parser.add_argument('--languages', default='en=5,zh=3,ko=2', help='语言比例（默认：%(default)s）')
+    parser.add_argument('--seed', type=int, default=1, help='合成消息的随机种子（默认：%(default)s）')
+    parser.add_argument('--workers', type=int, default=0, help='解析进程数（默认：%(default)s）')
+    parser.add_argument('--message-cache', action='store_true', help='同时写入原始消息缓存（messages.db）')
+    parser.add_argument('--no-memory', dest='memory', action='store_false',
+                        help='不测量峰值内存（tracemalloc 需要再运行一遍，且明显更慢）')
+    parser.add_argument('--output', metavar='PATH', help='把结果写成 JSON（可以作为之后的 --baseline）')
+    parser.add_argument('--baseline', metavar='PATH', help='与之前 --output 的结果对比吞吐')
+    parser.add_argument('--max-regression', type=float, default=0.25,
+                        help='允许的吞吐下降比例（默认：%(default)s）')
+    parser.add_argument('--parallel', type=int, default=4, help='backfill 模式同时获取的 ID 范围数（默认：%(default)s）')
+    parser.add_argument('--flood-waits', type=int, default=1, help='backfill 模式触发的 FloodWait 次数（默认：%(default)s）')
+    parser.add_argument('--debounce', type=float, default=0.2, help='watch 模式的合并发布秒数（默认：%(default)s）')
+    parser.add_argument('--bursts', type=int, default=3, help='watch 模式推送新消息的批数（默认：%(default)s）')
+    parser.add_argument('--burst-size', type=int, default=50, help='watch 模式每批的消息数（默认：%(default)s）')
+    parser.add_argument('--verbose', action='store_true', help='显示 scraper 的输出')
+    args = parser.parse_args()
+
+    try:
+        default_sizes = DEFAULT_SIZES if args.mode == 'scrape' else CHECK_SIZES
+        sizes = [int(size) for size in (args.sizes or ','.join(map(str, default_sizes))).split(',') if size.strip()]
+        generator = AnnouncementGenerator(args.density, args.repeat, args.languages, args.seed)
+    except ValueError as e:
+        parser.error(str(e))
+
+    if args.mode != 'scrape':
+        return 0 if run_checks(sizes, generator, args) else 1
+
+    print(f"公告比例 {args.density}，转发比例 {args.repeat}，语言 {args.languages}，"
+          f"每页延迟 {args.latency}s，解析进程 {args.workers}\n")
+    print(f"{'消息':>10}{'listing':>10}{'总耗时(s)':>10}{'消息/秒':>10}"
+          + ''.join(f"{stage + '(s)':>17}" for stage in REPORT_STAGES) + f"{'峰值内存(MB)':>12}")
+    results = []
+    for size in sizes:
+        result = measure(size, generator, args)
+        results.append(result)
+        print_row(result)
+    print()
+
+    if args.workers:
+        print("注意：tracemalloc 只统计主进程，解析进程的内存不计入峰值\n")
+    if args.output:
+        report = {
+            'created_at': datetime.now().isoformat(timespec='seconds'),
+            'options': {key: getattr(args, key) for key in
+                        ('latency', 'density', 'repeat', 'languages', 'seed', 'workers', 'message_cache')},
+            'results': results,
+        }
+        Path(args.output).write_text(json.dumps(report, ensure_ascii=False, indent=2) + '\n', encoding='utf-8')
+        print(f"✓ 结果已写入 {args.output}")
+    if args.baseline and not check_baseline(results, args.baseline, args.max_regression):
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
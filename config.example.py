@@ -7,6 +7,34 @@ API_HASH = 'YOUR_API_HASH'  # 从 https://my.telegram.org/apps 获取
 # 频道配置
 CHANNEL_USERNAME = 'news6551'  # 频道用户名（不需要 @ 符号）
 
+# 多频道（可选）：同时爬取多个频道，同一个 listing 只保留最早发布的一条，并记录来源频道
+# CHANNELS = ['news6551', 'another_channel']
+CHANNEL_CONCURRENCY = 4  # 同时抓取的频道数
+
 # 爬取配置
 MESSAGE_LIMIT = 500  # 获取最近多少条消息
 
+
+# 并行解析配置（可选，大批量回填时使用）
+EXTRACT_WORKERS = 0  # 解析进程数，0 表示串行解析
+EXTRACT_CHUNK_SIZE = 200  # 每次分发给进程池的消息条数
+EXTRACT_CACHE_SIZE = 10000  # 解析结果缓存的消息数（相同内容的消息只解析一次）
+EXTRACT_CACHE_FILE = 'extract_cache.json'  # 增量运行之间保存解析缓存；设为 '' 则不保存
+
+# 输出配置（可选）
+SHARD_FORMAT = 'compact'  # 月份分片格式：compact（字典编码，体积更小）或 json
+MESSAGE_CACHE = 'messages.db'  # 原始消息缓存，用于 parse 子命令离线重新解析；设为 '' 则不缓存
+LISTING_DB = ''  # listing 数据库（SQLite），如 'listings.db'：只写入变化的记录，可用 export 子命令重新生成输出文件
+EDIT_LOOKBACK = 200  # 增量模式下重新检查检查点之前最近多少条消息是否被编辑过（只重新解析编辑过的），0 表示不检查
+                     # 只在检查点移动后检查（fetch --check-edits 强制检查）
+COMPACT_EVERY = 50  # 增量模式下只追加新记录，追加这么多次后整体重写（按日期重新排序）
+METRICS_FILE = ''  # 各阶段耗时和规则命中统计，.prom 为 Prometheus textfile，其余为 JSON；'' 表示不记录
+
+# 历史回填配置（可选，python scraper.py --backfill N）
+BACKFILL_PAGE_SIZE = 100  # 每页消息数
+BACKFILL_SAVE_EVERY = 10  # 每多少页保存一次进度和已解析的结果
+BACKFILL_PARALLEL = 1  # 按消息 ID 范围同时获取的请求数（--parallel），1 表示逐页顺序获取
+BACKFILL_RANGE_PAGES = 5  # 并行回填时每个 ID 范围的页数
+
+# 守护模式配置（可选，python scraper.py --watch）
+WATCH_DEBOUNCE = 5  # 第一个新 listing 到达后等待的秒数，期间到达的 listing 一起发布
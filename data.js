@@ -3,8293 +3,918 @@
 // 自动从 @news6551 爬取的数据
 
 const cexListings = [
-    {
-        date: '2025-05-23',
-        token: 'KERNEL',
-        token_display: 'KERNEL',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '10:48',
-        notes: '📢 **UPBIT LISTING:[거래] 커널다오(KERNEL) 신규 거래지원 안내 (BTC, USDT 마켓) **  UPBIT LISTING:【交易】KERNELDAO（KERNEL）新增交易支持通知（BTC、USDT市场）  ---------- 🕒 __2025-05-23 1',
-    },
-    {
-        date: '2025-05-23',
-        token: 'SOPH',
-        token_display: 'SOPH (Sophon)',
-        exchange: 'OKX',
-        type: 'spot',
-        time: '20:00',
-        notes: '📢 **OKX LISTING:OKX to list SOPH (Sophon) for spot trading **  OKX LISTING:OKX宣布将上线索芬(Sophon)代币(SOPH)进行现货交易。  ---------- 🔗 [查看来源](https://www.okx.com/',
-    },
-    {
-        date: '2025-05-23',
-        token: 'SOPH',
-        token_display: 'Sophon (SOPH)',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '20:07',
-        notes: '📢 **Binance: Sophon (SOPH) Will Be Available on Binance Alpha and Binance Futures **  Binance: Sophon (SOPH) 将在 Binance Alpha 和 Binance Futures 上线。  -',
-    },
-    {
-        date: '2025-05-26',
-        token: 'HUMA',
-        token_display: 'HUMA',
-        exchange: 'OKX',
-        type: 'spot',
-        time: '11:00',
-        notes: '📢 **OKX LISTING:OKX to list HUMA (Huma Finance) for spot trading **  OKX LISTING:OKX即将上线HUMA（Huma Finance）进行现货交易。  ---------- 🔗 [查看来源](https://www.okx',
-    },
-    {
-        date: '2025-05-27',
-        token: 'HYPER',
-        token_display: 'Hyperlane (HYPER)',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '15:44',
-        notes: '📢 **UPBIT LISTING:[Trade] Market Support for Hyperlane(HYPER), RedStone(RED) (BTC, USDT Market) **  UPBIT LISTING:[交易] 数字货币市场将对Hyperlane(HYPER)和RedSto',
-    },
-    {
-        date: '2025-05-27',
-        token: 'RED',
-        token_display: 'RedStone (RED)',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '15:44',
-        notes: '📢 **UPBIT LISTING:[Trade] Market Support for Hyperlane(HYPER), RedStone(RED) (BTC, USDT Market) **  UPBIT LISTING:[交易] 数字货币市场将对Hyperlane(HYPER)和RedSto',
-    },
-    {
-        date: '2025-05-27',
-        token: 'SOPH',
-        token_display: 'SOPH (Sophon)',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '16:02',
-        notes: '📢 **UPBIT LISTING:[거래] 소폰(SOPH) 신규 거래지원 안내 (KRW, BTC, USDT 마켓) **  UPBIT LISTING:[交易] SOPH（SOPH）新增交易对支持公告（KRW、BTC、USDT市场）  ---------- 🕒 __2025-05-27 1',
-    },
-    {
-        date: '2025-05-27',
-        token: 'ELDE',
-        token_display: 'ELDE',
-        exchange: 'Bybit',
-        type: 'spot',
-        time: '18:56',
-        notes: '📢 **BYBIT: 🔥  Listing of ELDE on Convert & Bybit Savings **  BYBIT: 🔥  ELADE 已在 Convert 和 Bybit Savings 上线  ---------- 🔗 [查看来源](https://announcements.',
-    },
-    {
-        date: '2025-05-28',
-        token: 'SNX',
-        token_display: 'SNX',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '14:00',
-        notes: '📢 **UPBIT LISTING:[거래] 신세틱스(SNX) 거래 유의 종목 지정 기간 연장 안내 **  UPBIT LISTING:[交易] Synthetix（SNX）交易标的预警期间延长通知  ---------- 🕒 __2025-05-28 14:00:04__',
-    },
-    {
-        date: '2025-05-28',
-        token: 'SOPH',
-        token_display: 'Sophon (SOPH)',
-        exchange: 'Binance',
-        type: 'spot',
-        time: '15:16',
-        notes: '📢 **Binance: Introducing Sophon (SOPH) on Binance HODLer Airdrops! Earn SOPH With Retroactive BNB Simple Earn Subscriptions **  Binance: 在Binance HODL',
-    },
-    {
-        date: '2025-05-28',
-        token: 'SOPH',
-        token_display: 'SOPH (Sophon)',
-        exchange: 'OKX',
-        type: 'perp',
-        time: '15:30',
-        notes: '📢 **OKX LISTING:OKX to list perpetual for SOPH crypto **  OKX LISTING:OKX 即将上线 SOPH 永续合约。  ---------- 🔗 [查看来源](https://www.okx.com/help/okx-to-list-pe',
-    },
-    {
-        date: '2025-05-28',
-        token: 'MERL',
-        token_display: 'MERL',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '18:33',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined MERLUSDT Perpetual Contract **  币安期货将推出以美元稳定币Ⓢ为保证金的MERL / USDT永续合约  ---------- 🔗 [查看来源](https://www.bina',
-    },
-    {
-        date: '2025-05-29',
-        token: 'SOPH',
-        token_display: 'Sophon (SOPH)',
-        exchange: 'Binance',
-        type: 'spot',
-        time: '12:00',
-        notes: '📢 **Binance: Introducing Sophon (SOPH): Grab a Share of the 30,000,000 SOPH Prize Pool! **  Binance: Sophon (SOPH) 上线：立即参与，瓜分 30,000,000 SOPH 奖池！  ---',
-    },
-    {
-        date: '2025-05-29',
-        token: 'XTER',
-        token_display: 'XTER',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '14:29',
-        notes: '📢 **Bithumb LISTING:[이벤트] 엑스테리오(XTER) 원화 마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:[活动] 为庆祝XTERIO（XTER）上线韩元市场，举行空投活动。  ---------- 🔗 [查看来源](https://feed.bi',
-    },
-    {
-        date: '2025-05-29',
-        token: 'KMNO',
-        token_display: 'KMNO',
-        exchange: 'OKX',
-        type: 'spot',
-        time: '18:00',
-        notes: '📢 **OKX LISTING:OKX to list KMNO (Kamino Finance) for spot trading **  OKX LISTING:OKX将上线KMNO（Kamino Finance）现货交易。  ---------- 🔗 [查看来源](https://www.ok',
-    },
-    {
-        date: '2025-05-30',
-        token: 'FLOCK',
-        token_display: 'Flock (FLOCK)',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '11:06',
-        notes: '📢 **UPBIT LISTING:[거래] 플록(FLOCK), 포르타(FORT) 신규 거래지원 안내 (BTC, USDT 마켓) **  UPBIT LISTING:[交易] FLOCK（FLOCK）和PORTAL（FORT）新增交易支持通知（BTC, USDT市场）  ---------',
-    },
-    {
-        date: '2025-05-30',
-        token: 'FORT',
-        token_display: 'FORT',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '11:06',
-        notes: '📢 **UPBIT LISTING:[거래] 플록(FLOCK), 포르타(FORT) 신규 거래지원 안내 (BTC, USDT 마켓) **  UPBIT LISTING:[交易] FLOCK（FLOCK）和PORTAL（FORT）新增交易支持通知（BTC, USDT市场）  ---------',
-    },
-    {
-        date: '2025-05-30',
-        token: 'INIT',
-        token_display: 'INISIA (INIT)',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '15:25',
-        notes: '📢 **Bithumb LISTING:[이벤트] 이니시아(INIT), 플록(FLOCK) 원화 마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:[活动] INISIA (INIT)、Flock (FLOCK) 上线韩元市场纪念空投活动  ---------- 🔗 [',
-    },
-    {
-        date: '2025-05-30',
-        token: 'FLOCK',
-        token_display: 'Flock (FLOCK)',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '15:25',
-        notes: '📢 **Bithumb LISTING:[이벤트] 이니시아(INIT), 플록(FLOCK) 원화 마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:[活动] INISIA (INIT)、Flock (FLOCK) 上线韩元市场纪念空投活动  ---------- 🔗 [',
-    },
-    {
-        date: '2025-05-30',
-        token: 'HYPE',
-        token_display: 'HYPERLIQUID (HYPE)',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '16:36',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined HYPEUSDT Perpetual Contract **  Binance期货将推出以USDTⓈ为保证金挂钩的HYPEUSDT永续合约  ---------- 🔗 [查看来源](https://www.b',
-    },
-    {
-        date: '2025-05-30',
-        token: 'BDXN',
-        token_display: 'Bondex (BDXN)',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '17:35',
-        notes: '📢 **Binance: Bondex (BDXN) Will Be Available on Binance Alpha and Binance Futures **  Binance: 邦德克斯（BDXN）将上线币安 Alpha 和币安期货。  ---------- 🔗 [查看来源](https',
-    },
-    {
-        date: '2025-05-30',
-        token: 'ASRR',
-        token_display: 'ASRR',
-        exchange: 'Bybit',
-        type: 'spot',
-        time: '21:00',
-        notes: '📢 **BYBIT: 🔥 Listing of ASRR on Convert **  BYBIT：🔥 ASRR 在 Convert 交易对上架  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/-listing-of-a',
-    },
-    {
-        date: '2025-06-02',
-        token: 'XEM',
-        token_display: 'XEM',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '15:00',
-        notes: '📢 **UPBIT LISTING:[거래] 넴(XEM) 거래지원 종료 안내 (7/3 15:00) **  UPBIT LISTING:【交易】NEM（XEM）交易支持结束通知（7月3日 15:00）  ---------- 🕒 __2025-06-02 18:30:10__',
-    },
-    {
-        date: '2025-06-02',
-        token: 'SOPH',
-        token_display: 'SOPH (Sophon)',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '16:12',
-        notes: '📢 **Bithumb LISTING:[이벤트] 소폰(SOPH) 원화 마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:[活动] SOPH韩元市场上线庆祝空投活动  ---------- 🔗 [查看来源](https://feed.bithumb.com/notice',
-    },
-    {
-        date: '2025-06-03',
-        token: 'ENA',
-        token_display: 'Ethena (ENA)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '05:24',
-        notes: '📢 **COINBASE LISTING: Assets added to the roadmap today: Ethena (ENA) **  COINBASE LISTING: 今日路线图新增资产：Ethena（ENA）  ---------- 🔗 [查看来源](https://twitter',
-    },
-    {
-        date: '2025-06-03',
-        token: 'NXPC',
-        token_display: 'NXPC',
-        exchange: 'OKX',
-        type: 'perp',
-        time: '14:00',
-        notes: '📢 **OKX LISTING:OKX to list perpetual futures for NXPC, LAUNCHCOIN, MUBARAK crypto **  OKX LISTING:OKX将上线NXPC、LAUNCHCOIN、MUBARAK加密资产的永续合约。  ----------',
-    },
-    {
-        date: '2025-06-03',
-        token: 'LAUNCHCOIN',
-        token_display: 'LAUNCHCOIN',
-        exchange: 'OKX',
-        type: 'perp',
-        time: '14:00',
-        notes: '📢 **OKX LISTING:OKX to list perpetual futures for NXPC, LAUNCHCOIN, MUBARAK crypto **  OKX LISTING:OKX将上线NXPC、LAUNCHCOIN、MUBARAK加密资产的永续合约。  ----------',
-    },
-    {
-        date: '2025-06-03',
-        token: 'MUBARAK',
-        token_display: 'MUBARAK',
-        exchange: 'OKX',
-        type: 'perp',
-        time: '14:00',
-        notes: '📢 **OKX LISTING:OKX to list perpetual futures for NXPC, LAUNCHCOIN, MUBARAK crypto **  OKX LISTING:OKX将上线NXPC、LAUNCHCOIN、MUBARAK加密资产的永续合约。  ----------',
-    },
-    {
-        date: '2025-06-03',
-        token: 'PUFFER',
-        token_display: 'PUFFER',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '17:14',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined PUFFERUSDT and PORT3USDT Perpetual Contracts **  币安期货将推出以USDT为保证金的PUFFERUSDT和PORT3USDT永续合约。  ---------- ',
-    },
-    {
-        date: '2025-06-04',
-        token: 'USDG',
-        token_display: 'USDG',
-        exchange: 'OKX',
-        type: 'spot',
-        time: '14:00',
-        notes: '📢 **OKX LISTING:OKX to list USDG (Global Dollar) for spot trading **  OKX LISTING:OKX将上线USDG（Global Dollar）进行现货交易。  ---------- 🔗 [查看来源](https://www.ok',
-    },
-    {
-        date: '2025-06-04',
-        token: 'PUMP',
-        token_display: 'PUMP (Pump)',
-        exchange: 'Bybit',
-        type: 'spot',
-        time: '16:30',
-        notes: '📢 **BYBIT: 🔥 Listing of PUMPBTC on  Convert **  BYBIT: 🔥 PUMPBTC 在 Convert 平台上线  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/-listi',
-    },
-    {
-        date: '2025-06-04',
-        token: 'RESOLV',
-        token_display: 'RESOLV (Resolv)',
-        exchange: 'OKX',
-        type: 'spot',
-        time: '18:00',
-        notes: '📢 **OKX LISTING:OKX to list RESOLV (Resolv) for spot trading **  OKX LISTING:OKX将上线RESOLV（Resolv）进行现货交易。  ---------- 🔗 [查看来源](https://www.okx.com/help',
-    },
-    {
-        date: '2025-06-05',
-        token: 'ENA',
-        token_display: 'Ethena (ENA)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '00:04',
-        notes: '📢 **Coinbase will add support for Ethena (ENA) on the Ethereum network (ERC-20 token). Do not send this asset over other networks or your funds may be',
-    },
-    {
-        date: '2025-06-05',
-        token: 'LA',
-        token_display: 'Lagrange (LA)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '00:41',
-        notes: '📢 **Coinbase will add support for Lagrange (LA) on the Ethereum network (ERC-20 token). Do not send this asset over other networks or your funds may b',
-    },
-    {
-        date: '2025-06-05',
-        token: 'CAKE',
-        token_display: 'PancakeSwap (CAKE)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '03:21',
-        notes: '📢 **COINBASE LISTING: Assets added to the roadmap today: PancakeSwap (CAKE) **  COINBASE LISTING: 今日路线图中新增资产：PancakeSwap (CAKE)。  ---------- 🔗 [查看来源](',
-    },
-    {
-        date: '2025-06-05',
-        token: 'CAKE',
-        token_display: 'PancakeSwap (CAKE)',
-        exchange: 'Coinbase',
-        type: 'perp',
-        time: '03:21',
-        notes: '📢 **COINBASE LISTING: Assets added to the roadmap today: PancakeSwap (CAKE) **  COINBASE LISTING: 今日路线图中新增资产：PancakeSwap (CAKE)。  ---------- 🔗 [查看来源](',
-    },
-    {
-        date: '2025-06-05',
-        token: 'LA',
-        token_display: 'Lagrange (LA)',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '13:27',
-        notes: '📢 **Bithumb LISTING:[이벤트] 라그랑주(LA) 원화 마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:[活动] 庆祝拉格朗日(LA)新增韩元市场的空投活动  ---------- 🔗 [查看来源](https://feed.bithumb.com/n',
-    },
-    {
-        date: '2025-06-05',
-        token: 'LA',
-        token_display: 'Lagrange (LA)',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '15:03',
-        notes: '📢 **UPBIT LISTING:[거래] 라그랑주(LA) 신규 거래지원 안내 (BTC, USDT 마켓) **  UPBIT LISTING:[交易] 拉格兰奇（LA）新增交易支持公告（支持BTC、USDT市场）  ---------- 🕒 __2025-06-05 15:03:20__',
-    },
-    {
-        date: '2025-06-05',
-        token: 'BOB',
-        token_display: 'BOB',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '18:47',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined 1000000BOBUSDT Perpetual Contract (2025-06-05) **  Binance 期货将推出美元Ⓢ保证金 1000000BOBUSDT 永续合约（2025年6月5日到期） ',
-    },
-    {
-        date: '2025-06-05',
-        token: 'SOPH',
-        token_display: 'SOPH (Sophon)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '9:30 UTC',
-        notes: '📢 **CoinbaseInt Listing: We will add support for Sophon perpetual futures on Coinbase International Exchange and Coinbase Advanced. The opening of our',
-    },
-    {
-        date: '2025-06-05',
-        token: 'SOPH',
-        token_display: 'SOPH (Sophon)',
-        exchange: 'Coinbase',
-        type: 'perp',
-        time: '9:30 UTC',
-        notes: '📢 **CoinbaseInt Listing: We will add support for Sophon perpetual futures on Coinbase International Exchange and Coinbase Advanced. The opening of our',
-    },
-    {
-        date: '2025-06-05',
-        token: 'HYPE',
-        token_display: 'HYPERLIQUID (HYPE)',
-        exchange: 'Hyperliquid',
-        type: 'spot',
-        time: '9:30 UTC',
-        notes: '📢 **CoinbaseInt Listing: We will add support for Hyperliquid perpetual futures on Coinbase International Exchange and Coinbase Advanced. The opening o',
-    },
-    {
-        date: '2025-06-05',
-        token: 'HYPE',
-        token_display: 'HYPERLIQUID (HYPE)',
-        exchange: 'Hyperliquid',
-        type: 'perp',
-        time: '9:30 UTC',
-        notes: '📢 **CoinbaseInt Listing: We will add support for Hyperliquid perpetual futures on Coinbase International Exchange and Coinbase Advanced. The opening o',
-    },
-    {
-        date: '2025-06-05',
-        token: 'HYPE',
-        token_display: 'HYPERLIQUID (HYPE)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '9:30 UTC',
-        notes: '📢 **CoinbaseInt Listing: We will add support for Hyperliquid perpetual futures on Coinbase International Exchange and Coinbase Advanced. The opening o',
-    },
-    {
-        date: '2025-06-05',
-        token: 'HYPE',
-        token_display: 'HYPERLIQUID (HYPE)',
-        exchange: 'Coinbase',
-        type: 'perp',
-        time: '9:30 UTC',
-        notes: '📢 **CoinbaseInt Listing: We will add support for Hyperliquid perpetual futures on Coinbase International Exchange and Coinbase Advanced. The opening o',
-    },
-    {
-        date: '2025-06-06',
-        token: 'FARTCOIN',
-        token_display: 'Fartcoin (FARTCOIN)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '04:47',
-        notes: '📢 **COINBASE LISTING: Assets added to the roadmap today: Fartcoin (FARTCOIN) and Subsquid (SQD) **  COINBASE LISTING: 今日新增至路线图的资产：Fartcoin (FARTCOIN) ',
-    },
-    {
-        date: '2025-06-06',
-        token: 'SQD',
-        token_display: 'Subsquid (SQD)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '04:47',
-        notes: '📢 **COINBASE LISTING: Assets added to the roadmap today: Fartcoin (FARTCOIN) and Subsquid (SQD) **  COINBASE LISTING: 今日新增至路线图的资产：Fartcoin (FARTCOIN) ',
-    },
-    {
-        date: '2025-06-09',
-        token: 'SKATE',
-        token_display: 'Skate (SKATE)',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '13:30',
-        notes: '📢 **Binance: Skate (SKATE) Will Be Available on Binance Alpha and Binance Futures (2025-06-09) **  Binance: Skate（SKATE）将于2025年6月9日上线Binance Alpha和Bin',
-    },
-    {
-        date: '2025-06-10',
-        token: 'WIF',
-        token_display: 'Dogwifhat (WIF)',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '10:14',
-        notes: '📢 **Bithumb LISTING:[마켓 추가] 도그위프햇(WIF), 포켓네트워크(POKT) 원화 마켓 추가 **  Bithumb LISTING:[市场新增] Dogwifhat(WIF)、Pocket Network(POKT) 韩元市场上线。  ---------- 🔗 [查看',
-    },
-    {
-        date: '2025-06-10',
-        token: 'POKT',
-        token_display: 'Network (POKT)',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '10:14',
-        notes: '📢 **Bithumb LISTING:[마켓 추가] 도그위프햇(WIF), 포켓네트워크(POKT) 원화 마켓 추가 **  Bithumb LISTING:[市场新增] Dogwifhat(WIF)、Pocket Network(POKT) 韩元市场上线。  ---------- 🔗 [查看',
-    },
-    {
-        date: '2025-06-10',
-        token: 'EPT',
-        token_display: 'Balance (EPT)',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '12:41',
-        notes: '📢 **UPBIT LISTING:[Trade] Market Support for Balance(EPT) (USDT Market) **  UPBIT LISTING:[交易] 市场对Balance (EPT)的支持（USDT交易对）  ---------- 🔗 [查看来源](https',
-    },
-    {
-        date: '2025-06-10',
-        token: 'AXL',
-        token_display: 'Xela (AXL)',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '12:41',
-        notes: '📢 **UPBIT LISTING:[거래] 엑셀라(AXL) KRW, USDT 마켓 디지털 자산 추가 **  UPBIT LISTING:[交易] Xela (AXL) 韩元 (KRW) 和 Tether (USDT) 市场新增数字资产  ---------- 🕒 __2025-06-10 ',
-    },
-    {
-        date: '2025-06-10',
-        token: 'USDT',
-        token_display: 'Tether (USDT)',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '12:41',
-        notes: '📢 **UPBIT LISTING:[거래] 엑셀라(AXL) KRW, USDT 마켓 디지털 자산 추가 **  UPBIT LISTING:[交易] Xela (AXL) 韩元 (KRW) 和 Tether (USDT) 市场新增数字资产  ---------- 🕒 __2025-06-10 ',
-    },
-    {
-        date: '2025-06-10',
-        token: 'RESOLV',
-        token_display: 'Resolv (RESOLV)',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '15:00',
-        notes: '📢 **Binance: Resolv (RESOLV) Will Be Available on Binance Alpha and Binance Futures (2025-06-10) **  Binance: Resolv (RESOLV) 将于2025年6月10日在Binance Alp',
-    },
-    {
-        date: '2025-06-10',
-        token: 'HOME',
-        token_display: 'App (HOME)',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '15:01',
-        notes: '📢 **Binance: Defi App (HOME) Will Be Available on Binance Alpha and Binance Futures (2025-06-10) **  Binance: DeFi 应用（HOME）将在2025年6月10日上线 Binance Alph',
-    },
-    {
-        date: '2025-06-10',
-        token: 'RESOLV',
-        token_display: 'RESOLV (Resolv)',
-        exchange: 'Bybit',
-        type: 'spot',
-        time: '21:05',
-        notes: '📢 **BYBIT: 🔥 Listing of RESOLV on Convert **  BYBIT: RESOLV在Convert平台上架🔥  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/-listing-of-r',
-    },
-    {
-        date: '2025-06-11',
-        token: 'TAIKO',
-        token_display: 'TAIKO',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '18:15',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined TAIKOUSDT and SQDUSDT Perpetual Contracts (2025-06-11) **  币安期货将于2025年6月11日上线以USDT保证金的TAIKOUSDT和SQDUSDT永',
-    },
-    {
-        date: '2025-06-11',
-        token: 'SQD',
-        token_display: 'Subsquid (SQD)',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '18:15',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined TAIKOUSDT and SQDUSDT Perpetual Contracts (2025-06-11) **  币安期货将于2025年6月11日上线以USDT保证金的TAIKOUSDT和SQDUSDT永',
-    },
-    {
-        date: '2025-06-11',
-        token: 'RESOLV',
-        token_display: 'Resolv (RESOLV)',
-        exchange: 'Binance',
-        type: 'spot',
-        time: '18:24',
-        notes: '📢 **Binance: Introducing Resolv (RESOLV) on Binance HODLer Airdrops! Earn RESOLV With Retroactive BNB Simple Earn Subscriptions **  Binance: HODLer HO',
-    },
-    {
-        date: '2025-06-12',
-        token: 'CAKE',
-        token_display: 'PancakeSwap (CAKE)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '00:21',
-        notes: '📢 **Coinbase will add support for PancakeSwap (CAKE) on the Ethereum network (ERC-20 token). Do not send this asset over other networks or your funds ',
-    },
-    {
-        date: '2025-06-12',
-        token: 'CAKE',
-        token_display: 'PancakeSwap (CAKE)',
-        exchange: 'Coinbase',
-        type: 'perp',
-        time: '00:21',
-        notes: '📢 **Coinbase will add support for PancakeSwap (CAKE) on the Ethereum network (ERC-20 token). Do not send this asset over other networks or your funds ',
-    },
-    {
-        date: '2025-06-12',
-        token: 'SQD',
-        token_display: 'Subsquid (SQD)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '00:24',
-        notes: '📢 **Coinbase will add support for Subsquid (SQD) on the Arbitrum network. Do not send this asset over other networks or your funds may be lost. Transf',
-    },
-    {
-        date: '2025-06-12',
-        token: 'FARTCOIN',
-        token_display: 'Fartcoin (FARTCOIN)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '00:31',
-        notes: '📢 **Coinbase will add support for Fartcoin (FARTCOIN) on the Solana network (SPL token). Do not send this asset over other networks or your funds may ',
-    },
-    {
-        date: '2025-06-12',
-        token: 'SPL',
-        token_display: 'SPL',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '00:31',
-        notes: '📢 **Coinbase will add support for Fartcoin (FARTCOIN) on the Solana network (SPL token). Do not send this asset over other networks or your funds may ',
-    },
-    {
-        date: '2025-06-12',
-        token: 'CUDIS',
-        token_display: 'CUDIS',
-        exchange: 'Bybit',
-        type: 'perp',
-        time: '16:49',
-        notes: '📢 **BYBIT: New Listing : CUDISUSDT Perpetual Contract in Innovation Zone, with up to 20x leverage **  BYBIT: 新上市：创新区CUDOS/USDT永续合约，最高支持20倍杠杆。  -------',
-    },
-    {
-        date: '2025-06-12',
-        token: 'HOME',
-        token_display: 'App (HOME)',
-        exchange: 'Binance',
-        type: 'spot',
-        time: '19:04',
-        notes: '📢 **Binance: Introducing DeFi App (HOME) on Binance HODLer Airdrops! Earn HOME With Retroactive BNB Simple Earn Subscriptions **  Binance: Binance HOD',
-    },
-    {
-        date: '2025-06-12',
-        token: 'FARTCOIN',
-        token_display: 'Fartcoin (FARTCOIN)',
-        exchange: 'Coinbase',
-        type: 'perp',
-        time: '9:30 UTC',
-        notes: '📢 **CoinbaseInt Listing: We will add support for Fartcoin perpetual futures on Coinbase International Exchange and Coinbase Advanced. The opening of o',
-    },
-    {
-        date: '2025-06-13',
-        token: 'LA',
-        token_display: 'Lagrange (LA)',
-        exchange: 'OKX',
-        type: 'perp',
-        time: '11:00',
-        notes: '📢 **OKX LISTING:OKX to list perpetual futures for LA, HOME crypto **  OKX LISTING:OKX将上线LA、HOME代币的永续合约  ---------- 🔗 [查看来源](https://www.okx.com/help/o',
-    },
-    {
-        date: '2025-06-13',
-        token: 'HOME',
-        token_display: 'App (HOME)',
-        exchange: 'OKX',
-        type: 'perp',
-        time: '11:00',
-        notes: '📢 **OKX LISTING:OKX to list perpetual futures for LA, HOME crypto **  OKX LISTING:OKX将上线LA、HOME代币的永续合约  ---------- 🔗 [查看来源](https://www.okx.com/help/o',
-    },
-    {
-        date: '2025-06-16',
-        token: 'AAVE',
-        token_display: 'AAVE',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '14:45',
-        pairs: 'AAVE/USD',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined AAVEUSDC and UNIUSDC Perpetual Contracts (2025-06-16) **  Binance Futures 将推出以美元稳定币Ⓢ结算的 AAVE/USDC 和 UNI/',
-    },
-    {
-        date: '2025-06-16',
-        token: 'UNI',
-        token_display: 'UNI',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '14:45',
-        pairs: 'UNI/USD',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined AAVEUSDC and UNIUSDC Perpetual Contracts (2025-06-16) **  Binance Futures 将推出以美元稳定币Ⓢ结算的 AAVE/USDC 和 UNI/',
-    },
-    {
-        date: '2025-06-16',
-        token: 'HAEDAL',
-        token_display: 'Protocol (HAEDAL)',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '17:04',
-        notes: '📢 **UPBIT LISTING:[Trade] Market Support for Haedal Protocol(HAEDAL) (BTC, USDT Market) **  UPBIT LISTING:[交易] Haedal协议（HAEDAL）获得市场支持（BTC、USDT市场）  ---',
-    },
-    {
-        date: '2025-06-16',
-        token: 'SPK',
-        token_display: 'Spark (SPK)',
-        exchange: 'Binance',
-        type: 'spot',
-        time: '19:33',
-        notes: '📢 **Binance: Introducing Spark (SPK) on Binance HODLer Airdrops! Earn SPK With Retroactive BNB Simple Earn Subscriptions **  Binance: 在Binance HODLer空',
-    },
-    {
-        date: '2025-06-16',
-        token: 'SPK',
-        token_display: 'SPK (Spark)',
-        exchange: 'OKX',
-        type: 'spot',
-        time: '23:00',
-        notes: '📢 **OKX LISTING:OKX to list SPK (Spark) for spot trading **  OKX LISTING:OKX将上线SPK（Spark）进行现货交易。  ---------- 🔗 [查看来源](https://www.okx.com/help/okx-to-',
-    },
-    {
-        date: '2025-06-17',
-        token: 'SPK',
-        token_display: 'Spark (SPK)',
-        exchange: 'Bybit',
-        type: 'perp',
-        time: '17:24',
-        pairs: 'SPK/USD',
-        notes: '📢 **BYBIT: New Listing :  SPKUSDT Perpetual Contract, with up to 25x leverage **  BYBIT: 新上架：SPK/USDT 永续合约，最高25倍杠杆。  ---------- 🔗 [查看来源](https://annou',
-    },
-    {
-        date: '2025-06-17',
-        token: 'BOMB',
-        token_display: 'BOMB',
-        exchange: 'Bybit',
-        type: 'spot',
-        time: '17:31',
-        notes: '📢 **BYBIT: 🔥 Listing of BOMB on Convert **  BYBIT: 🔥 BOMB代币在Convert平台上线  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/-listing-of-bo',
-    },
-    {
-        date: '2025-06-17',
-        token: 'SPK',
-        token_display: 'Spark (SPK)',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '18:17',
-        notes: '📢 **Bithumb LISTING:[이벤트] 스파크(SPK) 원화 마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:[活动] 为庆祝SPARK（SPK）韩元市场上线，举办空投活动  ---------- 🔗 [查看来源](https://feed.bithumb.',
-    },
-    {
-        date: '2025-06-18',
-        token: 'SPK',
-        token_display: 'Spark (SPK)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '01:51',
-        notes: '📢 **Coinbase will add support for Spark (SPK) on the Ethereum network (ERC-20 Token). Do not send this asset over other networks or your funds may be ',
-    },
-    {
-        date: '2025-06-18',
-        token: 'MYX',
-        token_display: 'MYX',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '17:51',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined MYXUSDT and FUSDT Perpetual Contracts (2025-06-18) **  币安期货将推出基于美元稳定币（USDT）的MYXUSDT和FUSDT永续合约，预计上线日期为202',
-    },
-    {
-        date: '2025-06-19',
-        token: 'RAY',
-        token_display: 'Radium (RAY)',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '08:35',
-        notes: '📢 **UPBIT LISTING:[거래] 레이디움(RAY) KRW, USDT 마켓 디지털 자산 추가 **  UPBIT LISTING:[交易] Radium (RAY) 新增 KRW、USDT 市场 数字资产  ---------- 🕒 __2025-06-19 08:35:04__',
-    },
-    {
-        date: '2025-06-19',
-        token: 'HUMA',
-        token_display: 'HUMA',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '13:46',
-        notes: '📢 **Bithumb LISTING:[이벤트] 후마 파이낸스(HUMA), 포르타(FORT) 원화 마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:[活动] HUMA Finance（后马金融）庆祝FORT（音译为\\\\\\\\\\\\\\\\\\\\\\\\\',
-    },
-    {
-        date: '2025-06-19',
-        token: 'FORT',
-        token_display: 'FORT',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '13:46',
-        notes: '📢 **Bithumb LISTING:[이벤트] 후마 파이낸스(HUMA), 포르타(FORT) 원화 마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:[活动] HUMA Finance（后马金融）庆祝FORT（音译为\\\\\\\\\\\\\\\\\\\\\\\\\',
-    },
-    {
-        date: '2025-06-19',
-        token: 'SAHARA',
-        token_display: 'AI (SAHARA)',
-        exchange: 'OKX',
-        type: 'spot',
-        time: '16:00',
-        notes: '📢 **OKX LISTING:OKX to list SAHARA (Sahara AI) for spot trading **  OKX LISTING:OKX将上线SAHARA（Sahara AI）的现货交易  ---------- 🔗 [查看来源](https://www.okx.com/',
-    },
-    {
-        date: '2025-06-19',
-        token: 'NEWT',
-        token_display: 'Protocol (NEWT)',
-        exchange: 'Binance',
-        type: 'pre-market',
-        time: '19:01',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined NEWTUSDT Perpetual Contract Pre-Market Trading **  币安期货将推出以美元稳定币（USDT）为保证金支持的NEWTUSDT永续合约的预市场交易。  ------',
-    },
-    {
-        date: '2025-06-19',
-        token: 'SPK',
-        token_display: 'Spark (SPK)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '9:30 UTC',
-        notes: '📢 **CoinbaseInt Listing: We will add support for Defi App and Spark perpetual futures on Coinbase International Exchange and Coinbase Advanced. The op',
-    },
-    {
-        date: '2025-06-19',
-        token: 'SPK',
-        token_display: 'Spark (SPK)',
-        exchange: 'Coinbase',
-        type: 'perp',
-        time: '9:30 UTC',
-        notes: '📢 **CoinbaseInt Listing: We will add support for Defi App and Spark perpetual futures on Coinbase International Exchange and Coinbase Advanced. The op',
-    },
-    {
-        date: '2025-06-19',
-        token: 'RESOLV',
-        token_display: 'RESOLV (Resolv)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '9:30 UTC',
-        notes: '📢 **CoinbaseInt Listing: We will add support for Resolv perpetual futures on Coinbase International Exchange and Coinbase Advanced. The opening of our',
-    },
-    {
-        date: '2025-06-19',
-        token: 'RESOLV',
-        token_display: 'RESOLV (Resolv)',
-        exchange: 'Coinbase',
-        type: 'perp',
-        time: '9:30 UTC',
-        notes: '📢 **CoinbaseInt Listing: We will add support for Resolv perpetual futures on Coinbase International Exchange and Coinbase Advanced. The opening of our',
-    },
-    {
-        date: '2025-06-20',
-        token: 'NEWT',
-        token_display: 'Protocol (NEWT)',
-        exchange: 'Bybit',
-        type: 'pre-market',
-        time: '10:30 UTC',
-        notes: '📢 **BYBIT: Listing of NEWTUSDT on Bybit Perpetual Pre-Market on Jun 20, 2025, 10:30AM UTC **  BYBIT: 2025年6月20日，UTC时间上午10:30，Bybit永续合约预上市市场将上线NEWTUSDT',
-    },
-    {
-        date: '2025-06-20',
-        token: 'SAHARA',
-        token_display: 'AI (SAHARA)',
-        exchange: 'Bybit',
-        type: 'pre-market',
-        time: '12:30 UTC',
-        notes: '📢 **BYBIT: Listing of SAHARAUSDT on Bybit Perpetual Pre-Market on Jun 20, 2025, 12:30PM UTC **  BYBIT: SAHARA USDT将于2025年6月20日中午12:30（UTC时间）在Bybit永续合约',
-    },
-    {
-        date: '2025-06-23',
-        token: 'NEWT',
-        token_display: 'Protocol (NEWT)',
-        exchange: 'Binance',
-        type: 'spot',
-        time: '22:08',
-        notes: '📢 **Binance: Introducing Newton Protocol (NEWT) on Binance HODLer Airdrops! Earn NEWT With Retroactive BNB Simple Earn Subscriptions **  Binance: 在 Bi',
-    },
-    {
-        date: '2025-06-24',
-        token: 'DMC',
-        token_display: 'DeLorean (DMC)',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '16:15',
-        notes: '📢 **Binance: DeLorean (DMC) Will Be Available on Binance Alpha and Binance Futures (2025-06-24) **  Binance: DeLorean (DMC) 将于2025年6月24日上线Binance Alph',
-    },
-    {
-        date: '2025-06-24',
-        token: 'NEWT',
-        token_display: 'Protocol (NEWT)',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '16:35',
-        notes: '📢 **Bithumb LISTING:[이벤트] 뉴턴 프로토콜(NEWT) 원화 마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:[活动] Newton协议(NEWT)韩元市场上线纪念空投活动  ---------- 🔗 [查看来源](https://feed.bit',
-    },
-    {
-        date: '2025-06-24',
-        token: 'PUMP',
-        token_display: 'PUMP (Pump)',
-        exchange: 'Bybit',
-        type: 'spot',
-        time: '18:01',
-        notes: '📢 **BYBIT: Listing billboard — PUMPBTC **  BYBIT: 上线公告 — PUMPBTC  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/listing-billboard-pum',
-    },
-    {
-        date: '2025-06-24',
-        token: 'NEWT',
-        token_display: 'Protocol (NEWT)',
-        exchange: 'Bybit',
-        type: 'spot',
-        time: '21:00',
-        notes: '📢 **BYBIT: 🔥 Listing of NEWT on Convert **  BYBIT: 🔥 NEWT 上架 Convert  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/-listing-of-newt-',
-    },
-    {
-        date: '2025-06-24',
-        token: 'NEWT',
-        token_display: 'Protocol (NEWT)',
-        exchange: 'Binance',
-        type: 'spot',
-        time: '22:15',
-        notes: '📢 **Binance: Introducing Newton Protocol (NEWT): Trade NEWT to Grab a Share of the 2,000,000 NEWT Prize Pool! **  Binance: 介绍牛顿协议（NEWT）：交易NEWT即可瓜分2,00',
-    },
-    {
-        date: '2025-06-24',
-        token: 'SAHARA',
-        token_display: 'AI (SAHARA)',
-        exchange: 'Binance',
-        type: 'spot',
-        time: '22:29',
-        notes: '📢 **Binance: Introducing Sahara AI (SAHARA) on Binance HODLer Airdrops! Earn SAHARA With Retroactive BNB Simple Earn Subscriptions **  Binance: 在Binan',
-    },
-    {
-        date: '2025-06-25',
-        token: 'NEWT',
-        token_display: 'Newton (NEWT)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '00:48',
-        notes: '📢 **Coinbase will add support for Newton (NEWT) on the Ethereum network (ERC-20 Token). Do not send this asset over other networks or your funds may b',
-    },
-    {
-        date: '2025-06-25',
-        token: 'OL',
-        token_display: 'OL',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '17:30',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined OLUSDT Perpetual Contract (2025-06-25) **  Binance期货将推出以美元稳定币Ⓢ计价、面向2030的OLUSDT永续合约（2025-06-25发行）。  -----',
-    },
-    {
-        date: '2025-06-26',
-        token: 'SAHARA',
-        token_display: 'AI (SAHARA)',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '10:40',
-        notes: '📢 **UPBIT LISTING:[거래] 사하라에이아이(SAHARA) 신규 거래지원 안내 (KRW, BTC, USDT 마켓) **  UPBIT LISTING:[交易] 新增支持SAHARA交易对的公告（KRW、BTC、USDT市场）  ---------- 🕒 __2025-06-',
-    },
-    {
-        date: '2025-06-26',
-        token: 'SAHARA',
-        token_display: 'AI (SAHARA)',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '10:59',
-        notes: '📢 **Bithumb LISTING:[마켓 추가] 사하라에이아이(SAHARA) 원화 마켓 추가 **  Bithumb LISTING:[添加市场] 在Sahara AI（SAHARA）中添加韩元市场。  ---------- 🔗 [查看来源](https://feed.bithumb.c',
-    },
-    {
-        date: '2025-06-26',
-        token: 'SAHARA',
-        token_display: 'AI (SAHARA)',
-        exchange: 'Bybit',
-        type: 'spot',
-        time: '19:02',
-        notes: '📢 **BYBIT: 🔥 Listing of SAHARA on Convert **  BYBIT: 🔥 SAHARA代币已上线Convert交易平台  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/-listing',
-    },
-    {
-        date: '2025-06-27',
-        token: 'SYRUP',
-        token_display: 'Finance (SYRUP)',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '11:14',
-        notes: '📢 **Bithumb LISTING:메이플 파이낸스(SYRUP) 원화 마켓 추가 **  Bithumb LISTING:Maple Finance (SYRUP) 韩元市场已上线。  ---------- 🔗 [查看来源](https://feed.bithumb.com/notice/1',
-    },
-    {
-        date: '2025-06-30',
-        token: 'COINX',
-        token_display: 'COINX',
-        exchange: 'Bybit',
-        type: 'spot',
-        time: '21:01',
-        notes: '📢 **BYBIT: 🔥 Listing of COINX on Convert & Bybit Savings **  BYBIT: 🔥 COINX 上线 Convert 及 Bybit 储蓄产品  ---------- 🔗 [查看来源](https://announcements.bybit.c',
-    },
-    {
-        date: '2025-06-30',
-        token: 'NVDAX',
-        token_display: 'NVDAX',
-        exchange: 'Bybit',
-        type: 'spot',
-        time: '22:02',
-        notes: '📢 **BYBIT: 🔥  Listing of NVDAX on Convert & Bybit Savings **  BYBIT: 🔥 NVDAX 上线 Convert 和 Bybit Savings  ---------- 🔗 [查看来源](https://announcements.byb',
-    },
-    {
-        date: '2025-07-01',
-        token: 'FRAG',
-        token_display: 'FRAG',
-        exchange: 'Bybit',
-        type: 'spot',
-        time: '16:00',
-        notes: '📢 **BYBIT: 🔥 Listing of FRAG on  Convert **  BYBIT: 🔥 FRAG上线 Convert  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/-listing-of-frag-',
-    },
-    {
-        date: '2025-07-01',
-        token: 'SPL',
-        token_display: 'SPL',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '23:55',
-        notes: '📢 **Coinbase will add support for Wormhole (W) on the Solana network (SPL token). Do not send this asset over other networks or your funds may be lost',
-    },
-    {
-        date: '2025-07-03',
-        token: 'SKY',
-        token_display: 'Sky (SKY)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '06:42',
-        notes: '📢 **COINBASE LISTING: Assets added to the roadmap today: Sky (SKY) and USDS (USDS) **  COINBASE LISTING: 今日添加至路线图的资产：Sky（SKY）和USDS（USDS）。  ---------- ',
-    },
-    {
-        date: '2025-07-03',
-        token: 'MOODENG',
-        token_display: 'MOODENG',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '12:47',
-        notes: '📢 **UPBIT LISTING:[거래] 무뎅(MOODENG) 신규 거래지원 안내 (KRW, BTC, USDT 마켓) **  UPBIT LISTING:[交易] MOODENG新增交易支持通知（KRW, BTC, USDT市场）  ---------- 🕒 __2025-07-03 ',
-    },
-    {
-        date: '2025-07-03',
-        token: 'ICNT',
-        token_display: 'Network (ICNT)',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '16:30',
-        notes: '📢 **Binance: Impossible Cloud Network (ICNT) Will Be Available on Binance Alpha and Binance Futures (2025-07-03) **  Binance: Impossible Cloud Network',
-    },
-    {
-        date: '2025-07-03',
-        token: 'ICNT',
-        token_display: 'Network (ICNT)',
-        exchange: 'Bybit',
-        type: 'spot',
-        time: '17:01',
-        notes: '📢 **BYBIT: 🔥 Listing of ICNT on Convert **  BYBIT: 🔥 ICNT在Convert平台上线  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/-listing-of-icnt',
-    },
-    {
-        date: '2025-07-03',
-        token: 'OM',
-        token_display: 'Mantra (OM)',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '17:31',
-        notes: '📢 **Bithumb LISTING:[이벤트] 휴머니티 프로토콜(H), 만트라(OM) 원화 마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:[活动] 人类协议(H)、Mantra(OM)韩元市场上线纪念空投活动  ---------- 🔗 [查看来源](http',
-    },
-    {
-        date: '2025-07-03',
-        token: 'ICNT',
-        token_display: 'Network (ICNT)',
-        exchange: 'Bybit',
-        type: 'perp',
-        time: '19:14',
-        notes: '📢 **BYBIT: New Listing: ICNTUSDT Perpetual Contract Jul 3, 2025 **  BYBIT: 新款上市：ICNTUSDT永续合约2025年7月3日  ---------- 🔗 [查看来源](https://announcements.bybit',
-    },
-    {
-        date: '2025-07-03',
-        token: 'SAHARA',
-        token_display: 'AI (SAHARA)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '9:30 UTC',
-        notes: '📢 **CoinbaseInt Listing: We will add support for Sahara AI, and Maple Finance perpetual futures on Coinbase International Exchange and Coinbase Advanc',
-    },
-    {
-        date: '2025-07-03',
-        token: 'SAHARA',
-        token_display: 'AI (SAHARA)',
-        exchange: 'Coinbase',
-        type: 'perp',
-        time: '9:30 UTC',
-        notes: '📢 **CoinbaseInt Listing: We will add support for Sahara AI, and Maple Finance perpetual futures on Coinbase International Exchange and Coinbase Advanc',
-    },
-    {
-        date: '2025-07-03',
-        token: 'SYRUP',
-        token_display: 'Finance (SYRUP)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '9:30 UTC',
-        notes: '📢 **CoinbaseInt Listing: We will add support for Sahara AI, and Maple Finance perpetual futures on Coinbase International Exchange and Coinbase Advanc',
-    },
-    {
-        date: '2025-07-03',
-        token: 'SYRUP',
-        token_display: 'Finance (SYRUP)',
-        exchange: 'Coinbase',
-        type: 'perp',
-        time: '9:30 UTC',
-        notes: '📢 **CoinbaseInt Listing: We will add support for Sahara AI, and Maple Finance perpetual futures on Coinbase International Exchange and Coinbase Advanc',
-    },
-    {
-        date: '2025-07-04',
-        token: 'BULLA',
-        token_display: 'BULLA',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '15:11',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined BULLAUSDT and IDOLUSDT Perpetual Contracts (2025-07-04) **  Binance 期货将推出以 USDⓈ 作为保证金的 BULLAUSDT 和 IDOLU',
-    },
-    {
-        date: '2025-07-04',
-        token: 'IDOL',
-        token_display: 'IDOL',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '15:11',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined BULLAUSDT and IDOLUSDT Perpetual Contracts (2025-07-04) **  Binance 期货将推出以 USDⓈ 作为保证金的 BULLAUSDT 和 IDOLU',
-    },
-    {
-        date: '2025-07-09',
-        token: 'TANSSI',
-        token_display: 'Network (TANSSI)',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '00:15',
-        notes: '📢 **Binance: Tanssi Network (TANSSI) Will Be Available on Binance Alpha and Binance Futures (2025-07-09) **  Binance: Tanssi Network (TANSSI) 将于 2025 ',
-    },
-    {
-        date: '2025-07-09',
-        token: 'TANSSI',
-        token_display: 'Network (TANSSI)',
-        exchange: 'Bybit',
-        type: 'perp',
-        time: '20:22',
-        notes: '📢 **BYBIT: New Listing : TANSSIUSDT Perpetual Contract in Innovation Zone, with up to 12.5x leverage **  BYBIT: 新产品上线：创新区推出 TANSSIUSDT 永续合约，最高支持 12.5 ',
-    },
-    {
-        date: '2025-07-09',
-        token: 'LA',
-        token_display: 'Lagrange (LA)',
-        exchange: 'Binance',
-        type: 'spot',
-        time: '22:21',
-        notes: '📢 **Binance: Lagrange (LA) Listing Will Be Postponed **  Binance: Lagrange (LA) 的上线计划将推迟。  ---------- 🔗 [查看来源](https://www.binance.com/en/support/arti',
-    },
-    {
-        date: '2025-07-10',
-        token: 'PUMP',
-        token_display: 'PUMP (Pump)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '03:30',
-        notes: '📢 **CoinbaseInt Listing: We will add support for ****@pumpdotfun**** ****$PUMP**** pre-launch market on Coinbase International Exchange and Coinbase A',
-    },
-    {
-        date: '2025-07-10',
-        token: 'PUMP',
-        token_display: 'PUMP (Pump)',
-        exchange: 'Coinbase',
-        type: 'perp',
-        time: '03:30',
-        notes: '📢 **CoinbaseInt Listing: We will add support for ****@pumpdotfun**** ****$PUMP**** pre-launch market on Coinbase International Exchange and Coinbase A',
-    },
-    {
-        date: '2025-07-10',
-        token: 'UTC',
-        token_display: 'UTC',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '03:30',
-        notes: '📢 **CoinbaseInt Listing: We will add support for ****@pumpdotfun**** ****$PUMP**** pre-launch market on Coinbase International Exchange and Coinbase A',
-    },
-    {
-        date: '2025-07-10',
-        token: 'UTC',
-        token_display: 'UTC',
-        exchange: 'Coinbase',
-        type: 'perp',
-        time: '03:30',
-        notes: '📢 **CoinbaseInt Listing: We will add support for ****@pumpdotfun**** ****$PUMP**** pre-launch market on Coinbase International Exchange and Coinbase A',
-    },
-    {
-        date: '2025-07-10',
-        token: 'SKY',
-        token_display: 'Sky (SKY)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '03:44',
-        notes: '📢 **Coinbase will add support for Sky (SKY) and USDS (USDS) on the Ethereum network (ERC-20 token). Do not send these assets over other networks or yo',
-    },
-    {
-        date: '2025-07-10',
-        token: 'HYPER',
-        token_display: 'Hyperlane (HYPER)',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '10:18',
-        notes: '📢 **Bithumb LISTING:[마켓 추가] 하이퍼레인(HYPER) 원화 마켓 추가 **  Bithumb LISTING:[市场新增] Hyperlane（HYPER）韩元市场上线  ---------- 🔗 [查看来源](https://feed.bithumb.com/noti',
-    },
-    {
-        date: '2025-07-10',
-        token: 'BABY',
-        token_display: 'Babylon (BABY)',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '11:30',
-        notes: '📢 **UPBIT LISTING:[거래] 바빌론(BABY) 신규 거래지원 안내 (BTC, USDT 마켓) **  UPBIT LISTING:[交易] Babylon (BABY) 新增交易支持公告（BTC, USDT 市场）  ---------- 🕒 __2025-07-10 11:',
-    },
-    {
-        date: '2025-07-10',
-        token: 'LA',
-        token_display: 'Lagrange (LA)',
-        exchange: 'Binance',
-        type: 'spot',
-        time: '14:32',
-        notes: '📢 **Binance: Introducing Lagrange (LA): Trade LA to Grab a Share of the 2,500,000 LA Prize Pool! **  Binance: Lagrange (LA) 上线公告： 交易 LA 瓜分 2,500,000 L',
-    },
-    {
-        date: '2025-07-10',
-        token: 'PUMP',
-        token_display: 'PUMP (Pump)',
-        exchange: 'Binance',
-        type: 'pre-market',
-        time: '22:05',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined PUMPUSDT Perpetual Contract Pre-Market Trading (2025-07-10) **  Binance合约将推出以USDT计价的PUMP永续合约预市交易 (2025-0',
-    },
-    {
-        date: '2025-07-10',
-        token: 'PUMPFUN',
-        token_display: 'PUMPFUN',
-        exchange: 'Bybit',
-        type: 'pre-market',
-        time: '5:00 UTC',
-        notes: '📢 **BYBIT: Listing of PUMPFUNUSDT on Bybit Perpetual Pre-Market on Jul 10, 2025, 5:00AM UTC **  BYBIT: PUMPFUNUSDT将于2025年7月10日北京时间上午5:00在Bybit永续合约预上市市',
-    },
-    {
-        date: '2025-07-11',
-        token: 'PUMP',
-        token_display: 'PUMP (Pump)',
-        exchange: 'OKX',
-        type: 'pre-market',
-        time: '11:32',
-        notes: '📢 **OKX LISTING:OKX to list pre-market futures for PUMP (****Pump.fun****) crypto **  OKX LISTING:OKX即将上线PUMP（Pump.fun）的盘前期货交易。  ---------- 🔗 [查看来源](h',
-    },
-    {
-        date: '2025-07-11',
-        token: 'ENA',
-        token_display: 'Etherea (ENA)',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '12:43',
-        notes: '📢 **UPBIT LISTING:[거래] 에테나(ENA) 신규 거래지원 안내 (KRW, BTC, USDT 마켓) **  UPBIT LISTING:[交易] 支持新币种 Etherea (ENA) 交易（KRW, BTC, USDT 市场）通知  ---------- 🕒 __2025',
-    },
-    {
-        date: '2025-07-11',
-        token: 'CROSS',
-        token_display: 'CROSS',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '15:18',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined CROSSUSDT and AINUSDT Perpetual Contracts (2025-07-11) **  Binance期货将推出以美元稳定币（USDⓈ）为保证金基础的CROSSUSDT和AINU',
-    },
-    {
-        date: '2025-07-11',
-        token: 'AIN',
-        token_display: 'AIN',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '15:18',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined CROSSUSDT and AINUSDT Perpetual Contracts (2025-07-11) **  Binance期货将推出以美元稳定币（USDⓈ）为保证金基础的CROSSUSDT和AINU',
-    },
-    {
-        date: '2025-07-11',
-        token: 'HYPE',
-        token_display: 'HYPERLIQUID (HYPE)',
-        exchange: 'Bybit',
-        type: 'spot',
-        time: '16:00',
-        notes: '📢 **BYBIT: 🔥 Listing of HYPE on Convert & Bybit Savings **  BYBIT: 🔥 HYPE 代币已上线 Convert 和 Bybit 储蓄平台。  ---------- 🔗 [查看来源](https://announcements.bybit',
-    },
-    {
-        date: '2025-07-11',
-        token: 'RESOLV',
-        token_display: 'Resolv (RESOLV)',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '16:29',
-        notes: '📢 **Bithumb LISTING:[이벤트] 리졸브(RESOLV) 원화 마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:[活动] Resolv (RESOLV) 韩元市场上线纪念空投活动  ---------- 🔗 [查看来源](https://feed.bit',
-    },
-    {
-        date: '2025-07-15',
-        token: 'PUMP',
-        token_display: 'PUMP (Pump)',
-        exchange: 'Bybit',
-        type: 'spot',
-        time: '05:30',
-        notes: '📢 **BYBIT: 🔥 Listing of PUMP on Convert **  BYBIT: 🔥 PUMP 上线 Convert 交易平台  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/-listing-of-',
-    },
-    {
-        date: '2025-07-15',
-        token: 'SPL',
-        token_display: 'SPL',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '08:39',
-        notes: '📢 **Coinbase will add support for  (PUMP) on the Solana network (SPL token). Do not send this asset over other networks or your funds may be lost. Tra',
-    },
-    {
-        date: '2025-07-15',
-        token: 'PUMP',
-        token_display: 'PUMP (Pump)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '08:39',
-        notes: '📢 **Coinbase will add support for  (PUMP) on the Solana network (SPL token). Do not send this asset over other networks or your funds may be lost. Tra',
-    },
-    {
-        date: '2025-07-15',
-        token: 'VELVET',
-        token_display: 'VELVET',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '14:42',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined CUSDT and VELVETUSDT Perpetual Contracts (2025-07-15) **  Binance 期货将上线以 USDⓈ 计价结算的 CUSDT 和 VELVETUSDT 永',
-    },
-    {
-        date: '2025-07-15',
-        token: 'TAC',
-        token_display: 'TAC',
-        exchange: 'Bybit',
-        type: 'spot',
-        time: '17:01',
-        notes: '📢 **BYBIT: 🔥 Listing of TAC on Convert **  BYBIT: TAC 已在 Convert 上架  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/-listing-of-tac-on',
-    },
-    {
-        date: '2025-07-15',
-        token: 'VELVET',
-        token_display: 'VELVET',
-        exchange: 'Bybit',
-        type: 'perp',
-        time: '18:37',
-        notes: '📢 **BYBIT: New Listing : VELVETUSDT Perpetual Contract in Innovation Zone, with up to 12.5x leverage **  BYBIT: 新上线产品：VELVETUSDT永续合约，在创新区推出，最高支持12.5倍杠',
-    },
-    {
-        date: '2025-07-16',
-        token: 'ES',
-        token_display: 'ES',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '16:50',
-        notes: '📢 **Bithumb LISTING:[이벤트] 이클립스(ES) 원화 마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:[活动] 为庆祝Eclipse（ES）韩元市场上线，特别推出空投活动  ---------- 🔗 [查看来源](https://feed.bithu',
-    },
-    {
-        date: '2025-07-16',
-        token: 'ERA',
-        token_display: 'Caldera (ERA)',
-        exchange: 'Binance',
-        type: 'spot',
-        time: '16:58',
-        notes: '📢 **Binance: Introducing Caldera (ERA) on Binance HODLer Airdrops! Earn ERA With Retroactive BNB Simple Earn Subscriptions **  Binance: 在Binance HODLe',
-    },
-    {
-        date: '2025-07-17',
-        token: 'SPX',
-        token_display: 'SPX',
-        exchange: 'OKX',
-        type: 'perp',
-        time: '10:00',
-        notes: '📢 **OKX LISTING:OKX to list perpetual futures for SPX, MOG crypto **  OKX LISTING:OKX即将上线SPX和MOG加密永续合约  ---------- 🔗 [查看来源](https://www.okx.com/help/o',
-    },
-    {
-        date: '2025-07-17',
-        token: 'MOG',
-        token_display: 'MOG',
-        exchange: 'OKX',
-        type: 'perp',
-        time: '10:00',
-        notes: '📢 **OKX LISTING:OKX to list perpetual futures for SPX, MOG crypto **  OKX LISTING:OKX即将上线SPX和MOG加密永续合约  ---------- 🔗 [查看来源](https://www.okx.com/help/o',
-    },
-    {
-        date: '2025-07-17',
-        token: 'ERA',
-        token_display: 'Caldera (ERA)',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '16:30',
-        notes: '📢 **Bithumb LISTING:[이벤트] 칼데라(ERA) 원화 마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:[活动] 庆祝 Caldera (ERA) 韩元市场新增的空投活动  ---------- 🔗 [查看来源](https://feed.bithum',
-    },
-    {
-        date: '2025-07-17',
-        token: 'ERA',
-        token_display: 'Caldera (ERA)',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '17:01',
-        notes: '📢 **UPBIT LISTING:[거래] 칼데라(ERA) 신규 거래지원 안내 (KRW, BTC, USDT 마켓) **  UPBIT LISTING:[交易] 新增对Caldera (ERA)的交易支持公告（KRW, BTC, USDT市场）  ---------- 🕒 __2025-0',
-    },
-    {
-        date: '2025-07-17',
-        token: 'ERA',
-        token_display: 'Caldera (ERA)',
-        exchange: 'Bybit',
-        type: 'spot',
-        time: '22:31',
-        notes: '📢 **BYBIT: 🔥 Listing of ERA on Convert **  BYBIT: 🔥 ERA在Convert平台上线  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/-listing-of-era-on',
-    },
-    {
-        date: '2025-07-17',
-        token: 'ERA',
-        token_display: 'Caldera (ERA)',
-        exchange: 'Binance',
-        type: 'spot',
-        time: '23:03',
-        notes: '📢 **Binance Will Add Caldera (ERA) on Earn, Buy Crypto, Convert, Margin & Futures **  Binance 将在其 Earn、法币交易、闪兑、杠杆及期货平台上线 Caldera (ERA) 币种。  ----------',
-    },
-    {
-        date: '2025-07-18',
-        token: 'ERA',
-        token_display: 'Caldera (ERA)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '00:53',
-        notes: '📢 **Coinbase will add support for Caldera (ERA) on the Ethereum network (ERC-20 Token). Do not send this asset over other networks or your funds may b',
-    },
-    {
-        date: '2025-07-18',
-        token: 'PUMP',
-        token_display: 'PUMP (Pump)',
-        exchange: 'OKX',
-        type: 'spot',
-        time: '12:00',
-        notes: '📢 **OKX LISTING:OKX to list PUMP (Pump) for spot trading **  OKX LISTING:OKX将上线PUMP（Pump）进行现货交易。  ---------- 🔗 [查看来源](https://www.okx.com/help/okx-to-',
-    },
-    {
-        date: '2025-07-18',
-        token: 'ASPECTA',
-        token_display: 'ASP (ASPECTA)',
-        exchange: 'OKX',
-        type: 'spot',
-        time: '16:00',
-        notes: '📢 **OKX LISTING:OKX to list ASP (ASPECTA) for spot trading **  OKX LISTING:OKX将上线ASP（ASPECTA）进行现货交易。  ---------- 🔗 [查看来源](https://www.okx.com/help/okx',
-    },
-    {
-        date: '2025-07-21',
-        token: 'TA',
-        token_display: 'TA',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '10:00',
-        notes: '📢 **Binance: ****Trusta.AI**** (TA) Will Be Available on Binance Alpha and Binance Futures (2025-07-21) **  Binance: Trusta.AI（TA）将于2025年7月21日在币安Alpha',
-    },
-    {
-        date: '2025-07-21',
-        token: 'STRIKE',
-        token_display: 'STRIKE',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '15:00',
-        notes: '📢 **UPBIT LISTING:[거래] 스트라이크(STRIKE) 거래지원 종료 안내 (8/21 15:00) **  UPBIT LISTING:[交易] STRIKE（STRIKE）交易支持结束通知（8月21日 15:00）  ---------- 🕒 __2025-07-21 17:',
-    },
-    {
-        date: '2025-07-21',
-        token: 'TA',
-        token_display: 'TA',
-        exchange: 'Bybit',
-        type: 'perp',
-        time: '17:28',
-        notes: '📢 **BYBIT: New Listing : TAUSDT Perpetual Contract in Innovation Zone, with up to 25x leverage **  BYBIT: 新上市：创新区 TAUSDT 永续合约，最高杠杆可达 25 倍。  ----------',
-    },
-    {
-        date: '2025-07-22',
-        token: 'BNKR',
-        token_display: 'BankrCoin (BNKR)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '23:56',
-        notes: '📢 **COINBASE LISTING: Assets added to the roadmap today: BankrCoin (BNKR), Jito Staked SOL (JITOSOL), and Metaplex (MPLX) **  COINBASE LISTING: 今天加入路线',
-    },
-    {
-        date: '2025-07-22',
-        token: 'JITOSOL',
-        token_display: 'SOL (JITOSOL)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '23:56',
-        notes: '📢 **COINBASE LISTING: Assets added to the roadmap today: BankrCoin (BNKR), Jito Staked SOL (JITOSOL), and Metaplex (MPLX) **  COINBASE LISTING: 今天加入路线',
-    },
-    {
-        date: '2025-07-22',
-        token: 'MPLX',
-        token_display: 'Metaplex (MPLX)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '23:56',
-        notes: '📢 **COINBASE LISTING: Assets added to the roadmap today: BankrCoin (BNKR), Jito Staked SOL (JITOSOL), and Metaplex (MPLX) **  COINBASE LISTING: 今天加入路线',
-    },
-    {
-        date: '2025-07-23',
-        token: 'PENGU',
-        token_display: 'PENGU',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '14:00',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined PENGUUSDC, CVXUSDT and SLPUSDT Perpetual Contracts (2025-07-23) **  Binance合约将于2025年7月23日上线USDⓈ保证金交易的PEN',
-    },
-    {
-        date: '2025-07-23',
-        token: 'CVX',
-        token_display: 'CVX',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '14:00',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined PENGUUSDC, CVXUSDT and SLPUSDT Perpetual Contracts (2025-07-23) **  Binance合约将于2025年7月23日上线USDⓈ保证金交易的PEN',
-    },
-    {
-        date: '2025-07-23',
-        token: 'SLP',
-        token_display: 'SLP',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '14:00',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined PENGUUSDC, CVXUSDT and SLPUSDT Perpetual Contracts (2025-07-23) **  Binance合约将于2025年7月23日上线USDⓈ保证金交易的PEN',
-    },
-    {
-        date: '2025-07-23',
-        token: 'COA',
-        token_display: 'COA',
-        exchange: 'Bybit',
-        type: 'spot',
-        time: '17:00',
-        notes: '📢 **BYBIT: 🔥 Listing of COA on Convert **  BYBIT: 🔥 COA 在 Convert 平台上线  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/-listing-of-coa',
-    },
-    {
-        date: '2025-07-24',
-        token: 'LISTA',
-        token_display: 'LISTA',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '10:56',
-        notes: '📢 **Bithumb LISTING:[마켓 추가] 리스타 다오(LISTA), 멀린 체인(MERL) 원화 마켓 추가 **  Bithumb LISTING:[市场新增] 添加 LISTA DAO 和 MERL Chain 的韩元市场。  ---------- 🔗 [查看来源](https',
-    },
-    {
-        date: '2025-07-24',
-        token: 'MERL',
-        token_display: 'MERL',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '14:30',
-        notes: '📢 **Bithumb LISTING:[이벤트] 멀린 체인(MERL) 원화 마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:[活动] 为纪念Merlin Chain（MERL）上线韩元市场，举办空投活动。  ---------- 🔗 [查看来源](https://f',
-    },
-    {
-        date: '2025-07-24',
-        token: 'ERA',
-        token_display: 'Caldera (ERA)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '9:30 UTC',
-        notes: '📢 **CoinbaseInt Listing: We will add support for Caldera, and SushiSwap perpetual futures on Coinbase International Exchange and Coinbase Advanced. Th',
-    },
-    {
-        date: '2025-07-24',
-        token: 'ERA',
-        token_display: 'Caldera (ERA)',
-        exchange: 'Coinbase',
-        type: 'perp',
-        time: '9:30 UTC',
-        notes: '📢 **CoinbaseInt Listing: We will add support for Caldera, and SushiSwap perpetual futures on Coinbase International Exchange and Coinbase Advanced. Th',
-    },
-    {
-        date: '2025-07-24',
-        token: 'SUSHI',
-        token_display: 'SUSHI',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '9:30 UTC',
-        notes: '📢 **CoinbaseInt Listing: We will add support for Caldera, and SushiSwap perpetual futures on Coinbase International Exchange and Coinbase Advanced. Th',
-    },
-    {
-        date: '2025-07-24',
-        token: 'SUSHI',
-        token_display: 'SUSHI',
-        exchange: 'Coinbase',
-        type: 'perp',
-        time: '9:30 UTC',
-        notes: '📢 **CoinbaseInt Listing: We will add support for Caldera, and SushiSwap perpetual futures on Coinbase International Exchange and Coinbase Advanced. Th',
-    },
-    {
-        date: '2025-07-25',
-        token: 'HUMA',
-        token_display: 'HUMA',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '10:19',
-        notes: '📢 **UPBIT LISTING:후마파이낸스(HUMA) 신규 거래지원 안내 (BTC, USDT 마켓) **  UPBIT LISTING:后支付金融（HUMA）新增交易支持通知（BTC、USDT 市场）  ---------- 🔗 [查看来源](https://upbit.com/ser',
-    },
-    {
-        date: '2025-07-25',
-        token: 'SYRUP',
-        token_display: 'Finance (SYRUP)',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '10:19',
-        notes: '📢 **UPBIT LISTING:[거래] 메이플파이낸스(SYRUP) 신규 거래지원 안내 (KRW, BTC, USDT 마켓) **  UPBIT LISTING:[交易] Maple Finance (SYRUP) 新交易支持指南（KRW、BTC、USDT 市场）  ----------',
-    },
-    {
-        date: '2025-07-25',
-        token: 'USELESS',
-        token_display: 'Coin (USELESS)',
-        exchange: 'OKX',
-        type: 'perp',
-        time: '16:00',
-        notes: '📢 **OKX LISTING:OKX to list perpetual futures for USELESS, NEWT crypto **  OKX LISTING:OKX 将上线 USELESS 和 NEWT 加密货币的永续合约。  ---------- 🔗 [查看来源](https://',
-    },
-    {
-        date: '2025-07-25',
-        token: 'NEWT',
-        token_display: 'Protocol (NEWT)',
-        exchange: 'OKX',
-        type: 'perp',
-        time: '16:00',
-        notes: '📢 **OKX LISTING:OKX to list perpetual futures for USELESS, NEWT crypto **  OKX LISTING:OKX 将上线 USELESS 和 NEWT 加密货币的永续合约。  ---------- 🔗 [查看来源](https://',
-    },
-    {
-        date: '2025-07-25',
-        token: 'ZORA',
-        token_display: 'ZORA',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '17:45',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined ZORAUSDT and TAGUSDT Perpetual Contracts (2025-07-25) **  Binance期货将推出以USDⓈ为保证金的ZORAUSDT和TAGUSDT永续合约（发布日',
-    },
-    {
-        date: '2025-07-25',
-        token: 'TAG',
-        token_display: 'TAG',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '17:45',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined ZORAUSDT and TAGUSDT Perpetual Contracts (2025-07-25) **  Binance期货将推出以USDⓈ为保证金的ZORAUSDT和TAGUSDT永续合约（发布日',
-    },
-    {
-        date: '2025-07-26',
-        token: 'RSC',
-        token_display: 'ResearchCoin (RSC)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '00:04',
-        notes: '📢 **COINBASE LISTING: Assets added to the roadmap today: ResearchCoin (RSC) **  COINBASE LISTING: 今日添加至路线图的资产：ResearchCoin（RSC）  ---------- 🔗 [查看来源](h',
-    },
-    {
-        date: '2025-07-28',
-        token: 'OP',
-        token_display: 'OP',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '12:24',
-        notes: '📢 **UPBIT LISTING:[거래] 옵티미즘(OP) 신규 거래지원 안내 (KRW, BTC, USDT 마켓) **  UPBIT LISTING:[交易] 开启Optimism（OP）新交易支持（KRW、BTC、USDT市场）  ---------- 🕒 __2025-07-28 1',
-    },
-    {
-        date: '2025-07-29',
-        token: 'BIO',
-        token_display: 'Protocol (BIO)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '06:13',
-        notes: '📢 **COINBASE LISTING: Assets added to the roadmap today: Bio Protocol (BIO) and Euler (EUL) **  COINBASE LISTING: 今日列入路线图的资产：Bio Protocol (BIO) 和 Eule',
-    },
-    {
-        date: '2025-07-29',
-        token: 'EUL',
-        token_display: 'Euler (EUL)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '06:13',
-        notes: '📢 **COINBASE LISTING: Assets added to the roadmap today: Bio Protocol (BIO) and Euler (EUL) **  COINBASE LISTING: 今日列入路线图的资产：Bio Protocol (BIO) 和 Eule',
-    },
-    {
-        date: '2025-07-29',
-        token: 'ZRC',
-        token_display: 'ZRC',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '15:46',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined ZRCUSDT and ESPORTSUSDT Perpetual Contracts (2025-07-29) **  币安期货将于2025年7月29日推出以 USDT 作为保证金的 ZRCUSDT 和 E',
-    },
-    {
-        date: '2025-07-29',
-        token: 'ESPORTS',
-        token_display: 'ESPORTS',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '15:46',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined ZRCUSDT and ESPORTSUSDT Perpetual Contracts (2025-07-29) **  币安期货将于2025年7月29日推出以 USDT 作为保证金的 ZRCUSDT 和 E',
-    },
-    {
-        date: '2025-07-30',
-        token: 'TREE',
-        token_display: 'Treehouse (TREE)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '02:40',
-        notes: '📢 **Coinbase will add support for Treehouse (TREE) on the Ethereum network (ERC-20 token). Do not send this asset over other networks or your funds ma',
-    },
-    {
-        date: '2025-07-30',
-        token: 'BNKR',
-        token_display: 'BankrCoin (BNKR)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '03:11',
-        notes: '📢 **Coinbase will add support for BankrCoin (BNKR) on the Base network. Do not send this asset over other networks or your funds may be lost. Transfer',
-    },
-    {
-        date: '2025-07-30',
-        token: 'TUNA',
-        token_display: 'TUNA',
-        exchange: 'Bybit',
-        type: 'spot',
-        time: '22:02',
-        notes: '📢 **BYBIT: 🔥 Listing of TUNA on Convert **  BYBIT: 🔥 TUNA上架Convert  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/-listing-of-tuna-on',
-    },
-    {
-        date: '2025-07-31',
-        token: 'BIO',
-        token_display: 'Protocol (BIO)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '00:26',
-        notes: '📢 **Coinbase will add support for Bio Protocol (BIO) on the Ethereum network (ERC-20 token). Do not send this asset over other networks or your funds ',
-    },
-    {
-        date: '2025-07-31',
-        token: 'RSC',
-        token_display: 'ResearchCoin (RSC)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '00:28',
-        notes: '📢 **Coinbase will add support for ResearchCoin (RSC) on the Base network. Do not send this asset over other networks or your funds may be lost. Transf',
-    },
-    {
-        date: '2025-07-31',
-        token: 'NAORIS',
-        token_display: 'Protocol (NAORIS)',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '17:30',
-        notes: '📢 **Binance: Naoris Protocol (NAORIS) Will Be Available on Binance Alpha and Binance Futures (2025-07-31) **  Binance: Naoris Protocol (NAORIS) 将于2025',
-    },
-    {
-        date: '2025-07-31',
-        token: 'PLAY',
-        token_display: 'PlaysOut (PLAY)',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '17:45',
-        notes: '📢 **Binance: PlaysOut (PLAY) Will Be Available on Binance Alpha and Binance Futures (2025-07-31) **  Binance: PlaysOut (PLAY) 将于2025年7月31日在Binance Alp',
-    },
-    {
-        date: '2025-08-04',
-        token: 'TOWNS',
-        token_display: 'Towns (TOWNS)',
-        exchange: 'Binance',
-        type: 'spot',
-        time: '17:12',
-        notes: '📢 **Binance: Introducing Towns (TOWNS) on Binance HODLer Airdrops! Earn TOWNS With Retroactive BNB Simple Earn Subscriptions **  Binance: 在币安HODLer空投活',
-    },
-    {
-        date: '2025-08-05',
-        token: 'PROVE',
-        token_display: 'Succinct (PROVE)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '19:00 UTC',
-        notes: '📢 **CoinbaseInt Listing: We will add support for Succinct perpetual futures on Coinbase International Exchange and Coinbase Advanced. The opening of o',
-    },
-    {
-        date: '2025-08-05',
-        token: 'PROVE',
-        token_display: 'Succinct (PROVE)',
-        exchange: 'Coinbase',
-        type: 'perp',
-        time: '19:00 UTC',
-        notes: '📢 **CoinbaseInt Listing: We will add support for Succinct perpetual futures on Coinbase International Exchange and Coinbase Advanced. The opening of o',
-    },
-    {
-        date: '2025-08-05',
-        token: 'TOWNS',
-        token_display: 'Towns (TOWNS)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '19:00 UTC',
-        notes: '📢 **CoinbaseInt Listing: We will add support for Towns Protocol perpetual futures on Coinbase International Exchange and Coinbase Advanced. The openin',
-    },
-    {
-        date: '2025-08-05',
-        token: 'TOWNS',
-        token_display: 'Towns (TOWNS)',
-        exchange: 'Coinbase',
-        type: 'perp',
-        time: '19:00 UTC',
-        notes: '📢 **CoinbaseInt Listing: We will add support for Towns Protocol perpetual futures on Coinbase International Exchange and Coinbase Advanced. The openin',
-    },
-    {
-        date: '2025-08-05',
-        token: 'TOWNS',
-        token_display: 'WISDOM (TOWNS)',
-        exchange: 'Bybit',
-        type: 'spot',
-        time: '21:30',
-        notes: '📢 **BYBIT: 🔥 Listing of TOWNS on Convert & Bybit Savings **  BYBIT: 🔥 TOKEN OF WISDOM (TOWNS) 上线 Convert 和 Bybit 理财产品  ---------- 🔗 [查看来源](https://ann',
-    },
-    {
-        date: '2025-08-05',
-        token: 'TOWNS',
-        token_display: 'Towns (TOWNS)',
-        exchange: 'Binance',
-        type: 'spot',
-        time: '21:59',
-        notes: '📢 **Binance Will Add Towns (TOWNS) and Succinct (PROVE) on Earn, Buy Crypto, Convert, Margin & Futures **  Binance将在Earn、购买加密货币、兑换、杠杆和期货交易中上线Towns（TOW',
-    },
-    {
-        date: '2025-08-05',
-        token: 'PROVE',
-        token_display: 'Succinct (PROVE)',
-        exchange: 'Binance',
-        type: 'spot',
-        time: '21:59',
-        notes: '📢 **Binance Will Add Towns (TOWNS) and Succinct (PROVE) on Earn, Buy Crypto, Convert, Margin & Futures **  Binance将在Earn、购买加密货币、兑换、杠杆和期货交易中上线Towns（TOW',
-    },
-    {
-        date: '2025-08-05',
-        token: 'TOWNS',
-        token_display: 'Towns (TOWNS)',
-        exchange: 'Bybit',
-        type: 'perp',
-        time: '22:48',
-        notes: '📢 **BYBIT: New Listing :  TOWNSUSDT Perpetual Contract, with up to 50x leverage **  BYBIT: 新上线：TOWNSUSDT永续合约，最高支持50倍杠杆  ---------- 🔗 [查看来源](https://an',
-    },
-    {
-        date: '2025-08-05',
-        token: 'MAMO',
-        token_display: 'Mamo (MAMO)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '23:54',
-        notes: '📢 **Coinbase will add support for Mamo (MAMO) on the Base network. Do not send this asset over other networks or your funds may be lost. Transfers for',
-    },
-    {
-        date: '2025-08-06',
-        token: 'EUL',
-        token_display: 'Euler (EUL)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '00:01',
-        notes: '📢 **Coinbase will add support for Euler (EUL) on the Ethereum network (ERC-20 token). Do not send this asset over other networks or your funds may be ',
-    },
-    {
-        date: '2025-08-06',
-        token: 'PROVE',
-        token_display: 'Succinct (PROVE)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '00:07',
-        notes: '📢 **Coinbase will add support for Succinct (PROVE) on the Ethereum network (ERC-20 token). Do not send this asset over other networks or your funds ma',
-    },
-    {
-        date: '2025-08-06',
-        token: 'TOWNS',
-        token_display: 'Protocol (TOWNS)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '00:46',
-        notes: '📢 **Coinbase will add support for Towns Protocol (TOWNS) on the Base network. Do not send this asset over other networks or your funds may be lost. Tr',
-    },
-    {
-        date: '2025-08-06',
-        token: 'PROVE',
-        token_display: 'Succinct (PROVE)',
-        exchange: 'Bybit',
-        type: 'perp',
-        time: '01:13',
-        notes: '📢 **BYBIT: New Listing :  PROVEUSDT Perpetual Contract, with up to 25x leverage **  BYBIT: 新上币种：PROVEUSDT 永续合约，最高支持 25 倍杠杆  ---------- 🔗 [查看来源](https:',
-    },
-    {
-        date: '2025-08-06',
-        token: 'PROVE',
-        token_display: 'Succinct (PROVE)',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '11:20',
-        notes: '📢 **UPBIT LISTING:[거래] 서싱트(PROVE) 신규 거래지원 안내 (KRW, BTC, USDT 마켓) **  UPBIT LISTING:[交易] 关于支持新交易对的通知(PROVE)（KRW, BTC, USDT 市场）  ---------- 🕒 __2025-08-',
-    },
-    {
-        date: '2025-08-06',
-        token: 'PROVE',
-        token_display: 'Succinct (PROVE)',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '12:06',
-        notes: '📢 **Bithumb LISTING:[이벤트] 석싱트(PROVE) 원화 마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:[活动] 为庆祝PROVE韩元市场上线，将举行空投活动。  ---------- 🔗 [查看来源](https://feed.bithumb.c',
-    },
-    {
-        date: '2025-08-06',
-        token: 'APR',
-        token_display: 'Priori (APR)',
-        exchange: 'Binance',
-        type: 'spot',
-        time: '13:59',
-        notes: '📢 **Binance Earn New Listing Special Offer: Subscribe to PROVE Locked Products to Enjoy 200% APR for 7 Days! **  币安理财新上架限时特惠：订阅PROVE锁仓产品，即可享受7天高达200%年',
-    },
-    {
-        date: '2025-08-06',
-        token: 'COSMOSDYDX',
-        token_display: 'YdX (COSMOSDYDX)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '23:56',
-        notes: '📢 **Coinbase will add support for dYdX (COSMOSDYDX) on the dYdX network. Do not send this asset over other networks or your funds may be lost. Transfe',
-    },
-    {
-        date: '2025-08-07',
-        token: 'IN',
-        token_display: 'INFINIT (IN)',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '17:30',
-        notes: '📢 **Binance: INFINIT (IN) Will Be Available on Binance Alpha and Binance Futures (2025-08-07) **  Binance: INFINIT (IN) 将于2025年8月7日上线币安Alpha和币安合约平台。  ',
-    },
-    {
-        date: '2025-08-07',
-        token: 'YALA',
-        token_display: 'YALA',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '22:57',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined YALAUSDT and CARVUSDT Perpetual Contracts (2025-08-07) **  Binance 期货将于 2025 年 8 月 7 日上线以美元Ⓢ保证金交易的 YALAU',
-    },
-    {
-        date: '2025-08-07',
-        token: 'CARV',
-        token_display: 'CARV',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '22:57',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined YALAUSDT and CARVUSDT Perpetual Contracts (2025-08-07) **  Binance 期货将于 2025 年 8 月 7 日上线以美元Ⓢ保证金交易的 YALAU',
-    },
-    {
-        date: '2025-08-08',
-        token: 'IP',
-        token_display: 'IP',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '10:09',
-        notes: '📢 **UPBIT LISTING:[거래] 스토리(IP) 신규 거래지원 안내 (KRW, BTC, USDT 마켓) **  UPBIT LISTING:[交易] 支持新故事(IP)交易市场 (KRW, BTC, USDT 市场)  ---------- 🕒 __2025-08-08 10:0',
-    },
-    {
-        date: '2025-08-08',
-        token: 'TREE',
-        token_display: 'TreeHouse (TREE)',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '13:45',
-        notes: '📢 **Bithumb LISTING:트리하우스(TREE) 원화 마켓 추가 **  Bithumb LISTING:TreeHouse (TREE) 已新增韩元交易市场。  ---------- 🔗 [查看来源](https://feed.bithumb.com/notice/1649497)',
-    },
-    {
-        date: '2025-08-11',
-        token: 'SLAY',
-        token_display: 'SLAY',
-        exchange: 'Bybit',
-        type: 'spot',
-        time: '18:00',
-        notes: '📢 **BYBIT: 🔥 Listing of SLAY on Convert **  BYBIT: 🔥 SLAY在Convert平台上线  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/-listing-of-slay',
-    },
-    {
-        date: '2025-08-12',
-        token: 'CYBER',
-        token_display: 'Cyber (CYBER)',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '15:29',
-        notes: '📢 **UPBIT LISTING:[거래] 사이버(CYBER) KRW, USDT 마켓 디지털 자산 추가 **  UPBIT LISTING:[交易] Cyber (CYBER) 韩元、USDT市场新增加密货币资产  ---------- 🕒 __2025-08-12 15:29:52__',
-    },
-    {
-        date: '2025-08-13',
-        token: 'WCT',
-        token_display: 'Token (WCT)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '02:52',
-        notes: '📢 **COINBASE LISTING: Assets added to the roadmap today: WalletConnect Token (WCT) **  COINBASE LISTING: 今日加入路线图的资产：WalletConnect代币（WCT）  ---------- 🔗',
-    },
-    {
-        date: '2025-08-13',
-        token: 'TOWNS',
-        token_display: 'Towns (TOWNS)',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '09:41',
-        notes: '📢 **Bithumb LISTING:타운즈(TOWNS) 원화 마켓 추가 **  Bithumb LISTING:TOWNS现已上线韩元市场。  ---------- 🔗 [查看来源](https://feed.bithumb.com/notice/1649534) 🕒 __2025-08-1',
-    },
-    {
-        date: '2025-08-13',
-        token: 'BF',
-        token_display: 'BF',
-        exchange: 'Binance',
-        type: 'spot',
-        time: '10:59',
-        notes: '📢 **Binance Will List BFUSD and Introduce BFUSD Zero Trading Fee Promotion **  Binance 将上线 BFUSD 并推出 BFUSD 零交易手续费促销活动。  ---------- 🔗 [查看来源](https://ww',
-    },
-    {
-        date: '2025-08-13',
-        token: 'AIO',
-        token_display: 'AIO',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '17:40',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined AIOUSDT and XNYUSDT Perpetual Contracts (2025-08-13) **  Binance 期货将推出以 USDT 为保证金的 AIOUSDT 和 XNYUSDT 永续合',
-    },
-    {
-        date: '2025-08-13',
-        token: 'XNY',
-        token_display: 'XNY',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '17:40',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined AIOUSDT and XNYUSDT Perpetual Contracts (2025-08-13) **  Binance 期货将推出以 USDT 为保证金的 AIOUSDT 和 XNYUSDT 永续合',
-    },
-    {
-        date: '2025-08-13',
-        token: 'XNY',
-        token_display: 'XNY',
-        exchange: 'Bybit',
-        type: 'perp',
-        time: '21:44',
-        notes: '📢 **BYBIT: New Listing : XNYUSDT Perpetual Contract in Innovation Zone, with up to 25x leverage **  BYBIT: 上新：创新区新增XNYUSDT永续合约，最高支持25倍杠杆交易。  ---------',
-    },
-    {
-        date: '2025-08-14',
-        token: 'USELESS',
-        token_display: 'Coin (USELESS)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '03:25',
-        notes: '📢 **COINBASE LISTING: Assets added to the roadmap today: Useless Coin (USELESS) **  COINBASE LISTING: 今日新增至路线图的资产：无用币（USELESS）  ---------- 🔗 [查看来源](ht',
-    },
-    {
-        date: '2025-08-14',
-        token: 'WCT',
-        token_display: 'Token (WCT)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '04:00',
-        notes: '📢 **Coinbase will add support for WalletConnect Token (WCT) on the Optimism network. Do not send this asset over other networks or your funds may be l',
-    },
-    {
-        date: '2025-08-15',
-        token: 'USELESS',
-        token_display: 'Coin (USELESS)',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '18:46',
-        pairs: 'USELESS/USD',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined USELESSUSDT Perpetual Contract (2025-08-15) **  Binance 期货将推出以 USDT 为保证金的 USELESS/USDT 永续合约（2025 年 8 月 1',
-    },
-    {
-        date: '2025-08-18',
-        token: 'PLUME',
-        token_display: 'Plume (PLUME)',
-        exchange: 'Binance',
-        type: 'spot',
-        time: '17:36',
-        notes: '📢 **Binance: Introducing Plume (PLUME) on Binance HODLer Airdrops! Earn PLUME With Retroactive BNB Simple Earn Subscriptions **  Binance: 在Binance HOD',
-    },
-    {
-        date: '2025-08-18',
-        token: 'DAM',
-        token_display: 'DAM',
-        exchange: 'Bybit',
-        type: 'perp',
-        time: '21:03',
-        notes: '📢 **BYBIT: New Listing : DAMUSDT Perpetual Contract in Innovation Zone, with up to 20x leverage **  BYBIT: 新上线：创新区推出DAMUSDT永续合约，最高支持20倍杠杆。  ----------',
-    },
-    {
-        date: '2025-08-19',
-        token: 'BIO',
-        token_display: 'Protocol (BIO)',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '11:29',
-        notes: '📢 **Bithumb LISTING:바이오 프로토콜(BIO) 원화 마켓 추가 **  Bithumb LISTING:Bio Protocol (BIO) 增加韩元市场  ---------- 🔗 [查看来源](https://feed.bithumb.com/notice/1649599)',
-    },
-    {
-        date: '2025-08-19',
-        token: 'USELESS',
-        token_display: 'Coin (USELESS)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '23:49',
-        notes: '📢 **Coinbase will add support for Useless Coin (USELESS) on the Solana network (SPL token). Do not send this asset over other networks or your funds m',
-    },
-    {
-        date: '2025-08-19',
-        token: 'SPL',
-        token_display: 'SPL',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '23:49',
-        notes: '📢 **Coinbase will add support for Useless Coin (USELESS) on the Solana network (SPL token). Do not send this asset over other networks or your funds m',
-    },
-    {
-        date: '2025-08-20',
-        token: 'SAPIEN',
-        token_display: 'Sapien (SAPIEN)',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '11:14',
-        notes: '📢 **Binance: Sapien (SAPIEN) Will Be Available on Binance Alpha and Binance Futures (2025-08-20) **  Binance: Sapien (SAPIEN) 将于2025年8月20日在币安Alpha和币安期',
-    },
-    {
-        date: '2025-08-20',
-        token: 'CUDIS',
-        token_display: 'CUDIS',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '17:48',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined CUDISUSDT Perpetual Contract (2025-08-20) **  Binance期货将推出以USDT计价的CUDI/USDT永续合约（2025-08-20到期）  ---------',
-    },
-    {
-        date: '2025-08-21',
-        token: 'SAPIEN',
-        token_display: 'Sapien (SAPIEN)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '02:33',
-        notes: '📢 **Coinbase will add support for Sapien (SAPIEN) on the Base network. Do not send this asset over other networks or your funds may be lost. Transfers',
-    },
-    {
-        date: '2025-08-21',
-        token: 'AWE',
-        token_display: 'Network (AWE)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '05:30',
-        notes: '📢 **COINBASE LISTING: Assets added to the roadmap today: AWE Network (AWE), Dolomite (DOLO), Flock (FLOCK), Solayer (LAYER), and SPX6900 (SPX) **  COI',
-    },
-    {
-        date: '2025-08-21',
-        token: 'DOLO',
-        token_display: 'Dolomite (DOLO)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '05:30',
-        notes: '📢 **COINBASE LISTING: Assets added to the roadmap today: AWE Network (AWE), Dolomite (DOLO), Flock (FLOCK), Solayer (LAYER), and SPX6900 (SPX) **  COI',
-    },
-    {
-        date: '2025-08-21',
-        token: 'FLOCK',
-        token_display: 'Flock (FLOCK)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '05:30',
-        notes: '📢 **COINBASE LISTING: Assets added to the roadmap today: AWE Network (AWE), Dolomite (DOLO), Flock (FLOCK), Solayer (LAYER), and SPX6900 (SPX) **  COI',
-    },
-    {
-        date: '2025-08-21',
-        token: 'LAYER',
-        token_display: 'Solayer (LAYER)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '05:30',
-        notes: '📢 **COINBASE LISTING: Assets added to the roadmap today: AWE Network (AWE), Dolomite (DOLO), Flock (FLOCK), Solayer (LAYER), and SPX6900 (SPX) **  COI',
-    },
-    {
-        date: '2025-08-21',
-        token: 'SPX',
-        token_display: 'SPX',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '05:30',
-        notes: '📢 **COINBASE LISTING: Assets added to the roadmap today: AWE Network (AWE), Dolomite (DOLO), Flock (FLOCK), Solayer (LAYER), and SPX6900 (SPX) **  COI',
-    },
-    {
-        date: '2025-08-21',
-        token: 'APR',
-        token_display: 'Priori (APR)',
-        exchange: 'Binance',
-        type: 'spot',
-        time: '10:00',
-        notes: '📢 **Binance Earn New Listing Special Offer: Subscribe to PLUME Locked Products to Enjoy 200% APR for 7 Days! **  币安理财新币上线特惠：认购PLUME定期产品，享7天200%年化收益！  ',
-    },
-    {
-        date: '2025-08-21',
-        token: 'YZY',
-        token_display: 'YZY',
-        exchange: 'Hyperliquid',
-        type: 'perp',
-        time: '11:13',
-        pairs: 'YZY/USD',
-        notes: '📢 **【hyperliquid】 新上线YZY/USDC永续合约，最高可达3倍杠杆 **  【Hyperliquid】 新上线 YZY/USDC 永续合约，最高支持 3 倍杠杆。  ---------- 🕒 __2025-08-21 11:13:20__',
-    },
-    {
-        date: '2025-08-21',
-        token: 'YZY',
-        token_display: 'YZY',
-        exchange: 'Bybit',
-        type: 'perp',
-        time: '12:38',
-        notes: '📢 **BYBIT: New Listing :  YZYUSDT Perpetual Contract, with up to 25x leverage **  BYBIT: 新上线: YZYUSDT 永续合约, 支持最高25倍杠杆。  ---------- 🔗 [查看来源](https://an',
-    },
-    {
-        date: '2025-08-21',
-        token: 'MNT',
-        token_display: 'MNT',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '9:30 UTC',
-        notes: '📢 **CoinbaseInt Listing: We will add support for Mantle, Reserve Rights, and SuperVerse perpetual futures on Coinbase International Exchange and Coinb',
-    },
-    {
-        date: '2025-08-21',
-        token: 'MNT',
-        token_display: 'MNT',
-        exchange: 'Coinbase',
-        type: 'perp',
-        time: '9:30 UTC',
-        notes: '📢 **CoinbaseInt Listing: We will add support for Mantle, Reserve Rights, and SuperVerse perpetual futures on Coinbase International Exchange and Coinb',
-    },
-    {
-        date: '2025-08-21',
-        token: 'RSR',
-        token_display: 'RSR',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '9:30 UTC',
-        notes: '📢 **CoinbaseInt Listing: We will add support for Mantle, Reserve Rights, and SuperVerse perpetual futures on Coinbase International Exchange and Coinb',
-    },
-    {
-        date: '2025-08-21',
-        token: 'RSR',
-        token_display: 'RSR',
-        exchange: 'Coinbase',
-        type: 'perp',
-        time: '9:30 UTC',
-        notes: '📢 **CoinbaseInt Listing: We will add support for Mantle, Reserve Rights, and SuperVerse perpetual futures on Coinbase International Exchange and Coinb',
-    },
-    {
-        date: '2025-08-21',
-        token: 'SUPER',
-        token_display: 'SUPER',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '9:30 UTC',
-        notes: '📢 **CoinbaseInt Listing: We will add support for Mantle, Reserve Rights, and SuperVerse perpetual futures on Coinbase International Exchange and Coinb',
-    },
-    {
-        date: '2025-08-21',
-        token: 'SUPER',
-        token_display: 'SUPER',
-        exchange: 'Coinbase',
-        type: 'perp',
-        time: '9:30 UTC',
-        notes: '📢 **CoinbaseInt Listing: We will add support for Mantle, Reserve Rights, and SuperVerse perpetual futures on Coinbase International Exchange and Coinb',
-    },
-    {
-        date: '2025-08-22',
-        token: 'AERO',
-        token_display: 'Finance (AERO)',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '08:29',
-        notes: '📢 **UPBIT LISTING:[거래] 에어로드롬파이낸스(AERO) 신규 거래지원 안내 (KRW, BTC, USDT 마켓) **  UPBIT LISTING:[交易] Aerodrome Finance (AERO) 新交易支援通知（KRW, BTC, USDT 市场）  ----',
-    },
-    {
-        date: '2025-08-22',
-        token: 'XPL',
-        token_display: 'XPL (Plasma)',
-        exchange: 'Bybit',
-        type: 'pre-market',
-        time: '10:45 UTC',
-        notes: '📢 **BYBIT: Listing of XPLUSDT on Bybit Perpetual Pre-Market on Aug 22, 2025, 10:45AM UTC **  BYBIT: XPLUSDT将于2025年8月22日上午10:45（UTC时间）在Bybit永续合约预市上线。  ',
-    },
-    {
-        date: '2025-08-22',
-        token: 'XPL',
-        token_display: 'XPL (Plasma)',
-        exchange: 'Binance',
-        type: 'pre-market',
-        time: '16:29',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined XPLUSDT Perpetual Contract Pre-Market Trading (2025-08-22) **  Binance 期货将推出以 USDS 为保证金的 XPLUSDT 永续合约的预市',
-    },
-    {
-        date: '2025-08-23',
-        token: 'WLFI',
-        token_display: 'Financial (WLFI)',
-        exchange: 'Bybit',
-        type: 'pre-market',
-        time: '10:15 UTC',
-        notes: '📢 **BYBIT: Listing of WLFIUSDT on Bybit Perpetual Pre-Market on Aug 23, 2025, 10:15AM UTC **  BYBIT: 2025年8月23日UTC时间10:15，WLFIUSDT在Bybit的永续合约Pre-Marke',
-    },
-    {
-        date: '2025-08-23',
-        token: 'WLFI',
-        token_display: 'Financial (WLFI)',
-        exchange: 'Binance',
-        type: 'pre-market',
-        time: '16:15',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined WLFIUSDT Perpetual Contract Pre-Market Trading (2025-08-23) **  Binance Futures 将推出以 USDT 保证金结算的 WLFIUSD',
-    },
-    {
-        date: '2025-08-23',
-        token: 'WLFI',
-        token_display: 'Financial (WLFI)',
-        exchange: 'OKX',
-        type: 'pre-market',
-        time: '20:30',
-        notes: '📢 **OKX LISTING:OKX to list pre-market perpetual futures for WLFI (World Liberty Financial) crypto **  OKX LISTING:OKX将上线WLFI（世界自由金融）加密货币的预市永续合约。  ---',
-    },
-    {
-        date: '2025-08-25',
-        token: 'BIO',
-        token_display: 'Protocol (BIO)',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '13:59',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined BIOUSDC Perpetual Contract (2025-08-25) **  Binance期货将推出以USDⓈ计价的BIOUSDC永续合约（2025-08-25）  ---------- 🔗 [查',
-    },
-    {
-        date: '2025-08-25',
-        token: 'STG',
-        token_display: 'Finance (STG)',
-        exchange: 'Gate',
-        type: 'spot',
-        time: '14:59',
-        notes: '📢 **UPBIT LISTING:[거래] 스타게이트파이낸스(STG), 레이어제로(ZRO) 유의 촉구 안내 **  UPBIT LISTING:[交易] Stargate Finance (STG) 和 LayerZero (ZRO) 的注意事项通知。  ---------- 🕒 __20',
-    },
-    {
-        date: '2025-08-25',
-        token: 'STG',
-        token_display: 'Finance (STG)',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '14:59',
-        notes: '📢 **UPBIT LISTING:[거래] 스타게이트파이낸스(STG), 레이어제로(ZRO) 유의 촉구 안내 **  UPBIT LISTING:[交易] Stargate Finance (STG) 和 LayerZero (ZRO) 的注意事项通知。  ---------- 🕒 __20',
-    },
-    {
-        date: '2025-08-25',
-        token: 'ZRO',
-        token_display: 'LayerZero (ZRO)',
-        exchange: 'Gate',
-        type: 'spot',
-        time: '14:59',
-        notes: '📢 **UPBIT LISTING:[거래] 스타게이트파이낸스(STG), 레이어제로(ZRO) 유의 촉구 안내 **  UPBIT LISTING:[交易] Stargate Finance (STG) 和 LayerZero (ZRO) 的注意事项通知。  ---------- 🕒 __20',
-    },
-    {
-        date: '2025-08-25',
-        token: 'ZRO',
-        token_display: 'LayerZero (ZRO)',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '14:59',
-        notes: '📢 **UPBIT LISTING:[거래] 스타게이트파이낸스(STG), 레이어제로(ZRO) 유의 촉구 안내 **  UPBIT LISTING:[交易] Stargate Finance (STG) 和 LayerZero (ZRO) 的注意事项通知。  ---------- 🕒 __20',
-    },
-    {
-        date: '2025-08-25',
-        token: 'SOMI',
-        token_display: 'Somnia (SOMI)',
-        exchange: 'Binance',
-        type: 'pre-market',
-        time: '17:15',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined SOMIUSDT Perpetual Contract Pre-Market Trading (2025-08-25) **  Binance期货将启动美元Ⓢ-保证金的BOME永续合约的预市场交易 (2025',
-    },
-    {
-        date: '2025-08-26',
-        token: 'SD',
-        token_display: 'Stader (SD)',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '14:21',
-        notes: '📢 **Bithumb LISTING:스테이더(SD) 원화 마켓 추가 **  Bithumb LISTING:Stader(SD) 韩元市场已上线。  ---------- 🔗 [查看来源](https://feed.bithumb.com/notice/1649642) 🕒 __2025-0',
-    },
-    {
-        date: '2025-08-26',
-        token: 'BAS',
-        token_display: 'BAS',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '20:12',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined BASUSDT Perpetual Contract (2025-08-26) **  Binance 期货将推出以 USDT 计价 BASUSDT 永续合约（2025-08-26）  ---------- ',
-    },
-    {
-        date: '2025-08-27',
-        token: 'BTR',
-        token_display: 'Bitlayer (BTR)',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '09:30',
-        notes: '📢 **Binance: Bitlayer (BTR) Will Be Available on Binance Alpha and Binance Futures (2025-08-27) **  Binance: Bitlayer (BTR) 将于2025年8月27日上线币种榜 Alpha 和币',
-    },
-    {
-        date: '2025-08-27',
-        token: 'CAMP',
-        token_display: 'CAMP',
-        exchange: 'Bybit',
-        type: 'spot',
-        time: '17:15',
-        notes: '📢 **BYBIT: 🔥 Listing of CAMP on Convert **  BYBIT: 🔥 CAMP在Convert上市  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/-listing-of-camp-o',
-    },
-    {
-        date: '2025-08-27',
-        token: 'BSU',
-        token_display: 'BSU',
-        exchange: 'Bybit',
-        type: 'perp',
-        time: '18:58',
-        notes: '📢 **BYBIT: New Listing : BSUUSDT Perpetual Contract in Innovation Zone, with up to 20x leverage **  BYBIT: 新上市：创新区的 BSUUSDT 永续合约，最高支持20倍杠杆  ----------',
-    },
-    {
-        date: '2025-08-27',
-        token: 'BTR',
-        token_display: 'Bitlayer (BTR)',
-        exchange: 'Bybit',
-        type: 'perp',
-        time: '19:26',
-        notes: '📢 **BYBIT: New Listing : BTRUSDT Perpetual Contract in Innovation Zone, with up to 25x leverage **  BYBIT: 新上线：BTRUSDT永续合约，现可在创新区交易，最高支持25倍杠杆。  ------',
-    },
-    {
-        date: '2025-08-28',
-        token: 'TREE',
-        token_display: 'Treehouse (TREE)',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '12:59',
-        notes: '📢 **UPBIT LISTING:[거래] 트리하우스(TREE) 신규 거래지원 안내 (KRW, BTC, USDT 마켓) **  UPBIT LISTING:[交易] Treehouse (TREE) 新交易对上线公告 (KRW, BTC, USDT市场)  ---------- 🕒 __',
-    },
-    {
-        date: '2025-08-28',
-        token: 'XPL',
-        token_display: 'XPL (Plasma)',
-        exchange: 'OKX',
-        type: 'pre-market',
-        time: '18:00',
-        notes: '📢 **OKX LISTING:OKX to list pre-market perpetual futures for XPL (Plasma) crypto **  OKX LISTING:OKX 将上线 XPL（Plasma）加密货币的预市永续合约。  ---------- 🔗 [查看来源](',
-    },
-    {
-        date: '2025-08-28',
-        token: 'MITO',
-        token_display: 'Mitosis (MITO)',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '20:00',
-        notes: '📢 **Binance: Mitosis (MITO) Will Be Available on Binance Alpha and Binance Futures (2025-08-28) **  Binance: Mitosis (MITO) 将于2025年8月28日在Binance Alpha',
-    },
-    {
-        date: '2025-08-28',
-        token: 'GMT',
-        token_display: 'GMT',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '9:30 UTC',
-        notes: '📢 **CoinbaseInt Listing: We will add support for GMT, Omni Network, and Synthetix perpetual futures on Coinbase International Exchange and Coinbase Ad',
-    },
-    {
-        date: '2025-08-28',
-        token: 'GMT',
-        token_display: 'GMT',
-        exchange: 'Coinbase',
-        type: 'perp',
-        time: '9:30 UTC',
-        notes: '📢 **CoinbaseInt Listing: We will add support for GMT, Omni Network, and Synthetix perpetual futures on Coinbase International Exchange and Coinbase Ad',
-    },
-    {
-        date: '2025-08-28',
-        token: 'OMNI',
-        token_display: 'OMNI',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '9:30 UTC',
-        notes: '📢 **CoinbaseInt Listing: We will add support for GMT, Omni Network, and Synthetix perpetual futures on Coinbase International Exchange and Coinbase Ad',
-    },
-    {
-        date: '2025-08-28',
-        token: 'OMNI',
-        token_display: 'OMNI',
-        exchange: 'Coinbase',
-        type: 'perp',
-        time: '9:30 UTC',
-        notes: '📢 **CoinbaseInt Listing: We will add support for GMT, Omni Network, and Synthetix perpetual futures on Coinbase International Exchange and Coinbase Ad',
-    },
-    {
-        date: '2025-08-28',
-        token: 'SNX',
-        token_display: 'SNX',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '9:30 UTC',
-        notes: '📢 **CoinbaseInt Listing: We will add support for GMT, Omni Network, and Synthetix perpetual futures on Coinbase International Exchange and Coinbase Ad',
-    },
-    {
-        date: '2025-08-28',
-        token: 'SNX',
-        token_display: 'SNX',
-        exchange: 'Coinbase',
-        type: 'perp',
-        time: '9:30 UTC',
-        notes: '📢 **CoinbaseInt Listing: We will add support for GMT, Omni Network, and Synthetix perpetual futures on Coinbase International Exchange and Coinbase Ad',
-    },
-    {
-        date: '2025-08-29',
-        token: 'APR',
-        token_display: 'Priori (APR)',
-        exchange: 'Binance',
-        type: 'spot',
-        time: '14:59',
-        notes: '📢 **Binance Earn New Listing Special Offer: Subscribe to DOLO Locked Products to Enjoy 200% APR for 7 Days! **  币安理财新币上线特别优惠：申购DOLO定期理财产品，享受7天200%年化收益',
-    },
-    {
-        date: '2025-08-29',
-        token: 'CAMP',
-        token_display: 'CAMP',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '15:49',
-        notes: '📢 **Bithumb LISTING:캠프 네트워크(CAMP) 원화 마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:CAMP网络（CAMP）为庆贺韩元市场上线，举行空投活动。  ---------- 🔗 [查看来源](https://feed.bithumb.com',
-    },
-    {
-        date: '2025-08-29',
-        token: 'HEMI',
-        token_display: 'Hemi (HEMI)',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '22:00',
-        notes: '📢 **Binance: Hemi (HEMI) Will Be Available on Binance Alpha and Binance Futures (2025-08-29) **  Binance: Hemi (HEMI) 将于2025年8月29日在Binance Alpha和Binan',
-    },
-    {
-        date: '2025-08-29',
-        token: 'MITO',
-        token_display: 'Mitosis (MITO)',
-        exchange: 'Binance',
-        type: 'spot',
-        time: '22:59',
-        notes: '📢 **Binance Will Add Mitosis (MITO) on Earn, Buy Crypto, Convert & Margin **  Binance将在Earn、购买加密货币、兑换及保证金交易中上线Mitosis（MITO）  ---------- 🔗 [查看来源](https',
-    },
-    {
-        date: '2025-08-31',
-        token: 'WLFI',
-        token_display: 'Financial (WLFI)',
-        exchange: 'OKX',
-        type: 'pre-market',
-        time: '19:00',
-        notes: '📢 **OKX LISTING:OKX to list WLFI (World Liberty Financial) for spot trading and convert pre-market futures to standard perpetual futures **  OKX LISTI',
-    },
-    {
-        date: '2025-09-01',
-        token: 'WLFI',
-        token_display: 'Financial (WLFI)',
-        exchange: 'Binance',
-        type: 'spot',
-        time: '09:48',
-        notes: '📢 **Binance Will List  World Liberty Financial (WLFI) with Seed Tag Applied **  Binance将上线World Liberty Financial (WLFI)并应用种子标签  ---------- 🔗 [查看来源](h',
-    },
-    {
-        date: '2025-09-01',
-        token: 'USDT',
-        token_display: 'Linea (USDT)',
-        exchange: 'Bybit',
-        type: 'pre-market',
-        time: '10:15 UTC',
-        notes: '📢 **BYBIT: Listing of LINEAUSDT on Bybit Perpetual Pre-Market on Sep 1, 2025, 10:15AM UTC **  BYBIT: Linea (USDT) 将于 2025 年 9 月 1 日 UTC 时间 10:15 在 Byb',
-    },
-    {
-        date: '2025-09-01',
-        token: 'LINEA',
-        token_display: 'LINEA (Linea)',
-        exchange: 'Bybit',
-        type: 'pre-market',
-        time: '10:15 UTC',
-        notes: '📢 **BYBIT: Listing of LINEAUSDT on Bybit Perpetual Pre-Market on Sep 1, 2025, 10:15AM UTC **  BYBIT: Linea (USDT) 将于 2025 年 9 月 1 日 UTC 时间 10:15 在 Byb',
-    },
-    {
-        date: '2025-09-01',
-        token: 'WLFI',
-        token_display: 'Financial (WLFI)',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '12:09',
-        notes: '📢 **UPBIT LISTING:[거래] 월드리버티파이낸셜(WLFI) 신규 거래지원 안내 (KRW, BTC, USDT 마켓) **  UPBIT LISTING:[交易] World Liberty Financial (WLFI) 新增交易支持公告 (KRW, BTC, USDT 市',
-    },
-    {
-        date: '2025-09-01',
-        token: 'WLFI',
-        token_display: 'Financial (WLFI)',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '15:28',
-        notes: '📢 **Bithumb LISTING:[이벤트] 월드 리버티 파이낸셜(WLFI) 원화 마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:[活动] 纪念 World Liberty Financial (WLFI) 韩元市场上线空投活动  ---------- 🔗 [',
-    },
-    {
-        date: '2025-09-01',
-        token: 'LINEA',
-        token_display: 'LINEA (Linea)',
-        exchange: 'Binance',
-        type: 'pre-market',
-        time: '16:14',
-        pairs: 'LINEA/USD',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined LINEAUSDT Perpetual Contract Pre-Market Trading (2025-09-01) **  币安期货将推出基于美元稳定币（USDⓈ）保证金的三倍杠杆LINEA/USDT永',
-    },
-    {
-        date: '2025-09-01',
-        token: 'SOMI',
-        token_display: 'Somnia (SOMI)',
-        exchange: 'Binance',
-        type: 'spot',
-        time: '16:59',
-        notes: '📢 **Binance: Introducing Somnia (SOMI) on Binance HODLer Airdrops! Earn SOMI With Retroactive BNB Simple Earn Subscriptions **  Binance: Binance HODLe',
-    },
-    {
-        date: '2025-09-01',
-        token: 'LINEA',
-        token_display: 'LINEA (Linea)',
-        exchange: 'OKX',
-        type: 'pre-market',
-        time: '20:15',
-        notes: '📢 **OKX LISTING:OKX to list pre-market perpetual futures for LINEA (Linea) crypto **  OKX LISTING:OKX将上线LINEA（Linea）代币的永续合约预市交易。  ---------- 🔗 [查看来源](',
-    },
-    {
-        date: '2025-09-01',
-        token: 'WLFI',
-        token_display: 'Financial (WLFI)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '21:09',
-        notes: '📢 **Coinbase will add support for World Liberty Financial (WLFI) on the Ethereum network (ERC-20 token). Do not send this asset over other networks or',
-    },
-    {
-        date: '2025-09-01',
-        token: 'WLFI',
-        token_display: 'Financial (WLFI)',
-        exchange: 'Bybit',
-        type: 'spot',
-        time: '21:15',
-        notes: '📢 **BYBIT: 🔥 Listing of WLFI on Convert **  BYBIT: 🔥 WLFI已在Convert平台上线  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/-listing-of-wlf',
-    },
-    {
-        date: '2025-09-02',
-        token: 'AI',
-        token_display: 'AI',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '20:29',
-        notes: '📢 **Binance: Quack AI (Q) Will Be Available on Binance Alpha and Binance Futures (2025-09-02) **  Binance: Quack AI（Q）将在Binance Alpha和Binance Futures上',
-    },
-    {
-        date: '2025-09-02',
-        token: 'SOMI',
-        token_display: 'Somnia (SOMI)',
-        exchange: 'Bybit',
-        type: 'spot',
-        time: '22:45',
-        notes: '📢 **BYBIT: 🔥 Listing of SOMI on Convert & Bybit Savings **  BYBIT: 🔥 SOMI 在 Convert 和 Bybit Savings 上市  ---------- 🔗 [查看来源](https://announcements.bybi',
-    },
-    {
-        date: '2025-09-02',
-        token: 'SOMI',
-        token_display: 'Somnia (SOMI)',
-        exchange: 'Bybit',
-        type: 'perp',
-        time: '22:53',
-        notes: '📢 **BYBIT: New Listing :  SOMIUSDT Perpetual Contract, with up to 50x leverage **  BYBIT: 新上线：SOMIUSDT 永续合约，最高支持50倍杠杆  ---------- 🔗 [查看来源](https://ann',
-    },
-    {
-        date: '2025-09-03',
-        token: 'ARIA',
-        token_display: 'ARIA',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '17:49',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined ARIAUSDT and TAKEUSDT Perpetual Contracts (2025-09-03) **  Binance Futures 将于 2025 年 9 月 3 日推出以 USDⓈ 为保证',
-    },
-    {
-        date: '2025-09-03',
-        token: 'OKB',
-        token_display: 'OKB',
-        exchange: 'OKX',
-        type: 'perp',
-        time: '18:00',
-        notes: '📢 **OKX LISTING:OKX to list perpetual futures for OKB crypto **  OKX LISTING:OKX 将上线 OKB 永续期货交易  ---------- 🔗 [查看来源](https://www.okx.com/help/okx-to-l',
-    },
-    {
-        date: '2025-09-03',
-        token: 'PTB',
-        token_display: 'Bitcoin (PTB)',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '18:00',
-        notes: '📢 **Binance: Portal to Bitcoin (PTB) Will Be Available on Binance Alpha and Binance Futures (2025-09-03) **  Binance: Portal to Bitcoin (PTB) 将登陆Binan',
-    },
-    {
-        date: '2025-09-03',
-        token: 'PTB',
-        token_display: 'Bitcoin (PTB)',
-        exchange: 'Bybit',
-        type: 'perp',
-        time: '21:20',
-        notes: '📢 **BYBIT: New Listing : PTBUSDT Perpetual Contract in Innovation Zone, with up to 20x leverage **  BYBIT: 新上线：PT BUSDT永续合约在创新区推出，最高支持20倍杠杆。  --------',
-    },
-    {
-        date: '2025-09-03',
-        token: 'AWE',
-        token_display: 'Awe (AWE)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '23:57',
-        notes: '📢 **Coinbase will add support for Awe (AWE) on the Base network. Do not send this asset over other networks or your funds may be lost. Transfers for t',
-    },
-    {
-        date: '2025-09-04',
-        token: 'LISTING',
-        token_display: 'LISTING',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '03:43',
-        notes: '📢 **Moonshot LISTING (Verified!!)   Coinbase xStock ($COINx) `Xs7ZdzSHLU9ftNJsii5fCeJhoRWSC32SQGzGQtePxNu`  Market Cap: $77779.9M 24h Volume: $6K Cate',
-    },
-    {
-        date: '2025-09-04',
-        token: 'FUTU',
-        token_display: 'FUTU',
-        exchange: 'Bybit',
-        type: 'spot',
-        time: '21:44',
-        notes: '📢 **BYBIT: New TradFi Listing: FUTU, DFDV **  BYBIT: 新的TradFi上市股票：富途控股 (FUTU)，DFDV  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/new',
-    },
-    {
-        date: '2025-09-04',
-        token: 'ZEN',
-        token_display: 'ZEN',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '9:30 UTC',
-        notes: '📢 **CoinbaseInt Listing: We will add support for Horizen, UMA, and GMX perpetual futures on Coinbase International Exchange and Coinbase Advanced. The',
-    },
-    {
-        date: '2025-09-04',
-        token: 'ZEN',
-        token_display: 'ZEN',
-        exchange: 'Coinbase',
-        type: 'perp',
-        time: '9:30 UTC',
-        notes: '📢 **CoinbaseInt Listing: We will add support for Horizen, UMA, and GMX perpetual futures on Coinbase International Exchange and Coinbase Advanced. The',
-    },
-    {
-        date: '2025-09-04',
-        token: 'UMA',
-        token_display: 'UMA',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '9:30 UTC',
-        notes: '📢 **CoinbaseInt Listing: We will add support for Horizen, UMA, and GMX perpetual futures on Coinbase International Exchange and Coinbase Advanced. The',
-    },
-    {
-        date: '2025-09-04',
-        token: 'UMA',
-        token_display: 'UMA',
-        exchange: 'Coinbase',
-        type: 'perp',
-        time: '9:30 UTC',
-        notes: '📢 **CoinbaseInt Listing: We will add support for Horizen, UMA, and GMX perpetual futures on Coinbase International Exchange and Coinbase Advanced. The',
-    },
-    {
-        date: '2025-09-04',
-        token: 'GMX',
-        token_display: 'GMX',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '9:30 UTC',
-        notes: '📢 **CoinbaseInt Listing: We will add support for Horizen, UMA, and GMX perpetual futures on Coinbase International Exchange and Coinbase Advanced. The',
-    },
-    {
-        date: '2025-09-04',
-        token: 'GMX',
-        token_display: 'GMX',
-        exchange: 'Coinbase',
-        type: 'perp',
-        time: '9:30 UTC',
-        notes: '📢 **CoinbaseInt Listing: We will add support for Horizen, UMA, and GMX perpetual futures on Coinbase International Exchange and Coinbase Advanced. The',
-    },
-    {
-        date: '2025-09-05',
-        token: 'APR',
-        token_display: 'Priori (APR)',
-        exchange: 'Binance',
-        type: 'spot',
-        time: '10:59',
-        notes: '📢 **Binance Earn New Listing Special Offer: Subscribe to MITO or SOMI Locked Products to Enjoy 200% APR for 7 Days! **  Binance Earn 新上币特别活动：订阅 MITO 或',
-    },
-    {
-        date: '2025-09-05',
-        token: 'OPEN',
-        token_display: 'OpenLedger (OPEN)',
-        exchange: 'Binance',
-        type: 'spot',
-        time: '15:18',
-        notes: '📢 **Binance: Introducing OpenLedger (OPEN) on Binance HODLer Airdrops! Earn OPEN With Retroactive BNB Simple Earn Subscriptions **  Binance: 在Binance ',
-    },
-    {
-        date: '2025-09-05',
-        token: 'EUL',
-        token_display: 'Euler (EUL)',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '15:21',
-        notes: '📢 **Bithumb LISTING:[이벤트] 오일러(EUL) 원화 마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:[活动] Euler（EUL）韩元市场新增纪念空投活动  ---------- 🔗 [查看来源](https://feed.bithumb.com/',
-    },
-    {
-        date: '2025-09-05',
-        token: 'RED',
-        token_display: 'RedStone (RED)',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '15:44',
-        notes: '📢 **UPBIT LISTING:[거래] 레드스톤(RED) KRW 마켓 디지털 자산 추가 **  UPBIT LISTING:[交易] Redstone（RED）已添加至韩元（KRW）市场的数字资产交易对。  ---------- 🕒 __2025-09-05 15:44:51__',
-    },
-    {
-        date: '2025-09-06',
-        token: 'KTA',
-        token_display: 'Keeta (KTA)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '08:35',
-        notes: '📢 **COINBASE LISTING: Assets added to the roadmap today: Keeta (KTA) and Noice (NOICE) **  COINBASE LISTING: 今日新增至路线图的资产：基塔（KTA）和诺伊斯（NOICE）。  --------',
-    },
-    {
-        date: '2025-09-06',
-        token: 'NOICE',
-        token_display: 'Noice (NOICE)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '08:35',
-        notes: '📢 **COINBASE LISTING: Assets added to the roadmap today: Keeta (KTA) and Noice (NOICE) **  COINBASE LISTING: 今日新增至路线图的资产：基塔（KTA）和诺伊斯（NOICE）。  --------',
-    },
-    {
-        date: '2025-09-08',
-        token: 'WLFI',
-        token_display: 'Financial (WLFI)',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '15:30',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined WLFIUSDC Perpetual Contract (2025-09-08) **  币安期货将推出美元计价WLFIUSDC永续合约（2025年9月8日）  ---------- 🔗 [查看来源](htt',
-    },
-    {
-        date: '2025-09-08',
-        token: 'PROVE',
-        token_display: 'Succinct (PROVE)',
-        exchange: 'Bybit',
-        type: 'spot',
-        time: '20:16',
-        notes: '📢 **BYBIT: 🔥 Listing of PROVE on Convert **  BYBIT: 🔥 在Convert上列出PROVE  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/-listing-of-pro',
-    },
-    {
-        date: '2025-09-08',
-        token: 'LINEA',
-        token_display: 'LINEA (Linea)',
-        exchange: 'OKX',
-        type: 'pre-market',
-        time: '22:00',
-        notes: '📢 **OKX LISTING:OKX to list LINEA (Linea) for spot trading and convert pre-market futures to standard perpetual futures **  OKX LISTING:OKX 将上线 LINEA（',
-    },
-    {
-        date: '2025-09-08',
-        token: 'LINEA',
-        token_display: 'Linea (LINEA)',
-        exchange: 'Binance',
-        type: 'spot',
-        time: '22:26',
-        notes: '📢 **Binance: Introducing Linea (LINEA) on Binance HODLer Airdrops! Earn LINEA With Retroactive BNB Simple Earn Subscriptions **  Binance: 重磅推出Linea（LI',
-    },
-    {
-        date: '2025-09-09',
-        token: 'FLOCK',
-        token_display: 'Flock (FLOCK)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '01:16',
-        notes: '📢 **Coinbase will add support for SPX6900 (SPX) on the Ethereum network (ERC-20 Token) and Flock (FLOCK) on the Base network. Do not send these assets',
-    },
-    {
-        date: '2025-09-09',
-        token: 'SPX',
-        token_display: 'SPX',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '01:16',
-        notes: '📢 **Coinbase will add support for SPX6900 (SPX) on the Ethereum network (ERC-20 Token) and Flock (FLOCK) on the Base network. Do not send these assets',
-    },
-    {
-        date: '2025-09-09',
-        token: 'FLOCK',
-        token_display: 'Flock (FLOCK)',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '10:39',
-        notes: '📢 **UPBIT LISTING:[] 플록(FLOCK) KRW 마켓 디지털 자산 추가 **  UPBIT LISTING:[] FLOCK KRW 市场新增数字资产  ---------- 🔗 [查看来源](https://upbit.com/service_center/notice?i',
-    },
-    {
-        date: '2025-09-09',
-        token: 'FLOCK',
-        token_display: 'Flock (FLOCK)',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '13:28',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined FLOCKUSDT and SKYUSDT Perpetual Contracts (2025-09-09) **  币安期货将于2025年9月9日推出以美元计价的FLOCKUSDT和SKYUSDT永续合约 ',
-    },
-    {
-        date: '2025-09-09',
-        token: 'SKY',
-        token_display: 'Sky (SKY)',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '13:28',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined FLOCKUSDT and SKYUSDT Perpetual Contracts (2025-09-09) **  币安期货将于2025年9月9日推出以美元计价的FLOCKUSDT和SKYUSDT永续合约 ',
-    },
-    {
-        date: '2025-09-09',
-        token: 'WLD',
-        token_display: 'WLD',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '18:21',
-        notes: '📢 **UPBIT LISTING:[] 월드코인(WLD) 신규 거래지원 안내 (KRW, BTC, USDT 마켓) **  UPBIT LISTING:[] 世界币（WLD）新增交易支持公告（韩元、比特币、USDT交易市场）  ---------- 🔗 [查看来源](https://upbi',
-    },
-    {
-        date: '2025-09-09',
-        token: 'AVNT',
-        token_display: 'Avantis (AVNT)',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '21:00',
-        notes: '📢 **Binance: Avantis (AVNT) Will Be Available on Binance Alpha and Binance Futures (2025-09-09) **  Binance: Avantis (AVNT) 将于 2025 年 9 月 9 日上线币安 Alph',
-    },
-    {
-        date: '2025-09-09',
-        token: 'AVNT',
-        token_display: 'Avantis (AVNT)',
-        exchange: 'Bybit',
-        type: 'spot',
-        time: '22:17',
-        notes: '📢 **BYBIT: 🔥 Listing of AVNT on Convert **  BYBIT: 🔥 AVNT在Convert平台上线交易  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/-listing-of-av',
-    },
-    {
-        date: '2025-09-10',
-        token: 'LINEA',
-        token_display: 'LINEA (Linea)',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '11:00',
-        notes: '📢 **Bithumb LISTING:오픈렛저(OPEN), 리네아(LINEA) 원화 마켓 추가 **  Bithumb LISTING:开放式Linea赢得了额外的市场  ---------- 🔗 [查看来源](https://feed.bithumb.com/notice/1649828)',
-    },
-    {
-        date: '2025-09-10',
-        token: 'HOLO',
-        token_display: 'AI (HOLO)',
-        exchange: 'Binance',
-        type: 'spot',
-        time: '13:11',
-        notes: '📢 **Binance: Introducing Holoworld AI (HOLO) on Binance HODLer Airdrops! Earn HOLO With Retroactive BNB Simple Earn Subscriptions **  Binance: 即将在 Bin',
-    },
-    {
-        date: '2025-09-10',
-        token: 'OPEN',
-        token_display: 'OpenLet (OPEN)',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '13:31',
-        notes: '📢 **Bithumb LISTING:[이벤트] 오픈렛저(OPEN) 원화 마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:[活动] 纪念OpenLet (OPEN)新增韩元市场，举办空投活动  ---------- 🔗 [查看来源](https://feed.bit',
-    },
-    {
-        date: '2025-09-10',
-        token: 'LINEA',
-        token_display: 'LINEA (Linea)',
-        exchange: 'Bybit',
-        type: 'spot',
-        time: '15:00',
-        notes: '📢 **BYBIT: 🔥 Listing of LINEA on Convert **  BYBIT: 🔥LINEA在Convert平台上线  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/-listing-of-lin',
-    },
-    {
-        date: '2025-09-10',
-        token: 'LINEA',
-        token_display: 'LINEA (Linea)',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '15:39',
-        notes: '📢 **UPBIT LISTING:[] 리네아(LINEA) 신규 거래지원 안내 (KRW, BTC, USDT 마켓) **  UPBIT LISTING:关于列内亚（LINEA）新增交易对的通知（提KRW韩元、BTC比特币、USDT泰达币市场）  ---------- 🔗 [查看来源](ht',
-    },
-    {
-        date: '2025-09-11',
-        token: 'SKY',
-        token_display: 'Sky (SKY)',
-        exchange: 'OKX',
-        type: 'perp',
-        time: '11:00',
-        notes: '📢 **OKX LISTING:OKX to list perpetual futures for SKY crypto **  OKX LISTING:OKX即将上线SKY永续期货交易对。  ---------- 🔗 [查看来源](https://www.okx.com/help/okx-to-l',
-    },
-    {
-        date: '2025-09-11',
-        token: 'HOLO',
-        token_display: 'AI (HOLO)',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '17:23',
-        notes: '📢 **UPBIT LISTING:[] 홀로월드에이아이(HOLO) 신규 거래지원 안내 (KRW, BTC, USDT 마켓) **  UPBIT LISTING:尊敬的用户，  我们很高兴地通知您，HOLO（HOLO）现已支持KRW、BTC和USDT市场的新交易对。这意味着您现在可以使用韩元',
-    },
-    {
-        date: '2025-09-11',
-        token: 'PUMP',
-        token_display: 'PUMP (Pump)',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '17:49',
-        notes: '📢 **Bithumb LISTING:펌프닷펀(PUMP) 원화 마켓 추가 **  Bithumb LISTING:PUMP（펌프닷펀）在韩元市场上线。  ---------- 🔗 [查看来源](https://feed.bithumb.com/notice/1649839) 🕒 __2025-',
-    },
-    {
-        date: '2025-09-11',
-        token: 'PUMP',
-        token_display: 'PUMP (Pump)',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '18:15',
-        notes: '📢 **UPBIT LISTING:[] 펌프펀(PUMP) 신규 거래지원 안내 (KRW, USDT 마켓) **  UPBIT LISTING:[] Pump 币（PUMP）新增交易对公告（KRW，USDT 市场）  ---------- 🔗 [查看来源](https://upbit.com/',
-    },
-    {
-        date: '2025-09-11',
-        token: 'PUMP',
-        token_display: 'PUMP (Pump)',
-        exchange: 'Binance',
-        type: 'spot',
-        time: '19:37',
-        notes: '📢 **Binance Will List ****Pump.fun**** (PUMP) with Seed Tag Applied **  币安将上线Pump.fun (PUMP)并标注Seed标签。  ---------- 🔗 [查看来源](https://www.binance.com/en',
-    },
-    {
-        date: '2025-09-11',
-        token: 'HOLO',
-        token_display: 'AI (HOLO)',
-        exchange: 'Bybit',
-        type: 'spot',
-        time: '20:16',
-        notes: '📢 **BYBIT: 🔥 Listing of HOLO on Convert **  BYBIT: 🔥 HOLO 上线Convert平台  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/-listing-of-holo',
-    },
-    {
-        date: '2025-09-12',
-        token: 'XPIN',
-        token_display: 'XPIN',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '14:50',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined XPINUSDT Perpetual Contract (2025-09-12) **  Binance期货将推出以 USDT 为保证金的杠杆永续合约 XPINUSDT（2025-09-12）  ------',
-    },
-    {
-        date: '2025-09-12',
-        token: 'APR',
-        token_display: 'Priori (APR)',
-        exchange: 'Binance',
-        type: 'spot',
-        time: '17:00',
-        notes: '📢 **Binance Earn New Listing Special Offer: Subscribe to OPEN, LINEA or HOLO Locked Products to Enjoy 200% APR for 7 Days! **  币安Earn新币上线特别优惠：订阅OPEN、L',
-    },
-    {
-        date: '2025-09-12',
-        token: 'UB',
-        token_display: 'Unibase (UB)',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '17:29',
-        notes: '📢 **Binance: Unibase (UB) Will Be Available on Binance Alpha and Binance Futures (2025-09-12) **  Binance: Unibase（UB）将上线Binance Alpha和Binance Futures',
-    },
-    {
-        date: '2025-09-12',
-        token: 'UB',
-        token_display: 'Unibase (UB)',
-        exchange: 'Bybit',
-        type: 'perp',
-        time: '17:36',
-        notes: '📢 **BYBIT: New Listing : UBUSDT Perpetual Contract in Innovation Zone, with up to 25x leverage **  BYBIT: 新上线：创新区推出UBUSDT永续合约，最高支持25倍杠杆。  ---------- 🔗',
-    },
-    {
-        date: '2025-09-12',
-        token: 'ZKC',
-        token_display: 'Boundless (ZKC)',
-        exchange: 'Binance',
-        type: 'spot',
-        time: '17:57',
-        notes: '📢 **Binance: Introducing Boundless (ZKC) on Binance HODLer Airdrops! Earn ZKC With Retroactive BNB Simple Earn Subscriptions **  Binance: 在Binance HOD',
-    },
-    {
-        date: '2025-09-15',
-        token: 'ZKC',
-        token_display: 'Boundless (ZKC)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '01:31',
-        pairs: 'ZKC/USD',
-        notes: '📢 **COINBASE LISTING: Spot trading for Boundless (ZKC) will go live on 15 September 2025.   The opening of our ZKC-USD trading pair will begin later t',
-    },
-    {
-        date: '2025-09-15',
-        token: 'AVNT',
-        token_display: 'Avantis (AVNT)',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '10:29',
-        notes: '📢 **UPBIT LISTING:아반티스(AVNT) 신규 거래지원 안내 (KRW, BTC, USDT 마켓) **  UPBIT LISTING:阿凡缇斯（AVNT）新增交易对公告（KRW、BTC、USDT市场）  ---------- 🔗 [查看来源](https://upbit.com',
-    },
-    {
-        date: '2025-09-15',
-        token: 'AVNT',
-        token_display: 'Avantis (AVNT)',
-        exchange: 'Binance',
-        type: 'spot',
-        time: '11:46',
-        notes: '📢 **Binance Will List Avantis (AVNT) with Seed Tag Applied **  Binance将上线Avantis（AVNT），并应用种子标签。  ---------- 🔗 [查看来源](https://www.binance.com/en/suppor',
-    },
-    {
-        date: '2025-09-15',
-        token: 'AVNT',
-        token_display: 'Avantis (AVNT)',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '13:59',
-        notes: '📢 **Bithumb LISTING:아반티스(AVNT) 원화 마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:Avantis（AVNT）韩元市场添加纪念空投活动  ---------- 🔗 [查看来源](https://feed.bithumb.com/notice',
-    },
-    {
-        date: '2025-09-15',
-        token: 'ZKC',
-        token_display: 'Boundless (ZKC)',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '17:24',
-        notes: '📢 **UPBIT LISTING:바운드리스(ZKC) 신규 거래지원 안내 (KRW, BTC, USDT 마켓) **  UPBIT LISTING:Boundless (ZKC) 新增交易对支持指南（KRW, BTC, USDT 市场）  ---------- 🔗 [查看来源](https:',
-    },
-    {
-        date: '2025-09-15',
-        token: 'BARD',
-        token_display: 'BARD (Lombard)',
-        exchange: 'OKX',
-        type: 'spot',
-        time: '20:00',
-        notes: '📢 **OKX LISTING:OKX to list BARD (Lombard) for spot trading **  OKX LISTING:OKX将上线BARD（Lombard）进行现货交易。  ---------- 🔗 [查看来源](https://www.okx.com/help/o',
-    },
-    {
-        date: '2025-09-15',
-        token: 'ZKC',
-        token_display: 'Brand (ZKC)',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '20:34',
-        notes: '📢 **Bithumb LISTING:바운드리스(ZKC) 원화 마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:Bounce Brand (ZKC)韩元市场上线纪念空投活动  ---------- 🔗 [查看来源](https://feed.bithumb.com/n',
-    },
-    {
-        date: '2025-09-15',
-        token: 'ZKC',
-        token_display: 'Boundless (ZKC)',
-        exchange: 'Bybit',
-        type: 'spot',
-        time: '22:15',
-        notes: '📢 **BYBIT: 🔥 Listing of ZKC on Convert **  BYBIT: 🔥 ZKC将在Convert平台上币  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/-listing-of-zkc-o',
-    },
-    {
-        date: '2025-09-15',
-        token: 'ZKC',
-        token_display: 'Boundless (ZKC)',
-        exchange: 'Bybit',
-        type: 'perp',
-        time: '22:16',
-        notes: '📢 **BYBIT: New Listing :  ZKCUSDT Perpetual Contract, with up to 25x leverage **  BYBIT: 新上市：ZKCUSDT 永续合约，支持最高25倍杠杆。  ---------- 🔗 [查看来源](https://anno',
-    },
-    {
-        date: '2025-09-16',
-        token: 'AVNT',
-        token_display: 'Avantis (AVNT)',
-        exchange: 'Binance',
-        type: 'spot',
-        time: '17:29',
-        notes: '📢 **Binance: Introducing Avantis (AVNT) on Binance HODLer Airdrops! Earn AVNT With Retroactive BNB Simple Earn Subscriptions **  Binance: Binance HODL',
-    },
-    {
-        date: '2025-09-16',
-        token: 'PORTALS',
-        token_display: 'PORTALS',
-        exchange: 'Bybit',
-        type: 'spot',
-        time: '20:15',
-        notes: '📢 **BYBIT: 🔥 Listing of PORTALS on Convert **  BYBIT: 🔥 PORTALS 在 Convert 上币  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/-listing-',
-    },
-    {
-        date: '2025-09-17',
-        token: 'EUL',
-        token_display: 'Euler (EUL)',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '10:30',
-        notes: '📢 **UPBIT LISTING:[거래] 오일러(EUL), 플룸(PLUME) 신규 거래지원 안내 (BTC, USDT 마켓) **  UPBIT LISTING:[交易] Euler (EUL), Plume (PLUME) 新交易支持通知 (BTC, USDT 市场)  -------',
-    },
-    {
-        date: '2025-09-17',
-        token: 'PLUME',
-        token_display: 'Plume (PLUME)',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '10:30',
-        notes: '📢 **UPBIT LISTING:[거래] 오일러(EUL), 플룸(PLUME) 신규 거래지원 안내 (BTC, USDT 마켓) **  UPBIT LISTING:[交易] Euler (EUL), Plume (PLUME) 新交易支持通知 (BTC, USDT 市场)  -------',
-    },
-    {
-        date: '2025-09-17',
-        token: 'TOSHI',
-        token_display: 'TOSHI (Toshi)',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '10:30',
-        notes: '📢 **UPBIT LISTING:토시(TOSHI) 신규 거래지원 안내 (KRW, USDT 마켓) **  UPBIT LISTING:TOSHI新交易市场支持公告 (KRW, USDT市场)  ---------- 🔗 [查看来源](https://upbit.com/service_ce',
-    },
-    {
-        date: '2025-09-17',
-        token: 'TOSHI',
-        token_display: 'TOSHI (Toshi)',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '10:45',
-        notes: '📢 **Bithumb LISTING:토시(TOSHI), 홀로월드(HOLO) 원화 마켓 추가 **  Bithumb LISTING:TOSHI (토시)、HOLO (홀로월드) 已增加韩元(KRW)市场交易对。  ---------- 🔗 [查看来源](https://feed.bithu',
-    },
-    {
-        date: '2025-09-17',
-        token: 'ENA',
-        token_display: 'ENA (Ethena)',
-        exchange: 'OKX',
-        type: 'spot',
-        time: '11:00',
-        notes: '📢 **OKX LISTING:OKX to list ENA (Ethena) for spot trading **  OKX LISTING:OKX将上线ENA（Ethena）进行现货交易。  ---------- 🔗 [查看来源](https://www.okx.com/help/okx-t',
-    },
-    {
-        date: '2025-09-17',
-        token: 'TOSHI',
-        token_display: 'TOSHI (Toshi)',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '11:44',
-        pairs: 'TOSHI/USD',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined TOSHIUSDT and STBLUSDT Perpetual Contracts (2025-09-17) **  Binance 期货将于2025年9月17日推出以USDT计价的TOSHI/USDT和S',
-    },
-    {
-        date: '2025-09-17',
-        token: 'STBL',
-        token_display: 'STBL',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '11:44',
-        pairs: 'STBL/USD',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined TOSHIUSDT and STBLUSDT Perpetual Contracts (2025-09-17) **  Binance 期货将于2025年9月17日推出以USDT计价的TOSHI/USDT和S',
-    },
-    {
-        date: '2025-09-17',
-        token: 'HOLO',
-        token_display: 'AI (HOLO)',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '12:19',
-        notes: '📢 **Bithumb LISTING:홀로월드 에이아이(HOLO) 원화 마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:HoloWorld AI (HOLO) 韩元市场新增纪念空投活动  ---------- 🔗 [查看来源](https://feed.bithum',
-    },
-    {
-        date: '2025-09-17',
-        token: 'ENA',
-        token_display: 'Ethena (ENA)',
-        exchange: 'OKX',
-        type: 'perp',
-        time: '12:30',
-        notes: '📢 **OKX LISTING:OKX to list perpetual futures for ENA, PENDLE crypto **  OKX LISTING:OKX将上线ENA和PENDLE的永续合约  ---------- 🔗 [查看来源](https://www.okx.com/he',
-    },
-    {
-        date: '2025-09-17',
-        token: 'PENDLE',
-        token_display: 'PENDLE',
-        exchange: 'OKX',
-        type: 'perp',
-        time: '12:30',
-        notes: '📢 **OKX LISTING:OKX to list perpetual futures for ENA, PENDLE crypto **  OKX LISTING:OKX将上线ENA和PENDLE的永续合约  ---------- 🔗 [查看来源](https://www.okx.com/he',
-    },
-    {
-        date: '2025-09-17',
-        token: 'BARD',
-        token_display: 'Lombard (BARD)',
-        exchange: 'Binance',
-        type: 'spot',
-        time: '17:57',
-        notes: '📢 **Binance: Introducing Lombard (BARD) on Binance HODLer Airdrops! Earn BARD With Retroactive BNB Simple Earn Subscriptions **  Binance: Binance HODL',
-    },
-    {
-        date: '2025-09-17',
-        token: 'STBL',
-        token_display: 'STBL',
-        exchange: 'Bybit',
-        type: 'perp',
-        time: '18:29',
-        notes: '📢 **BYBIT: New Listing : STBLUSDT Perpetual Contract in Innovation Zone, with up to 25x leverage **  BYBIT: 新上线：创新区 STBLUSDT 永续合约，最高支持25倍杠杆。  --------',
-    },
-    {
-        date: '2025-09-18',
-        token: 'BARD',
-        token_display: 'BARD (Lombard)',
-        exchange: 'OKX',
-        type: 'perp',
-        time: '15:00',
-        notes: '📢 **OKX LISTING:OKX to list perpetual futures for BARD crypto **  OKX LISTING:OKX将上线BARD永续合约  ---------- 🔗 [查看来源](https://www.okx.com/help/okx-to-list',
-    },
-    {
-        date: '2025-09-18',
-        token: 'RVV',
-        token_display: 'Nova (RVV)',
-        exchange: 'Binance',
-        type: 'spot',
-        time: '15:01',
-        notes: '📢 **Join the Booster Program and Pre-TGE Campaign on ****#Binance**** Wallet with  ****@Astra__Nova****   📅 Booster Program Start Time: September 18, ',
-    },
-    {
-        date: '2025-09-18',
-        token: 'BARD',
-        token_display: 'BARD (Lombard)',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '17:49',
-        notes: '📢 **UPBIT LISTING:롬바드(BARD) 신규 거래지원 안내 (KRW, BTC, USDT 마켓) **  UPBIT LISTING:关于Lombard（BARD）的新交易支持通知（支持韩元、比特币、泰达币交易对）  ---------- 🔗 [查看来源](https://upb',
-    },
-    {
-        date: '2025-09-18',
-        token: 'LA',
-        token_display: 'Lagrange (LA)',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '18:02',
-        notes: '📢 **UPBIT LISTING:라그랑주(LA) KRW 마켓 디지털 자산 추가 **  UPBIT LISTING:LA（拉吉朗芝） KRW市场新增数字资产  ---------- 🔗 [查看来源](https://upbit.com/service_center/notice?id=553',
-    },
-    {
-        date: '2025-09-18',
-        token: 'BARD',
-        token_display: 'BARD (Lombard)',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '18:20',
-        notes: '📢 **Bithumb LISTING:[마켓 추가] 롬바드(BARD),  비트텐서(TAO) 원화 마켓 추가 **  Bithumb LISTING:[市场新增] 已增加Lombard（BARD）和BitTensor（TAO）的韩元市场。  ---------- 🔗 [查看来源](https',
-    },
-    {
-        date: '2025-09-18',
-        token: 'TAO',
-        token_display: 'BitTensor (TAO)',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '18:20',
-        notes: '📢 **Bithumb LISTING:[마켓 추가] 롬바드(BARD),  비트텐서(TAO) 원화 마켓 추가 **  Bithumb LISTING:[市场新增] 已增加Lombard（BARD）和BitTensor（TAO）的韩元市场。  ---------- 🔗 [查看来源](https',
-    },
-    {
-        date: '2025-09-18',
-        token: 'AIA',
-        token_display: 'AI (AIA)',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '18:59',
-        notes: '📢 **Binance: DeAgent AI (AIA) Will Be Available on Binance Alpha and Binance Futures (2025-09-18) **  Binance: DeAgent AI (AIA) 将于2025年9月18日在Binance A',
-    },
-    {
-        date: '2025-09-18',
-        token: 'BARD',
-        token_display: 'BARD (Lombard)',
-        exchange: 'Bybit',
-        type: 'spot',
-        time: '19:40',
-        notes: '📢 **BYBIT: 🔥 Listing of BARD on  Convert & Bybit Savings **  BYBIT: 🔥 BARD 已在 Convert 和 Bybit Savings 上线  ---------- 🔗 [查看来源](https://announcements.by',
-    },
-    {
-        date: '2025-09-18',
-        token: 'L',
-        token_display: 'L',
-        exchange: 'Bybit',
-        type: 'spot',
-        time: '19:46',
-        notes: '📢 **BYBIT: 🔥 Listing of LBTC on Convert **  BYBIT: 🔥 LBTC 上市交易平台 Convert  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/-listing-of-l',
-    },
-    {
-        date: '2025-09-18',
-        token: 'BARD',
-        token_display: 'Lombard (BARD)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '23:55',
-        pairs: 'BARD/USD',
-        notes: '📢 **COINBASE LISTING: Spot trading for Lombard (BARD) will go live on 18 September 2025. The opening of our BARD-USD trading pair will begin later tod',
-    },
-    {
-        date: '2025-09-19',
-        token: 'ETHFI',
-        token_display: 'ETHFI',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '11:09',
-        notes: '📢 **UPBIT LISTING:이더파이(ETHFI), 리졸브(RESOLV), 이니시아(INIT), 스파크(SPK) 신규 거래지원 안내 (BTC, USDT 마켓) **  UPBIT LISTING:以下为新支持的交易对（BTC、USDT市场）通知：   - **EtherFi（E',
-    },
-    {
-        date: '2025-09-19',
-        token: 'RESOLV',
-        token_display: 'RESOLV (Resolv)',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '11:09',
-        notes: '📢 **UPBIT LISTING:이더파이(ETHFI), 리졸브(RESOLV), 이니시아(INIT), 스파크(SPK) 신규 거래지원 안내 (BTC, USDT 마켓) **  UPBIT LISTING:以下为新支持的交易对（BTC、USDT市场）通知：   - **EtherFi（E',
-    },
-    {
-        date: '2025-09-19',
-        token: 'INIT',
-        token_display: 'INISIA (INIT)',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '11:09',
-        notes: '📢 **UPBIT LISTING:이더파이(ETHFI), 리졸브(RESOLV), 이니시아(INIT), 스파크(SPK) 신규 거래지원 안내 (BTC, USDT 마켓) **  UPBIT LISTING:以下为新支持的交易对（BTC、USDT市场）通知：   - **EtherFi（E',
-    },
-    {
-        date: '2025-09-19',
-        token: 'SPK',
-        token_display: 'Spark (SPK)',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '11:09',
-        notes: '📢 **UPBIT LISTING:이더파이(ETHFI), 리졸브(RESOLV), 이니시아(INIT), 스파크(SPK) 신규 거래지원 안내 (BTC, USDT 마켓) **  UPBIT LISTING:以下为新支持的交易对（BTC、USDT市场）通知：   - **EtherFi（E',
-    },
-    {
-        date: '2025-09-19',
-        token: 'KMNO',
-        token_display: 'KMNO',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '13:59',
-        notes: '📢 **Bithumb LISTING:카미노 파이낸스(KMNO) 원화 마켓 추가 **  Bithumb LISTING:Kamino Finance（KMNO）增加韩元交易对。  ---------- 🔗 [查看来源](https://feed.bithumb.com/notice/1649',
-    },
-    {
-        date: '2025-09-19',
-        token: 'ASTER',
-        token_display: 'Aster (ASTER)',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '18:57',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined ASTERUSDT and TRADOORUSDT Perpetual Contracts (2025-09-19) **  Binance期货将推出以USDⓈ计价的ASTERUSDT和TRADOORUSDT',
-    },
-    {
-        date: '2025-09-19',
-        token: 'TRADOOR',
-        token_display: 'TRADOOR',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '18:57',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined ASTERUSDT and TRADOORUSDT Perpetual Contracts (2025-09-19) **  Binance期货将推出以USDⓈ计价的ASTERUSDT和TRADOORUSDT',
-    },
-    {
-        date: '2025-09-19',
-        token: 'ASTER',
-        token_display: 'Aster (ASTER)',
-        exchange: 'Bybit',
-        type: 'pre-market',
-        time: '9:00 UTC',
-        notes: '📢 **BYBIT: Listing of ASTERUSDT on Bybit Perpetual Pre-Market on Sep 19, 2025, 9:00AM UTC **  BYBIT: 2025年9月19日UTC时间上午9点，ASTERUSDT将在Bybit永续合约预市上线。  --',
-    },
-    {
-        date: '2025-09-22',
-        token: 'SUN',
-        token_display: 'SUN',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '10:30',
-        notes: '📢 **UPBIT LISTING:썬(SUN) KRW, USDT 마켓 디지털 자산 추가 **  UPBIT LISTING:SUN (太阳币) 已在 KRW 和 USDT 市场中新增数字资产。  ---------- 🔗 [查看来源](https://upbit.com/service_ce',
-    },
-    {
-        date: '2025-09-22',
-        token: 'ASTER',
-        token_display: 'Aster (ASTER)',
-        exchange: 'OKX',
-        type: 'perp',
-        time: '12:00',
-        notes: '📢 **OKX LISTING:OKX to list perpetual futures for ASTER crypto **  OKX LISTING:OKX 将上线 ASTER 币的永续期货合约  ---------- 🔗 [查看来源](https://www.okx.com/help/ok',
-    },
-    {
-        date: '2025-09-22',
-        token: 'AVNT',
-        token_display: 'Avantis (AVNT)',
-        exchange: 'OKX',
-        type: 'perp',
-        time: '23:00',
-        notes: '📢 **OKX LISTING:OKX to list perpetual futures for AVNT crypto **  OKX LISTING:OKX将上线AVNT加密资产的永续合约  ---------- 🔗 [查看来源](https://www.okx.com/help/okx-to',
-    },
-    {
-        date: '2025-09-23',
-        token: 'CFG',
-        token_display: 'Centrifuge (CFG)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '07:49',
-        notes: '📢 **COINBASE LISTING: Assets added to the roadmap today: Centrifuge (CFG) and TROLL (TROLL) **  COINBASE LISTING: 今日新增至发展规划的资产包括：Centrifuge（CFG）和TROLL',
-    },
-    {
-        date: '2025-09-23',
-        token: 'UXLINK',
-        token_display: 'UXLINK',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '11:00',
-        notes: '📢 **UPBIT LISTING:[거래] 유엑스링크(UXLINK) 거래 유의 종목 지정 안내 **  UPBIT LISTING:[交易] UXLINK交易注意事项指定公告  ---------- 🕒 __2025-09-23 11:00:05__',
-    },
-    {
-        date: '2025-09-23',
-        token: 'BLESS',
-        token_display: 'Bless (BLESS)',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '11:00',
-        notes: '📢 **Binance: Bless (BLESS) Will Be Available on Binance Alpha and Binance Futures (2025-09-23) **  Binance: Bless (BLESS) 将于2025年9月23日在Binance Alpha及B',
-    },
-    {
-        date: '2025-09-23',
-        token: 'HEMI',
-        token_display: 'Hemi (HEMI)',
-        exchange: 'Binance',
-        type: 'spot',
-        time: '13:09',
-        notes: '📢 **Binance: Introducing Hemi (HEMI) on Binance HODLer Airdrops! Earn HEMI With Retroactive BNB Simple Earn Subscriptions **  Binance: 在Binance HODLer',
-    },
-    {
-        date: '2025-09-23',
-        token: 'XAN',
-        token_display: 'Anoma (XAN)',
-        exchange: 'Bybit',
-        type: 'spot',
-        time: '14:43',
-        notes: '📢 **BYBIT: Postponement of Anoma (XAN) Spot listing **  BYBIT: Anoma（XAN）现货上市延迟公告提示：“Anoma（XAN）现货上市时间将有所调整，具体时间将另行通知。” 请投资者关注官方进一步的消息，避免因时间变动可能造成的不便。开',
-    },
-    {
-        date: '2025-09-23',
-        token: 'XAN',
-        token_display: 'Anoma (XAN)',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '17:59',
-        notes: '📢 **Binance: Anoma (XAN) Will Be Available on Binance Alpha and Binance Futures (2025-09-23) **  Binance: Anoma（XAN）将于2025年9月23日在币安Alpha和币安期货上线。  ----',
-    },
-    {
-        date: '2025-09-24',
-        token: 'XPL',
-        token_display: 'Plasma (XPL)',
-        exchange: 'Binance',
-        type: 'spot',
-        time: '16:00',
-        notes: '📢 **Binance: Introducing Plasma (XPL) on Binance HODLer Airdrops! Earn XPL With Retroactive BNB Simple Earn Subscriptions **  Binance: 在 Binance HODLe',
-    },
-    {
-        date: '2025-09-24',
-        token: 'IN',
-        token_display: 'Infiniti (IN)',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '16:10',
-        notes: '📢 **UPBIT LISTING:[거래] 인피닛(IN) BTC, USDT 마켓, 비쓰리(B3) USDT 마켓 신규 거래지원 안내 **  UPBIT LISTING:[交易] Infiniti (IN) BTC、USDT市场，以及BTHREE (B3) USDT市场新增交易支持公告  ',
-    },
-    {
-        date: '2025-09-24',
-        token: 'BTHREE',
-        token_display: 'BTHREE',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '16:10',
-        notes: '📢 **UPBIT LISTING:[거래] 인피닛(IN) BTC, USDT 마켓, 비쓰리(B3) USDT 마켓 신규 거래지원 안내 **  UPBIT LISTING:[交易] Infiniti (IN) BTC、USDT市场，以及BTHREE (B3) USDT市场新增交易支持公告  ',
-    },
-    {
-        date: '2025-09-24',
-        token: 'FLUID',
-        token_display: 'Fluid (FLUID)',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '16:10',
-        notes: '📢 **UPBIT LISTING:플루이드(FLUID) 신규 거래지원 안내 (KRW, BTC, USDT 마켓) **  UPBIT LISTING:以下是关于FLUID（플루이드）新增交易对的通知（KRW、BTC、USDT市场）  ---------- 🔗 [查看来源](https://u',
-    },
-    {
-        date: '2025-09-24',
-        token: 'HEMI',
-        token_display: 'Hemi (HEMI)',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '16:38',
-        notes: '📢 **Bithumb LISTING:헤미(HEMI) 원화 마켓 추가 **  Bithumb LISTING:HEMI（HEMI）新增韩元市场  ---------- 🔗 [查看来源](https://feed.bithumb.com/notice/1650043) 🕒 __2025-09-2',
-    },
-    {
-        date: '2025-09-24',
-        token: 'FLUID',
-        token_display: 'Fluid (FLUID)',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '17:25',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined FLUIDUSDT Perpetual Contract (2025-09-24) **  Binance 期货将上线以 USDT 保证金的 FLUIDUSDT 永续合约（2025-09-24）  -----',
-    },
-    {
-        date: '2025-09-24',
-        token: 'XPL',
-        token_display: 'XPL (Plasma)',
-        exchange: 'OKX',
-        type: 'pre-market',
-        time: '21:01',
-        notes: '📢 **OKX LISTING:OKX to list XPL (Plasma) for spot trading and convert pre-market futures to standard perpetual futures **  OKX LISTING:OKX将上线XPL（Plasm',
-    },
-    {
-        date: '2025-09-25',
-        token: 'XPL',
-        token_display: 'XPL (Plasma)',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '09:57',
-        notes: '📢 **UPBIT LISTING:플라즈마(XPL) 신규 거래지원 안내 (KRW, BTC, USDT 마켓) **  UPBIT LISTING:플라즈마(XPL)新增交易支持通知（KRW、BTC、USDT市场）  ---------- 🔗 [查看来源](https://upbit.com/',
-    },
-    {
-        date: '2025-09-25',
-        token: 'POPCAT',
-        token_display: 'POPCAT',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '15:17',
-        notes: '📢 **Bithumb LISTING:팝캣(POPCAT) 원화 마켓 추가 (거래 수수료 무료) **  Bithumb LISTING:POPCAT韩元市场已上线（交易手续费免费）。  ---------- 🔗 [查看来源](https://feed.bithumb.com/notice/1',
-    },
-    {
-        date: '2025-09-25',
-        token: 'BTR',
-        token_display: 'Bitlayer (BTR)',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '15:40',
-        notes: '📢 **Bithumb LISTING:[이벤트] 비트레이어(BTR) 원화 마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:[活动] 庆祝 Bitlayer (BTR) 新增韩元市场空投活动  ---------- 🔗 [查看来源](https://feed.bith',
-    },
-    {
-        date: '2025-09-25',
-        token: 'COAI',
-        token_display: 'AI (COAI)',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '16:45',
-        notes: '📢 **Binance: ChainOpera AI (COAI) Will Be Available on Binance Alpha and Binance Futures (2025-09-25) **  Binance: ChainOpera AI (COAI) 将于2025年9月25日在币',
-    },
-    {
-        date: '2025-09-25',
-        token: 'MIRA',
-        token_display: 'Mira (MIRA)',
-        exchange: 'Binance',
-        type: 'spot',
-        time: '18:00',
-        notes: '📢 **Binance: Introducing Mira (MIRA) on Binance HODLer Airdrops! Earn MIRA With Retroactive BNB Simple Earn Subscriptions **  Binance: 在币安 HODLer 空投中引',
-    },
-    {
-        date: '2025-09-25',
-        token: 'XPL',
-        token_display: 'XPL (Plasma)',
-        exchange: 'Bybit',
-        type: 'spot',
-        time: '21:16',
-        notes: '📢 **BYBIT: 🔥 Listing of XPL on Convert & Bybit Savings **  BYBIT: XPL 已在 Convert 和 Bybit 理财平台上线  ---------- 🔗 [查看来源](https://announcements.bybit.com/e',
-    },
-    {
-        date: '2025-09-25',
-        token: 'CFG',
-        token_display: 'Centrifuge (CFG)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '23:54',
-        pairs: 'CFG/USD',
-        notes: '📢 **COINBASE LISTING: Spot trading for Centrifuge (CFG) and TROLL (TROLL) will go live on 25 September 2025. The opening of our CFG-USD and TROLL-USD ',
-    },
-    {
-        date: '2025-09-26',
-        token: 'HANA',
-        token_display: 'Network (HANA)',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '14:01',
-        notes: '📢 **Binance: Hana Network (HANA) Will Be Available on Binance Alpha and Binance Futures (2025-09-26) **  Binance: Hana Network（HANA）将于2025年9月26日在Binan',
-    },
-    {
-        date: '2025-09-26',
-        token: 'FLUID',
-        token_display: 'Fluid (FLUID)',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '15:50',
-        notes: '📢 **Bithumb LISTING:[마켓 추가] 플루이드(FLUID), 쿠디스(CUDIS) 원화 마켓 추가 **  Bithumb LISTING:[市场新增] FLUID（플루이드）、CUDIS（쿠디스）已新增韩元市场。  ---------- 🔗 [查看来源](https://fe',
-    },
-    {
-        date: '2025-09-26',
-        token: 'FF',
-        token_display: 'Finance (FF)',
-        exchange: 'Binance',
-        type: 'spot',
-        time: '15:52',
-        notes: '📢 **Binance: Introducing Falcon Finance (FF) on Binance HODLer Airdrops! Earn FF With Retroactive BNB Simple Earn Subscriptions **  Binance: Binance H',
-    },
-    {
-        date: '2025-09-26',
-        token: 'CUDIS',
-        token_display: 'CUDIS',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '16:45',
-        notes: '📢 **Bithumb LISTING:쿠디스(CUDIS) 원화 마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:CUDIS 韩元市场上线纪念空投活动  ---------- 🔗 [查看来源](https://feed.bithumb.com/notice/165011',
-    },
-    {
-        date: '2025-09-26',
-        token: 'APR',
-        token_display: 'Priori (APR)',
-        exchange: 'Binance',
-        type: 'spot',
-        time: '17:00',
-        notes: '📢 **Binance Earn New Listing Special Offer: Subscribe to ZKC, HEMI or XPL Locked Products to Enjoy 200% APR for 7 Days! **  币安赚币新上线特惠活动：订阅 ZKC、HEMI 或 ',
-    },
-    {
-        date: '2025-09-26',
-        token: 'MIRA',
-        token_display: 'Mira (MIRA)',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '17:31',
-        notes: '📢 **UPBIT LISTING:미라네트워크(MIRA) 신규 거래지원 안내 (KRW, BTC, USDT 마켓) **  UPBIT LISTING:MIRA网络(MIRA)新增交易支持公告 (KRW, BTC, USDT市场)  ---------- 🔗 [查看来源](https://u',
-    },
-    {
-        date: '2025-09-26',
-        token: 'AKE',
-        token_display: 'AKE',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '17:46',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined AKEUSDT and ORDERUSDT Perpetual Contracts (2025-09-26) **  Binance期货将于2025年9月26日上线以USDT为保证金的AKEUSDT和ORDE',
-    },
-    {
-        date: '2025-09-26',
-        token: 'MIRA',
-        token_display: 'Mira (MIRA)',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '19:20',
-        notes: '📢 **Bithumb LISTING:미라(MIRA) 원화마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:为庆祝MIRA上线韩元市场，将举行空投活动。  ---------- 🔗 [查看来源](https://feed.bithumb.com/notice/16501',
-    },
-    {
-        date: '2025-09-26',
-        token: 'MIRA',
-        token_display: 'Mira (MIRA)',
-        exchange: 'Binance',
-        type: 'spot',
-        time: '19:30',
-        notes: '📢 **Binance Will Add Mira (MIRA) on Earn, Buy Crypto, Convert, Margin & Futures **  币安将上线 Mira（MIRA），支持赚币、购买加密货币、兑换、杠杆交易及合约交易等功能。  ---------- 🔗 [查看来源]',
-    },
-    {
-        date: '2025-09-26',
-        token: 'MIRA',
-        token_display: 'Mira (MIRA)',
-        exchange: 'Bybit',
-        type: 'perp',
-        time: '21:00',
-        pairs: 'MIRA/USD',
-        notes: '📢 **BYBIT: New Listing :  MIRAUSDT Perpetual Contract, with up to 50x leverage **  BYBIT: 上新交易对：MIRA/USDT永续合约，最高可进行50倍杠杆交易。  ---------- 🔗 [查看来源](https',
-    },
-    {
-        date: '2025-09-26',
-        token: 'RL',
-        token_display: 'RL',
-        exchange: 'Bybit',
-        type: 'spot',
-        time: '22:21',
-        notes: '📢 **BYBIT: 🔥 Listing of RLUSD on Convert **  BYBIT: 🔥 RLUSD 在 Convert 平台上线  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/-listing-of',
-    },
-    {
-        date: '2025-09-27',
-        token: 'LIGHT',
-        token_display: 'Bitlight (LIGHT)',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '14:00',
-        notes: '📢 **Binance: Bitlight (LIGHT) Will Be Available on Binance Alpha and Binance Futures (2025-09-27) **  Binance: Bitlight (LIGHT) 将于 2025 年 9 月 27 日在币安阿',
-    },
-    {
-        date: '2025-09-27',
-        token: 'APEX',
-        token_display: 'APEX',
-        exchange: 'Hyperliquid',
-        type: 'perp',
-        time: '14:28',
-        pairs: 'APEX/USD',
-        notes: '📢 **【hyperliquid】 新上线APEX/USDC永续合约，最高可达3倍杠杆 **  【Hyperliquid】 新上线 APEX/USDC 永续合约，最高支持 3 倍杠杆。  ---------- 🕒 __2025-09-27 14:28:30__',
-    },
-    {
-        date: '2025-09-29',
-        token: 'XAN',
-        token_display: 'Anoma (XAN)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '02:35',
-        pairs: 'XAN/USD',
-        notes: '📢 **COINBASE LISTING: Spot trading for Anoma (XAN) will go live on 29 September 2025. The opening of our XAN-USD trading pair will begin later today i',
-    },
-    {
-        date: '2025-09-29',
-        token: 'XPL',
-        token_display: 'Plazma (XPL)',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '16:25',
-        notes: '📢 **Bithumb LISTING:플라즈마(XPL) 원화 마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:为纪念 Plazma (XPL) 韩元市场上线，推出空投活动  ---------- 🔗 [查看来源](https://feed.bithumb.com/no',
-    },
-    {
-        date: '2025-09-29',
-        token: 'EDEN',
-        token_display: 'OpenEden (EDEN)',
-        exchange: 'Binance',
-        type: 'spot',
-        time: '16:30',
-        notes: '📢 **Binance: Introducing OpenEden (EDEN) on Binance HODLer Airdrops! Earn EDEN With Retroactive BNB Simple Earn Subscriptions **  Binance: 在币安HODLer空投',
-    },
-    {
-        date: '2025-09-29',
-        token: 'XAN',
-        token_display: 'Anoma (XAN)',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '16:30',
-        notes: '📢 **Binance: Anoma (XAN) Listing Will Be Postponed on Binance Alpha and Binance Futures (2025-09-29) **  Binance: Anoma（XAN）在Binance Alpha和Binance Fut',
-    },
-    {
-        date: '2025-09-29',
-        token: 'SUPER',
-        token_display: 'SUPER',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '16:53',
-        notes: '📢 **UPBIT LISTING:슈퍼버스(SUPER) 신규 거래지원 안내 (KRW, BTC, USDT 마켓) **  UPBIT LISTING:SUPER新增交易对公告（KRW、BTC、USDT市场）  ---------- 🔗 [查看来源](https://upbit.com/ser',
-    },
-    {
-        date: '2025-09-29',
-        token: 'FF',
-        token_display: 'Finance (FF)',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '17:34',
-        notes: '📢 **UPBIT LISTING:[거래] 팔콘파이낸스(FF) 신규 거래지원 안내 (KRW, USDT 마켓) **  UPBIT LISTING:[交易] 新增Falcon Finance(FF)交易对指南（KRW, USDT市场）  ---------- 🕒 __2025-09-29 1',
-    },
-    {
-        date: '2025-09-29',
-        token: 'XAN',
-        token_display: 'Anoma (XAN)',
-        exchange: 'Bybit',
-        type: 'spot',
-        time: '18:21',
-        notes: '📢 **BYBIT: 🔥 Listing of XAN on Convert **  BYBIT: 🔥 XAN上市Convert交易平台  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/-listing-of-xan-o',
-    },
-    {
-        date: '2025-09-29',
-        token: 'XAN',
-        token_display: 'Anoma (XAN)',
-        exchange: 'Bybit',
-        type: 'perp',
-        time: '19:01',
-        notes: '📢 **BYBIT: New Listing :  XANUSDT Perpetual Contract, with up to 25x leverage **  BYBIT: 新产品：XANUSDT 永续合约，最高支持 25 倍杠杆  ---------- 🔗 [查看来源](https://ann',
-    },
-    {
-        date: '2025-09-29',
-        token: 'FF',
-        token_display: 'Finance (FF)',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '19:30',
-        notes: '📢 **Bithumb LISTING:팔콘 파이낸스(FF) 원화마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:Falcon Finance（FF）韩元市场上线纪念空投活动  ---------- 🔗 [查看来源](https://feed.bithumb.com/n',
-    },
-    {
-        date: '2025-09-29',
-        token: 'FF',
-        token_display: 'Finance (FF)',
-        exchange: 'Binance',
-        type: 'spot',
-        time: '20:50',
-        notes: '📢 **Binance: Falcon Finance (FF) Listing Will Be Postponed **  Binance: Falcon Finance (FF) 上市将被推迟。  ---------- 🔗 [查看来源](https://www.binance.com/en/su',
-    },
-    {
-        date: '2025-09-30',
-        token: 'XAN',
-        token_display: 'Anoma (XAN)',
-        exchange: 'OKX',
-        type: 'perp',
-        time: '00:01',
-        notes: '📢 **OKX LISTING:OKX to list perpetual futures for XAN crypto **  OKX LISTING:OKX 将在其平台上上线 XAN 加密资产的永续期货合约。  ---------- 🔗 [查看来源](https://www.okx.com/he',
-    },
-    {
-        date: '2025-09-30',
-        token: 'VFY',
-        token_display: 'Verify (VFY)',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '14:00',
-        notes: '📢 **Binance: zkVerify (VFY) Will Be Available on Binance Alpha and Binance Futures (2025-09-30) **  Binance: zkVerify (VFY) 将于2025年9月30日上线Binance Alph',
-    },
-    {
-        date: '2025-09-30',
-        token: 'EDEN',
-        token_display: 'OpenEden (EDEN)',
-        exchange: 'OKX',
-        type: 'perp',
-        time: '19:02',
-        notes: '📢 **OKX LISTING:OKX to list perpetual futures for EDEN crypto **  OKX LISTING:OKX将上线 EDEN 代币的永续合约  ---------- 🔗 [查看来源](https://www.okx.com/help/okx-to',
-    },
-    {
-        date: '2025-09-30',
-        token: 'EDEN',
-        token_display: 'OpenEden (EDEN)',
-        exchange: 'Bybit',
-        type: 'perp',
-        time: '20:00',
-        notes: '📢 **BYBIT: New Listing :  EDENUSDT Perpetual Contract, with up to 25x leverage **  BYBIT: 新上线：EDENUSDT永续合约，最高支持25倍杠杆  ---------- 🔗 [查看来源](https://anno',
-    },
-    {
-        date: '2025-09-30',
-        token: 'SYND',
-        token_display: 'Syndicate (SYND)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '20:43',
-        notes: '📢 **COINBASE LISTING: Assets added to the roadmap today: Syndicate (SYND) **  COINBASE LISTING: 今日新增至路线图的资产：Syndicate (SYND)  ---------- 🔗 [查看来源](http',
-    },
-    {
-        date: '2025-09-30',
-        token: 'VFY',
-        token_display: 'Verify (VFY)',
-        exchange: 'Bybit',
-        type: 'perp',
-        time: '20:45',
-        notes: '📢 **BYBIT: New Listing : VFYUSDT Perpetual Contract in Innovation Zone, with up to 50x leverage **  BYBIT: 新上线：创新区新增 VFYUSDT 永续合约，最高支持 50 倍杠杆  -------',
-    },
-    {
-        date: '2025-10-01',
-        token: 'SOMI',
-        token_display: 'SOMNIA (SOMI)',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '12:26',
-        notes: '📢 **UPBIT LISTING:솜니아(SOMI) 신규 거래지원 안내 (KRW, BTC, USDT 마켓) **  UPBIT LISTING:SOMNIA(SOMI)新增交易对指南 (KRW, BTC, USDT 市场)  ---------- 🔗 [查看来源](https://upbi',
-    },
-    {
-        date: '2025-10-01',
-        token: 'TRUTH',
-        token_display: 'Network (TRUTH)',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '14:00',
-        notes: '📢 **Binance: Swarm Network (TRUTH) Will Be Available on Binance Alpha and Binance Futures (2025-10-01) **  Binance: Swarm Network (TRUTH) 将于2025年10月1日',
-    },
-    {
-        date: '2025-10-01',
-        token: 'SOMI',
-        token_display: 'Somnia (SOMI)',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '14:22',
-        notes: '📢 **Bithumb LISTING:[이벤트] 솜니아(SOMI) 원화마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:[活动] 为庆祝SOMNIUM韩元市场上线，举行空投活动  ---------- 🔗 [查看来源](https://feed.bithumb.com',
-    },
-    {
-        date: '2025-10-01',
-        token: 'NOM',
-        token_display: 'Nomina (NOM)',
-        exchange: 'Binance',
-        type: 'spot',
-        time: '15:30',
-        notes: '📢 **Binance Will Add Nomina (NOM) on Earn, Buy Crypto, Convert, Margin & Futures **  Binance将在收益、购买加密货币、兑换、杠杆和期货产品中上线Nomina (NOM)。  ---------- 🔗 [查看来源',
-    },
-    {
-        date: '2025-10-01',
-        token: 'TRUTH',
-        token_display: 'Network (TRUTH)',
-        exchange: 'Bybit',
-        type: 'perp',
-        time: '22:26',
-        notes: '📢 **BYBIT: New Listing :  TRUTHUSDT Perpetual Contract, with up to 25x leverage **  BYBIT: 新上市：TRUTHUSDT永续合约，最高支持25倍杠杆  ---------- 🔗 [查看来源](https://an',
-    },
-    {
-        date: '2025-10-02',
-        token: 'SUPER',
-        token_display: 'SUPER',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '13:09',
-        notes: '📢 **Bithumb LISTING:슈퍼버스(SUPER), 더블제로(2Z) 원화 마켓 추가 (거래 수수료 무료) **  Bithumb LISTING:SUPER币（SUPER）和2Z币（2Z）已上线韩元交易市场，且交易手续费全免。  ---------- 🔗 [查看来源](https',
-    },
-    {
-        date: '2025-10-02',
-        token: 'UXLINK',
-        token_display: 'UXLINK',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '15:00',
-        notes: '📢 **UPBIT LISTING:[거래] 유엑스링크(UXLINK) 거래지원 종료 안내 (11/3 15:00) **  UPBIT LISTING:[公告] UXLINK交易支持结束通知（11月3日 15:00）  ---------- 🕒 __2025-10-02 12:00:04__',
-    },
-    {
-        date: '2025-10-03',
-        token: 'MORPHO',
-        token_display: 'Morpho (MORPHO)',
-        exchange: 'Binance',
-        type: 'spot',
-        time: '22:30',
-        notes: '📢 **Binance Will Add Morpho (MORPHO) on Earn, Buy Crypto, Convert & Margin **  Binance 将在 Earn、Buy Crypto、Convert 和 Margin 业务中上线 Morpho (MORPHO) 代币。  ',
-    },
-    {
-        date: '2025-10-06',
-        token: 'LYN',
-        token_display: 'AI (LYN)',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '14:00',
-        notes: '📢 **Binance: Everlyn AI (LYN) Will Be Available on Binance Alpha and Binance Futures (2025-10-06) **  Binance: Everlyn AI (LYN) 将于2025年10月6日上线Binance ',
-    },
-    {
-        date: '2025-10-06',
-        token: 'LYN',
-        token_display: 'AI (LYN)',
-        exchange: 'Bybit',
-        type: 'perp',
-        time: '16:20',
-        notes: '📢 **BYBIT: New Listing :  LYNUSDT Perpetual Contract, with up to 50x leverage **  BYBIT: 新上线：LYNUSDT永续合约，最高支持50倍杠杆  ---------- 🔗 [查看来源](https://announ',
-    },
-    {
-        date: '2025-10-06',
-        token: 'ASTER',
-        token_display: 'Aster (ASTER)',
-        exchange: 'Binance',
-        type: 'spot',
-        time: '19:30',
-        notes: '📢 **Binance Will Add Aster (ASTER) on Earn, Buy Crypto, Convert & Margin **  Binance将上线Aster（ASTER）至收益、购买加密货币、兑换和保证金交易功能。  ---------- 🔗 [查看来源](https:/',
-    },
-    {
-        date: '2025-10-06',
-        token: 'LINEA',
-        token_display: 'Linea (LINEA)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '23:38',
-        notes: '📢 **COINBASE LISTING: Assets added to the roadmap today: Linea (LINEA) **  COINBASE LISTING: 今日添加到路线的资产：Linea（LINEA）  ---------- 🔗 [查看来源](https://twit',
-    },
-    {
-        date: '2025-10-07',
-        token: 'DOOD',
-        token_display: 'Doodles (DOOD)',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '12:35',
-        notes: '📢 **UPBIT LISTING:두들즈(DOOD) 신규 거래지원 안내 (KRW, USDT 마켓) **  UPBIT LISTING:DOOD（DOOD）新交易市场通知（支持KRW、USDT市场）  ---------- 🔗 [查看来源](https://upbit.com/service',
-    },
-    {
-        date: '2025-10-07',
-        token: 'KGEN',
-        token_display: 'KGen (KGEN)',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '14:00',
-        notes: '📢 **Binance: KGen (KGEN) Will Be Available on Binance Alpha and Binance Futures (2025-10-07) **  Binance: KGen（KGEN）将于2025年10月7日上线Binance Alpha和Binanc',
-    },
-    {
-        date: '2025-10-07',
-        token: 'AVNT',
-        token_display: 'AVNT (Avantis)',
-        exchange: 'OKX',
-        type: 'spot',
-        time: '18:02',
-        notes: '📢 **OKX LISTING:OKX to list AVNT (Avantis), TOSHI (Toshi) for spot trading **  OKX LISTING:OKX将上线AVNT（Avantis）和TOSHI（Toshi）进行现货交易。  ---------- 🔗 [查看来源',
-    },
-    {
-        date: '2025-10-07',
-        token: 'TOSHI',
-        token_display: 'TOSHI (Toshi)',
-        exchange: 'OKX',
-        type: 'spot',
-        time: '18:02',
-        notes: '📢 **OKX LISTING:OKX to list AVNT (Avantis), TOSHI (Toshi) for spot trading **  OKX LISTING:OKX将上线AVNT（Avantis）和TOSHI（Toshi）进行现货交易。  ---------- 🔗 [查看来源',
-    },
-    {
-        date: '2025-10-07',
-        token: 'XAN',
-        token_display: 'Anoma (XAN)',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '19:00',
-        notes: '📢 **Bithumb LISTING:아노마(XAN) 원화 마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:为庆祝 Anoma (XAN) 韩元市场上线举办空投活动。  ---------- 🔗 [查看来源](https://feed.bithumb.com/noti',
-    },
-    {
-        date: '2025-10-09',
-        token: 'LINEA',
-        token_display: 'Linea (LINEA)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '00:13',
-        pairs: 'LINEA/USD',
-        notes: '📢 **COINBASE LISTING: Spot trading for Linea (LINEA), Noice (NOICE), and Syndicate (SYND) will go live on 9 October 2025. The opening of our LINEA-USD',
-    },
-    {
-        date: '2025-10-09',
-        token: 'NOICE',
-        token_display: 'Noice (NOICE)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '00:13',
-        pairs: 'NOICE/USD',
-        notes: '📢 **COINBASE LISTING: Spot trading for Linea (LINEA), Noice (NOICE), and Syndicate (SYND) will go live on 9 October 2025. The opening of our LINEA-USD',
-    },
-    {
-        date: '2025-10-09',
-        token: 'SYND',
-        token_display: 'Syndicate (SYND)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '00:13',
-        pairs: 'SYND/USD',
-        notes: '📢 **COINBASE LISTING: Spot trading for Linea (LINEA), Noice (NOICE), and Syndicate (SYND) will go live on 9 October 2025. The opening of our LINEA-USD',
-    },
-    {
-        date: '2025-10-09',
-        token: 'GIGGLE',
-        token_display: 'Fund (GIGGLE)',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '16:23',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined GIGGLEUSDT Perpetual Contract (2025-10-09) **  Binance期货将推出以USDⓈ为保证金的GIGGLEUSDT永续合约（2025-10-09）  -------',
-    },
-    {
-        date: '2025-10-10',
-        token: 'MET',
-        token_display: 'MET (Meteora)',
-        exchange: 'Bybit',
-        type: 'pre-market',
-        time: '10:45 UTC',
-        notes: '📢 **BYBIT: Listing of METUSDT on Bybit Perpetual Pre-Market on Oct 10, 2025, 10:45AM UTC **  BYBIT: 2025年10月10日，世界标准时间上午10:45，Bybit平台将上线METUSDT永续合约的预市',
-    },
-    {
-        date: '2025-10-10',
-        token: 'MON',
-        token_display: 'MON (Monad)',
-        exchange: 'OKX',
-        type: 'pre-market',
-        time: '13:02',
-        notes: '📢 **OKX LISTING:OKX to list pre-market perpetual futures for MON (Monad) crypto **  OKX LISTING:OKX将上线MON（Monad）加密货币的预市永续合约。  ---------- 🔗 [查看来源](http',
-    },
-    {
-        date: '2025-10-10',
-        token: 'IN',
-        token_display: 'Infiniti (IN)',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '14:00',
-        notes: '📢 **UPBIT LISTING:인피닛(IN) KRW 마켓 디지털 자산 추가 **  UPBIT LISTING:Infinittoken（IN）KRW市场新增数字资产。  ---------- 🔗 [查看来源](https://upbit.com/service_center/notice',
-    },
-    {
-        date: '2025-10-10',
-        token: 'MON',
-        token_display: 'MON (Monad)',
-        exchange: 'Binance',
-        type: 'pre-market',
-        time: '14:45',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined MONUSDT Perpetual Contract Pre-Market Trading (2025-10-10) **  Binance期货将推出以USDⓈ为保证金标的的MONUSDT永续合约预市交易（2',
-    },
-    {
-        date: '2025-10-10',
-        token: 'WAL',
-        token_display: 'Walrus (WAL)',
-        exchange: 'Binance',
-        type: 'spot',
-        time: '15:00',
-        notes: '📢 **Binance Will Add Walrus (WAL) on Earn, Buy Crypto, Convert & Margin **  Binance将上线Walrus (WAL)收益、购买加密货币、兑换及保证金交易。  ---------- 🔗 [查看来源](https://www',
-    },
-    {
-        date: '2025-10-10',
-        token: 'ASTER',
-        token_display: 'Aster (ASTER)',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '15:51',
-        notes: '📢 **Bithumb LISTING:아스터(ASTER) 원화 마켓 추가 (거래 수수료 무료) **  Bithumb LISTING:ASTER（阿斯特）韩元交易市场已上线（交易手续费免费）。  ---------- 🔗 [查看来源](https://feed.bithumb.com/no',
-    },
-    {
-        date: '2025-10-10',
-        token: 'ZORA',
-        token_display: 'ZORA',
-        exchange: 'OKX',
-        type: 'perp',
-        time: '18:02',
-        notes: '📢 **OKX LISTING:OKX to list perpetual futures for ZORA crypto **  OKX LISTING:OKX将上线ZORA代币的永续合约  ---------- 🔗 [查看来源](https://www.okx.com/help/okx-to-l',
-    },
-    {
-        date: '2025-10-11',
-        token: 'YB',
-        token_display: 'Basis (YB)',
-        exchange: 'Bybit',
-        type: 'pre-market',
-        time: '8:45 UTC',
-        notes: '📢 **BYBIT: Listing of YBUSDT on Bybit Perpetual Pre-Market on Oct 11, 2025, 8:45AM UTC **  BYBIT: YBUSDT将于2025年10月11日UTC时间上午8:45在Bybit永续合约预上市市场进行上市。  ',
-    },
-    {
-        date: '2025-10-12',
-        token: 'YB',
-        token_display: 'Basis (YB)',
-        exchange: 'OKX',
-        type: 'pre-market',
-        time: '14:02',
-        notes: '📢 **OKX LISTING:OKX to list pre-market perpetual futures for YB (Yield Basis) crypto **  OKX LISTING:OKX 将上线 YB（收益基础）加密货币的Pre-Perpetuals期权  ----------',
-    },
-    {
-        date: '2025-10-13',
-        token: 'EUL',
-        token_display: 'Euler (EUL)',
-        exchange: 'Binance',
-        type: 'spot',
-        time: '17:22',
-        notes: '📢 **Binance: Introducing Euler (EUL) on Binance HODLer Airdrops! Earn EUL With Retroactive BNB Simple Earn Subscriptions **  Binance: 在 Binance HODLer',
-    },
-    {
-        date: '2025-10-14',
-        token: 'ENSO',
-        token_display: 'Enso (ENSO)',
-        exchange: 'Binance',
-        type: 'spot',
-        time: '10:58',
-        notes: '📢 **Binance: Introducing Enso (ENSO) on Binance HODLer Airdrops! Earn ENSO With Retroactive BNB Simple Earn Subscriptions **  Binance: 在 Binance HODLe',
-    },
-    {
-        date: '2025-10-14',
-        token: 'PAXG',
-        token_display: 'PAXG',
-        exchange: 'OKX',
-        type: 'spot',
-        time: '12:02',
-        notes: '📢 **OKX LISTING:OKX to list PAXG (PAX Gold) for spot trading **  OKX LISTING:OKX将上线PAXG（PAX Gold）现货交易  ---------- 🔗 [查看来源](https://www.okx.com/help/ok',
-    },
-    {
-        date: '2025-10-14',
-        token: 'CLO',
-        token_display: 'Finance (CLO)',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '14:00',
-        notes: '📢 **Binance: Yei Finance (CLO) Will Be Available on Binance Alpha and Binance Futures (2025-10-14) **  Binance: Yei Finance（CLO）将于2025年10月14日上线Binance',
-    },
-    {
-        date: '2025-10-14',
-        token: 'ENSO',
-        token_display: 'Enso (ENSO)',
-        exchange: 'Bybit',
-        type: 'spot',
-        time: '17:32',
-        notes: '📢 **BYBIT: 🔥 Listing of  ENSO on Convert **  BYBIT: 🔥 ENSO 在 Convert 上市  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/-listing-of-en',
-    },
-    {
-        date: '2025-10-14',
-        token: 'YB',
-        token_display: 'Basis (YB)',
-        exchange: 'Binance',
-        type: 'spot',
-        time: '17:46',
-        notes: '📢 **Binance: Introducing Yield Basis (YB) on Binance HODLer Airdrops! Earn YB With Retroactive BNB Simple Earn Subscriptions **  Binance: Binance HODL',
-    },
-    {
-        date: '2025-10-14',
-        token: 'YB',
-        token_display: 'Basis (YB)',
-        exchange: 'OKX',
-        type: 'pre-market',
-        time: '21:32',
-        notes: '📢 **OKX LISTING:OKX to list YB (Yield Basis) for spot trading and convert pre-market futures to standard perpetual futures **  OKX LISTING:OKX将上线YB（Yi',
-    },
-    {
-        date: '2025-10-15',
-        token: 'YB',
-        token_display: 'Basis (YB)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '00:05',
-        pairs: 'YB/USD',
-        notes: '📢 **COINBASE LISTING: Spot trading for Yield Basis (YB) will go live on 15 October 2025. The opening of our YB-USD trading pair will begin later today',
-    },
-    {
-        date: '2025-10-15',
-        token: 'RECALL',
-        token_display: 'Network (RECALL)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '01:54',
-        pairs: 'RECALL/USD',
-        notes: '📢 **COINBASE LISTING: Spot trading for Recall Network (RECALL) will go live on 15 October 2025. The opening of our RECALL-USD trading pair will begin ',
-    },
-    {
-        date: '2025-10-15',
-        token: 'YGG',
-        token_display: 'Games (YGG)',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '13:00',
-        notes: '📢 **UPBIT LISTING:[거래] 일드길드게임즈(YGG) KRW, USDT 마켓 디지털 자산 추가 **  UPBIT LISTING:[交易] Yield Guild Games (YGG) KRW, USDT市场新增数字资产  ---------- 🕒 __2025-10-15',
-    },
-    {
-        date: '2025-10-15',
-        token: 'RECALL',
-        token_display: 'Recall (RECALL)',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '14:00',
-        notes: '📢 **Binance: Recall (RECALL) Will Be Available on Binance Alpha and Binance Futures (2025-10-15) **  Binance: Recall (RECALL) 将上线 Binance Alpha 和 Bina',
-    },
-    {
-        date: '2025-10-15',
-        token: 'RECALL',
-        token_display: 'Network (RECALL)',
-        exchange: 'Bybit',
-        type: 'spot',
-        time: '15:01',
-        notes: '📢 **BYBIT: 🔥 Listing of RECALL on Convert & Bybit Savings **  BYBIT: 🔥 RECALL 代币在 Convert 和 Bybit Savings 平台上架  ---------- 🔗 [查看来源](https://announceme',
-    },
-    {
-        date: '2025-10-15',
-        token: 'YB',
-        token_display: 'Basis (YB)',
-        exchange: 'Bybit',
-        type: 'spot',
-        time: '15:05',
-        notes: '📢 **BYBIT: 🔥 Listing of YB on Convert **  BYBIT: 🔥 在 Convert 交易平台上线 YB 代币  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/-listing-of-',
-    },
-    {
-        date: '2025-10-16',
-        token: 'TLN',
-        token_display: 'TLN',
-        exchange: 'Bybit',
-        type: 'spot',
-        time: '18:30',
-        notes: '📢 **BYBIT: New listing: TLN is now live on Bybit TradFi! **  BYBIT: 新上架公告：TLN现已登陆Bybit TradFi平台！  ---------- 🔗 [查看来源](https://announcements.bybit.com/',
-    },
-    {
-        date: '2025-10-17',
-        token: 'ZORA',
-        token_display: 'ZORA',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '10:30',
-        notes: '📢 **UPBIT LISTING:[거래] 조라(ZORA) 신규 거래지원 안내 (KRW, BTC, USDT 마켓) **  UPBIT LISTING:[交易] 关于支持ZORA（ZORA）新交易的公告（KRW, BTC, USDT 市场）  ---------- 🕒 __2025-10-',
-    },
-    {
-        date: '2025-10-17',
-        token: 'ZEROBASE',
-        token_display: 'ZBT (ZEROBASE)',
-        exchange: 'OKX',
-        type: 'pre-market',
-        time: '11:02',
-        notes: '📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list pre-market perpetual futures for ZBT (ZEROBASE) cryptoDetail:  at: 2025-10-17T11:02:23Z **  O',
-    },
-    {
-        date: '2025-10-17',
-        token: 'DOOD',
-        token_display: 'Doodles (DOOD)',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '11:33',
-        notes: '📢 **Bithumb LISTING:인피닛(IN), 두들즈(DOOD), 일드 베이시스(YB) 원화 마켓 추가 (거래 수수료 무료) **  Bithumb LISTING:无限币 (IN)、涂鸦币 (DOOD)、收益基础币 (YB) 新增韩元市场交易（交易手续费全免）。  ------',
-    },
-    {
-        date: '2025-10-17',
-        token: 'ORCA',
-        token_display: 'ORCA',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '11:56',
-        notes: '📢 **UPBIT LISTING:[거래] 유통량 계획표 변경 안내 : 오르카(ORCA) **  UPBIT LISTING:【交易】流通量计划表变更通知：Orca（ORCA）  ---------- 🕒 __2025-10-17 11:56:47__',
-    },
-    {
-        date: '2025-10-17',
-        token: 'IN',
-        token_display: 'Infinite (IN)',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '14:10',
-        notes: '📢 **Bithumb LISTING:[이벤트] 인피닛(IN), 일드베이시스(YB) 원화 마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:[活动] 为了纪念 Infinite(IN) 和 Yield Basis(YB) 上线韩元市场，即将举行空投活动。  ----',
-    },
-    {
-        date: '2025-10-17',
-        token: 'YB',
-        token_display: 'Basis (YB)',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '14:10',
-        notes: '📢 **Bithumb LISTING:[이벤트] 인피닛(IN), 일드베이시스(YB) 원화 마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:[活动] 为了纪念 Infinite(IN) 和 Yield Basis(YB) 上线韩元市场，即将举行空投活动。  ----',
-    },
-    {
-        date: '2025-10-17',
-        token: 'ZBT',
-        token_display: 'ZEROBASE (ZBT)',
-        exchange: 'Bybit',
-        type: 'spot',
-        time: '17:00',
-        notes: '📢 **BYBIT: 🔥 Listing of ZBT on Convert **  BYBIT: 🔥 法币交易平台Convert将上线ZBT  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/-listing-of-zb',
-    },
-    {
-        date: '2025-10-17',
-        token: 'ZBT',
-        token_display: 'ZEROBASE (ZBT)',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '17:00',
-        notes: '📢 **UPBIT LISTING:[거래] 제로베이스(ZBT) 신규 거래지원 안내 (KRW, BTC, USDT 마켓) **  UPBIT LISTING:[交易] 支持零基（ZBT）新交易的通知 （KRW、BTC、USDT 市场）  ---------- 🕒 __2025-10-17 1',
-    },
-    {
-        date: '2025-10-17',
-        token: 'ZBT',
-        token_display: 'ZEROBASE (ZBT)',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '17:30',
-        notes: '📢 **Binance: ZEROBASE (ZBT) Will Be Available on Binance Alpha and Binance Futures (2025-10-17) **  Binance: ZEROBASE（ZBT）将于2025年10月17日在Binance Alpha和',
-    },
-    {
-        date: '2025-10-17',
-        token: 'ZBT',
-        token_display: 'ZEROBASE (ZBT)',
-        exchange: 'Binance',
-        type: 'spot',
-        time: '17:53',
-        notes: '📢 **Binance: Introducing ZEROBASE (ZBT) on Binance HODLer Airdrops! Earn ZBT With Retroactive BNB Simple Earn Subscriptions **  Binance: 欢迎参与 Binance ',
-    },
-    {
-        date: '2025-10-17',
-        token: 'ZBT',
-        token_display: 'ZEROBASE (ZBT)',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '19:58',
-        notes: '📢 **Bithumb LISTING:제로베이스(ZBT) 원화마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:为庆祝 ZBT 韩元市场上线，特别举行空投活动。  ---------- 🔗 [查看来源](https://feed.bithumb.com/notice/1',
-    },
-    {
-        date: '2025-10-17',
-        token: 'LAB',
-        token_display: 'LAB',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '20:58',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined LABUSDT and RIVERUSDT Perpetual Contracts (2025-10-17) **  Binance 期货将推出以 USDⓈ 为保证金的 LABUSDT 和 RIVERUSDT',
-    },
-    {
-        date: '2025-10-17',
-        token: 'RIVER',
-        token_display: 'RIVER',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '20:58',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined LABUSDT and RIVERUSDT Perpetual Contracts (2025-10-17) **  Binance 期货将推出以 USDⓈ 为保证金的 LABUSDT 和 RIVERUSDT',
-    },
-    {
-        date: '2025-10-17',
-        token: 'ZBT',
-        token_display: 'ZEROBASE (ZBT)',
-        exchange: 'Bybit',
-        type: 'perp',
-        time: '21:23',
-        notes: '📢 **BYBIT: New Listing :  ZBTUSDT Perpetual Contract, with up to 50x leverage **  BYBIT: 新上线：ZBTUSDT 永续合约，最高支持 50 倍杠杆  ---------- 🔗 [查看来源](https://ann',
-    },
-    {
-        date: '2025-10-18',
-        token: 'KGEN',
-        token_display: 'KGen (KGEN)',
-        exchange: 'OKX',
-        type: 'perp',
-        time: '03:30',
-        notes: '📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list perpetual futures for KGEN cryptoDetail:  at: 2025-10-18T03:30:56Z **  OKX LISTING:#OKX 重要公告 ',
-    },
-    {
-        date: '2025-10-18',
-        token: 'RVV',
-        token_display: 'Nova (RVV)',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '18:30',
-        notes: '📢 **Binance: Astra Nova (RVV) Will Be Available on Binance Alpha and Binance Futures (2025-10-18) **  Binance: Astra Nova (RVV) 将于2025年10月18日在币安Alpha和',
-    },
-    {
-        date: '2025-10-20',
-        token: 'BIO',
-        token_display: 'Protocol (BIO)',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '14:35',
-        notes: '📢 **UPBIT LISTING:[거래] 바이오프로토콜(BIO) 신규 거래지원 안내 (KRW, BTC, USDT 마켓) **  UPBIT LISTING:[交易] BIO Protocol (BIO) 新增交易支持通知 (KRW, BTC, USDT 市场)  ---------- ',
-    },
-    {
-        date: '2025-10-21',
-        token: 'ZORA',
-        token_display: 'ZORA',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '15:15',
-        notes: '📢 **Bithumb LISTING:조라(ZORA), 리콜(RECALL) 원화 마켓 추가(거래 수수료 무료) **  Bithumb LISTING:ZORA和RECALL已新增韩元市场（交易手续费免费）。  ---------- 🔗 [查看来源](https://feed.bithum',
-    },
-    {
-        date: '2025-10-21',
-        token: 'RECALL',
-        token_display: 'Network (RECALL)',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '15:15',
-        notes: '📢 **Bithumb LISTING:조라(ZORA), 리콜(RECALL) 원화 마켓 추가(거래 수수료 무료) **  Bithumb LISTING:ZORA和RECALL已新增韩元市场（交易手续费免费）。  ---------- 🔗 [查看来源](https://feed.bithum',
-    },
-    {
-        date: '2025-10-21',
-        token: 'TURTLE',
-        token_display: 'Turtle (TURTLE)',
-        exchange: 'Binance',
-        type: 'spot',
-        time: '15:56',
-        notes: '📢 **Binance: Introducing Turtle (TURTLE) on Binance HODLer Airdrops! Earn TURTLE With Retroactive BNB Simple Earn Subscriptions **  Binance: Binance H',
-    },
-    {
-        date: '2025-10-21',
-        token: 'BLUAI',
-        token_display: 'Bluwhale (BLUAI)',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '19:03',
-        notes: '📢 **Binance: Bluwhale (BLUAI) Will Be Available on Binance Alpha and Binance Futures (2025-10-21) **  Binance: Bluwhale (BLUAI) 将于2025年10月21日在Binance ',
-    },
-    {
-        date: '2025-10-22',
-        token: 'KTA',
-        token_display: 'Keeta (KTA)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '00:00',
-        pairs: 'KTA/USD',
-        notes: '📢 **COINBASE LISTING: Spot trading for Keeta (KTA) will go live on 22 October 2025. The opening of our KTA-USD trading pair will begin on or after 9AM',
-    },
-    {
-        date: '2025-10-22',
-        token: 'MET',
-        token_display: 'MET (Meteora)',
-        exchange: 'OKX',
-        type: 'spot',
-        time: '03:03',
-        notes: '📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list MET (Meteora) for spot tradingDetail:  at: 2025-10-22T03:03:00Z **  OKX LISTING:#OKX重要公告    O',
-    },
-    {
-        date: '2025-10-22',
-        token: 'CPOOL',
-        token_display: 'ClearPool (CPOOL)',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '13:20',
-        notes: '📢 **UPBIT LISTING:[거래] 클리어풀(CPOOL) 신규 거래지원 안내 (KRW, BTC, USDT 마켓) **  UPBIT LISTING:[交易] 新增支持 ClearPool (CPOOL) 交易对（KRW、BTC、USDT 市场）  ---------- 🔗 [查看',
-    },
-    {
-        date: '2025-10-22',
-        token: 'CPOOL',
-        token_display: 'ClearPool (CPOOL)',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '13:35',
-        notes: '📢 **Bithumb LISTING:클리어풀(CPOOL) 원화 마켓 추가 (거래 수수료 무료) **  Bithumb LISTING:ClearPool(CPOOL)韩元市场现已上线（交易手续费免费）  ---------- 🔗 [查看来源](https://feed.bithumb.c',
-    },
-    {
-        date: '2025-10-22',
-        token: 'TURTLE',
-        token_display: 'Turtle (TURTLE)',
-        exchange: 'Bybit',
-        type: 'perp',
-        time: '23:21',
-        notes: '📢 **BYBIT: New Listing : TURTLEUSDT Perpetual Contract in Innovation Zone, with up to 25x leverage **  BYBIT: 新币上市：TURTLEUSDT 永续合约已登录创新区，最大杠杆高达25倍  --',
-    },
-    {
-        date: '2025-10-23',
-        token: 'APR',
-        token_display: 'Priori (APR)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '01:05',
-        pairs: 'APR/USD',
-        notes: '📢 **COINBASE LISTING: Spot trading for aPriori (APR) and Meteora (MET) will go live on 23 October 2025. The opening of our APR-USD and MET-USD trading',
-    },
-    {
-        date: '2025-10-23',
-        token: 'MET',
-        token_display: 'Meteora (MET)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '01:05',
-        pairs: 'MET/USD',
-        notes: '📢 **COINBASE LISTING: Spot trading for aPriori (APR) and Meteora (MET) will go live on 23 October 2025. The opening of our APR-USD and MET-USD trading',
-    },
-    {
-        date: '2025-10-23',
-        token: 'MEGA',
-        token_display: 'MegaETH (MEGA)',
-        exchange: 'Bybit',
-        type: 'pre-market',
-        time: '12:30 UTC',
-        notes: '📢 **BYBIT: Listing of MEGAUSDT on Bybit Perpetual Pre-Market on Oct 23, 2025, 12:30PM UTC **  BYBIT: MEGAUSDT将于2025年10月23日UTC时间12:30在Bybit永续期货预上市市场上线。',
-    },
-    {
-        date: '2025-10-23',
-        token: 'APR',
-        token_display: 'Priori (APR)',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '14:30',
-        notes: '📢 **Binance: aPriori (APR) Will Be Available on Binance Alpha and Binance Futures (2025-10-23) **  Binance: aPriori (APR) 将于2025年10月23日在Binance Alpha和',
-    },
-    {
-        date: '2025-10-23',
-        token: 'MET',
-        token_display: 'MET (Meteora)',
-        exchange: 'Bybit',
-        type: 'spot',
-        time: '20:00',
-        notes: '📢 **BYBIT: 🔥 Listing of MET on Convert **  BYBIT: MET现已上线Convert平台🔥  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/-listing-of-met-on',
-    },
-    {
-        date: '2025-10-23',
-        token: 'APR',
-        token_display: 'Priori (APR)',
-        exchange: 'Bybit',
-        type: 'perp',
-        time: '20:34',
-        notes: '📢 **BYBIT: New Listing : APRUSDT Perpetual Contract in Innovation Zone, with up to 50x leverage **  BYBIT: 创新区新上线：APRUSDT 永续合约，支持最高 50 倍杠杆  ----------',
-    },
-    {
-        date: '2025-10-24',
-        token: 'APR',
-        token_display: 'Priori (APR)',
-        exchange: 'OKX',
-        type: 'perp',
-        time: '04:42',
-        notes: '📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list perpetual futures for APR cryptoDetail:  at: 2025-10-24T04:42:19Z **  OKX LISTING:#OKX 重要公告 O',
-    },
-    {
-        date: '2025-10-24',
-        token: 'TURTLE',
-        token_display: 'Turtle (TURTLE)',
-        exchange: 'OKX',
-        type: 'perp',
-        time: '09:41',
-        notes: '📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list perpetual futures for TURTLE cryptoDetail:  at: 2025-10-24T09:41:19Z **  OKX LISTING:#OKX重要通知',
-    },
-    {
-        date: '2025-10-24',
-        token: 'ON',
-        token_display: 'Orochi (ON)',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '14:00',
-        notes: '📢 **Binance: Orochi (ON) Will Be Available on Binance Alpha and Binance Futures (2025-10-24) **  Binance: Orochi (ON) 将于2025年10月24日在币安Alpha和币安期货上线。  -',
-    },
-    {
-        date: '2025-10-24',
-        token: 'UTA',
-        token_display: 'UTA',
-        exchange: 'Bybit',
-        type: 'spot',
-        time: '17:54',
-        notes: '📢 **BYBIT: Listing of TRY and BRL as new collateral assets for UTA Loan and Institutional Loan **  BYBIT: 土耳其里拉（TRY）和巴西雷亚尔（BRL）将作为新的抵押资产，上线 UTA 贷款和机构贷',
-    },
-    {
-        date: '2025-10-25',
-        token: 'GIGGLE',
-        token_display: 'Fund (GIGGLE)',
-        exchange: 'OKX',
-        type: 'perp',
-        time: '06:31',
-        notes: '📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list perpetual futures for GIGGLE cryptoDetail:  at: 2025-10-25T06:31:17Z **  OKX LISTING:#OKX 重要通',
-    },
-    {
-        date: '2025-10-25',
-        token: 'GIGGLE',
-        token_display: 'Fund (GIGGLE)',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '11:02',
-        notes: '📢 **Binance Will List Giggle Fund (GIGGLE) and SynFutures (F) with Seed Tag Applied **  币安将上线Giggle Fund (GIGGLE)和SynFutures (F)，并应用种子标签  ---------- 🔗',
-    },
-    {
-        date: '2025-10-25',
-        token: 'GIGGLE',
-        token_display: 'Fund (GIGGLE)',
-        exchange: 'Binance',
-        type: 'spot',
-        time: '13:30',
-        notes: '📢 **Binance Will Add Giggle Fund (GIGGLE) and SynFutures (F) on Earn, Buy Crypto, Convert & Margin **  币安（Binance）将在Earn、购买加密货币、兑换和保证金交易中上线Giggle Fund',
-    },
-    {
-        date: '2025-10-27',
-        token: 'MMT',
-        token_display: 'Momentum (MMT)',
-        exchange: 'Bybit',
-        type: 'pre-market',
-        time: '11:00 UTC',
-        notes: '📢 **BYBIT: Listing of MMTUSDT on Bybit Perpetual Pre-Market on Oct 27, 2025, 11:00AM UTC **  BYBIT: MMTUSDT将于2025年10月27日当地时间上午11：00在Bybit永续合约预上市市场上线。 ',
-    },
-    {
-        date: '2025-10-27',
-        token: 'COMMON',
-        token_display: 'Common (COMMON)',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '14:00',
-        notes: '📢 **Binance: Common (COMMON) Will Be Available on Binance Alpha and Binance Futures (2025-10-27) **  Binance: Common（COMMON）将于2025年10月27日在 Binance Alp',
-    },
-    {
-        date: '2025-10-27',
-        token: 'SYND',
-        token_display: 'Syndicate (SYND)',
-        exchange: 'Bybit',
-        type: 'spot',
-        time: '16:21',
-        notes: '📢 **BYBIT: 🔥 Listing of SYND on Convert **  BYBIT: 🔥 SYND上线Convert平台  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/-listing-of-synd-',
-    },
-    {
-        date: '2025-10-27',
-        token: 'COMMON',
-        token_display: 'Common (COMMON)',
-        exchange: 'Bybit',
-        type: 'spot',
-        time: '20:01',
-        notes: '📢 **BYBIT: 🔥 Listing of COMMON on Convert **  BYBIT: 🔥 COMMON成功上线Convert平台  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/-listing-of',
-    },
-    {
-        date: '2025-10-27',
-        token: 'DBR',
-        token_display: 'Bridge (DBR)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '22:38',
-        notes: '📢 **COINBASE LISTING: Assets added to the roadmap today: deBridge (DBR) **  COINBASE LISTING: 今日添加到路线图中的资产：deBridge（DBR）  ---------- 🔗 [查看来源](https://',
-    },
-    {
-        date: '2025-10-28',
-        token: 'VIRTUAL',
-        token_display: 'Protocol (VIRTUAL)',
-        exchange: 'OKX',
-        type: 'spot',
-        time: '03:00',
-        notes: '📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list Virtuals Protocol (VIRTUAL) for spot tradingDetail:  at: 2025-10-28T03:00:34Z **  OKX LISTING',
-    },
-    {
-        date: '2025-10-28',
-        token: 'KERNEL',
-        token_display: 'KERNEL',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '15:00',
-        notes: '📢 **UPBIT LISTING:[거래] 커널다오(KERNEL) KRW 마켓 디지털 자산 추가 **  UPBIT LISTING:[交易] KERNEL DAO（KERNEL）已上线KRW市场，作为新增的数字资产。  ---------- 🔗 [查看来源](https://upbit.c',
-    },
-    {
-        date: '2025-10-29',
-        token: 'PIGGY',
-        token_display: 'PIGGY',
-        exchange: 'OKX',
-        type: 'perp',
-        time: '05:00',
-        notes: '📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list perpetual futures for PIGGY cryptoDetail:  at: 2025-10-29T05:00:41Z **  OKX LISTING:#OKX 重要公告',
-    },
-    {
-        date: '2025-10-29',
-        token: 'ENSO',
-        token_display: 'Enso (ENSO)',
-        exchange: 'OKX',
-        type: 'perp',
-        time: '09:01',
-        notes: '📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list perpetual futures for ENSO, OL cryptoDetail:  at: 2025-10-29T09:01:20Z **  OKX LISTING:#OKX 重',
-    },
-    {
-        date: '2025-10-29',
-        token: 'OL',
-        token_display: 'OL',
-        exchange: 'OKX',
-        type: 'perp',
-        time: '09:01',
-        notes: '📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list perpetual futures for ENSO, OL cryptoDetail:  at: 2025-10-29T09:01:20Z **  OKX LISTING:#OKX 重',
-    },
-    {
-        date: '2025-10-29',
-        token: 'KITE',
-        token_display: 'Kite (KITE)',
-        exchange: 'OKX',
-        type: 'pre-market',
-        time: '12:01',
-        notes: '📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list pre-market perpetual futures for KITE (Kite AI) cryptoDetail:  at: 2025-10-29T12:01:32Z **  O',
-    },
-    {
-        date: '2025-10-29',
-        token: 'ENSO',
-        token_display: 'Enso (ENSO)',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '14:30',
-        notes: '📢 **UPBIT LISTING:엔소(ENSO) 신규 거래지원 안내 (KRW, BTC, USDT 마켓) **  UPBIT LISTING:ENSO（ENSO）新增交易对公告（KRW、BTC、USDT市场）  ---------- 🔗 [查看来源](https://upbit.com/s',
-    },
-    {
-        date: '2025-10-29',
-        token: 'EAT',
-        token_display: 'EAT',
-        exchange: 'Bybit',
-        type: 'spot',
-        time: '15:30',
-        notes: '📢 **BYBIT: 🔥 Listing of EAT on Convert & Bybit Savings **  BYBIT: 🔥 EAT代币上线Convert与Bybit储蓄平台  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/a',
-    },
-    {
-        date: '2025-10-29',
-        token: 'ENSO',
-        token_display: 'Enso (ENSO)',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '15:52',
-        notes: '📢 **Bithumb LISTING:엔소(ENSO) 원화마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:ENSO韩元市场上线纪念空投活动  ---------- 🔗 [查看来源](https://feed.bithumb.com/notice/1650464) 🕒 ',
-    },
-    {
-        date: '2025-10-29',
-        token: 'AT',
-        token_display: 'APRO (AT)',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '17:36',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined ATUSDT Perpetual Contract (2025-10-29) **  币安期货将推出以USDT为保证金的全额结算永久合约 ATUSDT，合约到期日为2025年10月29日。  --------',
-    },
-    {
-        date: '2025-10-29',
-        token: 'KITE',
-        token_display: 'Kite (KITE)',
-        exchange: 'Binance',
-        type: 'pre-market',
-        time: '18:14',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined KITEUSDT Perpetual Contract Pre-Market Trading (2025-10-29) **  币安期货将推出以USDⓈ保证金的KITEUSDT永续合约的Pre-Market交',
-    },
-    {
-        date: '2025-10-29',
-        token: 'KITE',
-        token_display: 'Kite (KITE)',
-        exchange: 'Bybit',
-        type: 'pre-market',
-        time: '1:00 UTC',
-        notes: '📢 **BYBIT: Listing of KITEUSDT on Bybit Perpetual Pre-Market on Oct 29, 2025, 1:00PM UTC **  BYBIT: KITEUSDT将于2025年10月29日UTC时间下午1点在Bybit永续期货预上市市场上线。  ',
-    },
-    {
-        date: '2025-10-29',
-        token: 'DBR',
-        token_display: 'Bridge (DBR)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '23:50',
-        pairs: 'DBR/USD',
-        notes: '📢 **COINBASE LISTING: Spot trading for deBridge (DBR) will go live on 29 October 2025. The opening of our DBR-USD trading pair will begin on or after ',
-    },
-    {
-        date: '2025-10-30',
-        token: 'AT',
-        token_display: 'APRO (AT)',
-        exchange: 'OKX',
-        type: 'perp',
-        time: '09:31',
-        notes: '📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list perpetual futures for AT, RECALL cryptoDetail:  at: 2025-10-30T09:31:48Z **  OKX LISTING:#OKX',
-    },
-    {
-        date: '2025-10-30',
-        token: 'RECALL',
-        token_display: 'Network (RECALL)',
-        exchange: 'OKX',
-        type: 'perp',
-        time: '09:31',
-        notes: '📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list perpetual futures for AT, RECALL cryptoDetail:  at: 2025-10-30T09:31:48Z **  OKX LISTING:#OKX',
-    },
-    {
-        date: '2025-10-31',
-        token: 'CC',
-        token_display: 'CC (Canton)',
-        exchange: 'OKX',
-        type: 'pre-market',
-        time: '13:22',
-        notes: '📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list pre-market perpetual futures for CC(Canton Network) cryptoDetail:  at: 2025-10-31T13:22:13Z *',
-    },
-    {
-        date: '2025-10-31',
-        token: 'KITE',
-        token_display: 'Kite (KITE)',
-        exchange: 'Binance',
-        type: 'spot',
-        time: '16:09',
-        notes: '📢 **Binance: Introducing Kite (KITE) on Binance Launchpool! Farm KITE by Locking BNB, FDUSD and USDC **  Binance: Binance Launchpool正式上线Kite（KITE）！锁定B',
-    },
-    {
-        date: '2025-10-31',
-        token: 'FD',
-        token_display: 'FD',
-        exchange: 'Binance',
-        type: 'spot',
-        time: '16:09',
-        notes: '📢 **Binance: Introducing Kite (KITE) on Binance Launchpool! Farm KITE by Locking BNB, FDUSD and USDC **  Binance: Binance Launchpool正式上线Kite（KITE）！锁定B',
-    },
-    {
-        date: '2025-10-31',
-        token: 'CC',
-        token_display: 'CC (Canton)',
-        exchange: 'Binance',
-        type: 'pre-market',
-        time: '19:45',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined CCUSDT Perpetual Contract Pre-Market Trading (2025-10-31) **  Binance 期货将推出以USDⓈ计价的CCUSDT永续合约预市交易（2025-1',
-    },
-    {
-        date: '2025-10-31',
-        token: 'CC',
-        token_display: 'CC (Canton)',
-        exchange: 'Bybit',
-        type: 'pre-market',
-        time: '2:00 UTC',
-        notes: '📢 **BYBIT: Listing of CCUSDT on Bybit Perpetual Pre-Market on Oct 31, 2025, 2:00PM UTC **  BYBIT: CCUSDT将于2025年10月31日14:00（UTC时间）在Bybit永续期货预市上线。  ----',
-    },
-    {
-        date: '2025-11-01',
-        token: 'LAB',
-        token_display: 'LAB',
-        exchange: 'OKX',
-        type: 'perp',
-        time: '11:01',
-        notes: '📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list perpetual futures for LAB cryptoDetail:  at: 2025-11-01T11:01:26Z **  OKX LISTING:#OKX重要通知 OK',
-    },
-    {
-        date: '2025-11-03',
-        token: 'KITE',
-        token_display: 'Kite (KITE)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '00:58',
-        pairs: 'KITE/USD',
-        notes: '📢 **COINBASE LISTING: Spot trading for Kite (KITE) will go live on 3 November 2025. The opening of our KITE-USD trading pair will begin later today if',
-    },
-    {
-        date: '2025-11-03',
-        token: 'ZEN',
-        token_display: 'ZEN',
-        exchange: 'OKX',
-        type: 'perp',
-        time: '05:31',
-        notes: '📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list perpetual futures for ZEN cryptoDetail:  at: 2025-11-03T05:31:54Z **  OKX LISTING:#OKX 重要通知 O',
-    },
-    {
-        date: '2025-11-03',
-        token: 'HYPE',
-        token_display: 'HYPERLIQUID (HYPE)',
-        exchange: 'OKX',
-        type: 'spot',
-        time: '07:30',
-        notes: '📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list HYPE for spot tradingDetail:  at: 2025-11-03T07:30:24Z **  OKX LISTING:#OKX 重要公告 OKX即将上线HYPE进',
-    },
-    {
-        date: '2025-11-03',
-        token: 'KITE',
-        token_display: 'Kite (KITE)',
-        exchange: 'OKX',
-        type: 'pre-market',
-        time: '11:01',
-        notes: '📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list KITE (Kite AI) for spot trading and convert pre-market futures to standard perpetual futuresD',
-    },
-    {
-        date: '2025-11-03',
-        token: 'KITE',
-        token_display: 'Kite (KITE)',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '16:11',
-        notes: '📢 **UPBIT LISTING:[Trade] Market Support for Kite(KITE) (KRW, BTC, USDT Market) **  UPBIT LISTING:[交易] 市场对Kite（KITE）的支持（韩元、比特币、Tether市场）  ---------- 🔗',
-    },
-    {
-        date: '2025-11-03',
-        token: 'MMT',
-        token_display: 'Momentum (MMT)',
-        exchange: 'Binance',
-        type: 'spot',
-        time: '16:14',
-        notes: '📢 **Binance: Introducing Momentum (MMT) on Binance HODLer Airdrops! Earn MMT With Retroactive BNB Simple Earn Subscriptions **  Binance: Binance HODLe',
-    },
-    {
-        date: '2025-11-03',
-        token: 'KITE',
-        token_display: 'Kite (KITE)',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '19:00',
-        notes: '📢 **Bithumb LISTING:카이트(KITE) 원화마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:为庆祝KITE韩元市场上线，现推出空投活动  ---------- 🔗 [查看来源](https://feed.bithumb.com/notice/16505',
-    },
-    {
-        date: '2025-11-03',
-        token: 'KITE',
-        token_display: 'Kite (KITE)',
-        exchange: 'Binance',
-        type: 'spot',
-        time: '20:30',
-        notes: '📢 **Binance Will Add Kite (KITE) on Earn, Buy Crypto, Convert, Margin & Futures **  币安即将在Earn赚币、买币、一键买卖、杠杆交易和合约交易等产品中上线Kite（KITE）。  ---------- 🔗 [查看来源',
-    },
-    {
-        date: '2025-11-04',
-        token: 'MON',
-        token_display: 'Monad (MON)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '01:57',
-        notes: '📢 **COINBASE LISTING: Assets added to the roadmap today: Monad (MON) **  COINBASE LISTING: 今日被列入发展路线图的资产：Monad (MON)。  ---------- 🔗 [查看来源](https://twi',
-    },
-    {
-        date: '2025-11-04',
-        token: 'MMT',
-        token_display: 'Momentum (MMT)',
-        exchange: 'OKX',
-        type: 'spot',
-        time: '06:00',
-        notes: '📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list MMT for spot tradingDetail:  at: 2025-11-04T06:00:37Z **  OKX LISTING:#OKX重要公告 OKX即将上线 MMT 现货',
-    },
-    {
-        date: '2025-11-04',
-        token: 'MMT',
-        token_display: 'Momentum (MMT)',
-        exchange: 'OKX',
-        type: 'perp',
-        time: '08:30',
-        notes: '📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list perpetual futures for MMT cryptoDetail:  at: 2025-11-04T08:30:48Z **  OKX LISTING:#OKX 重要公告 O',
-    },
-    {
-        date: '2025-11-04',
-        token: 'MMT',
-        token_display: 'Momentum (MMT)',
-        exchange: 'Bybit',
-        type: 'spot',
-        time: '15:01',
-        notes: '📢 **BYBIT: 🔥 Listing of MMT on Convert **  BYBIT: 🔥 MMT 在 Convert 平台上线  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/-listing-of-mmt',
-    },
-    {
-        date: '2025-11-04',
-        token: 'MMT',
-        token_display: 'Momentum (MMT)',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '17:35',
-        notes: '📢 **UPBIT LISTING:[거래] 모멘텀(MMT) 신규 거래지원 안내 (BTC, USDT 마켓) **  UPBIT LISTING:[交易] Momentum (MMT) 新增交易支持通知 (BTC, USDT 市场)  ---------- 🔗 [查看来源](https://u',
-    },
-    {
-        date: '2025-11-04',
-        token: 'MMT',
-        token_display: 'Momentum (MMT)',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '19:53',
-        notes: '📢 **Bithumb LISTING:모멘텀(MMT) 원화마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:为庆祝MMT（Momentum）上线韩元市场，特别推出空投活动。  ---------- 🔗 [查看来源](https://feed.bithumb.com/no',
-    },
-    {
-        date: '2025-11-05',
-        token: 'TRUST',
-        token_display: 'Intuition (TRUST)',
-        exchange: 'OKX',
-        type: 'perp',
-        time: '11:02',
-        notes: '📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list perpetual futures for TRUST cryptoDetail:  at: 2025-11-05T11:02:01Z **  OKX LISTING:#OKX 重要公告',
-    },
-    {
-        date: '2025-11-05',
-        token: 'MMT',
-        token_display: 'Momentum (MMT)',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '13:48',
-        notes: '📢 **UPBIT LISTING:모멘텀(MMT) KRW 마켓 디지털 자산 추가 **  UPBIT LISTING:动量（MMT）将被纳入韩国KRW市场的数字资产列表。  ---------- 🔗 [查看来源](https://upbit.com/service_center/notice?',
-    },
-    {
-        date: '2025-11-05',
-        token: 'TRUST',
-        token_display: 'Intuition (TRUST)',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '14:03',
-        notes: '📢 **Binance: Intuition (TRUST) Will Be Available on Binance Alpha and Binance Futures (2025-11-05) **  Binance: 直觉币（TRUST）将于2025年11月5日上线币安Alpha和币安合约交易',
-    },
-    {
-        date: '2025-11-05',
-        token: 'TRUST',
-        token_display: 'Intuition (TRUST)',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '16:44',
-        notes: '📢 **UPBIT LISTING:[거래] 인튜이션(TRUST) 신규 거래지원 안내 (KRW, BTC, USDT 마켓) **  UPBIT LISTING:[交易] TRUST支持新增交易对（KRW、BTC、USDT市场）的公告  ---------- 🔗 [查看来源](https://',
-    },
-    {
-        date: '2025-11-05',
-        token: 'TRUST',
-        token_display: 'Intuition (TRUST)',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '18:40',
-        notes: '📢 **Bithumb LISTING:인튜이션(TRUST) 원화마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:为庆祝Intuition (TRUST)上线韩元市场，举行纪念空投活动  ---------- 🔗 [查看来源](https://feed.bithumb.',
-    },
-    {
-        date: '2025-11-06',
-        token: 'SAPIEN',
-        token_display: 'Sapien (SAPIEN)',
-        exchange: 'OKX',
-        type: 'perp',
-        time: '11:16',
-        notes: '📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list perpetual futures for SAPIEN cryptoDetail:  at: 2025-11-06T11:16:05Z **  OKX LISTING:#OKX 重要公',
-    },
-    {
-        date: '2025-11-06',
-        token: 'SAPIEN',
-        token_display: 'Sapien (SAPIEN)',
-        exchange: 'Binance',
-        type: 'spot',
-        time: '12:45',
-        notes: '📢 **Binance: Introducing Sapien (SAPIEN) on Binance HODLer Airdrops! Earn SAPIEN With Retroactive BNB Simple Earn Subscriptions **  Binance: Binance 推',
-    },
-    {
-        date: '2025-11-06',
-        token: 'UAI',
-        token_display: 'UnifAI (UAI)',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '15:01',
-        notes: '📢 **Binance: UnifAI (UAI) Will Be Available on Binance Alpha and Binance Futures (2025-11-06) **  Binance: UnifAI（UAI）将于2025年11月6日上线Binance Alpha和Bina',
-    },
-    {
-        date: '2025-11-06',
-        token: 'LITKEY',
-        token_display: 'LITKEY',
-        exchange: 'Bybit',
-        type: 'spot',
-        time: '17:51',
-        notes: '📢 **BYBIT: 🔥 Listing of LITKEY on Convert & Bybit Savings **  BYBIT: 🔥 LITKEY 上线 Convert 和 Bybit 理财平台  ---------- 🔗 [查看来源](https://announcements.bybit',
-    },
-    {
-        date: '2025-11-06',
-        token: 'FOLKS',
-        token_display: 'Finance (FOLKS)',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '18:30',
-        notes: '📢 **Binance: Folks Finance (FOLKS) Will Be Available on Binance Alpha and Binance Futures (2025-11-06) **  Binance: Folks Finance（FOLKS）将于2025年11月6日上线',
-    },
-    {
-        date: '2025-11-06',
-        token: 'STABLE',
-        token_display: 'STABLE',
-        exchange: 'Binance',
-        type: 'pre-market',
-        time: '19:44',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined STABLEUSDT Perpetual Contract Pre-Market Trading (2025-11-06) **  币安期货将推出以USDT为本位的STABLEUSDT永续合约的预市交易（20',
-    },
-    {
-        date: '2025-11-06',
-        token: 'STABLE',
-        token_display: 'STABLE',
-        exchange: 'Bybit',
-        type: 'pre-market',
-        time: '1:30 UTC',
-        notes: '📢 **BYBIT: Listing of STABLEUSDT on Bybit Perpetual Pre-Market on Nov 6, 2025, 1:30PM UTC **  BYBIT: STABLEUSDT 将于2025年11月6日13:30（UTC）在Bybit永续合约预上市市场上',
-    },
-    {
-        date: '2025-11-07',
-        token: 'ROI',
-        token_display: 'ROI',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '17:00',
-        notes: '📢 **Binance Futures Will Apply New ROI Method to Copy Trading and Update ROI for All Lead Portfolios **  Binance合约将采用新的ROI计算方法应用于跟单交易，并更新所有主投组合的ROI数据。',
-    },
-    {
-        date: '2025-11-08',
-        token: 'ASTER',
-        token_display: 'Aster (ASTER)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '04:17',
-        notes: '📢 **COINBASE LISTING: Assets added to the roadmap today: Aster (ASTER) **  COINBASE LISTING: 今日添加至路径图的资产：Aster（ASTER）  ---------- 🔗 [查看来源](https://twi',
-    },
-    {
-        date: '2025-11-10',
-        token: 'JCT',
-        token_display: 'Janction (JCT)',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '14:00',
-        notes: '📢 **Binance: Janction (JCT) Will Be Available on Binance Alpha and Binance Futures (2025-11-10) **  Binance: Janction (JCT) 将于2025年11月10日在Binance Alph',
-    },
-    {
-        date: '2025-11-11',
-        token: 'ALLO',
-        token_display: 'Allora (ALLO)',
-        exchange: 'OKX',
-        type: 'spot',
-        time: '07:30',
-        notes: '📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list ALLO for spot tradingDetail:  at: 2025-11-11T07:30:26Z **  OKX LISTING:#OKX 重要通知   OKX 将上线 AL',
-    },
-    {
-        date: '2025-11-11',
-        token: 'FLUID',
-        token_display: 'Fluid (FLUID)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '09:34',
-        notes: '📢 **COINBASE LISTING: Assets added to the roadmap today: Fluid (FLUID) and Nomina (NOM) **  COINBASE LISTING: 今日加入路线图的资产有：Fluid（FLUID）和Nomina（NOM）。  -',
-    },
-    {
-        date: '2025-11-11',
-        token: 'NOM',
-        token_display: 'Nomina (NOM)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '09:34',
-        notes: '📢 **COINBASE LISTING: Assets added to the roadmap today: Fluid (FLUID) and Nomina (NOM) **  COINBASE LISTING: 今日加入路线图的资产有：Fluid（FLUID）和Nomina（NOM）。  -',
-    },
-    {
-        date: '2025-11-11',
-        token: 'AERO',
-        token_display: 'Finance (AERO)',
-        exchange: 'Hyperliquid',
-        type: 'perp',
-        time: '14:45',
-        pairs: 'AERO/USD',
-        notes: '📢 **【hyperliquid】 新上线AERO/USDC永续合约，最高可达3倍杠杆 **  【hyperliquid】 最新上线 AERO/USDC 永续合约，支持最高 3 倍杠杆。  ---------- 🕒 __2025-11-11 14:45:00__',
-    },
-    {
-        date: '2025-11-11',
-        token: 'ALLO',
-        token_display: 'Allora (ALLO)',
-        exchange: 'OKX',
-        type: 'perp',
-        time: '16:31',
-        notes: '📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list perpetual futures for ALLO cryptoDetail:  at: 2025-11-11T16:31:42Z **  OKX LISTING:#OKX 重要公告 ',
-    },
-    {
-        date: '2025-11-11',
-        token: 'ALLO',
-        token_display: 'Allora (ALLO)',
-        exchange: 'Binance',
-        type: 'spot',
-        time: '20:47',
-        notes: '📢 **Binance: Allora (ALLO) Listing Will Be Postponed **  Binance: Allora (ALLO) 上线将被推迟  ---------- 🔗 [查看来源](https://www.binance.com/en/support/article',
-    },
-    {
-        date: '2025-11-12',
-        token: 'ALLO',
-        token_display: 'Allora (ALLO)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '05:34',
-        pairs: 'ALLO/USD',
-        notes: '📢 **COINBASE LISTING: The launch of spot trading for Allora (ALLO) has been postponed to 12 November 2025. The opening of our ALLO-USD trading pair wi',
-    },
-    {
-        date: '2025-11-12',
-        token: 'BEAT',
-        token_display: 'BEAT (Audiera)',
-        exchange: 'OKX',
-        type: 'perp',
-        time: '16:00',
-        notes: '📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list perpetual futures for BEAT (Audiera) cryptoDetail:  at: 2025-11-12T16:00:54Z **  OKX LISTING:',
-    },
-    {
-        date: '2025-11-12',
-        token: 'ELIZAOS',
-        token_display: 'ELIZAOS',
-        exchange: 'Bybit',
-        type: 'spot',
-        time: '16:18',
-        notes: '📢 **BYBIT: 🔥 Listing of ELIZAOS on Convert & Bybit Savings **  BYBIT: 🔥 ELIZAOS 上线 Convert 和 Bybit Savings 平台  ---------- 🔗 [查看来源](https://announcemen',
-    },
-    {
-        date: '2025-11-12',
-        token: 'CLANKER',
-        token_display: 'CLANKER',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '18:15',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined CLANKERUSDT and BEATUSDT Perpetual Contracts (2025-11-12) **  Binance 期货将推出以USDⓈ计价的 CLANKERUSDT 和 BEATUS',
-    },
-    {
-        date: '2025-11-12',
-        token: 'BEAT',
-        token_display: 'BEAT (Audiera)',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '18:15',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined CLANKERUSDT and BEATUSDT Perpetual Contracts (2025-11-12) **  Binance 期货将推出以USDⓈ计价的 CLANKERUSDT 和 BEATUS',
-    },
-    {
-        date: '2025-11-13',
-        token: 'NOM',
-        token_display: 'Nomina (NOM)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '03:33',
-        pairs: 'NOM/USD',
-        notes: '📢 **COINBASE LISTING: Spot trading for Nomina (NOM) will go live on 13 November 2025. The opening of our NOM-USD trading pair will begin on or after 9',
-    },
-    {
-        date: '2025-11-13',
-        token: 'PLANCK',
-        token_display: 'Planck (PLANCK)',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '15:01',
-        notes: '📢 **Binance: Planck (PLANCK) Will Be Available on Binance Alpha and Binance Futures (2025-11-13) **  Binance: Planck (PLANCK) 将于 2025 年 11 月 13 日在 Bin',
-    },
-    {
-        date: '2025-11-13',
-        token: 'OKLO',
-        token_display: 'OKLO',
-        exchange: 'Bybit',
-        type: 'spot',
-        time: '18:00',
-        notes: '📢 **BYBIT: New listing: OKLO is now live on Bybit TradFi! **  BYBIT: 新增上线：OKLO代币现已登陆Bybit传统金融（TradFi）交易平台！  ---------- 🔗 [查看来源](https://announcements.',
-    },
-    {
-        date: '2025-11-13',
-        token: 'BANK',
-        token_display: 'Protocol (BANK)',
-        exchange: 'Binance',
-        type: 'spot',
-        time: '21:30',
-        notes: '📢 **Binance Will Add Lorenzo Protocol (BANK) and Meteora (MET) on Earn, Buy Crypto, Convert & Margin **  **Binance** 将上线 **Lorenzo Protocol** (BANK) 和',
-    },
-    {
-        date: '2025-11-13',
-        token: 'MET',
-        token_display: 'Meteora (MET)',
-        exchange: 'Binance',
-        type: 'spot',
-        time: '21:30',
-        notes: '📢 **Binance Will Add Lorenzo Protocol (BANK) and Meteora (MET) on Earn, Buy Crypto, Convert & Margin **  **Binance** 将上线 **Lorenzo Protocol** (BANK) 和',
-    },
-    {
-        date: '2025-11-14',
-        token: 'SEI',
-        token_display: 'SEI',
-        exchange: 'OKX',
-        type: 'spot',
-        time: '03:00',
-        notes: '📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list SEI, 2Z for spot tradingDetail:  at: 2025-11-14T03:00:46Z **  OKX LISTING:#OKX 重要通知 OKX 将上线 S',
-    },
-    {
-        date: '2025-11-14',
-        token: 'SEI',
-        token_display: 'SEI',
-        exchange: 'OKX',
-        type: 'perp',
-        time: '07:01',
-        notes: '📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list perpetual futures for SEI cryptoDetail:  at: 2025-11-14T07:01:11Z **  OKX LISTING:#OKX 重要通知 O',
-    },
-    {
-        date: '2025-11-14',
-        token: 'PLANCK',
-        token_display: 'Planck (PLANCK)',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '14:30',
-        notes: '📢 **Binance Futures Will Postpone the Launch of PLANCKUSDT Perpetual Contract **  Binance 期货将推迟启动 PLANCKUSDT 永续合约。  ---------- 🔗 [查看来源](https://www.bi',
-    },
-    {
-        date: '2025-11-14',
-        token: 'SENT',
-        token_display: 'SENT (Sentient)',
-        exchange: 'OKX',
-        type: 'pre-market',
-        time: '14:33',
-        notes: '📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list pre-market perpetual futures for SENT (Sentient) cryptoDetail:  at: 2025-11-14T14:33:17Z **  ',
-    },
-    {
-        date: '2025-11-14',
-        token: 'PIEVERSE',
-        token_display: 'Pieverse (PIEVERSE)',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '15:47',
-        notes: '📢 **Binance: Pieverse (PIEVERSE) Will Be Available on Binance Alpha and Binance Futures (2025-11-14) **  Binance: Pieverse（PIEVERSE）将上线 Binance Alpha ',
-    },
-    {
-        date: '2025-11-14',
-        token: 'PIEVERSE',
-        token_display: 'Pieverse (PIEVERSE)',
-        exchange: 'Bybit',
-        type: 'spot',
-        time: '20:00',
-        notes: '📢 **BYBIT: 🔥 Listing of PIEVERSE on Convert **  BYBIT: 🔥 PIEVERSE 上线 Convert 平台  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/-listi',
-    },
-    {
-        date: '2025-11-14',
-        token: 'PIEVERSE',
-        token_display: 'Pieverse (PIEVERSE)',
-        exchange: 'Bybit',
-        type: 'perp',
-        time: '21:50',
-        pairs: 'PIEVERSE/USD',
-        notes: '📢 **BYBIT: New Listing : PIEVERSEUSDT Perpetual Contract in Innovation Zone, with up to 25x leverage **  BYBIT: 新上线：创新区 PIEVERSE/USDT 永续合约，最高支持 25 倍杠杆',
-    },
-    {
-        date: '2025-11-15',
-        token: 'SENT',
-        token_display: 'SENT (Sentient)',
-        exchange: 'Bybit',
-        type: 'pre-market',
-        time: '8:00 UTC',
-        notes: '📢 **BYBIT: Listing of SENTUSDT on Bybit Perpetual Pre-Market on Nov 15, 2025, 8:00AM UTC **  BYBIT: Bybit 将于 2025 年 11 月 15 日 UTC 时间上午 8:00 在永续期货预上市市场',
-    },
-    {
-        date: '2025-11-16',
-        token: 'PIEVERSE',
-        token_display: 'Pieverse (PIEVERSE)',
-        exchange: 'OKX',
-        type: 'perp',
-        time: '03:01',
-        notes: '📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list perpetual futures for PIEVERSE cryptoDetail:  at: 2025-11-16T03:01:58Z **  OKX LISTING:#OKX 重',
-    },
-    {
-        date: '2025-11-17',
-        token: 'SUP',
-        token_display: 'Superfluid (SUP)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '07:23',
-        pairs: 'SUP/USD',
-        notes: '📢 **COINBASE LISTING: Spot trading for Superfluid (SUP) will go live on 17 November 2025. The opening of our SUP-USD trading pair will begin later tod',
-    },
-    {
-        date: '2025-11-17',
-        token: 'ZEN',
-        token_display: 'ZEN',
-        exchange: 'OKX',
-        type: 'spot',
-        time: '13:00',
-        notes: '📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list ZEN for spot tradingDetail:  at: 2025-11-17T13:00:33Z **  OKX LISTING:#OKX 重要公告   OKX 将上线 ZEN',
-    },
-    {
-        date: '2025-11-17',
-        token: 'UAI',
-        token_display: 'UnifAI (UAI)',
-        exchange: 'Bybit',
-        type: 'perp',
-        time: '18:44',
-        notes: '📢 **BYBIT: New Listing : UAIUSDT Perpetual Contract in Innovation Zone, with up to 25x leverage **  BYBIT: 新上市：创新区 UAIUSDT 永续合约，最高支持 25 倍杠杆。  --------',
-    },
-    {
-        date: '2025-11-18',
-        token: 'TON',
-        token_display: 'Toncoin (TON)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '03:34',
-        pairs: 'TON/USD',
-        notes: '📢 **Coinbase will add support for Toncoin (TON) on The Open Network. Do not send this asset over other networks or your funds may be lost.   Spot trad',
-    },
-    {
-        date: '2025-11-18',
-        token: 'MET',
-        token_display: 'MET (Meteora)',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '15:57',
-        notes: '📢 **Bithumb LISTING:메테오라(MET) 원화마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:为纪念Meteora（MET）在韩元市场的上线，推出空投活动。  ---------- 🔗 [查看来源](https://feed.bithumb.com/no',
-    },
-    {
-        date: '2025-11-19',
-        token: 'WMTX',
-        token_display: 'Token (WMTX)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '09:12',
-        notes: '📢 **COINBASE LISTING: Assets added to the roadmap today: World Mobile Token (WMTX) **  COINBASE LISTING: 今日添加到路线图的资产：世界移动代币（WMTX）  ---------- 🔗 [查看来源]',
-    },
-    {
-        date: '2025-11-19',
-        token: 'ZEC',
-        token_display: 'ZEC',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '15:30',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined ZECUSDC Perpetual Contract (2025-11-19) **  币安期货将上线以美元稳定币（USDC）为保证金的 ZEC 永续合约 (2025-11-19)  ---------- 🔗',
-    },
-    {
-        date: '2025-11-19',
-        token: 'GAIB',
-        token_display: 'GAIB',
-        exchange: 'Bybit',
-        type: 'spot',
-        time: '20:02',
-        notes: '📢 **BYBIT: 🔥 Listing of GAIB on Convert & Bybit Savings **  BYBIT: 🔥 GAIB 上线 Convert 和 Bybit Savings  ---------- 🔗 [查看来源](https://announcements.bybit.',
-    },
-    {
-        date: '2025-11-20',
-        token: 'BOBBOB',
-        token_display: 'BOB (BOBBOB)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '01:06',
-        pairs: 'BOBBOB/USD',
-        notes: '📢 **COINBASE LISTING: Spot trading for BOB (BOBBOB) will go live on 20 November 2025. The opening of our BOBBOB-USD trading pair will begin later toda',
-    },
-    {
-        date: '2025-11-20',
-        token: 'JCT',
-        token_display: 'Janction (JCT)',
-        exchange: 'OKX',
-        type: 'perp',
-        time: '03:30',
-        notes: '📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list perpetual futures for JCT cryptoDetail:  at: 2025-11-20T03:30:35Z **  OKX LISTING:#OKX 重要通知 O',
-    },
-    {
-        date: '2025-11-20',
-        token: 'ASTER',
-        token_display: 'Aster (ASTER)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '04:10',
-        pairs: 'ASTER/USD',
-        notes: '📢 **COINBASE LISTING: Spot trading for Aster (ASTER) will go live on 20 November 2025. The opening of our ASTER-USD trading pair will begin on or afte',
-    },
-    {
-        date: '2025-11-20',
-        token: 'GAIB',
-        token_display: 'GAIB',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '16:30',
-        notes: '📢 **Binance Futures Will Postpone the Launch of GAIBUSDT Perpetual Contract **  Binance Futures 将推迟启动 GAIBUSDT 永续合约  ---------- 🔗 [查看来源](https://www.b',
-    },
-    {
-        date: '2025-11-21',
-        token: 'BOB',
-        token_display: 'BOB',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '17:28',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined BOBUSDT Perpetual Contract (2025-11-21) **  币安期货将推出以USDT计价的BOBUSDT永续合约（2025-11-21）  ---------- 🔗 [查看来源](',
-    },
-    {
-        date: '2025-11-23',
-        token: 'ZEC',
-        token_display: 'ZEC',
-        exchange: 'OKX',
-        type: 'spot',
-        time: '05:46',
-        notes: '📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list ZEC for spot tradingDetail:  at: 2025-11-23T05:46:02Z **  OKX LISTING:#OKX 重要公告 OKX将上线ZEC进行现货',
-    },
-    {
-        date: '2025-11-24',
-        token: 'APR',
-        token_display: 'Priori (APR)',
-        exchange: 'Binance',
-        type: 'spot',
-        time: '15:00',
-        notes: '📢 **Binance Earn New Listing Special Offer: Subscribe to ALLO, BANK, KITE or MET Locked Products to Enjoy 200% APR for 7 Days! **  币安Earn新品上市特别优惠：订阅AL',
-    },
-    {
-        date: '2025-11-24',
-        token: 'PIEVERSE',
-        token_display: 'Pieverse (PIEVERSE)',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '16:17',
-        notes: '📢 **Bithumb LISTING:[이벤트] 파이버스(PIEVERSE) 원화 마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:[活动] PIEVERSE 上线韩元市场纪念空投活动  ---------- 🔗 [查看来源](https://feed.bithumb',
-    },
-    {
-        date: '2025-11-24',
-        token: 'MON',
-        token_display: 'Monad (MON)',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '17:01',
-        notes: '📢 **UPBIT LISTING:[거래] 모나드(MON) 신규 거래지원 안내 (KRW, BTC, USDT 마켓) **  UPBIT LISTING:[交易] Monad (MON) 新增交易支持通知 (KRW, BTC, USDT 市场)  ---------- 🔗 [查看来源](ht',
-    },
-    {
-        date: '2025-11-24',
-        token: 'MON',
-        token_display: 'MON (Monad)',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '17:19',
-        notes: '📢 **Bithumb LISTING:모나드(MON) 원화 마켓 추가 (거래 수수료 무료) **  Bithumb LISTING:Monad（MON）在韩元市场新增交易对（交易手续费免费）。  ---------- 🔗 [查看来源](https://feed.bithumb.com/not',
-    },
-    {
-        date: '2025-11-24',
-        token: 'MON',
-        token_display: 'MON (Monad)',
-        exchange: 'Bybit',
-        type: 'spot',
-        time: '22:02',
-        notes: '📢 **BYBIT: 🔥 Listing of MON on Convert **  BYBIT: 🔥 MON 上线 Convert 平台  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/-listing-of-mon-',
-    },
-    {
-        date: '2025-11-25',
-        token: 'IRYS',
-        token_display: 'Irys (IRYS)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '00:53',
-        pairs: 'IRYS/USD',
-        notes: '📢 **COINBASE LISTING: Spot trading for Irys (IRYS) will go live on 25 November 2025. The opening of our IRYS-USD trading pair will begin later today i',
-    },
-    {
-        date: '2025-11-25',
-        token: 'FLUID',
-        token_display: 'Fluid (FLUID)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '00:53',
-        pairs: 'FLUID/USD',
-        notes: '📢 **COINBASE LISTING: Spot trading for Fluid (FLUID) and World Mobile Token (WMTX) will go live on 25 November 2025. The opening of our FLUID-USD and ',
-    },
-    {
-        date: '2025-11-25',
-        token: 'WMTX',
-        token_display: 'Token (WMTX)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '00:53',
-        pairs: 'WMTX/USD',
-        notes: '📢 **COINBASE LISTING: Spot trading for Fluid (FLUID) and World Mobile Token (WMTX) will go live on 25 November 2025. The opening of our FLUID-USD and ',
-    },
-    {
-        date: '2025-11-25',
-        token: 'DASH',
-        token_display: 'DASH',
-        exchange: 'OKX',
-        type: 'spot',
-        time: '09:00',
-        notes: '📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list DASH for spot tradingDetail:  at: 2025-11-25T09:00:30Z **  OKX LISTING:#OKX 重要通知   OKX 将上线 DA',
-    },
-    {
-        date: '2025-11-26',
-        token: 'PLUME',
-        token_display: 'Plume (PLUME)',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '13:30',
-        notes: '📢 **UPBIT LISTING:[거래] 플룸(PLUME) KRW 마켓 디지털 자산 추가 **  UPBIT LISTING:[交易] Plume (PLUME) 在 KRW 市场新增数字资产  ---------- 🔗 [查看来源](https://upbit.com/service_c',
-    },
-    {
-        date: '2025-11-26',
-        token: 'XION',
-        token_display: 'XION',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '16:51',
-        notes: '📢 **Bithumb LISTING:[이벤트] 자이온(XION) 원화 마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:[活动] 庆祝 ZION（XION）上线韩元市场的空投活动  ---------- 🔗 [查看来源](https://feed.bithumb.c',
-    },
-    {
-        date: '2025-11-26',
-        token: 'IRYS',
-        token_display: 'Irys (IRYS)',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '22:43',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined IRYSUSDT Perpetual Contract (2025-11-26) **  Binance Futures 即将推出 USDⓈ 保证金的 IRYSUSDT 永续合约（2025年11月26日）  ',
-    },
-    {
-        date: '2025-11-27',
-        token: 'AT',
-        token_display: 'APRO (AT)',
-        exchange: 'Binance',
-        type: 'spot',
-        time: '16:38',
-        notes: '📢 **Binance: Introducing APRO (AT) on Binance HODLer Airdrops! Earn AT With Retroactive BNB Simple Earn Subscriptions **  Binance: 在 Binance HODLer 空投',
-    },
-    {
-        date: '2025-11-27',
-        token: 'IRYS',
-        token_display: 'Irys (IRYS)',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '17:49',
-        notes: '📢 **Bithumb LISTING:아이리스(IRYS) 원화 마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:为庆祝IRIS（IRYS）韩元市场上线，将举行空投活动。#IRYS #AirDrop #Upbit  ---------- 🔗 [查看来源](https:/',
-    },
-    {
-        date: '2025-11-27',
-        token: 'IRYS',
-        token_display: 'Irys (IRYS)',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '17:49',
-        notes: '📢 **Bithumb LISTING:아이리스(IRYS) 원화 마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:为庆祝IRIS（IRYS）韩元市场上线，将举行空投活动。#IRYS #AirDrop #Upbit  ---------- 🔗 [查看来源](https:/',
-    },
-    {
-        date: '2025-11-27',
-        token: 'TQQQ',
-        token_display: 'TQQQ',
-        exchange: 'Bybit',
-        type: 'spot',
-        time: '19:00',
-        notes: '📢 **BYBIT: New listing: APP,PDD,QQQ,TQQQ are now live on Bybit TradFi! **  BYBIT: 新上线：APP、PDD、QQQ、TQQQ已在Bybit TradFi平台上线！  ---------- 🔗 [查看来源](https:/',
-    },
-    {
-        date: '2025-11-28',
-        token: 'TRUTH',
-        token_display: 'Network (TRUTH)',
-        exchange: 'OKX',
-        type: 'perp',
-        time: '11:01',
-        notes: '📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list perpetual futures for TRUTH cryptoDetail:  at: 2025-11-28T11:01:30Z **    ---------- 🔗 [查看来源]',
-    },
-    {
-        date: '2025-11-29',
-        token: 'RLS',
-        token_display: 'Rayls (RLS)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '09:35',
-        notes: '📢 **COINBASE LISTING: Assets added to the roadmap today: Rayls (RLS) **  COINBASE LISTING: 今日添加到路线图的资产：Rayls（RLS）  ---------- 🔗 [查看来源](https://twitter',
-    },
-    {
-        date: '2025-12-01',
-        token: 'RLS',
-        token_display: 'Rayls (RLS)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '00:51',
-        pairs: 'RLS/USD',
-        notes: '📢 **COINBASE LISTING: Spot trading for Rayls (RLS) will go live on 1 December 2025. The opening of our RLS-USD trading pairs will begin later today if',
-    },
-    {
-        date: '2025-12-01',
-        token: 'TRUTH',
-        token_display: 'Network (TRUTH)',
-        exchange: 'OKX',
-        type: 'spot',
-        time: '06:03',
-        notes: '📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list TRUTH for spot tradingDetail:  at: 2025-12-01T06:03:08Z **  OKX LISTING:#OKX重要公告 OKX将上线TRUTH现',
-    },
-    {
-        date: '2025-12-02',
-        token: 'PIPPIN',
-        token_display: 'PIPPIN',
-        exchange: 'OKX',
-        type: 'perp',
-        time: '14:32',
-        notes: '📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list perpetual futures for PIPPIN, RLS cryptoDetail:  at: 2025-12-02T14:32:38Z **  OKX LISTING:#OK',
-    },
-    {
-        date: '2025-12-02',
-        token: 'RLS',
-        token_display: 'Rayls (RLS)',
-        exchange: 'OKX',
-        type: 'perp',
-        time: '14:32',
-        notes: '📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list perpetual futures for PIPPIN, RLS cryptoDetail:  at: 2025-12-02T14:32:38Z **  OKX LISTING:#OK',
-    },
-    {
-        date: '2025-12-02',
-        token: 'RLS',
-        token_display: 'Rayls (RLS)',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '16:43',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined RLSUSDT Perpetual Contract (2025-12-02) **  \\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\',
-    },
-    {
-        date: '2025-12-03',
-        token: 'WET',
-        token_display: 'Humidifi (WET)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '03:42',
-        notes: '📢 **COINBASE LISTING: Assets added to the roadmap today: Humidifi (WET), zkPass (ZKP), Plume (PLUME), Hyperlane (HYPER), and Jupiter (JUPITER) **  COI',
-    },
-    {
-        date: '2025-12-03',
-        token: 'ZKP',
-        token_display: 'Pass (ZKP)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '03:42',
-        notes: '📢 **COINBASE LISTING: Assets added to the roadmap today: Humidifi (WET), zkPass (ZKP), Plume (PLUME), Hyperlane (HYPER), and Jupiter (JUPITER) **  COI',
-    },
-    {
-        date: '2025-12-03',
-        token: 'PLUME',
-        token_display: 'Plume (PLUME)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '03:42',
-        notes: '📢 **COINBASE LISTING: Assets added to the roadmap today: Humidifi (WET), zkPass (ZKP), Plume (PLUME), Hyperlane (HYPER), and Jupiter (JUPITER) **  COI',
-    },
-    {
-        date: '2025-12-03',
-        token: 'HYPER',
-        token_display: 'Hyperlane (HYPER)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '03:42',
-        notes: '📢 **COINBASE LISTING: Assets added to the roadmap today: Humidifi (WET), zkPass (ZKP), Plume (PLUME), Hyperlane (HYPER), and Jupiter (JUPITER) **  COI',
-    },
-    {
-        date: '2025-12-03',
-        token: 'JUPITER',
-        token_display: 'Jupiter (JUPITER)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '03:42',
-        notes: '📢 **COINBASE LISTING: Assets added to the roadmap today: Humidifi (WET), zkPass (ZKP), Plume (PLUME), Hyperlane (HYPER), and Jupiter (JUPITER) **  COI',
-    },
-    {
-        date: '2025-12-03',
-        token: 'BOB',
-        token_display: 'BOB',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '10:33',
-        notes: '📢 **Bithumb LISTING:비오비(BOB), 오리진트레일(TRAC) 원화 마켓 추가 **  Bithumb LISTING:新增BOB和TRAC韩元市场  ---------- 🔗 [查看来源](https://feed.bithumb.com/notice/1650991) 🕒',
-    },
-    {
-        date: '2025-12-03',
-        token: 'TRAC',
-        token_display: 'Trail (TRAC)',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '15:16',
-        notes: '📢 **Bithumb LISTING:오리진트레일(TRAC) 원화 마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:为庆祝Origin Trail (TRAC) KRW市场上线，将举办空投活动  ---------- 🔗 [查看来源](https://feed.bit',
-    },
-    {
-        date: '2025-12-04',
-        token: 'BEAM',
-        token_display: 'Beam (BEAM)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '07:39',
-        notes: '📢 **COINBASE LISTING: Assets added to the roadmap today: Beam (BEAM) **  COINBASE LISTING: 今天添加到产品路线图的资产：Beam (BEAM)  ---------- 🔗 [查看来源](https://twit',
-    },
-    {
-        date: '2025-12-04',
-        token: 'BOB',
-        token_display: 'BOB',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '11:30',
-        notes: '📢 **Bithumb LISTING:비오비(BOB) 원화 마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:为庆祝BOB（BOB）加入韩元市场，我们将举办空投活动  ---------- 🔗 [查看来源](https://feed.bithumb.com/notice',
-    },
-    {
-        date: '2025-12-04',
-        token: 'WET',
-        token_display: 'Humidifi (WET)',
-        exchange: 'Bybit',
-        type: 'pre-market',
-        time: '12:00 UTC',
-        notes: '📢 **BYBIT: Listing of WETUSDT on Bybit Perpetual Pre-Market on Dec 4, 2025, 12:00PM UTC **  BYBIT: WETUSDT将于2025年12月4日UTC时间下午12:00在Bybit Perpetual盘前交易',
-    },
-    {
-        date: '2025-12-05',
-        token: 'SAPIEN',
-        token_display: 'Sapien (SAPIEN)',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '11:30',
-        notes: '📢 **Bithumb LISTING:[이벤트] 사피엔(SAPIEN) 원화 마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:【活动】SAPIEN韩元市场新增纪念空投活动  ---------- 🔗 [查看来源](https://feed.bithumb.com/no',
-    },
-    {
-        date: '2025-12-06',
-        token: 'IMU',
-        token_display: 'ImmuneFi (IMU)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '07:52',
-        notes: '📢 **COINBASE LISTING: Assets added to the roadmap today: ImmuneFi (IMU) and Sentient (SENT) **  COINBASE LISTING: 今天添加到产品路线图的资产包括：ImmuneFi (IMU) 和 Sen',
-    },
-    {
-        date: '2025-12-06',
-        token: 'SENT',
-        token_display: 'Sentient (SENT)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '07:52',
-        notes: '📢 **COINBASE LISTING: Assets added to the roadmap today: ImmuneFi (IMU) and Sentient (SENT) **  COINBASE LISTING: 今天添加到产品路线图的资产包括：ImmuneFi (IMU) 和 Sen',
-    },
-    {
-        date: '2025-12-06',
-        token: 'POWER',
-        token_display: 'POWER',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '15:40',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined POWERUSDT Perpetual Contract (2025-12-06) **  币安期货将推出以美元计价的POWERUSDT永续合约（2025年12月6日）  ---------- 🔗 [查看来源',
-    },
-    {
-        date: '2025-12-08',
-        token: 'STABLE',
-        token_display: 'STABLE',
-        exchange: 'OKX',
-        type: 'perp',
-        time: '12:02',
-        notes: '📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list perpetual futures for STABLE cryptoDetail:  at: 2025-12-08T12:02:19Z **  OKX LISTING:#OKX 重要通',
-    },
-    {
-        date: '2025-12-08',
-        token: 'STABLE',
-        token_display: 'STABLE',
-        exchange: 'Bybit',
-        type: 'spot',
-        time: '20:32',
-        notes: '📢 **BYBIT: 🔥 Listing of STABLE on Convert & Bybit Savings **  BYBIT: 🔥 Convert &amp; Bybit Savings 上的稳定产品列表  ---------- 🔗 [查看来源](https://announcements',
-    },
-    {
-        date: '2025-12-09',
-        token: 'PLUME',
-        token_display: 'Plume (PLUME)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '01:54',
-        pairs: 'PLUME/USD',
-        notes: '📢 **COINBASE LISTING: Spot trading for Plume (PLUME) and Jupiter (JUPITER) will go live on 9 December 2025. The opening of our PLUME-USD and JUPITER-U',
-    },
-    {
-        date: '2025-12-09',
-        token: 'JUPITER',
-        token_display: 'Jupiter (JUPITER)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '01:54',
-        pairs: 'JUPITER/USD',
-        notes: '📢 **COINBASE LISTING: Spot trading for Plume (PLUME) and Jupiter (JUPITER) will go live on 9 December 2025. The opening of our PLUME-USD and JUPITER-U',
-    },
-    {
-        date: '2025-12-09',
-        token: 'WET',
-        token_display: 'Humidifi (WET)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '02:15',
-        pairs: 'WET/USD',
-        notes: '📢 **COINBASE LISTING: Spot trading for Humidifi (WET) will go live on 9 December 2025. The opening of our WET-USD trading pair will begin later today ',
-    },
-    {
-        date: '2025-12-09',
-        token: 'THQ',
-        token_display: 'Theoriq (THQ)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '04:26',
-        notes: '📢 **COINBASE LISTING: Assets added to the roadmap today: Theoriq (THQ) **  COINBASE LISTING: 今天添加到产品路线图的资产：Theoriq (THQ)  ---------- 🔗 [查看来源](https://',
-    },
-    {
-        date: '2025-12-09',
-        token: 'WET',
-        token_display: 'Humidifi (WET)',
-        exchange: 'OKX',
-        type: 'spot',
-        time: '07:31',
-        notes: '📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list WET for spot tradingDetail:  at: 2025-12-09T07:31:35Z **  OKX LISTING:#OKX 重要通知 OKX 将上线 WET 现',
-    },
-    {
-        date: '2025-12-09',
-        token: 'ALLO',
-        token_display: 'Allora (ALLO)',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '13:45',
-        notes: '📢 **Bithumb LISTING:[이벤트] 알로라(ALLO) 원화 마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:【活动】空投活动庆祝Allola（ALLO）韩元市场上线  ---------- 🔗 [查看来源](https://feed.bithumb.co',
-    },
-    {
-        date: '2025-12-09',
-        token: 'WET',
-        token_display: 'Humidifi (WET)',
-        exchange: 'OKX',
-        type: 'perp',
-        time: '15:18',
-        notes: '📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list perpetual futures for WET cryptoDetail:  at: 2025-12-09T15:18:03Z **  OKX LISTING:#OKX 重要通知 O',
-    },
-    {
-        date: '2025-12-09',
-        token: 'FOLKS',
-        token_display: 'Finance (FOLKS)',
-        exchange: 'Bybit',
-        type: 'perp',
-        time: '19:25',
-        notes: '📢 **BYBIT: New Listing : FOLKSUSDT Perpetual Contract in Innovation Zone, with up to 20x leverage **  BYBIT: 新品上市：FOLKSUSDT 创新区永续合约，最高可达 20 倍杠杆  -----',
-    },
-    {
-        date: '2025-12-09',
-        token: 'WET',
-        token_display: 'Humidifi (WET)',
-        exchange: 'Bybit',
-        type: 'spot',
-        time: '22:31',
-        notes: '📢 **BYBIT: 🔥 Listing of WET on Convert & Bybit Savings **  BYBIT: 🔥 WET 在 Convert &amp; Bybit Savings 上的列表  ---------- 🔗 [查看来源](https://announcements.',
-    },
-    {
-        date: '2025-12-10',
-        token: 'HYPER',
-        token_display: 'Hyperlane (HYPER)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '00:53',
-        pairs: 'HYPER/USD',
-        notes: '📢 **COINBASE LISTING: Spot trading for Hyperlane (HYPER) will go live on 10 December 2025. The opening of our HYPER-USD trading pair will begin on or ',
-    },
-    {
-        date: '2025-12-10',
-        token: 'PLUME',
-        token_display: 'Plume (PLUME)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '06:07',
-        pairs: 'PLUME/USD',
-        notes: '📢 **COINBASE LISTING: The launch of spot trading for Plume (PLUME) has been postponed to 10 December 2025. The opening of our PLUME-USD trading pair w',
-    },
-    {
-        date: '2025-12-11',
-        token: 'STABLE',
-        token_display: 'STABLE',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '14:30',
-        notes: '📢 **Bithumb LISTING:스테이블(STABLE) 원화 마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:为庆祝韩元稳定市场上线，我们将举办空投活动  ---------- 🔗 [查看来源](https://feed.bithumb.com/notice/1',
-    },
-    {
-        date: '2025-12-11',
-        token: 'ALMANAK',
-        token_display: 'ALMANAK',
-        exchange: 'Bybit',
-        type: 'spot',
-        time: '20:02',
-        notes: '📢 **BYBIT: 🔥 Listing of ALMANAK on Convert & Bybit Savings **  BYBIT: 🔥 ALMANAK 在 Convert &amp; Bybit Savings 上架  ---------- 🔗 [查看来源](https://announce',
-    },
-    {
-        date: '2025-12-12',
-        token: 'US',
-        token_display: 'US',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '17:17',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined USUSDT and CYSUSDT Perpetual Contracts (2025-12-12) **  币安期货将于2025年12月12日推出以美元Ⓢ为保证金的USUSDT和CYSUSDT永续合约  ',
-    },
-    {
-        date: '2025-12-12',
-        token: 'CYS',
-        token_display: 'CYS',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '17:17',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined USUSDT and CYSUSDT Perpetual Contracts (2025-12-12) **  币安期货将于2025年12月12日推出以美元Ⓢ为保证金的USUSDT和CYSUSDT永续合约  ',
-    },
-    {
-        date: '2025-12-13',
-        token: 'LIGHTER',
-        token_display: 'Lighter (LIGHTER)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '07:28',
-        notes: '📢 **COINBASE LISTING: Assets added to the roadmap today: Lighter (LIGHTER) **  COINBASE LISTING: 今天添加到产品路线图的资产：Lighter（轻量级）  ---------- 🔗 [查看来源](https',
-    },
-    {
-        date: '2025-12-14',
-        token: 'RAVE',
-        token_display: 'RaveDAO (RAVE)',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '22:18',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined RAVEUSDT Perpetual Contract (2025-12-14) **  币安期货将推出以美元Ⓢ计价的RAVEUSDT永续合约（2025年12月14日）  ---------- 🔗 [查看来源',
-    },
-    {
-        date: '2025-12-15',
-        token: 'WET',
-        token_display: 'Humidify (WET)',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '18:20',
-        notes: '📢 **Bithumb LISTING:[이벤트] 휴미디파이(WET) 원화마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:【活动】空投活动庆祝 Humidify (WET) 上线韩元市场  ---------- 🔗 [查看来源](https://feed.bithum',
-    },
-    {
-        date: '2025-12-16',
-        token: 'BEAM',
-        token_display: 'Beam (BEAM)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '00:54',
-        pairs: 'BEAM/USD',
-        notes: '📢 **COINBASE LISTING: Spot trading for Beam (BEAM) will go live on 16 December 2025. The opening of our BEAM-USD trading pair will begin on or after 9',
-    },
-    {
-        date: '2025-12-16',
-        token: 'THQ',
-        token_display: 'Theoriq (THQ)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '01:18',
-        pairs: 'THQ/USD',
-        notes: '📢 **COINBASE LISTING: Spot trading for Theoriq (THQ) will go live on 16 December 2025. The opening of our THQ-USD trading pair will begin later today ',
-    },
-    {
-        date: '2025-12-16',
-        token: 'EDEN',
-        token_display: 'OpenEden (EDEN)',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '16:55',
-        notes: '📢 **Bithumb LISTING:[이벤트] 오픈에덴(EDEN) 원화 마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:【活动】庆祝韩元市场上线Open Eden（EDEN）的空投活动  ---------- 🔗 [查看来源](https://feed.bithu',
-    },
-    {
-        date: '2025-12-17',
-        token: 'SCOR',
-        token_display: 'SCOR',
-        exchange: 'Bybit',
-        type: 'spot',
-        time: '18:32',
-        notes: '📢 **BYBIT: 🔥 Listing of SCOR on Convert & Bybit Savings **  BYBIT: 🔥 SCOR 在 Convert &amp; Bybit Savings 上的上市  ---------- 🔗 [查看来源](https://announcement',
-    },
-    {
-        date: '2025-12-18',
-        token: 'VOOI',
-        token_display: 'VOOI',
-        exchange: 'Bybit',
-        type: 'spot',
-        time: '21:23',
-        notes: '📢 **BYBIT: 🔥 Listing of VOOI on Convert & Bybit Savings **  BYBIT: 🔥 VOOI 在 Convert 和 Bybit Savings 上的列表  ---------- 🔗 [查看来源](https://announcements.by',
-    },
-    {
-        date: '2025-12-19',
-        token: 'ZKP',
-        token_display: 'Pass (ZKP)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '02:03',
-        pairs: 'ZKP/USD',
-        notes: '📢 **COINBASE LISTING: Spot trading for zkPass (ZKP) will go live on 19 December 2025. The opening of our ZKP-USD trading pair will begin later today i',
-    },
-    {
-        date: '2025-12-19',
-        token: 'DEXE',
-        token_display: 'DEXE',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '16:40',
-        notes: '📢 **Bithumb LISTING:딕시(DEXE) 원화 마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:为庆祝DEXE上线韩元市场，我们将举办空投活动  ---------- 🔗 [查看来源](https://feed.bithumb.com/notice/165',
-    },
-    {
-        date: '2025-12-19',
-        token: 'ZKP',
-        token_display: 'Pass (ZKP)',
-        exchange: 'Bybit',
-        type: 'spot',
-        time: '23:03',
-        notes: '📢 **BYBIT: 🔥 Listing of ZKP on Convert & Bybit Savings **  BYBIT: 🔥 ZKP 在 Convert 和 Bybit Savings 上架  ---------- 🔗 [查看来源](https://announcements.bybit.',
-    },
-    {
-        date: '2025-12-20',
-        token: 'BREV',
-        token_display: 'Brevis (BREV)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '06:40',
-        notes: '📢 **COINBASE LISTING: Assets added to the roadmap today: Brevis (BREV) **  COINBASE LISTING: 今天添加到产品路线图的资产：Brevis (BREV)  ---------- 🔗 [查看来源](https://',
-    },
-    {
-        date: '2025-12-21',
-        token: 'ZKP',
-        token_display: 'Pass (ZKP)',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '16:33',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined ZKPUSDT, GUAUSDT and IRUSDT Perpetual Contract (2025-12-21) **  币安期货将于2025年12月21日推出以美元Ⓢ为保证金的ZKPUSDT、GUAU',
-    },
-    {
-        date: '2025-12-21',
-        token: 'GUA',
-        token_display: 'GUA',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '16:33',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined ZKPUSDT, GUAUSDT and IRUSDT Perpetual Contract (2025-12-21) **  币安期货将于2025年12月21日推出以美元Ⓢ为保证金的ZKPUSDT、GUAU',
-    },
-    {
-        date: '2025-12-21',
-        token: 'IR',
-        token_display: 'IR',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '16:33',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined ZKPUSDT, GUAUSDT and IRUSDT Perpetual Contract (2025-12-21) **  币安期货将于2025年12月21日推出以美元Ⓢ为保证金的ZKPUSDT、GUAU',
-    },
-    {
-        date: '2025-12-22',
-        token: 'ZKP',
-        token_display: 'Pass (ZKP)',
-        exchange: 'Bybit',
-        type: 'perp',
-        time: '17:48',
-        notes: '📢 **BYBIT: New listing: ZKPUSDT Perpetual Contract in Innovation Zone, with up to 25x leverage **  BYBIT: 新上线：ZKPUSDT 永续合约，创新板块，最高可达 25 倍杠杆  ---------',
-    },
-    {
-        date: '2025-12-22',
-        token: 'BTW',
-        token_display: 'BTW',
-        exchange: 'Binance',
-        type: 'spot',
-        time: '18:01',
-        notes: '📢 **Join the  Pre-TGE and Booster Program on ****#Binance**** Wallet with  ****@BitwayOfficial****  📅 Booster Program Start Time: December 22 2025  🎯 ',
-    },
-    {
-        date: '2025-12-23',
-        token: 'THQ',
-        token_display: 'Teoric (THQ)',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '13:30',
-        notes: '📢 **Bithumb LISTING:테오릭(THQ) 원화마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:为庆祝 Teoric (THQ) 正式上线韩元市场，我们将举办空投活动  ---------- 🔗 [查看来源](https://feed.bithumb.com',
-    },
-    {
-        date: '2025-12-23',
-        token: 'LIT',
-        token_display: 'LIT (Lighter)',
-        exchange: 'Binance',
-        type: 'pre-market',
-        time: '21:53',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined LITUSDT Perpetual Contract Pre-Market Trading (2025-12-23) **  币安期货将于2025年12月23日推出以美元Ⓢ为保证金的LITUSDT永续合约盘前',
-    },
-    {
-        date: '2025-12-24',
-        token: 'LIT',
-        token_display: 'LIT (Lighter)',
-        exchange: 'OKX',
-        type: 'pre-market',
-        time: '03:01',
-        notes: '📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list pre-market perpetual futures for LIT (Lighter) cryptoDetail:  at: 2025-12-24T03:01:12Z **  OK',
-    },
-    {
-        date: '2025-12-26',
-        token: 'FXS',
-        token_display: 'Share (FXS)',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '11:00',
-        notes: '📢 **Binance Will Support the Frax Share (FXS) Mainnet Swap and Rebranding to Frax (FRAX) **  币安将支持 Frax Share (FXS) 主网上线及更名为 Frax (FRAX)  ---------- 🔗',
-    },
-    {
-        date: '2025-12-26',
-        token: 'FRAX',
-        token_display: 'Frax (FRAX)',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '11:00',
-        notes: '📢 **Binance Will Support the Frax Share (FXS) Mainnet Swap and Rebranding to Frax (FRAX) **  币安将支持 Frax Share (FXS) 主网上线及更名为 Frax (FRAX)  ---------- 🔗',
-    },
-    {
-        date: '2025-12-26',
-        token: 'YB',
-        token_display: 'Basis (YB)',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '12:15',
-        notes: '📢 **UPBIT LISTING:[거래] 일드베이시스(YB) 신규 거래지원 안내 (BTC, USDT 마켓) **  UPBIT LISTING:【交易】收益率基差 (YB) 新交易支持（BTC、USDT 市场）  ---------- 🔗 [查看来源](https://upbit.com',
-    },
-    {
-        date: '2025-12-26',
-        token: 'ZKP',
-        token_display: 'Pass (ZKP)',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '14:19',
-        notes: '📢 **UPBIT LISTING:[Trade] Market Support for zkPass(ZKP) (KRW, BTC, USDT Market) **  UPBIT LISTING:【交易】zkPass(ZKP) 的市场支持（韩元、比特币、USDT 市场）  ---------- 🔗',
-    },
-    {
-        date: '2025-12-26',
-        token: 'ZKP',
-        token_display: 'Pass (ZKP)',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '14:45',
-        notes: '📢 **Bithumb LISTING:[이벤트] 지케이패스(ZKP) 원화마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:【活动】空投活动庆祝 ZKP 上线韩元市场  ---------- 🔗 [查看来源](https://feed.bithumb.com/notic',
-    },
-    {
-        date: '2025-12-30',
-        token: 'BREV',
-        token_display: 'BREV (Brevis)',
-        exchange: 'OKX',
-        type: 'pre-market',
-        time: '12:31',
-        notes: '📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list pre-market perpetual futures for BREV (Brevis) cryptoDetail:  at: 2025-12-30T12:31:05Z **  OK',
-    },
-    {
-        date: '2025-12-30',
-        token: 'BREV',
-        token_display: 'Brevis (BREV)',
-        exchange: 'Binance',
-        type: 'pre-market',
-        time: '18:30',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined BREVUSDT Perpetual Contract Pre-Market Trading (2025-12-30) **  币安期货将于2025年12月30日推出以美元计价的BREVUSDT永续合约盘前交',
-    },
-    {
-        date: '2025-12-30',
-        token: 'BREV',
-        token_display: 'Brevis (BREV)',
-        exchange: 'Bybit',
-        type: 'pre-market',
-        time: '1:45 UTC',
-        notes: '📢 **BYBIT: Listing of BREVUSDT on Bybit Perpetual Pre-Market on Dec 30, 2025, 1:45PM UTC **  BYBIT: BREVUSDT将于2025年12月30日下午1:45（UTC）在Bybit Perpetual盘前',
-    },
-    {
-        date: '2025-12-30',
-        token: 'LIT',
-        token_display: 'LIT (Lighter)',
-        exchange: 'Bybit',
-        type: 'perp',
-        time: '22:09',
-        notes: '📢 **BYBIT: New listing: LITUSDT Perpetual Contract, with up to 25x leverage **  BYBIT: 新品上线：LITUSDT永续合约，最高可达25倍杠杆  ---------- 🔗 [查看来源](https://announc',
-    },
-    {
-        date: '2025-12-31',
-        token: 'LIGHTER',
-        token_display: 'Lighter (LIGHTER)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '01:06',
-        pairs: 'LIGHTER/USD',
-        notes: '📢 **COINBASE LISTING: Spot trading for Lighter (LIGHTER) will go live when liquidity conditions are met, in regions where trading is supported for our',
-    },
-    {
-        date: '2025-12-31',
-        token: 'LIT',
-        token_display: 'LIT (Lighter)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '01:12',
-        notes: '📢 **VeloNews:Lighter’s ****$LIT**** Token Gets Listed On Coinbase In Its First Major CEX Spot Listing Source: Twitter Blog **  VeloNews:Lighter 的 $LIT',
-    },
-    {
-        date: '2025-12-31',
-        token: 'COLLECT',
-        token_display: 'COLLECT',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '19:45',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined COLLECTUSDT and MAGMAUSDT Perpetual Contract (2025-12-31) **  币安期货将于2025年12月31日推出以美元Ⓢ为保证金的COLLECTUSDT和MA',
-    },
-    {
-        date: '2025-12-31',
-        token: 'MAGMA',
-        token_display: 'MAGMA',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '19:45',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined COLLECTUSDT and MAGMAUSDT Perpetual Contract (2025-12-31) **  币安期货将于2025年12月31日推出以美元Ⓢ为保证金的COLLECTUSDT和MA',
-    },
-    {
-        date: '2026-01-01',
-        token: 'XAUT',
-        token_display: 'Gold (XAUT)',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '12:00',
-        notes: '📢 **UPBIT LISTING:[Trade] Market Support for Tether Gold(XAUT) (KRW, BTC, USDT Market) **  UPBIT LISTING:【交易】Tether Gold(XAUT)市场支持（韩元、BTC、USDT市场）  ---',
-    },
-    {
-        date: '2026-01-01',
-        token: 'XAUT',
-        token_display: 'Gold (XAUT)',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '16:30',
-        notes: '📢 **Bithumb LISTING:[이벤트] 테더골드(XAUT) 원화마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:【活动】为庆祝加入韩元市场，Tether Gold (XAUT) 空投活动  ---------- 🔗 [查看来源](https://feed.b',
-    },
-    {
-        date: '2026-01-05',
-        token: 'BREV',
-        token_display: 'BREV (Brevis)',
-        exchange: 'OKX',
-        type: 'pre-market',
-        time: '11:30',
-        notes: '📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list BREV (Brevis) for spot trading and convert pre-market futures to standard perpetual futuresDe',
-    },
-    {
-        date: '2026-01-05',
-        token: 'BREV',
-        token_display: 'Brevis (BREV)',
-        exchange: 'OKX',
-        type: 'spot',
-        time: '16:00',
-        notes: '📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list BREV for spot tradingDetail:  at: 2026-01-05T16:00:05Z **  OKX LISTING:#OKX 重要通知 OKX 将 BREV 上',
-    },
-    {
-        date: '2026-01-05',
-        token: 'BREV',
-        token_display: 'Brevis (BREV)',
-        exchange: 'Binance',
-        type: 'spot',
-        time: '18:04',
-        notes: '📢 **Binance: Introducing Brevis (BREV) on Binance HODLer Airdrops! Earn BREV With Retroactive BNB Simple Earn Subscriptions **  Binance: 币安 HODLer 空投推',
-    },
-    {
-        date: '2026-01-06',
-        token: 'BREV',
-        token_display: 'Brevis (BREV)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '03:40',
-        pairs: 'BREV/USD',
-        notes: '📢 **COINBASE LISTING: Spot trading for Brevis (BREV) will go live on 6 January 2026. The opening of our BREV-USD trading pair will begin later today i',
-    },
-    {
-        date: '2026-01-06',
-        token: 'ZK',
-        token_display: 'Sync (ZK)',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '15:30',
-        notes: '📢 **UPBIT LISTING:지케이싱크(ZK) 신규 거래지원 안내 (KRW, BTC, USDT 마켓) **  UPBIT LISTING:ZK Sync (ZK) 新交易支持公告（韩元、比特币、USDT 市场）  ---------- 🔗 [查看来源](https://upbit.c',
-    },
-    {
-        date: '2026-01-06',
-        token: 'WHITEWHALE',
-        token_display: 'WHITEWHALE',
-        exchange: 'Bybit',
-        type: 'perp',
-        time: '20:28',
-        notes: '📢 **BYBIT: New listing: WHITEWHALEUSDT Perpetual Contract in Innovation Zone, with up to 5x leverage **  BYBIT: 新上线：WHITEWHALEUSDT 永续合约，创新区，最高可达 5 倍杠杆',
-    },
-    {
-        date: '2026-01-06',
-        token: 'BREV',
-        token_display: 'Brevis (BREV)',
-        exchange: 'Bybit',
-        type: 'spot',
-        time: '22:29',
-        notes: '📢 **BYBIT: 🔥 Listing of BREV on Convert **  BYBIT: 🔥 BREV 在 Convert 上的上市信息  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/-listing-of',
-    },
-    {
-        date: '2026-01-07',
-        token: 'MEGA',
-        token_display: 'MegaETH (MEGA)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '04:20',
-        notes: '📢 **COINBASE LISTING: Assets added to the roadmap today: MegaETH (MEGA) **  COINBASE LISTING: 今天添加到路线图的资产：MegaETH (MEGA)  ---------- 🔗 [查看来源](https://',
-    },
-    {
-        date: '2026-01-07',
-        token: 'BREV',
-        token_display: 'Brevis (BREV)',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '10:20',
-        notes: '📢 **UPBIT LISTING:[거래] 브레비스(BREV) 신규 거래지원 안내 (KRW, BTC, USDT 마켓) **  UPBIT LISTING:【交易】Brevis（BREV）新增交易支持（韩元、BTC、USDT市场）  ---------- 🔗 [查看来源](https://',
-    },
-    {
-        date: '2026-01-07',
-        token: 'BREV',
-        token_display: 'Brevis (BREV)',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '13:00',
-        notes: '📢 **Bithumb LISTING:브레비스(BREV) 원화마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:为庆祝 Brevis (BREV) 上线韩元市场，我们将举办空投活动  ---------- 🔗 [查看来源](https://feed.bithumb.co',
-    },
-    {
-        date: '2026-01-07',
-        token: 'ZKP',
-        token_display: 'Pass (ZKP)',
-        exchange: 'OKX',
-        type: 'perp',
-        time: '13:03',
-        notes: '📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list perpetual futures for ZKP cryptoDetail:  at: 2026-01-07T13:03:16Z **  OKX LISTING:#OKX 重要通知 O',
-    },
-    {
-        date: '2026-01-07',
-        token: 'XAG',
-        token_display: 'XAG',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '15:00',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined XAGUSDT Perpetual Contract (2026-01-07) **  币安期货将推出以美元Ⓢ计价的XAGUSDT永续合约（2026年1月7日）  ---------- 🔗 [查看来源](ht',
-    },
-    {
-        date: '2026-01-07',
-        token: 'ZKP',
-        token_display: 'Pass (ZKP)',
-        exchange: 'Binance',
-        type: 'spot',
-        time: '18:39',
-        notes: '📢 **Binance Will List 币安人生 (币安人生) and zkPass (ZKP) with Seed Tag Applied **  币安即将上线币安人生（币安人生）和zkPass（ZKP）并应用种子标签  ---------- 🔗 [查看来源](https://www.tree',
-    },
-    {
-        date: '2026-01-07',
-        token: 'RAY',
-        token_display: 'Raydium (RAY)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '23:05',
-        notes: '📢 **COINBASE LISTING: Assets added to the roadmap today: Raydium (RAY), Energy Dollar (ENERGY), Elsa (ELSA), and  (FUN) **  COINBASE LISTING: 今天添加到路线图',
-    },
-    {
-        date: '2026-01-07',
-        token: 'ENERGY',
-        token_display: 'Dollar (ENERGY)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '23:05',
-        notes: '📢 **COINBASE LISTING: Assets added to the roadmap today: Raydium (RAY), Energy Dollar (ENERGY), Elsa (ELSA), and  (FUN) **  COINBASE LISTING: 今天添加到路线图',
-    },
-    {
-        date: '2026-01-07',
-        token: 'ELSA',
-        token_display: 'Elsa (ELSA)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '23:05',
-        notes: '📢 **COINBASE LISTING: Assets added to the roadmap today: Raydium (RAY), Energy Dollar (ENERGY), Elsa (ELSA), and  (FUN) **  COINBASE LISTING: 今天添加到路线图',
-    },
-    {
-        date: '2026-01-07',
-        token: 'FUN',
-        token_display: 'FUN',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '23:05',
-        notes: '📢 **COINBASE LISTING: Assets added to the roadmap today: Raydium (RAY), Energy Dollar (ENERGY), Elsa (ELSA), and  (FUN) **  COINBASE LISTING: 今天添加到路线图',
-    },
-    {
-        date: '2026-01-09',
-        token: 'RIVER',
-        token_display: 'RIVER',
-        exchange: 'OKX',
-        type: 'perp',
-        time: '06:31',
-        notes: '📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list perpetual futures for RIVER cryptoDetail:  at: 2026-01-09T06:31:38Z **  OKX LISTING:#OKX 重要通知',
-    },
-    {
-        date: '2026-01-09',
-        token: 'ZAMA',
-        token_display: 'ZAMA (Zama)',
-        exchange: 'Bybit',
-        type: 'pre-market',
-        time: '10:45 UTC',
-        notes: '📢 **Bybit to list Pre-Market Perpetuals for ZAMAUSDT on Jan 9, 2026, 10:45AM UTC **  Bybit将于2026年1月9日上午10:45（UTC）上线ZAMAUSDT盘前永续合约。  ---------- 🔗 [查看来源',
-    },
-    {
-        date: '2026-01-09',
-        token: 'ZAMA',
-        token_display: 'ZAMA (Zama)',
-        exchange: 'OKX',
-        type: 'pre-market',
-        time: '14:02',
-        notes: '📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list pre-market perpetual futures for ZAMA (Zama) cryptoDetail:  at: 2026-01-09T14:02:18Z **  OKX ',
-    },
-    {
-        date: '2026-01-09',
-        token: 'ZAMA',
-        token_display: 'ZAMA (Zama)',
-        exchange: 'Binance',
-        type: 'pre-market',
-        time: '16:42',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined ZAMAUSDT Perpetual Contract Pre-Market Trading (2026-01-09) **  币安期货将于2026年1月9日推出以美元计价的ZAMAUSDT永续合约盘前交易。',
-    },
-    {
-        date: '2026-01-10',
-        token: 'FOGO',
-        token_display: 'FOGO (Fogo)',
-        exchange: 'OKX',
-        type: 'pre-market',
-        time: '15:16',
-        notes: '📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list pre-market perpetual futures for FOGO (Fogo) cryptoDetail:  at: 2026-01-10T15:16:04Z **  OKX ',
-    },
-    {
-        date: '2026-01-10',
-        token: 'FOGO',
-        token_display: 'FOGO (Fogo)',
-        exchange: 'Binance',
-        type: 'pre-market',
-        time: '21:42',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined FOGOUSDT Perpetual Contract Pre-Market Trading (2026-01-10) **  币安期货将于2026年1月10日推出以美元计价的FOGOUSDT永续合约盘前交易',
-    },
-    {
-        date: '2026-01-11',
-        token: 'FOGO',
-        token_display: 'FOGO (Fogo)',
-        exchange: 'Bybit',
-        type: 'pre-market',
-        time: '8:00 UTC',
-        notes: '📢 **Bybit to list Pre-Market Perpetuals for FOGOUSDT on Jan 11, 2026, 8:00AM UTC **  Bybit将于2026年1月11日上午8:00（UTC）上线FOGOUSDT盘前永续合约。  ---------- 🔗 [查看来源',
-    },
-    {
-        date: '2026-01-12',
-        token: 'FOGO',
-        token_display: 'Fogo (FOGO)',
-        exchange: 'Binance',
-        type: 'spot',
-        time: '20:50',
-        notes: '📢 **Binance Will List Fogo (FOGO) with Seed Tag Applied **  币安将上线 Fogo (FOGO)，并应用种子标签。  ---------- 🔗 [查看来源](https://www.treeofalpha.com/preview_articl',
-    },
-    {
-        date: '2026-01-13',
-        token: 'FOGO',
-        token_display: 'FOGO (Fogo)',
-        exchange: 'OKX',
-        type: 'spot',
-        time: '06:31',
-        notes: '📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list FOGO for spot tradingDetail:  at: 2026-01-13T06:31:34Z **  OKX LISTING:#OKX 重要通知 OKX 将上线 FOGO',
-    },
-    {
-        date: '2026-01-13',
-        token: 'FOGO',
-        token_display: 'FOGO (Fogo)',
-        exchange: 'OKX',
-        type: 'pre-market',
-        time: '14:31',
-        notes: '📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list FOGO (Fogo) for spot trading and convert pre-market futures to standard perpetual futuresDeta',
-    },
-    {
-        date: '2026-01-14',
-        token: 'RAY',
-        token_display: 'Raydium (RAY)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '05:06',
-        pairs: 'RAY/USD',
-        notes: '📢 **COINBASE LISTING: Spot trading for Raydium (RAY) will go live on 14 January 2026. The opening of our RAY-USD trading pair will begin on or after 9',
-    },
-    {
-        date: '2026-01-14',
-        token: 'USDE',
-        token_display: 'USDE',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '14:55',
-        notes: '📢 **UPBIT LISTING:[거래] 유에스디이(USDE) 신규 거래지원 안내 (KRW, BTC, USDT 마켓) **  UPBIT LISTING:【交易】新增 USDE 交易支持（韩元、比特币、USDT 交易对）  ---------- 🔗 [查看来源](https://upb',
-    },
-    {
-        date: '2026-01-14',
-        token: 'USDE',
-        token_display: 'USDE',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '15:13',
-        notes: '📢 **Bithumb LISTING:유에스디이(USDE) 원화 마켓 추가 **  Bithumb LISTING:美国鹰扬币已进入韩国市场  ---------- 🔗 [查看来源](https://feed.bithumb.com/notice/1651484) 🕒 __2026-01-14',
-    },
-    {
-        date: '2026-01-15',
-        token: 'LIT',
-        token_display: 'LIT (Lighter)',
-        exchange: 'OKX',
-        type: 'spot',
-        time: '11:00',
-        notes: '📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list LIT for spot tradingDetail:  at: 2026-01-15T11:00:44Z **  OKX LISTING:#OKX 重要通知 OKX 将 LIT 上市进',
-    },
-    {
-        date: '2026-01-15',
-        token: 'USDE',
-        token_display: 'USDE',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '18:00',
-        notes: '📢 **Bithumb LISTING:유에스디이(USDE) 원화마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:为庆祝 USDE 上线韩元市场，将举办空投活动  ---------- 🔗 [查看来源](https://feed.bithumb.com/notice/1',
-    },
-    {
-        date: '2026-01-15',
-        token: 'LIT',
-        token_display: 'Lighter (LIT)',
-        exchange: 'Bybit',
-        type: 'spot',
-        time: '18:03',
-        notes: '📢 **Bybit to List Lighter  (LIT) on Spot **  Bybit 将在现场列出打火机 (LIT)。  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/bybit-to-list-ligh',
-    },
-    {
-        date: '2026-01-15',
-        token: 'FOGO',
-        token_display: 'Fogo (FOGO)',
-        exchange: 'Binance',
-        type: 'spot',
-        time: '21:42',
-        notes: '📢 **Binance Will Add Fogo (FOGO) on Earn, Buy Crypto, Convert, Margin & Futures **  币安将在加密货币赚取、购买、转换、杠杆和期货交易中上线Fogo (FOGO)  ---------- 🔗 [查看来源](https:',
-    },
-    {
-        date: '2026-01-15',
-        token: 'FOGO',
-        token_display: 'FOGO (Fogo)',
-        exchange: 'Bybit',
-        type: 'spot',
-        time: '22:29',
-        notes: '📢 **BYBIT: 🔥 Listing of FOGO on Convert **  BYBIT: 🔥 FOGO 在 Convert 上的列表  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/-listing-of-f',
-    },
-    {
-        date: '2026-01-16',
-        token: 'SPORTFUN',
-        token_display: 'SPORTFUN',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '20:18',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined SPORTFUNUSDT and AIAUSDT Perpetual Contracts (2026-01-16) **  币安期货将推出以美元Ⓢ为保证金的SPORTFUNUSDT和AIAUSDT永续合约（2',
-    },
-    {
-        date: '2026-01-16',
-        token: 'AIA',
-        token_display: 'AI (AIA)',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '22:48',
-        notes: '📢 **Binance Futures Will Postpone the Launch of AIAUSDT Perpetual Contract **  币安期货将推迟AIAUSDT永续合约的上线  ---------- 🔗 [查看来源](https://www.treeofalpha.com/',
-    },
-    {
-        date: '2026-01-17',
-        token: 'FUN',
-        token_display: 'FUN',
-        exchange: 'OKX',
-        type: 'perp',
-        time: '02:30',
-        notes: '📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list perpetual futures for FUN cryptoDetail:  at: 2026-01-17T02:30:41Z **  OKX LISTING:#OKX 重要通知 O',
-    },
-    {
-        date: '2026-01-17',
-        token: 'SKR',
-        token_display: 'Seeker (SKR)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '10:45',
-        notes: '📢 **COINBASE LISTING: Assets added to the roadmap today: Seeker (SKR), FIGHT (FIGHT) **  COINBASE LISTING: 今天添加到产品路线图的资产：Seeker (SKR)、FIGHT (FIGHT)  -',
-    },
-    {
-        date: '2026-01-19',
-        token: 'SPORTFUN',
-        token_display: 'SPORTFUN',
-        exchange: 'Bybit',
-        type: 'perp',
-        time: '18:01',
-        notes: '📢 **BYBIT: New listing: SPORTFUNUSDT Perpetual Contract in Innovation Zone, with up to 20x leverage **  BYBIT: 新上线：SPORTFUNUSDT 永续合约，创新区，最高可达 20 倍杠杆  ',
-    },
-    {
-        date: '2026-01-20',
-        token: 'ELSA',
-        token_display: 'Elsa (ELSA)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '00:50',
-        pairs: 'ELSA/USD',
-        notes: '📢 **COINBASE LISTING: Spot trading for Elsa (ELSA) will go live on 20 January 2026. The opening of our ELSA-USD trading pair will begin later today if',
-    },
-    {
-        date: '2026-01-20',
-        token: 'SKR',
-        token_display: 'Seeker (SKR)',
-        exchange: 'Bybit',
-        type: 'pre-market',
-        time: '11:30 UTC',
-        notes: '📢 **BYBIT: Listing of SKRUSDT on Bybit Perpetual Pre-Market on Jan 20, 2026, 11:30AM UTC **  BYBIT: SKRUSDT将于2026年1月20日上午11:30（UTC）在Bybit Perpetual盘前交',
-    },
-    {
-        date: '2026-01-20',
-        token: 'ELSA',
-        token_display: 'Elsa (ELSA)',
-        exchange: 'Bybit',
-        type: 'spot',
-        time: '17:28',
-        notes: '📢 **BYBIT: 🔥 Listing of ELSA on Convert & Bybit Savings **  BYBIT: 🔥 ELSA 已上线 Convert &amp; Bybit Savings  ---------- 🔗 [查看来源](https://announcements.b',
-    },
-    {
-        date: '2026-01-20',
-        token: 'AIA',
-        token_display: 'AI (AIA)',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '18:26',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined AIAUSDT Perpetual Contract (2026-01-20) **  币安期货将推出以美元Ⓢ为保证金的AIAUSDT永续合约（2026年1月20日）  ---------- 🔗 [查看来源]',
-    },
-    {
-        date: '2026-01-21',
-        token: 'SKR',
-        token_display: 'Seeker (SKR)',
-        exchange: 'Bybit',
-        type: 'spot',
-        time: '10:52',
-        notes: '📢 **BYBIT: 🔥 Listing of SKR on Convert **  BYBIT: 🔥 SKR 在 Convert 上架  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/-listing-of-skr-o',
-    },
-    {
-        date: '2026-01-21',
-        token: 'RL',
-        token_display: 'RL',
-        exchange: 'Binance',
-        type: 'spot',
-        time: '16:30',
-        notes: '📢 **Binance Will List Ripple USD (RLUSD) and Introduce RLUSD Zero Trading Fee Promotion **  币安将上线瑞波币美元（RLUSD）并推出RLUSD零交易费优惠活动  ---------- 🔗 [查看来源](htt',
-    },
-    {
-        date: '2026-01-21',
-        token: 'IMU',
-        token_display: 'Token (IMU)',
-        exchange: 'Bybit',
-        type: 'spot',
-        time: '18:02',
-        notes: '📢 **Bybit to List  Immunefi Token (IMU) on Spot **  Bybit 将在现货市场上线 Immunefi 代币 (IMU)。  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/',
-    },
-    {
-        date: '2026-01-21',
-        token: 'ACU',
-        token_display: 'ACU',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '19:17',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined ACUUSDT and 我踏马来了USDT Perpetual Contracts (2026-01-21) **  币安合约上线USDⓈ本位ACUUSDT和我踩马来了USDT永续合约 (2026-01-21',
-    },
-    {
-        date: '2026-01-21',
-        token: 'SKR',
-        token_display: 'Seeker (SKR)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '22:29',
-        pairs: 'SKR/USD',
-        notes: '📢 **COINBASE LISTING: Spot trading for Seeker (SKR) will go live on 21 January 2026. The opening of our SKR-USD trading pair will begin later today if',
-    },
-    {
-        date: '2026-01-22',
-        token: 'SRK',
-        token_display: 'Seeker (SRK)',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '11:16',
-        notes: '📢 **Bithumb LISTING:시커(SRK) 원화 마켓 추가 **  Bithumb LISTING:Seeker (SRK) 已加入韩元市场  ---------- 🔗 [查看来源](https://feed.bithumb.com/notice/1651624) 🕒 __2026-0',
-    },
-    {
-        date: '2026-01-22',
-        token: 'SENT',
-        token_display: 'Sentient (SENT)',
-        exchange: 'Bybit',
-        type: 'spot',
-        time: '12:07',
-        notes: '📢 **Bybit to List Sentient (SENT)  on Spot **  Bybit 现场列出 Sentient (SENT)  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/bybit-to-lis',
-    },
-    {
-        date: '2026-01-22',
-        token: 'ELSA',
-        token_display: 'Elsa (ELSA)',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '13:30',
-        notes: '📢 **UPBIT LISTING:[거래] 헤이엘사(ELSA) 신규 거래지원 안내 (KRW, BTC, USDT 마켓) **  UPBIT LISTING:【交易】新增ELSA交易支持（韩元、比特币、USDT交易对）  ---------- 🔗 [查看来源](https://upbit.c',
-    },
-    {
-        date: '2026-01-22',
-        token: 'ELSA',
-        token_display: 'Elsa (ELSA)',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '14:47',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined ELSAUSDT Perpetual Contract (2026-01-22) **  币安期货将推出以美元Ⓢ计价的ELSAUSDT永续合约（2026年1月22日）  ---------- 🔗 [查看来源]',
-    },
-    {
-        date: '2026-01-22',
-        token: 'SENT',
-        token_display: 'Sentient (SENT)',
-        exchange: 'Binance',
-        type: 'spot',
-        time: '19:29',
-        notes: '📢 **Binance: Sentient (SENT) Listing Will Be Postponed **  Binance: Sentient (SENT) 名单将延期公布  ---------- 🔗 [查看来源](https://www.treeofalpha.com/preview_a',
-    },
-    {
-        date: '2026-01-22',
-        token: 'SKR',
-        token_display: 'Seeker (SKR)',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '19:46',
-        notes: '📢 **Bithumb LISTING:시커(SKR) 원화마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:为庆祝 Seeker (SKR) 上线韩元市场，我们将举办空投活动  ---------- 🔗 [查看来源](https://feed.bithumb.com/no',
-    },
-    {
-        date: '2026-01-22',
-        token: 'FIGHT',
-        token_display: 'FIGHT',
-        exchange: 'Bybit',
-        type: 'spot',
-        time: '21:31',
-        notes: '📢 **BYBIT: 🔥 Listing of FIGHT on Convert **  BYBIT: 🔥 正在 Convert 上列出 FIGHT  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/-listing-of',
-    },
-    {
-        date: '2026-01-22',
-        token: 'IMU',
-        token_display: 'ImmuneFi (IMU)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '22:18',
-        pairs: 'IMU/USD',
-        notes: '📢 **COINBASE LISTING: Spot trading for ImmuneFi (IMU) will go live on 22 January 2026. The opening of our IMU-USD trading pair will begin later today ',
-    },
-    {
-        date: '2026-01-22',
-        token: 'IMU',
-        token_display: 'ImmuneFi (IMU)',
-        exchange: 'Bybit',
-        type: 'spot',
-        time: '22:21',
-        notes: '📢 **BYBIT: 🔥 Listing of IMU on Convert & Bybit Savings **  BYBIT: 🔥 IMU 在 Convert &amp; Bybit Savings 上的列表  ---------- 🔗 [查看来源](https://announcements.',
-    },
-    {
-        date: '2026-01-22',
-        token: 'SENT',
-        token_display: 'Sentient (SENT)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '22:38',
-        pairs: 'SENT/USD',
-        notes: '📢 **COINBASE LISTING: Spot trading for FIGHT (FIGHT) and Sentient (SENT) will go live on 22 January 2026. The opening of our FIGHT-USD and SENT-USD tr',
-    },
-    {
-        date: '2026-01-23',
-        token: 'ACU',
-        token_display: 'ACU',
-        exchange: 'OKX',
-        type: 'perp',
-        time: '06:00',
-        notes: '📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list perpetual futures for ACU cryptoDetail:  at: 2026-01-23T06:00:45Z **  OKX LISTING:#OKX 重要通知 O',
-    },
-    {
-        date: '2026-01-23',
-        token: 'SPACE',
-        token_display: 'SPACE (Spacecoin)',
-        exchange: 'OKX',
-        type: 'spot',
-        time: '08:00',
-        notes: '📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list SPACE (Spacecoin) for spot tradingDetail:  at: 2026-01-23T08:00:29Z **  OKX LISTING:#OKX 重要通知',
-    },
-    {
-        date: '2026-01-23',
-        token: 'ACU',
-        token_display: 'ACU',
-        exchange: 'Bybit',
-        type: 'perp',
-        time: '16:24',
-        notes: '📢 **BYBIT: New listing: ACUUSDT Perpetual Contract in Innovation Zone, with up to 12.5x leverage **  BYBIT: 新品上线：ACUUSDT 永续合约，创新板块，最高可达 12.5 倍杠杆  ----',
-    },
-    {
-        date: '2026-01-23',
-        token: 'FIGHT',
-        token_display: 'FIGHT',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '18:16',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined SPACEUSDT and FIGHTUSDT Perpetual Contracts (2026-01-23) **  币安期货将推出以美元Ⓢ为保证金的SPACEUSDT和FIGHTUSDT永续合约（202',
-    },
-    {
-        date: '2026-01-24',
-        token: 'DOOD',
-        token_display: 'Doodles (DOOD)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '07:21',
-        notes: '📢 **COINBASE LISTING: Assets added to the roadmap today: Doodles (DOOD), Moonbirds (BIRB) **  COINBASE LISTING: 今天添加到产品路线图的资产：涂鸦（DOOD）、月鸟（BIRB）  -----',
-    },
-    {
-        date: '2026-01-24',
-        token: 'BIRB',
-        token_display: 'Moonbirds (BIRB)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '07:21',
-        notes: '📢 **COINBASE LISTING: Assets added to the roadmap today: Doodles (DOOD), Moonbirds (BIRB) **  COINBASE LISTING: 今天添加到产品路线图的资产：涂鸦（DOOD）、月鸟（BIRB）  -----',
-    },
-    {
-        date: '2026-01-26',
-        token: 'PYBOBO',
-        token_display: 'Capybobo (PYBOBO)',
-        exchange: 'Bybit',
-        type: 'spot',
-        time: '12:01',
-        notes: '📢 **Bybit to List Capybobo (PYBOBO) on Spot **  Bybit 将在现货市场上市 Capybobo (PYBOBO)。  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/bybi',
-    },
-    {
-        date: '2026-01-26',
-        token: 'SXP',
-        token_display: 'Solar (SXP)',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '19:00',
-        notes: '📢 **UPBIT LISTING:[거래] 솔라(SXP) 거래 유의 종목 지정 안내 **  UPBIT LISTING:【交易】关于指定 Solar (SXP) 为交易警示股票的通知  ---------- 🔗 [查看来源](https://upbit.com/service_center/',
-    },
-    {
-        date: '2026-01-27',
-        token: 'SENT',
-        token_display: 'SENT (Sentient)',
-        exchange: 'OKX',
-        type: 'spot',
-        time: '06:00',
-        notes: '📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list SENT (Sentient) for spot tradingDetail:  at: 2026-01-27T06:00:40Z **  OKX LISTING:#OKX 重要通知 O',
-    },
-    {
-        date: '2026-01-27',
-        token: 'USAT',
-        token_display: 'USAT',
-        exchange: 'OKX',
-        type: 'spot',
-        time: '13:00',
-        notes: '📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list USAT for spot tradingDetail:  at: 2026-01-27T13:00:19Z **  OKX LISTING:#OKX 重要通知 OKX 将上线 USAT',
-    },
-    {
-        date: '2026-01-27',
-        token: 'TRIA',
-        token_display: 'Tria (TRIA)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '23:08',
-        notes: '📢 **COINBASE LISTING: Assets added to the roadmap today: Tria (TRIA) and Zama (ZAMA) **  COINBASE LISTING: 今天添加到产品路线图的资产：Tria (TRIA) 和 Zama (ZAMA)  --',
-    },
-    {
-        date: '2026-01-27',
-        token: 'ZAMA',
-        token_display: 'Zama (ZAMA)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '23:08',
-        notes: '📢 **COINBASE LISTING: Assets added to the roadmap today: Tria (TRIA) and Zama (ZAMA) **  COINBASE LISTING: 今天添加到产品路线图的资产：Tria (TRIA) 和 Zama (ZAMA)  --',
-    },
-    {
-        date: '2026-01-28',
-        token: 'XAG',
-        token_display: 'XAG',
-        exchange: 'OKX',
-        type: 'perp',
-        time: '06:00',
-        notes: '📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list perpetual futures for XAG cryptoDetail:  at: 2026-01-28T06:00:33Z **  OKX LISTING:#OKX 重要通知 O',
-    },
-    {
-        date: '2026-01-28',
-        token: 'DOGE',
-        token_display: 'DOGE',
-        exchange: 'OKX',
-        type: 'perp',
-        time: '07:00',
-        notes: '📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list perpetual futures for DOGE, PEPE, PUMP, SUI, XRP USDⓈ UM cryptoDetail:  at: 2026-01-28T07:00:',
-    },
-    {
-        date: '2026-01-28',
-        token: 'PEPE',
-        token_display: 'PEPE',
-        exchange: 'OKX',
-        type: 'perp',
-        time: '07:00',
-        notes: '📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list perpetual futures for DOGE, PEPE, PUMP, SUI, XRP USDⓈ UM cryptoDetail:  at: 2026-01-28T07:00:',
-    },
-    {
-        date: '2026-01-28',
-        token: 'PUMP',
-        token_display: 'PUMP (Pump)',
-        exchange: 'OKX',
-        type: 'perp',
-        time: '07:00',
-        notes: '📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list perpetual futures for DOGE, PEPE, PUMP, SUI, XRP USDⓈ UM cryptoDetail:  at: 2026-01-28T07:00:',
-    },
-    {
-        date: '2026-01-28',
-        token: 'SUI',
-        token_display: 'SUI',
-        exchange: 'OKX',
-        type: 'perp',
-        time: '07:00',
-        notes: '📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list perpetual futures for DOGE, PEPE, PUMP, SUI, XRP USDⓈ UM cryptoDetail:  at: 2026-01-28T07:00:',
-    },
-    {
-        date: '2026-01-28',
-        token: 'XRP',
-        token_display: 'XRP',
-        exchange: 'OKX',
-        type: 'perp',
-        time: '07:00',
-        notes: '📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list perpetual futures for DOGE, PEPE, PUMP, SUI, XRP USDⓈ UM cryptoDetail:  at: 2026-01-28T07:00:',
-    },
-    {
-        date: '2026-01-28',
-        token: 'BIRB',
-        token_display: 'Moonbirds (BIRB)',
-        exchange: 'Bybit',
-        type: 'spot',
-        time: '12:16',
-        notes: '📢 **Bybit to List Moonbirds (BIRB) on Spot **  Bybit 将现场列出月鸟 (BIRB)。  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/bybit-to-list-moo',
-    },
-    {
-        date: '2026-01-28',
-        token: 'RIVN',
-        token_display: 'RIVN',
-        exchange: 'Bybit',
-        type: 'spot',
-        time: '19:00',
-        notes: '📢 **BYBIT: New listing: ASML,LRCX,RIVN are now live on Bybit TradFi! **  BYBIT: 最新上架：ASML、LRCX、RIVN 现已在 Bybit TradFi 上线！  ---------- 🔗 [查看来源](https://',
-    },
-    {
-        date: '2026-01-28',
-        token: 'TSLA',
-        token_display: 'TSLA',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '19:29',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined TSLAUSDT Equity Perpetual Contract (2026-01-28) **  币安期货将推出以美元计价的TSLAUSDT股票永续合约（2026年1月28日）  ---------- ',
-    },
-    {
-        date: '2026-01-28',
-        token: 'BIRB',
-        token_display: 'Moonbirds (BIRB)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '22:05',
-        pairs: 'BIRB/USD',
-        notes: '📢 **COINBASE LISTING: Spot trading for Moonbirds (BIRB) will go live on 28 January 2026. The opening of our BIRB-USD trading pair will begin later tod',
-    },
-    {
-        date: '2026-01-29',
-        token: 'INX',
-        token_display: 'Infinex (INX)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '00:58',
-        notes: '📢 **COINBASE LISTING: Assets added to the roadmap today: Infinex (INX) **  COINBASE LISTING: 今天新增至投资路线图的资产：Infinex (INX)  ---------- 🔗 [查看来源](https://',
-    },
-    {
-        date: '2026-01-29',
-        token: 'LTC',
-        token_display: 'LTC',
-        exchange: 'OKX',
-        type: 'perp',
-        time: '05:00',
-        notes: '📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list perpetual futures for LTCUSDⓈ UM and LTCUSDⓈ UM PerpetualDetail:  at: 2026-01-29T05:00:29Z **',
-    },
-    {
-        date: '2026-01-29',
-        token: 'HYPE',
-        token_display: 'HYPERLIQUID (HYPE)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '06:36',
-        notes: '📢 **AggrNews(No accuracy guaranteed):HYPERLIQUID (HYPE) ADDED TO COINBASE\',
-    },
-    {
-        date: '2026-01-29',
-        token: 'HYPE',
-        token_display: 'HYPERLIQUID (HYPE)',
-        exchange: 'Hyperliquid',
-        type: 'spot',
-        time: '06:36',
-        notes: '📢 **AggrNews(No accuracy guaranteed):HYPERLIQUID (HYPE) ADDED TO COINBASE\',
-    },
-    {
-        date: '2026-01-29',
-        token: 'BIRD',
-        token_display: 'BIRD',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '11:29',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined BIRDUSDT and GWEIUSDT Perpetual Contracts (2026-01-29) **  币安期货将推出以美元计价的BIRDUSDT和GWEIUSDT永续合约（2026年1月29日',
-    },
-    {
-        date: '2026-01-29',
-        token: 'GWEI',
-        token_display: 'ETHGas (GWEI)',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '11:29',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined BIRDUSDT and GWEIUSDT Perpetual Contracts (2026-01-29) **  币安期货将推出以美元计价的BIRDUSDT和GWEIUSDT永续合约（2026年1月29日',
-    },
-    {
-        date: '2026-01-29',
-        token: 'SENT',
-        token_display: 'Sentient (SENT)',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '14:15',
-        notes: '📢 **UPBIT LISTING:[Trade] Market Support for Sentient(SENT) (KRW, BTC, USDT Market) **  UPBIT LISTING:【交易】Sentient(SENT) 的市场支持（韩元、比特币、USDT 市场）  ------',
-    },
-    {
-        date: '2026-01-29',
-        token: 'SENT',
-        token_display: 'Sentient (SENT)',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '15:45',
-        notes: '📢 **Bithumb LISTING:센티언트(SENT) 원화마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:Sentient (SENT) 韩元市场新增纪念空投活动  ---------- 🔗 [查看来源](https://feed.bithumb.com/noti',
-    },
-    {
-        date: '2026-01-29',
-        token: 'ELSA',
-        token_display: 'Elsa (ELSA)',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '16:00',
-        notes: '📢 **Bithumb LISTING:[이벤트] 헤이엘사(ELSA) 원화마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:【活动】空投活动庆祝ELSA上线韩元市场  ---------- 🔗 [查看来源](https://feed.bithumb.com/notice',
-    },
-    {
-        date: '2026-01-29',
-        token: 'INX',
-        token_display: 'Infinex (INX)',
-        exchange: 'Bybit',
-        type: 'pre-market',
-        time: '9:30 UTC',
-        notes: '📢 **BYBIT: Listing of INXUSDT on Bybit Perpetual Pre-Market on Jan 29, 2026, 9:30AM UTC **  BYBIT: INXUSDT将于2026年1月29日上午9:30（UTC）在Bybit Perpetual盘前交易平',
-    },
-    {
-        date: '2026-01-30',
-        token: 'INX',
-        token_display: 'Infinex (INX)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '01:51',
-        pairs: 'INX/USD',
-        notes: '📢 **COINBASE LISTING: Spot trading for Infinex (INX) will go live on 30 January 2026. The opening of our INX-USD trading pair will begin later today i',
-    },
-    {
-        date: '2026-01-30',
-        token: 'ZAMA',
-        token_display: 'ZAMA (Zama)',
-        exchange: 'OKX',
-        type: 'spot',
-        time: '13:00',
-        notes: '📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list ZAMA for spot tradingDetail:  at: 2026-01-30T13:00:30Z **  OKX LISTING:#OKX 重要通知 OKX 将上线 ZAMA',
-    },
-    {
-        date: '2026-01-30',
-        token: 'XPT',
-        token_display: 'XPT',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '13:16',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined XPTUSDT and XPDUSDT Perpetual Contracts (2026-01-30) **  币安期货将推出以美元Ⓢ为保证金的XPTUSDT和XPDUSDT永续合约（2026年1月30日）',
-    },
-    {
-        date: '2026-01-30',
-        token: 'XPD',
-        token_display: 'XPD',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '13:16',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined XPTUSDT and XPDUSDT Perpetual Contracts (2026-01-30) **  币安期货将推出以美元Ⓢ为保证金的XPTUSDT和XPDUSDT永续合约（2026年1月30日）',
-    },
-    {
-        date: '2026-01-30',
-        token: 'ELON',
-        token_display: 'Echelon (ELON)',
-        exchange: 'Bybit',
-        type: 'spot',
-        time: '18:04',
-        notes: '📢 **Bybit to List Echelon (ELON) on Spot **  Bybit 将 Echelon (ELON) 现货上市  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/bybit-to-list',
-    },
-    {
-        date: '2026-01-30',
-        token: 'MEGA',
-        token_display: 'MegaETH (MEGA)',
-        exchange: 'Binance',
-        type: 'pre-market',
-        time: '18:36',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined MEGAUSDT Perpetual Contract Pre-Market Trading (2026-01-30) **  币安期货将于2026年1月30日推出以美元Ⓢ为保证金的MEGAUSDT永续合约盘',
-    },
-    {
-        date: '2026-01-30',
-        token: 'ZAMA',
-        token_display: 'ZAMA (Zama)',
-        exchange: 'OKX',
-        type: 'pre-market',
-        time: '21:00',
-        notes: '📢 **OKX LISTING:OKX to list ZAMA (Zama) for spot trading and convert pre-market futures to standard perpetual futures **  OKX LISTING:OKX将ZAMA（Zama）上市',
-    },
-    {
-        date: '2026-01-31',
-        token: 'XPD',
-        token_display: 'XPD',
-        exchange: 'OKX',
-        type: 'perp',
-        time: '13:00',
-        notes: '📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list perpetual futures for XPD and XPT cryptoDetail:  at: 2026-01-31T13:00:53Z **  OKX LISTING:#OK',
-    },
-    {
-        date: '2026-01-31',
-        token: 'PENGUIN',
-        token_display: 'Penguin (PENGUIN)',
-        exchange: 'Bybit',
-        type: 'spot',
-        time: '20:01',
-        notes: '📢 **Bybit to List Nietzschean Penguin  (PENGUIN) on Spot **  Bybit 将把尼采企鹅 (PENGUIN) 列入现货交易清单  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/a',
-    },
-    {
-        date: '2026-02-01',
-        token: 'PENGUIN',
-        token_display: 'Penguin (PENGUIN)',
-        exchange: 'Bybit',
-        type: 'spot',
-        time: '03:10',
-        notes: '📢 **BYBIT: 🔥 Listing of PENGUIN on Convert **  BYBIT: 🔥 企鹅在 Convert 上的上市  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/-listing-of-p',
-    },
-    {
-        date: '2026-02-02',
-        token: 'ZAMA',
-        token_display: 'Zama (ZAMA)',
-        exchange: 'Binance',
-        type: 'spot',
-        time: '12:28',
-        notes: '📢 **Binance Will List Zama (ZAMA) with Seed Tag Applied **  币安将上线 Zama (ZAMA)，并应用种子标签。  ---------- 🔗 [查看来源](https://www.treeofalpha.com/preview_articl',
-    },
-    {
-        date: '2026-02-02',
-        token: 'INTC',
-        token_display: 'INTC',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '16:47',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined INTCUSDT and HOODUSDT Equity Perpetual Contracts (2026-02-02) **  币安期货将推出以美元Ⓢ为保证金的INTCUSDT和HOODUSDT股票永续合',
-    },
-    {
-        date: '2026-02-02',
-        token: 'HOOD',
-        token_display: 'HOOD',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '16:47',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined INTCUSDT and HOODUSDT Equity Perpetual Contracts (2026-02-02) **  币安期货将推出以美元Ⓢ为保证金的INTCUSDT和HOODUSDT股票永续合',
-    },
-    {
-        date: '2026-02-02',
-        token: 'ZAMA',
-        token_display: 'ZAMA (Zama)',
-        exchange: 'Bybit',
-        type: 'spot',
-        time: '21:30',
-        notes: '📢 **BYBIT: 🔥 Listing of ZAMA on Convert **  BYBIT: 🔥 ZAMA 在 Convert 上架  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/-listing-of-zam',
-    },
-    {
-        date: '2026-02-02',
-        token: 'ELON',
-        token_display: 'Echelon (ELON)',
-        exchange: 'Bybit',
-        type: 'spot',
-        time: '22:01',
-        notes: '📢 **BYBIT: 🔥 Listing of ELON on Convert & Bybit Savings **  BYBIT: 🔥 ELON 已上线 Convert &amp; Bybit Savings  ---------- 🔗 [查看来源](https://announcements.b',
-    },
-    {
-        date: '2026-02-02',
-        token: 'ZAMA',
-        token_display: 'Zama (ZAMA)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '23:03',
-        pairs: 'ZAMA/USD',
-        notes: '📢 **COINBASE LISTING: Spot trading for Zama (ZAMA) will go live on 2 February 2026. The opening of our ZAMA-USD trading pair will begin later today if',
-    },
-    {
-        date: '2026-02-03',
-        token: 'DEEP',
-        token_display: 'DeepBook (DEEP)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '07:20',
-        notes: '📢 **COINBASE LISTING: Assets added to the roadmap today: DeepBook (DEEP) and Walrus (WAL) **  COINBASE LISTING: 今天添加到产品路线图的资产包括：DeepBook (DEEP) 和 Walr',
-    },
-    {
-        date: '2026-02-03',
-        token: 'WAL',
-        token_display: 'Walrus (WAL)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '07:20',
-        notes: '📢 **COINBASE LISTING: Assets added to the roadmap today: DeepBook (DEEP) and Walrus (WAL) **  COINBASE LISTING: 今天添加到产品路线图的资产包括：DeepBook (DEEP) 和 Walr',
-    },
-    {
-        date: '2026-02-03',
-        token: 'BIRB',
-        token_display: 'Moonbird (BIRB)',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '15:00',
-        notes: '📢 **UPBIT LISTING:문버드(BIRB) 신규 거래지원 안내 (KRW, BTC, USDT 마켓) **  UPBIT LISTING:Moonbird (BIRB) 新交易支持公告（韩元、比特币、USDT 市场）  ---------- 🔗 [查看来源](https://upbi',
-    },
-    {
-        date: '2026-02-03',
-        token: 'BIRB',
-        token_display: 'Moonbird (BIRB)',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '16:11',
-        notes: '📢 **Bithumb LISTING:[이벤트] 문버드(BIRB) 원화마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:【活动】Moonbird (BIRB) 空投活动，庆祝上线韩元市场  ---------- 🔗 [查看来源](https://feed.bithum',
-    },
-    {
-        date: '2026-02-03',
-        token: 'TRIA',
-        token_display: 'Tria (TRIA)',
-        exchange: 'Bybit',
-        type: 'spot',
-        time: '18:32',
-        notes: '📢 **BYBIT: 🔥 Listing of TRIA on Convert **  BYBIT: 🔥 TRIA 在 Convert 上的上市  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/-listing-of-t',
-    },
-    {
-        date: '2026-02-03',
-        token: 'TRIA',
-        token_display: 'Tria (TRIA)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '22:08',
-        pairs: 'TRIA/USD',
-        notes: '📢 **COINBASE LISTING: Spot trading for Tria (TRIA) will go live on 3 February 2026. The opening of our TRIA-USD trading pair will begin later today if',
-    },
-    {
-        date: '2026-02-05',
-        token: 'DOOD',
-        token_display: 'Doodles (DOOD)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '00:50',
-        pairs: 'DOOD/USD',
-        notes: '📢 **COINBASE LISTING: Spot trading for Doodles (DOOD) will go live on 5 February 2026. The opening of our DOOD-USD trading pair will begin on or after',
-    },
-    {
-        date: '2026-02-05',
-        token: 'HYPE',
-        token_display: 'Hyperliquid (HYPE)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '00:53',
-        pairs: 'HYPE/USD',
-        notes: '📢 **COINBASE LISTING: Spot trading for Hyperliquid (HYPE) will go live on 5 February 2026. The opening of our HYPE-USD trading pair will begin later t',
-    },
-    {
-        date: '2026-02-05',
-        token: 'HYPE',
-        token_display: 'Hyperliquid (HYPE)',
-        exchange: 'Hyperliquid',
-        type: 'spot',
-        time: '00:53',
-        pairs: 'HYPE/USD',
-        notes: '📢 **COINBASE LISTING: Spot trading for Hyperliquid (HYPE) will go live on 5 February 2026. The opening of our HYPE-USD trading pair will begin later t',
-    },
-    {
-        date: '2026-02-05',
-        token: 'RNBW',
-        token_display: 'Rainbow (RNBW)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '01:35',
-        pairs: 'RNBW/USD',
-        notes: '📢 **COINBASE LISTING: Spot trading for Rainbow (RNBW) will go live on 5 February 2026. The opening of our RNBW-USD trading pair will begin later today',
-    },
-    {
-        date: '2026-02-05',
-        token: 'RAVE',
-        token_display: 'RaveDAO (RAVE)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '03:35',
-        notes: '📢 **COINBASE LISTING: Assets added to the roadmap today: Rainbow (RNBW) and RaveDAO (RAVE) **  COINBASE LISTING: 今天添加到产品路线图的资产包括：Rainbow (RNBW) 和 Rave',
-    },
-    {
-        date: '2026-02-05',
-        token: 'TRIA',
-        token_display: 'Tria (TRIA)',
-        exchange: 'OKX',
-        type: 'perp',
-        time: '06:00',
-        notes: '📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list perpetual futures for TRIA cryptoDetail:  at: 2026-02-05T06:00:59Z **  OKX LISTING:#OKX 重要通知 ',
-    },
-    {
-        date: '2026-02-05',
-        token: 'AZTEC',
-        token_display: 'Aztec (AZTEC)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '06:09',
-        notes: '📢 **COINBASE LISTING: Assets added to the roadmap today: Aztec (AZTEC) and Espresso (ESP) **  COINBASE LISTING: 今天添加到产品路线图的资产：Aztec (AZTEC) 和 Espresso',
-    },
-    {
-        date: '2026-02-05',
-        token: 'ESP',
-        token_display: 'Espresso (ESP)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '06:09',
-        notes: '📢 **COINBASE LISTING: Assets added to the roadmap today: Aztec (AZTEC) and Espresso (ESP) **  COINBASE LISTING: 今天添加到产品路线图的资产：Aztec (AZTEC) 和 Espresso',
-    },
-    {
-        date: '2026-02-05',
-        token: 'LITE',
-        token_display: 'LITE',
-        exchange: 'Bybit',
-        type: 'spot',
-        time: '18:01',
-        notes: '📢 **BYBIT: New listing: MU,COHR,LITE are now live on Bybit TradFi! **  BYBIT: 最新房源：MU、COHR、LITE 现已在 Bybit TradFi 上线！  ---------- 🔗 [查看来源](https://anno',
-    },
-    {
-        date: '2026-02-05',
-        token: 'TRIA',
-        token_display: 'Tria (TRIA)',
-        exchange: 'Bybit',
-        type: 'perp',
-        time: '18:31',
-        notes: '📢 **BYBIT: New listing: TRIAUSDT Perpetual Contract in Innovation Zone, with up to 25x leverage **  BYBIT: 新上线：TRIAUSDT 永续合约，创新区，最高可达 25 倍杠杆  --------',
-    },
-    {
-        date: '2026-02-07',
-        token: 'UP',
-        token_display: 'Superform (UP)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '05:02',
-        notes: '📢 **COINBASE LISTING: Assets added to the roadmap today: Superform (UP) **  COINBASE LISTING: 今天添加到产品路线图的资产：Superform（UP）  ---------- 🔗 [查看来源](https:/',
-    },
-    {
-        date: '2026-02-10',
-        token: 'DENT',
-        token_display: 'DENT',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '04:30',
-        notes: '📢 **UPBIT LISTING:[거래] 덴트(DENT) 거래 유의 종목 지정 안내 **  UPBIT LISTING:【交易】关于指定DENT为交易警示股的通知  ---------- 🕒 __2026-02-10 04:30:04__',
-    },
-    {
-        date: '2026-02-10',
-        token: 'ESP',
-        token_display: 'Espresso (ESP)',
-        exchange: 'Binance',
-        type: 'pre-market',
-        time: '08:00',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined ESPUSDT Perpetual Contract Pre-Market Trading (2026-02-10) **  币安期货将于2026年2月10日推出以美元计价的ESPUSDT永续合约盘前交易。 ',
-    },
-    {
-        date: '2026-02-10',
-        token: 'OAS',
-        token_display: 'OAS',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '15:00',
-        notes: '📢 **UPBIT LISTING:[거래] 오아시스(OAS) 거래지원 종료 안내 (3/13 15:00) **  UPBIT LISTING:【交易】绿洲（OAS）交易支持终止通知（3月13日下午3:00）  ---------- 🕒 __2026-02-10 07:30:23__',
-    },
-    {
-        date: '2026-02-10',
-        token: 'SXP',
-        token_display: 'Solar (SXP)',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '15:00',
-        notes: '📢 **UPBIT LISTING:[거래] 솔라(SXP) 거래지원 종료 안내 (3/13 15:00) **  UPBIT LISTING:【交易】太阳能（SXP）交易支持终止通知（3月13日下午3:00）  ---------- 🕒 __2026-02-10 07:00:03__',
-    },
-    {
-        date: '2026-02-10',
-        token: 'ESP',
-        token_display: 'ESP (Espresso)',
-        exchange: 'OKX',
-        type: 'pre-market',
-        time: '15:01',
-        notes: '📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list pre-market perpetual futures for ESP (Espresso) cryptoDetail:  at: 2026-02-10T15:01:15Z **  O',
-    },
-    {
-        date: '2026-02-10',
-        token: 'UP',
-        token_display: 'Superform (UP)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '17:03',
-        pairs: 'UP/USD',
-        notes: '📢 **COINBASE LISTING: Spot trading for Superform (UP) will go live on 10 February 2026. The opening of our UP-USD trading pair will begin later today ',
-    },
-    {
-        date: '2026-02-10',
-        token: 'OPN',
-        token_display: 'OPINION (OPN)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '23:08',
-        notes: '📢 **COINBASE LISTING: Assets added to the roadmap today: OPINION (OPN) **  COINBASE LISTING: 今天添加到路线图中的资产：观点（OPN）  ---------- 🔗 [查看来源](https://twitter',
-    },
-    {
-        date: '2026-02-11',
-        token: 'GWEI',
-        token_display: 'ETHGas (GWEI)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '00:31',
-        notes: '📢 **COINBASE LISTING: Assets added to the roadmap today: ETHGas (GWEI) **  COINBASE LISTING: 今天添加到路线图的资产：ETHGas (GWEI)  ---------- 🔗 [查看来源](https://tw',
-    },
-    {
-        date: '2026-02-11',
-        token: 'RAVE',
-        token_display: 'RaveDAO (RAVE)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '16:51',
-        pairs: 'RAVE/USD',
-        notes: '📢 **COINBASE LISTING: Spot trading for RaveDAO (RAVE), DeepBook (DEEP), and Walrus (WAL) will go live on 11 February 2026. The opening of our RAVE-USD',
-    },
-    {
-        date: '2026-02-11',
-        token: 'DEEP',
-        token_display: 'DeepBook (DEEP)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '16:51',
-        pairs: 'DEEP/USD',
-        notes: '📢 **COINBASE LISTING: Spot trading for RaveDAO (RAVE), DeepBook (DEEP), and Walrus (WAL) will go live on 11 February 2026. The opening of our RAVE-USD',
-    },
-    {
-        date: '2026-02-11',
-        token: 'WAL',
-        token_display: 'Walrus (WAL)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '16:51',
-        pairs: 'WAL/USD',
-        notes: '📢 **COINBASE LISTING: Spot trading for RaveDAO (RAVE), DeepBook (DEEP), and Walrus (WAL) will go live on 11 February 2026. The opening of our RAVE-USD',
-    },
-    {
-        date: '2026-02-12',
-        token: 'CC',
-        token_display: 'CC (Canton)',
-        exchange: 'OKX',
-        type: 'spot',
-        time: '03:01',
-        notes: '📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list CC (Canton) for spot tradingDetail:  at: 2026-02-12T03:01:09Z **  OKX LISTING:#OKX 重要通知 OKX 将',
-    },
-    {
-        date: '2026-02-12',
-        token: 'NOM',
-        token_display: 'Nomina (NOM)',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '07:00',
-        notes: '📢 **UPBIT LISTING:[거래] 노미나(NOM) 거래 유의 종목 지정 안내 **  UPBIT LISTING:【交易】关于指定Nomina（NOM）为交易警示股票的通知  ---------- 🕒 __2026-02-12 07:00:35__',
-    },
-    {
-        date: '2026-02-12',
-        token: 'ESP',
-        token_display: 'Espresso (ESP)',
-        exchange: 'Binance',
-        type: 'spot',
-        time: '07:28',
-        notes: '📢 **Binance Will List Espresso (ESP) with Seed Tag Applied **  币安将上线 Espresso (ESP)，并应用种子标签。  ---------- 🔗 [查看来源](https://www.treeofalpha.com/preview_',
-    },
-    {
-        date: '2026-02-12',
-        token: 'AZTEC',
-        token_display: 'Aztec (AZTEC)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '13:03',
-        pairs: 'AZTEC/USD',
-        notes: '📢 **COINBASE LISTING: Spot trading for Aztec (AZTEC) and Espresso (ESP) will go live on 12 February 2026. The opening of our AZTEC-USD and ESP-USD tra',
-    },
-    {
-        date: '2026-02-12',
-        token: 'ESP',
-        token_display: 'Espresso (ESP)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '13:03',
-        pairs: 'ESP/USD',
-        notes: '📢 **COINBASE LISTING: Spot trading for Aztec (AZTEC) and Espresso (ESP) will go live on 12 February 2026. The opening of our AZTEC-USD and ESP-USD tra',
-    },
-    {
-        date: '2026-02-13',
-        token: 'LRC',
-        token_display: 'Loopring (LRC)',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '15:00',
-        notes: '📢 **UPBIT LISTING:[거래] 루프링(LRC) 거래지원 종료 안내 (3/16 15:00) **  UPBIT LISTING:【交易】Loopring (LRC) 交易支持终止通知（3月16日下午3:00）  ---------- 🕒 __2026-02-13 05:00:03',
-    },
-    {
-        date: '2026-02-16',
-        token: 'TAO',
-        token_display: 'BitTensor (TAO)',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '05:00',
-        notes: '📢 **UPBIT LISTING:비트텐서(TAO) 신규 거래지원 안내 (KRW, BTC, USDT 마켓) **  UPBIT LISTING:BitTensor (TAO) 新交易支持公告（韩元、比特币、USDT 市场）  ---------- 🕒 __2026-02-16 05:00:',
-    },
-    {
-        date: '2026-02-16',
-        token: 'LIT',
-        token_display: 'LIT (Lighter)',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '07:18',
-        notes: '📢 **Bithumb LISTING:라이터(LIT) 원화 마켓 추가 **  Bithumb LISTING:新增韩元打火机（LIT）市场  ---------- 🔗 [查看来源](https://feed.bithumb.com/notice/1652015) 🕒 __2026-02-16 ',
-    },
-    {
-        date: '2026-02-20',
-        token: 'AZTEC',
-        token_display: 'Aztec (AZTEC)',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '05:00',
-        notes: '📢 **UPBIT LISTING:아즈텍(AZTEC) 신규 거래지원 안내 (KRW, BTC, USDT 마켓) **  UPBIT LISTING:Aztec (AZTEC) 新增交易支持（KRW、BTC、USDT 市场）  ---------- 🕒 __2026-02-20 05:00:0',
-    },
-    {
-        date: '2026-02-20',
-        token: 'AZTEC',
-        token_display: 'Aztec (AZTEC)',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '08:00',
-        notes: '📢 **Bithumb LISTING:[이벤트] 아즈텍(AZTEC) 원화마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:【活动】空投活动庆祝阿兹特克（AZTEC）加入韩元市场  ---------- 🔗 [查看来源](https://feed.bithumb.com',
-    },
-    {
-        date: '2026-02-20',
-        token: 'ROBO',
-        token_display: 'Token (ROBO)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '15:47',
-        notes: '📢 **COINBASE LISTING: Assets added to the roadmap today: Robo Token (ROBO) **  COINBASE LISTING: 今天添加到路线图的资产：Robo Token (ROBO)  ---------- 🔗 [查看来源](ht',
-    },
-    {
-        date: '2026-02-21',
-        token: 'OPN',
-        token_display: 'OPINION (OPN)',
-        exchange: 'Binance',
-        type: 'pre-market',
-        time: '14:41',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined OPNUSDT Perpetual Contract Pre-Market Trading (2026-02-21) **  币安期货将于2026年2月21日推出以美元Ⓢ为保证金的OPNUSDT永续合约盘前交',
-    },
-    {
-        date: '2026-02-23',
-        token: 'OPN',
-        token_display: 'OPN (Opinion)',
-        exchange: 'OKX',
-        type: 'pre-market',
-        time: '11:31',
-        notes: '📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list pre-market perpetual futures for OPN (Opinion) cryptoDetail:  at: 2026-02-23T11:31:31Z **  OK',
-    },
-    {
-        date: '2026-02-24',
-        token: 'SKR',
-        token_display: 'Seeker (SKR)',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '05:00',
-        notes: '📢 **UPBIT LISTING:시커(SKR) 신규 거래지원 안내 (KRW, BTC, USDT 마켓) **  UPBIT LISTING:Seeker (SKR) 新交易支持公告（韩元、比特币、USDT 市场）  ---------- 🕒 __2026-02-24 05:00:00__',
-    },
-    {
-        date: '2026-02-24',
-        token: 'ESP',
-        token_display: 'Espresso (ESP)',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '06:04',
-        notes: '📢 **UPBIT LISTING:[거래] 에스프레소(ESP) 신규 거래지원 안내 (KRW, BTC, USDT 마켓) **  UPBIT LISTING:【交易】新版 Espresso (ESP) 交易支持（韩元、比特币、USDT 交易对）  ---------- 🕒 __2026-02',
-    },
-    {
-        date: '2026-02-24',
-        token: 'ESP',
-        token_display: 'Espresso (ESP)',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '07:25',
-        notes: '📢 **Bithumb LISTING:에스프레소(ESP) 원화마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:为庆祝浓缩咖啡 (ESP) 进入韩元市场，我们将举办空投活动  ---------- 🔗 [查看来源](https://feed.bithumb.com/no',
-    },
-    {
-        date: '2026-02-24',
-        token: 'GPS',
-        token_display: 'GPS',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '08:05',
-        notes: '📢 **Bithumb LISTING:[이벤트] 고플러스(GPS) 원화마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:【活动】空投活动庆祝Goplus（GPS）Won Market上线  ---------- 🔗 [查看来源](https://feed.bithum',
-    },
-    {
-        date: '2026-02-24',
-        token: 'GWEI',
-        token_display: 'ETHGas (GWEI)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '16:49',
-        pairs: 'GWEI/USD',
-        notes: '📢 **COINBASE LISTING: Spot trading for ETHGas (GWEI) will go live on 24 February 2026. The opening of our GWEI-USD trading pair will begin on or after',
-    },
-    {
-        date: '2026-02-24',
-        token: 'CAD',
-        token_display: 'CAD',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '18:20',
-        notes: '📢 **COINBASE LISTING: Spot trading for USDC-AUD, USDC-SGD, and USDC-CAD will go live on 24 February 2026. The opening of our USDC-AUD, USDC-SGD, and U',
-    },
-    {
-        date: '2026-02-26',
-        token: 'CFG',
-        token_display: 'Sentryfuse (CFG)',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '03:00',
-        notes: '📢 **UPBIT LISTING:[거래] 센트리퓨즈(CFG) 신규 거래지원 안내 (KRW, BTC, USDT 마켓) **  UPBIT LISTING:【交易】Sentryfuse (CFG) 新增交易支持（KRW、BTC、USDT 市场）  ---------- 🕒 __2026-0',
-    },
-    {
-        date: '2026-02-26',
-        token: 'GWEI',
-        token_display: 'Ethergas (GWEI)',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '04:09',
-        notes: '📢 **Bithumb LISTING:이더가스(GWEI) 원화마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:Ethergas (GWEI) 韩元市场新增纪念空投活动  ---------- 🔗 [查看来源](https://feed.bithumb.com/noti',
-    },
-    {
-        date: '2026-02-26',
-        token: 'DENT',
-        token_display: 'DENT',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '15:00',
-        notes: '📢 **UPBIT LISTING:[거래] 덴트(DENT) 거래지원 종료 안내(3/30 15:00) **  UPBIT LISTING:【交易】DENT交易支持终止通知（3月30日下午3:00）  ---------- 🕒 __2026-02-26 06:00:05__',
-    },
-    {
-        date: '2026-02-27',
-        token: 'ROBO',
-        token_display: 'Token (ROBO)',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '08:00',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined ROBOUSDT Perpetual Contract (2026-02-27) **  币安期货将推出以美元Ⓢ为保证金的ROBOUSDT永续合约（2026年2月27日）  ---------- 🔗 [查看来',
-    },
-    {
-        date: '2026-02-27',
-        token: 'TWAP',
-        token_display: 'TWAP',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '10:17',
-        notes: '📢 **Bithumb LISTING:[업데이트] 시간분할자동주문 (TWAP) 서비스 제공 플랫폼 확대 안내 (안드로이드, PC, 모바일웹 추가) **  Bithumb LISTING:【更新】分时自动订餐（TWAP）服务平台扩展（新增安卓、PC和移动网页版）  ----------',
-    },
-    {
-        date: '2026-02-27',
-        token: 'NOM',
-        token_display: 'Nomina (NOM)',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '15:00',
-        notes: '📢 **UPBIT LISTING:[거래] 노미나(NOM) 거래지원 종료 안내(3/30 15:00) **  UPBIT LISTING:【交易】Nomina (NOM) 交易支持终止通知（3月30日下午3:00）  ---------- 🕒 __2026-02-27 06:00:05__',
-    },
-    {
-        date: '2026-02-27',
-        token: 'ROBO',
-        token_display: 'Token (ROBO)',
-        exchange: 'OKX',
-        type: 'perp',
-        time: '15:17',
-        notes: '📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list perpetual futures for ROBO cryptoDetail:  at: 2026-02-27T15:17:00Z **  OKX LISTING:#OKX 重要通知 ',
-    },
-    {
-        date: '2026-02-27',
-        token: 'ROBO',
-        token_display: 'Token (ROBO)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '21:03',
-        pairs: 'ROBO/USD',
-        notes: '📢 **COINBASE LISTING: Spot trading for Robo Token (ROBO) is expected to go live on 27 February 2026. The opening of our ROBO-USD trading pair will beg',
-    },
-    {
-        date: '2026-03-01',
-        token: 'KAT',
-        token_display: 'KAT (Katana)',
-        exchange: 'OKX',
-        type: 'pre-market',
-        time: '13:02',
-        notes: '📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list KAT (Katana) for spot trading and convert pre-market futures to standard perpetual futuresDet',
-    },
-    {
-        date: '2026-03-02',
-        token: 'KAT',
-        token_display: 'Katana (KAT)',
-        exchange: 'Binance',
-        type: 'pre-market',
-        time: '04:16',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined KATUSDT Perpetual Contract Pre-Market Trading (2026-03-02) **  币安期货将于2026年3月2日推出以美元计价的KATUSDT永续合约盘前交易。  ',
-    },
-    {
-        date: '2026-03-02',
-        token: 'KAT',
-        token_display: 'Katana (KAT)',
-        exchange: 'OKX',
-        type: 'pre-market',
-        time: '11:00',
-        notes: '📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list pre-market perpetual futures for KAT cryptoDetail:  at: 2026-03-02T11:00:44Z **  OKX LISTING:',
-    },
-    {
-        date: '2026-03-02',
-        token: 'OPN',
-        token_display: 'Opinion (OPN)',
-        exchange: 'Binance',
-        type: 'spot',
-        time: '12:45',
-        notes: '📢 **Binance: Introducing Opinion (OPN) on Binance Launchpool! Farm OPN by Locking BNB, USDC, U, and USD1 **  Binance: 币安 Launchpool 现已推出 Opinion (OPN)',
-    },
-    {
-        date: '2026-03-03',
-        token: 'LMTS',
-        token_display: 'Limitless (LMTS)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '22:22',
-        notes: '📢 **COINBASE LISTING: Assets added to the roadmap today: Limitless (LMTS) **  COINBASE LISTING: 今天添加到产品路线图的资产：Limitless (LMTS)  ---------- 🔗 [查看来源](ht',
-    },
-    {
-        date: '2026-03-04',
-        token: 'CFG',
-        token_display: 'Centrifuge (CFG)',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '05:07',
-        notes: '📢 **Bithumb LISTING:센트리퓨즈(CFG) 원화 마켓 추가 **  Bithumb LISTING:离心机（CFG）已进入韩元市场  ---------- 🔗 [查看来源](https://feed.bithumb.com/notice/1652174) 🕒 __2026-03-',
-    },
-    {
-        date: '2026-03-04',
-        token: 'EDGE',
-        token_display: 'EDGE',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '05:50',
-        notes: '📢 **UPBIT LISTING:디피니티브(EDGE) 신규 거래지원 안내 (KRW, BTC, USDT 마켓) **  UPBIT LISTING:最终版（EDGE）新交易支持公告（韩元、比特币、USDT市场）  ---------- 🔗 [查看来源](https://upbit.com/',
-    },
-    {
-        date: '2026-03-04',
-        token: 'EDGE',
-        token_display: 'EDGE',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '07:40',
-        notes: '📢 **Bithumb LISTING:디피니티브(EDGE) 원화마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:最终版（EDGE）韩元市场新增纪念空投活动  ---------- 🔗 [查看来源](https://feed.bithumb.com/notice/165',
-    },
-    {
-        date: '2026-03-04',
-        token: 'XCU',
-        token_display: 'XCU',
-        exchange: 'OKX',
-        type: 'perp',
-        time: '11:01',
-        notes: '📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list perpetual futures for XCU and CLDetail:  at: 2026-03-04T11:01:48Z **  OKX LISTING:OKX 重要通知：OK',
-    },
-    {
-        date: '2026-03-04',
-        token: 'ROBO',
-        token_display: 'Protocol (ROBO)',
-        exchange: 'Binance',
-        type: 'spot',
-        time: '13:13',
-        notes: '📢 **Binance Will List Fabric Protocol (ROBO) with Seed Tag Applied **  币安将上线带有种子标签的 Fabric 协议 (ROBO)。  ---------- 🔗 [查看来源](https://news.6551.io/previe',
-    },
-    {
-        date: '2026-03-05',
-        token: 'ROBO',
-        token_display: 'Token (ROBO)',
-        exchange: 'OKX',
-        type: 'spot',
-        time: '04:01',
-        notes: '📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list ROBO (Fabric Protocol) for spot tradingDetail:  at: 2026-03-05T04:01:10Z **  OKX LISTING:OKX ',
-    },
-    {
-        date: '2026-03-05',
-        token: 'APR',
-        token_display: 'Priori (APR)',
-        exchange: 'Binance',
-        type: 'spot',
-        time: '08:00',
-        notes: '📢 **Binance Earn New Listing Special Offer: Subscribe to OPN Locked Products to Enjoy 200% APR for 7 Days (2026-03-05) **  币安新上线特惠：订阅 OPN 锁仓产品，即可享受 7 ',
-    },
-    {
-        date: '2026-03-05',
-        token: 'LMTS',
-        token_display: 'Limitless (LMTS)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '16:47',
-        pairs: 'LMTS/USD',
-        notes: '📢 **COINBASE LISTING: Spot trading for Limitless (LMTS) will go live on 5 March 2026. The opening of our LMTS-USD trading pair will begin on or after ',
-    },
-    {
-        date: '2026-03-05',
-        token: 'OPN',
-        token_display: 'OPINION (OPN)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '22:03',
-        pairs: 'OPN/USD',
-        notes: '📢 **COINBASE LISTING: Spot trading for OPINION (OPN) is expected to go live on 5 March 2026. The opening of our OPN-USD trading pair will begin on or ',
-    },
-    {
-        date: '2026-03-06',
-        token: 'COPPER',
-        token_display: 'COPPER',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '12:30',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined COPPERUSDT Perpetual Contract (2026-03-06) **  币安期货将推出以美元Ⓢ为保证金的铜USDT永续合约（2026年3月6日）  ---------- 🔗 [查看来源]',
-    },
-    {
-        date: '2026-03-06',
-        token: 'LMTS',
-        token_display: 'Limitless (LMTS)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '21:57',
-        pairs: 'LMTS/USD',
-        notes: '📢 **COINBASE LISTING: The launch of spot trading for Limitless (LMTS) has been postponed to 6 March 2026. The opening of our LMTS-USD trading pair wil',
-    },
-    {
-        date: '2026-03-07',
-        token: 'BLEND',
-        token_display: 'Fluent (BLEND)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '18:24',
-        notes: '📢 **COINBASE LISTING: Assets added to the roadmap today: Fluent (BLEND) **  COINBASE LISTING: 今天添加到产品路线图的资产：Fluent（BLEND）  ---------- 🔗 [查看来源](https:/',
-    },
-    {
-        date: '2026-03-09',
-        token: 'XAU',
-        token_display: 'XAU',
-        exchange: 'Bybit',
-        type: 'perp',
-        time: '03:14',
-        notes: '📢 **BYBIT: New listing: XAUUSDT Perpetual Contract, with up to 75x leverage **  BYBIT: 新品上线：XAUUSDT永续合约，最高可达75倍杠杆  ---------- 🔗 [查看来源](https://announc',
-    },
-    {
-        date: '2026-03-10',
-        token: 'NGD',
-        token_display: 'NGD',
-        exchange: 'OKX',
-        type: 'perp',
-        time: '08:31',
-        notes: '📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list perpetual futures for NGDetail:  at: 2026-03-10T08:31:19Z **  OKX LISTING:OKX 重要通知：OKX 将于 202',
-    },
-    {
-        date: '2026-03-10',
-        token: 'NG',
-        token_display: 'NG',
-        exchange: 'OKX',
-        type: 'perp',
-        time: '08:31',
-        notes: '📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list perpetual futures for NGDetail:  at: 2026-03-10T08:31:19Z **  OKX LISTING:OKX 重要通知：OKX 将于 202',
-    },
-    {
-        date: '2026-03-11',
-        token: 'ICP',
-        token_display: 'ICP',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '06:00',
-        notes: '📢 **UPBIT LISTING:[거래] 인터넷컴퓨터(ICP) 신규 거래지원 안내 (KRW, BTC, USDT 마켓) **  UPBIT LISTING:【交易】新型互联网电脑（ICP）交易支持（韩元、比特币、USDT 市场）  ---------- 🕒 __2026-03-11 06',
-    },
-    {
-        date: '2026-03-11',
-        token: 'NIGHT',
-        token_display: 'Midnight (NIGHT)',
-        exchange: 'Binance',
-        type: 'spot',
-        time: '11:31',
-        notes: '📢 **Binance: Introducing Midnight (NIGHT) on Binance HODLer Airdrops! Earn NIGHT With Retroactive BNB Simple Earn Subscriptions **  Binance: 币安 HODLer',
-    },
-    {
-        date: '2026-03-12',
-        token: 'CYS',
-        token_display: 'CYS',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '06:40',
-        notes: '📢 **Bithumb LISTING:싸이식(CYS) 원화마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:为庆祝CYS加入韩元市场，我们将举办空投活动  ---------- 🔗 [查看来源](https://feed.bithumb.com/notice/16522',
-    },
-    {
-        date: '2026-03-13',
-        token: 'BILL',
-        token_display: 'Billions (BILL)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '07:13',
-        notes: '📢 **COINBASE LISTING: Assets added to the roadmap today: Billions (BILL) **  COINBASE LISTING: 今天添加到路线图的资产：数十亿（BILL）  ---------- 🔗 [查看来源](https://twit',
-    },
-    {
-        date: '2026-03-13',
-        token: 'KAT',
-        token_display: 'Katana (KAT)',
-        exchange: 'Binance',
-        type: 'spot',
-        time: '09:45',
-        notes: '📢 **Binance Will List Katana (KAT) with Seed Tag Applied **  币安将上线 Katana (KAT)，并应用种子标签。  ---------- 🔗 [查看来源](https://news.6551.io/preview/dfafbcad2d6',
-    },
-    {
-        date: '2026-03-13',
-        token: 'LUNA',
-        token_display: 'LUNA',
-        exchange: 'OKX',
-        type: 'spot',
-        time: '19:14',
-        notes: '📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list LUNA, ENJ, ACE, VELODROME, STETH, ETHW, and WOO for Spot TradingDetail:  at: 2026-03-13T19:14',
-    },
-    {
-        date: '2026-03-13',
-        token: 'WOO',
-        token_display: 'WOO',
-        exchange: 'OKX',
-        type: 'spot',
-        time: '19:14',
-        notes: '📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list LUNA, ENJ, ACE, VELODROME, STETH, ETHW, and WOO for Spot TradingDetail:  at: 2026-03-13T19:14',
-    },
-    {
-        date: '2026-03-13',
-        token: 'ST',
-        token_display: 'ST',
-        exchange: 'OKX',
-        type: 'spot',
-        time: '19:14',
-        notes: '📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list LUNA, ENJ, ACE, VELODROME, STETH, ETHW, and WOO for Spot TradingDetail:  at: 2026-03-13T19:14',
-    },
-    {
-        date: '2026-03-16',
-        token: 'BP',
-        token_display: 'BP',
-        exchange: 'Bybit',
-        type: 'pre-market',
-        time: '10:00 UTC',
-        notes: '📢 **BYBIT: Listing of BPUSDT on Bybit Perpetual Pre-Market on Mar 16, 2026, 10:00AM UTC **  BYBIT: BPUSDT将于2026年3月16日上午10:00（UTC）在Bybit Perpetual盘前交易平',
-    },
-    {
-        date: '2026-03-16',
-        token: 'CFG',
-        token_display: 'Centrifuge (CFG)',
-        exchange: 'Binance',
-        type: 'spot',
-        time: '18:22',
-        notes: '📢 **Binance Will List Centrifuge (CFG) with Seed Tag Applied **  币安将上线 Centrifuge (CFG)，并应用种子标签。  ---------- 🔗 [查看来源](https://news.6551.io/preview/096',
-    },
-    {
-        date: '2026-03-16',
-        token: 'EWY',
-        token_display: 'EWY',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '22:30',
-        notes: '📢 **Binance Futures Will Launch EWYUSDT USDⓈ-Margined Index Perpetual Contract (2026-03-16) **  币安期货将推出 EWYUSDT 美元保证金指数永续合约（2026年3月16日）  ---------- 🔗 ',
-    },
-    {
-        date: '2026-03-17',
-        token: 'PRL',
-        token_display: 'Perle (PRL)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '08:21',
-        notes: '📢 **COINBASE LISTING: Assets added to the roadmap today: Perle (PRL) **  COINBASE LISTING: 今天添加到产品路线图的资产：Perle (PRL)  ---------- 🔗 [查看来源](https://twit',
-    },
-    {
-        date: '2026-03-17',
-        token: 'CFG',
-        token_display: 'Centrifuge (CFG)',
-        exchange: 'Bybit',
-        type: 'perp',
-        time: '12:24',
-        notes: '📢 **BYBIT: New listing: CFGUSDT Perpetual Contract, with up to 25x leverage **  BYBIT: 新品上线：CFGUSDT永续合约，最高可达25倍杠杆  ---------- 🔗 [查看来源](https://announc',
-    },
-    {
-        date: '2026-03-18',
-        token: 'ROBO',
-        token_display: 'Protocol (ROBO)',
-        exchange: 'Binance',
-        type: 'spot',
-        time: '11:30',
-        notes: '📢 **Binance: Introducing Fabric Protocol (ROBO) on Binance HODLer Airdrops! Earn ROBO With Retroactive BNB Simple Earn Subscriptions **  Binance: 币安 H',
-    },
-    {
-        date: '2026-03-18',
-        token: 'ROBO',
-        token_display: 'Protocol (ROBO)',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '11:50',
-        notes: '📢 **Bithumb LISTING:패브릭 프로토콜(ROBO) 원화마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:Fabric Protocol (ROBO) 韩元市场新增纪念空投活动  ---------- 🔗 [查看来源](https://feed.bithu',
-    },
-    {
-        date: '2026-03-18',
-        token: 'KAT',
-        token_display: 'Katana (KAT)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '20:03',
-        pairs: 'KAT/USD',
-        notes: '📢 **COINBASE LISTING: Spot trading for Katana (KAT) is expected to go live on 18 March 2026. The opening of our KAT-USD trading pair will begin on or ',
-    },
-    {
-        date: '2026-03-19',
-        token: 'ICNT',
-        token_display: 'Network (ICNT)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '03:58',
-        notes: '📢 **COINBASE LISTING: Assets added to the roadmap today: Impossible Cloud Network (ICNT) **  COINBASE LISTING: 今天添加到路线图中的资产：不可能云网络 (ICNT)  ---------- ',
-    },
-    {
-        date: '2026-03-19',
-        token: 'ETHFI',
-        token_display: 'ETHFI',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '10:50',
-        notes: '📢 **UPBIT LISTING:[거래] 이더파이(ETHFI) KRW 마켓 디지털 자산 추가 **  UPBIT LISTING:【交易】ETHFI 将数字资产添加到韩元市场  ---------- 🕒 __2026-03-19 10:50:00__',
-    },
-    {
-        date: '2026-03-19',
-        token: 'EWJ',
-        token_display: 'EWJ',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '18:30',
-        notes: '📢 **Binance Futures Will Launch EWJUSDT USDⓈ-Margined Index Perpetual Contract (2026-03-19) **  币安期货将推出 EWJUSDT 美元保证金指数永续合约（2026年3月19日）  ---------- 🔗 ',
-    },
-    {
-        date: '2026-03-19',
-        token: 'EDGE',
-        token_display: 'EDGE',
-        exchange: 'Binance',
-        type: 'pre-market',
-        time: '21:29',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined EDGEUSDT Perpetual Contract Pre-Market Trading (2026-03-19) **  币安期货将于2026年3月19日推出以美元计价的EDGEUSDT永续合约盘前交易',
-    },
-    {
-        date: '2026-03-20',
-        token: 'PHA',
-        token_display: 'PHA',
-        exchange: 'Bithumb',
-        type: 'spot',
-        time: '13:00',
-        notes: '📢 **Bithumb LISTING:팔라 네트워크(PHA) 원화마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:为庆祝PHA韩元市场上线，将举办空投活动  ---------- 🔗 [查看来源](https://feed.bithumb.com/notice/165',
-    },
-    {
-        date: '2026-03-20',
-        token: 'EDGE',
-        token_display: 'EDGE',
-        exchange: 'Bybit',
-        type: 'pre-market',
-        time: '4:30 UTC',
-        notes: '📢 **Bybit to list Pre-Market Perpetuals for EDGEUSDT on Mar 20, 2026, 4:30AM UTC **  Bybit将于2026年3月20日凌晨4:30（UTC）上线EDGEUSDT盘前永续合约。  ---------- 🔗 [查看来源',
-    },
-    {
-        date: '2026-03-22',
-        token: 'RESOLV',
-        token_display: 'RESOLV (Resolv)',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '12:40',
-        notes: '📢 **UPBIT LISTING:[거래] 리졸브(RESOLV) 유의 촉구 안내 **  UPBIT LISTING:【交易】RESOLV 警告通知  ---------- 🕒 __2026-03-22 12:40:04__',
-    },
-    {
-        date: '2026-03-23',
-        token: 'MON',
-        token_display: 'MON (Monad)',
-        exchange: 'OKX',
-        type: 'spot',
-        time: '02:01',
-        notes: '📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list MON (Monad) for spot tradingDetail:  at: 2026-03-23T02:01:32Z **  OKX LISTING:OKX 重要通知：OKX 即将',
-    },
-    {
-        date: '2026-03-23',
-        token: 'RESOLV',
-        token_display: 'RESOLV (Resolv)',
-        exchange: 'Upbit',
-        type: 'spot',
-        time: '14:00',
-        notes: '📢 **UPBIT LISTING:[거래] 리졸브(RESOLV) 거래 유의 종목 지정 안내 **  UPBIT LISTING:【交易】关于将RESOV指定为交易警示项目的通知  ---------- 🕒 __2026-03-23 14:00:03__',
-    },
-    {
-        date: '2026-03-23',
-        token: 'PAYP',
-        token_display: 'PAYP',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '21:58',
-        notes: '📢 **Binance Futures Will Launch PAYPUSDT USDⓈ-Margined Equity Perpetual Contract (2026-03-23) **  币安期货将推出 PAYPUSDT 美元保证金股票永续合约（2026年3月23日）  ----------',
-    },
-    {
-        date: '2026-03-24',
-        token: 'BRENTOILD',
-        token_display: 'BRENTOILD',
-        exchange: 'OKX',
-        type: 'perp',
-        time: '08:01',
-        notes: '📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list perpetual futures for BRENTOILDetail:  at: 2026-03-24T08:01:42Z **  OKX LISTING:OKX 重要通知：OKX ',
-    },
-    {
-        date: '2026-03-24',
-        token: 'CL',
-        token_display: 'CL',
-        exchange: 'Bybit',
-        type: 'perp',
-        time: '16:12',
-        notes: '📢 **BYBIT: New listing: CLUSDT Perpetual Contract, with up to 50x leverage **  BYBIT: 新品上线：CLUSDT永续合约，最高可达50倍杠杆  ---------- 🔗 [查看来源](https://announcem',
-    },
-    {
-        date: '2026-03-25',
-        token: 'CHECK',
-        token_display: 'Checkmate (CHECK)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '03:40',
-        notes: '📢 **COINBASE LISTING: Assets added to the roadmap today: Checkmate (CHECK) and Sign (SIGN) **  COINBASE LISTING: 今天添加到产品路线图的资产：Checkmate (CHECK) 和 Sig',
-    },
-    {
-        date: '2026-03-25',
-        token: 'SIGN',
-        token_display: 'Sign (SIGN)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '03:40',
-        notes: '📢 **COINBASE LISTING: Assets added to the roadmap today: Checkmate (CHECK) and Sign (SIGN) **  COINBASE LISTING: 今天添加到产品路线图的资产：Checkmate (CHECK) 和 Sig',
-    },
-    {
-        date: '2026-03-25',
-        token: 'PRL',
-        token_display: 'Perle (PRL)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '04:27',
-        notes: '📢 **Coinbase will add support for Perle (PRL). You can now generate a deposit address for PRL on coinbase․com, the Coinbase app, and Coinbase Exchange',
-    },
-    {
-        date: '2026-03-25',
-        token: 'APR',
-        token_display: 'Priori (APR)',
-        exchange: 'Binance',
-        type: 'spot',
-        time: '12:30',
-        notes: '📢 **Binance Earn New Listing Special Offer: Subscribe to NIGHT Locked Products to Enjoy 200% APR for 7 Days **  币安新上线特惠：订阅夜间锁仓产品，即可享受7天200%年化收益率  ----',
-    },
-    {
-        date: '2026-03-25',
-        token: 'BSB',
-        token_display: 'BSB',
-        exchange: 'Binance',
-        type: 'perp',
-        time: '18:14',
-        notes: '📢 **Binance Futures Will Launch USDⓈ-Margined BSBUSDT Perpetual Contract (2026-03-25) **  币安期货将推出以美元Ⓢ为保证金的BSBUSDT永续合约（2026年3月25日）  ---------- 🔗 [查看来源]',
-    },
-    {
-        date: '2026-03-25',
-        token: 'ICNT',
-        token_display: 'Network (ICNT)',
-        exchange: 'Coinbase',
-        type: 'spot',
-        time: '23:52',
-        pairs: 'ICNT/USD',
-        notes: '📢 **COINBASE LISTING: Spot trading for Impossible Cloud Network (ICNT) will go live on 25 March 2026. The opening of our ICNT-USD trading pair will be',
-    },
+    {"date": "2025-05-23", "token": "KERNEL", "token_display": "KERNEL", "exchange": "Upbit", "type": "spot", "time": "10:48", "notes": "📢 **UPBIT LISTING:[거래] 커널다오(KERNEL) 신규 거래지원 안내 (BTC, USDT 마켓) **  UPBIT LISTING:【交易】KERNELDAO（KERNEL）新增交易支持通知（BTC、USDT市场）  ---------- 🕒 __2025-05-23 1"},
+    {"date": "2025-05-23", "token": "SOPH", "token_display": "SOPH (Sophon)", "exchange": "OKX", "type": "spot", "time": "20:00", "notes": "📢 **OKX LISTING:OKX to list SOPH (Sophon) for spot trading **  OKX LISTING:OKX宣布将上线索芬(Sophon)代币(SOPH)进行现货交易。  ---------- 🔗 [查看来源](https://www.okx.com/"},
+    {"date": "2025-05-23", "token": "SOPH", "token_display": "Sophon (SOPH)", "exchange": "Binance", "type": "perp", "time": "20:07", "notes": "📢 **Binance: Sophon (SOPH) Will Be Available on Binance Alpha and Binance Futures **  Binance: Sophon (SOPH) 将在 Binance Alpha 和 Binance Futures 上线。  -"},
+    {"date": "2025-05-26", "token": "HUMA", "token_display": "HUMA", "exchange": "OKX", "type": "spot", "time": "11:00", "notes": "📢 **OKX LISTING:OKX to list HUMA (Huma Finance) for spot trading **  OKX LISTING:OKX即将上线HUMA（Huma Finance）进行现货交易。  ---------- 🔗 [查看来源](https://www.okx"},
+    {"date": "2025-05-27", "token": "HYPER", "token_display": "Hyperlane (HYPER)", "exchange": "Upbit", "type": "spot", "time": "15:44", "notes": "📢 **UPBIT LISTING:[Trade] Market Support for Hyperlane(HYPER), RedStone(RED) (BTC, USDT Market) **  UPBIT LISTING:[交易] 数字货币市场将对Hyperlane(HYPER)和RedSto"},
+    {"date": "2025-05-27", "token": "RED", "token_display": "RedStone (RED)", "exchange": "Upbit", "type": "spot", "time": "15:44", "notes": "📢 **UPBIT LISTING:[Trade] Market Support for Hyperlane(HYPER), RedStone(RED) (BTC, USDT Market) **  UPBIT LISTING:[交易] 数字货币市场将对Hyperlane(HYPER)和RedSto"},
+    {"date": "2025-05-27", "token": "SOPH", "token_display": "SOPH (Sophon)", "exchange": "Upbit", "type": "spot", "time": "16:02", "notes": "📢 **UPBIT LISTING:[거래] 소폰(SOPH) 신규 거래지원 안내 (KRW, BTC, USDT 마켓) **  UPBIT LISTING:[交易] SOPH（SOPH）新增交易对支持公告（KRW、BTC、USDT市场）  ---------- 🕒 __2025-05-27 1"},
+    {"date": "2025-05-27", "token": "ELDE", "token_display": "ELDE", "exchange": "Bybit", "type": "spot", "time": "18:56", "notes": "📢 **BYBIT: 🔥  Listing of ELDE on Convert & Bybit Savings **  BYBIT: 🔥  ELADE 已在 Convert 和 Bybit Savings 上线  ---------- 🔗 [查看来源](https://announcements."},
+    {"date": "2025-05-28", "token": "SNX", "token_display": "SNX", "exchange": "Upbit", "type": "spot", "time": "14:00", "notes": "📢 **UPBIT LISTING:[거래] 신세틱스(SNX) 거래 유의 종목 지정 기간 연장 안내 **  UPBIT LISTING:[交易] Synthetix（SNX）交易标的预警期间延长通知  ---------- 🕒 __2025-05-28 14:00:04__"},
+    {"date": "2025-05-28", "token": "SOPH", "token_display": "Sophon (SOPH)", "exchange": "Binance", "type": "spot", "time": "15:16", "notes": "📢 **Binance: Introducing Sophon (SOPH) on Binance HODLer Airdrops! Earn SOPH With Retroactive BNB Simple Earn Subscriptions **  Binance: 在Binance HODL"},
+    {"date": "2025-05-28", "token": "SOPH", "token_display": "SOPH (Sophon)", "exchange": "OKX", "type": "perp", "time": "15:30", "notes": "📢 **OKX LISTING:OKX to list perpetual for SOPH crypto **  OKX LISTING:OKX 即将上线 SOPH 永续合约。  ---------- 🔗 [查看来源](https://www.okx.com/help/okx-to-list-pe"},
+    {"date": "2025-05-28", "token": "MERL", "token_display": "MERL", "exchange": "Binance", "type": "perp", "time": "18:33", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined MERLUSDT Perpetual Contract **  币安期货将推出以美元稳定币Ⓢ为保证金的MERL / USDT永续合约  ---------- 🔗 [查看来源](https://www.bina"},
+    {"date": "2025-05-29", "token": "SOPH", "token_display": "Sophon (SOPH)", "exchange": "Binance", "type": "spot", "time": "12:00", "notes": "📢 **Binance: Introducing Sophon (SOPH): Grab a Share of the 30,000,000 SOPH Prize Pool! **  Binance: Sophon (SOPH) 上线：立即参与，瓜分 30,000,000 SOPH 奖池！  ---"},
+    {"date": "2025-05-29", "token": "XTER", "token_display": "XTER", "exchange": "Bithumb", "type": "spot", "time": "14:29", "notes": "📢 **Bithumb LISTING:[이벤트] 엑스테리오(XTER) 원화 마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:[活动] 为庆祝XTERIO（XTER）上线韩元市场，举行空投活动。  ---------- 🔗 [查看来源](https://feed.bi"},
+    {"date": "2025-05-29", "token": "KMNO", "token_display": "KMNO", "exchange": "OKX", "type": "spot", "time": "18:00", "notes": "📢 **OKX LISTING:OKX to list KMNO (Kamino Finance) for spot trading **  OKX LISTING:OKX将上线KMNO（Kamino Finance）现货交易。  ---------- 🔗 [查看来源](https://www.ok"},
+    {"date": "2025-05-30", "token": "FLOCK", "token_display": "Flock (FLOCK)", "exchange": "Upbit", "type": "spot", "time": "11:06", "notes": "📢 **UPBIT LISTING:[거래] 플록(FLOCK), 포르타(FORT) 신규 거래지원 안내 (BTC, USDT 마켓) **  UPBIT LISTING:[交易] FLOCK（FLOCK）和PORTAL（FORT）新增交易支持通知（BTC, USDT市场）  ---------"},
+    {"date": "2025-05-30", "token": "FORT", "token_display": "FORT", "exchange": "Upbit", "type": "spot", "time": "11:06", "notes": "📢 **UPBIT LISTING:[거래] 플록(FLOCK), 포르타(FORT) 신규 거래지원 안내 (BTC, USDT 마켓) **  UPBIT LISTING:[交易] FLOCK（FLOCK）和PORTAL（FORT）新增交易支持通知（BTC, USDT市场）  ---------"},
+    {"date": "2025-05-30", "token": "INIT", "token_display": "INISIA (INIT)", "exchange": "Bithumb", "type": "spot", "time": "15:25", "notes": "📢 **Bithumb LISTING:[이벤트] 이니시아(INIT), 플록(FLOCK) 원화 마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:[活动] INISIA (INIT)、Flock (FLOCK) 上线韩元市场纪念空投活动  ---------- 🔗 ["},
+    {"date": "2025-05-30", "token": "FLOCK", "token_display": "Flock (FLOCK)", "exchange": "Bithumb", "type": "spot", "time": "15:25", "notes": "📢 **Bithumb LISTING:[이벤트] 이니시아(INIT), 플록(FLOCK) 원화 마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:[活动] INISIA (INIT)、Flock (FLOCK) 上线韩元市场纪念空投活动  ---------- 🔗 ["},
+    {"date": "2025-05-30", "token": "HYPE", "token_display": "HYPERLIQUID (HYPE)", "exchange": "Binance", "type": "perp", "time": "16:36", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined HYPEUSDT Perpetual Contract **  Binance期货将推出以USDTⓈ为保证金挂钩的HYPEUSDT永续合约  ---------- 🔗 [查看来源](https://www.b"},
+    {"date": "2025-05-30", "token": "BDXN", "token_display": "Bondex (BDXN)", "exchange": "Binance", "type": "perp", "time": "17:35", "notes": "📢 **Binance: Bondex (BDXN) Will Be Available on Binance Alpha and Binance Futures **  Binance: 邦德克斯（BDXN）将上线币安 Alpha 和币安期货。  ---------- 🔗 [查看来源](https"},
+    {"date": "2025-05-30", "token": "ASRR", "token_display": "ASRR", "exchange": "Bybit", "type": "spot", "time": "21:00", "notes": "📢 **BYBIT: 🔥 Listing of ASRR on Convert **  BYBIT：🔥 ASRR 在 Convert 交易对上架  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/-listing-of-a"},
+    {"date": "2025-06-02", "token": "XEM", "token_display": "XEM", "exchange": "Upbit", "type": "spot", "time": "15:00", "notes": "📢 **UPBIT LISTING:[거래] 넴(XEM) 거래지원 종료 안내 (7/3 15:00) **  UPBIT LISTING:【交易】NEM（XEM）交易支持结束通知（7月3日 15:00）  ---------- 🕒 __2025-06-02 18:30:10__"},
+    {"date": "2025-06-02", "token": "SOPH", "token_display": "SOPH (Sophon)", "exchange": "Bithumb", "type": "spot", "time": "16:12", "notes": "📢 **Bithumb LISTING:[이벤트] 소폰(SOPH) 원화 마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:[活动] SOPH韩元市场上线庆祝空投活动  ---------- 🔗 [查看来源](https://feed.bithumb.com/notice"},
+    {"date": "2025-06-03", "token": "ENA", "token_display": "Ethena (ENA)", "exchange": "Coinbase", "type": "spot", "time": "05:24", "notes": "📢 **COINBASE LISTING: Assets added to the roadmap today: Ethena (ENA) **  COINBASE LISTING: 今日路线图新增资产：Ethena（ENA）  ---------- 🔗 [查看来源](https://twitter"},
+    {"date": "2025-06-03", "token": "NXPC", "token_display": "NXPC", "exchange": "OKX", "type": "perp", "time": "14:00", "notes": "📢 **OKX LISTING:OKX to list perpetual futures for NXPC, LAUNCHCOIN, MUBARAK crypto **  OKX LISTING:OKX将上线NXPC、LAUNCHCOIN、MUBARAK加密资产的永续合约。  ----------"},
+    {"date": "2025-06-03", "token": "LAUNCHCOIN", "token_display": "LAUNCHCOIN", "exchange": "OKX", "type": "perp", "time": "14:00", "notes": "📢 **OKX LISTING:OKX to list perpetual futures for NXPC, LAUNCHCOIN, MUBARAK crypto **  OKX LISTING:OKX将上线NXPC、LAUNCHCOIN、MUBARAK加密资产的永续合约。  ----------"},
+    {"date": "2025-06-03", "token": "MUBARAK", "token_display": "MUBARAK", "exchange": "OKX", "type": "perp", "time": "14:00", "notes": "📢 **OKX LISTING:OKX to list perpetual futures for NXPC, LAUNCHCOIN, MUBARAK crypto **  OKX LISTING:OKX将上线NXPC、LAUNCHCOIN、MUBARAK加密资产的永续合约。  ----------"},
+    {"date": "2025-06-03", "token": "PUFFER", "token_display": "PUFFER", "exchange": "Binance", "type": "perp", "time": "17:14", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined PUFFERUSDT and PORT3USDT Perpetual Contracts **  币安期货将推出以USDT为保证金的PUFFERUSDT和PORT3USDT永续合约。  ---------- "},
+    {"date": "2025-06-04", "token": "USDG", "token_display": "USDG", "exchange": "OKX", "type": "spot", "time": "14:00", "notes": "📢 **OKX LISTING:OKX to list USDG (Global Dollar) for spot trading **  OKX LISTING:OKX将上线USDG（Global Dollar）进行现货交易。  ---------- 🔗 [查看来源](https://www.ok"},
+    {"date": "2025-06-04", "token": "PUMP", "token_display": "PUMP (Pump)", "exchange": "Bybit", "type": "spot", "time": "16:30", "notes": "📢 **BYBIT: 🔥 Listing of PUMPBTC on  Convert **  BYBIT: 🔥 PUMPBTC 在 Convert 平台上线  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/-listi"},
+    {"date": "2025-06-04", "token": "RESOLV", "token_display": "RESOLV (Resolv)", "exchange": "OKX", "type": "spot", "time": "18:00", "notes": "📢 **OKX LISTING:OKX to list RESOLV (Resolv) for spot trading **  OKX LISTING:OKX将上线RESOLV（Resolv）进行现货交易。  ---------- 🔗 [查看来源](https://www.okx.com/help"},
+    {"date": "2025-06-05", "token": "ENA", "token_display": "Ethena (ENA)", "exchange": "Coinbase", "type": "spot", "time": "00:04", "notes": "📢 **Coinbase will add support for Ethena (ENA) on the Ethereum network (ERC-20 token). Do not send this asset over other networks or your funds may be"},
+    {"date": "2025-06-05", "token": "LA", "token_display": "Lagrange (LA)", "exchange": "Coinbase", "type": "spot", "time": "00:41", "notes": "📢 **Coinbase will add support for Lagrange (LA) on the Ethereum network (ERC-20 token). Do not send this asset over other networks or your funds may b"},
+    {"date": "2025-06-05", "token": "CAKE", "token_display": "PancakeSwap (CAKE)", "exchange": "Coinbase", "type": "spot", "time": "03:21", "notes": "📢 **COINBASE LISTING: Assets added to the roadmap today: PancakeSwap (CAKE) **  COINBASE LISTING: 今日路线图中新增资产：PancakeSwap (CAKE)。  ---------- 🔗 [查看来源]("},
+    {"date": "2025-06-05", "token": "CAKE", "token_display": "PancakeSwap (CAKE)", "exchange": "Coinbase", "type": "perp", "time": "03:21", "notes": "📢 **COINBASE LISTING: Assets added to the roadmap today: PancakeSwap (CAKE) **  COINBASE LISTING: 今日路线图中新增资产：PancakeSwap (CAKE)。  ---------- 🔗 [查看来源]("},
+    {"date": "2025-06-05", "token": "LA", "token_display": "Lagrange (LA)", "exchange": "Bithumb", "type": "spot", "time": "13:27", "notes": "📢 **Bithumb LISTING:[이벤트] 라그랑주(LA) 원화 마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:[活动] 庆祝拉格朗日(LA)新增韩元市场的空投活动  ---------- 🔗 [查看来源](https://feed.bithumb.com/n"},
+    {"date": "2025-06-05", "token": "LA", "token_display": "Lagrange (LA)", "exchange": "Upbit", "type": "spot", "time": "15:03", "notes": "📢 **UPBIT LISTING:[거래] 라그랑주(LA) 신규 거래지원 안내 (BTC, USDT 마켓) **  UPBIT LISTING:[交易] 拉格兰奇（LA）新增交易支持公告（支持BTC、USDT市场）  ---------- 🕒 __2025-06-05 15:03:20__"},
+    {"date": "2025-06-05", "token": "BOB", "token_display": "BOB", "exchange": "Binance", "type": "perp", "time": "18:47", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined 1000000BOBUSDT Perpetual Contract (2025-06-05) **  Binance 期货将推出美元Ⓢ保证金 1000000BOBUSDT 永续合约（2025年6月5日到期） "},
+    {"date": "2025-06-05", "token": "SOPH", "token_display": "SOPH (Sophon)", "exchange": "Coinbase", "type": "spot", "time": "9:30 UTC", "notes": "📢 **CoinbaseInt Listing: We will add support for Sophon perpetual futures on Coinbase International Exchange and Coinbase Advanced. The opening of our"},
+    {"date": "2025-06-05", "token": "SOPH", "token_display": "SOPH (Sophon)", "exchange": "Coinbase", "type": "perp", "time": "9:30 UTC", "notes": "📢 **CoinbaseInt Listing: We will add support for Sophon perpetual futures on Coinbase International Exchange and Coinbase Advanced. The opening of our"},
+    {"date": "2025-06-05", "token": "HYPE", "token_display": "HYPERLIQUID (HYPE)", "exchange": "Hyperliquid", "type": "spot", "time": "9:30 UTC", "notes": "📢 **CoinbaseInt Listing: We will add support for Hyperliquid perpetual futures on Coinbase International Exchange and Coinbase Advanced. The opening o"},
+    {"date": "2025-06-05", "token": "HYPE", "token_display": "HYPERLIQUID (HYPE)", "exchange": "Hyperliquid", "type": "perp", "time": "9:30 UTC", "notes": "📢 **CoinbaseInt Listing: We will add support for Hyperliquid perpetual futures on Coinbase International Exchange and Coinbase Advanced. The opening o"},
+    {"date": "2025-06-05", "token": "HYPE", "token_display": "HYPERLIQUID (HYPE)", "exchange": "Coinbase", "type": "spot", "time": "9:30 UTC", "notes": "📢 **CoinbaseInt Listing: We will add support for Hyperliquid perpetual futures on Coinbase International Exchange and Coinbase Advanced. The opening o"},
+    {"date": "2025-06-05", "token": "HYPE", "token_display": "HYPERLIQUID (HYPE)", "exchange": "Coinbase", "type": "perp", "time": "9:30 UTC", "notes": "📢 **CoinbaseInt Listing: We will add support for Hyperliquid perpetual futures on Coinbase International Exchange and Coinbase Advanced. The opening o"},
+    {"date": "2025-06-06", "token": "FARTCOIN", "token_display": "Fartcoin (FARTCOIN)", "exchange": "Coinbase", "type": "spot", "time": "04:47", "notes": "📢 **COINBASE LISTING: Assets added to the roadmap today: Fartcoin (FARTCOIN) and Subsquid (SQD) **  COINBASE LISTING: 今日新增至路线图的资产：Fartcoin (FARTCOIN) "},
+    {"date": "2025-06-06", "token": "SQD", "token_display": "Subsquid (SQD)", "exchange": "Coinbase", "type": "spot", "time": "04:47", "notes": "📢 **COINBASE LISTING: Assets added to the roadmap today: Fartcoin (FARTCOIN) and Subsquid (SQD) **  COINBASE LISTING: 今日新增至路线图的资产：Fartcoin (FARTCOIN) "},
+    {"date": "2025-06-09", "token": "SKATE", "token_display": "Skate (SKATE)", "exchange": "Binance", "type": "perp", "time": "13:30", "notes": "📢 **Binance: Skate (SKATE) Will Be Available on Binance Alpha and Binance Futures (2025-06-09) **  Binance: Skate（SKATE）将于2025年6月9日上线Binance Alpha和Bin"},
+    {"date": "2025-06-10", "token": "WIF", "token_display": "Dogwifhat (WIF)", "exchange": "Bithumb", "type": "spot", "time": "10:14", "notes": "📢 **Bithumb LISTING:[마켓 추가] 도그위프햇(WIF), 포켓네트워크(POKT) 원화 마켓 추가 **  Bithumb LISTING:[市场新增] Dogwifhat(WIF)、Pocket Network(POKT) 韩元市场上线。  ---------- 🔗 [查看"},
+    {"date": "2025-06-10", "token": "POKT", "token_display": "Network (POKT)", "exchange": "Bithumb", "type": "spot", "time": "10:14", "notes": "📢 **Bithumb LISTING:[마켓 추가] 도그위프햇(WIF), 포켓네트워크(POKT) 원화 마켓 추가 **  Bithumb LISTING:[市场新增] Dogwifhat(WIF)、Pocket Network(POKT) 韩元市场上线。  ---------- 🔗 [查看"},
+    {"date": "2025-06-10", "token": "EPT", "token_display": "Balance (EPT)", "exchange": "Upbit", "type": "spot", "time": "12:41", "notes": "📢 **UPBIT LISTING:[Trade] Market Support for Balance(EPT) (USDT Market) **  UPBIT LISTING:[交易] 市场对Balance (EPT)的支持（USDT交易对）  ---------- 🔗 [查看来源](https"},
+    {"date": "2025-06-10", "token": "AXL", "token_display": "Xela (AXL)", "exchange": "Upbit", "type": "spot", "time": "12:41", "notes": "📢 **UPBIT LISTING:[거래] 엑셀라(AXL) KRW, USDT 마켓 디지털 자산 추가 **  UPBIT LISTING:[交易] Xela (AXL) 韩元 (KRW) 和 Tether (USDT) 市场新增数字资产  ---------- 🕒 __2025-06-10 "},
+    {"date": "2025-06-10", "token": "USDT", "token_display": "Tether (USDT)", "exchange": "Upbit", "type": "spot", "time": "12:41", "notes": "📢 **UPBIT LISTING:[거래] 엑셀라(AXL) KRW, USDT 마켓 디지털 자산 추가 **  UPBIT LISTING:[交易] Xela (AXL) 韩元 (KRW) 和 Tether (USDT) 市场新增数字资产  ---------- 🕒 __2025-06-10 "},
+    {"date": "2025-06-10", "token": "RESOLV", "token_display": "Resolv (RESOLV)", "exchange": "Binance", "type": "perp", "time": "15:00", "notes": "📢 **Binance: Resolv (RESOLV) Will Be Available on Binance Alpha and Binance Futures (2025-06-10) **  Binance: Resolv (RESOLV) 将于2025年6月10日在Binance Alp"},
+    {"date": "2025-06-10", "token": "HOME", "token_display": "App (HOME)", "exchange": "Binance", "type": "perp", "time": "15:01", "notes": "📢 **Binance: Defi App (HOME) Will Be Available on Binance Alpha and Binance Futures (2025-06-10) **  Binance: DeFi 应用（HOME）将在2025年6月10日上线 Binance Alph"},
+    {"date": "2025-06-10", "token": "RESOLV", "token_display": "RESOLV (Resolv)", "exchange": "Bybit", "type": "spot", "time": "21:05", "notes": "📢 **BYBIT: 🔥 Listing of RESOLV on Convert **  BYBIT: RESOLV在Convert平台上架🔥  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/-listing-of-r"},
+    {"date": "2025-06-11", "token": "TAIKO", "token_display": "TAIKO", "exchange": "Binance", "type": "perp", "time": "18:15", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined TAIKOUSDT and SQDUSDT Perpetual Contracts (2025-06-11) **  币安期货将于2025年6月11日上线以USDT保证金的TAIKOUSDT和SQDUSDT永"},
+    {"date": "2025-06-11", "token": "SQD", "token_display": "Subsquid (SQD)", "exchange": "Binance", "type": "perp", "time": "18:15", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined TAIKOUSDT and SQDUSDT Perpetual Contracts (2025-06-11) **  币安期货将于2025年6月11日上线以USDT保证金的TAIKOUSDT和SQDUSDT永"},
+    {"date": "2025-06-11", "token": "RESOLV", "token_display": "Resolv (RESOLV)", "exchange": "Binance", "type": "spot", "time": "18:24", "notes": "📢 **Binance: Introducing Resolv (RESOLV) on Binance HODLer Airdrops! Earn RESOLV With Retroactive BNB Simple Earn Subscriptions **  Binance: HODLer HO"},
+    {"date": "2025-06-12", "token": "CAKE", "token_display": "PancakeSwap (CAKE)", "exchange": "Coinbase", "type": "spot", "time": "00:21", "notes": "📢 **Coinbase will add support for PancakeSwap (CAKE) on the Ethereum network (ERC-20 token). Do not send this asset over other networks or your funds "},
+    {"date": "2025-06-12", "token": "CAKE", "token_display": "PancakeSwap (CAKE)", "exchange": "Coinbase", "type": "perp", "time": "00:21", "notes": "📢 **Coinbase will add support for PancakeSwap (CAKE) on the Ethereum network (ERC-20 token). Do not send this asset over other networks or your funds "},
+    {"date": "2025-06-12", "token": "SQD", "token_display": "Subsquid (SQD)", "exchange": "Coinbase", "type": "spot", "time": "00:24", "notes": "📢 **Coinbase will add support for Subsquid (SQD) on the Arbitrum network. Do not send this asset over other networks or your funds may be lost. Transf"},
+    {"date": "2025-06-12", "token": "FARTCOIN", "token_display": "Fartcoin (FARTCOIN)", "exchange": "Coinbase", "type": "spot", "time": "00:31", "notes": "📢 **Coinbase will add support for Fartcoin (FARTCOIN) on the Solana network (SPL token). Do not send this asset over other networks or your funds may "},
+    {"date": "2025-06-12", "token": "SPL", "token_display": "SPL", "exchange": "Coinbase", "type": "spot", "time": "00:31", "notes": "📢 **Coinbase will add support for Fartcoin (FARTCOIN) on the Solana network (SPL token). Do not send this asset over other networks or your funds may "},
+    {"date": "2025-06-12", "token": "CUDIS", "token_display": "CUDIS", "exchange": "Bybit", "type": "perp", "time": "16:49", "notes": "📢 **BYBIT: New Listing : CUDISUSDT Perpetual Contract in Innovation Zone, with up to 20x leverage **  BYBIT: 新上市：创新区CUDOS/USDT永续合约，最高支持20倍杠杆。  -------"},
+    {"date": "2025-06-12", "token": "HOME", "token_display": "App (HOME)", "exchange": "Binance", "type": "spot", "time": "19:04", "notes": "📢 **Binance: Introducing DeFi App (HOME) on Binance HODLer Airdrops! Earn HOME With Retroactive BNB Simple Earn Subscriptions **  Binance: Binance HOD"},
+    {"date": "2025-06-12", "token": "FARTCOIN", "token_display": "Fartcoin (FARTCOIN)", "exchange": "Coinbase", "type": "perp", "time": "9:30 UTC", "notes": "📢 **CoinbaseInt Listing: We will add support for Fartcoin perpetual futures on Coinbase International Exchange and Coinbase Advanced. The opening of o"},
+    {"date": "2025-06-13", "token": "LA", "token_display": "Lagrange (LA)", "exchange": "OKX", "type": "perp", "time": "11:00", "notes": "📢 **OKX LISTING:OKX to list perpetual futures for LA, HOME crypto **  OKX LISTING:OKX将上线LA、HOME代币的永续合约  ---------- 🔗 [查看来源](https://www.okx.com/help/o"},
+    {"date": "2025-06-13", "token": "HOME", "token_display": "App (HOME)", "exchange": "OKX", "type": "perp", "time": "11:00", "notes": "📢 **OKX LISTING:OKX to list perpetual futures for LA, HOME crypto **  OKX LISTING:OKX将上线LA、HOME代币的永续合约  ---------- 🔗 [查看来源](https://www.okx.com/help/o"},
+    {"date": "2025-06-16", "token": "AAVE", "token_display": "AAVE", "exchange": "Binance", "type": "perp", "time": "14:45", "pairs": "AAVE/USD", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined AAVEUSDC and UNIUSDC Perpetual Contracts (2025-06-16) **  Binance Futures 将推出以美元稳定币Ⓢ结算的 AAVE/USDC 和 UNI/"},
+    {"date": "2025-06-16", "token": "UNI", "token_display": "UNI", "exchange": "Binance", "type": "perp", "time": "14:45", "pairs": "UNI/USD", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined AAVEUSDC and UNIUSDC Perpetual Contracts (2025-06-16) **  Binance Futures 将推出以美元稳定币Ⓢ结算的 AAVE/USDC 和 UNI/"},
+    {"date": "2025-06-16", "token": "HAEDAL", "token_display": "Protocol (HAEDAL)", "exchange": "Upbit", "type": "spot", "time": "17:04", "notes": "📢 **UPBIT LISTING:[Trade] Market Support for Haedal Protocol(HAEDAL) (BTC, USDT Market) **  UPBIT LISTING:[交易] Haedal协议（HAEDAL）获得市场支持（BTC、USDT市场）  ---"},
+    {"date": "2025-06-16", "token": "SPK", "token_display": "Spark (SPK)", "exchange": "Binance", "type": "spot", "time": "19:33", "notes": "📢 **Binance: Introducing Spark (SPK) on Binance HODLer Airdrops! Earn SPK With Retroactive BNB Simple Earn Subscriptions **  Binance: 在Binance HODLer空"},
+    {"date": "2025-06-16", "token": "SPK", "token_display": "SPK (Spark)", "exchange": "OKX", "type": "spot", "time": "23:00", "notes": "📢 **OKX LISTING:OKX to list SPK (Spark) for spot trading **  OKX LISTING:OKX将上线SPK（Spark）进行现货交易。  ---------- 🔗 [查看来源](https://www.okx.com/help/okx-to-"},
+    {"date": "2025-06-17", "token": "SPK", "token_display": "Spark (SPK)", "exchange": "Bybit", "type": "perp", "time": "17:24", "pairs": "SPK/USD", "notes": "📢 **BYBIT: New Listing :  SPKUSDT Perpetual Contract, with up to 25x leverage **  BYBIT: 新上架：SPK/USDT 永续合约，最高25倍杠杆。  ---------- 🔗 [查看来源](https://annou"},
+    {"date": "2025-06-17", "token": "BOMB", "token_display": "BOMB", "exchange": "Bybit", "type": "spot", "time": "17:31", "notes": "📢 **BYBIT: 🔥 Listing of BOMB on Convert **  BYBIT: 🔥 BOMB代币在Convert平台上线  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/-listing-of-bo"},
+    {"date": "2025-06-17", "token": "SPK", "token_display": "Spark (SPK)", "exchange": "Bithumb", "type": "spot", "time": "18:17", "notes": "📢 **Bithumb LISTING:[이벤트] 스파크(SPK) 원화 마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:[活动] 为庆祝SPARK（SPK）韩元市场上线，举办空投活动  ---------- 🔗 [查看来源](https://feed.bithumb."},
+    {"date": "2025-06-18", "token": "SPK", "token_display": "Spark (SPK)", "exchange": "Coinbase", "type": "spot", "time": "01:51", "notes": "📢 **Coinbase will add support for Spark (SPK) on the Ethereum network (ERC-20 Token). Do not send this asset over other networks or your funds may be "},
+    {"date": "2025-06-18", "token": "MYX", "token_display": "MYX", "exchange": "Binance", "type": "perp", "time": "17:51", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined MYXUSDT and FUSDT Perpetual Contracts (2025-06-18) **  币安期货将推出基于美元稳定币（USDT）的MYXUSDT和FUSDT永续合约，预计上线日期为202"},
+    {"date": "2025-06-19", "token": "RAY", "token_display": "Radium (RAY)", "exchange": "Upbit", "type": "spot", "time": "08:35", "notes": "📢 **UPBIT LISTING:[거래] 레이디움(RAY) KRW, USDT 마켓 디지털 자산 추가 **  UPBIT LISTING:[交易] Radium (RAY) 新增 KRW、USDT 市场 数字资产  ---------- 🕒 __2025-06-19 08:35:04__"},
+    {"date": "2025-06-19", "token": "HUMA", "token_display": "HUMA", "exchange": "Bithumb", "type": "spot", "time": "13:46", "notes": "📢 **Bithumb LISTING:[이벤트] 후마 파이낸스(HUMA), 포르타(FORT) 원화 마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:[活动] HUMA Finance（后马金融）庆祝FORT（音译为\\\\\\\\\\\\\\\\\\\\\\\\\\"},
+    {"date": "2025-06-19", "token": "FORT", "token_display": "FORT", "exchange": "Bithumb", "type": "spot", "time": "13:46", "notes": "📢 **Bithumb LISTING:[이벤트] 후마 파이낸스(HUMA), 포르타(FORT) 원화 마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:[活动] HUMA Finance（后马金融）庆祝FORT（音译为\\\\\\\\\\\\\\\\\\\\\\\\\\"},
+    {"date": "2025-06-19", "token": "SAHARA", "token_display": "AI (SAHARA)", "exchange": "OKX", "type": "spot", "time": "16:00", "notes": "📢 **OKX LISTING:OKX to list SAHARA (Sahara AI) for spot trading **  OKX LISTING:OKX将上线SAHARA（Sahara AI）的现货交易  ---------- 🔗 [查看来源](https://www.okx.com/"},
+    {"date": "2025-06-19", "token": "NEWT", "token_display": "Protocol (NEWT)", "exchange": "Binance", "type": "pre-market", "time": "19:01", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined NEWTUSDT Perpetual Contract Pre-Market Trading **  币安期货将推出以美元稳定币（USDT）为保证金支持的NEWTUSDT永续合约的预市场交易。  ------"},
+    {"date": "2025-06-19", "token": "SPK", "token_display": "Spark (SPK)", "exchange": "Coinbase", "type": "spot", "time": "9:30 UTC", "notes": "📢 **CoinbaseInt Listing: We will add support for Defi App and Spark perpetual futures on Coinbase International Exchange and Coinbase Advanced. The op"},
+    {"date": "2025-06-19", "token": "SPK", "token_display": "Spark (SPK)", "exchange": "Coinbase", "type": "perp", "time": "9:30 UTC", "notes": "📢 **CoinbaseInt Listing: We will add support for Defi App and Spark perpetual futures on Coinbase International Exchange and Coinbase Advanced. The op"},
+    {"date": "2025-06-19", "token": "RESOLV", "token_display": "RESOLV (Resolv)", "exchange": "Coinbase", "type": "spot", "time": "9:30 UTC", "notes": "📢 **CoinbaseInt Listing: We will add support for Resolv perpetual futures on Coinbase International Exchange and Coinbase Advanced. The opening of our"},
+    {"date": "2025-06-19", "token": "RESOLV", "token_display": "RESOLV (Resolv)", "exchange": "Coinbase", "type": "perp", "time": "9:30 UTC", "notes": "📢 **CoinbaseInt Listing: We will add support for Resolv perpetual futures on Coinbase International Exchange and Coinbase Advanced. The opening of our"},
+    {"date": "2025-06-20", "token": "NEWT", "token_display": "Protocol (NEWT)", "exchange": "Bybit", "type": "pre-market", "time": "10:30 UTC", "notes": "📢 **BYBIT: Listing of NEWTUSDT on Bybit Perpetual Pre-Market on Jun 20, 2025, 10:30AM UTC **  BYBIT: 2025年6月20日，UTC时间上午10:30，Bybit永续合约预上市市场将上线NEWTUSDT"},
+    {"date": "2025-06-20", "token": "SAHARA", "token_display": "AI (SAHARA)", "exchange": "Bybit", "type": "pre-market", "time": "12:30 UTC", "notes": "📢 **BYBIT: Listing of SAHARAUSDT on Bybit Perpetual Pre-Market on Jun 20, 2025, 12:30PM UTC **  BYBIT: SAHARA USDT将于2025年6月20日中午12:30（UTC时间）在Bybit永续合约"},
+    {"date": "2025-06-23", "token": "NEWT", "token_display": "Protocol (NEWT)", "exchange": "Binance", "type": "spot", "time": "22:08", "notes": "📢 **Binance: Introducing Newton Protocol (NEWT) on Binance HODLer Airdrops! Earn NEWT With Retroactive BNB Simple Earn Subscriptions **  Binance: 在 Bi"},
+    {"date": "2025-06-24", "token": "DMC", "token_display": "DeLorean (DMC)", "exchange": "Binance", "type": "perp", "time": "16:15", "notes": "📢 **Binance: DeLorean (DMC) Will Be Available on Binance Alpha and Binance Futures (2025-06-24) **  Binance: DeLorean (DMC) 将于2025年6月24日上线Binance Alph"},
+    {"date": "2025-06-24", "token": "NEWT", "token_display": "Protocol (NEWT)", "exchange": "Bithumb", "type": "spot", "time": "16:35", "notes": "📢 **Bithumb LISTING:[이벤트] 뉴턴 프로토콜(NEWT) 원화 마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:[活动] Newton协议(NEWT)韩元市场上线纪念空投活动  ---------- 🔗 [查看来源](https://feed.bit"},
+    {"date": "2025-06-24", "token": "PUMP", "token_display": "PUMP (Pump)", "exchange": "Bybit", "type": "spot", "time": "18:01", "notes": "📢 **BYBIT: Listing billboard — PUMPBTC **  BYBIT: 上线公告 — PUMPBTC  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/listing-billboard-pum"},
+    {"date": "2025-06-24", "token": "NEWT", "token_display": "Protocol (NEWT)", "exchange": "Bybit", "type": "spot", "time": "21:00", "notes": "📢 **BYBIT: 🔥 Listing of NEWT on Convert **  BYBIT: 🔥 NEWT 上架 Convert  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/-listing-of-newt-"},
+    {"date": "2025-06-24", "token": "NEWT", "token_display": "Protocol (NEWT)", "exchange": "Binance", "type": "spot", "time": "22:15", "notes": "📢 **Binance: Introducing Newton Protocol (NEWT): Trade NEWT to Grab a Share of the 2,000,000 NEWT Prize Pool! **  Binance: 介绍牛顿协议（NEWT）：交易NEWT即可瓜分2,00"},
+    {"date": "2025-06-24", "token": "SAHARA", "token_display": "AI (SAHARA)", "exchange": "Binance", "type": "spot", "time": "22:29", "notes": "📢 **Binance: Introducing Sahara AI (SAHARA) on Binance HODLer Airdrops! Earn SAHARA With Retroactive BNB Simple Earn Subscriptions **  Binance: 在Binan"},
+    {"date": "2025-06-25", "token": "NEWT", "token_display": "Newton (NEWT)", "exchange": "Coinbase", "type": "spot", "time": "00:48", "notes": "📢 **Coinbase will add support for Newton (NEWT) on the Ethereum network (ERC-20 Token). Do not send this asset over other networks or your funds may b"},
+    {"date": "2025-06-25", "token": "OL", "token_display": "OL", "exchange": "Binance", "type": "perp", "time": "17:30", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined OLUSDT Perpetual Contract (2025-06-25) **  Binance期货将推出以美元稳定币Ⓢ计价、面向2030的OLUSDT永续合约（2025-06-25发行）。  -----"},
+    {"date": "2025-06-26", "token": "SAHARA", "token_display": "AI (SAHARA)", "exchange": "Upbit", "type": "spot", "time": "10:40", "notes": "📢 **UPBIT LISTING:[거래] 사하라에이아이(SAHARA) 신규 거래지원 안내 (KRW, BTC, USDT 마켓) **  UPBIT LISTING:[交易] 新增支持SAHARA交易对的公告（KRW、BTC、USDT市场）  ---------- 🕒 __2025-06-"},
+    {"date": "2025-06-26", "token": "SAHARA", "token_display": "AI (SAHARA)", "exchange": "Bithumb", "type": "spot", "time": "10:59", "notes": "📢 **Bithumb LISTING:[마켓 추가] 사하라에이아이(SAHARA) 원화 마켓 추가 **  Bithumb LISTING:[添加市场] 在Sahara AI（SAHARA）中添加韩元市场。  ---------- 🔗 [查看来源](https://feed.bithumb.c"},
+    {"date": "2025-06-26", "token": "SAHARA", "token_display": "AI (SAHARA)", "exchange": "Bybit", "type": "spot", "time": "19:02", "notes": "📢 **BYBIT: 🔥 Listing of SAHARA on Convert **  BYBIT: 🔥 SAHARA代币已上线Convert交易平台  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/-listing"},
+    {"date": "2025-06-27", "token": "SYRUP", "token_display": "Finance (SYRUP)", "exchange": "Bithumb", "type": "spot", "time": "11:14", "notes": "📢 **Bithumb LISTING:메이플 파이낸스(SYRUP) 원화 마켓 추가 **  Bithumb LISTING:Maple Finance (SYRUP) 韩元市场已上线。  ---------- 🔗 [查看来源](https://feed.bithumb.com/notice/1"},
+    {"date": "2025-06-30", "token": "COINX", "token_display": "COINX", "exchange": "Bybit", "type": "spot", "time": "21:01", "notes": "📢 **BYBIT: 🔥 Listing of COINX on Convert & Bybit Savings **  BYBIT: 🔥 COINX 上线 Convert 及 Bybit 储蓄产品  ---------- 🔗 [查看来源](https://announcements.bybit.c"},
+    {"date": "2025-06-30", "token": "NVDAX", "token_display": "NVDAX", "exchange": "Bybit", "type": "spot", "time": "22:02", "notes": "📢 **BYBIT: 🔥  Listing of NVDAX on Convert & Bybit Savings **  BYBIT: 🔥 NVDAX 上线 Convert 和 Bybit Savings  ---------- 🔗 [查看来源](https://announcements.byb"},
+    {"date": "2025-07-01", "token": "FRAG", "token_display": "FRAG", "exchange": "Bybit", "type": "spot", "time": "16:00", "notes": "📢 **BYBIT: 🔥 Listing of FRAG on  Convert **  BYBIT: 🔥 FRAG上线 Convert  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/-listing-of-frag-"},
+    {"date": "2025-07-01", "token": "SPL", "token_display": "SPL", "exchange": "Coinbase", "type": "spot", "time": "23:55", "notes": "📢 **Coinbase will add support for Wormhole (W) on the Solana network (SPL token). Do not send this asset over other networks or your funds may be lost"},
+    {"date": "2025-07-03", "token": "SKY", "token_display": "Sky (SKY)", "exchange": "Coinbase", "type": "spot", "time": "06:42", "notes": "📢 **COINBASE LISTING: Assets added to the roadmap today: Sky (SKY) and USDS (USDS) **  COINBASE LISTING: 今日添加至路线图的资产：Sky（SKY）和USDS（USDS）。  ---------- "},
+    {"date": "2025-07-03", "token": "MOODENG", "token_display": "MOODENG", "exchange": "Upbit", "type": "spot", "time": "12:47", "notes": "📢 **UPBIT LISTING:[거래] 무뎅(MOODENG) 신규 거래지원 안내 (KRW, BTC, USDT 마켓) **  UPBIT LISTING:[交易] MOODENG新增交易支持通知（KRW, BTC, USDT市场）  ---------- 🕒 __2025-07-03 "},
+    {"date": "2025-07-03", "token": "ICNT", "token_display": "Network (ICNT)", "exchange": "Binance", "type": "perp", "time": "16:30", "notes": "📢 **Binance: Impossible Cloud Network (ICNT) Will Be Available on Binance Alpha and Binance Futures (2025-07-03) **  Binance: Impossible Cloud Network"},
+    {"date": "2025-07-03", "token": "ICNT", "token_display": "Network (ICNT)", "exchange": "Bybit", "type": "spot", "time": "17:01", "notes": "📢 **BYBIT: 🔥 Listing of ICNT on Convert **  BYBIT: 🔥 ICNT在Convert平台上线  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/-listing-of-icnt"},
+    {"date": "2025-07-03", "token": "OM", "token_display": "Mantra (OM)", "exchange": "Bithumb", "type": "spot", "time": "17:31", "notes": "📢 **Bithumb LISTING:[이벤트] 휴머니티 프로토콜(H), 만트라(OM) 원화 마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:[活动] 人类协议(H)、Mantra(OM)韩元市场上线纪念空投活动  ---------- 🔗 [查看来源](http"},
+    {"date": "2025-07-03", "token": "ICNT", "token_display": "Network (ICNT)", "exchange": "Bybit", "type": "perp", "time": "19:14", "notes": "📢 **BYBIT: New Listing: ICNTUSDT Perpetual Contract Jul 3, 2025 **  BYBIT: 新款上市：ICNTUSDT永续合约2025年7月3日  ---------- 🔗 [查看来源](https://announcements.bybit"},
+    {"date": "2025-07-03", "token": "SAHARA", "token_display": "AI (SAHARA)", "exchange": "Coinbase", "type": "spot", "time": "9:30 UTC", "notes": "📢 **CoinbaseInt Listing: We will add support for Sahara AI, and Maple Finance perpetual futures on Coinbase International Exchange and Coinbase Advanc"},
+    {"date": "2025-07-03", "token": "SAHARA", "token_display": "AI (SAHARA)", "exchange": "Coinbase", "type": "perp", "time": "9:30 UTC", "notes": "📢 **CoinbaseInt Listing: We will add support for Sahara AI, and Maple Finance perpetual futures on Coinbase International Exchange and Coinbase Advanc"},
+    {"date": "2025-07-03", "token": "SYRUP", "token_display": "Finance (SYRUP)", "exchange": "Coinbase", "type": "spot", "time": "9:30 UTC", "notes": "📢 **CoinbaseInt Listing: We will add support for Sahara AI, and Maple Finance perpetual futures on Coinbase International Exchange and Coinbase Advanc"},
+    {"date": "2025-07-03", "token": "SYRUP", "token_display": "Finance (SYRUP)", "exchange": "Coinbase", "type": "perp", "time": "9:30 UTC", "notes": "📢 **CoinbaseInt Listing: We will add support for Sahara AI, and Maple Finance perpetual futures on Coinbase International Exchange and Coinbase Advanc"},
+    {"date": "2025-07-04", "token": "BULLA", "token_display": "BULLA", "exchange": "Binance", "type": "perp", "time": "15:11", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined BULLAUSDT and IDOLUSDT Perpetual Contracts (2025-07-04) **  Binance 期货将推出以 USDⓈ 作为保证金的 BULLAUSDT 和 IDOLU"},
+    {"date": "2025-07-04", "token": "IDOL", "token_display": "IDOL", "exchange": "Binance", "type": "perp", "time": "15:11", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined BULLAUSDT and IDOLUSDT Perpetual Contracts (2025-07-04) **  Binance 期货将推出以 USDⓈ 作为保证金的 BULLAUSDT 和 IDOLU"},
+    {"date": "2025-07-09", "token": "TANSSI", "token_display": "Network (TANSSI)", "exchange": "Binance", "type": "perp", "time": "00:15", "notes": "📢 **Binance: Tanssi Network (TANSSI) Will Be Available on Binance Alpha and Binance Futures (2025-07-09) **  Binance: Tanssi Network (TANSSI) 将于 2025 "},
+    {"date": "2025-07-09", "token": "TANSSI", "token_display": "Network (TANSSI)", "exchange": "Bybit", "type": "perp", "time": "20:22", "notes": "📢 **BYBIT: New Listing : TANSSIUSDT Perpetual Contract in Innovation Zone, with up to 12.5x leverage **  BYBIT: 新产品上线：创新区推出 TANSSIUSDT 永续合约，最高支持 12.5 "},
+    {"date": "2025-07-09", "token": "LA", "token_display": "Lagrange (LA)", "exchange": "Binance", "type": "spot", "time": "22:21", "notes": "📢 **Binance: Lagrange (LA) Listing Will Be Postponed **  Binance: Lagrange (LA) 的上线计划将推迟。  ---------- 🔗 [查看来源](https://www.binance.com/en/support/arti"},
+    {"date": "2025-07-10", "token": "PUMP", "token_display": "PUMP (Pump)", "exchange": "Coinbase", "type": "spot", "time": "03:30", "notes": "📢 **CoinbaseInt Listing: We will add support for ****@pumpdotfun**** ****$PUMP**** pre-launch market on Coinbase International Exchange and Coinbase A"},
+    {"date": "2025-07-10", "token": "PUMP", "token_display": "PUMP (Pump)", "exchange": "Coinbase", "type": "perp", "time": "03:30", "notes": "📢 **CoinbaseInt Listing: We will add support for ****@pumpdotfun**** ****$PUMP**** pre-launch market on Coinbase International Exchange and Coinbase A"},
+    {"date": "2025-07-10", "token": "UTC", "token_display": "UTC", "exchange": "Coinbase", "type": "spot", "time": "03:30", "notes": "📢 **CoinbaseInt Listing: We will add support for ****@pumpdotfun**** ****$PUMP**** pre-launch market on Coinbase International Exchange and Coinbase A"},
+    {"date": "2025-07-10", "token": "UTC", "token_display": "UTC", "exchange": "Coinbase", "type": "perp", "time": "03:30", "notes": "📢 **CoinbaseInt Listing: We will add support for ****@pumpdotfun**** ****$PUMP**** pre-launch market on Coinbase International Exchange and Coinbase A"},
+    {"date": "2025-07-10", "token": "SKY", "token_display": "Sky (SKY)", "exchange": "Coinbase", "type": "spot", "time": "03:44", "notes": "📢 **Coinbase will add support for Sky (SKY) and USDS (USDS) on the Ethereum network (ERC-20 token). Do not send these assets over other networks or yo"},
+    {"date": "2025-07-10", "token": "HYPER", "token_display": "Hyperlane (HYPER)", "exchange": "Bithumb", "type": "spot", "time": "10:18", "notes": "📢 **Bithumb LISTING:[마켓 추가] 하이퍼레인(HYPER) 원화 마켓 추가 **  Bithumb LISTING:[市场新增] Hyperlane（HYPER）韩元市场上线  ---------- 🔗 [查看来源](https://feed.bithumb.com/noti"},
+    {"date": "2025-07-10", "token": "BABY", "token_display": "Babylon (BABY)", "exchange": "Upbit", "type": "spot", "time": "11:30", "notes": "📢 **UPBIT LISTING:[거래] 바빌론(BABY) 신규 거래지원 안내 (BTC, USDT 마켓) **  UPBIT LISTING:[交易] Babylon (BABY) 新增交易支持公告（BTC, USDT 市场）  ---------- 🕒 __2025-07-10 11:"},
+    {"date": "2025-07-10", "token": "LA", "token_display": "Lagrange (LA)", "exchange": "Binance", "type": "spot", "time": "14:32", "notes": "📢 **Binance: Introducing Lagrange (LA): Trade LA to Grab a Share of the 2,500,000 LA Prize Pool! **  Binance: Lagrange (LA) 上线公告： 交易 LA 瓜分 2,500,000 L"},
+    {"date": "2025-07-10", "token": "PUMP", "token_display": "PUMP (Pump)", "exchange": "Binance", "type": "pre-market", "time": "22:05", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined PUMPUSDT Perpetual Contract Pre-Market Trading (2025-07-10) **  Binance合约将推出以USDT计价的PUMP永续合约预市交易 (2025-0"},
+    {"date": "2025-07-10", "token": "PUMPFUN", "token_display": "PUMPFUN", "exchange": "Bybit", "type": "pre-market", "time": "5:00 UTC", "notes": "📢 **BYBIT: Listing of PUMPFUNUSDT on Bybit Perpetual Pre-Market on Jul 10, 2025, 5:00AM UTC **  BYBIT: PUMPFUNUSDT将于2025年7月10日北京时间上午5:00在Bybit永续合约预上市市"},
+    {"date": "2025-07-11", "token": "PUMP", "token_display": "PUMP (Pump)", "exchange": "OKX", "type": "pre-market", "time": "11:32", "notes": "📢 **OKX LISTING:OKX to list pre-market futures for PUMP (****Pump.fun****) crypto **  OKX LISTING:OKX即将上线PUMP（Pump.fun）的盘前期货交易。  ---------- 🔗 [查看来源](h"},
+    {"date": "2025-07-11", "token": "ENA", "token_display": "Etherea (ENA)", "exchange": "Upbit", "type": "spot", "time": "12:43", "notes": "📢 **UPBIT LISTING:[거래] 에테나(ENA) 신규 거래지원 안내 (KRW, BTC, USDT 마켓) **  UPBIT LISTING:[交易] 支持新币种 Etherea (ENA) 交易（KRW, BTC, USDT 市场）通知  ---------- 🕒 __2025"},
+    {"date": "2025-07-11", "token": "CROSS", "token_display": "CROSS", "exchange": "Binance", "type": "perp", "time": "15:18", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined CROSSUSDT and AINUSDT Perpetual Contracts (2025-07-11) **  Binance期货将推出以美元稳定币（USDⓈ）为保证金基础的CROSSUSDT和AINU"},
+    {"date": "2025-07-11", "token": "AIN", "token_display": "AIN", "exchange": "Binance", "type": "perp", "time": "15:18", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined CROSSUSDT and AINUSDT Perpetual Contracts (2025-07-11) **  Binance期货将推出以美元稳定币（USDⓈ）为保证金基础的CROSSUSDT和AINU"},
+    {"date": "2025-07-11", "token": "HYPE", "token_display": "HYPERLIQUID (HYPE)", "exchange": "Bybit", "type": "spot", "time": "16:00", "notes": "📢 **BYBIT: 🔥 Listing of HYPE on Convert & Bybit Savings **  BYBIT: 🔥 HYPE 代币已上线 Convert 和 Bybit 储蓄平台。  ---------- 🔗 [查看来源](https://announcements.bybit"},
+    {"date": "2025-07-11", "token": "RESOLV", "token_display": "Resolv (RESOLV)", "exchange": "Bithumb", "type": "spot", "time": "16:29", "notes": "📢 **Bithumb LISTING:[이벤트] 리졸브(RESOLV) 원화 마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:[活动] Resolv (RESOLV) 韩元市场上线纪念空投活动  ---------- 🔗 [查看来源](https://feed.bit"},
+    {"date": "2025-07-15", "token": "PUMP", "token_display": "PUMP (Pump)", "exchange": "Bybit", "type": "spot", "time": "05:30", "notes": "📢 **BYBIT: 🔥 Listing of PUMP on Convert **  BYBIT: 🔥 PUMP 上线 Convert 交易平台  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/-listing-of-"},
+    {"date": "2025-07-15", "token": "SPL", "token_display": "SPL", "exchange": "Coinbase", "type": "spot", "time": "08:39", "notes": "📢 **Coinbase will add support for  (PUMP) on the Solana network (SPL token). Do not send this asset over other networks or your funds may be lost. Tra"},
+    {"date": "2025-07-15", "token": "PUMP", "token_display": "PUMP (Pump)", "exchange": "Coinbase", "type": "spot", "time": "08:39", "notes": "📢 **Coinbase will add support for  (PUMP) on the Solana network (SPL token). Do not send this asset over other networks or your funds may be lost. Tra"},
+    {"date": "2025-07-15", "token": "VELVET", "token_display": "VELVET", "exchange": "Binance", "type": "perp", "time": "14:42", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined CUSDT and VELVETUSDT Perpetual Contracts (2025-07-15) **  Binance 期货将上线以 USDⓈ 计价结算的 CUSDT 和 VELVETUSDT 永"},
+    {"date": "2025-07-15", "token": "TAC", "token_display": "TAC", "exchange": "Bybit", "type": "spot", "time": "17:01", "notes": "📢 **BYBIT: 🔥 Listing of TAC on Convert **  BYBIT: TAC 已在 Convert 上架  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/-listing-of-tac-on"},
+    {"date": "2025-07-15", "token": "VELVET", "token_display": "VELVET", "exchange": "Bybit", "type": "perp", "time": "18:37", "notes": "📢 **BYBIT: New Listing : VELVETUSDT Perpetual Contract in Innovation Zone, with up to 12.5x leverage **  BYBIT: 新上线产品：VELVETUSDT永续合约，在创新区推出，最高支持12.5倍杠"},
+    {"date": "2025-07-16", "token": "ES", "token_display": "ES", "exchange": "Bithumb", "type": "spot", "time": "16:50", "notes": "📢 **Bithumb LISTING:[이벤트] 이클립스(ES) 원화 마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:[活动] 为庆祝Eclipse（ES）韩元市场上线，特别推出空投活动  ---------- 🔗 [查看来源](https://feed.bithu"},
+    {"date": "2025-07-16", "token": "ERA", "token_display": "Caldera (ERA)", "exchange": "Binance", "type": "spot", "time": "16:58", "notes": "📢 **Binance: Introducing Caldera (ERA) on Binance HODLer Airdrops! Earn ERA With Retroactive BNB Simple Earn Subscriptions **  Binance: 在Binance HODLe"},
+    {"date": "2025-07-17", "token": "SPX", "token_display": "SPX", "exchange": "OKX", "type": "perp", "time": "10:00", "notes": "📢 **OKX LISTING:OKX to list perpetual futures for SPX, MOG crypto **  OKX LISTING:OKX即将上线SPX和MOG加密永续合约  ---------- 🔗 [查看来源](https://www.okx.com/help/o"},
+    {"date": "2025-07-17", "token": "MOG", "token_display": "MOG", "exchange": "OKX", "type": "perp", "time": "10:00", "notes": "📢 **OKX LISTING:OKX to list perpetual futures for SPX, MOG crypto **  OKX LISTING:OKX即将上线SPX和MOG加密永续合约  ---------- 🔗 [查看来源](https://www.okx.com/help/o"},
+    {"date": "2025-07-17", "token": "ERA", "token_display": "Caldera (ERA)", "exchange": "Bithumb", "type": "spot", "time": "16:30", "notes": "📢 **Bithumb LISTING:[이벤트] 칼데라(ERA) 원화 마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:[活动] 庆祝 Caldera (ERA) 韩元市场新增的空投活动  ---------- 🔗 [查看来源](https://feed.bithum"},
+    {"date": "2025-07-17", "token": "ERA", "token_display": "Caldera (ERA)", "exchange": "Upbit", "type": "spot", "time": "17:01", "notes": "📢 **UPBIT LISTING:[거래] 칼데라(ERA) 신규 거래지원 안내 (KRW, BTC, USDT 마켓) **  UPBIT LISTING:[交易] 新增对Caldera (ERA)的交易支持公告（KRW, BTC, USDT市场）  ---------- 🕒 __2025-0"},
+    {"date": "2025-07-17", "token": "ERA", "token_display": "Caldera (ERA)", "exchange": "Bybit", "type": "spot", "time": "22:31", "notes": "📢 **BYBIT: 🔥 Listing of ERA on Convert **  BYBIT: 🔥 ERA在Convert平台上线  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/-listing-of-era-on"},
+    {"date": "2025-07-17", "token": "ERA", "token_display": "Caldera (ERA)", "exchange": "Binance", "type": "spot", "time": "23:03", "notes": "📢 **Binance Will Add Caldera (ERA) on Earn, Buy Crypto, Convert, Margin & Futures **  Binance 将在其 Earn、法币交易、闪兑、杠杆及期货平台上线 Caldera (ERA) 币种。  ----------"},
+    {"date": "2025-07-18", "token": "ERA", "token_display": "Caldera (ERA)", "exchange": "Coinbase", "type": "spot", "time": "00:53", "notes": "📢 **Coinbase will add support for Caldera (ERA) on the Ethereum network (ERC-20 Token). Do not send this asset over other networks or your funds may b"},
+    {"date": "2025-07-18", "token": "PUMP", "token_display": "PUMP (Pump)", "exchange": "OKX", "type": "spot", "time": "12:00", "notes": "📢 **OKX LISTING:OKX to list PUMP (Pump) for spot trading **  OKX LISTING:OKX将上线PUMP（Pump）进行现货交易。  ---------- 🔗 [查看来源](https://www.okx.com/help/okx-to-"},
+    {"date": "2025-07-18", "token": "ASPECTA", "token_display": "ASP (ASPECTA)", "exchange": "OKX", "type": "spot", "time": "16:00", "notes": "📢 **OKX LISTING:OKX to list ASP (ASPECTA) for spot trading **  OKX LISTING:OKX将上线ASP（ASPECTA）进行现货交易。  ---------- 🔗 [查看来源](https://www.okx.com/help/okx"},
+    {"date": "2025-07-21", "token": "TA", "token_display": "TA", "exchange": "Binance", "type": "perp", "time": "10:00", "notes": "📢 **Binance: ****Trusta.AI**** (TA) Will Be Available on Binance Alpha and Binance Futures (2025-07-21) **  Binance: Trusta.AI（TA）将于2025年7月21日在币安Alpha"},
+    {"date": "2025-07-21", "token": "STRIKE", "token_display": "STRIKE", "exchange": "Upbit", "type": "spot", "time": "15:00", "notes": "📢 **UPBIT LISTING:[거래] 스트라이크(STRIKE) 거래지원 종료 안내 (8/21 15:00) **  UPBIT LISTING:[交易] STRIKE（STRIKE）交易支持结束通知（8月21日 15:00）  ---------- 🕒 __2025-07-21 17:"},
+    {"date": "2025-07-21", "token": "TA", "token_display": "TA", "exchange": "Bybit", "type": "perp", "time": "17:28", "notes": "📢 **BYBIT: New Listing : TAUSDT Perpetual Contract in Innovation Zone, with up to 25x leverage **  BYBIT: 新上市：创新区 TAUSDT 永续合约，最高杠杆可达 25 倍。  ----------"},
+    {"date": "2025-07-22", "token": "BNKR", "token_display": "BankrCoin (BNKR)", "exchange": "Coinbase", "type": "spot", "time": "23:56", "notes": "📢 **COINBASE LISTING: Assets added to the roadmap today: BankrCoin (BNKR), Jito Staked SOL (JITOSOL), and Metaplex (MPLX) **  COINBASE LISTING: 今天加入路线"},
+    {"date": "2025-07-22", "token": "JITOSOL", "token_display": "SOL (JITOSOL)", "exchange": "Coinbase", "type": "spot", "time": "23:56", "notes": "📢 **COINBASE LISTING: Assets added to the roadmap today: BankrCoin (BNKR), Jito Staked SOL (JITOSOL), and Metaplex (MPLX) **  COINBASE LISTING: 今天加入路线"},
+    {"date": "2025-07-22", "token": "MPLX", "token_display": "Metaplex (MPLX)", "exchange": "Coinbase", "type": "spot", "time": "23:56", "notes": "📢 **COINBASE LISTING: Assets added to the roadmap today: BankrCoin (BNKR), Jito Staked SOL (JITOSOL), and Metaplex (MPLX) **  COINBASE LISTING: 今天加入路线"},
+    {"date": "2025-07-23", "token": "PENGU", "token_display": "PENGU", "exchange": "Binance", "type": "perp", "time": "14:00", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined PENGUUSDC, CVXUSDT and SLPUSDT Perpetual Contracts (2025-07-23) **  Binance合约将于2025年7月23日上线USDⓈ保证金交易的PEN"},
+    {"date": "2025-07-23", "token": "CVX", "token_display": "CVX", "exchange": "Binance", "type": "perp", "time": "14:00", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined PENGUUSDC, CVXUSDT and SLPUSDT Perpetual Contracts (2025-07-23) **  Binance合约将于2025年7月23日上线USDⓈ保证金交易的PEN"},
+    {"date": "2025-07-23", "token": "SLP", "token_display": "SLP", "exchange": "Binance", "type": "perp", "time": "14:00", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined PENGUUSDC, CVXUSDT and SLPUSDT Perpetual Contracts (2025-07-23) **  Binance合约将于2025年7月23日上线USDⓈ保证金交易的PEN"},
+    {"date": "2025-07-23", "token": "COA", "token_display": "COA", "exchange": "Bybit", "type": "spot", "time": "17:00", "notes": "📢 **BYBIT: 🔥 Listing of COA on Convert **  BYBIT: 🔥 COA 在 Convert 平台上线  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/-listing-of-coa"},
+    {"date": "2025-07-24", "token": "LISTA", "token_display": "LISTA", "exchange": "Bithumb", "type": "spot", "time": "10:56", "notes": "📢 **Bithumb LISTING:[마켓 추가] 리스타 다오(LISTA), 멀린 체인(MERL) 원화 마켓 추가 **  Bithumb LISTING:[市场新增] 添加 LISTA DAO 和 MERL Chain 的韩元市场。  ---------- 🔗 [查看来源](https"},
+    {"date": "2025-07-24", "token": "MERL", "token_display": "MERL", "exchange": "Bithumb", "type": "spot", "time": "14:30", "notes": "📢 **Bithumb LISTING:[이벤트] 멀린 체인(MERL) 원화 마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:[活动] 为纪念Merlin Chain（MERL）上线韩元市场，举办空投活动。  ---------- 🔗 [查看来源](https://f"},
+    {"date": "2025-07-24", "token": "ERA", "token_display": "Caldera (ERA)", "exchange": "Coinbase", "type": "spot", "time": "9:30 UTC", "notes": "📢 **CoinbaseInt Listing: We will add support for Caldera, and SushiSwap perpetual futures on Coinbase International Exchange and Coinbase Advanced. Th"},
+    {"date": "2025-07-24", "token": "ERA", "token_display": "Caldera (ERA)", "exchange": "Coinbase", "type": "perp", "time": "9:30 UTC", "notes": "📢 **CoinbaseInt Listing: We will add support for Caldera, and SushiSwap perpetual futures on Coinbase International Exchange and Coinbase Advanced. Th"},
+    {"date": "2025-07-24", "token": "SUSHI", "token_display": "SUSHI", "exchange": "Coinbase", "type": "spot", "time": "9:30 UTC", "notes": "📢 **CoinbaseInt Listing: We will add support for Caldera, and SushiSwap perpetual futures on Coinbase International Exchange and Coinbase Advanced. Th"},
+    {"date": "2025-07-24", "token": "SUSHI", "token_display": "SUSHI", "exchange": "Coinbase", "type": "perp", "time": "9:30 UTC", "notes": "📢 **CoinbaseInt Listing: We will add support for Caldera, and SushiSwap perpetual futures on Coinbase International Exchange and Coinbase Advanced. Th"},
+    {"date": "2025-07-25", "token": "HUMA", "token_display": "HUMA", "exchange": "Upbit", "type": "spot", "time": "10:19", "notes": "📢 **UPBIT LISTING:후마파이낸스(HUMA) 신규 거래지원 안내 (BTC, USDT 마켓) **  UPBIT LISTING:后支付金融（HUMA）新增交易支持通知（BTC、USDT 市场）  ---------- 🔗 [查看来源](https://upbit.com/ser"},
+    {"date": "2025-07-25", "token": "SYRUP", "token_display": "Finance (SYRUP)", "exchange": "Upbit", "type": "spot", "time": "10:19", "notes": "📢 **UPBIT LISTING:[거래] 메이플파이낸스(SYRUP) 신규 거래지원 안내 (KRW, BTC, USDT 마켓) **  UPBIT LISTING:[交易] Maple Finance (SYRUP) 新交易支持指南（KRW、BTC、USDT 市场）  ----------"},
+    {"date": "2025-07-25", "token": "USELESS", "token_display": "Coin (USELESS)", "exchange": "OKX", "type": "perp", "time": "16:00", "notes": "📢 **OKX LISTING:OKX to list perpetual futures for USELESS, NEWT crypto **  OKX LISTING:OKX 将上线 USELESS 和 NEWT 加密货币的永续合约。  ---------- 🔗 [查看来源](https://"},
+    {"date": "2025-07-25", "token": "NEWT", "token_display": "Protocol (NEWT)", "exchange": "OKX", "type": "perp", "time": "16:00", "notes": "📢 **OKX LISTING:OKX to list perpetual futures for USELESS, NEWT crypto **  OKX LISTING:OKX 将上线 USELESS 和 NEWT 加密货币的永续合约。  ---------- 🔗 [查看来源](https://"},
+    {"date": "2025-07-25", "token": "ZORA", "token_display": "ZORA", "exchange": "Binance", "type": "perp", "time": "17:45", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined ZORAUSDT and TAGUSDT Perpetual Contracts (2025-07-25) **  Binance期货将推出以USDⓈ为保证金的ZORAUSDT和TAGUSDT永续合约（发布日"},
+    {"date": "2025-07-25", "token": "TAG", "token_display": "TAG", "exchange": "Binance", "type": "perp", "time": "17:45", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined ZORAUSDT and TAGUSDT Perpetual Contracts (2025-07-25) **  Binance期货将推出以USDⓈ为保证金的ZORAUSDT和TAGUSDT永续合约（发布日"},
+    {"date": "2025-07-26", "token": "RSC", "token_display": "ResearchCoin (RSC)", "exchange": "Coinbase", "type": "spot", "time": "00:04", "notes": "📢 **COINBASE LISTING: Assets added to the roadmap today: ResearchCoin (RSC) **  COINBASE LISTING: 今日添加至路线图的资产：ResearchCoin（RSC）  ---------- 🔗 [查看来源](h"},
+    {"date": "2025-07-28", "token": "OP", "token_display": "OP", "exchange": "Upbit", "type": "spot", "time": "12:24", "notes": "📢 **UPBIT LISTING:[거래] 옵티미즘(OP) 신규 거래지원 안내 (KRW, BTC, USDT 마켓) **  UPBIT LISTING:[交易] 开启Optimism（OP）新交易支持（KRW、BTC、USDT市场）  ---------- 🕒 __2025-07-28 1"},
+    {"date": "2025-07-29", "token": "BIO", "token_display": "Protocol (BIO)", "exchange": "Coinbase", "type": "spot", "time": "06:13", "notes": "📢 **COINBASE LISTING: Assets added to the roadmap today: Bio Protocol (BIO) and Euler (EUL) **  COINBASE LISTING: 今日列入路线图的资产：Bio Protocol (BIO) 和 Eule"},
+    {"date": "2025-07-29", "token": "EUL", "token_display": "Euler (EUL)", "exchange": "Coinbase", "type": "spot", "time": "06:13", "notes": "📢 **COINBASE LISTING: Assets added to the roadmap today: Bio Protocol (BIO) and Euler (EUL) **  COINBASE LISTING: 今日列入路线图的资产：Bio Protocol (BIO) 和 Eule"},
+    {"date": "2025-07-29", "token": "ZRC", "token_display": "ZRC", "exchange": "Binance", "type": "perp", "time": "15:46", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined ZRCUSDT and ESPORTSUSDT Perpetual Contracts (2025-07-29) **  币安期货将于2025年7月29日推出以 USDT 作为保证金的 ZRCUSDT 和 E"},
+    {"date": "2025-07-29", "token": "ESPORTS", "token_display": "ESPORTS", "exchange": "Binance", "type": "perp", "time": "15:46", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined ZRCUSDT and ESPORTSUSDT Perpetual Contracts (2025-07-29) **  币安期货将于2025年7月29日推出以 USDT 作为保证金的 ZRCUSDT 和 E"},
+    {"date": "2025-07-30", "token": "TREE", "token_display": "Treehouse (TREE)", "exchange": "Coinbase", "type": "spot", "time": "02:40", "notes": "📢 **Coinbase will add support for Treehouse (TREE) on the Ethereum network (ERC-20 token). Do not send this asset over other networks or your funds ma"},
+    {"date": "2025-07-30", "token": "BNKR", "token_display": "BankrCoin (BNKR)", "exchange": "Coinbase", "type": "spot", "time": "03:11", "notes": "📢 **Coinbase will add support for BankrCoin (BNKR) on the Base network. Do not send this asset over other networks or your funds may be lost. Transfer"},
+    {"date": "2025-07-30", "token": "TUNA", "token_display": "TUNA", "exchange": "Bybit", "type": "spot", "time": "22:02", "notes": "📢 **BYBIT: 🔥 Listing of TUNA on Convert **  BYBIT: 🔥 TUNA上架Convert  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/-listing-of-tuna-on"},
+    {"date": "2025-07-31", "token": "BIO", "token_display": "Protocol (BIO)", "exchange": "Coinbase", "type": "spot", "time": "00:26", "notes": "📢 **Coinbase will add support for Bio Protocol (BIO) on the Ethereum network (ERC-20 token). Do not send this asset over other networks or your funds "},
+    {"date": "2025-07-31", "token": "RSC", "token_display": "ResearchCoin (RSC)", "exchange": "Coinbase", "type": "spot", "time": "00:28", "notes": "📢 **Coinbase will add support for ResearchCoin (RSC) on the Base network. Do not send this asset over other networks or your funds may be lost. Transf"},
+    {"date": "2025-07-31", "token": "NAORIS", "token_display": "Protocol (NAORIS)", "exchange": "Binance", "type": "perp", "time": "17:30", "notes": "📢 **Binance: Naoris Protocol (NAORIS) Will Be Available on Binance Alpha and Binance Futures (2025-07-31) **  Binance: Naoris Protocol (NAORIS) 将于2025"},
+    {"date": "2025-07-31", "token": "PLAY", "token_display": "PlaysOut (PLAY)", "exchange": "Binance", "type": "perp", "time": "17:45", "notes": "📢 **Binance: PlaysOut (PLAY) Will Be Available on Binance Alpha and Binance Futures (2025-07-31) **  Binance: PlaysOut (PLAY) 将于2025年7月31日在Binance Alp"},
+    {"date": "2025-08-04", "token": "TOWNS", "token_display": "Towns (TOWNS)", "exchange": "Binance", "type": "spot", "time": "17:12", "notes": "📢 **Binance: Introducing Towns (TOWNS) on Binance HODLer Airdrops! Earn TOWNS With Retroactive BNB Simple Earn Subscriptions **  Binance: 在币安HODLer空投活"},
+    {"date": "2025-08-05", "token": "PROVE", "token_display": "Succinct (PROVE)", "exchange": "Coinbase", "type": "spot", "time": "19:00 UTC", "notes": "📢 **CoinbaseInt Listing: We will add support for Succinct perpetual futures on Coinbase International Exchange and Coinbase Advanced. The opening of o"},
+    {"date": "2025-08-05", "token": "PROVE", "token_display": "Succinct (PROVE)", "exchange": "Coinbase", "type": "perp", "time": "19:00 UTC", "notes": "📢 **CoinbaseInt Listing: We will add support for Succinct perpetual futures on Coinbase International Exchange and Coinbase Advanced. The opening of o"},
+    {"date": "2025-08-05", "token": "TOWNS", "token_display": "Towns (TOWNS)", "exchange": "Coinbase", "type": "spot", "time": "19:00 UTC", "notes": "📢 **CoinbaseInt Listing: We will add support for Towns Protocol perpetual futures on Coinbase International Exchange and Coinbase Advanced. The openin"},
+    {"date": "2025-08-05", "token": "TOWNS", "token_display": "Towns (TOWNS)", "exchange": "Coinbase", "type": "perp", "time": "19:00 UTC", "notes": "📢 **CoinbaseInt Listing: We will add support for Towns Protocol perpetual futures on Coinbase International Exchange and Coinbase Advanced. The openin"},
+    {"date": "2025-08-05", "token": "TOWNS", "token_display": "WISDOM (TOWNS)", "exchange": "Bybit", "type": "spot", "time": "21:30", "notes": "📢 **BYBIT: 🔥 Listing of TOWNS on Convert & Bybit Savings **  BYBIT: 🔥 TOKEN OF WISDOM (TOWNS) 上线 Convert 和 Bybit 理财产品  ---------- 🔗 [查看来源](https://ann"},
+    {"date": "2025-08-05", "token": "TOWNS", "token_display": "Towns (TOWNS)", "exchange": "Binance", "type": "spot", "time": "21:59", "notes": "📢 **Binance Will Add Towns (TOWNS) and Succinct (PROVE) on Earn, Buy Crypto, Convert, Margin & Futures **  Binance将在Earn、购买加密货币、兑换、杠杆和期货交易中上线Towns（TOW"},
+    {"date": "2025-08-05", "token": "PROVE", "token_display": "Succinct (PROVE)", "exchange": "Binance", "type": "spot", "time": "21:59", "notes": "📢 **Binance Will Add Towns (TOWNS) and Succinct (PROVE) on Earn, Buy Crypto, Convert, Margin & Futures **  Binance将在Earn、购买加密货币、兑换、杠杆和期货交易中上线Towns（TOW"},
+    {"date": "2025-08-05", "token": "TOWNS", "token_display": "Towns (TOWNS)", "exchange": "Bybit", "type": "perp", "time": "22:48", "notes": "📢 **BYBIT: New Listing :  TOWNSUSDT Perpetual Contract, with up to 50x leverage **  BYBIT: 新上线：TOWNSUSDT永续合约，最高支持50倍杠杆  ---------- 🔗 [查看来源](https://an"},
+    {"date": "2025-08-05", "token": "MAMO", "token_display": "Mamo (MAMO)", "exchange": "Coinbase", "type": "spot", "time": "23:54", "notes": "📢 **Coinbase will add support for Mamo (MAMO) on the Base network. Do not send this asset over other networks or your funds may be lost. Transfers for"},
+    {"date": "2025-08-06", "token": "EUL", "token_display": "Euler (EUL)", "exchange": "Coinbase", "type": "spot", "time": "00:01", "notes": "📢 **Coinbase will add support for Euler (EUL) on the Ethereum network (ERC-20 token). Do not send this asset over other networks or your funds may be "},
+    {"date": "2025-08-06", "token": "PROVE", "token_display": "Succinct (PROVE)", "exchange": "Coinbase", "type": "spot", "time": "00:07", "notes": "📢 **Coinbase will add support for Succinct (PROVE) on the Ethereum network (ERC-20 token). Do not send this asset over other networks or your funds ma"},
+    {"date": "2025-08-06", "token": "TOWNS", "token_display": "Protocol (TOWNS)", "exchange": "Coinbase", "type": "spot", "time": "00:46", "notes": "📢 **Coinbase will add support for Towns Protocol (TOWNS) on the Base network. Do not send this asset over other networks or your funds may be lost. Tr"},
+    {"date": "2025-08-06", "token": "PROVE", "token_display": "Succinct (PROVE)", "exchange": "Bybit", "type": "perp", "time": "01:13", "notes": "📢 **BYBIT: New Listing :  PROVEUSDT Perpetual Contract, with up to 25x leverage **  BYBIT: 新上币种：PROVEUSDT 永续合约，最高支持 25 倍杠杆  ---------- 🔗 [查看来源](https:"},
+    {"date": "2025-08-06", "token": "PROVE", "token_display": "Succinct (PROVE)", "exchange": "Upbit", "type": "spot", "time": "11:20", "notes": "📢 **UPBIT LISTING:[거래] 서싱트(PROVE) 신규 거래지원 안내 (KRW, BTC, USDT 마켓) **  UPBIT LISTING:[交易] 关于支持新交易对的通知(PROVE)（KRW, BTC, USDT 市场）  ---------- 🕒 __2025-08-"},
+    {"date": "2025-08-06", "token": "PROVE", "token_display": "Succinct (PROVE)", "exchange": "Bithumb", "type": "spot", "time": "12:06", "notes": "📢 **Bithumb LISTING:[이벤트] 석싱트(PROVE) 원화 마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:[活动] 为庆祝PROVE韩元市场上线，将举行空投活动。  ---------- 🔗 [查看来源](https://feed.bithumb.c"},
+    {"date": "2025-08-06", "token": "APR", "token_display": "Priori (APR)", "exchange": "Binance", "type": "spot", "time": "13:59", "notes": "📢 **Binance Earn New Listing Special Offer: Subscribe to PROVE Locked Products to Enjoy 200% APR for 7 Days! **  币安理财新上架限时特惠：订阅PROVE锁仓产品，即可享受7天高达200%年"},
+    {"date": "2025-08-06", "token": "COSMOSDYDX", "token_display": "YdX (COSMOSDYDX)", "exchange": "Coinbase", "type": "spot", "time": "23:56", "notes": "📢 **Coinbase will add support for dYdX (COSMOSDYDX) on the dYdX network. Do not send this asset over other networks or your funds may be lost. Transfe"},
+    {"date": "2025-08-07", "token": "IN", "token_display": "INFINIT (IN)", "exchange": "Binance", "type": "perp", "time": "17:30", "notes": "📢 **Binance: INFINIT (IN) Will Be Available on Binance Alpha and Binance Futures (2025-08-07) **  Binance: INFINIT (IN) 将于2025年8月7日上线币安Alpha和币安合约平台。  "},
+    {"date": "2025-08-07", "token": "YALA", "token_display": "YALA", "exchange": "Binance", "type": "perp", "time": "22:57", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined YALAUSDT and CARVUSDT Perpetual Contracts (2025-08-07) **  Binance 期货将于 2025 年 8 月 7 日上线以美元Ⓢ保证金交易的 YALAU"},
+    {"date": "2025-08-07", "token": "CARV", "token_display": "CARV", "exchange": "Binance", "type": "perp", "time": "22:57", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined YALAUSDT and CARVUSDT Perpetual Contracts (2025-08-07) **  Binance 期货将于 2025 年 8 月 7 日上线以美元Ⓢ保证金交易的 YALAU"},
+    {"date": "2025-08-08", "token": "IP", "token_display": "IP", "exchange": "Upbit", "type": "spot", "time": "10:09", "notes": "📢 **UPBIT LISTING:[거래] 스토리(IP) 신규 거래지원 안내 (KRW, BTC, USDT 마켓) **  UPBIT LISTING:[交易] 支持新故事(IP)交易市场 (KRW, BTC, USDT 市场)  ---------- 🕒 __2025-08-08 10:0"},
+    {"date": "2025-08-08", "token": "TREE", "token_display": "TreeHouse (TREE)", "exchange": "Bithumb", "type": "spot", "time": "13:45", "notes": "📢 **Bithumb LISTING:트리하우스(TREE) 원화 마켓 추가 **  Bithumb LISTING:TreeHouse (TREE) 已新增韩元交易市场。  ---------- 🔗 [查看来源](https://feed.bithumb.com/notice/1649497)"},
+    {"date": "2025-08-11", "token": "SLAY", "token_display": "SLAY", "exchange": "Bybit", "type": "spot", "time": "18:00", "notes": "📢 **BYBIT: 🔥 Listing of SLAY on Convert **  BYBIT: 🔥 SLAY在Convert平台上线  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/-listing-of-slay"},
+    {"date": "2025-08-12", "token": "CYBER", "token_display": "Cyber (CYBER)", "exchange": "Upbit", "type": "spot", "time": "15:29", "notes": "📢 **UPBIT LISTING:[거래] 사이버(CYBER) KRW, USDT 마켓 디지털 자산 추가 **  UPBIT LISTING:[交易] Cyber (CYBER) 韩元、USDT市场新增加密货币资产  ---------- 🕒 __2025-08-12 15:29:52__"},
+    {"date": "2025-08-13", "token": "WCT", "token_display": "Token (WCT)", "exchange": "Coinbase", "type": "spot", "time": "02:52", "notes": "📢 **COINBASE LISTING: Assets added to the roadmap today: WalletConnect Token (WCT) **  COINBASE LISTING: 今日加入路线图的资产：WalletConnect代币（WCT）  ---------- 🔗"},
+    {"date": "2025-08-13", "token": "TOWNS", "token_display": "Towns (TOWNS)", "exchange": "Bithumb", "type": "spot", "time": "09:41", "notes": "📢 **Bithumb LISTING:타운즈(TOWNS) 원화 마켓 추가 **  Bithumb LISTING:TOWNS现已上线韩元市场。  ---------- 🔗 [查看来源](https://feed.bithumb.com/notice/1649534) 🕒 __2025-08-1"},
+    {"date": "2025-08-13", "token": "BF", "token_display": "BF", "exchange": "Binance", "type": "spot", "time": "10:59", "notes": "📢 **Binance Will List BFUSD and Introduce BFUSD Zero Trading Fee Promotion **  Binance 将上线 BFUSD 并推出 BFUSD 零交易手续费促销活动。  ---------- 🔗 [查看来源](https://ww"},
+    {"date": "2025-08-13", "token": "AIO", "token_display": "AIO", "exchange": "Binance", "type": "perp", "time": "17:40", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined AIOUSDT and XNYUSDT Perpetual Contracts (2025-08-13) **  Binance 期货将推出以 USDT 为保证金的 AIOUSDT 和 XNYUSDT 永续合"},
+    {"date": "2025-08-13", "token": "XNY", "token_display": "XNY", "exchange": "Binance", "type": "perp", "time": "17:40", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined AIOUSDT and XNYUSDT Perpetual Contracts (2025-08-13) **  Binance 期货将推出以 USDT 为保证金的 AIOUSDT 和 XNYUSDT 永续合"},
+    {"date": "2025-08-13", "token": "XNY", "token_display": "XNY", "exchange": "Bybit", "type": "perp", "time": "21:44", "notes": "📢 **BYBIT: New Listing : XNYUSDT Perpetual Contract in Innovation Zone, with up to 25x leverage **  BYBIT: 上新：创新区新增XNYUSDT永续合约，最高支持25倍杠杆交易。  ---------"},
+    {"date": "2025-08-14", "token": "USELESS", "token_display": "Coin (USELESS)", "exchange": "Coinbase", "type": "spot", "time": "03:25", "notes": "📢 **COINBASE LISTING: Assets added to the roadmap today: Useless Coin (USELESS) **  COINBASE LISTING: 今日新增至路线图的资产：无用币（USELESS）  ---------- 🔗 [查看来源](ht"},
+    {"date": "2025-08-14", "token": "WCT", "token_display": "Token (WCT)", "exchange": "Coinbase", "type": "spot", "time": "04:00", "notes": "📢 **Coinbase will add support for WalletConnect Token (WCT) on the Optimism network. Do not send this asset over other networks or your funds may be l"},
+    {"date": "2025-08-15", "token": "USELESS", "token_display": "Coin (USELESS)", "exchange": "Binance", "type": "perp", "time": "18:46", "pairs": "USELESS/USD", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined USELESSUSDT Perpetual Contract (2025-08-15) **  Binance 期货将推出以 USDT 为保证金的 USELESS/USDT 永续合约（2025 年 8 月 1"},
+    {"date": "2025-08-18", "token": "PLUME", "token_display": "Plume (PLUME)", "exchange": "Binance", "type": "spot", "time": "17:36", "notes": "📢 **Binance: Introducing Plume (PLUME) on Binance HODLer Airdrops! Earn PLUME With Retroactive BNB Simple Earn Subscriptions **  Binance: 在Binance HOD"},
+    {"date": "2025-08-18", "token": "DAM", "token_display": "DAM", "exchange": "Bybit", "type": "perp", "time": "21:03", "notes": "📢 **BYBIT: New Listing : DAMUSDT Perpetual Contract in Innovation Zone, with up to 20x leverage **  BYBIT: 新上线：创新区推出DAMUSDT永续合约，最高支持20倍杠杆。  ----------"},
+    {"date": "2025-08-19", "token": "BIO", "token_display": "Protocol (BIO)", "exchange": "Bithumb", "type": "spot", "time": "11:29", "notes": "📢 **Bithumb LISTING:바이오 프로토콜(BIO) 원화 마켓 추가 **  Bithumb LISTING:Bio Protocol (BIO) 增加韩元市场  ---------- 🔗 [查看来源](https://feed.bithumb.com/notice/1649599)"},
+    {"date": "2025-08-19", "token": "USELESS", "token_display": "Coin (USELESS)", "exchange": "Coinbase", "type": "spot", "time": "23:49", "notes": "📢 **Coinbase will add support for Useless Coin (USELESS) on the Solana network (SPL token). Do not send this asset over other networks or your funds m"},
+    {"date": "2025-08-19", "token": "SPL", "token_display": "SPL", "exchange": "Coinbase", "type": "spot", "time": "23:49", "notes": "📢 **Coinbase will add support for Useless Coin (USELESS) on the Solana network (SPL token). Do not send this asset over other networks or your funds m"},
+    {"date": "2025-08-20", "token": "SAPIEN", "token_display": "Sapien (SAPIEN)", "exchange": "Binance", "type": "perp", "time": "11:14", "notes": "📢 **Binance: Sapien (SAPIEN) Will Be Available on Binance Alpha and Binance Futures (2025-08-20) **  Binance: Sapien (SAPIEN) 将于2025年8月20日在币安Alpha和币安期"},
+    {"date": "2025-08-20", "token": "CUDIS", "token_display": "CUDIS", "exchange": "Binance", "type": "perp", "time": "17:48", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined CUDISUSDT Perpetual Contract (2025-08-20) **  Binance期货将推出以USDT计价的CUDI/USDT永续合约（2025-08-20到期）  ---------"},
+    {"date": "2025-08-21", "token": "SAPIEN", "token_display": "Sapien (SAPIEN)", "exchange": "Coinbase", "type": "spot", "time": "02:33", "notes": "📢 **Coinbase will add support for Sapien (SAPIEN) on the Base network. Do not send this asset over other networks or your funds may be lost. Transfers"},
+    {"date": "2025-08-21", "token": "AWE", "token_display": "Network (AWE)", "exchange": "Coinbase", "type": "spot", "time": "05:30", "notes": "📢 **COINBASE LISTING: Assets added to the roadmap today: AWE Network (AWE), Dolomite (DOLO), Flock (FLOCK), Solayer (LAYER), and SPX6900 (SPX) **  COI"},
+    {"date": "2025-08-21", "token": "DOLO", "token_display": "Dolomite (DOLO)", "exchange": "Coinbase", "type": "spot", "time": "05:30", "notes": "📢 **COINBASE LISTING: Assets added to the roadmap today: AWE Network (AWE), Dolomite (DOLO), Flock (FLOCK), Solayer (LAYER), and SPX6900 (SPX) **  COI"},
+    {"date": "2025-08-21", "token": "FLOCK", "token_display": "Flock (FLOCK)", "exchange": "Coinbase", "type": "spot", "time": "05:30", "notes": "📢 **COINBASE LISTING: Assets added to the roadmap today: AWE Network (AWE), Dolomite (DOLO), Flock (FLOCK), Solayer (LAYER), and SPX6900 (SPX) **  COI"},
+    {"date": "2025-08-21", "token": "LAYER", "token_display": "Solayer (LAYER)", "exchange": "Coinbase", "type": "spot", "time": "05:30", "notes": "📢 **COINBASE LISTING: Assets added to the roadmap today: AWE Network (AWE), Dolomite (DOLO), Flock (FLOCK), Solayer (LAYER), and SPX6900 (SPX) **  COI"},
+    {"date": "2025-08-21", "token": "SPX", "token_display": "SPX", "exchange": "Coinbase", "type": "spot", "time": "05:30", "notes": "📢 **COINBASE LISTING: Assets added to the roadmap today: AWE Network (AWE), Dolomite (DOLO), Flock (FLOCK), Solayer (LAYER), and SPX6900 (SPX) **  COI"},
+    {"date": "2025-08-21", "token": "APR", "token_display": "Priori (APR)", "exchange": "Binance", "type": "spot", "time": "10:00", "notes": "📢 **Binance Earn New Listing Special Offer: Subscribe to PLUME Locked Products to Enjoy 200% APR for 7 Days! **  币安理财新币上线特惠：认购PLUME定期产品，享7天200%年化收益！  "},
+    {"date": "2025-08-21", "token": "YZY", "token_display": "YZY", "exchange": "Hyperliquid", "type": "perp", "time": "11:13", "pairs": "YZY/USD", "notes": "📢 **【hyperliquid】 新上线YZY/USDC永续合约，最高可达3倍杠杆 **  【Hyperliquid】 新上线 YZY/USDC 永续合约，最高支持 3 倍杠杆。  ---------- 🕒 __2025-08-21 11:13:20__"},
+    {"date": "2025-08-21", "token": "YZY", "token_display": "YZY", "exchange": "Bybit", "type": "perp", "time": "12:38", "notes": "📢 **BYBIT: New Listing :  YZYUSDT Perpetual Contract, with up to 25x leverage **  BYBIT: 新上线: YZYUSDT 永续合约, 支持最高25倍杠杆。  ---------- 🔗 [查看来源](https://an"},
+    {"date": "2025-08-21", "token": "MNT", "token_display": "MNT", "exchange": "Coinbase", "type": "spot", "time": "9:30 UTC", "notes": "📢 **CoinbaseInt Listing: We will add support for Mantle, Reserve Rights, and SuperVerse perpetual futures on Coinbase International Exchange and Coinb"},
+    {"date": "2025-08-21", "token": "MNT", "token_display": "MNT", "exchange": "Coinbase", "type": "perp", "time": "9:30 UTC", "notes": "📢 **CoinbaseInt Listing: We will add support for Mantle, Reserve Rights, and SuperVerse perpetual futures on Coinbase International Exchange and Coinb"},
+    {"date": "2025-08-21", "token": "RSR", "token_display": "RSR", "exchange": "Coinbase", "type": "spot", "time": "9:30 UTC", "notes": "📢 **CoinbaseInt Listing: We will add support for Mantle, Reserve Rights, and SuperVerse perpetual futures on Coinbase International Exchange and Coinb"},
+    {"date": "2025-08-21", "token": "RSR", "token_display": "RSR", "exchange": "Coinbase", "type": "perp", "time": "9:30 UTC", "notes": "📢 **CoinbaseInt Listing: We will add support for Mantle, Reserve Rights, and SuperVerse perpetual futures on Coinbase International Exchange and Coinb"},
+    {"date": "2025-08-21", "token": "SUPER", "token_display": "SUPER", "exchange": "Coinbase", "type": "spot", "time": "9:30 UTC", "notes": "📢 **CoinbaseInt Listing: We will add support for Mantle, Reserve Rights, and SuperVerse perpetual futures on Coinbase International Exchange and Coinb"},
+    {"date": "2025-08-21", "token": "SUPER", "token_display": "SUPER", "exchange": "Coinbase", "type": "perp", "time": "9:30 UTC", "notes": "📢 **CoinbaseInt Listing: We will add support for Mantle, Reserve Rights, and SuperVerse perpetual futures on Coinbase International Exchange and Coinb"},
+    {"date": "2025-08-22", "token": "AERO", "token_display": "Finance (AERO)", "exchange": "Upbit", "type": "spot", "time": "08:29", "notes": "📢 **UPBIT LISTING:[거래] 에어로드롬파이낸스(AERO) 신규 거래지원 안내 (KRW, BTC, USDT 마켓) **  UPBIT LISTING:[交易] Aerodrome Finance (AERO) 新交易支援通知（KRW, BTC, USDT 市场）  ----"},
+    {"date": "2025-08-22", "token": "XPL", "token_display": "XPL (Plasma)", "exchange": "Bybit", "type": "pre-market", "time": "10:45 UTC", "notes": "📢 **BYBIT: Listing of XPLUSDT on Bybit Perpetual Pre-Market on Aug 22, 2025, 10:45AM UTC **  BYBIT: XPLUSDT将于2025年8月22日上午10:45（UTC时间）在Bybit永续合约预市上线。  "},
+    {"date": "2025-08-22", "token": "XPL", "token_display": "XPL (Plasma)", "exchange": "Binance", "type": "pre-market", "time": "16:29", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined XPLUSDT Perpetual Contract Pre-Market Trading (2025-08-22) **  Binance 期货将推出以 USDS 为保证金的 XPLUSDT 永续合约的预市"},
+    {"date": "2025-08-23", "token": "WLFI", "token_display": "Financial (WLFI)", "exchange": "Bybit", "type": "pre-market", "time": "10:15 UTC", "notes": "📢 **BYBIT: Listing of WLFIUSDT on Bybit Perpetual Pre-Market on Aug 23, 2025, 10:15AM UTC **  BYBIT: 2025年8月23日UTC时间10:15，WLFIUSDT在Bybit的永续合约Pre-Marke"},
+    {"date": "2025-08-23", "token": "WLFI", "token_display": "Financial (WLFI)", "exchange": "Binance", "type": "pre-market", "time": "16:15", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined WLFIUSDT Perpetual Contract Pre-Market Trading (2025-08-23) **  Binance Futures 将推出以 USDT 保证金结算的 WLFIUSD"},
+    {"date": "2025-08-23", "token": "WLFI", "token_display": "Financial (WLFI)", "exchange": "OKX", "type": "pre-market", "time": "20:30", "notes": "📢 **OKX LISTING:OKX to list pre-market perpetual futures for WLFI (World Liberty Financial) crypto **  OKX LISTING:OKX将上线WLFI（世界自由金融）加密货币的预市永续合约。  ---"},
+    {"date": "2025-08-25", "token": "BIO", "token_display": "Protocol (BIO)", "exchange": "Binance", "type": "perp", "time": "13:59", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined BIOUSDC Perpetual Contract (2025-08-25) **  Binance期货将推出以USDⓈ计价的BIOUSDC永续合约（2025-08-25）  ---------- 🔗 [查"},
+    {"date": "2025-08-25", "token": "STG", "token_display": "Finance (STG)", "exchange": "Gate", "type": "spot", "time": "14:59", "notes": "📢 **UPBIT LISTING:[거래] 스타게이트파이낸스(STG), 레이어제로(ZRO) 유의 촉구 안내 **  UPBIT LISTING:[交易] Stargate Finance (STG) 和 LayerZero (ZRO) 的注意事项通知。  ---------- 🕒 __20"},
+    {"date": "2025-08-25", "token": "STG", "token_display": "Finance (STG)", "exchange": "Upbit", "type": "spot", "time": "14:59", "notes": "📢 **UPBIT LISTING:[거래] 스타게이트파이낸스(STG), 레이어제로(ZRO) 유의 촉구 안내 **  UPBIT LISTING:[交易] Stargate Finance (STG) 和 LayerZero (ZRO) 的注意事项通知。  ---------- 🕒 __20"},
+    {"date": "2025-08-25", "token": "ZRO", "token_display": "LayerZero (ZRO)", "exchange": "Gate", "type": "spot", "time": "14:59", "notes": "📢 **UPBIT LISTING:[거래] 스타게이트파이낸스(STG), 레이어제로(ZRO) 유의 촉구 안내 **  UPBIT LISTING:[交易] Stargate Finance (STG) 和 LayerZero (ZRO) 的注意事项通知。  ---------- 🕒 __20"},
+    {"date": "2025-08-25", "token": "ZRO", "token_display": "LayerZero (ZRO)", "exchange": "Upbit", "type": "spot", "time": "14:59", "notes": "📢 **UPBIT LISTING:[거래] 스타게이트파이낸스(STG), 레이어제로(ZRO) 유의 촉구 안내 **  UPBIT LISTING:[交易] Stargate Finance (STG) 和 LayerZero (ZRO) 的注意事项通知。  ---------- 🕒 __20"},
+    {"date": "2025-08-25", "token": "SOMI", "token_display": "Somnia (SOMI)", "exchange": "Binance", "type": "pre-market", "time": "17:15", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined SOMIUSDT Perpetual Contract Pre-Market Trading (2025-08-25) **  Binance期货将启动美元Ⓢ-保证金的BOME永续合约的预市场交易 (2025"},
+    {"date": "2025-08-26", "token": "SD", "token_display": "Stader (SD)", "exchange": "Bithumb", "type": "spot", "time": "14:21", "notes": "📢 **Bithumb LISTING:스테이더(SD) 원화 마켓 추가 **  Bithumb LISTING:Stader(SD) 韩元市场已上线。  ---------- 🔗 [查看来源](https://feed.bithumb.com/notice/1649642) 🕒 __2025-0"},
+    {"date": "2025-08-26", "token": "BAS", "token_display": "BAS", "exchange": "Binance", "type": "perp", "time": "20:12", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined BASUSDT Perpetual Contract (2025-08-26) **  Binance 期货将推出以 USDT 计价 BASUSDT 永续合约（2025-08-26）  ---------- "},
+    {"date": "2025-08-27", "token": "BTR", "token_display": "Bitlayer (BTR)", "exchange": "Binance", "type": "perp", "time": "09:30", "notes": "📢 **Binance: Bitlayer (BTR) Will Be Available on Binance Alpha and Binance Futures (2025-08-27) **  Binance: Bitlayer (BTR) 将于2025年8月27日上线币种榜 Alpha 和币"},
+    {"date": "2025-08-27", "token": "CAMP", "token_display": "CAMP", "exchange": "Bybit", "type": "spot", "time": "17:15", "notes": "📢 **BYBIT: 🔥 Listing of CAMP on Convert **  BYBIT: 🔥 CAMP在Convert上市  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/-listing-of-camp-o"},
+    {"date": "2025-08-27", "token": "BSU", "token_display": "BSU", "exchange": "Bybit", "type": "perp", "time": "18:58", "notes": "📢 **BYBIT: New Listing : BSUUSDT Perpetual Contract in Innovation Zone, with up to 20x leverage **  BYBIT: 新上市：创新区的 BSUUSDT 永续合约，最高支持20倍杠杆  ----------"},
+    {"date": "2025-08-27", "token": "BTR", "token_display": "Bitlayer (BTR)", "exchange": "Bybit", "type": "perp", "time": "19:26", "notes": "📢 **BYBIT: New Listing : BTRUSDT Perpetual Contract in Innovation Zone, with up to 25x leverage **  BYBIT: 新上线：BTRUSDT永续合约，现可在创新区交易，最高支持25倍杠杆。  ------"},
+    {"date": "2025-08-28", "token": "TREE", "token_display": "Treehouse (TREE)", "exchange": "Upbit", "type": "spot", "time": "12:59", "notes": "📢 **UPBIT LISTING:[거래] 트리하우스(TREE) 신규 거래지원 안내 (KRW, BTC, USDT 마켓) **  UPBIT LISTING:[交易] Treehouse (TREE) 新交易对上线公告 (KRW, BTC, USDT市场)  ---------- 🕒 __"},
+    {"date": "2025-08-28", "token": "XPL", "token_display": "XPL (Plasma)", "exchange": "OKX", "type": "pre-market", "time": "18:00", "notes": "📢 **OKX LISTING:OKX to list pre-market perpetual futures for XPL (Plasma) crypto **  OKX LISTING:OKX 将上线 XPL（Plasma）加密货币的预市永续合约。  ---------- 🔗 [查看来源]("},
+    {"date": "2025-08-28", "token": "MITO", "token_display": "Mitosis (MITO)", "exchange": "Binance", "type": "perp", "time": "20:00", "notes": "📢 **Binance: Mitosis (MITO) Will Be Available on Binance Alpha and Binance Futures (2025-08-28) **  Binance: Mitosis (MITO) 将于2025年8月28日在Binance Alpha"},
+    {"date": "2025-08-28", "token": "GMT", "token_display": "GMT", "exchange": "Coinbase", "type": "spot", "time": "9:30 UTC", "notes": "📢 **CoinbaseInt Listing: We will add support for GMT, Omni Network, and Synthetix perpetual futures on Coinbase International Exchange and Coinbase Ad"},
+    {"date": "2025-08-28", "token": "GMT", "token_display": "GMT", "exchange": "Coinbase", "type": "perp", "time": "9:30 UTC", "notes": "📢 **CoinbaseInt Listing: We will add support for GMT, Omni Network, and Synthetix perpetual futures on Coinbase International Exchange and Coinbase Ad"},
+    {"date": "2025-08-28", "token": "OMNI", "token_display": "OMNI", "exchange": "Coinbase", "type": "spot", "time": "9:30 UTC", "notes": "📢 **CoinbaseInt Listing: We will add support for GMT, Omni Network, and Synthetix perpetual futures on Coinbase International Exchange and Coinbase Ad"},
+    {"date": "2025-08-28", "token": "OMNI", "token_display": "OMNI", "exchange": "Coinbase", "type": "perp", "time": "9:30 UTC", "notes": "📢 **CoinbaseInt Listing: We will add support for GMT, Omni Network, and Synthetix perpetual futures on Coinbase International Exchange and Coinbase Ad"},
+    {"date": "2025-08-28", "token": "SNX", "token_display": "SNX", "exchange": "Coinbase", "type": "spot", "time": "9:30 UTC", "notes": "📢 **CoinbaseInt Listing: We will add support for GMT, Omni Network, and Synthetix perpetual futures on Coinbase International Exchange and Coinbase Ad"},
+    {"date": "2025-08-28", "token": "SNX", "token_display": "SNX", "exchange": "Coinbase", "type": "perp", "time": "9:30 UTC", "notes": "📢 **CoinbaseInt Listing: We will add support for GMT, Omni Network, and Synthetix perpetual futures on Coinbase International Exchange and Coinbase Ad"},
+    {"date": "2025-08-29", "token": "APR", "token_display": "Priori (APR)", "exchange": "Binance", "type": "spot", "time": "14:59", "notes": "📢 **Binance Earn New Listing Special Offer: Subscribe to DOLO Locked Products to Enjoy 200% APR for 7 Days! **  币安理财新币上线特别优惠：申购DOLO定期理财产品，享受7天200%年化收益"},
+    {"date": "2025-08-29", "token": "CAMP", "token_display": "CAMP", "exchange": "Bithumb", "type": "spot", "time": "15:49", "notes": "📢 **Bithumb LISTING:캠프 네트워크(CAMP) 원화 마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:CAMP网络（CAMP）为庆贺韩元市场上线，举行空投活动。  ---------- 🔗 [查看来源](https://feed.bithumb.com"},
+    {"date": "2025-08-29", "token": "HEMI", "token_display": "Hemi (HEMI)", "exchange": "Binance", "type": "perp", "time": "22:00", "notes": "📢 **Binance: Hemi (HEMI) Will Be Available on Binance Alpha and Binance Futures (2025-08-29) **  Binance: Hemi (HEMI) 将于2025年8月29日在Binance Alpha和Binan"},
+    {"date": "2025-08-29", "token": "MITO", "token_display": "Mitosis (MITO)", "exchange": "Binance", "type": "spot", "time": "22:59", "notes": "📢 **Binance Will Add Mitosis (MITO) on Earn, Buy Crypto, Convert & Margin **  Binance将在Earn、购买加密货币、兑换及保证金交易中上线Mitosis（MITO）  ---------- 🔗 [查看来源](https"},
+    {"date": "2025-08-31", "token": "WLFI", "token_display": "Financial (WLFI)", "exchange": "OKX", "type": "pre-market", "time": "19:00", "notes": "📢 **OKX LISTING:OKX to list WLFI (World Liberty Financial) for spot trading and convert pre-market futures to standard perpetual futures **  OKX LISTI"},
+    {"date": "2025-09-01", "token": "WLFI", "token_display": "Financial (WLFI)", "exchange": "Binance", "type": "spot", "time": "09:48", "notes": "📢 **Binance Will List  World Liberty Financial (WLFI) with Seed Tag Applied **  Binance将上线World Liberty Financial (WLFI)并应用种子标签  ---------- 🔗 [查看来源](h"},
+    {"date": "2025-09-01", "token": "USDT", "token_display": "Linea (USDT)", "exchange": "Bybit", "type": "pre-market", "time": "10:15 UTC", "notes": "📢 **BYBIT: Listing of LINEAUSDT on Bybit Perpetual Pre-Market on Sep 1, 2025, 10:15AM UTC **  BYBIT: Linea (USDT) 将于 2025 年 9 月 1 日 UTC 时间 10:15 在 Byb"},
+    {"date": "2025-09-01", "token": "LINEA", "token_display": "LINEA (Linea)", "exchange": "Bybit", "type": "pre-market", "time": "10:15 UTC", "notes": "📢 **BYBIT: Listing of LINEAUSDT on Bybit Perpetual Pre-Market on Sep 1, 2025, 10:15AM UTC **  BYBIT: Linea (USDT) 将于 2025 年 9 月 1 日 UTC 时间 10:15 在 Byb"},
+    {"date": "2025-09-01", "token": "WLFI", "token_display": "Financial (WLFI)", "exchange": "Upbit", "type": "spot", "time": "12:09", "notes": "📢 **UPBIT LISTING:[거래] 월드리버티파이낸셜(WLFI) 신규 거래지원 안내 (KRW, BTC, USDT 마켓) **  UPBIT LISTING:[交易] World Liberty Financial (WLFI) 新增交易支持公告 (KRW, BTC, USDT 市"},
+    {"date": "2025-09-01", "token": "WLFI", "token_display": "Financial (WLFI)", "exchange": "Bithumb", "type": "spot", "time": "15:28", "notes": "📢 **Bithumb LISTING:[이벤트] 월드 리버티 파이낸셜(WLFI) 원화 마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:[活动] 纪念 World Liberty Financial (WLFI) 韩元市场上线空投活动  ---------- 🔗 ["},
+    {"date": "2025-09-01", "token": "LINEA", "token_display": "LINEA (Linea)", "exchange": "Binance", "type": "pre-market", "time": "16:14", "pairs": "LINEA/USD", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined LINEAUSDT Perpetual Contract Pre-Market Trading (2025-09-01) **  币安期货将推出基于美元稳定币（USDⓈ）保证金的三倍杠杆LINEA/USDT永"},
+    {"date": "2025-09-01", "token": "SOMI", "token_display": "Somnia (SOMI)", "exchange": "Binance", "type": "spot", "time": "16:59", "notes": "📢 **Binance: Introducing Somnia (SOMI) on Binance HODLer Airdrops! Earn SOMI With Retroactive BNB Simple Earn Subscriptions **  Binance: Binance HODLe"},
+    {"date": "2025-09-01", "token": "LINEA", "token_display": "LINEA (Linea)", "exchange": "OKX", "type": "pre-market", "time": "20:15", "notes": "📢 **OKX LISTING:OKX to list pre-market perpetual futures for LINEA (Linea) crypto **  OKX LISTING:OKX将上线LINEA（Linea）代币的永续合约预市交易。  ---------- 🔗 [查看来源]("},
+    {"date": "2025-09-01", "token": "WLFI", "token_display": "Financial (WLFI)", "exchange": "Coinbase", "type": "spot", "time": "21:09", "notes": "📢 **Coinbase will add support for World Liberty Financial (WLFI) on the Ethereum network (ERC-20 token). Do not send this asset over other networks or"},
+    {"date": "2025-09-01", "token": "WLFI", "token_display": "Financial (WLFI)", "exchange": "Bybit", "type": "spot", "time": "21:15", "notes": "📢 **BYBIT: 🔥 Listing of WLFI on Convert **  BYBIT: 🔥 WLFI已在Convert平台上线  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/-listing-of-wlf"},
+    {"date": "2025-09-02", "token": "AI", "token_display": "AI", "exchange": "Binance", "type": "perp", "time": "20:29", "notes": "📢 **Binance: Quack AI (Q) Will Be Available on Binance Alpha and Binance Futures (2025-09-02) **  Binance: Quack AI（Q）将在Binance Alpha和Binance Futures上"},
+    {"date": "2025-09-02", "token": "SOMI", "token_display": "Somnia (SOMI)", "exchange": "Bybit", "type": "spot", "time": "22:45", "notes": "📢 **BYBIT: 🔥 Listing of SOMI on Convert & Bybit Savings **  BYBIT: 🔥 SOMI 在 Convert 和 Bybit Savings 上市  ---------- 🔗 [查看来源](https://announcements.bybi"},
+    {"date": "2025-09-02", "token": "SOMI", "token_display": "Somnia (SOMI)", "exchange": "Bybit", "type": "perp", "time": "22:53", "notes": "📢 **BYBIT: New Listing :  SOMIUSDT Perpetual Contract, with up to 50x leverage **  BYBIT: 新上线：SOMIUSDT 永续合约，最高支持50倍杠杆  ---------- 🔗 [查看来源](https://ann"},
+    {"date": "2025-09-03", "token": "ARIA", "token_display": "ARIA", "exchange": "Binance", "type": "perp", "time": "17:49", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined ARIAUSDT and TAKEUSDT Perpetual Contracts (2025-09-03) **  Binance Futures 将于 2025 年 9 月 3 日推出以 USDⓈ 为保证"},
+    {"date": "2025-09-03", "token": "OKB", "token_display": "OKB", "exchange": "OKX", "type": "perp", "time": "18:00", "notes": "📢 **OKX LISTING:OKX to list perpetual futures for OKB crypto **  OKX LISTING:OKX 将上线 OKB 永续期货交易  ---------- 🔗 [查看来源](https://www.okx.com/help/okx-to-l"},
+    {"date": "2025-09-03", "token": "PTB", "token_display": "Bitcoin (PTB)", "exchange": "Binance", "type": "perp", "time": "18:00", "notes": "📢 **Binance: Portal to Bitcoin (PTB) Will Be Available on Binance Alpha and Binance Futures (2025-09-03) **  Binance: Portal to Bitcoin (PTB) 将登陆Binan"},
+    {"date": "2025-09-03", "token": "PTB", "token_display": "Bitcoin (PTB)", "exchange": "Bybit", "type": "perp", "time": "21:20", "notes": "📢 **BYBIT: New Listing : PTBUSDT Perpetual Contract in Innovation Zone, with up to 20x leverage **  BYBIT: 新上线：PT BUSDT永续合约在创新区推出，最高支持20倍杠杆。  --------"},
+    {"date": "2025-09-03", "token": "AWE", "token_display": "Awe (AWE)", "exchange": "Coinbase", "type": "spot", "time": "23:57", "notes": "📢 **Coinbase will add support for Awe (AWE) on the Base network. Do not send this asset over other networks or your funds may be lost. Transfers for t"},
+    {"date": "2025-09-04", "token": "LISTING", "token_display": "LISTING", "exchange": "Coinbase", "type": "spot", "time": "03:43", "notes": "📢 **Moonshot LISTING (Verified!!)   Coinbase xStock ($COINx) `Xs7ZdzSHLU9ftNJsii5fCeJhoRWSC32SQGzGQtePxNu`  Market Cap: $77779.9M 24h Volume: $6K Cate"},
+    {"date": "2025-09-04", "token": "FUTU", "token_display": "FUTU", "exchange": "Bybit", "type": "spot", "time": "21:44", "notes": "📢 **BYBIT: New TradFi Listing: FUTU, DFDV **  BYBIT: 新的TradFi上市股票：富途控股 (FUTU)，DFDV  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/new"},
+    {"date": "2025-09-04", "token": "ZEN", "token_display": "ZEN", "exchange": "Coinbase", "type": "spot", "time": "9:30 UTC", "notes": "📢 **CoinbaseInt Listing: We will add support for Horizen, UMA, and GMX perpetual futures on Coinbase International Exchange and Coinbase Advanced. The"},
+    {"date": "2025-09-04", "token": "ZEN", "token_display": "ZEN", "exchange": "Coinbase", "type": "perp", "time": "9:30 UTC", "notes": "📢 **CoinbaseInt Listing: We will add support for Horizen, UMA, and GMX perpetual futures on Coinbase International Exchange and Coinbase Advanced. The"},
+    {"date": "2025-09-04", "token": "UMA", "token_display": "UMA", "exchange": "Coinbase", "type": "spot", "time": "9:30 UTC", "notes": "📢 **CoinbaseInt Listing: We will add support for Horizen, UMA, and GMX perpetual futures on Coinbase International Exchange and Coinbase Advanced. The"},
+    {"date": "2025-09-04", "token": "UMA", "token_display": "UMA", "exchange": "Coinbase", "type": "perp", "time": "9:30 UTC", "notes": "📢 **CoinbaseInt Listing: We will add support for Horizen, UMA, and GMX perpetual futures on Coinbase International Exchange and Coinbase Advanced. The"},
+    {"date": "2025-09-04", "token": "GMX", "token_display": "GMX", "exchange": "Coinbase", "type": "spot", "time": "9:30 UTC", "notes": "📢 **CoinbaseInt Listing: We will add support for Horizen, UMA, and GMX perpetual futures on Coinbase International Exchange and Coinbase Advanced. The"},
+    {"date": "2025-09-04", "token": "GMX", "token_display": "GMX", "exchange": "Coinbase", "type": "perp", "time": "9:30 UTC", "notes": "📢 **CoinbaseInt Listing: We will add support for Horizen, UMA, and GMX perpetual futures on Coinbase International Exchange and Coinbase Advanced. The"},
+    {"date": "2025-09-05", "token": "APR", "token_display": "Priori (APR)", "exchange": "Binance", "type": "spot", "time": "10:59", "notes": "📢 **Binance Earn New Listing Special Offer: Subscribe to MITO or SOMI Locked Products to Enjoy 200% APR for 7 Days! **  Binance Earn 新上币特别活动：订阅 MITO 或"},
+    {"date": "2025-09-05", "token": "OPEN", "token_display": "OpenLedger (OPEN)", "exchange": "Binance", "type": "spot", "time": "15:18", "notes": "📢 **Binance: Introducing OpenLedger (OPEN) on Binance HODLer Airdrops! Earn OPEN With Retroactive BNB Simple Earn Subscriptions **  Binance: 在Binance "},
+    {"date": "2025-09-05", "token": "EUL", "token_display": "Euler (EUL)", "exchange": "Bithumb", "type": "spot", "time": "15:21", "notes": "📢 **Bithumb LISTING:[이벤트] 오일러(EUL) 원화 마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:[活动] Euler（EUL）韩元市场新增纪念空投活动  ---------- 🔗 [查看来源](https://feed.bithumb.com/"},
+    {"date": "2025-09-05", "token": "RED", "token_display": "RedStone (RED)", "exchange": "Upbit", "type": "spot", "time": "15:44", "notes": "📢 **UPBIT LISTING:[거래] 레드스톤(RED) KRW 마켓 디지털 자산 추가 **  UPBIT LISTING:[交易] Redstone（RED）已添加至韩元（KRW）市场的数字资产交易对。  ---------- 🕒 __2025-09-05 15:44:51__"},
+    {"date": "2025-09-06", "token": "KTA", "token_display": "Keeta (KTA)", "exchange": "Coinbase", "type": "spot", "time": "08:35", "notes": "📢 **COINBASE LISTING: Assets added to the roadmap today: Keeta (KTA) and Noice (NOICE) **  COINBASE LISTING: 今日新增至路线图的资产：基塔（KTA）和诺伊斯（NOICE）。  --------"},
+    {"date": "2025-09-06", "token": "NOICE", "token_display": "Noice (NOICE)", "exchange": "Coinbase", "type": "spot", "time": "08:35", "notes": "📢 **COINBASE LISTING: Assets added to the roadmap today: Keeta (KTA) and Noice (NOICE) **  COINBASE LISTING: 今日新增至路线图的资产：基塔（KTA）和诺伊斯（NOICE）。  --------"},
+    {"date": "2025-09-08", "token": "WLFI", "token_display": "Financial (WLFI)", "exchange": "Binance", "type": "perp", "time": "15:30", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined WLFIUSDC Perpetual Contract (2025-09-08) **  币安期货将推出美元计价WLFIUSDC永续合约（2025年9月8日）  ---------- 🔗 [查看来源](htt"},
+    {"date": "2025-09-08", "token": "PROVE", "token_display": "Succinct (PROVE)", "exchange": "Bybit", "type": "spot", "time": "20:16", "notes": "📢 **BYBIT: 🔥 Listing of PROVE on Convert **  BYBIT: 🔥 在Convert上列出PROVE  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/-listing-of-pro"},
+    {"date": "2025-09-08", "token": "LINEA", "token_display": "LINEA (Linea)", "exchange": "OKX", "type": "pre-market", "time": "22:00", "notes": "📢 **OKX LISTING:OKX to list LINEA (Linea) for spot trading and convert pre-market futures to standard perpetual futures **  OKX LISTING:OKX 将上线 LINEA（"},
+    {"date": "2025-09-08", "token": "LINEA", "token_display": "Linea (LINEA)", "exchange": "Binance", "type": "spot", "time": "22:26", "notes": "📢 **Binance: Introducing Linea (LINEA) on Binance HODLer Airdrops! Earn LINEA With Retroactive BNB Simple Earn Subscriptions **  Binance: 重磅推出Linea（LI"},
+    {"date": "2025-09-09", "token": "FLOCK", "token_display": "Flock (FLOCK)", "exchange": "Coinbase", "type": "spot", "time": "01:16", "notes": "📢 **Coinbase will add support for SPX6900 (SPX) on the Ethereum network (ERC-20 Token) and Flock (FLOCK) on the Base network. Do not send these assets"},
+    {"date": "2025-09-09", "token": "SPX", "token_display": "SPX", "exchange": "Coinbase", "type": "spot", "time": "01:16", "notes": "📢 **Coinbase will add support for SPX6900 (SPX) on the Ethereum network (ERC-20 Token) and Flock (FLOCK) on the Base network. Do not send these assets"},
+    {"date": "2025-09-09", "token": "FLOCK", "token_display": "Flock (FLOCK)", "exchange": "Upbit", "type": "spot", "time": "10:39", "notes": "📢 **UPBIT LISTING:[] 플록(FLOCK) KRW 마켓 디지털 자산 추가 **  UPBIT LISTING:[] FLOCK KRW 市场新增数字资产  ---------- 🔗 [查看来源](https://upbit.com/service_center/notice?i"},
+    {"date": "2025-09-09", "token": "FLOCK", "token_display": "Flock (FLOCK)", "exchange": "Binance", "type": "perp", "time": "13:28", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined FLOCKUSDT and SKYUSDT Perpetual Contracts (2025-09-09) **  币安期货将于2025年9月9日推出以美元计价的FLOCKUSDT和SKYUSDT永续合约 "},
+    {"date": "2025-09-09", "token": "SKY", "token_display": "Sky (SKY)", "exchange": "Binance", "type": "perp", "time": "13:28", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined FLOCKUSDT and SKYUSDT Perpetual Contracts (2025-09-09) **  币安期货将于2025年9月9日推出以美元计价的FLOCKUSDT和SKYUSDT永续合约 "},
+    {"date": "2025-09-09", "token": "WLD", "token_display": "WLD", "exchange": "Upbit", "type": "spot", "time": "18:21", "notes": "📢 **UPBIT LISTING:[] 월드코인(WLD) 신규 거래지원 안내 (KRW, BTC, USDT 마켓) **  UPBIT LISTING:[] 世界币（WLD）新增交易支持公告（韩元、比特币、USDT交易市场）  ---------- 🔗 [查看来源](https://upbi"},
+    {"date": "2025-09-09", "token": "AVNT", "token_display": "Avantis (AVNT)", "exchange": "Binance", "type": "perp", "time": "21:00", "notes": "📢 **Binance: Avantis (AVNT) Will Be Available on Binance Alpha and Binance Futures (2025-09-09) **  Binance: Avantis (AVNT) 将于 2025 年 9 月 9 日上线币安 Alph"},
+    {"date": "2025-09-09", "token": "AVNT", "token_display": "Avantis (AVNT)", "exchange": "Bybit", "type": "spot", "time": "22:17", "notes": "📢 **BYBIT: 🔥 Listing of AVNT on Convert **  BYBIT: 🔥 AVNT在Convert平台上线交易  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/-listing-of-av"},
+    {"date": "2025-09-10", "token": "LINEA", "token_display": "LINEA (Linea)", "exchange": "Bithumb", "type": "spot", "time": "11:00", "notes": "📢 **Bithumb LISTING:오픈렛저(OPEN), 리네아(LINEA) 원화 마켓 추가 **  Bithumb LISTING:开放式Linea赢得了额外的市场  ---------- 🔗 [查看来源](https://feed.bithumb.com/notice/1649828)"},
+    {"date": "2025-09-10", "token": "HOLO", "token_display": "AI (HOLO)", "exchange": "Binance", "type": "spot", "time": "13:11", "notes": "📢 **Binance: Introducing Holoworld AI (HOLO) on Binance HODLer Airdrops! Earn HOLO With Retroactive BNB Simple Earn Subscriptions **  Binance: 即将在 Bin"},
+    {"date": "2025-09-10", "token": "OPEN", "token_display": "OpenLet (OPEN)", "exchange": "Bithumb", "type": "spot", "time": "13:31", "notes": "📢 **Bithumb LISTING:[이벤트] 오픈렛저(OPEN) 원화 마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:[活动] 纪念OpenLet (OPEN)新增韩元市场，举办空投活动  ---------- 🔗 [查看来源](https://feed.bit"},
+    {"date": "2025-09-10", "token": "LINEA", "token_display": "LINEA (Linea)", "exchange": "Bybit", "type": "spot", "time": "15:00", "notes": "📢 **BYBIT: 🔥 Listing of LINEA on Convert **  BYBIT: 🔥LINEA在Convert平台上线  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/-listing-of-lin"},
+    {"date": "2025-09-10", "token": "LINEA", "token_display": "LINEA (Linea)", "exchange": "Upbit", "type": "spot", "time": "15:39", "notes": "📢 **UPBIT LISTING:[] 리네아(LINEA) 신규 거래지원 안내 (KRW, BTC, USDT 마켓) **  UPBIT LISTING:关于列内亚（LINEA）新增交易对的通知（提KRW韩元、BTC比特币、USDT泰达币市场）  ---------- 🔗 [查看来源](ht"},
+    {"date": "2025-09-11", "token": "SKY", "token_display": "Sky (SKY)", "exchange": "OKX", "type": "perp", "time": "11:00", "notes": "📢 **OKX LISTING:OKX to list perpetual futures for SKY crypto **  OKX LISTING:OKX即将上线SKY永续期货交易对。  ---------- 🔗 [查看来源](https://www.okx.com/help/okx-to-l"},
+    {"date": "2025-09-11", "token": "HOLO", "token_display": "AI (HOLO)", "exchange": "Upbit", "type": "spot", "time": "17:23", "notes": "📢 **UPBIT LISTING:[] 홀로월드에이아이(HOLO) 신규 거래지원 안내 (KRW, BTC, USDT 마켓) **  UPBIT LISTING:尊敬的用户，  我们很高兴地通知您，HOLO（HOLO）现已支持KRW、BTC和USDT市场的新交易对。这意味着您现在可以使用韩元"},
+    {"date": "2025-09-11", "token": "PUMP", "token_display": "PUMP (Pump)", "exchange": "Bithumb", "type": "spot", "time": "17:49", "notes": "📢 **Bithumb LISTING:펌프닷펀(PUMP) 원화 마켓 추가 **  Bithumb LISTING:PUMP（펌프닷펀）在韩元市场上线。  ---------- 🔗 [查看来源](https://feed.bithumb.com/notice/1649839) 🕒 __2025-"},
+    {"date": "2025-09-11", "token": "PUMP", "token_display": "PUMP (Pump)", "exchange": "Upbit", "type": "spot", "time": "18:15", "notes": "📢 **UPBIT LISTING:[] 펌프펀(PUMP) 신규 거래지원 안내 (KRW, USDT 마켓) **  UPBIT LISTING:[] Pump 币（PUMP）新增交易对公告（KRW，USDT 市场）  ---------- 🔗 [查看来源](https://upbit.com/"},
+    {"date": "2025-09-11", "token": "PUMP", "token_display": "PUMP (Pump)", "exchange": "Binance", "type": "spot", "time": "19:37", "notes": "📢 **Binance Will List ****Pump.fun**** (PUMP) with Seed Tag Applied **  币安将上线Pump.fun (PUMP)并标注Seed标签。  ---------- 🔗 [查看来源](https://www.binance.com/en"},
+    {"date": "2025-09-11", "token": "HOLO", "token_display": "AI (HOLO)", "exchange": "Bybit", "type": "spot", "time": "20:16", "notes": "📢 **BYBIT: 🔥 Listing of HOLO on Convert **  BYBIT: 🔥 HOLO 上线Convert平台  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/-listing-of-holo"},
+    {"date": "2025-09-12", "token": "XPIN", "token_display": "XPIN", "exchange": "Binance", "type": "perp", "time": "14:50", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined XPINUSDT Perpetual Contract (2025-09-12) **  Binance期货将推出以 USDT 为保证金的杠杆永续合约 XPINUSDT（2025-09-12）  ------"},
+    {"date": "2025-09-12", "token": "APR", "token_display": "Priori (APR)", "exchange": "Binance", "type": "spot", "time": "17:00", "notes": "📢 **Binance Earn New Listing Special Offer: Subscribe to OPEN, LINEA or HOLO Locked Products to Enjoy 200% APR for 7 Days! **  币安Earn新币上线特别优惠：订阅OPEN、L"},
+    {"date": "2025-09-12", "token": "UB", "token_display": "Unibase (UB)", "exchange": "Binance", "type": "perp", "time": "17:29", "notes": "📢 **Binance: Unibase (UB) Will Be Available on Binance Alpha and Binance Futures (2025-09-12) **  Binance: Unibase（UB）将上线Binance Alpha和Binance Futures"},
+    {"date": "2025-09-12", "token": "UB", "token_display": "Unibase (UB)", "exchange": "Bybit", "type": "perp", "time": "17:36", "notes": "📢 **BYBIT: New Listing : UBUSDT Perpetual Contract in Innovation Zone, with up to 25x leverage **  BYBIT: 新上线：创新区推出UBUSDT永续合约，最高支持25倍杠杆。  ---------- 🔗"},
+    {"date": "2025-09-12", "token": "ZKC", "token_display": "Boundless (ZKC)", "exchange": "Binance", "type": "spot", "time": "17:57", "notes": "📢 **Binance: Introducing Boundless (ZKC) on Binance HODLer Airdrops! Earn ZKC With Retroactive BNB Simple Earn Subscriptions **  Binance: 在Binance HOD"},
+    {"date": "2025-09-15", "token": "ZKC", "token_display": "Boundless (ZKC)", "exchange": "Coinbase", "type": "spot", "time": "01:31", "pairs": "ZKC/USD", "notes": "📢 **COINBASE LISTING: Spot trading for Boundless (ZKC) will go live on 15 September 2025.   The opening of our ZKC-USD trading pair will begin later t"},
+    {"date": "2025-09-15", "token": "AVNT", "token_display": "Avantis (AVNT)", "exchange": "Upbit", "type": "spot", "time": "10:29", "notes": "📢 **UPBIT LISTING:아반티스(AVNT) 신규 거래지원 안내 (KRW, BTC, USDT 마켓) **  UPBIT LISTING:阿凡缇斯（AVNT）新增交易对公告（KRW、BTC、USDT市场）  ---------- 🔗 [查看来源](https://upbit.com"},
+    {"date": "2025-09-15", "token": "AVNT", "token_display": "Avantis (AVNT)", "exchange": "Binance", "type": "spot", "time": "11:46", "notes": "📢 **Binance Will List Avantis (AVNT) with Seed Tag Applied **  Binance将上线Avantis（AVNT），并应用种子标签。  ---------- 🔗 [查看来源](https://www.binance.com/en/suppor"},
+    {"date": "2025-09-15", "token": "AVNT", "token_display": "Avantis (AVNT)", "exchange": "Bithumb", "type": "spot", "time": "13:59", "notes": "📢 **Bithumb LISTING:아반티스(AVNT) 원화 마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:Avantis（AVNT）韩元市场添加纪念空投活动  ---------- 🔗 [查看来源](https://feed.bithumb.com/notice"},
+    {"date": "2025-09-15", "token": "ZKC", "token_display": "Boundless (ZKC)", "exchange": "Upbit", "type": "spot", "time": "17:24", "notes": "📢 **UPBIT LISTING:바운드리스(ZKC) 신규 거래지원 안내 (KRW, BTC, USDT 마켓) **  UPBIT LISTING:Boundless (ZKC) 新增交易对支持指南（KRW, BTC, USDT 市场）  ---------- 🔗 [查看来源](https:"},
+    {"date": "2025-09-15", "token": "BARD", "token_display": "BARD (Lombard)", "exchange": "OKX", "type": "spot", "time": "20:00", "notes": "📢 **OKX LISTING:OKX to list BARD (Lombard) for spot trading **  OKX LISTING:OKX将上线BARD（Lombard）进行现货交易。  ---------- 🔗 [查看来源](https://www.okx.com/help/o"},
+    {"date": "2025-09-15", "token": "ZKC", "token_display": "Brand (ZKC)", "exchange": "Bithumb", "type": "spot", "time": "20:34", "notes": "📢 **Bithumb LISTING:바운드리스(ZKC) 원화 마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:Bounce Brand (ZKC)韩元市场上线纪念空投活动  ---------- 🔗 [查看来源](https://feed.bithumb.com/n"},
+    {"date": "2025-09-15", "token": "ZKC", "token_display": "Boundless (ZKC)", "exchange": "Bybit", "type": "spot", "time": "22:15", "notes": "📢 **BYBIT: 🔥 Listing of ZKC on Convert **  BYBIT: 🔥 ZKC将在Convert平台上币  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/-listing-of-zkc-o"},
+    {"date": "2025-09-15", "token": "ZKC", "token_display": "Boundless (ZKC)", "exchange": "Bybit", "type": "perp", "time": "22:16", "notes": "📢 **BYBIT: New Listing :  ZKCUSDT Perpetual Contract, with up to 25x leverage **  BYBIT: 新上市：ZKCUSDT 永续合约，支持最高25倍杠杆。  ---------- 🔗 [查看来源](https://anno"},
+    {"date": "2025-09-16", "token": "AVNT", "token_display": "Avantis (AVNT)", "exchange": "Binance", "type": "spot", "time": "17:29", "notes": "📢 **Binance: Introducing Avantis (AVNT) on Binance HODLer Airdrops! Earn AVNT With Retroactive BNB Simple Earn Subscriptions **  Binance: Binance HODL"},
+    {"date": "2025-09-16", "token": "PORTALS", "token_display": "PORTALS", "exchange": "Bybit", "type": "spot", "time": "20:15", "notes": "📢 **BYBIT: 🔥 Listing of PORTALS on Convert **  BYBIT: 🔥 PORTALS 在 Convert 上币  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/-listing-"},
+    {"date": "2025-09-17", "token": "EUL", "token_display": "Euler (EUL)", "exchange": "Upbit", "type": "spot", "time": "10:30", "notes": "📢 **UPBIT LISTING:[거래] 오일러(EUL), 플룸(PLUME) 신규 거래지원 안내 (BTC, USDT 마켓) **  UPBIT LISTING:[交易] Euler (EUL), Plume (PLUME) 新交易支持通知 (BTC, USDT 市场)  -------"},
+    {"date": "2025-09-17", "token": "PLUME", "token_display": "Plume (PLUME)", "exchange": "Upbit", "type": "spot", "time": "10:30", "notes": "📢 **UPBIT LISTING:[거래] 오일러(EUL), 플룸(PLUME) 신규 거래지원 안내 (BTC, USDT 마켓) **  UPBIT LISTING:[交易] Euler (EUL), Plume (PLUME) 新交易支持通知 (BTC, USDT 市场)  -------"},
+    {"date": "2025-09-17", "token": "TOSHI", "token_display": "TOSHI (Toshi)", "exchange": "Upbit", "type": "spot", "time": "10:30", "notes": "📢 **UPBIT LISTING:토시(TOSHI) 신규 거래지원 안내 (KRW, USDT 마켓) **  UPBIT LISTING:TOSHI新交易市场支持公告 (KRW, USDT市场)  ---------- 🔗 [查看来源](https://upbit.com/service_ce"},
+    {"date": "2025-09-17", "token": "TOSHI", "token_display": "TOSHI (Toshi)", "exchange": "Bithumb", "type": "spot", "time": "10:45", "notes": "📢 **Bithumb LISTING:토시(TOSHI), 홀로월드(HOLO) 원화 마켓 추가 **  Bithumb LISTING:TOSHI (토시)、HOLO (홀로월드) 已增加韩元(KRW)市场交易对。  ---------- 🔗 [查看来源](https://feed.bithu"},
+    {"date": "2025-09-17", "token": "ENA", "token_display": "ENA (Ethena)", "exchange": "OKX", "type": "spot", "time": "11:00", "notes": "📢 **OKX LISTING:OKX to list ENA (Ethena) for spot trading **  OKX LISTING:OKX将上线ENA（Ethena）进行现货交易。  ---------- 🔗 [查看来源](https://www.okx.com/help/okx-t"},
+    {"date": "2025-09-17", "token": "TOSHI", "token_display": "TOSHI (Toshi)", "exchange": "Binance", "type": "perp", "time": "11:44", "pairs": "TOSHI/USD", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined TOSHIUSDT and STBLUSDT Perpetual Contracts (2025-09-17) **  Binance 期货将于2025年9月17日推出以USDT计价的TOSHI/USDT和S"},
+    {"date": "2025-09-17", "token": "STBL", "token_display": "STBL", "exchange": "Binance", "type": "perp", "time": "11:44", "pairs": "STBL/USD", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined TOSHIUSDT and STBLUSDT Perpetual Contracts (2025-09-17) **  Binance 期货将于2025年9月17日推出以USDT计价的TOSHI/USDT和S"},
+    {"date": "2025-09-17", "token": "HOLO", "token_display": "AI (HOLO)", "exchange": "Bithumb", "type": "spot", "time": "12:19", "notes": "📢 **Bithumb LISTING:홀로월드 에이아이(HOLO) 원화 마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:HoloWorld AI (HOLO) 韩元市场新增纪念空投活动  ---------- 🔗 [查看来源](https://feed.bithum"},
+    {"date": "2025-09-17", "token": "ENA", "token_display": "Ethena (ENA)", "exchange": "OKX", "type": "perp", "time": "12:30", "notes": "📢 **OKX LISTING:OKX to list perpetual futures for ENA, PENDLE crypto **  OKX LISTING:OKX将上线ENA和PENDLE的永续合约  ---------- 🔗 [查看来源](https://www.okx.com/he"},
+    {"date": "2025-09-17", "token": "PENDLE", "token_display": "PENDLE", "exchange": "OKX", "type": "perp", "time": "12:30", "notes": "📢 **OKX LISTING:OKX to list perpetual futures for ENA, PENDLE crypto **  OKX LISTING:OKX将上线ENA和PENDLE的永续合约  ---------- 🔗 [查看来源](https://www.okx.com/he"},
+    {"date": "2025-09-17", "token": "BARD", "token_display": "Lombard (BARD)", "exchange": "Binance", "type": "spot", "time": "17:57", "notes": "📢 **Binance: Introducing Lombard (BARD) on Binance HODLer Airdrops! Earn BARD With Retroactive BNB Simple Earn Subscriptions **  Binance: Binance HODL"},
+    {"date": "2025-09-17", "token": "STBL", "token_display": "STBL", "exchange": "Bybit", "type": "perp", "time": "18:29", "notes": "📢 **BYBIT: New Listing : STBLUSDT Perpetual Contract in Innovation Zone, with up to 25x leverage **  BYBIT: 新上线：创新区 STBLUSDT 永续合约，最高支持25倍杠杆。  --------"},
+    {"date": "2025-09-18", "token": "BARD", "token_display": "BARD (Lombard)", "exchange": "OKX", "type": "perp", "time": "15:00", "notes": "📢 **OKX LISTING:OKX to list perpetual futures for BARD crypto **  OKX LISTING:OKX将上线BARD永续合约  ---------- 🔗 [查看来源](https://www.okx.com/help/okx-to-list"},
+    {"date": "2025-09-18", "token": "RVV", "token_display": "Nova (RVV)", "exchange": "Binance", "type": "spot", "time": "15:01", "notes": "📢 **Join the Booster Program and Pre-TGE Campaign on ****#Binance**** Wallet with  ****@Astra__Nova****   📅 Booster Program Start Time: September 18, "},
+    {"date": "2025-09-18", "token": "BARD", "token_display": "BARD (Lombard)", "exchange": "Upbit", "type": "spot", "time": "17:49", "notes": "📢 **UPBIT LISTING:롬바드(BARD) 신규 거래지원 안내 (KRW, BTC, USDT 마켓) **  UPBIT LISTING:关于Lombard（BARD）的新交易支持通知（支持韩元、比特币、泰达币交易对）  ---------- 🔗 [查看来源](https://upb"},
+    {"date": "2025-09-18", "token": "LA", "token_display": "Lagrange (LA)", "exchange": "Upbit", "type": "spot", "time": "18:02", "notes": "📢 **UPBIT LISTING:라그랑주(LA) KRW 마켓 디지털 자산 추가 **  UPBIT LISTING:LA（拉吉朗芝） KRW市场新增数字资产  ---------- 🔗 [查看来源](https://upbit.com/service_center/notice?id=553"},
+    {"date": "2025-09-18", "token": "BARD", "token_display": "BARD (Lombard)", "exchange": "Bithumb", "type": "spot", "time": "18:20", "notes": "📢 **Bithumb LISTING:[마켓 추가] 롬바드(BARD),  비트텐서(TAO) 원화 마켓 추가 **  Bithumb LISTING:[市场新增] 已增加Lombard（BARD）和BitTensor（TAO）的韩元市场。  ---------- 🔗 [查看来源](https"},
+    {"date": "2025-09-18", "token": "TAO", "token_display": "BitTensor (TAO)", "exchange": "Bithumb", "type": "spot", "time": "18:20", "notes": "📢 **Bithumb LISTING:[마켓 추가] 롬바드(BARD),  비트텐서(TAO) 원화 마켓 추가 **  Bithumb LISTING:[市场新增] 已增加Lombard（BARD）和BitTensor（TAO）的韩元市场。  ---------- 🔗 [查看来源](https"},
+    {"date": "2025-09-18", "token": "AIA", "token_display": "AI (AIA)", "exchange": "Binance", "type": "perp", "time": "18:59", "notes": "📢 **Binance: DeAgent AI (AIA) Will Be Available on Binance Alpha and Binance Futures (2025-09-18) **  Binance: DeAgent AI (AIA) 将于2025年9月18日在Binance A"},
+    {"date": "2025-09-18", "token": "BARD", "token_display": "BARD (Lombard)", "exchange": "Bybit", "type": "spot", "time": "19:40", "notes": "📢 **BYBIT: 🔥 Listing of BARD on  Convert & Bybit Savings **  BYBIT: 🔥 BARD 已在 Convert 和 Bybit Savings 上线  ---------- 🔗 [查看来源](https://announcements.by"},
+    {"date": "2025-09-18", "token": "L", "token_display": "L", "exchange": "Bybit", "type": "spot", "time": "19:46", "notes": "📢 **BYBIT: 🔥 Listing of LBTC on Convert **  BYBIT: 🔥 LBTC 上市交易平台 Convert  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/-listing-of-l"},
+    {"date": "2025-09-18", "token": "BARD", "token_display": "Lombard (BARD)", "exchange": "Coinbase", "type": "spot", "time": "23:55", "pairs": "BARD/USD", "notes": "📢 **COINBASE LISTING: Spot trading for Lombard (BARD) will go live on 18 September 2025. The opening of our BARD-USD trading pair will begin later tod"},
+    {"date": "2025-09-19", "token": "ETHFI", "token_display": "ETHFI", "exchange": "Upbit", "type": "spot", "time": "11:09", "notes": "📢 **UPBIT LISTING:이더파이(ETHFI), 리졸브(RESOLV), 이니시아(INIT), 스파크(SPK) 신규 거래지원 안내 (BTC, USDT 마켓) **  UPBIT LISTING:以下为新支持的交易对（BTC、USDT市场）通知：   - **EtherFi（E"},
+    {"date": "2025-09-19", "token": "RESOLV", "token_display": "RESOLV (Resolv)", "exchange": "Upbit", "type": "spot", "time": "11:09", "notes": "📢 **UPBIT LISTING:이더파이(ETHFI), 리졸브(RESOLV), 이니시아(INIT), 스파크(SPK) 신규 거래지원 안내 (BTC, USDT 마켓) **  UPBIT LISTING:以下为新支持的交易对（BTC、USDT市场）通知：   - **EtherFi（E"},
+    {"date": "2025-09-19", "token": "INIT", "token_display": "INISIA (INIT)", "exchange": "Upbit", "type": "spot", "time": "11:09", "notes": "📢 **UPBIT LISTING:이더파이(ETHFI), 리졸브(RESOLV), 이니시아(INIT), 스파크(SPK) 신규 거래지원 안내 (BTC, USDT 마켓) **  UPBIT LISTING:以下为新支持的交易对（BTC、USDT市场）通知：   - **EtherFi（E"},
+    {"date": "2025-09-19", "token": "SPK", "token_display": "Spark (SPK)", "exchange": "Upbit", "type": "spot", "time": "11:09", "notes": "📢 **UPBIT LISTING:이더파이(ETHFI), 리졸브(RESOLV), 이니시아(INIT), 스파크(SPK) 신규 거래지원 안내 (BTC, USDT 마켓) **  UPBIT LISTING:以下为新支持的交易对（BTC、USDT市场）通知：   - **EtherFi（E"},
+    {"date": "2025-09-19", "token": "KMNO", "token_display": "KMNO", "exchange": "Bithumb", "type": "spot", "time": "13:59", "notes": "📢 **Bithumb LISTING:카미노 파이낸스(KMNO) 원화 마켓 추가 **  Bithumb LISTING:Kamino Finance（KMNO）增加韩元交易对。  ---------- 🔗 [查看来源](https://feed.bithumb.com/notice/1649"},
+    {"date": "2025-09-19", "token": "ASTER", "token_display": "Aster (ASTER)", "exchange": "Binance", "type": "perp", "time": "18:57", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined ASTERUSDT and TRADOORUSDT Perpetual Contracts (2025-09-19) **  Binance期货将推出以USDⓈ计价的ASTERUSDT和TRADOORUSDT"},
+    {"date": "2025-09-19", "token": "TRADOOR", "token_display": "TRADOOR", "exchange": "Binance", "type": "perp", "time": "18:57", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined ASTERUSDT and TRADOORUSDT Perpetual Contracts (2025-09-19) **  Binance期货将推出以USDⓈ计价的ASTERUSDT和TRADOORUSDT"},
+    {"date": "2025-09-19", "token": "ASTER", "token_display": "Aster (ASTER)", "exchange": "Bybit", "type": "pre-market", "time": "9:00 UTC", "notes": "📢 **BYBIT: Listing of ASTERUSDT on Bybit Perpetual Pre-Market on Sep 19, 2025, 9:00AM UTC **  BYBIT: 2025年9月19日UTC时间上午9点，ASTERUSDT将在Bybit永续合约预市上线。  --"},
+    {"date": "2025-09-22", "token": "SUN", "token_display": "SUN", "exchange": "Upbit", "type": "spot", "time": "10:30", "notes": "📢 **UPBIT LISTING:썬(SUN) KRW, USDT 마켓 디지털 자산 추가 **  UPBIT LISTING:SUN (太阳币) 已在 KRW 和 USDT 市场中新增数字资产。  ---------- 🔗 [查看来源](https://upbit.com/service_ce"},
+    {"date": "2025-09-22", "token": "ASTER", "token_display": "Aster (ASTER)", "exchange": "OKX", "type": "perp", "time": "12:00", "notes": "📢 **OKX LISTING:OKX to list perpetual futures for ASTER crypto **  OKX LISTING:OKX 将上线 ASTER 币的永续期货合约  ---------- 🔗 [查看来源](https://www.okx.com/help/ok"},
+    {"date": "2025-09-22", "token": "AVNT", "token_display": "Avantis (AVNT)", "exchange": "OKX", "type": "perp", "time": "23:00", "notes": "📢 **OKX LISTING:OKX to list perpetual futures for AVNT crypto **  OKX LISTING:OKX将上线AVNT加密资产的永续合约  ---------- 🔗 [查看来源](https://www.okx.com/help/okx-to"},
+    {"date": "2025-09-23", "token": "CFG", "token_display": "Centrifuge (CFG)", "exchange": "Coinbase", "type": "spot", "time": "07:49", "notes": "📢 **COINBASE LISTING: Assets added to the roadmap today: Centrifuge (CFG) and TROLL (TROLL) **  COINBASE LISTING: 今日新增至发展规划的资产包括：Centrifuge（CFG）和TROLL"},
+    {"date": "2025-09-23", "token": "UXLINK", "token_display": "UXLINK", "exchange": "Upbit", "type": "spot", "time": "11:00", "notes": "📢 **UPBIT LISTING:[거래] 유엑스링크(UXLINK) 거래 유의 종목 지정 안내 **  UPBIT LISTING:[交易] UXLINK交易注意事项指定公告  ---------- 🕒 __2025-09-23 11:00:05__"},
+    {"date": "2025-09-23", "token": "BLESS", "token_display": "Bless (BLESS)", "exchange": "Binance", "type": "perp", "time": "11:00", "notes": "📢 **Binance: Bless (BLESS) Will Be Available on Binance Alpha and Binance Futures (2025-09-23) **  Binance: Bless (BLESS) 将于2025年9月23日在Binance Alpha及B"},
+    {"date": "2025-09-23", "token": "HEMI", "token_display": "Hemi (HEMI)", "exchange": "Binance", "type": "spot", "time": "13:09", "notes": "📢 **Binance: Introducing Hemi (HEMI) on Binance HODLer Airdrops! Earn HEMI With Retroactive BNB Simple Earn Subscriptions **  Binance: 在Binance HODLer"},
+    {"date": "2025-09-23", "token": "XAN", "token_display": "Anoma (XAN)", "exchange": "Bybit", "type": "spot", "time": "14:43", "notes": "📢 **BYBIT: Postponement of Anoma (XAN) Spot listing **  BYBIT: Anoma（XAN）现货上市延迟公告提示：“Anoma（XAN）现货上市时间将有所调整，具体时间将另行通知。” 请投资者关注官方进一步的消息，避免因时间变动可能造成的不便。开"},
+    {"date": "2025-09-23", "token": "XAN", "token_display": "Anoma (XAN)", "exchange": "Binance", "type": "perp", "time": "17:59", "notes": "📢 **Binance: Anoma (XAN) Will Be Available on Binance Alpha and Binance Futures (2025-09-23) **  Binance: Anoma（XAN）将于2025年9月23日在币安Alpha和币安期货上线。  ----"},
+    {"date": "2025-09-24", "token": "XPL", "token_display": "Plasma (XPL)", "exchange": "Binance", "type": "spot", "time": "16:00", "notes": "📢 **Binance: Introducing Plasma (XPL) on Binance HODLer Airdrops! Earn XPL With Retroactive BNB Simple Earn Subscriptions **  Binance: 在 Binance HODLe"},
+    {"date": "2025-09-24", "token": "IN", "token_display": "Infiniti (IN)", "exchange": "Upbit", "type": "spot", "time": "16:10", "notes": "📢 **UPBIT LISTING:[거래] 인피닛(IN) BTC, USDT 마켓, 비쓰리(B3) USDT 마켓 신규 거래지원 안내 **  UPBIT LISTING:[交易] Infiniti (IN) BTC、USDT市场，以及BTHREE (B3) USDT市场新增交易支持公告  "},
+    {"date": "2025-09-24", "token": "BTHREE", "token_display": "BTHREE", "exchange": "Upbit", "type": "spot", "time": "16:10", "notes": "📢 **UPBIT LISTING:[거래] 인피닛(IN) BTC, USDT 마켓, 비쓰리(B3) USDT 마켓 신규 거래지원 안내 **  UPBIT LISTING:[交易] Infiniti (IN) BTC、USDT市场，以及BTHREE (B3) USDT市场新增交易支持公告  "},
+    {"date": "2025-09-24", "token": "FLUID", "token_display": "Fluid (FLUID)", "exchange": "Upbit", "type": "spot", "time": "16:10", "notes": "📢 **UPBIT LISTING:플루이드(FLUID) 신규 거래지원 안내 (KRW, BTC, USDT 마켓) **  UPBIT LISTING:以下是关于FLUID（플루이드）新增交易对的通知（KRW、BTC、USDT市场）  ---------- 🔗 [查看来源](https://u"},
+    {"date": "2025-09-24", "token": "HEMI", "token_display": "Hemi (HEMI)", "exchange": "Bithumb", "type": "spot", "time": "16:38", "notes": "📢 **Bithumb LISTING:헤미(HEMI) 원화 마켓 추가 **  Bithumb LISTING:HEMI（HEMI）新增韩元市场  ---------- 🔗 [查看来源](https://feed.bithumb.com/notice/1650043) 🕒 __2025-09-2"},
+    {"date": "2025-09-24", "token": "FLUID", "token_display": "Fluid (FLUID)", "exchange": "Binance", "type": "perp", "time": "17:25", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined FLUIDUSDT Perpetual Contract (2025-09-24) **  Binance 期货将上线以 USDT 保证金的 FLUIDUSDT 永续合约（2025-09-24）  -----"},
+    {"date": "2025-09-24", "token": "XPL", "token_display": "XPL (Plasma)", "exchange": "OKX", "type": "pre-market", "time": "21:01", "notes": "📢 **OKX LISTING:OKX to list XPL (Plasma) for spot trading and convert pre-market futures to standard perpetual futures **  OKX LISTING:OKX将上线XPL（Plasm"},
+    {"date": "2025-09-25", "token": "XPL", "token_display": "XPL (Plasma)", "exchange": "Upbit", "type": "spot", "time": "09:57", "notes": "📢 **UPBIT LISTING:플라즈마(XPL) 신규 거래지원 안내 (KRW, BTC, USDT 마켓) **  UPBIT LISTING:플라즈마(XPL)新增交易支持通知（KRW、BTC、USDT市场）  ---------- 🔗 [查看来源](https://upbit.com/"},
+    {"date": "2025-09-25", "token": "POPCAT", "token_display": "POPCAT", "exchange": "Bithumb", "type": "spot", "time": "15:17", "notes": "📢 **Bithumb LISTING:팝캣(POPCAT) 원화 마켓 추가 (거래 수수료 무료) **  Bithumb LISTING:POPCAT韩元市场已上线（交易手续费免费）。  ---------- 🔗 [查看来源](https://feed.bithumb.com/notice/1"},
+    {"date": "2025-09-25", "token": "BTR", "token_display": "Bitlayer (BTR)", "exchange": "Bithumb", "type": "spot", "time": "15:40", "notes": "📢 **Bithumb LISTING:[이벤트] 비트레이어(BTR) 원화 마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:[活动] 庆祝 Bitlayer (BTR) 新增韩元市场空投活动  ---------- 🔗 [查看来源](https://feed.bith"},
+    {"date": "2025-09-25", "token": "COAI", "token_display": "AI (COAI)", "exchange": "Binance", "type": "perp", "time": "16:45", "notes": "📢 **Binance: ChainOpera AI (COAI) Will Be Available on Binance Alpha and Binance Futures (2025-09-25) **  Binance: ChainOpera AI (COAI) 将于2025年9月25日在币"},
+    {"date": "2025-09-25", "token": "MIRA", "token_display": "Mira (MIRA)", "exchange": "Binance", "type": "spot", "time": "18:00", "notes": "📢 **Binance: Introducing Mira (MIRA) on Binance HODLer Airdrops! Earn MIRA With Retroactive BNB Simple Earn Subscriptions **  Binance: 在币安 HODLer 空投中引"},
+    {"date": "2025-09-25", "token": "XPL", "token_display": "XPL (Plasma)", "exchange": "Bybit", "type": "spot", "time": "21:16", "notes": "📢 **BYBIT: 🔥 Listing of XPL on Convert & Bybit Savings **  BYBIT: XPL 已在 Convert 和 Bybit 理财平台上线  ---------- 🔗 [查看来源](https://announcements.bybit.com/e"},
+    {"date": "2025-09-25", "token": "CFG", "token_display": "Centrifuge (CFG)", "exchange": "Coinbase", "type": "spot", "time": "23:54", "pairs": "CFG/USD", "notes": "📢 **COINBASE LISTING: Spot trading for Centrifuge (CFG) and TROLL (TROLL) will go live on 25 September 2025. The opening of our CFG-USD and TROLL-USD "},
+    {"date": "2025-09-26", "token": "HANA", "token_display": "Network (HANA)", "exchange": "Binance", "type": "perp", "time": "14:01", "notes": "📢 **Binance: Hana Network (HANA) Will Be Available on Binance Alpha and Binance Futures (2025-09-26) **  Binance: Hana Network（HANA）将于2025年9月26日在Binan"},
+    {"date": "2025-09-26", "token": "FLUID", "token_display": "Fluid (FLUID)", "exchange": "Bithumb", "type": "spot", "time": "15:50", "notes": "📢 **Bithumb LISTING:[마켓 추가] 플루이드(FLUID), 쿠디스(CUDIS) 원화 마켓 추가 **  Bithumb LISTING:[市场新增] FLUID（플루이드）、CUDIS（쿠디스）已新增韩元市场。  ---------- 🔗 [查看来源](https://fe"},
+    {"date": "2025-09-26", "token": "FF", "token_display": "Finance (FF)", "exchange": "Binance", "type": "spot", "time": "15:52", "notes": "📢 **Binance: Introducing Falcon Finance (FF) on Binance HODLer Airdrops! Earn FF With Retroactive BNB Simple Earn Subscriptions **  Binance: Binance H"},
+    {"date": "2025-09-26", "token": "CUDIS", "token_display": "CUDIS", "exchange": "Bithumb", "type": "spot", "time": "16:45", "notes": "📢 **Bithumb LISTING:쿠디스(CUDIS) 원화 마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:CUDIS 韩元市场上线纪念空投活动  ---------- 🔗 [查看来源](https://feed.bithumb.com/notice/165011"},
+    {"date": "2025-09-26", "token": "APR", "token_display": "Priori (APR)", "exchange": "Binance", "type": "spot", "time": "17:00", "notes": "📢 **Binance Earn New Listing Special Offer: Subscribe to ZKC, HEMI or XPL Locked Products to Enjoy 200% APR for 7 Days! **  币安赚币新上线特惠活动：订阅 ZKC、HEMI 或 "},
+    {"date": "2025-09-26", "token": "MIRA", "token_display": "Mira (MIRA)", "exchange": "Upbit", "type": "spot", "time": "17:31", "notes": "📢 **UPBIT LISTING:미라네트워크(MIRA) 신규 거래지원 안내 (KRW, BTC, USDT 마켓) **  UPBIT LISTING:MIRA网络(MIRA)新增交易支持公告 (KRW, BTC, USDT市场)  ---------- 🔗 [查看来源](https://u"},
+    {"date": "2025-09-26", "token": "AKE", "token_display": "AKE", "exchange": "Binance", "type": "perp", "time": "17:46", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined AKEUSDT and ORDERUSDT Perpetual Contracts (2025-09-26) **  Binance期货将于2025年9月26日上线以USDT为保证金的AKEUSDT和ORDE"},
+    {"date": "2025-09-26", "token": "MIRA", "token_display": "Mira (MIRA)", "exchange": "Bithumb", "type": "spot", "time": "19:20", "notes": "📢 **Bithumb LISTING:미라(MIRA) 원화마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:为庆祝MIRA上线韩元市场，将举行空投活动。  ---------- 🔗 [查看来源](https://feed.bithumb.com/notice/16501"},
+    {"date": "2025-09-26", "token": "MIRA", "token_display": "Mira (MIRA)", "exchange": "Binance", "type": "spot", "time": "19:30", "notes": "📢 **Binance Will Add Mira (MIRA) on Earn, Buy Crypto, Convert, Margin & Futures **  币安将上线 Mira（MIRA），支持赚币、购买加密货币、兑换、杠杆交易及合约交易等功能。  ---------- 🔗 [查看来源]"},
+    {"date": "2025-09-26", "token": "MIRA", "token_display": "Mira (MIRA)", "exchange": "Bybit", "type": "perp", "time": "21:00", "pairs": "MIRA/USD", "notes": "📢 **BYBIT: New Listing :  MIRAUSDT Perpetual Contract, with up to 50x leverage **  BYBIT: 上新交易对：MIRA/USDT永续合约，最高可进行50倍杠杆交易。  ---------- 🔗 [查看来源](https"},
+    {"date": "2025-09-26", "token": "RL", "token_display": "RL", "exchange": "Bybit", "type": "spot", "time": "22:21", "notes": "📢 **BYBIT: 🔥 Listing of RLUSD on Convert **  BYBIT: 🔥 RLUSD 在 Convert 平台上线  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/-listing-of"},
+    {"date": "2025-09-27", "token": "LIGHT", "token_display": "Bitlight (LIGHT)", "exchange": "Binance", "type": "perp", "time": "14:00", "notes": "📢 **Binance: Bitlight (LIGHT) Will Be Available on Binance Alpha and Binance Futures (2025-09-27) **  Binance: Bitlight (LIGHT) 将于 2025 年 9 月 27 日在币安阿"},
+    {"date": "2025-09-27", "token": "APEX", "token_display": "APEX", "exchange": "Hyperliquid", "type": "perp", "time": "14:28", "pairs": "APEX/USD", "notes": "📢 **【hyperliquid】 新上线APEX/USDC永续合约，最高可达3倍杠杆 **  【Hyperliquid】 新上线 APEX/USDC 永续合约，最高支持 3 倍杠杆。  ---------- 🕒 __2025-09-27 14:28:30__"},
+    {"date": "2025-09-29", "token": "XAN", "token_display": "Anoma (XAN)", "exchange": "Coinbase", "type": "spot", "time": "02:35", "pairs": "XAN/USD", "notes": "📢 **COINBASE LISTING: Spot trading for Anoma (XAN) will go live on 29 September 2025. The opening of our XAN-USD trading pair will begin later today i"},
+    {"date": "2025-09-29", "token": "XPL", "token_display": "Plazma (XPL)", "exchange": "Bithumb", "type": "spot", "time": "16:25", "notes": "📢 **Bithumb LISTING:플라즈마(XPL) 원화 마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:为纪念 Plazma (XPL) 韩元市场上线，推出空投活动  ---------- 🔗 [查看来源](https://feed.bithumb.com/no"},
+    {"date": "2025-09-29", "token": "EDEN", "token_display": "OpenEden (EDEN)", "exchange": "Binance", "type": "spot", "time": "16:30", "notes": "📢 **Binance: Introducing OpenEden (EDEN) on Binance HODLer Airdrops! Earn EDEN With Retroactive BNB Simple Earn Subscriptions **  Binance: 在币安HODLer空投"},
+    {"date": "2025-09-29", "token": "XAN", "token_display": "Anoma (XAN)", "exchange": "Binance", "type": "perp", "time": "16:30", "notes": "📢 **Binance: Anoma (XAN) Listing Will Be Postponed on Binance Alpha and Binance Futures (2025-09-29) **  Binance: Anoma（XAN）在Binance Alpha和Binance Fut"},
+    {"date": "2025-09-29", "token": "SUPER", "token_display": "SUPER", "exchange": "Upbit", "type": "spot", "time": "16:53", "notes": "📢 **UPBIT LISTING:슈퍼버스(SUPER) 신규 거래지원 안내 (KRW, BTC, USDT 마켓) **  UPBIT LISTING:SUPER新增交易对公告（KRW、BTC、USDT市场）  ---------- 🔗 [查看来源](https://upbit.com/ser"},
+    {"date": "2025-09-29", "token": "FF", "token_display": "Finance (FF)", "exchange": "Upbit", "type": "spot", "time": "17:34", "notes": "📢 **UPBIT LISTING:[거래] 팔콘파이낸스(FF) 신규 거래지원 안내 (KRW, USDT 마켓) **  UPBIT LISTING:[交易] 新增Falcon Finance(FF)交易对指南（KRW, USDT市场）  ---------- 🕒 __2025-09-29 1"},
+    {"date": "2025-09-29", "token": "XAN", "token_display": "Anoma (XAN)", "exchange": "Bybit", "type": "spot", "time": "18:21", "notes": "📢 **BYBIT: 🔥 Listing of XAN on Convert **  BYBIT: 🔥 XAN上市Convert交易平台  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/-listing-of-xan-o"},
+    {"date": "2025-09-29", "token": "XAN", "token_display": "Anoma (XAN)", "exchange": "Bybit", "type": "perp", "time": "19:01", "notes": "📢 **BYBIT: New Listing :  XANUSDT Perpetual Contract, with up to 25x leverage **  BYBIT: 新产品：XANUSDT 永续合约，最高支持 25 倍杠杆  ---------- 🔗 [查看来源](https://ann"},
+    {"date": "2025-09-29", "token": "FF", "token_display": "Finance (FF)", "exchange": "Bithumb", "type": "spot", "time": "19:30", "notes": "📢 **Bithumb LISTING:팔콘 파이낸스(FF) 원화마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:Falcon Finance（FF）韩元市场上线纪念空投活动  ---------- 🔗 [查看来源](https://feed.bithumb.com/n"},
+    {"date": "2025-09-29", "token": "FF", "token_display": "Finance (FF)", "exchange": "Binance", "type": "spot", "time": "20:50", "notes": "📢 **Binance: Falcon Finance (FF) Listing Will Be Postponed **  Binance: Falcon Finance (FF) 上市将被推迟。  ---------- 🔗 [查看来源](https://www.binance.com/en/su"},
+    {"date": "2025-09-30", "token": "XAN", "token_display": "Anoma (XAN)", "exchange": "OKX", "type": "perp", "time": "00:01", "notes": "📢 **OKX LISTING:OKX to list perpetual futures for XAN crypto **  OKX LISTING:OKX 将在其平台上上线 XAN 加密资产的永续期货合约。  ---------- 🔗 [查看来源](https://www.okx.com/he"},
+    {"date": "2025-09-30", "token": "VFY", "token_display": "Verify (VFY)", "exchange": "Binance", "type": "perp", "time": "14:00", "notes": "📢 **Binance: zkVerify (VFY) Will Be Available on Binance Alpha and Binance Futures (2025-09-30) **  Binance: zkVerify (VFY) 将于2025年9月30日上线Binance Alph"},
+    {"date": "2025-09-30", "token": "EDEN", "token_display": "OpenEden (EDEN)", "exchange": "OKX", "type": "perp", "time": "19:02", "notes": "📢 **OKX LISTING:OKX to list perpetual futures for EDEN crypto **  OKX LISTING:OKX将上线 EDEN 代币的永续合约  ---------- 🔗 [查看来源](https://www.okx.com/help/okx-to"},
+    {"date": "2025-09-30", "token": "EDEN", "token_display": "OpenEden (EDEN)", "exchange": "Bybit", "type": "perp", "time": "20:00", "notes": "📢 **BYBIT: New Listing :  EDENUSDT Perpetual Contract, with up to 25x leverage **  BYBIT: 新上线：EDENUSDT永续合约，最高支持25倍杠杆  ---------- 🔗 [查看来源](https://anno"},
+    {"date": "2025-09-30", "token": "SYND", "token_display": "Syndicate (SYND)", "exchange": "Coinbase", "type": "spot", "time": "20:43", "notes": "📢 **COINBASE LISTING: Assets added to the roadmap today: Syndicate (SYND) **  COINBASE LISTING: 今日新增至路线图的资产：Syndicate (SYND)  ---------- 🔗 [查看来源](http"},
+    {"date": "2025-09-30", "token": "VFY", "token_display": "Verify (VFY)", "exchange": "Bybit", "type": "perp", "time": "20:45", "notes": "📢 **BYBIT: New Listing : VFYUSDT Perpetual Contract in Innovation Zone, with up to 50x leverage **  BYBIT: 新上线：创新区新增 VFYUSDT 永续合约，最高支持 50 倍杠杆  -------"},
+    {"date": "2025-10-01", "token": "SOMI", "token_display": "SOMNIA (SOMI)", "exchange": "Upbit", "type": "spot", "time": "12:26", "notes": "📢 **UPBIT LISTING:솜니아(SOMI) 신규 거래지원 안내 (KRW, BTC, USDT 마켓) **  UPBIT LISTING:SOMNIA(SOMI)新增交易对指南 (KRW, BTC, USDT 市场)  ---------- 🔗 [查看来源](https://upbi"},
+    {"date": "2025-10-01", "token": "TRUTH", "token_display": "Network (TRUTH)", "exchange": "Binance", "type": "perp", "time": "14:00", "notes": "📢 **Binance: Swarm Network (TRUTH) Will Be Available on Binance Alpha and Binance Futures (2025-10-01) **  Binance: Swarm Network (TRUTH) 将于2025年10月1日"},
+    {"date": "2025-10-01", "token": "SOMI", "token_display": "Somnia (SOMI)", "exchange": "Bithumb", "type": "spot", "time": "14:22", "notes": "📢 **Bithumb LISTING:[이벤트] 솜니아(SOMI) 원화마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:[活动] 为庆祝SOMNIUM韩元市场上线，举行空投活动  ---------- 🔗 [查看来源](https://feed.bithumb.com"},
+    {"date": "2025-10-01", "token": "NOM", "token_display": "Nomina (NOM)", "exchange": "Binance", "type": "spot", "time": "15:30", "notes": "📢 **Binance Will Add Nomina (NOM) on Earn, Buy Crypto, Convert, Margin & Futures **  Binance将在收益、购买加密货币、兑换、杠杆和期货产品中上线Nomina (NOM)。  ---------- 🔗 [查看来源"},
+    {"date": "2025-10-01", "token": "TRUTH", "token_display": "Network (TRUTH)", "exchange": "Bybit", "type": "perp", "time": "22:26", "notes": "📢 **BYBIT: New Listing :  TRUTHUSDT Perpetual Contract, with up to 25x leverage **  BYBIT: 新上市：TRUTHUSDT永续合约，最高支持25倍杠杆  ---------- 🔗 [查看来源](https://an"},
+    {"date": "2025-10-02", "token": "SUPER", "token_display": "SUPER", "exchange": "Bithumb", "type": "spot", "time": "13:09", "notes": "📢 **Bithumb LISTING:슈퍼버스(SUPER), 더블제로(2Z) 원화 마켓 추가 (거래 수수료 무료) **  Bithumb LISTING:SUPER币（SUPER）和2Z币（2Z）已上线韩元交易市场，且交易手续费全免。  ---------- 🔗 [查看来源](https"},
+    {"date": "2025-10-02", "token": "UXLINK", "token_display": "UXLINK", "exchange": "Upbit", "type": "spot", "time": "15:00", "notes": "📢 **UPBIT LISTING:[거래] 유엑스링크(UXLINK) 거래지원 종료 안내 (11/3 15:00) **  UPBIT LISTING:[公告] UXLINK交易支持结束通知（11月3日 15:00）  ---------- 🕒 __2025-10-02 12:00:04__"},
+    {"date": "2025-10-03", "token": "MORPHO", "token_display": "Morpho (MORPHO)", "exchange": "Binance", "type": "spot", "time": "22:30", "notes": "📢 **Binance Will Add Morpho (MORPHO) on Earn, Buy Crypto, Convert & Margin **  Binance 将在 Earn、Buy Crypto、Convert 和 Margin 业务中上线 Morpho (MORPHO) 代币。  "},
+    {"date": "2025-10-06", "token": "LYN", "token_display": "AI (LYN)", "exchange": "Binance", "type": "perp", "time": "14:00", "notes": "📢 **Binance: Everlyn AI (LYN) Will Be Available on Binance Alpha and Binance Futures (2025-10-06) **  Binance: Everlyn AI (LYN) 将于2025年10月6日上线Binance "},
+    {"date": "2025-10-06", "token": "LYN", "token_display": "AI (LYN)", "exchange": "Bybit", "type": "perp", "time": "16:20", "notes": "📢 **BYBIT: New Listing :  LYNUSDT Perpetual Contract, with up to 50x leverage **  BYBIT: 新上线：LYNUSDT永续合约，最高支持50倍杠杆  ---------- 🔗 [查看来源](https://announ"},
+    {"date": "2025-10-06", "token": "ASTER", "token_display": "Aster (ASTER)", "exchange": "Binance", "type": "spot", "time": "19:30", "notes": "📢 **Binance Will Add Aster (ASTER) on Earn, Buy Crypto, Convert & Margin **  Binance将上线Aster（ASTER）至收益、购买加密货币、兑换和保证金交易功能。  ---------- 🔗 [查看来源](https:/"},
+    {"date": "2025-10-06", "token": "LINEA", "token_display": "Linea (LINEA)", "exchange": "Coinbase", "type": "spot", "time": "23:38", "notes": "📢 **COINBASE LISTING: Assets added to the roadmap today: Linea (LINEA) **  COINBASE LISTING: 今日添加到路线的资产：Linea（LINEA）  ---------- 🔗 [查看来源](https://twit"},
+    {"date": "2025-10-07", "token": "DOOD", "token_display": "Doodles (DOOD)", "exchange": "Upbit", "type": "spot", "time": "12:35", "notes": "📢 **UPBIT LISTING:두들즈(DOOD) 신규 거래지원 안내 (KRW, USDT 마켓) **  UPBIT LISTING:DOOD（DOOD）新交易市场通知（支持KRW、USDT市场）  ---------- 🔗 [查看来源](https://upbit.com/service"},
+    {"date": "2025-10-07", "token": "KGEN", "token_display": "KGen (KGEN)", "exchange": "Binance", "type": "perp", "time": "14:00", "notes": "📢 **Binance: KGen (KGEN) Will Be Available on Binance Alpha and Binance Futures (2025-10-07) **  Binance: KGen（KGEN）将于2025年10月7日上线Binance Alpha和Binanc"},
+    {"date": "2025-10-07", "token": "AVNT", "token_display": "AVNT (Avantis)", "exchange": "OKX", "type": "spot", "time": "18:02", "notes": "📢 **OKX LISTING:OKX to list AVNT (Avantis), TOSHI (Toshi) for spot trading **  OKX LISTING:OKX将上线AVNT（Avantis）和TOSHI（Toshi）进行现货交易。  ---------- 🔗 [查看来源"},
+    {"date": "2025-10-07", "token": "TOSHI", "token_display": "TOSHI (Toshi)", "exchange": "OKX", "type": "spot", "time": "18:02", "notes": "📢 **OKX LISTING:OKX to list AVNT (Avantis), TOSHI (Toshi) for spot trading **  OKX LISTING:OKX将上线AVNT（Avantis）和TOSHI（Toshi）进行现货交易。  ---------- 🔗 [查看来源"},
+    {"date": "2025-10-07", "token": "XAN", "token_display": "Anoma (XAN)", "exchange": "Bithumb", "type": "spot", "time": "19:00", "notes": "📢 **Bithumb LISTING:아노마(XAN) 원화 마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:为庆祝 Anoma (XAN) 韩元市场上线举办空投活动。  ---------- 🔗 [查看来源](https://feed.bithumb.com/noti"},
+    {"date": "2025-10-09", "token": "LINEA", "token_display": "Linea (LINEA)", "exchange": "Coinbase", "type": "spot", "time": "00:13", "pairs": "LINEA/USD", "notes": "📢 **COINBASE LISTING: Spot trading for Linea (LINEA), Noice (NOICE), and Syndicate (SYND) will go live on 9 October 2025. The opening of our LINEA-USD"},
+    {"date": "2025-10-09", "token": "NOICE", "token_display": "Noice (NOICE)", "exchange": "Coinbase", "type": "spot", "time": "00:13", "pairs": "NOICE/USD", "notes": "📢 **COINBASE LISTING: Spot trading for Linea (LINEA), Noice (NOICE), and Syndicate (SYND) will go live on 9 October 2025. The opening of our LINEA-USD"},
+    {"date": "2025-10-09", "token": "SYND", "token_display": "Syndicate (SYND)", "exchange": "Coinbase", "type": "spot", "time": "00:13", "pairs": "SYND/USD", "notes": "📢 **COINBASE LISTING: Spot trading for Linea (LINEA), Noice (NOICE), and Syndicate (SYND) will go live on 9 October 2025. The opening of our LINEA-USD"},
+    {"date": "2025-10-09", "token": "GIGGLE", "token_display": "Fund (GIGGLE)", "exchange": "Binance", "type": "perp", "time": "16:23", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined GIGGLEUSDT Perpetual Contract (2025-10-09) **  Binance期货将推出以USDⓈ为保证金的GIGGLEUSDT永续合约（2025-10-09）  -------"},
+    {"date": "2025-10-10", "token": "MET", "token_display": "MET (Meteora)", "exchange": "Bybit", "type": "pre-market", "time": "10:45 UTC", "notes": "📢 **BYBIT: Listing of METUSDT on Bybit Perpetual Pre-Market on Oct 10, 2025, 10:45AM UTC **  BYBIT: 2025年10月10日，世界标准时间上午10:45，Bybit平台将上线METUSDT永续合约的预市"},
+    {"date": "2025-10-10", "token": "MON", "token_display": "MON (Monad)", "exchange": "OKX", "type": "pre-market", "time": "13:02", "notes": "📢 **OKX LISTING:OKX to list pre-market perpetual futures for MON (Monad) crypto **  OKX LISTING:OKX将上线MON（Monad）加密货币的预市永续合约。  ---------- 🔗 [查看来源](http"},
+    {"date": "2025-10-10", "token": "IN", "token_display": "Infiniti (IN)", "exchange": "Upbit", "type": "spot", "time": "14:00", "notes": "📢 **UPBIT LISTING:인피닛(IN) KRW 마켓 디지털 자산 추가 **  UPBIT LISTING:Infinittoken（IN）KRW市场新增数字资产。  ---------- 🔗 [查看来源](https://upbit.com/service_center/notice"},
+    {"date": "2025-10-10", "token": "MON", "token_display": "MON (Monad)", "exchange": "Binance", "type": "pre-market", "time": "14:45", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined MONUSDT Perpetual Contract Pre-Market Trading (2025-10-10) **  Binance期货将推出以USDⓈ为保证金标的的MONUSDT永续合约预市交易（2"},
+    {"date": "2025-10-10", "token": "WAL", "token_display": "Walrus (WAL)", "exchange": "Binance", "type": "spot", "time": "15:00", "notes": "📢 **Binance Will Add Walrus (WAL) on Earn, Buy Crypto, Convert & Margin **  Binance将上线Walrus (WAL)收益、购买加密货币、兑换及保证金交易。  ---------- 🔗 [查看来源](https://www"},
+    {"date": "2025-10-10", "token": "ASTER", "token_display": "Aster (ASTER)", "exchange": "Bithumb", "type": "spot", "time": "15:51", "notes": "📢 **Bithumb LISTING:아스터(ASTER) 원화 마켓 추가 (거래 수수료 무료) **  Bithumb LISTING:ASTER（阿斯特）韩元交易市场已上线（交易手续费免费）。  ---------- 🔗 [查看来源](https://feed.bithumb.com/no"},
+    {"date": "2025-10-10", "token": "ZORA", "token_display": "ZORA", "exchange": "OKX", "type": "perp", "time": "18:02", "notes": "📢 **OKX LISTING:OKX to list perpetual futures for ZORA crypto **  OKX LISTING:OKX将上线ZORA代币的永续合约  ---------- 🔗 [查看来源](https://www.okx.com/help/okx-to-l"},
+    {"date": "2025-10-11", "token": "YB", "token_display": "Basis (YB)", "exchange": "Bybit", "type": "pre-market", "time": "8:45 UTC", "notes": "📢 **BYBIT: Listing of YBUSDT on Bybit Perpetual Pre-Market on Oct 11, 2025, 8:45AM UTC **  BYBIT: YBUSDT将于2025年10月11日UTC时间上午8:45在Bybit永续合约预上市市场进行上市。  "},
+    {"date": "2025-10-12", "token": "YB", "token_display": "Basis (YB)", "exchange": "OKX", "type": "pre-market", "time": "14:02", "notes": "📢 **OKX LISTING:OKX to list pre-market perpetual futures for YB (Yield Basis) crypto **  OKX LISTING:OKX 将上线 YB（收益基础）加密货币的Pre-Perpetuals期权  ----------"},
+    {"date": "2025-10-13", "token": "EUL", "token_display": "Euler (EUL)", "exchange": "Binance", "type": "spot", "time": "17:22", "notes": "📢 **Binance: Introducing Euler (EUL) on Binance HODLer Airdrops! Earn EUL With Retroactive BNB Simple Earn Subscriptions **  Binance: 在 Binance HODLer"},
+    {"date": "2025-10-14", "token": "ENSO", "token_display": "Enso (ENSO)", "exchange": "Binance", "type": "spot", "time": "10:58", "notes": "📢 **Binance: Introducing Enso (ENSO) on Binance HODLer Airdrops! Earn ENSO With Retroactive BNB Simple Earn Subscriptions **  Binance: 在 Binance HODLe"},
+    {"date": "2025-10-14", "token": "PAXG", "token_display": "PAXG", "exchange": "OKX", "type": "spot", "time": "12:02", "notes": "📢 **OKX LISTING:OKX to list PAXG (PAX Gold) for spot trading **  OKX LISTING:OKX将上线PAXG（PAX Gold）现货交易  ---------- 🔗 [查看来源](https://www.okx.com/help/ok"},
+    {"date": "2025-10-14", "token": "CLO", "token_display": "Finance (CLO)", "exchange": "Binance", "type": "perp", "time": "14:00", "notes": "📢 **Binance: Yei Finance (CLO) Will Be Available on Binance Alpha and Binance Futures (2025-10-14) **  Binance: Yei Finance（CLO）将于2025年10月14日上线Binance"},
+    {"date": "2025-10-14", "token": "ENSO", "token_display": "Enso (ENSO)", "exchange": "Bybit", "type": "spot", "time": "17:32", "notes": "📢 **BYBIT: 🔥 Listing of  ENSO on Convert **  BYBIT: 🔥 ENSO 在 Convert 上市  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/-listing-of-en"},
+    {"date": "2025-10-14", "token": "YB", "token_display": "Basis (YB)", "exchange": "Binance", "type": "spot", "time": "17:46", "notes": "📢 **Binance: Introducing Yield Basis (YB) on Binance HODLer Airdrops! Earn YB With Retroactive BNB Simple Earn Subscriptions **  Binance: Binance HODL"},
+    {"date": "2025-10-14", "token": "YB", "token_display": "Basis (YB)", "exchange": "OKX", "type": "pre-market", "time": "21:32", "notes": "📢 **OKX LISTING:OKX to list YB (Yield Basis) for spot trading and convert pre-market futures to standard perpetual futures **  OKX LISTING:OKX将上线YB（Yi"},
+    {"date": "2025-10-15", "token": "YB", "token_display": "Basis (YB)", "exchange": "Coinbase", "type": "spot", "time": "00:05", "pairs": "YB/USD", "notes": "📢 **COINBASE LISTING: Spot trading for Yield Basis (YB) will go live on 15 October 2025. The opening of our YB-USD trading pair will begin later today"},
+    {"date": "2025-10-15", "token": "RECALL", "token_display": "Network (RECALL)", "exchange": "Coinbase", "type": "spot", "time": "01:54", "pairs": "RECALL/USD", "notes": "📢 **COINBASE LISTING: Spot trading for Recall Network (RECALL) will go live on 15 October 2025. The opening of our RECALL-USD trading pair will begin "},
+    {"date": "2025-10-15", "token": "YGG", "token_display": "Games (YGG)", "exchange": "Upbit", "type": "spot", "time": "13:00", "notes": "📢 **UPBIT LISTING:[거래] 일드길드게임즈(YGG) KRW, USDT 마켓 디지털 자산 추가 **  UPBIT LISTING:[交易] Yield Guild Games (YGG) KRW, USDT市场新增数字资产  ---------- 🕒 __2025-10-15"},
+    {"date": "2025-10-15", "token": "RECALL", "token_display": "Recall (RECALL)", "exchange": "Binance", "type": "perp", "time": "14:00", "notes": "📢 **Binance: Recall (RECALL) Will Be Available on Binance Alpha and Binance Futures (2025-10-15) **  Binance: Recall (RECALL) 将上线 Binance Alpha 和 Bina"},
+    {"date": "2025-10-15", "token": "RECALL", "token_display": "Network (RECALL)", "exchange": "Bybit", "type": "spot", "time": "15:01", "notes": "📢 **BYBIT: 🔥 Listing of RECALL on Convert & Bybit Savings **  BYBIT: 🔥 RECALL 代币在 Convert 和 Bybit Savings 平台上架  ---------- 🔗 [查看来源](https://announceme"},
+    {"date": "2025-10-15", "token": "YB", "token_display": "Basis (YB)", "exchange": "Bybit", "type": "spot", "time": "15:05", "notes": "📢 **BYBIT: 🔥 Listing of YB on Convert **  BYBIT: 🔥 在 Convert 交易平台上线 YB 代币  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/-listing-of-"},
+    {"date": "2025-10-16", "token": "TLN", "token_display": "TLN", "exchange": "Bybit", "type": "spot", "time": "18:30", "notes": "📢 **BYBIT: New listing: TLN is now live on Bybit TradFi! **  BYBIT: 新上架公告：TLN现已登陆Bybit TradFi平台！  ---------- 🔗 [查看来源](https://announcements.bybit.com/"},
+    {"date": "2025-10-17", "token": "ZORA", "token_display": "ZORA", "exchange": "Upbit", "type": "spot", "time": "10:30", "notes": "📢 **UPBIT LISTING:[거래] 조라(ZORA) 신규 거래지원 안내 (KRW, BTC, USDT 마켓) **  UPBIT LISTING:[交易] 关于支持ZORA（ZORA）新交易的公告（KRW, BTC, USDT 市场）  ---------- 🕒 __2025-10-"},
+    {"date": "2025-10-17", "token": "ZEROBASE", "token_display": "ZBT (ZEROBASE)", "exchange": "OKX", "type": "pre-market", "time": "11:02", "notes": "📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list pre-market perpetual futures for ZBT (ZEROBASE) cryptoDetail:  at: 2025-10-17T11:02:23Z **  O"},
+    {"date": "2025-10-17", "token": "DOOD", "token_display": "Doodles (DOOD)", "exchange": "Bithumb", "type": "spot", "time": "11:33", "notes": "📢 **Bithumb LISTING:인피닛(IN), 두들즈(DOOD), 일드 베이시스(YB) 원화 마켓 추가 (거래 수수료 무료) **  Bithumb LISTING:无限币 (IN)、涂鸦币 (DOOD)、收益基础币 (YB) 新增韩元市场交易（交易手续费全免）。  ------"},
+    {"date": "2025-10-17", "token": "ORCA", "token_display": "ORCA", "exchange": "Upbit", "type": "spot", "time": "11:56", "notes": "📢 **UPBIT LISTING:[거래] 유통량 계획표 변경 안내 : 오르카(ORCA) **  UPBIT LISTING:【交易】流通量计划表变更通知：Orca（ORCA）  ---------- 🕒 __2025-10-17 11:56:47__"},
+    {"date": "2025-10-17", "token": "IN", "token_display": "Infinite (IN)", "exchange": "Bithumb", "type": "spot", "time": "14:10", "notes": "📢 **Bithumb LISTING:[이벤트] 인피닛(IN), 일드베이시스(YB) 원화 마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:[活动] 为了纪念 Infinite(IN) 和 Yield Basis(YB) 上线韩元市场，即将举行空投活动。  ----"},
+    {"date": "2025-10-17", "token": "YB", "token_display": "Basis (YB)", "exchange": "Bithumb", "type": "spot", "time": "14:10", "notes": "📢 **Bithumb LISTING:[이벤트] 인피닛(IN), 일드베이시스(YB) 원화 마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:[活动] 为了纪念 Infinite(IN) 和 Yield Basis(YB) 上线韩元市场，即将举行空投活动。  ----"},
+    {"date": "2025-10-17", "token": "ZBT", "token_display": "ZEROBASE (ZBT)", "exchange": "Bybit", "type": "spot", "time": "17:00", "notes": "📢 **BYBIT: 🔥 Listing of ZBT on Convert **  BYBIT: 🔥 法币交易平台Convert将上线ZBT  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/-listing-of-zb"},
+    {"date": "2025-10-17", "token": "ZBT", "token_display": "ZEROBASE (ZBT)", "exchange": "Upbit", "type": "spot", "time": "17:00", "notes": "📢 **UPBIT LISTING:[거래] 제로베이스(ZBT) 신규 거래지원 안내 (KRW, BTC, USDT 마켓) **  UPBIT LISTING:[交易] 支持零基（ZBT）新交易的通知 （KRW、BTC、USDT 市场）  ---------- 🕒 __2025-10-17 1"},
+    {"date": "2025-10-17", "token": "ZBT", "token_display": "ZEROBASE (ZBT)", "exchange": "Binance", "type": "perp", "time": "17:30", "notes": "📢 **Binance: ZEROBASE (ZBT) Will Be Available on Binance Alpha and Binance Futures (2025-10-17) **  Binance: ZEROBASE（ZBT）将于2025年10月17日在Binance Alpha和"},
+    {"date": "2025-10-17", "token": "ZBT", "token_display": "ZEROBASE (ZBT)", "exchange": "Binance", "type": "spot", "time": "17:53", "notes": "📢 **Binance: Introducing ZEROBASE (ZBT) on Binance HODLer Airdrops! Earn ZBT With Retroactive BNB Simple Earn Subscriptions **  Binance: 欢迎参与 Binance "},
+    {"date": "2025-10-17", "token": "ZBT", "token_display": "ZEROBASE (ZBT)", "exchange": "Bithumb", "type": "spot", "time": "19:58", "notes": "📢 **Bithumb LISTING:제로베이스(ZBT) 원화마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:为庆祝 ZBT 韩元市场上线，特别举行空投活动。  ---------- 🔗 [查看来源](https://feed.bithumb.com/notice/1"},
+    {"date": "2025-10-17", "token": "LAB", "token_display": "LAB", "exchange": "Binance", "type": "perp", "time": "20:58", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined LABUSDT and RIVERUSDT Perpetual Contracts (2025-10-17) **  Binance 期货将推出以 USDⓈ 为保证金的 LABUSDT 和 RIVERUSDT"},
+    {"date": "2025-10-17", "token": "RIVER", "token_display": "RIVER", "exchange": "Binance", "type": "perp", "time": "20:58", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined LABUSDT and RIVERUSDT Perpetual Contracts (2025-10-17) **  Binance 期货将推出以 USDⓈ 为保证金的 LABUSDT 和 RIVERUSDT"},
+    {"date": "2025-10-17", "token": "ZBT", "token_display": "ZEROBASE (ZBT)", "exchange": "Bybit", "type": "perp", "time": "21:23", "notes": "📢 **BYBIT: New Listing :  ZBTUSDT Perpetual Contract, with up to 50x leverage **  BYBIT: 新上线：ZBTUSDT 永续合约，最高支持 50 倍杠杆  ---------- 🔗 [查看来源](https://ann"},
+    {"date": "2025-10-18", "token": "KGEN", "token_display": "KGen (KGEN)", "exchange": "OKX", "type": "perp", "time": "03:30", "notes": "📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list perpetual futures for KGEN cryptoDetail:  at: 2025-10-18T03:30:56Z **  OKX LISTING:#OKX 重要公告 "},
+    {"date": "2025-10-18", "token": "RVV", "token_display": "Nova (RVV)", "exchange": "Binance", "type": "perp", "time": "18:30", "notes": "📢 **Binance: Astra Nova (RVV) Will Be Available on Binance Alpha and Binance Futures (2025-10-18) **  Binance: Astra Nova (RVV) 将于2025年10月18日在币安Alpha和"},
+    {"date": "2025-10-20", "token": "BIO", "token_display": "Protocol (BIO)", "exchange": "Upbit", "type": "spot", "time": "14:35", "notes": "📢 **UPBIT LISTING:[거래] 바이오프로토콜(BIO) 신규 거래지원 안내 (KRW, BTC, USDT 마켓) **  UPBIT LISTING:[交易] BIO Protocol (BIO) 新增交易支持通知 (KRW, BTC, USDT 市场)  ---------- "},
+    {"date": "2025-10-21", "token": "ZORA", "token_display": "ZORA", "exchange": "Bithumb", "type": "spot", "time": "15:15", "notes": "📢 **Bithumb LISTING:조라(ZORA), 리콜(RECALL) 원화 마켓 추가(거래 수수료 무료) **  Bithumb LISTING:ZORA和RECALL已新增韩元市场（交易手续费免费）。  ---------- 🔗 [查看来源](https://feed.bithum"},
+    {"date": "2025-10-21", "token": "RECALL", "token_display": "Network (RECALL)", "exchange": "Bithumb", "type": "spot", "time": "15:15", "notes": "📢 **Bithumb LISTING:조라(ZORA), 리콜(RECALL) 원화 마켓 추가(거래 수수료 무료) **  Bithumb LISTING:ZORA和RECALL已新增韩元市场（交易手续费免费）。  ---------- 🔗 [查看来源](https://feed.bithum"},
+    {"date": "2025-10-21", "token": "TURTLE", "token_display": "Turtle (TURTLE)", "exchange": "Binance", "type": "spot", "time": "15:56", "notes": "📢 **Binance: Introducing Turtle (TURTLE) on Binance HODLer Airdrops! Earn TURTLE With Retroactive BNB Simple Earn Subscriptions **  Binance: Binance H"},
+    {"date": "2025-10-21", "token": "BLUAI", "token_display": "Bluwhale (BLUAI)", "exchange": "Binance", "type": "perp", "time": "19:03", "notes": "📢 **Binance: Bluwhale (BLUAI) Will Be Available on Binance Alpha and Binance Futures (2025-10-21) **  Binance: Bluwhale (BLUAI) 将于2025年10月21日在Binance "},
+    {"date": "2025-10-22", "token": "KTA", "token_display": "Keeta (KTA)", "exchange": "Coinbase", "type": "spot", "time": "00:00", "pairs": "KTA/USD", "notes": "📢 **COINBASE LISTING: Spot trading for Keeta (KTA) will go live on 22 October 2025. The opening of our KTA-USD trading pair will begin on or after 9AM"},
+    {"date": "2025-10-22", "token": "MET", "token_display": "MET (Meteora)", "exchange": "OKX", "type": "spot", "time": "03:03", "notes": "📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list MET (Meteora) for spot tradingDetail:  at: 2025-10-22T03:03:00Z **  OKX LISTING:#OKX重要公告    O"},
+    {"date": "2025-10-22", "token": "CPOOL", "token_display": "ClearPool (CPOOL)", "exchange": "Upbit", "type": "spot", "time": "13:20", "notes": "📢 **UPBIT LISTING:[거래] 클리어풀(CPOOL) 신규 거래지원 안내 (KRW, BTC, USDT 마켓) **  UPBIT LISTING:[交易] 新增支持 ClearPool (CPOOL) 交易对（KRW、BTC、USDT 市场）  ---------- 🔗 [查看"},
+    {"date": "2025-10-22", "token": "CPOOL", "token_display": "ClearPool (CPOOL)", "exchange": "Bithumb", "type": "spot", "time": "13:35", "notes": "📢 **Bithumb LISTING:클리어풀(CPOOL) 원화 마켓 추가 (거래 수수료 무료) **  Bithumb LISTING:ClearPool(CPOOL)韩元市场现已上线（交易手续费免费）  ---------- 🔗 [查看来源](https://feed.bithumb.c"},
+    {"date": "2025-10-22", "token": "TURTLE", "token_display": "Turtle (TURTLE)", "exchange": "Bybit", "type": "perp", "time": "23:21", "notes": "📢 **BYBIT: New Listing : TURTLEUSDT Perpetual Contract in Innovation Zone, with up to 25x leverage **  BYBIT: 新币上市：TURTLEUSDT 永续合约已登录创新区，最大杠杆高达25倍  --"},
+    {"date": "2025-10-23", "token": "APR", "token_display": "Priori (APR)", "exchange": "Coinbase", "type": "spot", "time": "01:05", "pairs": "APR/USD", "notes": "📢 **COINBASE LISTING: Spot trading for aPriori (APR) and Meteora (MET) will go live on 23 October 2025. The opening of our APR-USD and MET-USD trading"},
+    {"date": "2025-10-23", "token": "MET", "token_display": "Meteora (MET)", "exchange": "Coinbase", "type": "spot", "time": "01:05", "pairs": "MET/USD", "notes": "📢 **COINBASE LISTING: Spot trading for aPriori (APR) and Meteora (MET) will go live on 23 October 2025. The opening of our APR-USD and MET-USD trading"},
+    {"date": "2025-10-23", "token": "MEGA", "token_display": "MegaETH (MEGA)", "exchange": "Bybit", "type": "pre-market", "time": "12:30 UTC", "notes": "📢 **BYBIT: Listing of MEGAUSDT on Bybit Perpetual Pre-Market on Oct 23, 2025, 12:30PM UTC **  BYBIT: MEGAUSDT将于2025年10月23日UTC时间12:30在Bybit永续期货预上市市场上线。"},
+    {"date": "2025-10-23", "token": "APR", "token_display": "Priori (APR)", "exchange": "Binance", "type": "perp", "time": "14:30", "notes": "📢 **Binance: aPriori (APR) Will Be Available on Binance Alpha and Binance Futures (2025-10-23) **  Binance: aPriori (APR) 将于2025年10月23日在Binance Alpha和"},
+    {"date": "2025-10-23", "token": "MET", "token_display": "MET (Meteora)", "exchange": "Bybit", "type": "spot", "time": "20:00", "notes": "📢 **BYBIT: 🔥 Listing of MET on Convert **  BYBIT: MET现已上线Convert平台🔥  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/-listing-of-met-on"},
+    {"date": "2025-10-23", "token": "APR", "token_display": "Priori (APR)", "exchange": "Bybit", "type": "perp", "time": "20:34", "notes": "📢 **BYBIT: New Listing : APRUSDT Perpetual Contract in Innovation Zone, with up to 50x leverage **  BYBIT: 创新区新上线：APRUSDT 永续合约，支持最高 50 倍杠杆  ----------"},
+    {"date": "2025-10-24", "token": "APR", "token_display": "Priori (APR)", "exchange": "OKX", "type": "perp", "time": "04:42", "notes": "📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list perpetual futures for APR cryptoDetail:  at: 2025-10-24T04:42:19Z **  OKX LISTING:#OKX 重要公告 O"},
+    {"date": "2025-10-24", "token": "TURTLE", "token_display": "Turtle (TURTLE)", "exchange": "OKX", "type": "perp", "time": "09:41", "notes": "📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list perpetual futures for TURTLE cryptoDetail:  at: 2025-10-24T09:41:19Z **  OKX LISTING:#OKX重要通知"},
+    {"date": "2025-10-24", "token": "ON", "token_display": "Orochi (ON)", "exchange": "Binance", "type": "perp", "time": "14:00", "notes": "📢 **Binance: Orochi (ON) Will Be Available on Binance Alpha and Binance Futures (2025-10-24) **  Binance: Orochi (ON) 将于2025年10月24日在币安Alpha和币安期货上线。  -"},
+    {"date": "2025-10-24", "token": "UTA", "token_display": "UTA", "exchange": "Bybit", "type": "spot", "time": "17:54", "notes": "📢 **BYBIT: Listing of TRY and BRL as new collateral assets for UTA Loan and Institutional Loan **  BYBIT: 土耳其里拉（TRY）和巴西雷亚尔（BRL）将作为新的抵押资产，上线 UTA 贷款和机构贷"},
+    {"date": "2025-10-25", "token": "GIGGLE", "token_display": "Fund (GIGGLE)", "exchange": "OKX", "type": "perp", "time": "06:31", "notes": "📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list perpetual futures for GIGGLE cryptoDetail:  at: 2025-10-25T06:31:17Z **  OKX LISTING:#OKX 重要通"},
+    {"date": "2025-10-25", "token": "GIGGLE", "token_display": "Fund (GIGGLE)", "exchange": "Binance", "type": "perp", "time": "11:02", "notes": "📢 **Binance Will List Giggle Fund (GIGGLE) and SynFutures (F) with Seed Tag Applied **  币安将上线Giggle Fund (GIGGLE)和SynFutures (F)，并应用种子标签  ---------- 🔗"},
+    {"date": "2025-10-25", "token": "GIGGLE", "token_display": "Fund (GIGGLE)", "exchange": "Binance", "type": "spot", "time": "13:30", "notes": "📢 **Binance Will Add Giggle Fund (GIGGLE) and SynFutures (F) on Earn, Buy Crypto, Convert & Margin **  币安（Binance）将在Earn、购买加密货币、兑换和保证金交易中上线Giggle Fund"},
+    {"date": "2025-10-27", "token": "MMT", "token_display": "Momentum (MMT)", "exchange": "Bybit", "type": "pre-market", "time": "11:00 UTC", "notes": "📢 **BYBIT: Listing of MMTUSDT on Bybit Perpetual Pre-Market on Oct 27, 2025, 11:00AM UTC **  BYBIT: MMTUSDT将于2025年10月27日当地时间上午11：00在Bybit永续合约预上市市场上线。 "},
+    {"date": "2025-10-27", "token": "COMMON", "token_display": "Common (COMMON)", "exchange": "Binance", "type": "perp", "time": "14:00", "notes": "📢 **Binance: Common (COMMON) Will Be Available on Binance Alpha and Binance Futures (2025-10-27) **  Binance: Common（COMMON）将于2025年10月27日在 Binance Alp"},
+    {"date": "2025-10-27", "token": "SYND", "token_display": "Syndicate (SYND)", "exchange": "Bybit", "type": "spot", "time": "16:21", "notes": "📢 **BYBIT: 🔥 Listing of SYND on Convert **  BYBIT: 🔥 SYND上线Convert平台  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/-listing-of-synd-"},
+    {"date": "2025-10-27", "token": "COMMON", "token_display": "Common (COMMON)", "exchange": "Bybit", "type": "spot", "time": "20:01", "notes": "📢 **BYBIT: 🔥 Listing of COMMON on Convert **  BYBIT: 🔥 COMMON成功上线Convert平台  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/-listing-of"},
+    {"date": "2025-10-27", "token": "DBR", "token_display": "Bridge (DBR)", "exchange": "Coinbase", "type": "spot", "time": "22:38", "notes": "📢 **COINBASE LISTING: Assets added to the roadmap today: deBridge (DBR) **  COINBASE LISTING: 今日添加到路线图中的资产：deBridge（DBR）  ---------- 🔗 [查看来源](https://"},
+    {"date": "2025-10-28", "token": "VIRTUAL", "token_display": "Protocol (VIRTUAL)", "exchange": "OKX", "type": "spot", "time": "03:00", "notes": "📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list Virtuals Protocol (VIRTUAL) for spot tradingDetail:  at: 2025-10-28T03:00:34Z **  OKX LISTING"},
+    {"date": "2025-10-28", "token": "KERNEL", "token_display": "KERNEL", "exchange": "Upbit", "type": "spot", "time": "15:00", "notes": "📢 **UPBIT LISTING:[거래] 커널다오(KERNEL) KRW 마켓 디지털 자산 추가 **  UPBIT LISTING:[交易] KERNEL DAO（KERNEL）已上线KRW市场，作为新增的数字资产。  ---------- 🔗 [查看来源](https://upbit.c"},
+    {"date": "2025-10-29", "token": "PIGGY", "token_display": "PIGGY", "exchange": "OKX", "type": "perp", "time": "05:00", "notes": "📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list perpetual futures for PIGGY cryptoDetail:  at: 2025-10-29T05:00:41Z **  OKX LISTING:#OKX 重要公告"},
+    {"date": "2025-10-29", "token": "ENSO", "token_display": "Enso (ENSO)", "exchange": "OKX", "type": "perp", "time": "09:01", "notes": "📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list perpetual futures for ENSO, OL cryptoDetail:  at: 2025-10-29T09:01:20Z **  OKX LISTING:#OKX 重"},
+    {"date": "2025-10-29", "token": "OL", "token_display": "OL", "exchange": "OKX", "type": "perp", "time": "09:01", "notes": "📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list perpetual futures for ENSO, OL cryptoDetail:  at: 2025-10-29T09:01:20Z **  OKX LISTING:#OKX 重"},
+    {"date": "2025-10-29", "token": "KITE", "token_display": "Kite (KITE)", "exchange": "OKX", "type": "pre-market", "time": "12:01", "notes": "📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list pre-market perpetual futures for KITE (Kite AI) cryptoDetail:  at: 2025-10-29T12:01:32Z **  O"},
+    {"date": "2025-10-29", "token": "ENSO", "token_display": "Enso (ENSO)", "exchange": "Upbit", "type": "spot", "time": "14:30", "notes": "📢 **UPBIT LISTING:엔소(ENSO) 신규 거래지원 안내 (KRW, BTC, USDT 마켓) **  UPBIT LISTING:ENSO（ENSO）新增交易对公告（KRW、BTC、USDT市场）  ---------- 🔗 [查看来源](https://upbit.com/s"},
+    {"date": "2025-10-29", "token": "EAT", "token_display": "EAT", "exchange": "Bybit", "type": "spot", "time": "15:30", "notes": "📢 **BYBIT: 🔥 Listing of EAT on Convert & Bybit Savings **  BYBIT: 🔥 EAT代币上线Convert与Bybit储蓄平台  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/a"},
+    {"date": "2025-10-29", "token": "ENSO", "token_display": "Enso (ENSO)", "exchange": "Bithumb", "type": "spot", "time": "15:52", "notes": "📢 **Bithumb LISTING:엔소(ENSO) 원화마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:ENSO韩元市场上线纪念空投活动  ---------- 🔗 [查看来源](https://feed.bithumb.com/notice/1650464) 🕒 "},
+    {"date": "2025-10-29", "token": "AT", "token_display": "APRO (AT)", "exchange": "Binance", "type": "perp", "time": "17:36", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined ATUSDT Perpetual Contract (2025-10-29) **  币安期货将推出以USDT为保证金的全额结算永久合约 ATUSDT，合约到期日为2025年10月29日。  --------"},
+    {"date": "2025-10-29", "token": "KITE", "token_display": "Kite (KITE)", "exchange": "Binance", "type": "pre-market", "time": "18:14", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined KITEUSDT Perpetual Contract Pre-Market Trading (2025-10-29) **  币安期货将推出以USDⓈ保证金的KITEUSDT永续合约的Pre-Market交"},
+    {"date": "2025-10-29", "token": "KITE", "token_display": "Kite (KITE)", "exchange": "Bybit", "type": "pre-market", "time": "1:00 UTC", "notes": "📢 **BYBIT: Listing of KITEUSDT on Bybit Perpetual Pre-Market on Oct 29, 2025, 1:00PM UTC **  BYBIT: KITEUSDT将于2025年10月29日UTC时间下午1点在Bybit永续期货预上市市场上线。  "},
+    {"date": "2025-10-29", "token": "DBR", "token_display": "Bridge (DBR)", "exchange": "Coinbase", "type": "spot", "time": "23:50", "pairs": "DBR/USD", "notes": "📢 **COINBASE LISTING: Spot trading for deBridge (DBR) will go live on 29 October 2025. The opening of our DBR-USD trading pair will begin on or after "},
+    {"date": "2025-10-30", "token": "AT", "token_display": "APRO (AT)", "exchange": "OKX", "type": "perp", "time": "09:31", "notes": "📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list perpetual futures for AT, RECALL cryptoDetail:  at: 2025-10-30T09:31:48Z **  OKX LISTING:#OKX"},
+    {"date": "2025-10-30", "token": "RECALL", "token_display": "Network (RECALL)", "exchange": "OKX", "type": "perp", "time": "09:31", "notes": "📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list perpetual futures for AT, RECALL cryptoDetail:  at: 2025-10-30T09:31:48Z **  OKX LISTING:#OKX"},
+    {"date": "2025-10-31", "token": "CC", "token_display": "CC (Canton)", "exchange": "OKX", "type": "pre-market", "time": "13:22", "notes": "📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list pre-market perpetual futures for CC(Canton Network) cryptoDetail:  at: 2025-10-31T13:22:13Z *"},
+    {"date": "2025-10-31", "token": "KITE", "token_display": "Kite (KITE)", "exchange": "Binance", "type": "spot", "time": "16:09", "notes": "📢 **Binance: Introducing Kite (KITE) on Binance Launchpool! Farm KITE by Locking BNB, FDUSD and USDC **  Binance: Binance Launchpool正式上线Kite（KITE）！锁定B"},
+    {"date": "2025-10-31", "token": "FD", "token_display": "FD", "exchange": "Binance", "type": "spot", "time": "16:09", "notes": "📢 **Binance: Introducing Kite (KITE) on Binance Launchpool! Farm KITE by Locking BNB, FDUSD and USDC **  Binance: Binance Launchpool正式上线Kite（KITE）！锁定B"},
+    {"date": "2025-10-31", "token": "CC", "token_display": "CC (Canton)", "exchange": "Binance", "type": "pre-market", "time": "19:45", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined CCUSDT Perpetual Contract Pre-Market Trading (2025-10-31) **  Binance 期货将推出以USDⓈ计价的CCUSDT永续合约预市交易（2025-1"},
+    {"date": "2025-10-31", "token": "CC", "token_display": "CC (Canton)", "exchange": "Bybit", "type": "pre-market", "time": "2:00 UTC", "notes": "📢 **BYBIT: Listing of CCUSDT on Bybit Perpetual Pre-Market on Oct 31, 2025, 2:00PM UTC **  BYBIT: CCUSDT将于2025年10月31日14:00（UTC时间）在Bybit永续期货预市上线。  ----"},
+    {"date": "2025-11-01", "token": "LAB", "token_display": "LAB", "exchange": "OKX", "type": "perp", "time": "11:01", "notes": "📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list perpetual futures for LAB cryptoDetail:  at: 2025-11-01T11:01:26Z **  OKX LISTING:#OKX重要通知 OK"},
+    {"date": "2025-11-03", "token": "KITE", "token_display": "Kite (KITE)", "exchange": "Coinbase", "type": "spot", "time": "00:58", "pairs": "KITE/USD", "notes": "📢 **COINBASE LISTING: Spot trading for Kite (KITE) will go live on 3 November 2025. The opening of our KITE-USD trading pair will begin later today if"},
+    {"date": "2025-11-03", "token": "ZEN", "token_display": "ZEN", "exchange": "OKX", "type": "perp", "time": "05:31", "notes": "📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list perpetual futures for ZEN cryptoDetail:  at: 2025-11-03T05:31:54Z **  OKX LISTING:#OKX 重要通知 O"},
+    {"date": "2025-11-03", "token": "HYPE", "token_display": "HYPERLIQUID (HYPE)", "exchange": "OKX", "type": "spot", "time": "07:30", "notes": "📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list HYPE for spot tradingDetail:  at: 2025-11-03T07:30:24Z **  OKX LISTING:#OKX 重要公告 OKX即将上线HYPE进"},
+    {"date": "2025-11-03", "token": "KITE", "token_display": "Kite (KITE)", "exchange": "OKX", "type": "pre-market", "time": "11:01", "notes": "📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list KITE (Kite AI) for spot trading and convert pre-market futures to standard perpetual futuresD"},
+    {"date": "2025-11-03", "token": "KITE", "token_display": "Kite (KITE)", "exchange": "Upbit", "type": "spot", "time": "16:11", "notes": "📢 **UPBIT LISTING:[Trade] Market Support for Kite(KITE) (KRW, BTC, USDT Market) **  UPBIT LISTING:[交易] 市场对Kite（KITE）的支持（韩元、比特币、Tether市场）  ---------- 🔗"},
+    {"date": "2025-11-03", "token": "MMT", "token_display": "Momentum (MMT)", "exchange": "Binance", "type": "spot", "time": "16:14", "notes": "📢 **Binance: Introducing Momentum (MMT) on Binance HODLer Airdrops! Earn MMT With Retroactive BNB Simple Earn Subscriptions **  Binance: Binance HODLe"},
+    {"date": "2025-11-03", "token": "KITE", "token_display": "Kite (KITE)", "exchange": "Bithumb", "type": "spot", "time": "19:00", "notes": "📢 **Bithumb LISTING:카이트(KITE) 원화마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:为庆祝KITE韩元市场上线，现推出空投活动  ---------- 🔗 [查看来源](https://feed.bithumb.com/notice/16505"},
+    {"date": "2025-11-03", "token": "KITE", "token_display": "Kite (KITE)", "exchange": "Binance", "type": "spot", "time": "20:30", "notes": "📢 **Binance Will Add Kite (KITE) on Earn, Buy Crypto, Convert, Margin & Futures **  币安即将在Earn赚币、买币、一键买卖、杠杆交易和合约交易等产品中上线Kite（KITE）。  ---------- 🔗 [查看来源"},
+    {"date": "2025-11-04", "token": "MON", "token_display": "Monad (MON)", "exchange": "Coinbase", "type": "spot", "time": "01:57", "notes": "📢 **COINBASE LISTING: Assets added to the roadmap today: Monad (MON) **  COINBASE LISTING: 今日被列入发展路线图的资产：Monad (MON)。  ---------- 🔗 [查看来源](https://twi"},
+    {"date": "2025-11-04", "token": "MMT", "token_display": "Momentum (MMT)", "exchange": "OKX", "type": "spot", "time": "06:00", "notes": "📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list MMT for spot tradingDetail:  at: 2025-11-04T06:00:37Z **  OKX LISTING:#OKX重要公告 OKX即将上线 MMT 现货"},
+    {"date": "2025-11-04", "token": "MMT", "token_display": "Momentum (MMT)", "exchange": "OKX", "type": "perp", "time": "08:30", "notes": "📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list perpetual futures for MMT cryptoDetail:  at: 2025-11-04T08:30:48Z **  OKX LISTING:#OKX 重要公告 O"},
+    {"date": "2025-11-04", "token": "MMT", "token_display": "Momentum (MMT)", "exchange": "Bybit", "type": "spot", "time": "15:01", "notes": "📢 **BYBIT: 🔥 Listing of MMT on Convert **  BYBIT: 🔥 MMT 在 Convert 平台上线  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/-listing-of-mmt"},
+    {"date": "2025-11-04", "token": "MMT", "token_display": "Momentum (MMT)", "exchange": "Upbit", "type": "spot", "time": "17:35", "notes": "📢 **UPBIT LISTING:[거래] 모멘텀(MMT) 신규 거래지원 안내 (BTC, USDT 마켓) **  UPBIT LISTING:[交易] Momentum (MMT) 新增交易支持通知 (BTC, USDT 市场)  ---------- 🔗 [查看来源](https://u"},
+    {"date": "2025-11-04", "token": "MMT", "token_display": "Momentum (MMT)", "exchange": "Bithumb", "type": "spot", "time": "19:53", "notes": "📢 **Bithumb LISTING:모멘텀(MMT) 원화마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:为庆祝MMT（Momentum）上线韩元市场，特别推出空投活动。  ---------- 🔗 [查看来源](https://feed.bithumb.com/no"},
+    {"date": "2025-11-05", "token": "TRUST", "token_display": "Intuition (TRUST)", "exchange": "OKX", "type": "perp", "time": "11:02", "notes": "📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list perpetual futures for TRUST cryptoDetail:  at: 2025-11-05T11:02:01Z **  OKX LISTING:#OKX 重要公告"},
+    {"date": "2025-11-05", "token": "MMT", "token_display": "Momentum (MMT)", "exchange": "Upbit", "type": "spot", "time": "13:48", "notes": "📢 **UPBIT LISTING:모멘텀(MMT) KRW 마켓 디지털 자산 추가 **  UPBIT LISTING:动量（MMT）将被纳入韩国KRW市场的数字资产列表。  ---------- 🔗 [查看来源](https://upbit.com/service_center/notice?"},
+    {"date": "2025-11-05", "token": "TRUST", "token_display": "Intuition (TRUST)", "exchange": "Binance", "type": "perp", "time": "14:03", "notes": "📢 **Binance: Intuition (TRUST) Will Be Available on Binance Alpha and Binance Futures (2025-11-05) **  Binance: 直觉币（TRUST）将于2025年11月5日上线币安Alpha和币安合约交易"},
+    {"date": "2025-11-05", "token": "TRUST", "token_display": "Intuition (TRUST)", "exchange": "Upbit", "type": "spot", "time": "16:44", "notes": "📢 **UPBIT LISTING:[거래] 인튜이션(TRUST) 신규 거래지원 안내 (KRW, BTC, USDT 마켓) **  UPBIT LISTING:[交易] TRUST支持新增交易对（KRW、BTC、USDT市场）的公告  ---------- 🔗 [查看来源](https://"},
+    {"date": "2025-11-05", "token": "TRUST", "token_display": "Intuition (TRUST)", "exchange": "Bithumb", "type": "spot", "time": "18:40", "notes": "📢 **Bithumb LISTING:인튜이션(TRUST) 원화마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:为庆祝Intuition (TRUST)上线韩元市场，举行纪念空投活动  ---------- 🔗 [查看来源](https://feed.bithumb."},
+    {"date": "2025-11-06", "token": "SAPIEN", "token_display": "Sapien (SAPIEN)", "exchange": "OKX", "type": "perp", "time": "11:16", "notes": "📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list perpetual futures for SAPIEN cryptoDetail:  at: 2025-11-06T11:16:05Z **  OKX LISTING:#OKX 重要公"},
+    {"date": "2025-11-06", "token": "SAPIEN", "token_display": "Sapien (SAPIEN)", "exchange": "Binance", "type": "spot", "time": "12:45", "notes": "📢 **Binance: Introducing Sapien (SAPIEN) on Binance HODLer Airdrops! Earn SAPIEN With Retroactive BNB Simple Earn Subscriptions **  Binance: Binance 推"},
+    {"date": "2025-11-06", "token": "UAI", "token_display": "UnifAI (UAI)", "exchange": "Binance", "type": "perp", "time": "15:01", "notes": "📢 **Binance: UnifAI (UAI) Will Be Available on Binance Alpha and Binance Futures (2025-11-06) **  Binance: UnifAI（UAI）将于2025年11月6日上线Binance Alpha和Bina"},
+    {"date": "2025-11-06", "token": "LITKEY", "token_display": "LITKEY", "exchange": "Bybit", "type": "spot", "time": "17:51", "notes": "📢 **BYBIT: 🔥 Listing of LITKEY on Convert & Bybit Savings **  BYBIT: 🔥 LITKEY 上线 Convert 和 Bybit 理财平台  ---------- 🔗 [查看来源](https://announcements.bybit"},
+    {"date": "2025-11-06", "token": "FOLKS", "token_display": "Finance (FOLKS)", "exchange": "Binance", "type": "perp", "time": "18:30", "notes": "📢 **Binance: Folks Finance (FOLKS) Will Be Available on Binance Alpha and Binance Futures (2025-11-06) **  Binance: Folks Finance（FOLKS）将于2025年11月6日上线"},
+    {"date": "2025-11-06", "token": "STABLE", "token_display": "STABLE", "exchange": "Binance", "type": "pre-market", "time": "19:44", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined STABLEUSDT Perpetual Contract Pre-Market Trading (2025-11-06) **  币安期货将推出以USDT为本位的STABLEUSDT永续合约的预市交易（20"},
+    {"date": "2025-11-06", "token": "STABLE", "token_display": "STABLE", "exchange": "Bybit", "type": "pre-market", "time": "1:30 UTC", "notes": "📢 **BYBIT: Listing of STABLEUSDT on Bybit Perpetual Pre-Market on Nov 6, 2025, 1:30PM UTC **  BYBIT: STABLEUSDT 将于2025年11月6日13:30（UTC）在Bybit永续合约预上市市场上"},
+    {"date": "2025-11-07", "token": "ROI", "token_display": "ROI", "exchange": "Binance", "type": "perp", "time": "17:00", "notes": "📢 **Binance Futures Will Apply New ROI Method to Copy Trading and Update ROI for All Lead Portfolios **  Binance合约将采用新的ROI计算方法应用于跟单交易，并更新所有主投组合的ROI数据。"},
+    {"date": "2025-11-08", "token": "ASTER", "token_display": "Aster (ASTER)", "exchange": "Coinbase", "type": "spot", "time": "04:17", "notes": "📢 **COINBASE LISTING: Assets added to the roadmap today: Aster (ASTER) **  COINBASE LISTING: 今日添加至路径图的资产：Aster（ASTER）  ---------- 🔗 [查看来源](https://twi"},
+    {"date": "2025-11-10", "token": "JCT", "token_display": "Janction (JCT)", "exchange": "Binance", "type": "perp", "time": "14:00", "notes": "📢 **Binance: Janction (JCT) Will Be Available on Binance Alpha and Binance Futures (2025-11-10) **  Binance: Janction (JCT) 将于2025年11月10日在Binance Alph"},
+    {"date": "2025-11-11", "token": "ALLO", "token_display": "Allora (ALLO)", "exchange": "OKX", "type": "spot", "time": "07:30", "notes": "📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list ALLO for spot tradingDetail:  at: 2025-11-11T07:30:26Z **  OKX LISTING:#OKX 重要通知   OKX 将上线 AL"},
+    {"date": "2025-11-11", "token": "FLUID", "token_display": "Fluid (FLUID)", "exchange": "Coinbase", "type": "spot", "time": "09:34", "notes": "📢 **COINBASE LISTING: Assets added to the roadmap today: Fluid (FLUID) and Nomina (NOM) **  COINBASE LISTING: 今日加入路线图的资产有：Fluid（FLUID）和Nomina（NOM）。  -"},
+    {"date": "2025-11-11", "token": "NOM", "token_display": "Nomina (NOM)", "exchange": "Coinbase", "type": "spot", "time": "09:34", "notes": "📢 **COINBASE LISTING: Assets added to the roadmap today: Fluid (FLUID) and Nomina (NOM) **  COINBASE LISTING: 今日加入路线图的资产有：Fluid（FLUID）和Nomina（NOM）。  -"},
+    {"date": "2025-11-11", "token": "AERO", "token_display": "Finance (AERO)", "exchange": "Hyperliquid", "type": "perp", "time": "14:45", "pairs": "AERO/USD", "notes": "📢 **【hyperliquid】 新上线AERO/USDC永续合约，最高可达3倍杠杆 **  【hyperliquid】 最新上线 AERO/USDC 永续合约，支持最高 3 倍杠杆。  ---------- 🕒 __2025-11-11 14:45:00__"},
+    {"date": "2025-11-11", "token": "ALLO", "token_display": "Allora (ALLO)", "exchange": "OKX", "type": "perp", "time": "16:31", "notes": "📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list perpetual futures for ALLO cryptoDetail:  at: 2025-11-11T16:31:42Z **  OKX LISTING:#OKX 重要公告 "},
+    {"date": "2025-11-11", "token": "ALLO", "token_display": "Allora (ALLO)", "exchange": "Binance", "type": "spot", "time": "20:47", "notes": "📢 **Binance: Allora (ALLO) Listing Will Be Postponed **  Binance: Allora (ALLO) 上线将被推迟  ---------- 🔗 [查看来源](https://www.binance.com/en/support/article"},
+    {"date": "2025-11-12", "token": "ALLO", "token_display": "Allora (ALLO)", "exchange": "Coinbase", "type": "spot", "time": "05:34", "pairs": "ALLO/USD", "notes": "📢 **COINBASE LISTING: The launch of spot trading for Allora (ALLO) has been postponed to 12 November 2025. The opening of our ALLO-USD trading pair wi"},
+    {"date": "2025-11-12", "token": "BEAT", "token_display": "BEAT (Audiera)", "exchange": "OKX", "type": "perp", "time": "16:00", "notes": "📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list perpetual futures for BEAT (Audiera) cryptoDetail:  at: 2025-11-12T16:00:54Z **  OKX LISTING:"},
+    {"date": "2025-11-12", "token": "ELIZAOS", "token_display": "ELIZAOS", "exchange": "Bybit", "type": "spot", "time": "16:18", "notes": "📢 **BYBIT: 🔥 Listing of ELIZAOS on Convert & Bybit Savings **  BYBIT: 🔥 ELIZAOS 上线 Convert 和 Bybit Savings 平台  ---------- 🔗 [查看来源](https://announcemen"},
+    {"date": "2025-11-12", "token": "CLANKER", "token_display": "CLANKER", "exchange": "Binance", "type": "perp", "time": "18:15", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined CLANKERUSDT and BEATUSDT Perpetual Contracts (2025-11-12) **  Binance 期货将推出以USDⓈ计价的 CLANKERUSDT 和 BEATUS"},
+    {"date": "2025-11-12", "token": "BEAT", "token_display": "BEAT (Audiera)", "exchange": "Binance", "type": "perp", "time": "18:15", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined CLANKERUSDT and BEATUSDT Perpetual Contracts (2025-11-12) **  Binance 期货将推出以USDⓈ计价的 CLANKERUSDT 和 BEATUS"},
+    {"date": "2025-11-13", "token": "NOM", "token_display": "Nomina (NOM)", "exchange": "Coinbase", "type": "spot", "time": "03:33", "pairs": "NOM/USD", "notes": "📢 **COINBASE LISTING: Spot trading for Nomina (NOM) will go live on 13 November 2025. The opening of our NOM-USD trading pair will begin on or after 9"},
+    {"date": "2025-11-13", "token": "PLANCK", "token_display": "Planck (PLANCK)", "exchange": "Binance", "type": "perp", "time": "15:01", "notes": "📢 **Binance: Planck (PLANCK) Will Be Available on Binance Alpha and Binance Futures (2025-11-13) **  Binance: Planck (PLANCK) 将于 2025 年 11 月 13 日在 Bin"},
+    {"date": "2025-11-13", "token": "OKLO", "token_display": "OKLO", "exchange": "Bybit", "type": "spot", "time": "18:00", "notes": "📢 **BYBIT: New listing: OKLO is now live on Bybit TradFi! **  BYBIT: 新增上线：OKLO代币现已登陆Bybit传统金融（TradFi）交易平台！  ---------- 🔗 [查看来源](https://announcements."},
+    {"date": "2025-11-13", "token": "BANK", "token_display": "Protocol (BANK)", "exchange": "Binance", "type": "spot", "time": "21:30", "notes": "📢 **Binance Will Add Lorenzo Protocol (BANK) and Meteora (MET) on Earn, Buy Crypto, Convert & Margin **  **Binance** 将上线 **Lorenzo Protocol** (BANK) 和"},
+    {"date": "2025-11-13", "token": "MET", "token_display": "Meteora (MET)", "exchange": "Binance", "type": "spot", "time": "21:30", "notes": "📢 **Binance Will Add Lorenzo Protocol (BANK) and Meteora (MET) on Earn, Buy Crypto, Convert & Margin **  **Binance** 将上线 **Lorenzo Protocol** (BANK) 和"},
+    {"date": "2025-11-14", "token": "SEI", "token_display": "SEI", "exchange": "OKX", "type": "spot", "time": "03:00", "notes": "📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list SEI, 2Z for spot tradingDetail:  at: 2025-11-14T03:00:46Z **  OKX LISTING:#OKX 重要通知 OKX 将上线 S"},
+    {"date": "2025-11-14", "token": "SEI", "token_display": "SEI", "exchange": "OKX", "type": "perp", "time": "07:01", "notes": "📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list perpetual futures for SEI cryptoDetail:  at: 2025-11-14T07:01:11Z **  OKX LISTING:#OKX 重要通知 O"},
+    {"date": "2025-11-14", "token": "PLANCK", "token_display": "Planck (PLANCK)", "exchange": "Binance", "type": "perp", "time": "14:30", "notes": "📢 **Binance Futures Will Postpone the Launch of PLANCKUSDT Perpetual Contract **  Binance 期货将推迟启动 PLANCKUSDT 永续合约。  ---------- 🔗 [查看来源](https://www.bi"},
+    {"date": "2025-11-14", "token": "SENT", "token_display": "SENT (Sentient)", "exchange": "OKX", "type": "pre-market", "time": "14:33", "notes": "📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list pre-market perpetual futures for SENT (Sentient) cryptoDetail:  at: 2025-11-14T14:33:17Z **  "},
+    {"date": "2025-11-14", "token": "PIEVERSE", "token_display": "Pieverse (PIEVERSE)", "exchange": "Binance", "type": "perp", "time": "15:47", "notes": "📢 **Binance: Pieverse (PIEVERSE) Will Be Available on Binance Alpha and Binance Futures (2025-11-14) **  Binance: Pieverse（PIEVERSE）将上线 Binance Alpha "},
+    {"date": "2025-11-14", "token": "PIEVERSE", "token_display": "Pieverse (PIEVERSE)", "exchange": "Bybit", "type": "spot", "time": "20:00", "notes": "📢 **BYBIT: 🔥 Listing of PIEVERSE on Convert **  BYBIT: 🔥 PIEVERSE 上线 Convert 平台  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/-listi"},
+    {"date": "2025-11-14", "token": "PIEVERSE", "token_display": "Pieverse (PIEVERSE)", "exchange": "Bybit", "type": "perp", "time": "21:50", "pairs": "PIEVERSE/USD", "notes": "📢 **BYBIT: New Listing : PIEVERSEUSDT Perpetual Contract in Innovation Zone, with up to 25x leverage **  BYBIT: 新上线：创新区 PIEVERSE/USDT 永续合约，最高支持 25 倍杠杆"},
+    {"date": "2025-11-15", "token": "SENT", "token_display": "SENT (Sentient)", "exchange": "Bybit", "type": "pre-market", "time": "8:00 UTC", "notes": "📢 **BYBIT: Listing of SENTUSDT on Bybit Perpetual Pre-Market on Nov 15, 2025, 8:00AM UTC **  BYBIT: Bybit 将于 2025 年 11 月 15 日 UTC 时间上午 8:00 在永续期货预上市市场"},
+    {"date": "2025-11-16", "token": "PIEVERSE", "token_display": "Pieverse (PIEVERSE)", "exchange": "OKX", "type": "perp", "time": "03:01", "notes": "📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list perpetual futures for PIEVERSE cryptoDetail:  at: 2025-11-16T03:01:58Z **  OKX LISTING:#OKX 重"},
+    {"date": "2025-11-17", "token": "SUP", "token_display": "Superfluid (SUP)", "exchange": "Coinbase", "type": "spot", "time": "07:23", "pairs": "SUP/USD", "notes": "📢 **COINBASE LISTING: Spot trading for Superfluid (SUP) will go live on 17 November 2025. The opening of our SUP-USD trading pair will begin later tod"},
+    {"date": "2025-11-17", "token": "ZEN", "token_display": "ZEN", "exchange": "OKX", "type": "spot", "time": "13:00", "notes": "📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list ZEN for spot tradingDetail:  at: 2025-11-17T13:00:33Z **  OKX LISTING:#OKX 重要公告   OKX 将上线 ZEN"},
+    {"date": "2025-11-17", "token": "UAI", "token_display": "UnifAI (UAI)", "exchange": "Bybit", "type": "perp", "time": "18:44", "notes": "📢 **BYBIT: New Listing : UAIUSDT Perpetual Contract in Innovation Zone, with up to 25x leverage **  BYBIT: 新上市：创新区 UAIUSDT 永续合约，最高支持 25 倍杠杆。  --------"},
+    {"date": "2025-11-18", "token": "TON", "token_display": "Toncoin (TON)", "exchange": "Coinbase", "type": "spot", "time": "03:34", "pairs": "TON/USD", "notes": "📢 **Coinbase will add support for Toncoin (TON) on The Open Network. Do not send this asset over other networks or your funds may be lost.   Spot trad"},
+    {"date": "2025-11-18", "token": "MET", "token_display": "MET (Meteora)", "exchange": "Bithumb", "type": "spot", "time": "15:57", "notes": "📢 **Bithumb LISTING:메테오라(MET) 원화마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:为纪念Meteora（MET）在韩元市场的上线，推出空投活动。  ---------- 🔗 [查看来源](https://feed.bithumb.com/no"},
+    {"date": "2025-11-19", "token": "WMTX", "token_display": "Token (WMTX)", "exchange": "Coinbase", "type": "spot", "time": "09:12", "notes": "📢 **COINBASE LISTING: Assets added to the roadmap today: World Mobile Token (WMTX) **  COINBASE LISTING: 今日添加到路线图的资产：世界移动代币（WMTX）  ---------- 🔗 [查看来源]"},
+    {"date": "2025-11-19", "token": "ZEC", "token_display": "ZEC", "exchange": "Binance", "type": "perp", "time": "15:30", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined ZECUSDC Perpetual Contract (2025-11-19) **  币安期货将上线以美元稳定币（USDC）为保证金的 ZEC 永续合约 (2025-11-19)  ---------- 🔗"},
+    {"date": "2025-11-19", "token": "GAIB", "token_display": "GAIB", "exchange": "Bybit", "type": "spot", "time": "20:02", "notes": "📢 **BYBIT: 🔥 Listing of GAIB on Convert & Bybit Savings **  BYBIT: 🔥 GAIB 上线 Convert 和 Bybit Savings  ---------- 🔗 [查看来源](https://announcements.bybit."},
+    {"date": "2025-11-20", "token": "BOBBOB", "token_display": "BOB (BOBBOB)", "exchange": "Coinbase", "type": "spot", "time": "01:06", "pairs": "BOBBOB/USD", "notes": "📢 **COINBASE LISTING: Spot trading for BOB (BOBBOB) will go live on 20 November 2025. The opening of our BOBBOB-USD trading pair will begin later toda"},
+    {"date": "2025-11-20", "token": "JCT", "token_display": "Janction (JCT)", "exchange": "OKX", "type": "perp", "time": "03:30", "notes": "📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list perpetual futures for JCT cryptoDetail:  at: 2025-11-20T03:30:35Z **  OKX LISTING:#OKX 重要通知 O"},
+    {"date": "2025-11-20", "token": "ASTER", "token_display": "Aster (ASTER)", "exchange": "Coinbase", "type": "spot", "time": "04:10", "pairs": "ASTER/USD", "notes": "📢 **COINBASE LISTING: Spot trading for Aster (ASTER) will go live on 20 November 2025. The opening of our ASTER-USD trading pair will begin on or afte"},
+    {"date": "2025-11-20", "token": "GAIB", "token_display": "GAIB", "exchange": "Binance", "type": "perp", "time": "16:30", "notes": "📢 **Binance Futures Will Postpone the Launch of GAIBUSDT Perpetual Contract **  Binance Futures 将推迟启动 GAIBUSDT 永续合约  ---------- 🔗 [查看来源](https://www.b"},
+    {"date": "2025-11-21", "token": "BOB", "token_display": "BOB", "exchange": "Binance", "type": "perp", "time": "17:28", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined BOBUSDT Perpetual Contract (2025-11-21) **  币安期货将推出以USDT计价的BOBUSDT永续合约（2025-11-21）  ---------- 🔗 [查看来源]("},
+    {"date": "2025-11-23", "token": "ZEC", "token_display": "ZEC", "exchange": "OKX", "type": "spot", "time": "05:46", "notes": "📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list ZEC for spot tradingDetail:  at: 2025-11-23T05:46:02Z **  OKX LISTING:#OKX 重要公告 OKX将上线ZEC进行现货"},
+    {"date": "2025-11-24", "token": "APR", "token_display": "Priori (APR)", "exchange": "Binance", "type": "spot", "time": "15:00", "notes": "📢 **Binance Earn New Listing Special Offer: Subscribe to ALLO, BANK, KITE or MET Locked Products to Enjoy 200% APR for 7 Days! **  币安Earn新品上市特别优惠：订阅AL"},
+    {"date": "2025-11-24", "token": "PIEVERSE", "token_display": "Pieverse (PIEVERSE)", "exchange": "Bithumb", "type": "spot", "time": "16:17", "notes": "📢 **Bithumb LISTING:[이벤트] 파이버스(PIEVERSE) 원화 마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:[活动] PIEVERSE 上线韩元市场纪念空投活动  ---------- 🔗 [查看来源](https://feed.bithumb"},
+    {"date": "2025-11-24", "token": "MON", "token_display": "Monad (MON)", "exchange": "Upbit", "type": "spot", "time": "17:01", "notes": "📢 **UPBIT LISTING:[거래] 모나드(MON) 신규 거래지원 안내 (KRW, BTC, USDT 마켓) **  UPBIT LISTING:[交易] Monad (MON) 新增交易支持通知 (KRW, BTC, USDT 市场)  ---------- 🔗 [查看来源](ht"},
+    {"date": "2025-11-24", "token": "MON", "token_display": "MON (Monad)", "exchange": "Bithumb", "type": "spot", "time": "17:19", "notes": "📢 **Bithumb LISTING:모나드(MON) 원화 마켓 추가 (거래 수수료 무료) **  Bithumb LISTING:Monad（MON）在韩元市场新增交易对（交易手续费免费）。  ---------- 🔗 [查看来源](https://feed.bithumb.com/not"},
+    {"date": "2025-11-24", "token": "MON", "token_display": "MON (Monad)", "exchange": "Bybit", "type": "spot", "time": "22:02", "notes": "📢 **BYBIT: 🔥 Listing of MON on Convert **  BYBIT: 🔥 MON 上线 Convert 平台  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/-listing-of-mon-"},
+    {"date": "2025-11-25", "token": "IRYS", "token_display": "Irys (IRYS)", "exchange": "Coinbase", "type": "spot", "time": "00:53", "pairs": "IRYS/USD", "notes": "📢 **COINBASE LISTING: Spot trading for Irys (IRYS) will go live on 25 November 2025. The opening of our IRYS-USD trading pair will begin later today i"},
+    {"date": "2025-11-25", "token": "FLUID", "token_display": "Fluid (FLUID)", "exchange": "Coinbase", "type": "spot", "time": "00:53", "pairs": "FLUID/USD", "notes": "📢 **COINBASE LISTING: Spot trading for Fluid (FLUID) and World Mobile Token (WMTX) will go live on 25 November 2025. The opening of our FLUID-USD and "},
+    {"date": "2025-11-25", "token": "WMTX", "token_display": "Token (WMTX)", "exchange": "Coinbase", "type": "spot", "time": "00:53", "pairs": "WMTX/USD", "notes": "📢 **COINBASE LISTING: Spot trading for Fluid (FLUID) and World Mobile Token (WMTX) will go live on 25 November 2025. The opening of our FLUID-USD and "},
+    {"date": "2025-11-25", "token": "DASH", "token_display": "DASH", "exchange": "OKX", "type": "spot", "time": "09:00", "notes": "📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list DASH for spot tradingDetail:  at: 2025-11-25T09:00:30Z **  OKX LISTING:#OKX 重要通知   OKX 将上线 DA"},
+    {"date": "2025-11-26", "token": "PLUME", "token_display": "Plume (PLUME)", "exchange": "Upbit", "type": "spot", "time": "13:30", "notes": "📢 **UPBIT LISTING:[거래] 플룸(PLUME) KRW 마켓 디지털 자산 추가 **  UPBIT LISTING:[交易] Plume (PLUME) 在 KRW 市场新增数字资产  ---------- 🔗 [查看来源](https://upbit.com/service_c"},
+    {"date": "2025-11-26", "token": "XION", "token_display": "XION", "exchange": "Bithumb", "type": "spot", "time": "16:51", "notes": "📢 **Bithumb LISTING:[이벤트] 자이온(XION) 원화 마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:[活动] 庆祝 ZION（XION）上线韩元市场的空投活动  ---------- 🔗 [查看来源](https://feed.bithumb.c"},
+    {"date": "2025-11-26", "token": "IRYS", "token_display": "Irys (IRYS)", "exchange": "Binance", "type": "perp", "time": "22:43", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined IRYSUSDT Perpetual Contract (2025-11-26) **  Binance Futures 即将推出 USDⓈ 保证金的 IRYSUSDT 永续合约（2025年11月26日）  "},
+    {"date": "2025-11-27", "token": "AT", "token_display": "APRO (AT)", "exchange": "Binance", "type": "spot", "time": "16:38", "notes": "📢 **Binance: Introducing APRO (AT) on Binance HODLer Airdrops! Earn AT With Retroactive BNB Simple Earn Subscriptions **  Binance: 在 Binance HODLer 空投"},
+    {"date": "2025-11-27", "token": "IRYS", "token_display": "Irys (IRYS)", "exchange": "Upbit", "type": "spot", "time": "17:49", "notes": "📢 **Bithumb LISTING:아이리스(IRYS) 원화 마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:为庆祝IRIS（IRYS）韩元市场上线，将举行空投活动。#IRYS #AirDrop #Upbit  ---------- 🔗 [查看来源](https:/"},
+    {"date": "2025-11-27", "token": "IRYS", "token_display": "Irys (IRYS)", "exchange": "Bithumb", "type": "spot", "time": "17:49", "notes": "📢 **Bithumb LISTING:아이리스(IRYS) 원화 마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:为庆祝IRIS（IRYS）韩元市场上线，将举行空投活动。#IRYS #AirDrop #Upbit  ---------- 🔗 [查看来源](https:/"},
+    {"date": "2025-11-27", "token": "TQQQ", "token_display": "TQQQ", "exchange": "Bybit", "type": "spot", "time": "19:00", "notes": "📢 **BYBIT: New listing: APP,PDD,QQQ,TQQQ are now live on Bybit TradFi! **  BYBIT: 新上线：APP、PDD、QQQ、TQQQ已在Bybit TradFi平台上线！  ---------- 🔗 [查看来源](https:/"},
+    {"date": "2025-11-28", "token": "TRUTH", "token_display": "Network (TRUTH)", "exchange": "OKX", "type": "perp", "time": "11:01", "notes": "📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list perpetual futures for TRUTH cryptoDetail:  at: 2025-11-28T11:01:30Z **    ---------- 🔗 [查看来源]"},
+    {"date": "2025-11-29", "token": "RLS", "token_display": "Rayls (RLS)", "exchange": "Coinbase", "type": "spot", "time": "09:35", "notes": "📢 **COINBASE LISTING: Assets added to the roadmap today: Rayls (RLS) **  COINBASE LISTING: 今日添加到路线图的资产：Rayls（RLS）  ---------- 🔗 [查看来源](https://twitter"},
+    {"date": "2025-12-01", "token": "RLS", "token_display": "Rayls (RLS)", "exchange": "Coinbase", "type": "spot", "time": "00:51", "pairs": "RLS/USD", "notes": "📢 **COINBASE LISTING: Spot trading for Rayls (RLS) will go live on 1 December 2025. The opening of our RLS-USD trading pairs will begin later today if"},
+    {"date": "2025-12-01", "token": "TRUTH", "token_display": "Network (TRUTH)", "exchange": "OKX", "type": "spot", "time": "06:03", "notes": "📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list TRUTH for spot tradingDetail:  at: 2025-12-01T06:03:08Z **  OKX LISTING:#OKX重要公告 OKX将上线TRUTH现"},
+    {"date": "2025-12-02", "token": "PIPPIN", "token_display": "PIPPIN", "exchange": "OKX", "type": "perp", "time": "14:32", "notes": "📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list perpetual futures for PIPPIN, RLS cryptoDetail:  at: 2025-12-02T14:32:38Z **  OKX LISTING:#OK"},
+    {"date": "2025-12-02", "token": "RLS", "token_display": "Rayls (RLS)", "exchange": "OKX", "type": "perp", "time": "14:32", "notes": "📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list perpetual futures for PIPPIN, RLS cryptoDetail:  at: 2025-12-02T14:32:38Z **  OKX LISTING:#OK"},
+    {"date": "2025-12-02", "token": "RLS", "token_display": "Rayls (RLS)", "exchange": "Binance", "type": "perp", "time": "16:43", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined RLSUSDT Perpetual Contract (2025-12-02) **  \\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\\"},
+    {"date": "2025-12-03", "token": "WET", "token_display": "Humidifi (WET)", "exchange": "Coinbase", "type": "spot", "time": "03:42", "notes": "📢 **COINBASE LISTING: Assets added to the roadmap today: Humidifi (WET), zkPass (ZKP), Plume (PLUME), Hyperlane (HYPER), and Jupiter (JUPITER) **  COI"},
+    {"date": "2025-12-03", "token": "ZKP", "token_display": "Pass (ZKP)", "exchange": "Coinbase", "type": "spot", "time": "03:42", "notes": "📢 **COINBASE LISTING: Assets added to the roadmap today: Humidifi (WET), zkPass (ZKP), Plume (PLUME), Hyperlane (HYPER), and Jupiter (JUPITER) **  COI"},
+    {"date": "2025-12-03", "token": "PLUME", "token_display": "Plume (PLUME)", "exchange": "Coinbase", "type": "spot", "time": "03:42", "notes": "📢 **COINBASE LISTING: Assets added to the roadmap today: Humidifi (WET), zkPass (ZKP), Plume (PLUME), Hyperlane (HYPER), and Jupiter (JUPITER) **  COI"},
+    {"date": "2025-12-03", "token": "HYPER", "token_display": "Hyperlane (HYPER)", "exchange": "Coinbase", "type": "spot", "time": "03:42", "notes": "📢 **COINBASE LISTING: Assets added to the roadmap today: Humidifi (WET), zkPass (ZKP), Plume (PLUME), Hyperlane (HYPER), and Jupiter (JUPITER) **  COI"},
+    {"date": "2025-12-03", "token": "JUPITER", "token_display": "Jupiter (JUPITER)", "exchange": "Coinbase", "type": "spot", "time": "03:42", "notes": "📢 **COINBASE LISTING: Assets added to the roadmap today: Humidifi (WET), zkPass (ZKP), Plume (PLUME), Hyperlane (HYPER), and Jupiter (JUPITER) **  COI"},
+    {"date": "2025-12-03", "token": "BOB", "token_display": "BOB", "exchange": "Bithumb", "type": "spot", "time": "10:33", "notes": "📢 **Bithumb LISTING:비오비(BOB), 오리진트레일(TRAC) 원화 마켓 추가 **  Bithumb LISTING:新增BOB和TRAC韩元市场  ---------- 🔗 [查看来源](https://feed.bithumb.com/notice/1650991) 🕒"},
+    {"date": "2025-12-03", "token": "TRAC", "token_display": "Trail (TRAC)", "exchange": "Bithumb", "type": "spot", "time": "15:16", "notes": "📢 **Bithumb LISTING:오리진트레일(TRAC) 원화 마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:为庆祝Origin Trail (TRAC) KRW市场上线，将举办空投活动  ---------- 🔗 [查看来源](https://feed.bit"},
+    {"date": "2025-12-04", "token": "BEAM", "token_display": "Beam (BEAM)", "exchange": "Coinbase", "type": "spot", "time": "07:39", "notes": "📢 **COINBASE LISTING: Assets added to the roadmap today: Beam (BEAM) **  COINBASE LISTING: 今天添加到产品路线图的资产：Beam (BEAM)  ---------- 🔗 [查看来源](https://twit"},
+    {"date": "2025-12-04", "token": "BOB", "token_display": "BOB", "exchange": "Bithumb", "type": "spot", "time": "11:30", "notes": "📢 **Bithumb LISTING:비오비(BOB) 원화 마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:为庆祝BOB（BOB）加入韩元市场，我们将举办空投活动  ---------- 🔗 [查看来源](https://feed.bithumb.com/notice"},
+    {"date": "2025-12-04", "token": "WET", "token_display": "Humidifi (WET)", "exchange": "Bybit", "type": "pre-market", "time": "12:00 UTC", "notes": "📢 **BYBIT: Listing of WETUSDT on Bybit Perpetual Pre-Market on Dec 4, 2025, 12:00PM UTC **  BYBIT: WETUSDT将于2025年12月4日UTC时间下午12:00在Bybit Perpetual盘前交易"},
+    {"date": "2025-12-05", "token": "SAPIEN", "token_display": "Sapien (SAPIEN)", "exchange": "Bithumb", "type": "spot", "time": "11:30", "notes": "📢 **Bithumb LISTING:[이벤트] 사피엔(SAPIEN) 원화 마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:【活动】SAPIEN韩元市场新增纪念空投活动  ---------- 🔗 [查看来源](https://feed.bithumb.com/no"},
+    {"date": "2025-12-06", "token": "IMU", "token_display": "ImmuneFi (IMU)", "exchange": "Coinbase", "type": "spot", "time": "07:52", "notes": "📢 **COINBASE LISTING: Assets added to the roadmap today: ImmuneFi (IMU) and Sentient (SENT) **  COINBASE LISTING: 今天添加到产品路线图的资产包括：ImmuneFi (IMU) 和 Sen"},
+    {"date": "2025-12-06", "token": "SENT", "token_display": "Sentient (SENT)", "exchange": "Coinbase", "type": "spot", "time": "07:52", "notes": "📢 **COINBASE LISTING: Assets added to the roadmap today: ImmuneFi (IMU) and Sentient (SENT) **  COINBASE LISTING: 今天添加到产品路线图的资产包括：ImmuneFi (IMU) 和 Sen"},
+    {"date": "2025-12-06", "token": "POWER", "token_display": "POWER", "exchange": "Binance", "type": "perp", "time": "15:40", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined POWERUSDT Perpetual Contract (2025-12-06) **  币安期货将推出以美元计价的POWERUSDT永续合约（2025年12月6日）  ---------- 🔗 [查看来源"},
+    {"date": "2025-12-08", "token": "STABLE", "token_display": "STABLE", "exchange": "OKX", "type": "perp", "time": "12:02", "notes": "📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list perpetual futures for STABLE cryptoDetail:  at: 2025-12-08T12:02:19Z **  OKX LISTING:#OKX 重要通"},
+    {"date": "2025-12-08", "token": "STABLE", "token_display": "STABLE", "exchange": "Bybit", "type": "spot", "time": "20:32", "notes": "📢 **BYBIT: 🔥 Listing of STABLE on Convert & Bybit Savings **  BYBIT: 🔥 Convert &amp; Bybit Savings 上的稳定产品列表  ---------- 🔗 [查看来源](https://announcements"},
+    {"date": "2025-12-09", "token": "PLUME", "token_display": "Plume (PLUME)", "exchange": "Coinbase", "type": "spot", "time": "01:54", "pairs": "PLUME/USD", "notes": "📢 **COINBASE LISTING: Spot trading for Plume (PLUME) and Jupiter (JUPITER) will go live on 9 December 2025. The opening of our PLUME-USD and JUPITER-U"},
+    {"date": "2025-12-09", "token": "JUPITER", "token_display": "Jupiter (JUPITER)", "exchange": "Coinbase", "type": "spot", "time": "01:54", "pairs": "JUPITER/USD", "notes": "📢 **COINBASE LISTING: Spot trading for Plume (PLUME) and Jupiter (JUPITER) will go live on 9 December 2025. The opening of our PLUME-USD and JUPITER-U"},
+    {"date": "2025-12-09", "token": "WET", "token_display": "Humidifi (WET)", "exchange": "Coinbase", "type": "spot", "time": "02:15", "pairs": "WET/USD", "notes": "📢 **COINBASE LISTING: Spot trading for Humidifi (WET) will go live on 9 December 2025. The opening of our WET-USD trading pair will begin later today "},
+    {"date": "2025-12-09", "token": "THQ", "token_display": "Theoriq (THQ)", "exchange": "Coinbase", "type": "spot", "time": "04:26", "notes": "📢 **COINBASE LISTING: Assets added to the roadmap today: Theoriq (THQ) **  COINBASE LISTING: 今天添加到产品路线图的资产：Theoriq (THQ)  ---------- 🔗 [查看来源](https://"},
+    {"date": "2025-12-09", "token": "WET", "token_display": "Humidifi (WET)", "exchange": "OKX", "type": "spot", "time": "07:31", "notes": "📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list WET for spot tradingDetail:  at: 2025-12-09T07:31:35Z **  OKX LISTING:#OKX 重要通知 OKX 将上线 WET 现"},
+    {"date": "2025-12-09", "token": "ALLO", "token_display": "Allora (ALLO)", "exchange": "Bithumb", "type": "spot", "time": "13:45", "notes": "📢 **Bithumb LISTING:[이벤트] 알로라(ALLO) 원화 마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:【活动】空投活动庆祝Allola（ALLO）韩元市场上线  ---------- 🔗 [查看来源](https://feed.bithumb.co"},
+    {"date": "2025-12-09", "token": "WET", "token_display": "Humidifi (WET)", "exchange": "OKX", "type": "perp", "time": "15:18", "notes": "📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list perpetual futures for WET cryptoDetail:  at: 2025-12-09T15:18:03Z **  OKX LISTING:#OKX 重要通知 O"},
+    {"date": "2025-12-09", "token": "FOLKS", "token_display": "Finance (FOLKS)", "exchange": "Bybit", "type": "perp", "time": "19:25", "notes": "📢 **BYBIT: New Listing : FOLKSUSDT Perpetual Contract in Innovation Zone, with up to 20x leverage **  BYBIT: 新品上市：FOLKSUSDT 创新区永续合约，最高可达 20 倍杠杆  -----"},
+    {"date": "2025-12-09", "token": "WET", "token_display": "Humidifi (WET)", "exchange": "Bybit", "type": "spot", "time": "22:31", "notes": "📢 **BYBIT: 🔥 Listing of WET on Convert & Bybit Savings **  BYBIT: 🔥 WET 在 Convert &amp; Bybit Savings 上的列表  ---------- 🔗 [查看来源](https://announcements."},
+    {"date": "2025-12-10", "token": "HYPER", "token_display": "Hyperlane (HYPER)", "exchange": "Coinbase", "type": "spot", "time": "00:53", "pairs": "HYPER/USD", "notes": "📢 **COINBASE LISTING: Spot trading for Hyperlane (HYPER) will go live on 10 December 2025. The opening of our HYPER-USD trading pair will begin on or "},
+    {"date": "2025-12-10", "token": "PLUME", "token_display": "Plume (PLUME)", "exchange": "Coinbase", "type": "spot", "time": "06:07", "pairs": "PLUME/USD", "notes": "📢 **COINBASE LISTING: The launch of spot trading for Plume (PLUME) has been postponed to 10 December 2025. The opening of our PLUME-USD trading pair w"},
+    {"date": "2025-12-11", "token": "STABLE", "token_display": "STABLE", "exchange": "Bithumb", "type": "spot", "time": "14:30", "notes": "📢 **Bithumb LISTING:스테이블(STABLE) 원화 마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:为庆祝韩元稳定市场上线，我们将举办空投活动  ---------- 🔗 [查看来源](https://feed.bithumb.com/notice/1"},
+    {"date": "2025-12-11", "token": "ALMANAK", "token_display": "ALMANAK", "exchange": "Bybit", "type": "spot", "time": "20:02", "notes": "📢 **BYBIT: 🔥 Listing of ALMANAK on Convert & Bybit Savings **  BYBIT: 🔥 ALMANAK 在 Convert &amp; Bybit Savings 上架  ---------- 🔗 [查看来源](https://announce"},
+    {"date": "2025-12-12", "token": "US", "token_display": "US", "exchange": "Binance", "type": "perp", "time": "17:17", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined USUSDT and CYSUSDT Perpetual Contracts (2025-12-12) **  币安期货将于2025年12月12日推出以美元Ⓢ为保证金的USUSDT和CYSUSDT永续合约  "},
+    {"date": "2025-12-12", "token": "CYS", "token_display": "CYS", "exchange": "Binance", "type": "perp", "time": "17:17", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined USUSDT and CYSUSDT Perpetual Contracts (2025-12-12) **  币安期货将于2025年12月12日推出以美元Ⓢ为保证金的USUSDT和CYSUSDT永续合约  "},
+    {"date": "2025-12-13", "token": "LIGHTER", "token_display": "Lighter (LIGHTER)", "exchange": "Coinbase", "type": "spot", "time": "07:28", "notes": "📢 **COINBASE LISTING: Assets added to the roadmap today: Lighter (LIGHTER) **  COINBASE LISTING: 今天添加到产品路线图的资产：Lighter（轻量级）  ---------- 🔗 [查看来源](https"},
+    {"date": "2025-12-14", "token": "RAVE", "token_display": "RaveDAO (RAVE)", "exchange": "Binance", "type": "perp", "time": "22:18", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined RAVEUSDT Perpetual Contract (2025-12-14) **  币安期货将推出以美元Ⓢ计价的RAVEUSDT永续合约（2025年12月14日）  ---------- 🔗 [查看来源"},
+    {"date": "2025-12-15", "token": "WET", "token_display": "Humidify (WET)", "exchange": "Bithumb", "type": "spot", "time": "18:20", "notes": "📢 **Bithumb LISTING:[이벤트] 휴미디파이(WET) 원화마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:【活动】空投活动庆祝 Humidify (WET) 上线韩元市场  ---------- 🔗 [查看来源](https://feed.bithum"},
+    {"date": "2025-12-16", "token": "BEAM", "token_display": "Beam (BEAM)", "exchange": "Coinbase", "type": "spot", "time": "00:54", "pairs": "BEAM/USD", "notes": "📢 **COINBASE LISTING: Spot trading for Beam (BEAM) will go live on 16 December 2025. The opening of our BEAM-USD trading pair will begin on or after 9"},
+    {"date": "2025-12-16", "token": "THQ", "token_display": "Theoriq (THQ)", "exchange": "Coinbase", "type": "spot", "time": "01:18", "pairs": "THQ/USD", "notes": "📢 **COINBASE LISTING: Spot trading for Theoriq (THQ) will go live on 16 December 2025. The opening of our THQ-USD trading pair will begin later today "},
+    {"date": "2025-12-16", "token": "EDEN", "token_display": "OpenEden (EDEN)", "exchange": "Bithumb", "type": "spot", "time": "16:55", "notes": "📢 **Bithumb LISTING:[이벤트] 오픈에덴(EDEN) 원화 마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:【活动】庆祝韩元市场上线Open Eden（EDEN）的空投活动  ---------- 🔗 [查看来源](https://feed.bithu"},
+    {"date": "2025-12-17", "token": "SCOR", "token_display": "SCOR", "exchange": "Bybit", "type": "spot", "time": "18:32", "notes": "📢 **BYBIT: 🔥 Listing of SCOR on Convert & Bybit Savings **  BYBIT: 🔥 SCOR 在 Convert &amp; Bybit Savings 上的上市  ---------- 🔗 [查看来源](https://announcement"},
+    {"date": "2025-12-18", "token": "VOOI", "token_display": "VOOI", "exchange": "Bybit", "type": "spot", "time": "21:23", "notes": "📢 **BYBIT: 🔥 Listing of VOOI on Convert & Bybit Savings **  BYBIT: 🔥 VOOI 在 Convert 和 Bybit Savings 上的列表  ---------- 🔗 [查看来源](https://announcements.by"},
+    {"date": "2025-12-19", "token": "ZKP", "token_display": "Pass (ZKP)", "exchange": "Coinbase", "type": "spot", "time": "02:03", "pairs": "ZKP/USD", "notes": "📢 **COINBASE LISTING: Spot trading for zkPass (ZKP) will go live on 19 December 2025. The opening of our ZKP-USD trading pair will begin later today i"},
+    {"date": "2025-12-19", "token": "DEXE", "token_display": "DEXE", "exchange": "Bithumb", "type": "spot", "time": "16:40", "notes": "📢 **Bithumb LISTING:딕시(DEXE) 원화 마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:为庆祝DEXE上线韩元市场，我们将举办空投活动  ---------- 🔗 [查看来源](https://feed.bithumb.com/notice/165"},
+    {"date": "2025-12-19", "token": "ZKP", "token_display": "Pass (ZKP)", "exchange": "Bybit", "type": "spot", "time": "23:03", "notes": "📢 **BYBIT: 🔥 Listing of ZKP on Convert & Bybit Savings **  BYBIT: 🔥 ZKP 在 Convert 和 Bybit Savings 上架  ---------- 🔗 [查看来源](https://announcements.bybit."},
+    {"date": "2025-12-20", "token": "BREV", "token_display": "Brevis (BREV)", "exchange": "Coinbase", "type": "spot", "time": "06:40", "notes": "📢 **COINBASE LISTING: Assets added to the roadmap today: Brevis (BREV) **  COINBASE LISTING: 今天添加到产品路线图的资产：Brevis (BREV)  ---------- 🔗 [查看来源](https://"},
+    {"date": "2025-12-21", "token": "ZKP", "token_display": "Pass (ZKP)", "exchange": "Binance", "type": "perp", "time": "16:33", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined ZKPUSDT, GUAUSDT and IRUSDT Perpetual Contract (2025-12-21) **  币安期货将于2025年12月21日推出以美元Ⓢ为保证金的ZKPUSDT、GUAU"},
+    {"date": "2025-12-21", "token": "GUA", "token_display": "GUA", "exchange": "Binance", "type": "perp", "time": "16:33", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined ZKPUSDT, GUAUSDT and IRUSDT Perpetual Contract (2025-12-21) **  币安期货将于2025年12月21日推出以美元Ⓢ为保证金的ZKPUSDT、GUAU"},
+    {"date": "2025-12-21", "token": "IR", "token_display": "IR", "exchange": "Binance", "type": "perp", "time": "16:33", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined ZKPUSDT, GUAUSDT and IRUSDT Perpetual Contract (2025-12-21) **  币安期货将于2025年12月21日推出以美元Ⓢ为保证金的ZKPUSDT、GUAU"},
+    {"date": "2025-12-22", "token": "ZKP", "token_display": "Pass (ZKP)", "exchange": "Bybit", "type": "perp", "time": "17:48", "notes": "📢 **BYBIT: New listing: ZKPUSDT Perpetual Contract in Innovation Zone, with up to 25x leverage **  BYBIT: 新上线：ZKPUSDT 永续合约，创新板块，最高可达 25 倍杠杆  ---------"},
+    {"date": "2025-12-22", "token": "BTW", "token_display": "BTW", "exchange": "Binance", "type": "spot", "time": "18:01", "notes": "📢 **Join the  Pre-TGE and Booster Program on ****#Binance**** Wallet with  ****@BitwayOfficial****  📅 Booster Program Start Time: December 22 2025  🎯 "},
+    {"date": "2025-12-23", "token": "THQ", "token_display": "Teoric (THQ)", "exchange": "Bithumb", "type": "spot", "time": "13:30", "notes": "📢 **Bithumb LISTING:테오릭(THQ) 원화마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:为庆祝 Teoric (THQ) 正式上线韩元市场，我们将举办空投活动  ---------- 🔗 [查看来源](https://feed.bithumb.com"},
+    {"date": "2025-12-23", "token": "LIT", "token_display": "LIT (Lighter)", "exchange": "Binance", "type": "pre-market", "time": "21:53", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined LITUSDT Perpetual Contract Pre-Market Trading (2025-12-23) **  币安期货将于2025年12月23日推出以美元Ⓢ为保证金的LITUSDT永续合约盘前"},
+    {"date": "2025-12-24", "token": "LIT", "token_display": "LIT (Lighter)", "exchange": "OKX", "type": "pre-market", "time": "03:01", "notes": "📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list pre-market perpetual futures for LIT (Lighter) cryptoDetail:  at: 2025-12-24T03:01:12Z **  OK"},
+    {"date": "2025-12-26", "token": "FXS", "token_display": "Share (FXS)", "exchange": "Binance", "type": "perp", "time": "11:00", "notes": "📢 **Binance Will Support the Frax Share (FXS) Mainnet Swap and Rebranding to Frax (FRAX) **  币安将支持 Frax Share (FXS) 主网上线及更名为 Frax (FRAX)  ---------- 🔗"},
+    {"date": "2025-12-26", "token": "FRAX", "token_display": "Frax (FRAX)", "exchange": "Binance", "type": "perp", "time": "11:00", "notes": "📢 **Binance Will Support the Frax Share (FXS) Mainnet Swap and Rebranding to Frax (FRAX) **  币安将支持 Frax Share (FXS) 主网上线及更名为 Frax (FRAX)  ---------- 🔗"},
+    {"date": "2025-12-26", "token": "YB", "token_display": "Basis (YB)", "exchange": "Upbit", "type": "spot", "time": "12:15", "notes": "📢 **UPBIT LISTING:[거래] 일드베이시스(YB) 신규 거래지원 안내 (BTC, USDT 마켓) **  UPBIT LISTING:【交易】收益率基差 (YB) 新交易支持（BTC、USDT 市场）  ---------- 🔗 [查看来源](https://upbit.com"},
+    {"date": "2025-12-26", "token": "ZKP", "token_display": "Pass (ZKP)", "exchange": "Upbit", "type": "spot", "time": "14:19", "notes": "📢 **UPBIT LISTING:[Trade] Market Support for zkPass(ZKP) (KRW, BTC, USDT Market) **  UPBIT LISTING:【交易】zkPass(ZKP) 的市场支持（韩元、比特币、USDT 市场）  ---------- 🔗"},
+    {"date": "2025-12-26", "token": "ZKP", "token_display": "Pass (ZKP)", "exchange": "Bithumb", "type": "spot", "time": "14:45", "notes": "📢 **Bithumb LISTING:[이벤트] 지케이패스(ZKP) 원화마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:【活动】空投活动庆祝 ZKP 上线韩元市场  ---------- 🔗 [查看来源](https://feed.bithumb.com/notic"},
+    {"date": "2025-12-30", "token": "BREV", "token_display": "BREV (Brevis)", "exchange": "OKX", "type": "pre-market", "time": "12:31", "notes": "📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list pre-market perpetual futures for BREV (Brevis) cryptoDetail:  at: 2025-12-30T12:31:05Z **  OK"},
+    {"date": "2025-12-30", "token": "BREV", "token_display": "Brevis (BREV)", "exchange": "Binance", "type": "pre-market", "time": "18:30", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined BREVUSDT Perpetual Contract Pre-Market Trading (2025-12-30) **  币安期货将于2025年12月30日推出以美元计价的BREVUSDT永续合约盘前交"},
+    {"date": "2025-12-30", "token": "BREV", "token_display": "Brevis (BREV)", "exchange": "Bybit", "type": "pre-market", "time": "1:45 UTC", "notes": "📢 **BYBIT: Listing of BREVUSDT on Bybit Perpetual Pre-Market on Dec 30, 2025, 1:45PM UTC **  BYBIT: BREVUSDT将于2025年12月30日下午1:45（UTC）在Bybit Perpetual盘前"},
+    {"date": "2025-12-30", "token": "LIT", "token_display": "LIT (Lighter)", "exchange": "Bybit", "type": "perp", "time": "22:09", "notes": "📢 **BYBIT: New listing: LITUSDT Perpetual Contract, with up to 25x leverage **  BYBIT: 新品上线：LITUSDT永续合约，最高可达25倍杠杆  ---------- 🔗 [查看来源](https://announc"},
+    {"date": "2025-12-31", "token": "LIGHTER", "token_display": "Lighter (LIGHTER)", "exchange": "Coinbase", "type": "spot", "time": "01:06", "pairs": "LIGHTER/USD", "notes": "📢 **COINBASE LISTING: Spot trading for Lighter (LIGHTER) will go live when liquidity conditions are met, in regions where trading is supported for our"},
+    {"date": "2025-12-31", "token": "LIT", "token_display": "LIT (Lighter)", "exchange": "Coinbase", "type": "spot", "time": "01:12", "notes": "📢 **VeloNews:Lighter’s ****$LIT**** Token Gets Listed On Coinbase In Its First Major CEX Spot Listing Source: Twitter Blog **  VeloNews:Lighter 的 $LIT"},
+    {"date": "2025-12-31", "token": "COLLECT", "token_display": "COLLECT", "exchange": "Binance", "type": "perp", "time": "19:45", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined COLLECTUSDT and MAGMAUSDT Perpetual Contract (2025-12-31) **  币安期货将于2025年12月31日推出以美元Ⓢ为保证金的COLLECTUSDT和MA"},
+    {"date": "2025-12-31", "token": "MAGMA", "token_display": "MAGMA", "exchange": "Binance", "type": "perp", "time": "19:45", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined COLLECTUSDT and MAGMAUSDT Perpetual Contract (2025-12-31) **  币安期货将于2025年12月31日推出以美元Ⓢ为保证金的COLLECTUSDT和MA"},
+    {"date": "2026-01-01", "token": "XAUT", "token_display": "Gold (XAUT)", "exchange": "Upbit", "type": "spot", "time": "12:00", "notes": "📢 **UPBIT LISTING:[Trade] Market Support for Tether Gold(XAUT) (KRW, BTC, USDT Market) **  UPBIT LISTING:【交易】Tether Gold(XAUT)市场支持（韩元、BTC、USDT市场）  ---"},
+    {"date": "2026-01-01", "token": "XAUT", "token_display": "Gold (XAUT)", "exchange": "Bithumb", "type": "spot", "time": "16:30", "notes": "📢 **Bithumb LISTING:[이벤트] 테더골드(XAUT) 원화마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:【活动】为庆祝加入韩元市场，Tether Gold (XAUT) 空投活动  ---------- 🔗 [查看来源](https://feed.b"},
+    {"date": "2026-01-05", "token": "BREV", "token_display": "BREV (Brevis)", "exchange": "OKX", "type": "pre-market", "time": "11:30", "notes": "📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list BREV (Brevis) for spot trading and convert pre-market futures to standard perpetual futuresDe"},
+    {"date": "2026-01-05", "token": "BREV", "token_display": "Brevis (BREV)", "exchange": "OKX", "type": "spot", "time": "16:00", "notes": "📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list BREV for spot tradingDetail:  at: 2026-01-05T16:00:05Z **  OKX LISTING:#OKX 重要通知 OKX 将 BREV 上"},
+    {"date": "2026-01-05", "token": "BREV", "token_display": "Brevis (BREV)", "exchange": "Binance", "type": "spot", "time": "18:04", "notes": "📢 **Binance: Introducing Brevis (BREV) on Binance HODLer Airdrops! Earn BREV With Retroactive BNB Simple Earn Subscriptions **  Binance: 币安 HODLer 空投推"},
+    {"date": "2026-01-06", "token": "BREV", "token_display": "Brevis (BREV)", "exchange": "Coinbase", "type": "spot", "time": "03:40", "pairs": "BREV/USD", "notes": "📢 **COINBASE LISTING: Spot trading for Brevis (BREV) will go live on 6 January 2026. The opening of our BREV-USD trading pair will begin later today i"},
+    {"date": "2026-01-06", "token": "ZK", "token_display": "Sync (ZK)", "exchange": "Upbit", "type": "spot", "time": "15:30", "notes": "📢 **UPBIT LISTING:지케이싱크(ZK) 신규 거래지원 안내 (KRW, BTC, USDT 마켓) **  UPBIT LISTING:ZK Sync (ZK) 新交易支持公告（韩元、比特币、USDT 市场）  ---------- 🔗 [查看来源](https://upbit.c"},
+    {"date": "2026-01-06", "token": "WHITEWHALE", "token_display": "WHITEWHALE", "exchange": "Bybit", "type": "perp", "time": "20:28", "notes": "📢 **BYBIT: New listing: WHITEWHALEUSDT Perpetual Contract in Innovation Zone, with up to 5x leverage **  BYBIT: 新上线：WHITEWHALEUSDT 永续合约，创新区，最高可达 5 倍杠杆"},
+    {"date": "2026-01-06", "token": "BREV", "token_display": "Brevis (BREV)", "exchange": "Bybit", "type": "spot", "time": "22:29", "notes": "📢 **BYBIT: 🔥 Listing of BREV on Convert **  BYBIT: 🔥 BREV 在 Convert 上的上市信息  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/-listing-of"},
+    {"date": "2026-01-07", "token": "MEGA", "token_display": "MegaETH (MEGA)", "exchange": "Coinbase", "type": "spot", "time": "04:20", "notes": "📢 **COINBASE LISTING: Assets added to the roadmap today: MegaETH (MEGA) **  COINBASE LISTING: 今天添加到路线图的资产：MegaETH (MEGA)  ---------- 🔗 [查看来源](https://"},
+    {"date": "2026-01-07", "token": "BREV", "token_display": "Brevis (BREV)", "exchange": "Upbit", "type": "spot", "time": "10:20", "notes": "📢 **UPBIT LISTING:[거래] 브레비스(BREV) 신규 거래지원 안내 (KRW, BTC, USDT 마켓) **  UPBIT LISTING:【交易】Brevis（BREV）新增交易支持（韩元、BTC、USDT市场）  ---------- 🔗 [查看来源](https://"},
+    {"date": "2026-01-07", "token": "BREV", "token_display": "Brevis (BREV)", "exchange": "Bithumb", "type": "spot", "time": "13:00", "notes": "📢 **Bithumb LISTING:브레비스(BREV) 원화마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:为庆祝 Brevis (BREV) 上线韩元市场，我们将举办空投活动  ---------- 🔗 [查看来源](https://feed.bithumb.co"},
+    {"date": "2026-01-07", "token": "ZKP", "token_display": "Pass (ZKP)", "exchange": "OKX", "type": "perp", "time": "13:03", "notes": "📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list perpetual futures for ZKP cryptoDetail:  at: 2026-01-07T13:03:16Z **  OKX LISTING:#OKX 重要通知 O"},
+    {"date": "2026-01-07", "token": "XAG", "token_display": "XAG", "exchange": "Binance", "type": "perp", "time": "15:00", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined XAGUSDT Perpetual Contract (2026-01-07) **  币安期货将推出以美元Ⓢ计价的XAGUSDT永续合约（2026年1月7日）  ---------- 🔗 [查看来源](ht"},
+    {"date": "2026-01-07", "token": "ZKP", "token_display": "Pass (ZKP)", "exchange": "Binance", "type": "spot", "time": "18:39", "notes": "📢 **Binance Will List 币安人生 (币安人生) and zkPass (ZKP) with Seed Tag Applied **  币安即将上线币安人生（币安人生）和zkPass（ZKP）并应用种子标签  ---------- 🔗 [查看来源](https://www.tree"},
+    {"date": "2026-01-07", "token": "RAY", "token_display": "Raydium (RAY)", "exchange": "Coinbase", "type": "spot", "time": "23:05", "notes": "📢 **COINBASE LISTING: Assets added to the roadmap today: Raydium (RAY), Energy Dollar (ENERGY), Elsa (ELSA), and  (FUN) **  COINBASE LISTING: 今天添加到路线图"},
+    {"date": "2026-01-07", "token": "ENERGY", "token_display": "Dollar (ENERGY)", "exchange": "Coinbase", "type": "spot", "time": "23:05", "notes": "📢 **COINBASE LISTING: Assets added to the roadmap today: Raydium (RAY), Energy Dollar (ENERGY), Elsa (ELSA), and  (FUN) **  COINBASE LISTING: 今天添加到路线图"},
+    {"date": "2026-01-07", "token": "ELSA", "token_display": "Elsa (ELSA)", "exchange": "Coinbase", "type": "spot", "time": "23:05", "notes": "📢 **COINBASE LISTING: Assets added to the roadmap today: Raydium (RAY), Energy Dollar (ENERGY), Elsa (ELSA), and  (FUN) **  COINBASE LISTING: 今天添加到路线图"},
+    {"date": "2026-01-07", "token": "FUN", "token_display": "FUN", "exchange": "Coinbase", "type": "spot", "time": "23:05", "notes": "📢 **COINBASE LISTING: Assets added to the roadmap today: Raydium (RAY), Energy Dollar (ENERGY), Elsa (ELSA), and  (FUN) **  COINBASE LISTING: 今天添加到路线图"},
+    {"date": "2026-01-09", "token": "RIVER", "token_display": "RIVER", "exchange": "OKX", "type": "perp", "time": "06:31", "notes": "📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list perpetual futures for RIVER cryptoDetail:  at: 2026-01-09T06:31:38Z **  OKX LISTING:#OKX 重要通知"},
+    {"date": "2026-01-09", "token": "ZAMA", "token_display": "ZAMA (Zama)", "exchange": "Bybit", "type": "pre-market", "time": "10:45 UTC", "notes": "📢 **Bybit to list Pre-Market Perpetuals for ZAMAUSDT on Jan 9, 2026, 10:45AM UTC **  Bybit将于2026年1月9日上午10:45（UTC）上线ZAMAUSDT盘前永续合约。  ---------- 🔗 [查看来源"},
+    {"date": "2026-01-09", "token": "ZAMA", "token_display": "ZAMA (Zama)", "exchange": "OKX", "type": "pre-market", "time": "14:02", "notes": "📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list pre-market perpetual futures for ZAMA (Zama) cryptoDetail:  at: 2026-01-09T14:02:18Z **  OKX "},
+    {"date": "2026-01-09", "token": "ZAMA", "token_display": "ZAMA (Zama)", "exchange": "Binance", "type": "pre-market", "time": "16:42", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined ZAMAUSDT Perpetual Contract Pre-Market Trading (2026-01-09) **  币安期货将于2026年1月9日推出以美元计价的ZAMAUSDT永续合约盘前交易。"},
+    {"date": "2026-01-10", "token": "FOGO", "token_display": "FOGO (Fogo)", "exchange": "OKX", "type": "pre-market", "time": "15:16", "notes": "📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list pre-market perpetual futures for FOGO (Fogo) cryptoDetail:  at: 2026-01-10T15:16:04Z **  OKX "},
+    {"date": "2026-01-10", "token": "FOGO", "token_display": "FOGO (Fogo)", "exchange": "Binance", "type": "pre-market", "time": "21:42", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined FOGOUSDT Perpetual Contract Pre-Market Trading (2026-01-10) **  币安期货将于2026年1月10日推出以美元计价的FOGOUSDT永续合约盘前交易"},
+    {"date": "2026-01-11", "token": "FOGO", "token_display": "FOGO (Fogo)", "exchange": "Bybit", "type": "pre-market", "time": "8:00 UTC", "notes": "📢 **Bybit to list Pre-Market Perpetuals for FOGOUSDT on Jan 11, 2026, 8:00AM UTC **  Bybit将于2026年1月11日上午8:00（UTC）上线FOGOUSDT盘前永续合约。  ---------- 🔗 [查看来源"},
+    {"date": "2026-01-12", "token": "FOGO", "token_display": "Fogo (FOGO)", "exchange": "Binance", "type": "spot", "time": "20:50", "notes": "📢 **Binance Will List Fogo (FOGO) with Seed Tag Applied **  币安将上线 Fogo (FOGO)，并应用种子标签。  ---------- 🔗 [查看来源](https://www.treeofalpha.com/preview_articl"},
+    {"date": "2026-01-13", "token": "FOGO", "token_display": "FOGO (Fogo)", "exchange": "OKX", "type": "spot", "time": "06:31", "notes": "📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list FOGO for spot tradingDetail:  at: 2026-01-13T06:31:34Z **  OKX LISTING:#OKX 重要通知 OKX 将上线 FOGO"},
+    {"date": "2026-01-13", "token": "FOGO", "token_display": "FOGO (Fogo)", "exchange": "OKX", "type": "pre-market", "time": "14:31", "notes": "📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list FOGO (Fogo) for spot trading and convert pre-market futures to standard perpetual futuresDeta"},
+    {"date": "2026-01-14", "token": "RAY", "token_display": "Raydium (RAY)", "exchange": "Coinbase", "type": "spot", "time": "05:06", "pairs": "RAY/USD", "notes": "📢 **COINBASE LISTING: Spot trading for Raydium (RAY) will go live on 14 January 2026. The opening of our RAY-USD trading pair will begin on or after 9"},
+    {"date": "2026-01-14", "token": "USDE", "token_display": "USDE", "exchange": "Upbit", "type": "spot", "time": "14:55", "notes": "📢 **UPBIT LISTING:[거래] 유에스디이(USDE) 신규 거래지원 안내 (KRW, BTC, USDT 마켓) **  UPBIT LISTING:【交易】新增 USDE 交易支持（韩元、比特币、USDT 交易对）  ---------- 🔗 [查看来源](https://upb"},
+    {"date": "2026-01-14", "token": "USDE", "token_display": "USDE", "exchange": "Bithumb", "type": "spot", "time": "15:13", "notes": "📢 **Bithumb LISTING:유에스디이(USDE) 원화 마켓 추가 **  Bithumb LISTING:美国鹰扬币已进入韩国市场  ---------- 🔗 [查看来源](https://feed.bithumb.com/notice/1651484) 🕒 __2026-01-14"},
+    {"date": "2026-01-15", "token": "LIT", "token_display": "LIT (Lighter)", "exchange": "OKX", "type": "spot", "time": "11:00", "notes": "📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list LIT for spot tradingDetail:  at: 2026-01-15T11:00:44Z **  OKX LISTING:#OKX 重要通知 OKX 将 LIT 上市进"},
+    {"date": "2026-01-15", "token": "USDE", "token_display": "USDE", "exchange": "Bithumb", "type": "spot", "time": "18:00", "notes": "📢 **Bithumb LISTING:유에스디이(USDE) 원화마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:为庆祝 USDE 上线韩元市场，将举办空投活动  ---------- 🔗 [查看来源](https://feed.bithumb.com/notice/1"},
+    {"date": "2026-01-15", "token": "LIT", "token_display": "Lighter (LIT)", "exchange": "Bybit", "type": "spot", "time": "18:03", "notes": "📢 **Bybit to List Lighter  (LIT) on Spot **  Bybit 将在现场列出打火机 (LIT)。  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/bybit-to-list-ligh"},
+    {"date": "2026-01-15", "token": "FOGO", "token_display": "Fogo (FOGO)", "exchange": "Binance", "type": "spot", "time": "21:42", "notes": "📢 **Binance Will Add Fogo (FOGO) on Earn, Buy Crypto, Convert, Margin & Futures **  币安将在加密货币赚取、购买、转换、杠杆和期货交易中上线Fogo (FOGO)  ---------- 🔗 [查看来源](https:"},
+    {"date": "2026-01-15", "token": "FOGO", "token_display": "FOGO (Fogo)", "exchange": "Bybit", "type": "spot", "time": "22:29", "notes": "📢 **BYBIT: 🔥 Listing of FOGO on Convert **  BYBIT: 🔥 FOGO 在 Convert 上的列表  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/-listing-of-f"},
+    {"date": "2026-01-16", "token": "SPORTFUN", "token_display": "SPORTFUN", "exchange": "Binance", "type": "perp", "time": "20:18", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined SPORTFUNUSDT and AIAUSDT Perpetual Contracts (2026-01-16) **  币安期货将推出以美元Ⓢ为保证金的SPORTFUNUSDT和AIAUSDT永续合约（2"},
+    {"date": "2026-01-16", "token": "AIA", "token_display": "AI (AIA)", "exchange": "Binance", "type": "perp", "time": "22:48", "notes": "📢 **Binance Futures Will Postpone the Launch of AIAUSDT Perpetual Contract **  币安期货将推迟AIAUSDT永续合约的上线  ---------- 🔗 [查看来源](https://www.treeofalpha.com/"},
+    {"date": "2026-01-17", "token": "FUN", "token_display": "FUN", "exchange": "OKX", "type": "perp", "time": "02:30", "notes": "📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list perpetual futures for FUN cryptoDetail:  at: 2026-01-17T02:30:41Z **  OKX LISTING:#OKX 重要通知 O"},
+    {"date": "2026-01-17", "token": "SKR", "token_display": "Seeker (SKR)", "exchange": "Coinbase", "type": "spot", "time": "10:45", "notes": "📢 **COINBASE LISTING: Assets added to the roadmap today: Seeker (SKR), FIGHT (FIGHT) **  COINBASE LISTING: 今天添加到产品路线图的资产：Seeker (SKR)、FIGHT (FIGHT)  -"},
+    {"date": "2026-01-19", "token": "SPORTFUN", "token_display": "SPORTFUN", "exchange": "Bybit", "type": "perp", "time": "18:01", "notes": "📢 **BYBIT: New listing: SPORTFUNUSDT Perpetual Contract in Innovation Zone, with up to 20x leverage **  BYBIT: 新上线：SPORTFUNUSDT 永续合约，创新区，最高可达 20 倍杠杆  "},
+    {"date": "2026-01-20", "token": "ELSA", "token_display": "Elsa (ELSA)", "exchange": "Coinbase", "type": "spot", "time": "00:50", "pairs": "ELSA/USD", "notes": "📢 **COINBASE LISTING: Spot trading for Elsa (ELSA) will go live on 20 January 2026. The opening of our ELSA-USD trading pair will begin later today if"},
+    {"date": "2026-01-20", "token": "SKR", "token_display": "Seeker (SKR)", "exchange": "Bybit", "type": "pre-market", "time": "11:30 UTC", "notes": "📢 **BYBIT: Listing of SKRUSDT on Bybit Perpetual Pre-Market on Jan 20, 2026, 11:30AM UTC **  BYBIT: SKRUSDT将于2026年1月20日上午11:30（UTC）在Bybit Perpetual盘前交"},
+    {"date": "2026-01-20", "token": "ELSA", "token_display": "Elsa (ELSA)", "exchange": "Bybit", "type": "spot", "time": "17:28", "notes": "📢 **BYBIT: 🔥 Listing of ELSA on Convert & Bybit Savings **  BYBIT: 🔥 ELSA 已上线 Convert &amp; Bybit Savings  ---------- 🔗 [查看来源](https://announcements.b"},
+    {"date": "2026-01-20", "token": "AIA", "token_display": "AI (AIA)", "exchange": "Binance", "type": "perp", "time": "18:26", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined AIAUSDT Perpetual Contract (2026-01-20) **  币安期货将推出以美元Ⓢ为保证金的AIAUSDT永续合约（2026年1月20日）  ---------- 🔗 [查看来源]"},
+    {"date": "2026-01-21", "token": "SKR", "token_display": "Seeker (SKR)", "exchange": "Bybit", "type": "spot", "time": "10:52", "notes": "📢 **BYBIT: 🔥 Listing of SKR on Convert **  BYBIT: 🔥 SKR 在 Convert 上架  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/-listing-of-skr-o"},
+    {"date": "2026-01-21", "token": "RL", "token_display": "RL", "exchange": "Binance", "type": "spot", "time": "16:30", "notes": "📢 **Binance Will List Ripple USD (RLUSD) and Introduce RLUSD Zero Trading Fee Promotion **  币安将上线瑞波币美元（RLUSD）并推出RLUSD零交易费优惠活动  ---------- 🔗 [查看来源](htt"},
+    {"date": "2026-01-21", "token": "IMU", "token_display": "Token (IMU)", "exchange": "Bybit", "type": "spot", "time": "18:02", "notes": "📢 **Bybit to List  Immunefi Token (IMU) on Spot **  Bybit 将在现货市场上线 Immunefi 代币 (IMU)。  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/"},
+    {"date": "2026-01-21", "token": "ACU", "token_display": "ACU", "exchange": "Binance", "type": "perp", "time": "19:17", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined ACUUSDT and 我踏马来了USDT Perpetual Contracts (2026-01-21) **  币安合约上线USDⓈ本位ACUUSDT和我踩马来了USDT永续合约 (2026-01-21"},
+    {"date": "2026-01-21", "token": "SKR", "token_display": "Seeker (SKR)", "exchange": "Coinbase", "type": "spot", "time": "22:29", "pairs": "SKR/USD", "notes": "📢 **COINBASE LISTING: Spot trading for Seeker (SKR) will go live on 21 January 2026. The opening of our SKR-USD trading pair will begin later today if"},
+    {"date": "2026-01-22", "token": "SRK", "token_display": "Seeker (SRK)", "exchange": "Bithumb", "type": "spot", "time": "11:16", "notes": "📢 **Bithumb LISTING:시커(SRK) 원화 마켓 추가 **  Bithumb LISTING:Seeker (SRK) 已加入韩元市场  ---------- 🔗 [查看来源](https://feed.bithumb.com/notice/1651624) 🕒 __2026-0"},
+    {"date": "2026-01-22", "token": "SENT", "token_display": "Sentient (SENT)", "exchange": "Bybit", "type": "spot", "time": "12:07", "notes": "📢 **Bybit to List Sentient (SENT)  on Spot **  Bybit 现场列出 Sentient (SENT)  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/bybit-to-lis"},
+    {"date": "2026-01-22", "token": "ELSA", "token_display": "Elsa (ELSA)", "exchange": "Upbit", "type": "spot", "time": "13:30", "notes": "📢 **UPBIT LISTING:[거래] 헤이엘사(ELSA) 신규 거래지원 안내 (KRW, BTC, USDT 마켓) **  UPBIT LISTING:【交易】新增ELSA交易支持（韩元、比特币、USDT交易对）  ---------- 🔗 [查看来源](https://upbit.c"},
+    {"date": "2026-01-22", "token": "ELSA", "token_display": "Elsa (ELSA)", "exchange": "Binance", "type": "perp", "time": "14:47", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined ELSAUSDT Perpetual Contract (2026-01-22) **  币安期货将推出以美元Ⓢ计价的ELSAUSDT永续合约（2026年1月22日）  ---------- 🔗 [查看来源]"},
+    {"date": "2026-01-22", "token": "SENT", "token_display": "Sentient (SENT)", "exchange": "Binance", "type": "spot", "time": "19:29", "notes": "📢 **Binance: Sentient (SENT) Listing Will Be Postponed **  Binance: Sentient (SENT) 名单将延期公布  ---------- 🔗 [查看来源](https://www.treeofalpha.com/preview_a"},
+    {"date": "2026-01-22", "token": "SKR", "token_display": "Seeker (SKR)", "exchange": "Bithumb", "type": "spot", "time": "19:46", "notes": "📢 **Bithumb LISTING:시커(SKR) 원화마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:为庆祝 Seeker (SKR) 上线韩元市场，我们将举办空投活动  ---------- 🔗 [查看来源](https://feed.bithumb.com/no"},
+    {"date": "2026-01-22", "token": "FIGHT", "token_display": "FIGHT", "exchange": "Bybit", "type": "spot", "time": "21:31", "notes": "📢 **BYBIT: 🔥 Listing of FIGHT on Convert **  BYBIT: 🔥 正在 Convert 上列出 FIGHT  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/-listing-of"},
+    {"date": "2026-01-22", "token": "IMU", "token_display": "ImmuneFi (IMU)", "exchange": "Coinbase", "type": "spot", "time": "22:18", "pairs": "IMU/USD", "notes": "📢 **COINBASE LISTING: Spot trading for ImmuneFi (IMU) will go live on 22 January 2026. The opening of our IMU-USD trading pair will begin later today "},
+    {"date": "2026-01-22", "token": "IMU", "token_display": "ImmuneFi (IMU)", "exchange": "Bybit", "type": "spot", "time": "22:21", "notes": "📢 **BYBIT: 🔥 Listing of IMU on Convert & Bybit Savings **  BYBIT: 🔥 IMU 在 Convert &amp; Bybit Savings 上的列表  ---------- 🔗 [查看来源](https://announcements."},
+    {"date": "2026-01-22", "token": "SENT", "token_display": "Sentient (SENT)", "exchange": "Coinbase", "type": "spot", "time": "22:38", "pairs": "SENT/USD", "notes": "📢 **COINBASE LISTING: Spot trading for FIGHT (FIGHT) and Sentient (SENT) will go live on 22 January 2026. The opening of our FIGHT-USD and SENT-USD tr"},
+    {"date": "2026-01-23", "token": "ACU", "token_display": "ACU", "exchange": "OKX", "type": "perp", "time": "06:00", "notes": "📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list perpetual futures for ACU cryptoDetail:  at: 2026-01-23T06:00:45Z **  OKX LISTING:#OKX 重要通知 O"},
+    {"date": "2026-01-23", "token": "SPACE", "token_display": "SPACE (Spacecoin)", "exchange": "OKX", "type": "spot", "time": "08:00", "notes": "📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list SPACE (Spacecoin) for spot tradingDetail:  at: 2026-01-23T08:00:29Z **  OKX LISTING:#OKX 重要通知"},
+    {"date": "2026-01-23", "token": "ACU", "token_display": "ACU", "exchange": "Bybit", "type": "perp", "time": "16:24", "notes": "📢 **BYBIT: New listing: ACUUSDT Perpetual Contract in Innovation Zone, with up to 12.5x leverage **  BYBIT: 新品上线：ACUUSDT 永续合约，创新板块，最高可达 12.5 倍杠杆  ----"},
+    {"date": "2026-01-23", "token": "FIGHT", "token_display": "FIGHT", "exchange": "Binance", "type": "perp", "time": "18:16", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined SPACEUSDT and FIGHTUSDT Perpetual Contracts (2026-01-23) **  币安期货将推出以美元Ⓢ为保证金的SPACEUSDT和FIGHTUSDT永续合约（202"},
+    {"date": "2026-01-24", "token": "DOOD", "token_display": "Doodles (DOOD)", "exchange": "Coinbase", "type": "spot", "time": "07:21", "notes": "📢 **COINBASE LISTING: Assets added to the roadmap today: Doodles (DOOD), Moonbirds (BIRB) **  COINBASE LISTING: 今天添加到产品路线图的资产：涂鸦（DOOD）、月鸟（BIRB）  -----"},
+    {"date": "2026-01-24", "token": "BIRB", "token_display": "Moonbirds (BIRB)", "exchange": "Coinbase", "type": "spot", "time": "07:21", "notes": "📢 **COINBASE LISTING: Assets added to the roadmap today: Doodles (DOOD), Moonbirds (BIRB) **  COINBASE LISTING: 今天添加到产品路线图的资产：涂鸦（DOOD）、月鸟（BIRB）  -----"},
+    {"date": "2026-01-26", "token": "PYBOBO", "token_display": "Capybobo (PYBOBO)", "exchange": "Bybit", "type": "spot", "time": "12:01", "notes": "📢 **Bybit to List Capybobo (PYBOBO) on Spot **  Bybit 将在现货市场上市 Capybobo (PYBOBO)。  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/bybi"},
+    {"date": "2026-01-26", "token": "SXP", "token_display": "Solar (SXP)", "exchange": "Upbit", "type": "spot", "time": "19:00", "notes": "📢 **UPBIT LISTING:[거래] 솔라(SXP) 거래 유의 종목 지정 안내 **  UPBIT LISTING:【交易】关于指定 Solar (SXP) 为交易警示股票的通知  ---------- 🔗 [查看来源](https://upbit.com/service_center/"},
+    {"date": "2026-01-27", "token": "SENT", "token_display": "SENT (Sentient)", "exchange": "OKX", "type": "spot", "time": "06:00", "notes": "📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list SENT (Sentient) for spot tradingDetail:  at: 2026-01-27T06:00:40Z **  OKX LISTING:#OKX 重要通知 O"},
+    {"date": "2026-01-27", "token": "USAT", "token_display": "USAT", "exchange": "OKX", "type": "spot", "time": "13:00", "notes": "📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list USAT for spot tradingDetail:  at: 2026-01-27T13:00:19Z **  OKX LISTING:#OKX 重要通知 OKX 将上线 USAT"},
+    {"date": "2026-01-27", "token": "TRIA", "token_display": "Tria (TRIA)", "exchange": "Coinbase", "type": "spot", "time": "23:08", "notes": "📢 **COINBASE LISTING: Assets added to the roadmap today: Tria (TRIA) and Zama (ZAMA) **  COINBASE LISTING: 今天添加到产品路线图的资产：Tria (TRIA) 和 Zama (ZAMA)  --"},
+    {"date": "2026-01-27", "token": "ZAMA", "token_display": "Zama (ZAMA)", "exchange": "Coinbase", "type": "spot", "time": "23:08", "notes": "📢 **COINBASE LISTING: Assets added to the roadmap today: Tria (TRIA) and Zama (ZAMA) **  COINBASE LISTING: 今天添加到产品路线图的资产：Tria (TRIA) 和 Zama (ZAMA)  --"},
+    {"date": "2026-01-28", "token": "XAG", "token_display": "XAG", "exchange": "OKX", "type": "perp", "time": "06:00", "notes": "📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list perpetual futures for XAG cryptoDetail:  at: 2026-01-28T06:00:33Z **  OKX LISTING:#OKX 重要通知 O"},
+    {"date": "2026-01-28", "token": "DOGE", "token_display": "DOGE", "exchange": "OKX", "type": "perp", "time": "07:00", "notes": "📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list perpetual futures for DOGE, PEPE, PUMP, SUI, XRP USDⓈ UM cryptoDetail:  at: 2026-01-28T07:00:"},
+    {"date": "2026-01-28", "token": "PEPE", "token_display": "PEPE", "exchange": "OKX", "type": "perp", "time": "07:00", "notes": "📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list perpetual futures for DOGE, PEPE, PUMP, SUI, XRP USDⓈ UM cryptoDetail:  at: 2026-01-28T07:00:"},
+    {"date": "2026-01-28", "token": "PUMP", "token_display": "PUMP (Pump)", "exchange": "OKX", "type": "perp", "time": "07:00", "notes": "📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list perpetual futures for DOGE, PEPE, PUMP, SUI, XRP USDⓈ UM cryptoDetail:  at: 2026-01-28T07:00:"},
+    {"date": "2026-01-28", "token": "SUI", "token_display": "SUI", "exchange": "OKX", "type": "perp", "time": "07:00", "notes": "📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list perpetual futures for DOGE, PEPE, PUMP, SUI, XRP USDⓈ UM cryptoDetail:  at: 2026-01-28T07:00:"},
+    {"date": "2026-01-28", "token": "XRP", "token_display": "XRP", "exchange": "OKX", "type": "perp", "time": "07:00", "notes": "📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list perpetual futures for DOGE, PEPE, PUMP, SUI, XRP USDⓈ UM cryptoDetail:  at: 2026-01-28T07:00:"},
+    {"date": "2026-01-28", "token": "BIRB", "token_display": "Moonbirds (BIRB)", "exchange": "Bybit", "type": "spot", "time": "12:16", "notes": "📢 **Bybit to List Moonbirds (BIRB) on Spot **  Bybit 将现场列出月鸟 (BIRB)。  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/bybit-to-list-moo"},
+    {"date": "2026-01-28", "token": "RIVN", "token_display": "RIVN", "exchange": "Bybit", "type": "spot", "time": "19:00", "notes": "📢 **BYBIT: New listing: ASML,LRCX,RIVN are now live on Bybit TradFi! **  BYBIT: 最新上架：ASML、LRCX、RIVN 现已在 Bybit TradFi 上线！  ---------- 🔗 [查看来源](https://"},
+    {"date": "2026-01-28", "token": "TSLA", "token_display": "TSLA", "exchange": "Binance", "type": "perp", "time": "19:29", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined TSLAUSDT Equity Perpetual Contract (2026-01-28) **  币安期货将推出以美元计价的TSLAUSDT股票永续合约（2026年1月28日）  ---------- "},
+    {"date": "2026-01-28", "token": "BIRB", "token_display": "Moonbirds (BIRB)", "exchange": "Coinbase", "type": "spot", "time": "22:05", "pairs": "BIRB/USD", "notes": "📢 **COINBASE LISTING: Spot trading for Moonbirds (BIRB) will go live on 28 January 2026. The opening of our BIRB-USD trading pair will begin later tod"},
+    {"date": "2026-01-29", "token": "INX", "token_display": "Infinex (INX)", "exchange": "Coinbase", "type": "spot", "time": "00:58", "notes": "📢 **COINBASE LISTING: Assets added to the roadmap today: Infinex (INX) **  COINBASE LISTING: 今天新增至投资路线图的资产：Infinex (INX)  ---------- 🔗 [查看来源](https://"},
+    {"date": "2026-01-29", "token": "LTC", "token_display": "LTC", "exchange": "OKX", "type": "perp", "time": "05:00", "notes": "📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list perpetual futures for LTCUSDⓈ UM and LTCUSDⓈ UM PerpetualDetail:  at: 2026-01-29T05:00:29Z **"},
+    {"date": "2026-01-29", "token": "HYPE", "token_display": "HYPERLIQUID (HYPE)", "exchange": "Coinbase", "type": "spot", "time": "06:36", "notes": "📢 **AggrNews(No accuracy guaranteed):HYPERLIQUID (HYPE) ADDED TO COINBASE\\"},
+    {"date": "2026-01-29", "token": "HYPE", "token_display": "HYPERLIQUID (HYPE)", "exchange": "Hyperliquid", "type": "spot", "time": "06:36", "notes": "📢 **AggrNews(No accuracy guaranteed):HYPERLIQUID (HYPE) ADDED TO COINBASE\\"},
+    {"date": "2026-01-29", "token": "BIRD", "token_display": "BIRD", "exchange": "Binance", "type": "perp", "time": "11:29", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined BIRDUSDT and GWEIUSDT Perpetual Contracts (2026-01-29) **  币安期货将推出以美元计价的BIRDUSDT和GWEIUSDT永续合约（2026年1月29日"},
+    {"date": "2026-01-29", "token": "GWEI", "token_display": "ETHGas (GWEI)", "exchange": "Binance", "type": "perp", "time": "11:29", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined BIRDUSDT and GWEIUSDT Perpetual Contracts (2026-01-29) **  币安期货将推出以美元计价的BIRDUSDT和GWEIUSDT永续合约（2026年1月29日"},
+    {"date": "2026-01-29", "token": "SENT", "token_display": "Sentient (SENT)", "exchange": "Upbit", "type": "spot", "time": "14:15", "notes": "📢 **UPBIT LISTING:[Trade] Market Support for Sentient(SENT) (KRW, BTC, USDT Market) **  UPBIT LISTING:【交易】Sentient(SENT) 的市场支持（韩元、比特币、USDT 市场）  ------"},
+    {"date": "2026-01-29", "token": "SENT", "token_display": "Sentient (SENT)", "exchange": "Bithumb", "type": "spot", "time": "15:45", "notes": "📢 **Bithumb LISTING:센티언트(SENT) 원화마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:Sentient (SENT) 韩元市场新增纪念空投活动  ---------- 🔗 [查看来源](https://feed.bithumb.com/noti"},
+    {"date": "2026-01-29", "token": "ELSA", "token_display": "Elsa (ELSA)", "exchange": "Bithumb", "type": "spot", "time": "16:00", "notes": "📢 **Bithumb LISTING:[이벤트] 헤이엘사(ELSA) 원화마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:【活动】空投活动庆祝ELSA上线韩元市场  ---------- 🔗 [查看来源](https://feed.bithumb.com/notice"},
+    {"date": "2026-01-29", "token": "INX", "token_display": "Infinex (INX)", "exchange": "Bybit", "type": "pre-market", "time": "9:30 UTC", "notes": "📢 **BYBIT: Listing of INXUSDT on Bybit Perpetual Pre-Market on Jan 29, 2026, 9:30AM UTC **  BYBIT: INXUSDT将于2026年1月29日上午9:30（UTC）在Bybit Perpetual盘前交易平"},
+    {"date": "2026-01-30", "token": "INX", "token_display": "Infinex (INX)", "exchange": "Coinbase", "type": "spot", "time": "01:51", "pairs": "INX/USD", "notes": "📢 **COINBASE LISTING: Spot trading for Infinex (INX) will go live on 30 January 2026. The opening of our INX-USD trading pair will begin later today i"},
+    {"date": "2026-01-30", "token": "ZAMA", "token_display": "ZAMA (Zama)", "exchange": "OKX", "type": "spot", "time": "13:00", "notes": "📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list ZAMA for spot tradingDetail:  at: 2026-01-30T13:00:30Z **  OKX LISTING:#OKX 重要通知 OKX 将上线 ZAMA"},
+    {"date": "2026-01-30", "token": "XPT", "token_display": "XPT", "exchange": "Binance", "type": "perp", "time": "13:16", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined XPTUSDT and XPDUSDT Perpetual Contracts (2026-01-30) **  币安期货将推出以美元Ⓢ为保证金的XPTUSDT和XPDUSDT永续合约（2026年1月30日）"},
+    {"date": "2026-01-30", "token": "XPD", "token_display": "XPD", "exchange": "Binance", "type": "perp", "time": "13:16", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined XPTUSDT and XPDUSDT Perpetual Contracts (2026-01-30) **  币安期货将推出以美元Ⓢ为保证金的XPTUSDT和XPDUSDT永续合约（2026年1月30日）"},
+    {"date": "2026-01-30", "token": "ELON", "token_display": "Echelon (ELON)", "exchange": "Bybit", "type": "spot", "time": "18:04", "notes": "📢 **Bybit to List Echelon (ELON) on Spot **  Bybit 将 Echelon (ELON) 现货上市  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/bybit-to-list"},
+    {"date": "2026-01-30", "token": "MEGA", "token_display": "MegaETH (MEGA)", "exchange": "Binance", "type": "pre-market", "time": "18:36", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined MEGAUSDT Perpetual Contract Pre-Market Trading (2026-01-30) **  币安期货将于2026年1月30日推出以美元Ⓢ为保证金的MEGAUSDT永续合约盘"},
+    {"date": "2026-01-30", "token": "ZAMA", "token_display": "ZAMA (Zama)", "exchange": "OKX", "type": "pre-market", "time": "21:00", "notes": "📢 **OKX LISTING:OKX to list ZAMA (Zama) for spot trading and convert pre-market futures to standard perpetual futures **  OKX LISTING:OKX将ZAMA（Zama）上市"},
+    {"date": "2026-01-31", "token": "XPD", "token_display": "XPD", "exchange": "OKX", "type": "perp", "time": "13:00", "notes": "📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list perpetual futures for XPD and XPT cryptoDetail:  at: 2026-01-31T13:00:53Z **  OKX LISTING:#OK"},
+    {"date": "2026-01-31", "token": "PENGUIN", "token_display": "Penguin (PENGUIN)", "exchange": "Bybit", "type": "spot", "time": "20:01", "notes": "📢 **Bybit to List Nietzschean Penguin  (PENGUIN) on Spot **  Bybit 将把尼采企鹅 (PENGUIN) 列入现货交易清单  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/a"},
+    {"date": "2026-02-01", "token": "PENGUIN", "token_display": "Penguin (PENGUIN)", "exchange": "Bybit", "type": "spot", "time": "03:10", "notes": "📢 **BYBIT: 🔥 Listing of PENGUIN on Convert **  BYBIT: 🔥 企鹅在 Convert 上的上市  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/-listing-of-p"},
+    {"date": "2026-02-02", "token": "ZAMA", "token_display": "Zama (ZAMA)", "exchange": "Binance", "type": "spot", "time": "12:28", "notes": "📢 **Binance Will List Zama (ZAMA) with Seed Tag Applied **  币安将上线 Zama (ZAMA)，并应用种子标签。  ---------- 🔗 [查看来源](https://www.treeofalpha.com/preview_articl"},
+    {"date": "2026-02-02", "token": "INTC", "token_display": "INTC", "exchange": "Binance", "type": "perp", "time": "16:47", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined INTCUSDT and HOODUSDT Equity Perpetual Contracts (2026-02-02) **  币安期货将推出以美元Ⓢ为保证金的INTCUSDT和HOODUSDT股票永续合"},
+    {"date": "2026-02-02", "token": "HOOD", "token_display": "HOOD", "exchange": "Binance", "type": "perp", "time": "16:47", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined INTCUSDT and HOODUSDT Equity Perpetual Contracts (2026-02-02) **  币安期货将推出以美元Ⓢ为保证金的INTCUSDT和HOODUSDT股票永续合"},
+    {"date": "2026-02-02", "token": "ZAMA", "token_display": "ZAMA (Zama)", "exchange": "Bybit", "type": "spot", "time": "21:30", "notes": "📢 **BYBIT: 🔥 Listing of ZAMA on Convert **  BYBIT: 🔥 ZAMA 在 Convert 上架  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/-listing-of-zam"},
+    {"date": "2026-02-02", "token": "ELON", "token_display": "Echelon (ELON)", "exchange": "Bybit", "type": "spot", "time": "22:01", "notes": "📢 **BYBIT: 🔥 Listing of ELON on Convert & Bybit Savings **  BYBIT: 🔥 ELON 已上线 Convert &amp; Bybit Savings  ---------- 🔗 [查看来源](https://announcements.b"},
+    {"date": "2026-02-02", "token": "ZAMA", "token_display": "Zama (ZAMA)", "exchange": "Coinbase", "type": "spot", "time": "23:03", "pairs": "ZAMA/USD", "notes": "📢 **COINBASE LISTING: Spot trading for Zama (ZAMA) will go live on 2 February 2026. The opening of our ZAMA-USD trading pair will begin later today if"},
+    {"date": "2026-02-03", "token": "DEEP", "token_display": "DeepBook (DEEP)", "exchange": "Coinbase", "type": "spot", "time": "07:20", "notes": "📢 **COINBASE LISTING: Assets added to the roadmap today: DeepBook (DEEP) and Walrus (WAL) **  COINBASE LISTING: 今天添加到产品路线图的资产包括：DeepBook (DEEP) 和 Walr"},
+    {"date": "2026-02-03", "token": "WAL", "token_display": "Walrus (WAL)", "exchange": "Coinbase", "type": "spot", "time": "07:20", "notes": "📢 **COINBASE LISTING: Assets added to the roadmap today: DeepBook (DEEP) and Walrus (WAL) **  COINBASE LISTING: 今天添加到产品路线图的资产包括：DeepBook (DEEP) 和 Walr"},
+    {"date": "2026-02-03", "token": "BIRB", "token_display": "Moonbird (BIRB)", "exchange": "Upbit", "type": "spot", "time": "15:00", "notes": "📢 **UPBIT LISTING:문버드(BIRB) 신규 거래지원 안내 (KRW, BTC, USDT 마켓) **  UPBIT LISTING:Moonbird (BIRB) 新交易支持公告（韩元、比特币、USDT 市场）  ---------- 🔗 [查看来源](https://upbi"},
+    {"date": "2026-02-03", "token": "BIRB", "token_display": "Moonbird (BIRB)", "exchange": "Bithumb", "type": "spot", "time": "16:11", "notes": "📢 **Bithumb LISTING:[이벤트] 문버드(BIRB) 원화마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:【活动】Moonbird (BIRB) 空投活动，庆祝上线韩元市场  ---------- 🔗 [查看来源](https://feed.bithum"},
+    {"date": "2026-02-03", "token": "TRIA", "token_display": "Tria (TRIA)", "exchange": "Bybit", "type": "spot", "time": "18:32", "notes": "📢 **BYBIT: 🔥 Listing of TRIA on Convert **  BYBIT: 🔥 TRIA 在 Convert 上的上市  ---------- 🔗 [查看来源](https://announcements.bybit.com/en/article/-listing-of-t"},
+    {"date": "2026-02-03", "token": "TRIA", "token_display": "Tria (TRIA)", "exchange": "Coinbase", "type": "spot", "time": "22:08", "pairs": "TRIA/USD", "notes": "📢 **COINBASE LISTING: Spot trading for Tria (TRIA) will go live on 3 February 2026. The opening of our TRIA-USD trading pair will begin later today if"},
+    {"date": "2026-02-05", "token": "DOOD", "token_display": "Doodles (DOOD)", "exchange": "Coinbase", "type": "spot", "time": "00:50", "pairs": "DOOD/USD", "notes": "📢 **COINBASE LISTING: Spot trading for Doodles (DOOD) will go live on 5 February 2026. The opening of our DOOD-USD trading pair will begin on or after"},
+    {"date": "2026-02-05", "token": "HYPE", "token_display": "Hyperliquid (HYPE)", "exchange": "Coinbase", "type": "spot", "time": "00:53", "pairs": "HYPE/USD", "notes": "📢 **COINBASE LISTING: Spot trading for Hyperliquid (HYPE) will go live on 5 February 2026. The opening of our HYPE-USD trading pair will begin later t"},
+    {"date": "2026-02-05", "token": "HYPE", "token_display": "Hyperliquid (HYPE)", "exchange": "Hyperliquid", "type": "spot", "time": "00:53", "pairs": "HYPE/USD", "notes": "📢 **COINBASE LISTING: Spot trading for Hyperliquid (HYPE) will go live on 5 February 2026. The opening of our HYPE-USD trading pair will begin later t"},
+    {"date": "2026-02-05", "token": "RNBW", "token_display": "Rainbow (RNBW)", "exchange": "Coinbase", "type": "spot", "time": "01:35", "pairs": "RNBW/USD", "notes": "📢 **COINBASE LISTING: Spot trading for Rainbow (RNBW) will go live on 5 February 2026. The opening of our RNBW-USD trading pair will begin later today"},
+    {"date": "2026-02-05", "token": "RAVE", "token_display": "RaveDAO (RAVE)", "exchange": "Coinbase", "type": "spot", "time": "03:35", "notes": "📢 **COINBASE LISTING: Assets added to the roadmap today: Rainbow (RNBW) and RaveDAO (RAVE) **  COINBASE LISTING: 今天添加到产品路线图的资产包括：Rainbow (RNBW) 和 Rave"},
+    {"date": "2026-02-05", "token": "TRIA", "token_display": "Tria (TRIA)", "exchange": "OKX", "type": "perp", "time": "06:00", "notes": "📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list perpetual futures for TRIA cryptoDetail:  at: 2026-02-05T06:00:59Z **  OKX LISTING:#OKX 重要通知 "},
+    {"date": "2026-02-05", "token": "AZTEC", "token_display": "Aztec (AZTEC)", "exchange": "Coinbase", "type": "spot", "time": "06:09", "notes": "📢 **COINBASE LISTING: Assets added to the roadmap today: Aztec (AZTEC) and Espresso (ESP) **  COINBASE LISTING: 今天添加到产品路线图的资产：Aztec (AZTEC) 和 Espresso"},
+    {"date": "2026-02-05", "token": "ESP", "token_display": "Espresso (ESP)", "exchange": "Coinbase", "type": "spot", "time": "06:09", "notes": "📢 **COINBASE LISTING: Assets added to the roadmap today: Aztec (AZTEC) and Espresso (ESP) **  COINBASE LISTING: 今天添加到产品路线图的资产：Aztec (AZTEC) 和 Espresso"},
+    {"date": "2026-02-05", "token": "LITE", "token_display": "LITE", "exchange": "Bybit", "type": "spot", "time": "18:01", "notes": "📢 **BYBIT: New listing: MU,COHR,LITE are now live on Bybit TradFi! **  BYBIT: 最新房源：MU、COHR、LITE 现已在 Bybit TradFi 上线！  ---------- 🔗 [查看来源](https://anno"},
+    {"date": "2026-02-05", "token": "TRIA", "token_display": "Tria (TRIA)", "exchange": "Bybit", "type": "perp", "time": "18:31", "notes": "📢 **BYBIT: New listing: TRIAUSDT Perpetual Contract in Innovation Zone, with up to 25x leverage **  BYBIT: 新上线：TRIAUSDT 永续合约，创新区，最高可达 25 倍杠杆  --------"},
+    {"date": "2026-02-07", "token": "UP", "token_display": "Superform (UP)", "exchange": "Coinbase", "type": "spot", "time": "05:02", "notes": "📢 **COINBASE LISTING: Assets added to the roadmap today: Superform (UP) **  COINBASE LISTING: 今天添加到产品路线图的资产：Superform（UP）  ---------- 🔗 [查看来源](https:/"},
+    {"date": "2026-02-10", "token": "DENT", "token_display": "DENT", "exchange": "Upbit", "type": "spot", "time": "04:30", "notes": "📢 **UPBIT LISTING:[거래] 덴트(DENT) 거래 유의 종목 지정 안내 **  UPBIT LISTING:【交易】关于指定DENT为交易警示股的通知  ---------- 🕒 __2026-02-10 04:30:04__"},
+    {"date": "2026-02-10", "token": "ESP", "token_display": "Espresso (ESP)", "exchange": "Binance", "type": "pre-market", "time": "08:00", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined ESPUSDT Perpetual Contract Pre-Market Trading (2026-02-10) **  币安期货将于2026年2月10日推出以美元计价的ESPUSDT永续合约盘前交易。 "},
+    {"date": "2026-02-10", "token": "OAS", "token_display": "OAS", "exchange": "Upbit", "type": "spot", "time": "15:00", "notes": "📢 **UPBIT LISTING:[거래] 오아시스(OAS) 거래지원 종료 안내 (3/13 15:00) **  UPBIT LISTING:【交易】绿洲（OAS）交易支持终止通知（3月13日下午3:00）  ---------- 🕒 __2026-02-10 07:30:23__"},
+    {"date": "2026-02-10", "token": "SXP", "token_display": "Solar (SXP)", "exchange": "Upbit", "type": "spot", "time": "15:00", "notes": "📢 **UPBIT LISTING:[거래] 솔라(SXP) 거래지원 종료 안내 (3/13 15:00) **  UPBIT LISTING:【交易】太阳能（SXP）交易支持终止通知（3月13日下午3:00）  ---------- 🕒 __2026-02-10 07:00:03__"},
+    {"date": "2026-02-10", "token": "ESP", "token_display": "ESP (Espresso)", "exchange": "OKX", "type": "pre-market", "time": "15:01", "notes": "📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list pre-market perpetual futures for ESP (Espresso) cryptoDetail:  at: 2026-02-10T15:01:15Z **  O"},
+    {"date": "2026-02-10", "token": "UP", "token_display": "Superform (UP)", "exchange": "Coinbase", "type": "spot", "time": "17:03", "pairs": "UP/USD", "notes": "📢 **COINBASE LISTING: Spot trading for Superform (UP) will go live on 10 February 2026. The opening of our UP-USD trading pair will begin later today "},
+    {"date": "2026-02-10", "token": "OPN", "token_display": "OPINION (OPN)", "exchange": "Coinbase", "type": "spot", "time": "23:08", "notes": "📢 **COINBASE LISTING: Assets added to the roadmap today: OPINION (OPN) **  COINBASE LISTING: 今天添加到路线图中的资产：观点（OPN）  ---------- 🔗 [查看来源](https://twitter"},
+    {"date": "2026-02-11", "token": "GWEI", "token_display": "ETHGas (GWEI)", "exchange": "Coinbase", "type": "spot", "time": "00:31", "notes": "📢 **COINBASE LISTING: Assets added to the roadmap today: ETHGas (GWEI) **  COINBASE LISTING: 今天添加到路线图的资产：ETHGas (GWEI)  ---------- 🔗 [查看来源](https://tw"},
+    {"date": "2026-02-11", "token": "RAVE", "token_display": "RaveDAO (RAVE)", "exchange": "Coinbase", "type": "spot", "time": "16:51", "pairs": "RAVE/USD", "notes": "📢 **COINBASE LISTING: Spot trading for RaveDAO (RAVE), DeepBook (DEEP), and Walrus (WAL) will go live on 11 February 2026. The opening of our RAVE-USD"},
+    {"date": "2026-02-11", "token": "DEEP", "token_display": "DeepBook (DEEP)", "exchange": "Coinbase", "type": "spot", "time": "16:51", "pairs": "DEEP/USD", "notes": "📢 **COINBASE LISTING: Spot trading for RaveDAO (RAVE), DeepBook (DEEP), and Walrus (WAL) will go live on 11 February 2026. The opening of our RAVE-USD"},
+    {"date": "2026-02-11", "token": "WAL", "token_display": "Walrus (WAL)", "exchange": "Coinbase", "type": "spot", "time": "16:51", "pairs": "WAL/USD", "notes": "📢 **COINBASE LISTING: Spot trading for RaveDAO (RAVE), DeepBook (DEEP), and Walrus (WAL) will go live on 11 February 2026. The opening of our RAVE-USD"},
+    {"date": "2026-02-12", "token": "CC", "token_display": "CC (Canton)", "exchange": "OKX", "type": "spot", "time": "03:01", "notes": "📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list CC (Canton) for spot tradingDetail:  at: 2026-02-12T03:01:09Z **  OKX LISTING:#OKX 重要通知 OKX 将"},
+    {"date": "2026-02-12", "token": "NOM", "token_display": "Nomina (NOM)", "exchange": "Upbit", "type": "spot", "time": "07:00", "notes": "📢 **UPBIT LISTING:[거래] 노미나(NOM) 거래 유의 종목 지정 안내 **  UPBIT LISTING:【交易】关于指定Nomina（NOM）为交易警示股票的通知  ---------- 🕒 __2026-02-12 07:00:35__"},
+    {"date": "2026-02-12", "token": "ESP", "token_display": "Espresso (ESP)", "exchange": "Binance", "type": "spot", "time": "07:28", "notes": "📢 **Binance Will List Espresso (ESP) with Seed Tag Applied **  币安将上线 Espresso (ESP)，并应用种子标签。  ---------- 🔗 [查看来源](https://www.treeofalpha.com/preview_"},
+    {"date": "2026-02-12", "token": "AZTEC", "token_display": "Aztec (AZTEC)", "exchange": "Coinbase", "type": "spot", "time": "13:03", "pairs": "AZTEC/USD", "notes": "📢 **COINBASE LISTING: Spot trading for Aztec (AZTEC) and Espresso (ESP) will go live on 12 February 2026. The opening of our AZTEC-USD and ESP-USD tra"},
+    {"date": "2026-02-12", "token": "ESP", "token_display": "Espresso (ESP)", "exchange": "Coinbase", "type": "spot", "time": "13:03", "pairs": "ESP/USD", "notes": "📢 **COINBASE LISTING: Spot trading for Aztec (AZTEC) and Espresso (ESP) will go live on 12 February 2026. The opening of our AZTEC-USD and ESP-USD tra"},
+    {"date": "2026-02-13", "token": "LRC", "token_display": "Loopring (LRC)", "exchange": "Upbit", "type": "spot", "time": "15:00", "notes": "📢 **UPBIT LISTING:[거래] 루프링(LRC) 거래지원 종료 안내 (3/16 15:00) **  UPBIT LISTING:【交易】Loopring (LRC) 交易支持终止通知（3月16日下午3:00）  ---------- 🕒 __2026-02-13 05:00:03"},
+    {"date": "2026-02-16", "token": "TAO", "token_display": "BitTensor (TAO)", "exchange": "Upbit", "type": "spot", "time": "05:00", "notes": "📢 **UPBIT LISTING:비트텐서(TAO) 신규 거래지원 안내 (KRW, BTC, USDT 마켓) **  UPBIT LISTING:BitTensor (TAO) 新交易支持公告（韩元、比特币、USDT 市场）  ---------- 🕒 __2026-02-16 05:00:"},
+    {"date": "2026-02-16", "token": "LIT", "token_display": "LIT (Lighter)", "exchange": "Bithumb", "type": "spot", "time": "07:18", "notes": "📢 **Bithumb LISTING:라이터(LIT) 원화 마켓 추가 **  Bithumb LISTING:新增韩元打火机（LIT）市场  ---------- 🔗 [查看来源](https://feed.bithumb.com/notice/1652015) 🕒 __2026-02-16 "},
+    {"date": "2026-02-20", "token": "AZTEC", "token_display": "Aztec (AZTEC)", "exchange": "Upbit", "type": "spot", "time": "05:00", "notes": "📢 **UPBIT LISTING:아즈텍(AZTEC) 신규 거래지원 안내 (KRW, BTC, USDT 마켓) **  UPBIT LISTING:Aztec (AZTEC) 新增交易支持（KRW、BTC、USDT 市场）  ---------- 🕒 __2026-02-20 05:00:0"},
+    {"date": "2026-02-20", "token": "AZTEC", "token_display": "Aztec (AZTEC)", "exchange": "Bithumb", "type": "spot", "time": "08:00", "notes": "📢 **Bithumb LISTING:[이벤트] 아즈텍(AZTEC) 원화마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:【活动】空投活动庆祝阿兹特克（AZTEC）加入韩元市场  ---------- 🔗 [查看来源](https://feed.bithumb.com"},
+    {"date": "2026-02-20", "token": "ROBO", "token_display": "Token (ROBO)", "exchange": "Coinbase", "type": "spot", "time": "15:47", "notes": "📢 **COINBASE LISTING: Assets added to the roadmap today: Robo Token (ROBO) **  COINBASE LISTING: 今天添加到路线图的资产：Robo Token (ROBO)  ---------- 🔗 [查看来源](ht"},
+    {"date": "2026-02-21", "token": "OPN", "token_display": "OPINION (OPN)", "exchange": "Binance", "type": "pre-market", "time": "14:41", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined OPNUSDT Perpetual Contract Pre-Market Trading (2026-02-21) **  币安期货将于2026年2月21日推出以美元Ⓢ为保证金的OPNUSDT永续合约盘前交"},
+    {"date": "2026-02-23", "token": "OPN", "token_display": "OPN (Opinion)", "exchange": "OKX", "type": "pre-market", "time": "11:31", "notes": "📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list pre-market perpetual futures for OPN (Opinion) cryptoDetail:  at: 2026-02-23T11:31:31Z **  OK"},
+    {"date": "2026-02-24", "token": "SKR", "token_display": "Seeker (SKR)", "exchange": "Upbit", "type": "spot", "time": "05:00", "notes": "📢 **UPBIT LISTING:시커(SKR) 신규 거래지원 안내 (KRW, BTC, USDT 마켓) **  UPBIT LISTING:Seeker (SKR) 新交易支持公告（韩元、比特币、USDT 市场）  ---------- 🕒 __2026-02-24 05:00:00__"},
+    {"date": "2026-02-24", "token": "ESP", "token_display": "Espresso (ESP)", "exchange": "Upbit", "type": "spot", "time": "06:04", "notes": "📢 **UPBIT LISTING:[거래] 에스프레소(ESP) 신규 거래지원 안내 (KRW, BTC, USDT 마켓) **  UPBIT LISTING:【交易】新版 Espresso (ESP) 交易支持（韩元、比特币、USDT 交易对）  ---------- 🕒 __2026-02"},
+    {"date": "2026-02-24", "token": "ESP", "token_display": "Espresso (ESP)", "exchange": "Bithumb", "type": "spot", "time": "07:25", "notes": "📢 **Bithumb LISTING:에스프레소(ESP) 원화마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:为庆祝浓缩咖啡 (ESP) 进入韩元市场，我们将举办空投活动  ---------- 🔗 [查看来源](https://feed.bithumb.com/no"},
+    {"date": "2026-02-24", "token": "GPS", "token_display": "GPS", "exchange": "Bithumb", "type": "spot", "time": "08:05", "notes": "📢 **Bithumb LISTING:[이벤트] 고플러스(GPS) 원화마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:【活动】空投活动庆祝Goplus（GPS）Won Market上线  ---------- 🔗 [查看来源](https://feed.bithum"},
+    {"date": "2026-02-24", "token": "GWEI", "token_display": "ETHGas (GWEI)", "exchange": "Coinbase", "type": "spot", "time": "16:49", "pairs": "GWEI/USD", "notes": "📢 **COINBASE LISTING: Spot trading for ETHGas (GWEI) will go live on 24 February 2026. The opening of our GWEI-USD trading pair will begin on or after"},
+    {"date": "2026-02-24", "token": "CAD", "token_display": "CAD", "exchange": "Coinbase", "type": "spot", "time": "18:20", "notes": "📢 **COINBASE LISTING: Spot trading for USDC-AUD, USDC-SGD, and USDC-CAD will go live on 24 February 2026. The opening of our USDC-AUD, USDC-SGD, and U"},
+    {"date": "2026-02-26", "token": "CFG", "token_display": "Sentryfuse (CFG)", "exchange": "Upbit", "type": "spot", "time": "03:00", "notes": "📢 **UPBIT LISTING:[거래] 센트리퓨즈(CFG) 신규 거래지원 안내 (KRW, BTC, USDT 마켓) **  UPBIT LISTING:【交易】Sentryfuse (CFG) 新增交易支持（KRW、BTC、USDT 市场）  ---------- 🕒 __2026-0"},
+    {"date": "2026-02-26", "token": "GWEI", "token_display": "Ethergas (GWEI)", "exchange": "Bithumb", "type": "spot", "time": "04:09", "notes": "📢 **Bithumb LISTING:이더가스(GWEI) 원화마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:Ethergas (GWEI) 韩元市场新增纪念空投活动  ---------- 🔗 [查看来源](https://feed.bithumb.com/noti"},
+    {"date": "2026-02-26", "token": "DENT", "token_display": "DENT", "exchange": "Upbit", "type": "spot", "time": "15:00", "notes": "📢 **UPBIT LISTING:[거래] 덴트(DENT) 거래지원 종료 안내(3/30 15:00) **  UPBIT LISTING:【交易】DENT交易支持终止通知（3月30日下午3:00）  ---------- 🕒 __2026-02-26 06:00:05__"},
+    {"date": "2026-02-27", "token": "ROBO", "token_display": "Token (ROBO)", "exchange": "Binance", "type": "perp", "time": "08:00", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined ROBOUSDT Perpetual Contract (2026-02-27) **  币安期货将推出以美元Ⓢ为保证金的ROBOUSDT永续合约（2026年2月27日）  ---------- 🔗 [查看来"},
+    {"date": "2026-02-27", "token": "TWAP", "token_display": "TWAP", "exchange": "Bithumb", "type": "spot", "time": "10:17", "notes": "📢 **Bithumb LISTING:[업데이트] 시간분할자동주문 (TWAP) 서비스 제공 플랫폼 확대 안내 (안드로이드, PC, 모바일웹 추가) **  Bithumb LISTING:【更新】分时自动订餐（TWAP）服务平台扩展（新增安卓、PC和移动网页版）  ----------"},
+    {"date": "2026-02-27", "token": "NOM", "token_display": "Nomina (NOM)", "exchange": "Upbit", "type": "spot", "time": "15:00", "notes": "📢 **UPBIT LISTING:[거래] 노미나(NOM) 거래지원 종료 안내(3/30 15:00) **  UPBIT LISTING:【交易】Nomina (NOM) 交易支持终止通知（3月30日下午3:00）  ---------- 🕒 __2026-02-27 06:00:05__"},
+    {"date": "2026-02-27", "token": "ROBO", "token_display": "Token (ROBO)", "exchange": "OKX", "type": "perp", "time": "15:17", "notes": "📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list perpetual futures for ROBO cryptoDetail:  at: 2026-02-27T15:17:00Z **  OKX LISTING:#OKX 重要通知 "},
+    {"date": "2026-02-27", "token": "ROBO", "token_display": "Token (ROBO)", "exchange": "Coinbase", "type": "spot", "time": "21:03", "pairs": "ROBO/USD", "notes": "📢 **COINBASE LISTING: Spot trading for Robo Token (ROBO) is expected to go live on 27 February 2026. The opening of our ROBO-USD trading pair will beg"},
+    {"date": "2026-03-01", "token": "KAT", "token_display": "KAT (Katana)", "exchange": "OKX", "type": "pre-market", "time": "13:02", "notes": "📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list KAT (Katana) for spot trading and convert pre-market futures to standard perpetual futuresDet"},
+    {"date": "2026-03-02", "token": "KAT", "token_display": "Katana (KAT)", "exchange": "Binance", "type": "pre-market", "time": "04:16", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined KATUSDT Perpetual Contract Pre-Market Trading (2026-03-02) **  币安期货将于2026年3月2日推出以美元计价的KATUSDT永续合约盘前交易。  "},
+    {"date": "2026-03-02", "token": "KAT", "token_display": "Katana (KAT)", "exchange": "OKX", "type": "pre-market", "time": "11:00", "notes": "📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list pre-market perpetual futures for KAT cryptoDetail:  at: 2026-03-02T11:00:44Z **  OKX LISTING:"},
+    {"date": "2026-03-02", "token": "OPN", "token_display": "Opinion (OPN)", "exchange": "Binance", "type": "spot", "time": "12:45", "notes": "📢 **Binance: Introducing Opinion (OPN) on Binance Launchpool! Farm OPN by Locking BNB, USDC, U, and USD1 **  Binance: 币安 Launchpool 现已推出 Opinion (OPN)"},
+    {"date": "2026-03-03", "token": "LMTS", "token_display": "Limitless (LMTS)", "exchange": "Coinbase", "type": "spot", "time": "22:22", "notes": "📢 **COINBASE LISTING: Assets added to the roadmap today: Limitless (LMTS) **  COINBASE LISTING: 今天添加到产品路线图的资产：Limitless (LMTS)  ---------- 🔗 [查看来源](ht"},
+    {"date": "2026-03-04", "token": "CFG", "token_display": "Centrifuge (CFG)", "exchange": "Bithumb", "type": "spot", "time": "05:07", "notes": "📢 **Bithumb LISTING:센트리퓨즈(CFG) 원화 마켓 추가 **  Bithumb LISTING:离心机（CFG）已进入韩元市场  ---------- 🔗 [查看来源](https://feed.bithumb.com/notice/1652174) 🕒 __2026-03-"},
+    {"date": "2026-03-04", "token": "EDGE", "token_display": "EDGE", "exchange": "Upbit", "type": "spot", "time": "05:50", "notes": "📢 **UPBIT LISTING:디피니티브(EDGE) 신규 거래지원 안내 (KRW, BTC, USDT 마켓) **  UPBIT LISTING:最终版（EDGE）新交易支持公告（韩元、比特币、USDT市场）  ---------- 🔗 [查看来源](https://upbit.com/"},
+    {"date": "2026-03-04", "token": "EDGE", "token_display": "EDGE", "exchange": "Bithumb", "type": "spot", "time": "07:40", "notes": "📢 **Bithumb LISTING:디피니티브(EDGE) 원화마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:最终版（EDGE）韩元市场新增纪念空投活动  ---------- 🔗 [查看来源](https://feed.bithumb.com/notice/165"},
+    {"date": "2026-03-04", "token": "XCU", "token_display": "XCU", "exchange": "OKX", "type": "perp", "time": "11:01", "notes": "📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list perpetual futures for XCU and CLDetail:  at: 2026-03-04T11:01:48Z **  OKX LISTING:OKX 重要通知：OK"},
+    {"date": "2026-03-04", "token": "ROBO", "token_display": "Protocol (ROBO)", "exchange": "Binance", "type": "spot", "time": "13:13", "notes": "📢 **Binance Will List Fabric Protocol (ROBO) with Seed Tag Applied **  币安将上线带有种子标签的 Fabric 协议 (ROBO)。  ---------- 🔗 [查看来源](https://news.6551.io/previe"},
+    {"date": "2026-03-05", "token": "ROBO", "token_display": "Token (ROBO)", "exchange": "OKX", "type": "spot", "time": "04:01", "notes": "📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list ROBO (Fabric Protocol) for spot tradingDetail:  at: 2026-03-05T04:01:10Z **  OKX LISTING:OKX "},
+    {"date": "2026-03-05", "token": "APR", "token_display": "Priori (APR)", "exchange": "Binance", "type": "spot", "time": "08:00", "notes": "📢 **Binance Earn New Listing Special Offer: Subscribe to OPN Locked Products to Enjoy 200% APR for 7 Days (2026-03-05) **  币安新上线特惠：订阅 OPN 锁仓产品，即可享受 7 "},
+    {"date": "2026-03-05", "token": "LMTS", "token_display": "Limitless (LMTS)", "exchange": "Coinbase", "type": "spot", "time": "16:47", "pairs": "LMTS/USD", "notes": "📢 **COINBASE LISTING: Spot trading for Limitless (LMTS) will go live on 5 March 2026. The opening of our LMTS-USD trading pair will begin on or after "},
+    {"date": "2026-03-05", "token": "OPN", "token_display": "OPINION (OPN)", "exchange": "Coinbase", "type": "spot", "time": "22:03", "pairs": "OPN/USD", "notes": "📢 **COINBASE LISTING: Spot trading for OPINION (OPN) is expected to go live on 5 March 2026. The opening of our OPN-USD trading pair will begin on or "},
+    {"date": "2026-03-06", "token": "COPPER", "token_display": "COPPER", "exchange": "Binance", "type": "perp", "time": "12:30", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined COPPERUSDT Perpetual Contract (2026-03-06) **  币安期货将推出以美元Ⓢ为保证金的铜USDT永续合约（2026年3月6日）  ---------- 🔗 [查看来源]"},
+    {"date": "2026-03-06", "token": "LMTS", "token_display": "Limitless (LMTS)", "exchange": "Coinbase", "type": "spot", "time": "21:57", "pairs": "LMTS/USD", "notes": "📢 **COINBASE LISTING: The launch of spot trading for Limitless (LMTS) has been postponed to 6 March 2026. The opening of our LMTS-USD trading pair wil"},
+    {"date": "2026-03-07", "token": "BLEND", "token_display": "Fluent (BLEND)", "exchange": "Coinbase", "type": "spot", "time": "18:24", "notes": "📢 **COINBASE LISTING: Assets added to the roadmap today: Fluent (BLEND) **  COINBASE LISTING: 今天添加到产品路线图的资产：Fluent（BLEND）  ---------- 🔗 [查看来源](https:/"},
+    {"date": "2026-03-09", "token": "XAU", "token_display": "XAU", "exchange": "Bybit", "type": "perp", "time": "03:14", "notes": "📢 **BYBIT: New listing: XAUUSDT Perpetual Contract, with up to 75x leverage **  BYBIT: 新品上线：XAUUSDT永续合约，最高可达75倍杠杆  ---------- 🔗 [查看来源](https://announc"},
+    {"date": "2026-03-10", "token": "NGD", "token_display": "NGD", "exchange": "OKX", "type": "perp", "time": "08:31", "notes": "📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list perpetual futures for NGDetail:  at: 2026-03-10T08:31:19Z **  OKX LISTING:OKX 重要通知：OKX 将于 202"},
+    {"date": "2026-03-10", "token": "NG", "token_display": "NG", "exchange": "OKX", "type": "perp", "time": "08:31", "notes": "📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list perpetual futures for NGDetail:  at: 2026-03-10T08:31:19Z **  OKX LISTING:OKX 重要通知：OKX 将于 202"},
+    {"date": "2026-03-11", "token": "ICP", "token_display": "ICP", "exchange": "Upbit", "type": "spot", "time": "06:00", "notes": "📢 **UPBIT LISTING:[거래] 인터넷컴퓨터(ICP) 신규 거래지원 안내 (KRW, BTC, USDT 마켓) **  UPBIT LISTING:【交易】新型互联网电脑（ICP）交易支持（韩元、比特币、USDT 市场）  ---------- 🕒 __2026-03-11 06"},
+    {"date": "2026-03-11", "token": "NIGHT", "token_display": "Midnight (NIGHT)", "exchange": "Binance", "type": "spot", "time": "11:31", "notes": "📢 **Binance: Introducing Midnight (NIGHT) on Binance HODLer Airdrops! Earn NIGHT With Retroactive BNB Simple Earn Subscriptions **  Binance: 币安 HODLer"},
+    {"date": "2026-03-12", "token": "CYS", "token_display": "CYS", "exchange": "Bithumb", "type": "spot", "time": "06:40", "notes": "📢 **Bithumb LISTING:싸이식(CYS) 원화마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:为庆祝CYS加入韩元市场，我们将举办空投活动  ---------- 🔗 [查看来源](https://feed.bithumb.com/notice/16522"},
+    {"date": "2026-03-13", "token": "BILL", "token_display": "Billions (BILL)", "exchange": "Coinbase", "type": "spot", "time": "07:13", "notes": "📢 **COINBASE LISTING: Assets added to the roadmap today: Billions (BILL) **  COINBASE LISTING: 今天添加到路线图的资产：数十亿（BILL）  ---------- 🔗 [查看来源](https://twit"},
+    {"date": "2026-03-13", "token": "KAT", "token_display": "Katana (KAT)", "exchange": "Binance", "type": "spot", "time": "09:45", "notes": "📢 **Binance Will List Katana (KAT) with Seed Tag Applied **  币安将上线 Katana (KAT)，并应用种子标签。  ---------- 🔗 [查看来源](https://news.6551.io/preview/dfafbcad2d6"},
+    {"date": "2026-03-13", "token": "LUNA", "token_display": "LUNA", "exchange": "OKX", "type": "spot", "time": "19:14", "notes": "📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list LUNA, ENJ, ACE, VELODROME, STETH, ETHW, and WOO for Spot TradingDetail:  at: 2026-03-13T19:14"},
+    {"date": "2026-03-13", "token": "WOO", "token_display": "WOO", "exchange": "OKX", "type": "spot", "time": "19:14", "notes": "📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list LUNA, ENJ, ACE, VELODROME, STETH, ETHW, and WOO for Spot TradingDetail:  at: 2026-03-13T19:14"},
+    {"date": "2026-03-13", "token": "ST", "token_display": "ST", "exchange": "OKX", "type": "spot", "time": "19:14", "notes": "📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list LUNA, ENJ, ACE, VELODROME, STETH, ETHW, and WOO for Spot TradingDetail:  at: 2026-03-13T19:14"},
+    {"date": "2026-03-16", "token": "BP", "token_display": "BP", "exchange": "Bybit", "type": "pre-market", "time": "10:00 UTC", "notes": "📢 **BYBIT: Listing of BPUSDT on Bybit Perpetual Pre-Market on Mar 16, 2026, 10:00AM UTC **  BYBIT: BPUSDT将于2026年3月16日上午10:00（UTC）在Bybit Perpetual盘前交易平"},
+    {"date": "2026-03-16", "token": "CFG", "token_display": "Centrifuge (CFG)", "exchange": "Binance", "type": "spot", "time": "18:22", "notes": "📢 **Binance Will List Centrifuge (CFG) with Seed Tag Applied **  币安将上线 Centrifuge (CFG)，并应用种子标签。  ---------- 🔗 [查看来源](https://news.6551.io/preview/096"},
+    {"date": "2026-03-16", "token": "EWY", "token_display": "EWY", "exchange": "Binance", "type": "perp", "time": "22:30", "notes": "📢 **Binance Futures Will Launch EWYUSDT USDⓈ-Margined Index Perpetual Contract (2026-03-16) **  币安期货将推出 EWYUSDT 美元保证金指数永续合约（2026年3月16日）  ---------- 🔗 "},
+    {"date": "2026-03-17", "token": "PRL", "token_display": "Perle (PRL)", "exchange": "Coinbase", "type": "spot", "time": "08:21", "notes": "📢 **COINBASE LISTING: Assets added to the roadmap today: Perle (PRL) **  COINBASE LISTING: 今天添加到产品路线图的资产：Perle (PRL)  ---------- 🔗 [查看来源](https://twit"},
+    {"date": "2026-03-17", "token": "CFG", "token_display": "Centrifuge (CFG)", "exchange": "Bybit", "type": "perp", "time": "12:24", "notes": "📢 **BYBIT: New listing: CFGUSDT Perpetual Contract, with up to 25x leverage **  BYBIT: 新品上线：CFGUSDT永续合约，最高可达25倍杠杆  ---------- 🔗 [查看来源](https://announc"},
+    {"date": "2026-03-18", "token": "ROBO", "token_display": "Protocol (ROBO)", "exchange": "Binance", "type": "spot", "time": "11:30", "notes": "📢 **Binance: Introducing Fabric Protocol (ROBO) on Binance HODLer Airdrops! Earn ROBO With Retroactive BNB Simple Earn Subscriptions **  Binance: 币安 H"},
+    {"date": "2026-03-18", "token": "ROBO", "token_display": "Protocol (ROBO)", "exchange": "Bithumb", "type": "spot", "time": "11:50", "notes": "📢 **Bithumb LISTING:패브릭 프로토콜(ROBO) 원화마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:Fabric Protocol (ROBO) 韩元市场新增纪念空投活动  ---------- 🔗 [查看来源](https://feed.bithu"},
+    {"date": "2026-03-18", "token": "KAT", "token_display": "Katana (KAT)", "exchange": "Coinbase", "type": "spot", "time": "20:03", "pairs": "KAT/USD", "notes": "📢 **COINBASE LISTING: Spot trading for Katana (KAT) is expected to go live on 18 March 2026. The opening of our KAT-USD trading pair will begin on or "},
+    {"date": "2026-03-19", "token": "ICNT", "token_display": "Network (ICNT)", "exchange": "Coinbase", "type": "spot", "time": "03:58", "notes": "📢 **COINBASE LISTING: Assets added to the roadmap today: Impossible Cloud Network (ICNT) **  COINBASE LISTING: 今天添加到路线图中的资产：不可能云网络 (ICNT)  ---------- "},
+    {"date": "2026-03-19", "token": "ETHFI", "token_display": "ETHFI", "exchange": "Upbit", "type": "spot", "time": "10:50", "notes": "📢 **UPBIT LISTING:[거래] 이더파이(ETHFI) KRW 마켓 디지털 자산 추가 **  UPBIT LISTING:【交易】ETHFI 将数字资产添加到韩元市场  ---------- 🕒 __2026-03-19 10:50:00__"},
+    {"date": "2026-03-19", "token": "EWJ", "token_display": "EWJ", "exchange": "Binance", "type": "perp", "time": "18:30", "notes": "📢 **Binance Futures Will Launch EWJUSDT USDⓈ-Margined Index Perpetual Contract (2026-03-19) **  币安期货将推出 EWJUSDT 美元保证金指数永续合约（2026年3月19日）  ---------- 🔗 "},
+    {"date": "2026-03-19", "token": "EDGE", "token_display": "EDGE", "exchange": "Binance", "type": "pre-market", "time": "21:29", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined EDGEUSDT Perpetual Contract Pre-Market Trading (2026-03-19) **  币安期货将于2026年3月19日推出以美元计价的EDGEUSDT永续合约盘前交易"},
+    {"date": "2026-03-20", "token": "PHA", "token_display": "PHA", "exchange": "Bithumb", "type": "spot", "time": "13:00", "notes": "📢 **Bithumb LISTING:팔라 네트워크(PHA) 원화마켓 추가 기념 에어드랍 이벤트 **  Bithumb LISTING:为庆祝PHA韩元市场上线，将举办空投活动  ---------- 🔗 [查看来源](https://feed.bithumb.com/notice/165"},
+    {"date": "2026-03-20", "token": "EDGE", "token_display": "EDGE", "exchange": "Bybit", "type": "pre-market", "time": "4:30 UTC", "notes": "📢 **Bybit to list Pre-Market Perpetuals for EDGEUSDT on Mar 20, 2026, 4:30AM UTC **  Bybit将于2026年3月20日凌晨4:30（UTC）上线EDGEUSDT盘前永续合约。  ---------- 🔗 [查看来源"},
+    {"date": "2026-03-22", "token": "RESOLV", "token_display": "RESOLV (Resolv)", "exchange": "Upbit", "type": "spot", "time": "12:40", "notes": "📢 **UPBIT LISTING:[거래] 리졸브(RESOLV) 유의 촉구 안내 **  UPBIT LISTING:【交易】RESOLV 警告通知  ---------- 🕒 __2026-03-22 12:40:04__"},
+    {"date": "2026-03-23", "token": "MON", "token_display": "MON (Monad)", "exchange": "OKX", "type": "spot", "time": "02:01", "notes": "📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list MON (Monad) for spot tradingDetail:  at: 2026-03-23T02:01:32Z **  OKX LISTING:OKX 重要通知：OKX 即将"},
+    {"date": "2026-03-23", "token": "RESOLV", "token_display": "RESOLV (Resolv)", "exchange": "Upbit", "type": "spot", "time": "14:00", "notes": "📢 **UPBIT LISTING:[거래] 리졸브(RESOLV) 거래 유의 종목 지정 안내 **  UPBIT LISTING:【交易】关于将RESOV指定为交易警示项目的通知  ---------- 🕒 __2026-03-23 14:00:03__"},
+    {"date": "2026-03-23", "token": "PAYP", "token_display": "PAYP", "exchange": "Binance", "type": "perp", "time": "21:58", "notes": "📢 **Binance Futures Will Launch PAYPUSDT USDⓈ-Margined Equity Perpetual Contract (2026-03-23) **  币安期货将推出 PAYPUSDT 美元保证金股票永续合约（2026年3月23日）  ----------"},
+    {"date": "2026-03-24", "token": "BRENTOILD", "token_display": "BRENTOILD", "exchange": "OKX", "type": "perp", "time": "08:01", "notes": "📢 **OKX LISTING:****#OKX**** Important NoticeOKX to list perpetual futures for BRENTOILDetail:  at: 2026-03-24T08:01:42Z **  OKX LISTING:OKX 重要通知：OKX "},
+    {"date": "2026-03-24", "token": "CL", "token_display": "CL", "exchange": "Bybit", "type": "perp", "time": "16:12", "notes": "📢 **BYBIT: New listing: CLUSDT Perpetual Contract, with up to 50x leverage **  BYBIT: 新品上线：CLUSDT永续合约，最高可达50倍杠杆  ---------- 🔗 [查看来源](https://announcem"},
+    {"date": "2026-03-25", "token": "CHECK", "token_display": "Checkmate (CHECK)", "exchange": "Coinbase", "type": "spot", "time": "03:40", "notes": "📢 **COINBASE LISTING: Assets added to the roadmap today: Checkmate (CHECK) and Sign (SIGN) **  COINBASE LISTING: 今天添加到产品路线图的资产：Checkmate (CHECK) 和 Sig"},
+    {"date": "2026-03-25", "token": "SIGN", "token_display": "Sign (SIGN)", "exchange": "Coinbase", "type": "spot", "time": "03:40", "notes": "📢 **COINBASE LISTING: Assets added to the roadmap today: Checkmate (CHECK) and Sign (SIGN) **  COINBASE LISTING: 今天添加到产品路线图的资产：Checkmate (CHECK) 和 Sig"},
+    {"date": "2026-03-25", "token": "PRL", "token_display": "Perle (PRL)", "exchange": "Coinbase", "type": "spot", "time": "04:27", "notes": "📢 **Coinbase will add support for Perle (PRL). You can now generate a deposit address for PRL on coinbase․com, the Coinbase app, and Coinbase Exchange"},
+    {"date": "2026-03-25", "token": "APR", "token_display": "Priori (APR)", "exchange": "Binance", "type": "spot", "time": "12:30", "notes": "📢 **Binance Earn New Listing Special Offer: Subscribe to NIGHT Locked Products to Enjoy 200% APR for 7 Days **  币安新上线特惠：订阅夜间锁仓产品，即可享受7天200%年化收益率  ----"},
+    {"date": "2026-03-25", "token": "BSB", "token_display": "BSB", "exchange": "Binance", "type": "perp", "time": "18:14", "notes": "📢 **Binance Futures Will Launch USDⓈ-Margined BSBUSDT Perpetual Contract (2026-03-25) **  币安期货将推出以美元Ⓢ为保证金的BSBUSDT永续合约（2026年3月25日）  ---------- 🔗 [查看来源]"},
+    {"date": "2026-03-25", "token": "ICNT", "token_display": "Network (ICNT)", "exchange": "Coinbase", "type": "spot", "time": "23:52", "pairs": "ICNT/USD", "notes": "📢 **COINBASE LISTING: Spot trading for Impossible Cloud Network (ICNT) will go live on 25 March 2026. The opening of our ICNT-USD trading pair will be"},
 ];
+// watermark: {"appends": 0, "count": 913, "message_id": 0}
@@ -0,0 +1,667 @@
+# -*- coding: utf-8 -*-
+"""
+CEX listing 解析库：从频道消息文本中提取 listing
+
+只依赖标准库，不需要 telethon，其他工具和解析进程可以直接导入：
+
+    from listing_parser import extract_listing_info
+    listings = extract_listing_info(text, message_date='2025-05-23')
+
+返回普通的 dict 列表，可以直接 json.dumps 或当作 dict 处理。scraper.py 内部直接使用解析引擎
+ListingClassifier，得到的是 Listing 对象（__slots__ 记录，支持字典式访问），输出时才转换为 dict。
+
+scraper.py 从这里导入解析引擎并重新导出 extract_listing_info、Listing 等名称。
+"""
+
+import re
+import sys
+
+# ---------------------------------------------------------------------------
+# 解析规则
+# 所有正则在模块加载时编译一次，由 ListingClassifier 持有，避免每条消息重复编译
+# ---------------------------------------------------------------------------
+
+# delist（下架）关键词：命中任意一个即丢弃整条消息
+DELIST_KEYWORDS = [
+    r'\bdelisting\b', r'\bdelist\b', r'下架', r'removal', r'暂停交易', r'suspend.*trading',
+    r'停止交易', r'停止.*交易', r'终止.*交易', r'取消.*交易', r'remove.*trading',
+    r'will.*delist', r'to.*delist', r'going.*to.*delist', r'停止.*上市'
+]
+
+# 是否是 listing 消息（用于判断活动消息是否需要保留）
+LISTING_HINT_PATTERN = r'\blisting\b|\blist\b|上市|上线|alpha\s+coin|new.*coin|add.*trading'
+
+# 纯活动/促销消息（没有 listing 关键词时过滤）
+PURE_ACTIVITY_KEYWORDS = [
+    r'^.*airdrop\s*$', r'^.*空投\s*$', r'^.*campaign\s*$', r'^.*promotion\s*$',
+    r'^.*giveaway\s*$', r'^.*contest\s*$', r'^.*reward\s*$'
+]
+
+# 必须包含 listing 相关的关键词（放宽条件，包括更多变体）
+LISTING_KEYWORDS = [
+    r'\blisting\b', r'\blist\b', r'上市', r'上线', r'add.*spot', r'add.*perpetual',
+    r'new.*trading', r'launch.*trading', r'will.*list', r'to.*list',
+    r'list.*spot', r'list.*perpetual', r'list.*perp', r'add.*trading',
+    r'opens.*trading', r'start.*trading', r'available.*trading',
+    r'alpha\s+coin', r'new.*coin', r'introducing.*on', r'마켓.*추가', r'新增.*资产',
+    r'important\s+notice.*list', r'重要通知.*上线'
+]
+
+# LISTING_KEYWORDS 中每个模式都至少包含以下一个字面量，
+# 先用子串查找做一次廉价预筛，绝大多数非 listing 消息在这里就被拒绝
+LISTING_LITERALS = ('list', '上市', '上线', 'add', 'trading', 'alpha', 'coin', 'introducing', '마켓', '新增')
+
+# 交易所名称（扩展更多交易所，包括韩文交易所）
+EXCHANGE_PATTERNS = [
+    r'\b(binance|coinbase|okx|okex|kraken|bybit|huobi|gate\.io|gateio|kucoin|bitfinex|bitstamp|mexc|bitget|bitmart|coinlist|gemini|bithumb|upbit|hyperliquid)\b',
+    r'(币安|欧易|火币|gate|库币)',  # 中文交易所名称
+]
+
+# 中文交易所名称 -> 英文
+EXCHANGE_NAME_MAP = {
+    '币安': 'Binance',
+    '欧易': 'OKX',
+    '火币': 'Huobi',
+    'gate': 'Gate',
+    '库币': 'KuCoin',
+}
+
+# 日期格式（优先提取消息中的日期），第二项表示是否在小写文本上匹配（英文月份）
+DATE_PATTERNS = [
+    # ISO 格式（优先，因为更准确）
+    (r'(\d{4})[-\/](\d{1,2})[-\/](\d{1,2})', False),  # 2024-12-15 或 2024/12/15
+    # 英文月份格式 - 支持逗号
+    (r'(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[\s\.\/,-]+(\d{1,2})[\s\.\/,-]+(\d{4})', True),  # Oct 23, 2025 或 Oct 23 2025
+    (r'(\d{1,2})[\s\.\/,-]+(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[\s\.\/,-]+(\d{4})', True),  # 23 Oct 2025
+    # 中文日期格式
+    (r'(\d{4})\s*年\s*(\d{1,2})\s*月\s*(\d{1,2})\s*日', False),  # 2025年11月14日
+    # 其他格式
+    (r'(\d{1,2})[-\/](\d{1,2})[-\/](\d{4})', False),  # 12-15-2024
+    (r'(\d{1,2})\s+月\s+(\d{1,2})\s+日', False),      # 12月15日
+]
+
+CHINESE_DATE_PATTERN = r'(\d{4})\s*年\s*(\d{1,2})\s*月\s*(\d{1,2})\s*日'
+
+# 月份名称映射
+MONTH_NAMES = {
+    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
+    'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12
+}
+
+# 代币名称中需要排除的常见单词
+EXCLUDE_TOKENS = frozenset({'THE', 'AND', 'FOR', 'ARE', 'BUT', 'NOT', 'YOU', 'ALL', 'CAN', 'HER', 'WAS', 'ONE', 'OUR', 'OUT', 'DAY', 'GET', 'HAS', 'HIM', 'HIS', 'HOW', 'ITS', 'MAY', 'NEW', 'NOW', 'OLD', 'SEE', 'TWO', 'WHO', 'WAY', 'USE', 'HER', 'SHE', 'PUT', 'END', 'WHY', 'ASK', 'MEN', 'TURN', 'WANT', 'TELL', 'WENT', 'WERE', 'WHAT', 'WHEN', 'WITH', 'YOUR', 'FROM', 'HAVE', 'THIS', 'THAT', 'WILL', 'MORE', 'VERY', 'WHAT', 'KNOW', 'JUST', 'LIKE', 'LONG', 'MAKE', 'MANY', 'OVER', 'SUCH', 'TAKE', 'THAN', 'THEM', 'WELL', 'WERE', 'WILL', 'YEAR', 'YOUR', 'ABOUT', 'AFTER', 'AGAIN', 'BEING', 'BELOW', 'BETWEEN', 'BOTH', 'CAME', 'CARRY', 'CHANGE', 'CHILDREN', 'CLOSE', 'COME', 'COULD', 'DOES', 'DON\'T', 'DURING', 'EACH', 'EARLY', 'EARTH', 'EIGHT', 'EVERY', 'EXAMPLE', 'EYES', 'FACE', 'FAMILY', 'FAR', 'FATHER', 'FEET', 'FEW', 'FIND', 'FIRST', 'FOUND', 'FOUR', 'GAVE', 'GET', 'GIRL', 'GIVE', 'GOES', 'GOOD', 'GOT', 'GREAT', 'GROUP', 'GROW', 'HAD', 'HAND', 'HARD', 'HAS', 'HAVE', 'HEAD', 'HEAR', 'HELP', 'HERE', 'HIGH', 'HOME', 'HOUR', 'HOUSE', 'HOW', 'INTO', 'ITS', 'JUST', 'KEEP', 'KIND', 'KNEW', 'KNOW', 'LARGE', 'LAST', 'LATE', 'LEARN', 'LEFT', 'LESS', 'LIFE', 'LIGHT', 'LINE', 'LIST', 'LITTLE', 'LIVE', 'LONG', 'LOOK', 'LOOKED', 'MADE', 'MAKE', 'MAN', 'MANY', 'MAY', 'MEAN', 'MEN', 'MIGHT', 'MILES', 'MISS', 'MONEY', 'MORNING', 'MOST', 'MOTHER', 'MOVE', 'MUCH', 'MUST', 'NAME', 'NEAR', 'NEED', 'NEVER', 'NEW', 'NEXT', 'NIGHT', 'NOON', 'NOTE', 'NOTHING', 'NOW', 'NUMBER', 'OFF', 'OFTEN', 'ONCE', 'ONLY', 'OPEN', 'ORDER', 'OTHER', 'OUR', 'OUT', 'OVER', 'OWN', 'PAGE', 'PAPER', 'PART', 'PASS', 'PAST', 'PEOPLE', 'PER', 'PICTURE', 'PLACE', 'PLAN', 'PLAY', 'POINT', 'PUT', 'READ', 'REAL', 'RIGHT', 'ROOM', 'ROUND', 'SAID', 'SAME', 'SAW', 'SAY', 'SCHOOL', 'SEA', 'SECOND', 'SEE', 'SEEM', 'SENT', 'SET', 'SHE', 'SHIP', 'SHORT', 'SHOULD', 'SHOW', 'SIDE', 'SINCE', 'SING', 'SIT', 'SIX', 'SIZE', 'SLOW', 'SMALL', 'SOON', 'SOUND', 'SOUTH', 'SPACE', 'SPEAK', 'SPELL', 'STAND', 'START', 'STATE', 'STILL', 'STOP', 'STORY', 'SUCH', 'SURE', 'TAKE', 'TALK', 'TELL', 'TEN', 'TEST', 'THAN', 'THAT', 'THEIR', 'THEM', 'THEN', 'THERE', 'THESE', 'THEY', 'THING', 'THINK', 'THIS', 'THOSE', 'THREE', 'THROUGH', 'TIME', 'TOLD', 'TOOK', 'TOO', 'TOOK', 'TOOL', 'TOP', 'TOWARD', 'TOWN', 'TREE', 'TRIED', 'TRUE', 'TRY', 'TURN', 'TWO', 'UNDER', 'UNTIL', 'UPON', 'USED', 'USING', 'USUAL', 'VALUE', 'VERY', 'VOICE', 'WALK', 'WANT', 'WARM', 'WATCH', 'WATER', 'WAVE', 'WAYS', 'WEAR', 'WEEK', 'WEIGHT', 'WELL', 'WENT', 'WERE', 'WEST', 'WHAT', 'WHEEL', 'WHEN', 'WHERE', 'WHICH', 'WHILE', 'WHITE', 'WHO', 'WHOLE', 'WHOSE', 'WHY', 'WIDE', 'WIFE', 'WILD', 'WILL', 'WIND', 'WINDOW', 'WISH', 'WITH', 'WITHIN', 'WITHOUT', 'WOMAN', 'WOMEN', 'WON\'T', 'WONDER', 'WOOD', 'WORD', 'WORE', 'WORK', 'WORLD', 'WOULD', 'WRITE', 'WRONG', 'WROTE', 'YARD', 'YEAR', 'YELLOW', 'YES', 'YESTERDAY', 'YET', 'YOU', 'YOUNG', 'YOUR', 'YOURSELF'})
+
+# 代币名称中需要排除的交易所名称和计价货币
+EXCLUDE_EXCHANGE_NAMES = frozenset([
+    'BINANCE', 'COINBASE', 'OKX', 'OKEX', 'KRAKEN', 'BYBIT', 'HUOBI', 'KUCOIN',
+    'BITFINEX', 'BITSTAMP', 'GATE', 'BITHUMB', 'UPBIT', 'MEXC', 'BITGET', 'BITMART',
+    'HYPERLIQUID', 'USD', 'USDT', 'USDC', 'KRW', 'BTC', 'ETH', 'EUR', 'GBP'
+])
+
+# 交易对后缀
+PAIR_SUFFIXES = ['USDT', 'USD', 'USDC', 'BTC', 'ETH', 'EUR', 'GBP', 'KRW']
+
+# 带括号的代币格式
+BRACKET_NAME_TOKEN_PATTERN = r'([A-Z][A-Za-z]+)\s*\(([A-Z]{2,10})\)'  # Name (TOKEN)，如 "Rayls (RLS)"
+BRACKET_TOKEN_NAME_PATTERN = r'([A-Z]{2,10})\s*\(([A-Z][A-Za-z]+)\)'  # TOKEN (Name)，如 "SENT (Sentient)"
+
+# 提取代币名称（更精确的模式，支持更多格式）
+# 注意：更具体的模式要放在前面
+TOKEN_PATTERNS = [
+    # 特定格式：list pre-market perpetual futures for TOKEN (Name) - 最具体
+    r'list\s+pre-market\s+perpetual\s+futures\s+for\s+([A-Z]{2,10})\s*\(([A-Z][A-Za-z]+)\)',  # "list pre-market perpetual futures for SENT (Sentient)"
+    r'to\s+list\s+pre-market\s+perpetual\s+futures\s+for\s+([A-Z]{2,10})\s*\(([A-Z][A-Za-z]+)\)',  # "to list pre-market perpetual futures for SENT (Sentient)"
+    # 特定格式：list perpetual futures for TOKEN (Name)
+    r'list\s+perpetual\s+futures\s+for\s+([A-Z]{2,10})\s*\(([A-Z][A-Za-z]+)\)',  # "list perpetual futures for TOKEN (Name)"
+    # 优先匹配带括号的格式，如 "Rayls (RLS)" 或 "APRO (AT)" 或 "SENT (Sentient)"
+    BRACKET_NAME_TOKEN_PATTERN,  # "Rayls (RLS)" 或 "APRO (AT)"
+    BRACKET_TOKEN_NAME_PATTERN,  # "SENT (Sentient)" - 代币代码在前
+    # 特定格式：list perpetual futures for TOKEN
+    r'list\s+perpetual\s+futures\s+for\s+([A-Z]{2,10})',  # "list perpetual futures for SEI"
+    r'to\s+list\s+perpetual\s+futures\s+for\s+([A-Z]{2,10})',  # "to list perpetual futures for SEI"
+    r'list\s+([A-Z]{2,10})\s+for\s+spot',  # "list SEI for spot"
+    r'list\s+([A-Z]{2,10})\s+for\s+perpetual',  # "list SEI for perpetual"
+    # 中文格式：上线TOKEN（Name）代币的预市永续期货
+    r'上线([A-Z]{2,10})\s*\(([A-Z][A-Za-z]+)\)',  # "上线SENT（Sentient）"
+    # 交易对格式
+    r'\b([A-Z]{2,10})[/\-](USD|USDT|BTC|ETH|EUR|GBP|KRW|USDC)',  # "IRYSUSDT" 或 "AERO/USDC"
+    # Alpha Coin 格式（优先匹配，因为更具体）
+    r'new\s+binance\s+alpha\s+coin[:\s]+([A-Z]{2,10})',  # "New Binance Alpha Coin: VSN"
+    r'binance\s+alpha\s+coin[:\s]+([A-Z]{2,10})',  # "Binance Alpha Coin: VSN"
+    r'alpha\s+coin[:\s]+([A-Z]{2,10})',  # "Alpha Coin: VSN"
+    # 韩文格式
+    r'([A-Z]{2,10})\s*\([^)]+\)\s*원화',  # "아이리스(IRYS) 원화"
+    r'플룸\s*\(([A-Z]{2,10})\)',  # "플룸(PLUME)"
+    r'([A-Z]{2,10})\s+KRW',  # "PLUME KRW"
+    # 标准 listing 格式
+    r'list\s+([A-Z]{2,10})\s+for',  # "list DASH for"
+    r'list\s+([A-Z]{2,10})',  # "list DASH"
+    r'listing\s+of\s+([A-Z]{2,10})',  # "listing of BTC"
+    r'to\s+list\s+([A-Z]{2,10})',  # "to list TRUTH"
+    r'上线\s+([A-Z]{2,10})',  # "上线 SEI"
+    r'add\s+([A-Z]{2,10})',  # "add BTC"
+    # 其他格式
+    r'\$([A-Z]{2,10})\b',  # $BTC 格式
+    r'\b([A-Z]{3,10})\s+(?:will|to|is|are|has|have|listing|list|on|for)',  # 代币名称后跟 listing 相关词
+    r'introducing\s+([A-Z]{2,10})',  # "Introducing APRO"
+    r'\(([A-Z]{2,10})\)',  # "(IRYS)" 或 "(PLUME)"
+    r'([A-Z]{2,10})\s*\(',  # "IRYS (" 或 "PLUME ("
+    # 从交易对中提取，如 "IRYSUSDT" -> "IRYS"
+    r'([A-Z]{2,10})(?:USDT|USD|BTC|ETH|EUR|GBP|KRW|USDC)',  # "IRYSUSDT" -> "IRYS"
+]
+
+# 提取时间
+TIME_PATTERN = r'(\d{1,2}):(\d{2})\s*(?:AM|PM|am|pm)?\s*(UTC|utc|GMT|gmt)?'
+
+# 提取交易对
+PAIRS_PATTERN = r'([A-Z]{2,10})[/\-](USD|USDT|BTC|ETH|EUR|GBP)'
+
+
+def _compile_any(patterns):
+    """把多个模式合并为一个交替正则，一次 search 等价于 any(re.search(p) for p in patterns)"""
+    return re.compile('|'.join(f'(?:{pattern})' for pattern in patterns))
+
+
+def _listing_from_dict(record):
+    return Listing.from_dict(record)
+
+
+_UNSET = object()  # Listing 中没有赋值的字段
+
+
+class Listing:
+    """
+    一条 listing 的紧凑记录
+    
+    用 __slots__ 代替每条记录一个 dict；交易所、类型、日期、代币等重复很多的字段使用驻留字符串，
+    同一条消息解析出的多条 listing 共享同一个 text（原文前 300 字符）对象。
+    
+    支持字典式访问（listing['date']、listing.get()、'time' in listing、listing['pairs'] = ...），
+    没有赋值的字段视为不存在；to_dict() 按 FIELDS 的顺序输出，与原来 JSON 记录的字段顺序一致。
+    FIELDS 以外的字段（如旧数据中的额外字段）保存在 extra 中，放在最后输出。
+    """
+
+    FIELDS = ('date', 'token', 'token_display', 'exchange', 'type', 'text',
+              'time', 'pairs', 'message_id', 'message_date', 'source')
+    _FIELD_SET = frozenset(FIELDS)
+    _INTERNED = frozenset(('date', 'token', 'exchange', 'type', 'time', 'message_date', 'source'))
+    __slots__ = FIELDS + ('extra',)
+
+    def __init__(self, date=_UNSET, token=_UNSET, token_display=_UNSET, exchange=_UNSET, type=_UNSET,
+                 text=_UNSET):
+        self.date = sys.intern(date) if date is not _UNSET else date
+        self.token = sys.intern(token) if token is not _UNSET else token
+        self.token_display = token_display
+        self.exchange = sys.intern(exchange) if exchange is not _UNSET else exchange
+        self.type = sys.intern(type) if type is not _UNSET else type
+        self.text = text
+        self.time = self.pairs = self.message_id = self.message_date = self.source = _UNSET
+        self.extra = None
+
+    @classmethod
+    def from_dict(cls, record, notes=None):
+        """
+        从字典（cex_listings.json 或数据库中的记录）创建
+        
+        Args:
+            notes: 可选的 {text: text} 字典，相同的 text 只保留一个对象
+        """
+        listing = cls()
+        for key, value in record.items():
+            if key == 'text' and notes is not None and isinstance(value, str):
+                value = notes.setdefault(value, value)
+            listing[key] = value
+        return listing
+
+    def __getitem__(self, key):
+        if key in self._FIELD_SET:
+            value = getattr(self, key)
+            if value is not _UNSET:
+                return value
+        elif self.extra and key in self.extra:
+            return self.extra[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        if key in self._FIELD_SET:
+            if key in self._INTERNED and type(value) is str:
+                value = sys.intern(value)
+            setattr(self, key, value)
+        elif self.extra is None:
+            self.extra = {key: value}
+        else:
+            self.extra[key] = value
+
+    def __contains__(self, key):
+        if key in self._FIELD_SET:
+            return getattr(self, key) is not _UNSET
+        return bool(self.extra) and key in self.extra
+
+    def get(self, key, default=None):
+        if key in self._FIELD_SET:
+            value = getattr(self, key)
+            return default if value is _UNSET else value
+        return self.extra.get(key, default) if self.extra else default
+
+    def keys(self):
+        return [key for key, _ in self.items()]
+
+    def items(self):
+        """(字段, 值) 的迭代器，不构建字典"""
+        for field in self.FIELDS:
+            value = getattr(self, field)
+            if value is not _UNSET:
+                yield field, value
+        if self.extra:
+            yield from self.extra.items()
+
+    def to_dict(self):
+        record = {field: value for field, value in zip(self.FIELDS, self._values()) if value is not _UNSET}
+        if self.extra:
+            record.update(self.extra)
+        return record
+
+    def _values(self):
+        return (self.date, self.token, self.token_display, self.exchange, self.type, self.text,
+                self.time, self.pairs, self.message_id, self.message_date, self.source)
+
+    def copy(self):
+        listing = Listing.__new__(Listing)
+        (listing.date, listing.token, listing.token_display, listing.exchange, listing.type, listing.text,
+         listing.time, listing.pairs, listing.message_id, listing.message_date, listing.source) = self._values()
+        listing.extra = dict(self.extra) if self.extra else None
+        return listing
+
+    def __eq__(self, other):
+        if isinstance(other, (Listing, dict)):
+            return self.to_dict() == dict(other.items())
+        return NotImplemented
+
+    __hash__ = None
+
+    def __reduce__(self):
+        # 进程池传递结果时按字典序列化；同一批结果中相同的 text 对象只序列化一次
+        return _listing_from_dict, (self.to_dict(),)
+
+    def __repr__(self):
+        return f"Listing({self.to_dict()!r})"
+
+
+def listing_dict(listing):
+    """输出用的普通字典（Listing 或从文件读取的 dict 都可以）"""
+    return listing.to_dict() if isinstance(listing, Listing) else listing
+
+
+class ListingClassifier:
+    """
+    CEX listing 解析引擎
+    在构造时编译全部规则，之后每条消息只做匹配，不再编译正则或重建常量表
+    """
+
+    def __init__(self):
+        # 过滤规则
+        self.listing_filter = _compile_any(LISTING_KEYWORDS)
+        self.delist_filter = _compile_any(DELIST_KEYWORDS)
+        self.listing_hint = re.compile(LISTING_HINT_PATTERN)
+        self.pure_activity = _compile_any(PURE_ACTIVITY_KEYWORDS)
+        self.exchange_patterns = [re.compile(pattern) for pattern in EXCHANGE_PATTERNS]
+
+        # 类型识别规则
+        self.premarket = re.compile(r'pre-market|premarket|预上市|预市')
+        self.alpha_coin = re.compile(r'new\s+binance\s+alpha\s+coin|binance\s+alpha\s+coin|alpha\s+coin|binance\s+alpha')
+        self.premarket_perp = re.compile(r'perpetual|perp|futures|永续|合约')
+        self.perp_contract = re.compile(r'perpetual\s+futures|perpetual\s+contract|perp\s+contract|永续合约|futures.*perpetual|contract.*api|合约.*api')
+        self.convert = re.compile(r'convert')
+        self.contract = re.compile(r'contract')
+        self.binance_futures = re.compile(r'binance\s+futures|futures.*will\s+launch')
+        self.binance_spot = re.compile(r'earn|buy\s+crypto|convert.*margin|margin')
+        self.okx_spot = re.compile(r'spot\s+trading|list.*for\s+spot')
+        self.okx_perp = re.compile(r'perpetual\s+futures|list.*perpetual')
+        self.hyperliquid_perp = re.compile(r'永续合约')
+        self.other_perp = re.compile(r'perpetual|perp|futures|swap|合约')
+        self.other_spot = re.compile(r'spot|现货|roadmap|마켓.*추가|新增.*资产')
+
+        # 日期、时间、交易对
+        self.date_patterns = [(re.compile(pattern), use_lower) for pattern, use_lower in DATE_PATTERNS]
+        self.chinese_date = re.compile(CHINESE_DATE_PATTERN)
+        self.time_pattern = re.compile(TIME_PATTERN)
+        self.pairs_pattern = re.compile(PAIRS_PATTERN)
+
+        # 代币规则
+        self.bracket_name_token = re.compile(BRACKET_NAME_TOKEN_PATTERN)
+        self.bracket_token_name = re.compile(BRACKET_TOKEN_NAME_PATTERN)
+        # 两个分组的模式（带括号的格式、交易对）已由上面的括号规则处理，
+        # 在逐个模式提取时结果全部被跳过，因此这里只保留单分组的模式
+        self.token_patterns = [
+            compiled for compiled in map(re.compile, TOKEN_PATTERNS)
+            if compiled.groups == 1
+        ]
+
+    def is_candidate(self, text_lower):
+        """廉价预筛：判断消息是否可能是 listing（必要条件）"""
+        if not any(literal in text_lower for literal in LISTING_LITERALS):
+            return False
+        return self.listing_filter.search(text_lower) is not None
+
+    def extract(self, text, message_date=None):
+        """解析单条消息，返回 listing 列表（语义见 extract_listing_info）"""
+        listings = []
+
+        text_lower = text.lower()
+
+        # 必须包含 listing 相关的关键词；其余过滤规则都只会返回空列表，
+        # 所以先做这一步可以一次性拒绝绝大多数普通消息
+        if not self.is_candidate(text_lower):
+            return listings
+
+        # 优先过滤掉 delist（下架）相关的消息，无论是否包含 listing 关键词
+        if self.delist_filter.search(text_lower):
+            return listings
+
+        # 如果是 listing 消息，即使包含活动关键词也保留（比如 listing + 空投活动）
+        # 但如果是纯活动消息（没有 listing），则过滤
+        if not self.listing_hint.search(text_lower):
+            if self.pure_activity.search(text_lower):
+                return listings
+
+        # 必须包含交易所名称
+        exchanges = []
+        for pattern in self.exchange_patterns:
+            for match in pattern.findall(text_lower):
+                # 如果是中文交易所名称，转换为英文
+                if match in EXCHANGE_NAME_MAP:
+                    exchanges.append(EXCHANGE_NAME_MAP[match].lower())
+                else:
+                    exchanges.append(match)
+
+        if not exchanges:
+            return listings
+
+        listing_types = self._classify_types(text_lower)
+        if listing_types is None:
+            # Alpha Coin 暂时不提取
+            return []
+
+        # 提取日期（多种格式，优先提取消息中的日期）
+        date_match = None
+        for pattern, use_lower in self.date_patterns:
+            # 英文月份格式在小写文本上匹配，其余使用原始文本
+            date_match = pattern.search(text_lower if use_lower else text)
+            if date_match:
+                break
+
+        tokens, token_display = self._extract_tokens(text)
+
+        # 提取时间
+        time_match = self.time_pattern.search(text)
+
+        # 提取交易对
+        pairs = self.pairs_pattern.findall(text)
+
+        # 如果找到代币和交易所，创建 listing 对象
+        if tokens and exchanges:
+            listing_date = self._parse_date(date_match, text) if date_match else None
+
+            # 如果没有从消息文本中提取到日期
+            # 对于 Alpha Coin，可以使用消息发布日期（因为 Alpha Coin 通常是即时上线的）
+            # 对于其他类型，如果没有日期则跳过（因为消息发布日期可能不是上币日期）
+            if not listing_date:
+                if 'alpha' in listing_types:
+                    if message_date:
+                        # Alpha Coin 使用消息发布日期
+                        listing_date = message_date
+                    else:
+                        # Alpha Coin 但没有消息发布日期，跳过
+                        return []
+                else:
+                    # 非 Alpha Coin 必须有日期
+                    return []
+
+            # 处理时间
+            listing_time = None
+            if time_match:
+                listing_time = f"{time_match.group(1)}:{time_match.group(2)}"
+                if time_match.group(3):
+                    listing_time += f" {time_match.group(3).upper()}"
+
+            notes = text[:300]  # 保存原始文本的前300字符
+
+            for token in tokens[:5]:  # 最多取前5个代币
+                for exchange in list(set(exchanges))[:2]:  # 去重，最多取前2个交易所
+                    # 统一交易所名称为英文
+                    exchange_normalized = EXCHANGE_NAME_MAP.get(exchange, exchange).title()
+
+                    # 使用显示名称（如果有），否则使用代币代码
+                    display_token = token_display.get(token, token)
+
+                    # 为每个类型创建 listing（如果一条消息包含多个类型）
+                    for listing_type in listing_types:
+                        listing = Listing(
+                            date=listing_date,
+                            token=token,  # 代币代码
+                            token_display=display_token,  # 显示名称，如 "Rayls (RLS)"
+                            exchange=exchange_normalized,  # 已转换为英文
+                            type=listing_type,  # perp, spot 或 alpha
+                            text=notes,  # 同一条消息的 listing 共享
+                        )
+
+                        if listing_time:
+                            listing['time'] = listing_time
+                        # 找到匹配的交易对
+                        for pair in pairs:
+                            if pair[0].upper() == token.upper():
+                                listing['pairs'] = f"{pair[0]}/{pair[1]}"
+                                break
+
+                        listings.append(listing)
+
+        return listings
+
+    def _classify_types(self, text_lower):
+        """
+        识别交易类型：perp（永续合约）、spot（现货）、alpha 或 pre-market
+        返回 None 表示是 Alpha Coin（不提取）
+        """
+        listing_types = []
+
+        # Pre-Market 检测（优先级最高，因为它是特殊的市场类型）
+        is_premarket = self.premarket.search(text_lower)
+
+        # Coinbase 默认都是 spot
+        if 'coinbase' in text_lower:
+            if is_premarket:
+                listing_types.append('pre-market')
+            else:
+                listing_types.append('spot')
+        # Binance Alpha Coin：暂时过滤掉 Alpha Coin，只保留其他类型的 listing
+        if self.alpha_coin.search(text_lower):
+            return None
+        # Pre-Market Perpetual / Pre-Market Spot
+        elif is_premarket:
+            listing_types.append('pre-market')
+        # Perp 相关关键词（非 Pre-Market）
+        elif self.perp_contract.search(text_lower):
+            listing_types.append('perp')
+        # Bybit Convert 是 spot
+        elif 'bybit' in text_lower and self.convert.search(text_lower):
+            listing_types.append('spot')
+        # Bybit contract 是 perp
+        elif 'bybit' in text_lower and self.contract.search(text_lower) and 'convert' not in text_lower:
+            listing_types.append('perp')
+        # Binance Futures 是 perp
+        elif self.binance_futures.search(text_lower):
+            listing_types.append('perp')
+        # Binance Earn/Buy/Convert/Margin 是 spot
+        elif 'binance' in text_lower and self.binance_spot.search(text_lower):
+            listing_types.append('spot')
+        # OKX spot trading
+        elif 'okx' in text_lower and self.okx_spot.search(text_lower):
+            listing_types.append('spot')
+        # OKX perpetual futures（非 pre-market，上面已排除）
+        elif 'okx' in text_lower and self.okx_perp.search(text_lower):
+            listing_types.append('perp')
+        # Hyperliquid 永续合约
+        elif 'hyperliquid' in text_lower and self.hyperliquid_perp.search(text_lower):
+            listing_types.append('perp')
+        # 其他 perp 关键词（非 Pre-Market）
+        elif 'spot' not in text_lower and self.other_perp.search(text_lower):
+            if 'perp' not in listing_types:
+                listing_types.append('perp')
+        # 其他 spot 关键词
+        elif self.other_spot.search(text_lower):
+            if 'spot' not in listing_types:
+                listing_types.append('spot')
+
+        # 如果没有识别到任何类型，默认是 spot
+        if not listing_types:
+            listing_types = ['spot']
+
+        return listing_types
+
+    def _extract_tokens(self, text):
+        """提取代币代码列表和显示名称映射"""
+        tokens = []
+        token_display = {}  # 存储代币的显示名称，如 {"RLS": "Rayls (RLS)"}
+        bracket_tokens = {}  # 存储括号内的代币，如 {"BOBBOB": "BOB"}
+
+        # 记录已处理的代币，避免重复
+        processed_tokens = set()
+
+        # 先提取带括号的格式，支持两种格式：
+        # 1. "Name (TOKEN)" - 如 "Rayls (RLS)" 或 "BOB (BOBBOB)"
+        # 2. "TOKEN (Name)" - 如 "SENT (Sentient)"
+        for display_name, token in self.bracket_name_token.findall(text):
+            token_upper = token.upper()
+            if token_upper not in processed_tokens:
+                bracket_tokens[token_upper] = display_name
+                token_display[token_upper] = f"{display_name} ({token})"
+                tokens.append(token_upper)
+                processed_tokens.add(token_upper)
+
+        for token, display_name in self.bracket_token_name.findall(text):
+            token_upper = token.upper()
+            if token_upper not in processed_tokens:
+                token_display[token_upper] = f"{token} ({display_name})"
+                tokens.append(token_upper)
+                processed_tokens.add(token_upper)
+
+        # 然后提取其他格式的代币
+        bracket_names = set(bracket_tokens.values())
+        for pattern in self.token_patterns:
+            for token in pattern.findall(text):
+                token_upper = token.upper()
+                # 如果这个代币已经在括号中出现过（如 BOB 在 "BOB (BOBBOB)" 中），跳过
+                if token_upper in bracket_names:
+                    continue
+                # 如果已经处理过，跳过
+                if token_upper in processed_tokens:
+                    continue
+                # 过滤掉常见单词和交易所名称
+                if token_upper not in EXCLUDE_TOKENS and token_upper not in EXCLUDE_EXCHANGE_NAMES:
+                    if len(token) >= 2 and token_upper not in tokens:
+                        tokens.append(token_upper)
+
+        # 如果从交易对中提取（如 IRYSUSDT），需要清理
+        cleaned_tokens = []
+        for token in tokens:
+            # 移除交易对后缀
+            for suffix in PAIR_SUFFIXES:
+                if token.endswith(suffix) and len(token) > len(suffix):
+                    token = token[:-len(suffix)]
+                    break
+            # 如果这个代币是括号内代币的显示名称（如 BOB 是 BOBBOB 的显示名称），跳过
+            if token in bracket_names:
+                continue
+            if token not in cleaned_tokens:
+                cleaned_tokens.append(token)
+
+        return cleaned_tokens, token_display
+
+    def _parse_date(self, date_match, text):
+        """把日期匹配结果转换为 YYYY-MM-DD，无法解析时返回 None"""
+        try:
+            groups = date_match.groups()
+            if len(groups) != 3:
+                return None
+
+            # 先检查是否是中文日期格式（2025年10月23日）
+            if '年' in text or '月' in text or '日' in text:
+                chinese_match = self.chinese_date.search(text)
+                values = chinese_match.groups() if chinese_match else groups
+                year, month, day = (int(value) for value in values)
+            elif len(groups[0]) == 4 or len(groups[2]) != 4:
+                # YYYY-MM-DD 或其他格式
+                year, month, day = (int(value) for value in groups)
+            elif groups[0].lower() in MONTH_NAMES:  # Oct 23, 2025
+                month_name, day, year = groups
+                year, month, day = int(year), MONTH_NAMES[month_name.lower()], int(day)
+            elif groups[1].lower() in MONTH_NAMES:  # 23 Oct 2025
+                day, month_name, year = groups
+                year, month, day = int(year), MONTH_NAMES[month_name.lower()], int(day)
+            else:  # MM-DD-YYYY
+                month, day, year = groups
+                year, month, day = int(year), int(month), int(day)
+
+            # 验证日期有效性
+            if 2000 <= year <= 2100 and 1 <= month <= 12 and 1 <= day <= 31:
+                return f"{year}-{str(month).zfill(2)}-{str(day).zfill(2)}"
+        except (ValueError, IndexError, KeyError):
+            pass
+        return None
+
+
+# 模块加载时构建一次，所有调用共享
+_CLASSIFIER = ListingClassifier()
+
+
+def extract_listing_info(text, message_date=None):
+    """
+    从消息文本中提取 CEX listing 信息
+    只提取 new listing，过滤掉活动相关的消息
+    
+    Args:
+        text: 消息文本
+        message_date: 消息发布日期（可选），用于 Alpha Coin 等没有明确日期的消息
+    
+    Returns:
+        listing 字典的列表（字段顺序同 Listing.FIELDS）
+    """
+    return [listing.to_dict() for listing in _CLASSIFIER.extract(text, message_date)]
+
+
+def annotate_listings(listings, message_id, msg_date, source=None):
+    """
+    给一条消息的解析结果附加消息 ID、发布日期和来源频道
+    
+    Args:
+        listings: 该消息解析出的 Listing 列表
+        message_id: 消息 ID
+        msg_date: 消息发布日期（YYYY-MM-DD）
+        source: 来源频道（离线回放等没有来源时为 None）
+    """
+    collected = []
+    for listing in listings:
+        # 确保日期有效（extract_listing_info 已经确保日期存在）
+        date = listing.get('date', '')
+        if not date or len(date) != 10 or date.count('-') != 2:
+            # 如果日期无效，跳过这条 listing（不应该发生，因为 extract_listing_info 已经检查过）
+            print(f"⚠️ 警告：消息 #{message_id} 的 listing 日期无效: {date}，跳过")
+            continue
+        listing['message_id'] = message_id
+        listing['message_date'] = msg_date
+        if source:
+            listing['source'] = source
+        collected.append(listing)
+    return collected
+
+
+def _extract_chunk(chunk):
+    """
+    进程池任务：解析一块 (message_id, msg_date, text, source) 消息，返回 [(message_id, listings), ...]
+    
+    放在这里而不是 scraper 中，spawn 方式启动的解析进程只需要导入本模块
+    """
+    return [
+        (message_id, annotate_listings(_CLASSIFIER.extract(text, msg_date), message_id, msg_date, source))
+        for message_id, msg_date, text, source in chunk
+    ]
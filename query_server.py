@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+只读查询服务：把 listing 加载到内存索引中，按日期范围、交易所、类型、代币返回 JSON
+
+下游的机器人和看板只取需要的那一部分，不必每次下载并解析完整的 data.js。
+只依赖标准库。
+
+接口：
+    GET /listings?from=2025-05-01&to=2025-05-31&exchange=binance,okx&type=spot&token=KERNEL&limit=100&offset=0
+        所有参数都可选；exchange、type、token 可以用逗号分隔多个值（不区分大小写）。
+        返回 {"version", "total", "offset", "limit", "next_offset", "listings"}，
+        next_offset 为 null 表示已经是最后一页
+    GET /meta
+        数据版本、记录数、日期范围、各交易所和各类型的记录数
+
+响应带 ETag（数据版本 + 查询参数），客户端带 If-None-Match 时数据未变则返回 304；
+客户端支持时响应用 gzip 压缩。数据文件变化后自动重新加载。
+
+用法：
+    python query_server.py                      # 默认读取 cex_listings.json（不存在时读取 data.js）
+    python query_server.py --port 8080 --file data.js
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qsl, urlsplit
+
+DEFAULT_FILES = ('cex_listings.json', 'data.js')
+DEFAULT_LIMIT = 100
+MAX_LIMIT = 1000
+RELOAD_INTERVAL = 2  # 最多每隔多少秒检查一次数据文件是否变化
+RESPONSE_CACHE_SIZE = 1024  # 缓存的已编码响应数
+GZIP_MIN_SIZE = 1024  # 小于这个大小的响应不压缩
+CACHE_MAX_AGE = 60  # Cache-Control 的 max-age（秒）
+
+FILTER_FIELDS = ('exchange', 'type', 'token')
+
+
+def read_listings(path):
+    """
+    读取 listing 文件，返回 (listings, 文件内容哈希)
+
+    支持 cex_listings.json（JSON 数组）和 data.js（每行一条 JSON 记录）
+    """
+    data = Path(path).read_bytes()
+    version = hashlib.blake2b(data, digest_size=8).hexdigest()
+    if str(path).endswith('.js'):
+        listings = []
+        for line in data.decode('utf-8').splitlines():
+            line = line.strip().rstrip(',')
+            if line.startswith('{'):
+                listings.append(json.loads(line))
+    else:
+        listings = json.loads(data)
+    return listings, version
+
+
+def _field(listing, field):
+    """索引和过滤用的规范化字段值"""
+    value = listing.get(field) or ''
+    return value.upper() if field == 'token' else value.lower()
+
+
+class ListingStore:
+    """
+    不可变的内存索引
+
+    记录按日期排序，日期范围用二分查找定位；交易所、类型、代币各有一个
+    值 -> 记录位置列表（升序）的倒排索引
+    """
+
+    def __init__(self, listings, version):
+        self.version = version
+        self.listings = sorted(listings, key=lambda listing: listing.get('date', ''))
+        self.dates = [listing.get('date', '') for listing in self.listings]
+        self.indexes = {field: {} for field in FILTER_FIELDS}
+        for position, listing in enumerate(self.listings):
+            for field in FILTER_FIELDS:
+                self.indexes[field].setdefault(_field(listing, field), []).append(position)
+
+    def query(self, date_from='', date_to='', filters=None, offset=0, limit=DEFAULT_LIMIT):
+        """
+        Args:
+            date_from / date_to: 闭区间，YYYY-MM-DD，空字符串表示不限
+            filters: {字段: 允许的值集合}（值已规范化）
+
+        Returns:
+            (符合条件的总数, 当前页的 listing)
+        """
+        lo = bisect_left(self.dates, date_from) if date_from else 0
+        hi = bisect_right(self.dates, date_to) if date_to else len(self.dates)
+        filters = filters or {}
+        if not filters:
+            positions = range(lo, hi)
+        else:
+            # 从候选最少的过滤条件出发，其余条件逐条检查
+            candidates = []
+            for field, values in filters.items():
+                lists = [self.indexes[field].get(value, ()) for value in values]
+                candidates.append((sum(map(len, lists)), field, lists))
+            _, first_field, lists = min(candidates, key=lambda candidate: candidate[0])
+            merged = []
+            for matched in lists:
+                merged.extend(matched[bisect_left(matched, lo):bisect_left(matched, hi)])
+            if len(lists) > 1:
+                merged.sort()
+            rest = [(field, values) for field, values in filters.items() if field != first_field]
+            positions = [
+                position for position in merged
+                if all(_field(self.listings[position], field) in values for field, values in rest)
+            ]
+        return len(positions), [self.listings[position] for position in positions[offset:offset + limit]]
+
+    def meta(self):
+        return {
+            'version': self.version,
+            'count': len(self.listings),
+            'date_from': self.dates[0] if self.dates else None,
+            'date_to': self.dates[-1] if self.dates else None,
+            'exchanges': {value: len(positions) for value, positions in sorted(self.indexes['exchange'].items())},
+            'types': {value: len(positions) for value, positions in sorted(self.indexes['type'].items())},
+        }
+
+
+class QueryService:
+    """持有当前的 ListingStore，数据文件变化时重新加载；缓存已编码的响应"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.store = None
+        self._stat = None
+        self._checked = 0.0
+        self._lock = threading.Lock()
+        self._responses = OrderedDict()  # (版本, 请求) -> [ETag, 响应体, gzip 响应体]
+        self.reload()
+
+    def reload(self):
+        stat = self.path.stat()
+        listings, version = read_listings(self.path)
+        self.store = ListingStore(listings, version)
+        self._stat = (stat.st_mtime_ns, stat.st_size)
+        print(f"✓ 已加载 {self.path}：{len(listings)} 条 listing（版本 {version}）")
+
+    def current(self):
+        """返回当前的 ListingStore，距上次检查超过 RELOAD_INTERVAL 时检查文件是否变化"""
+        now = time.monotonic()
+        if now - self._checked >= RELOAD_INTERVAL:
+            with self._lock:
+                if now - self._checked >= RELOAD_INTERVAL:
+                    self._checked = now
+                    try:
+                        stat = self.path.stat()
+                        if (stat.st_mtime_ns, stat.st_size) != self._stat:
+                            self.reload()
+                    except (OSError, ValueError) as e:
+                        # 文件正在被替换或内容不完整时继续使用旧数据
+                        print(f"⚠️ 警告：重新加载 {self.path} 失败（{e}），继续使用旧数据")
+        return self.store
+
+    def response(self, store, request, build):
+        """返回 [ETag, 响应体, gzip 响应体或 None]，build() 生成响应对象"""
+        key = (store.version, request)
+        with self._lock:
+            cached = self._responses.get(key)
+            if cached is not None:
+                self._responses.move_to_end(key)
+                return cached
+        body = json.dumps(build(), ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        etag = '"%s-%s"' % (store.version, hashlib.blake2b(repr(request).encode('utf-8'), digest_size=6).hexdigest())
+        compressed = gzip.compress(body, compresslevel=6, mtime=0) if len(body) >= GZIP_MIN_SIZE else None
+        entry = [etag, body, compressed]
+        with self._lock:
+            self._responses[key] = entry
+            while len(self._responses) > RESPONSE_CACHE_SIZE:
+                self._responses.popitem(last=False)
+        return entry
+
+
+class BadRequest(ValueError):
+    pass
+
+
+def parse_listing_query(params):
+    """把查询参数规范化为可哈希的请求：(from, to, ((字段, 值...), ...), offset, limit)"""
+    def number(name, default, maximum=None):
+        value = params.get(name, '')
+        if not value:
+            return default
+        if not value.isdigit():
+            raise BadRequest(f"{name} 必须是非负整数")
+        return min(int(value), maximum) if maximum else int(value)
+
+    filters = []
+    for field in FILTER_FIELDS:
+        values = {
+            value.strip().upper() if field == 'token' else value.strip().lower()
+            for value in params.get(field, '').split(',') if value.strip()
+        }
+        if values:
+            filters.append((field, tuple(sorted(values))))
+    limit = number('limit', DEFAULT_LIMIT, MAX_LIMIT)
+    if not limit:
+        raise BadRequest("limit 必须大于 0")
+    return (params.get('from', ''), params.get('to', ''), tuple(filters), number('offset', 0), limit)
+
+
+class QueryHandler(BaseHTTPRequestHandler):
+    service = None  # 由 serve() 设置
+    server_version = 'CexListingQuery/1.0'
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        self.handle_query(head=False)
+
+    def do_HEAD(self):
+        self.handle_query(head=True)
+
+    def handle_query(self, head):
+        self.head = head
+        url = urlsplit(self.path)
+        params = dict(parse_qsl(url.query))
+        store = self.service.current()
+        try:
+            if url.path == '/listings':
+                request = parse_listing_query(params)
+                date_from, date_to, filters, offset, limit = request
+
+                def build():
+                    total, page = store.query(date_from, date_to, {field: set(values) for field, values in filters},
+                                              offset, limit)
+                    return {
+                        'version': store.version,
+                        'total': total,
+                        'offset': offset,
+                        'limit': limit,
+                        'next_offset': offset + limit if offset + limit < total else None,
+                        'listings': page,
+                    }
+            elif url.path == '/meta':
+                request = 'meta'
+                build = store.meta
+            else:
+                self.send_error_json(HTTPStatus.NOT_FOUND, f"未知的路径 {url.path}")
+                return
+        except BadRequest as e:
+            self.send_error_json(HTTPStatus.BAD_REQUEST, str(e))
+            return
+        self.send_entry(self.service.response(store, request, build))
+
+    def send_entry(self, entry):
+        etag, body, compressed = entry
+        if etag in self.headers.get('If-None-Match', ''):
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_common_headers(etag)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        if compressed is not None and 'gzip' in self.headers.get('Accept-Encoding', ''):
+            body = compressed
+            encoding = 'gzip'
+        else:
+            encoding = None
+        self.send_response(HTTPStatus.OK)
+        self.send_common_headers(etag)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        if encoding:
+            self.send_header('Content-Encoding', encoding)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if not self.head:
+            self.wfile.write(body)
+
+    def send_common_headers(self, etag):
+        self.send_header('ETag', etag)
+        self.send_header('Cache-Control', f'public, max-age={CACHE_MAX_AGE}')
+        self.send_header('Vary', 'Accept-Encoding')
+        self.send_header('Access-Control-Allow-Origin', '*')
+
+    def send_error_json(self, status, message):
+        self.close_connection = status >= 500
+        body = json.dumps({'error': message}, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if not self.head:
+            self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # 高频请求下不逐条打印访问日志
+        pass
+
+
+def default_file():
+    for name in DEFAULT_FILES:
+        if os.path.exists(name):
+            return name
+    return DEFAULT_FILES[0]
+
+
+def serve(path, host='127.0.0.1', port=8000):
+    QueryHandler.service = QueryService(path)
+    server = ThreadingHTTPServer((host, port), QueryHandler)
+    server.daemon_threads = True
+    print(f"✓ 查询服务已启动：http://{host}:{port}/listings")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n已停止")
+    finally:
+        server.server_close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='CEX listing 只读查询服务')
+    parser.add_argument('--file', default=None,
+                        help=f"listing 数据文件（默认：{' 或 '.join(DEFAULT_FILES)}）")
+    parser.add_argument('--host', default='127.0.0.1', help='监听地址（默认：%(default)s）')
+    parser.add_argument('--port', type=int, default=8000, help='监听端口（默认：%(default)s）')
+    args = parser.parse_args()
+    serve(args.file or default_file(), args.host, args.port)
+
+
+if __name__ == '__main__':
+    main()
@@ -5,18 +5,47 @@ Telegram Channel Scraper for @news6551
 爬取公开频道的 CEX listing 信息
 """
 
+import argparse
 import asyncio
+import bisect
+import gzip
+import hashlib
 import json
+import os
 import re
+import shutil
+import sqlite3
+import sys
+import tempfile
+import time
+import zlib
+from collections import Counter, OrderedDict, deque
+from contextlib import contextmanager, nullcontext
+from concurrent.futures import Future, ProcessPoolExecutor, wait
 from datetime import datetime
 from pathlib import Path
 
+# 解析规则、Listing 记录和解析引擎在 listing_parser 中（只依赖标准库，可以单独导入）；
+# 这里重新导出，scraper.extract_listing_info 等用法不变
+import listing_parser
+from listing_parser import (  # noqa: F401
+    DELIST_KEYWORDS,
+    LISTING_KEYWORDS,
+    PURE_ACTIVITY_KEYWORDS,
+    Listing,
+    ListingClassifier,
+    _UNSET,
+    annotate_listings,
+    extract_listing_info,
+    listing_dict,
+)
+
+# telethon 只在连接 Telegram 时导入（import_telethon），离线解析、导出和统计不需要安装
+
 try:
-    from telethon import TelegramClient
-    from telethon.errors import SessionPasswordNeededError
+    import brotli  # 可选：安装后额外输出 .br 预压缩文件
 except ImportError:
-    print("请先安装 telethon: pip install telethon")
-    exit(1)
+    brotli = None
 
 # 尝试从配置文件导入
 try:
@@ -28,701 +57,2735 @@ except ImportError:
     CHANNEL_USERNAME = 'news6551'  # 频道用户名
     MESSAGE_LIMIT = 2000  # 默认获取2000条消息（增加以获取更多 Alpha Coin）
 
-# 会话文件
-SESSION_FILE = 'telegram_session.session'
+# 多频道（可选）：同时爬取的频道列表，同一个 listing 只保留一条
+try:
+    from config import CHANNELS
+except ImportError:
+    CHANNELS = [CHANNEL_USERNAME]
+
+try:
+    from config import CHANNEL_CONCURRENCY
+except ImportError:
+    CHANNEL_CONCURRENCY = 4  # 同时抓取的频道数
+
+# 并行解析配置（可选）
+try:
+    from config import EXTRACT_WORKERS, EXTRACT_CHUNK_SIZE
+except ImportError:
+    EXTRACT_WORKERS = 0  # 解析进程数，0 表示在当前进程串行解析
+    EXTRACT_CHUNK_SIZE = 200  # 每次分发给进程池的消息条数
+
+# 月份分片格式（可选）：compact 为字典编码（体积更小），json 为普通记录数组
+try:
+    from config import SHARD_FORMAT
+except ImportError:
+    SHARD_FORMAT = 'compact'
+
+# 历史回填（--backfill）：每页消息数、每多少页保存一次进度和已解析结果（可选）
+try:
+    from config import BACKFILL_PAGE_SIZE, BACKFILL_SAVE_EVERY
+except ImportError:
+    BACKFILL_PAGE_SIZE = 100
+    BACKFILL_SAVE_EVERY = 10
+
+# 并行回填（--parallel）：把消息 ID 空间切成多个范围同时获取；每个范围的页数、同时进行的请求数（可选）
+try:
+    from config import BACKFILL_PARALLEL
+except ImportError:
+    BACKFILL_PARALLEL = 1  # 1 表示逐页顺序获取
+try:
+    from config import BACKFILL_RANGE_PAGES
+except ImportError:
+    BACKFILL_RANGE_PAGES = 5
+
+# 守护模式（--watch）：第一个新 listing 到达后等待的秒数，期间到达的一起发布（可选）
+try:
+    from config import WATCH_DEBOUNCE
+except ImportError:
+    WATCH_DEBOUNCE = 5
+
+# 增量模式下重新检查检查点之前最近这么多条消息是否被编辑过，编辑过的重新解析（可选，0 表示不检查）
+try:
+    from config import EDIT_LOOKBACK
+except ImportError:
+    EDIT_LOOKBACK = 200
+
+# 增量模式下 data.js / cex_listings.json 只追加新记录，追加这么多次后整体重写一次（可选）
+try:
+    from config import COMPACT_EVERY
+except ImportError:
+    COMPACT_EVERY = 50
+
+# 会话文件
+SESSION_FILE = 'telegram_session.session'
+
+# 输出文件
+OUTPUT_JSON = 'cex_listings.json'
+OUTPUT_JS = 'data.js'
+
+# 按月分片输出（前端按需加载当前查看的月份）
+DATA_DIR = 'data'
+MANIFEST_FILE = 'manifest.json'
+COMPACT_FORMAT_VERSION = 1
+
+# 网页入口（发布时改写其中的数据清单和静态资源版本）
+INDEX_HTML = 'index.html'
+STATIC_ASSETS = ('script.js', 'style.css')
+
+# 解析结果缓存（可选）：相同内容的消息（转发、重复公告）只解析一次
+try:
+    from config import EXTRACT_CACHE_SIZE, EXTRACT_CACHE_FILE
+except ImportError:
+    EXTRACT_CACHE_SIZE = 10000  # 最多缓存的消息数，超出时淘汰最久未使用的
+    EXTRACT_CACHE_FILE = 'extract_cache.json'  # 增量运行之间保存缓存；设为空字符串则不保存
+
+# 运行指标（可选）：各阶段耗时和各条正则的命中统计，写入 JSON 或 Prometheus textfile（.prom）
+try:
+    from config import METRICS_FILE
+except ImportError:
+    METRICS_FILE = ''  # 为空时不收集（也可以用 --metrics 指定）
+
+# 原始消息缓存（SQLite）：抓取时保存完整消息文本，修改解析规则后用 parse 子命令离线重新解析
+try:
+    from config import MESSAGE_CACHE
+except ImportError:
+    MESSAGE_CACHE = 'messages.db'  # 设为空字符串则不缓存
+
+# listing 数据库（SQLite，可选）：每次运行只写入新增或替换的记录，可以按日期、交易所做范围查询，
+# 输出文件可以用 export 子命令从数据库重新生成。可以与 MESSAGE_CACHE 使用同一个文件
+try:
+    from config import LISTING_DB
+except ImportError:
+    LISTING_DB = ''  # 为空时不使用
+
+# 增量爬取检查点（每个频道最后处理的消息 ID）
+CHECKPOINT_FILE = 'scraper_state.json'
+
+
+# 解析时代替消息发布日期的占位符：缓存的结果与发布日期无关，取出时再换成实际日期
+_MESSAGE_DATE = '\0message_date'
+
+
+class ExtractionCache:
+    """
+    extract_listing_info 前的 LRU 缓存，键为规范化文本（去掉末尾空白）的哈希
+    
+    - 预筛就能排除的消息（绝大多数）不进入缓存
+    - 缓存的 listing 不保存 text 字段的内容，日期依赖发布日期时保存占位符，取出时换成
+      当前消息的原文和发布日期，所以结果与直接调用 extract_listing_info 相同
+    - 超过 maxsize 时淘汰最久未使用的条目
+    """
+
+    def __init__(self, maxsize=EXTRACT_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()  # 文本哈希 -> (listing, ...)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def extract(self, text, message_date=None):
+        """同 extract_listing_info(text, message_date)"""
+        classifier = listing_parser._CLASSIFIER  # 启用指标时会被替换为带统计的引擎
+        if not classifier.is_candidate(text.lower()):
+            return []
+        normalized = text.rstrip()
+        key = hashlib.blake2b(normalized.encode('utf-8'), digest_size=16).hexdigest()
+        cached = self._entries.get(key)
+        if cached is None:
+            self.misses += 1
+            cached = tuple(classifier.extract(normalized, _MESSAGE_DATE))
+            for listing in cached:
+                listing.text = None
+            self._entries[key] = cached
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        else:
+            self.hits += 1
+            self._entries.move_to_end(key)
+        
+        listings = []
+        notes = text[:300]
+        for listing in cached:
+            listing = listing.copy()
+            listing.text = notes
+            if listing['date'] == _MESSAGE_DATE:
+                if not message_date:
+                    # 与 extract_listing_info 一致：需要发布日期但没有时整条消息跳过
+                    return []
+                listing['date'] = message_date
+            listings.append(listing)
+        return listings
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        rate = self.hits / lookups if lookups else 0.0
+        return (f"解析缓存：命中 {self.hits}，未命中 {self.misses}（命中率 {rate:.0%}），"
+                f"淘汰 {self.evictions}，当前 {len(self)} 条")
+
+    @staticmethod
+    def rules_version():
+        """解析规则的版本：listing_parser.py 和本文件内容的哈希，规则或代码有任何改动时旧缓存作废"""
+        return content_hash(Path(listing_parser.__file__).read_bytes() + Path(__file__).read_bytes())
+
+    def load(self, path=None):
+        """读取保存的缓存；规则版本不同或文件无效时忽略"""
+        path = Path(path or EXTRACT_CACHE_FILE)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            return
+        if saved.get('rules') != self.rules_version():
+            print(f"解析规则已变更，忽略旧的 {path.name}")
+            return
+        for key, listings in saved.get('entries', [])[-self.maxsize:]:
+            self._entries[key] = tuple(map(Listing.from_dict, listings))
+
+    def save(self, path=None):
+        """按最近使用顺序保存缓存"""
+        payload = {
+            'rules': self.rules_version(),
+            'entries': [[key, [listing.to_dict() for listing in listings]]
+                        for key, listings in self._entries.items()],
+        }
+        atomic_write(path or EXTRACT_CACHE_FILE, json.dumps(payload, ensure_ascii=False, separators=(',', ':')))
+
+
+_EXTRACT_CACHE = ExtractionCache()
+
+
+def load_extract_cache():
+    """增量运行开始时读取保存的解析缓存"""
+    if EXTRACT_CACHE_FILE:
+        _EXTRACT_CACHE.load()
+
+
+def save_extract_cache(persist=True):
+    """运行结束时输出命中统计；persist 为 True 时保存缓存供下次增量运行使用"""
+    print(_EXTRACT_CACHE.stats())
+    if persist and EXTRACT_CACHE_FILE:
+        _EXTRACT_CACHE.save()
+
+
+class Metrics:
+    """
+    运行指标：各阶段的耗时和条目数、各条正则的调用/命中次数和累计耗时、计数器
+    
+    只有启用（enable_metrics）时才创建；未启用时各记录点只判断 METRICS is None，
+    解析引擎使用未包装的正则，几乎没有额外开销。
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.started_at = datetime.now().isoformat(timespec='seconds')
+        self.stages = {}  # 阶段 -> {'seconds': 累计耗时, 'items': 条目数}
+        self.patterns = {}  # 正则名 -> [正则, 调用次数, 命中次数, 累计耗时]
+        self.counters = {}
+
+    def add_stage(self, name, seconds, items=0):
+        stage = self.stages.setdefault(name, {'seconds': 0.0, 'items': 0})
+        stage['seconds'] += seconds
+        stage['items'] += items
+
+    @contextmanager
+    def stage(self, name, items=0):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_stage(name, time.perf_counter() - started, items)
+
+    def count(self, name, value=1):
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    def pattern_entry(self, name, pattern):
+        return self.patterns.setdefault(name, [pattern, 0, 0, 0.0])
+
+    def report(self):
+        """机器可读的报告（字典）"""
+        return {
+            'started_at': self.started_at,
+            'elapsed': time.perf_counter() - self.started,
+            'stages': self.stages,
+            'counters': self.counters,
+            # 按累计耗时排序，方便找出最贵的规则；hits 为 0 的规则可以考虑删除
+            'patterns': [
+                {'name': name, 'pattern': pattern, 'calls': calls, 'hits': hits, 'seconds': seconds}
+                for name, (pattern, calls, hits, seconds) in sorted(
+                    self.patterns.items(), key=lambda item: item[1][3], reverse=True)
+            ],
+        }
+
+    def to_prometheus(self):
+        """Prometheus textfile 格式（供 node_exporter 的 textfile collector 读取）"""
+        def label(value):
+            return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+        report = self.report()
+        lines = [
+            '# HELP cex_scraper_run_seconds Wall time of the last run.',
+            '# TYPE cex_scraper_run_seconds gauge',
+            f"cex_scraper_run_seconds {report['elapsed']:.6f}",
+            '# HELP cex_scraper_last_run_timestamp_seconds Unix time the last run finished.',
+            '# TYPE cex_scraper_last_run_timestamp_seconds gauge',
+            f"cex_scraper_last_run_timestamp_seconds {time.time():.0f}",
+            '# HELP cex_scraper_stage_seconds Time spent in each stage.',
+            '# TYPE cex_scraper_stage_seconds gauge',
+        ]
+        lines += [f'cex_scraper_stage_seconds{{stage="{label(name)}"}} {stage["seconds"]:.6f}'
+                  for name, stage in report['stages'].items()]
+        lines += ['# HELP cex_scraper_stage_items Items processed by each stage.',
+                  '# TYPE cex_scraper_stage_items gauge']
+        lines += [f'cex_scraper_stage_items{{stage="{label(name)}"}} {stage["items"]}'
+                  for name, stage in report['stages'].items()]
+        lines += ['# HELP cex_scraper_counter Run counters.', '# TYPE cex_scraper_counter gauge']
+        lines += [f'cex_scraper_counter{{name="{label(name)}"}} {value}'
+                  for name, value in report['counters'].items()]
+        for metric, field, help_text in (
+            ('cex_scraper_pattern_calls', 'calls', 'Times each extraction regex was evaluated.'),
+            ('cex_scraper_pattern_hits', 'hits', 'Times each extraction regex matched.'),
+            ('cex_scraper_pattern_seconds', 'seconds', 'Cumulative time spent in each extraction regex.'),
+        ):
+            lines += [f'# HELP {metric} {help_text}', f'# TYPE {metric} gauge']
+            lines += [f'{metric}{{name="{label(entry["name"])}"}} {entry[field]}' for entry in report['patterns']]
+        return '\n'.join(lines) + '\n'
+
+    def write(self, path):
+        """写出报告：.prom 为 Prometheus textfile，其余为 JSON"""
+        if str(path).endswith('.prom'):
+            atomic_write(path, self.to_prometheus())
+        else:
+            atomic_write(path, json.dumps(self.report(), ensure_ascii=False, indent=2))
+
+    def print_summary(self, top=5):
+        print("\n各阶段耗时：")
+        for name, stage in self.stages.items():
+            print(f"  {name:<20}{stage['seconds']:>10.3f}s{stage['items']:>10}")
+        patterns = self.report()['patterns']
+        if patterns:
+            print(f"最耗时的 {min(top, len(patterns))} 条规则：")
+            for entry in patterns[:top]:
+                print(f"  {entry['name']:<28}{entry['seconds']:>10.4f}s  调用 {entry['calls']}  命中 {entry['hits']}")
+            dead = [entry['name'] for entry in patterns if entry['calls'] and not entry['hits']]
+            if dead:
+                more = f" 等 {len(dead)} 条" if len(dead) > 10 else ''
+                print(f"从未命中的规则：{', '.join(dead[:10])}{more}（完整列表见指标报告）")
+
+
+class _TimedPattern:
+    """记录调用次数、命中次数和耗时的正则包装（只在启用指标时使用）"""
+
+    __slots__ = ('_pattern', '_entry')
+
+    def __init__(self, pattern, entry):
+        self._pattern = pattern
+        self._entry = entry
+
+    @property
+    def pattern(self):
+        return self._pattern.pattern
+
+    @property
+    def groups(self):
+        return self._pattern.groups
+
+    def _record(self, started, hit):
+        entry = self._entry
+        entry[1] += 1
+        entry[3] += time.perf_counter() - started
+        if hit:
+            entry[2] += 1
+
+    def search(self, *args):
+        started = time.perf_counter()
+        match = self._pattern.search(*args)
+        self._record(started, match is not None)
+        return match
+
+    def findall(self, *args):
+        started = time.perf_counter()
+        result = self._pattern.findall(*args)
+        self._record(started, bool(result))
+        return result
+
+
+class _TimedAny:
+    """
+    代替 _compile_any 合并后的正则，逐个关键词匹配并分别统计（只在启用指标时使用）
+    search 的结果与合并后的正则等价（只用于判断是否匹配）
+    """
+
+    def __init__(self, name, keywords, metrics):
+        self._patterns = [
+            _TimedPattern(re.compile(keyword), metrics.pattern_entry(f"{name}:{keyword}", keyword))
+            for keyword in keywords
+        ]
+
+    def search(self, string):
+        first = None
+        for pattern in self._patterns:
+            match = pattern.search(string)
+            if first is None:
+                first = match
+        return first
+
+
+def instrument_classifier(classifier, metrics):
+    """把解析引擎中的全部正则换成带统计的包装，返回该引擎"""
+    keyword_lists = {
+        'listing_filter': LISTING_KEYWORDS,
+        'delist_filter': DELIST_KEYWORDS,
+        'pure_activity': PURE_ACTIVITY_KEYWORDS,
+    }
+    for attr, value in list(vars(classifier).items()):
+        if attr in keyword_lists:
+            setattr(classifier, attr, _TimedAny(attr, keyword_lists[attr], metrics))
+        elif isinstance(value, re.Pattern):
+            setattr(classifier, attr, _TimedPattern(value, metrics.pattern_entry(attr, value.pattern)))
+        elif isinstance(value, list):
+            wrapped = []
+            for i, item in enumerate(value):
+                pattern, extra = (item[0], item[1:]) if isinstance(item, tuple) else (item, None)
+                timed = _TimedPattern(pattern, metrics.pattern_entry(f"{attr}[{i}]", pattern.pattern))
+                wrapped.append((timed, *extra) if extra is not None else timed)
+            setattr(classifier, attr, wrapped)
+    return classifier
+
+
+METRICS = None
+_NO_TIMER = nullcontext()
+
+
+def enable_metrics():
+    """启用指标收集：之后的解析使用带统计的解析引擎"""
+    global METRICS
+    METRICS = Metrics()
+    listing_parser._CLASSIFIER = instrument_classifier(ListingClassifier(), METRICS)
+    return METRICS
+
+
+def timed(name, items=0):
+    """记录一段代码的耗时；未启用指标时返回空的上下文管理器"""
+    return _NO_TIMER if METRICS is None else METRICS.stage(name, items)
+
+
+def write_metrics(path):
+    """运行结束时写出指标报告"""
+    if METRICS is None:
+        return
+    cache = _EXTRACT_CACHE
+    METRICS.counters.update({
+        'extract_cache_hits': cache.hits,
+        'extract_cache_misses': cache.misses,
+        'extract_cache_evictions': cache.evictions,
+    })
+    METRICS.print_summary()
+    METRICS.write(path)
+    print(f"✓ 指标已写入 {path}")
+
+
+@contextmanager
+def atomic_open(path, copy_existing=False):
+    """
+    原子写入：先写同目录下的临时文件再 os.replace，
+    并发的部署或浏览器请求不会读到写了一半的文件
+    
+    Args:
+        path: 目标文件
+        copy_existing: 先把目标文件复制到临时文件（用于追加写入），调用方自行 seek
+    
+    Yields:
+        临时文件的二进制句柄
+    """
+    path = Path(path)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f'.{path.name}.', suffix='.tmp')
+    try:
+        if copy_existing:
+            os.close(fd)
+            shutil.copyfile(path, tmp_path)
+            f = open(tmp_path, 'r+b')
+        else:
+            f = os.fdopen(fd, 'wb')
+        with f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def atomic_write(path, data):
+    """原子写入整个文件"""
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    with atomic_open(path) as f:
+        f.write(data)
+
+
+def precompress(path):
+    """
+    为已写好的文件生成 gzip（以及安装了 brotli 时的 brotli）预压缩版本，流式读取
+    
+    只有能直接发送预压缩文件的服务器（nginx gzip_static 等）会用到；Vercel 自己压缩响应，不使用这些文件
+    """
+    with open(path, 'rb') as src, atomic_open(f"{path}.gz") as dst:
+        with gzip.GzipFile(filename='', mode='wb', compresslevel=9, fileobj=dst, mtime=0) as gz:
+            shutil.copyfileobj(src, gz)
+    if brotli is not None:
+        compressor = brotli.Compressor()
+        with open(path, 'rb') as src, atomic_open(f"{path}.br") as dst:
+            for chunk in iter(lambda: src.read(1 << 16), b''):
+                dst.write(compressor.process(chunk))
+            dst.write(compressor.finish())
+
+
+def publish_file(path, data):
+    """原子写入文件并生成预压缩版本"""
+    atomic_write(path, data)
+    precompress(path)
+
+
+def content_hash(data, length=16):
+    """内容哈希，用于带哈希的文件名和缓存版本"""
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    return hashlib.sha256(data).hexdigest()[:length]
+
+
+def load_checkpoint():
+    """读取增量爬取的检查点（每个频道最后处理的消息 ID）"""
+    path = Path(CHECKPOINT_FILE)
+    if not path.exists():
+        return {}
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"⚠️ 警告：检查点文件 {CHECKPOINT_FILE} 无法读取（{e}），将执行完整爬取")
+        return {}
+
+
+def save_checkpoint(checkpoint):
+    """保存检查点"""
+    atomic_write(CHECKPOINT_FILE, json.dumps(checkpoint, ensure_ascii=False, indent=2))
+
+
+def load_existing_listings(object_hook=None):
+    """
+    读取上次输出的 listing（增量模式下与新数据合并）
+    
+    Args:
+        object_hook: 传给 json.load，读取时逐条转换记录（如转换为 Listing）
+    """
+    path = Path(OUTPUT_JSON)
+    if not path.exists():
+        return []
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f, object_hook=object_hook)
+    except (OSError, ValueError) as e:
+        print(f"⚠️ 警告：{OUTPUT_JSON} 无法读取（{e}），将重新生成")
+        return []
+
+
+def listing_key(listing):
+    """去重键：(日期, 代币, 交易所, 类型)"""
+    if type(listing) is Listing and _UNSET not in (listing.date, listing.token, listing.exchange, listing.type):
+        # 热点路径：直接读取字段
+        return (listing.date, sys.intern(listing.token.upper()), listing.exchange.lower(), listing.type)
+    return (
+        listing.get('date', ''),
+        # 驻留：代币已经是大写时与 listing 中的 token 是同一个对象
+        sys.intern(listing.get('token', '').upper()),
+        listing['exchange'].lower(),
+        listing.get('type', 'spot'),
+    )
+
+
+def collect_message_listings(message_id, msg_date, text, source=None):
+    """
+    解析单条消息，返回附带消息 ID、发布日期和来源频道的 listing 列表
+    
+    Args:
+        message_id: 消息 ID
+        msg_date: 消息发布日期（YYYY-MM-DD），用于 Alpha Coin 等没有明确日期的消息
+        text: 消息文本
+        source: 来源频道（离线回放等没有来源时为 None）
+    """
+    return annotate_listings(_EXTRACT_CACHE.extract(text, message_date=msg_date), message_id, msg_date, source)
+
+
+class ChunkedExtractor:
+    """
+    按块把消息分发到进程池解析，结果按提交顺序取回
+    
+    workers 为 0 时在当前进程逐条解析（不启动进程池）。
+    在途的块最多 workers * 2 个，调用方在 backlogged 时等待最早的块，
+    这样内存有上限，抓取也不会被解析阻塞。
+    """
+
+    def __init__(self, workers=0, chunk_size=EXTRACT_CHUNK_SIZE):
+        self.executor = ProcessPoolExecutor(max_workers=workers) if workers > 0 else None
+        self.chunk_size = max(1, chunk_size) if self.executor else 1
+        self.max_in_flight = max(2, workers * 2)
+        self._buffer = []
+        self._pending = deque()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        if self.executor:
+            self.executor.shutdown(cancel_futures=True)
+
+    @property
+    def backlogged(self):
+        """在途的块是否已达上限"""
+        return len(self._pending) >= self.max_in_flight
+
+    def submit(self, message_id, msg_date, text, source=None):
+        """提交一条消息，凑满一块后分发"""
+        self._buffer.append((message_id, msg_date, text, source))
+        if len(self._buffer) >= self.chunk_size:
+            self.flush()
+
+    def flush(self):
+        """分发缓冲区中不满一块的消息"""
+        if not self._buffer:
+            return
+        chunk, self._buffer = self._buffer, []
+        if self.executor:
+            # 进程中直接用解析引擎（listing_parser._extract_chunk），不经过本进程的解析缓存
+            future = self.executor.submit(listing_parser._extract_chunk, chunk)
+        else:
+            future = Future()
+            future.set_result([
+                (message_id, collect_message_listings(message_id, msg_date, text, source))
+                for message_id, msg_date, text, source in chunk
+            ])
+        self._pending.append(future)
+
+    def pop_ready(self):
+        """按提交顺序取回已经完成的块，返回 [(message_id, listings), ...]"""
+        results = []
+        while self._pending and self._pending[0].done():
+            results.extend(self._pending.popleft().result())
+        return results
+
+    def wait_oldest(self):
+        """阻塞等待最早提交的块完成"""
+        if self._pending:
+            wait([self._pending[0]])
+
+    async def wait_oldest_async(self):
+        """等待最早提交的块完成（不阻塞事件循环）"""
+        if self._pending:
+            await asyncio.wrap_future(self._pending[0])
+
+    def drain(self):
+        """分发剩余消息，阻塞取回全部结果"""
+        self.flush()
+        results = []
+        while self._pending:
+            results.extend(self._pending.popleft().result())
+        return results
+
+    async def drain_async(self):
+        """分发剩余消息，异步取回全部结果"""
+        self.flush()
+        results = []
+        while self._pending:
+            await self.wait_oldest_async()
+            results.extend(self.pop_ready())
+        return results
+
+
+# 交易所名称统一为英文（避免中英文重复）
+EXCHANGE_CANONICAL_NAMES = {
+    '币安': 'Binance',
+    '欧易': 'OKX',
+    '火币': 'Huobi',
+    'Gate': 'Gate',
+    '库币': 'KuCoin',
+}
+
+# token_display 括号内的代码，如 "BOB (BOBBOB)" -> "BOBBOB"
+_BRACKET_CODE = re.compile(r'\(([A-Z0-9]+)\)')
+_BRACKET = re.compile(r'\([^)]+\)')
+
+
+def canonicalize_listing(listing):
+    """
+    原地规范化一条 listing 的交易所名称和代币代码，返回该 listing
+    
+    代币名称处理 BOBBOB/BOB 这种情况：如果显示名称包含括号，优先使用括号内的代码，
+    并确保显示名称括号内是规范化后的代码
+    """
+    exchange = listing.get('exchange', '')
+    if exchange in EXCHANGE_CANONICAL_NAMES:
+        listing['exchange'] = EXCHANGE_CANONICAL_NAMES[exchange]
+    
+    token = listing.get('token', '').upper()
+    token_display = listing.get('token_display', token)
+    if token_display and '(' in token_display:
+        match = _BRACKET_CODE.search(token_display)
+        if match and match.group(1) != token:
+            normalized = match.group(1)
+            listing['token'] = normalized
+            listing['token_display'] = _BRACKET.sub(f'({normalized})', token_display)
+    return listing
+
+
+def _is_valid_date(date):
+    return bool(date) and len(date) == 10 and date.count('-') == 2
+
+
+def _first_seen_rank(listing):
+    """
+    同一个键的记录中保留最早发布的：先比较发布日期，不同频道同一天发布时按频道名，
+    同一频道内按 message_id（频道内 ID 随时间递增）；没有 message_id 的排在最后
+    """
+    if type(listing) is Listing:
+        # 热点路径：直接读取字段
+        message_id, message_date, source = listing.message_id, listing.message_date, listing.source
+        if message_id is _UNSET:
+            message_id = None
+        if message_date is _UNSET:
+            message_date = None
+        if source is _UNSET:
+            source = None
+    else:
+        message_id = listing.get('message_id')
+        message_date, source = listing.get('message_date'), listing.get('source')
+    return (message_id is None, message_date or '', source or CHANNEL_USERNAME, message_id or 0)
+
+
+class ListingIndex:
+    """
+    listing 去重索引，键为 (日期, 代币, 交易所, 类型)
+    
+    - 每条记录在加入时只规范化一次
+    - 同一个键保留最早的消息（message_id 最小）的记录和 notes，与消息到达顺序无关
+    - 记录按日期保持有序，合并新记录只需要 O(新增) 的工作，不需要重新处理已有数据
+    
+    增量模式下用 ListingIndex.load() 从上次输出的 cex_listings.json 恢复索引。
+    消息被编辑时用 replace_message() 替换由这条消息得到的记录。
+    """
+
+    def __init__(self, listings=()):
+        self._records = {}  # key -> listing
+        self._order = []  # 按日期有序的 (date, seq, key)
+        self._seq = 0
+        self._by_message = None  # (频道, message_id) -> 以该消息为准的键集合；第一次替换时才建立
+        for listing in listings:
+            self.add(listing)
+
+    @classmethod
+    def load(cls):
+        """
+        恢复上次的索引（已有记录已经规范化，不再重复处理）
+        启用了 LISTING_DB 且数据库不为空时从数据库读取，否则读取 cex_listings.json
+        """
+        index = cls()
+        notes = {}  # 同一条消息的多条 listing 共享一个 text
+        
+        def restore(record):
+            return Listing.from_dict(record, notes)
+        
+        with timed('load'):
+            with open_listing_db() as db:
+                if db is not None and len(db):
+                    listings = map(restore, db.iter_listings())
+                else:
+                    # 读取时逐条转换，不需要先构建全部的 dict
+                    listings = load_existing_listings(object_hook=restore)
+                for listing in listings:
+                    index.add(listing, canonical=True)
+        return index
+
+    def __len__(self):
+        return len(self._records)
+
+    def __contains__(self, key):
+        return key in self._records
+
+    def get(self, key):
+        return self._records.get(key)
+
+    def add(self, listing, canonical=False):
+        """
+        加入一条 listing
+        
+        Args:
+            listing: listing 字典（会被原地规范化）
+            canonical: 记录已经规范化过（如从输出文件加载）时跳过规范化
+        
+        Returns:
+            True 表示新增了键或替换了已有记录，False 表示重复或日期无效
+        """
+        if not _is_valid_date(listing.get('date', '')):
+            return False
+        if not canonical:
+            canonicalize_listing(listing)
+        key = listing_key(listing)
+        current = self._records.get(key)
+        if current is None:
+            self._records[key] = listing
+            self._seq += 1
+            entry = (key[0], self._seq, key)
+            if not self._order or self._order[-1] <= entry:
+                self._order.append(entry)
+            else:
+                bisect.insort(self._order, entry)
+            if self._by_message is not None:
+                self._link(key, listing)
+            return True
+        if _first_seen_rank(listing) < _first_seen_rank(current):
+            self._records[key] = listing
+            if self._by_message is not None:
+                self._unlink(key, current)
+                self._link(key, listing)
+            return True
+        return False
+
+    @staticmethod
+    def _message_of(listing):
+        message_id = listing.get('message_id')
+        return None if message_id is None else (listing.get('source') or CHANNEL_USERNAME, message_id)
+
+    def _link(self, key, listing):
+        message = self._message_of(listing)
+        if message is not None:
+            self._by_message.setdefault(message, set()).add(key)
+
+    def _unlink(self, key, listing):
+        keys = self._by_message.get(self._message_of(listing))
+        if keys is not None:
+            keys.discard(key)
+
+    def _remove(self, key):
+        """删除一个键，返回被删除的记录"""
+        listing = self._records.pop(key)
+        # 同一天的记录不多，在当天的范围内查找
+        position = bisect.bisect_left(self._order, (key[0],))
+        while self._order[position][2] != key:
+            position += 1
+        del self._order[position]
+        return listing
+
+    def replace_message(self, source, message_id, listings):
+        """
+        消息被编辑后，用重新解析的结果替换由这条消息得到的记录
+        
+        - 编辑后仍然存在的键原地更新（保持原来的顺序）
+        - 编辑后不再存在的键被删除
+        - 新出现的键按 add() 的规则加入（已有更早的消息时不替换）
+        
+        只删除以这条消息为准的记录；如果还有其他消息公告过被删除的键，重新解析（parse）时会恢复。
+        
+        Returns:
+            (新增或替换的 listing, 被删除的 listing)
+        """
+        if self._by_message is None:
+            self._by_message = {}
+            for key, record in self._records.items():
+                self._link(key, record)
+        old_keys = self._by_message.pop((source or CHANNEL_USERNAME, message_id), set())
+        changed = []
+        kept = set()
+        for listing in listings:
+            if not _is_valid_date(listing.get('date', '')):
+                continue
+            canonicalize_listing(listing)
+            key = listing_key(listing)
+            if key in old_keys and key not in kept:
+                self._records[key] = listing
+                self._link(key, listing)
+                changed.append(listing)
+            elif self.add(listing, canonical=True):
+                changed.append(listing)
+            kept.add(key)
+        removed = [self._remove(key) for key in sorted(old_keys - kept)]
+        return changed, removed
+
+    def listings(self):
+        """按日期排序的全部 listing（同一天内按加入顺序）"""
+        return [self._records[key] for _, _, key in self._order]
+
+
+def dedup_listings(all_listings):
+    """规范化并去重（基于日期、代币、交易所和类型），返回按日期排序的结果"""
+    return ListingIndex(all_listings).listings()
+
+
+def _can_append(watermark, listings, new_listings):
+    """
+    能否只追加新记录：已发布的文件与索引一致且新记录都是新增的键（条数正好增加
+    len(new_listings)，说明没有替换已有记录），新记录都来自比同一频道的水位线更新的消息
+    （否则是旧消息重新解析出的记录，应该整体重写），且距上次整体重写的追加次数未到 COMPACT_EVERY
+    
+    消息 ID 只在同一个频道内可以比较，水位线按来源频道分别记录
+    """
+    if not watermark or not new_listings or watermark['appends'] + 1 >= COMPACT_EVERY:
+        return False
+    message_ids = watermark.get('message_ids')
+    if message_ids is None:
+        # 旧格式的水位线只有一个全局的 message_id
+        return False
+    if any((listing.get('message_id') or 0) <= message_ids.get(listing.get('source') or '', 0)
+           for listing in new_listings):
+        return False
+    return watermark['count'] + len(new_listings) == len(listings)
+
+
+def save_outputs(listings, new_listings=None):
+    """
+    发布全部输出：JSON、data.js、月份分片和清单，最后改写 index.html 中的引用
+    
+    所有文件都是原子替换的；分片和清单使用带内容哈希的文件名，
+    index.html 最后更新，所以读者总能看到一套完整一致的数据
+    
+    Args:
+        listings: 按日期排序的全部 listing
+        new_listings: 增量模式下本次新增的 listing。可以追加时 JSON 和 data.js
+            只在末尾追加这些记录（不再按日期排序），每 COMPACT_EVERY 次整体重写一次；
+            月份分片只重新生成这些记录所在的月份
+    """
+    watermark = read_data_js_watermark() if new_listings else None
+    changed_months = None
+    if _can_append(watermark, listings, new_listings) and append_listings_json(new_listings):
+        with timed('write.data_js', len(new_listings)):
+            append_data_js(new_listings, watermark)
+        print(f"✓ 已追加 {len(new_listings)} 条到 {OUTPUT_JSON} 和 {OUTPUT_JS}")
+        changed_months = {listing['date'][:7] for listing in new_listings}
+    else:
+        with timed('write.json', len(listings)):
+            write_listings_json(listings)
+        print(f"✓ 已保存到 {OUTPUT_JSON}")
+        with timed('write.data_js', len(listings)):
+            update_data_js(listings)
+        print(f"✓ 已更新 {OUTPUT_JS}")
+    # 预压缩单独计时，data.js 的写入耗时不受压缩级别影响
+    with timed('write.precompress'):
+        precompress(OUTPUT_JS)
+    
+    with timed('write.shards', len(listings)):
+        manifest = export_month_shards(listings, changed_months=changed_months)
+    if changed_months is None:
+        print(f"✓ 已更新 {DATA_DIR}/ 下的 {len(manifest['months'])} 个月份分片")
+    else:
+        print(f"✓ 已更新 {DATA_DIR}/ 下的 {len(changed_months)} 个月份分片")
+    
+    with timed('write.index_html'):
+        updated = update_index_html(manifest['file'])
+    if updated:
+        print(f"✓ 已更新 {INDEX_HTML} 中的引用")
+
+
+def merge_and_save(index, changed_listings, incremental=False, removed_listings=()):
+    """
+    写出索引中的全部 listing
+    
+    Args:
+        index: ListingIndex（增量模式下包含已有数据）
+        changed_listings: 本次新增或替换的 listing
+        incremental: 增量模式。没有新增、替换或删除时不重写输出文件
+        removed_listings: 本次删除的 listing（消息编辑后不再包含的记录）。有删除时整体重写
+    """
+    if incremental:
+        removed = f"，删除 {len(removed_listings)} 个" if removed_listings else ''
+        print(f"新增 {len(changed_listings)} 个 listing{removed}（共 {len(index)} 个）\n")
+        changed = bool(changed_listings) or bool(removed_listings) or not Path(OUTPUT_JSON).exists()
+    else:
+        print(f"去重后剩余 {len(index)} 个 listing\n")
+        changed = True
+    
+    with timed('sort', len(index)):
+        unique_listings = index.listings()
+    if changed:
+        save_outputs(unique_listings, changed_listings if incremental and not removed_listings else None)
+        sync_listing_db(unique_listings, changed_listings, incremental, removed_listings)
+    else:
+        print("没有新增 listing，跳过写入")
+    
+    return unique_listings
+
+
+# ---------------------------------------------------------------------------
+# 抓取 → 解析 → 去重 → 输出 流水线
+# 各阶段通过有界 asyncio.Queue 连接，下游处理不过来时上游自动等待（背压），
+# 内存占用与消息总数无关
+# ---------------------------------------------------------------------------
+
+PIPELINE_QUEUE_SIZE = 1000  # 每个队列最多缓存的条目数
+
+_END = object()  # 流水线结束标记
+
+
+class StageStats:
+    """单个阶段的吞吐统计"""
+
+    def __init__(self, name):
+        self.name = name
+        self.items = 0  # 处理的条目数
+        self.elapsed = 0.0  # 阶段总耗时
+        self.wait_in = 0.0  # 等待上游（输入队列为空）的时间
+        self.wait_out = 0.0  # 等待下游（输出队列已满）的时间
+
+    @property
+    def busy(self):
+        """实际处理时间（总耗时减去排队等待）"""
+        return max(0.0, self.elapsed - self.wait_in - self.wait_out)
+
+    @property
+    def rate(self):
+        return self.items / self.busy if self.busy else 0.0
+
+    async def get(self, queue):
+        started = time.perf_counter()
+        item = await queue.get()
+        self.wait_in += time.perf_counter() - started
+        return item
+
+    async def put(self, queue, item):
+        started = time.perf_counter()
+        await queue.put(item)
+        self.wait_out += time.perf_counter() - started
+
+
+class ListSink:
+    """默认输出阶段：收集本次新增或替换的 listing"""
+
+    def __init__(self):
+        self.listings = []
+
+    def add(self, listing):
+        self.listings.append(listing)
+
+    def close(self):
+        pass
+
+
+async def _iterate(iterable):
+    """把同步迭代器包装为异步迭代器，作为流水线的消息源"""
+    for item in iterable:
+        yield item
+
+
+async def fetch_stage(source, out_queue, stats):
+    """抓取阶段：从消息源读取 (message_id, msg_date, text[, source])"""
+    started = time.perf_counter()
+    async for message in source:
+        stats.items += 1
+        await stats.put(out_queue, message)
+    await stats.put(out_queue, _END)
+    stats.elapsed = time.perf_counter() - started
+
+
+async def parse_stage(in_queue, out_queue, extractor, stats):
+    """解析阶段：交给 ChunkedExtractor 解析，按消息顺序输出 (message_id, listings)"""
+    started = time.perf_counter()
+    while True:
+        item = await stats.get(in_queue)
+        if item is _END:
+            break
+        extractor.submit(*item)
+        if extractor.backlogged:
+            await extractor.wait_oldest_async()
+        for result in extractor.pop_ready():
+            stats.items += 1
+            await stats.put(out_queue, result)
+    for result in await extractor.drain_async():
+        stats.items += 1
+        await stats.put(out_queue, result)
+    await stats.put(out_queue, _END)
+    stats.elapsed = time.perf_counter() - started
+
+
+async def dedup_stage(in_queue, out_queue, index, stats):
+    """去重阶段：加入 ListingIndex，只把新增或替换的 listing 交给下游"""
+    started = time.perf_counter()
+    while True:
+        item = await stats.get(in_queue)
+        if item is _END:
+            break
+        message_id, listings = item
+        if not listings:
+            continue
+        stats.items += len(listings)
+        print(f"✓ 找到 {len(listings)} 个 listing (消息 #{message_id})")
+        for listing in listings:
+            if index.add(listing):
+                await stats.put(out_queue, listing)
+    await stats.put(out_queue, _END)
+    stats.elapsed = time.perf_counter() - started
+
+
+async def sink_stage(in_queue, sink, stats):
+    """输出阶段：把新增或替换的 listing 交给 sink"""
+    started = time.perf_counter()
+    while True:
+        listing = await stats.get(in_queue)
+        if listing is _END:
+            break
+        stats.items += 1
+        sink.add(listing)
+    sink.close()
+    stats.elapsed = time.perf_counter() - started
+
+
+def print_pipeline_stats(stats):
+    """打印各阶段吞吐，处理时间最长的阶段即瓶颈"""
+    print("\n流水线各阶段统计：")
+    print(f"  {'阶段':<8}{'条目':>8}{'处理(s)':>10}{'条/秒':>10}{'等上游(s)':>11}{'等下游(s)':>11}")
+    for stage in stats:
+        print(f"  {stage.name:<8}{stage.items:>8}{stage.busy:>10.3f}{stage.rate:>10.0f}"
+              f"{stage.wait_in:>11.3f}{stage.wait_out:>11.3f}")
+    bottleneck = max(stats, key=lambda stage: stage.busy)
+    print(f"  瓶颈阶段：{bottleneck.name}\n")
+
+
+async def run_pipeline(source, index=None, workers=EXTRACT_WORKERS, chunk_size=EXTRACT_CHUNK_SIZE,
+                       sink=None, queue_size=PIPELINE_QUEUE_SIZE):
+    """
+    运行 抓取 → 解析 → 去重 → 输出 流水线
+    
+    Args:
+        source: 异步迭代器，产出 (message_id, msg_date, text)
+        index: ListingIndex（增量模式下包含已有数据），默认新建
+        workers: 解析进程数，0 表示串行
+        chunk_size: 每次分发给进程池的消息条数
+        sink: 输出阶段，需要提供 add(listing) 和 close()，默认收集到列表
+        queue_size: 阶段之间队列的容量
+    
+    Returns:
+        (sink, [StageStats, ...])
+    """
+    if sink is None:
+        sink = ListSink()
+    if index is None:
+        index = ListingIndex()
+    
+    stats = [StageStats(name) for name in ('fetch', 'parse', 'dedup', 'sink')]
+    messages, results, listings = (asyncio.Queue(maxsize=queue_size) for _ in range(3))
+    
+    with ChunkedExtractor(workers, chunk_size) as extractor:
+        tasks = [
+            asyncio.ensure_future(fetch_stage(source, messages, stats[0])),
+            asyncio.ensure_future(parse_stage(messages, results, extractor, stats[1])),
+            asyncio.ensure_future(dedup_stage(results, listings, index, stats[2])),
+            asyncio.ensure_future(sink_stage(listings, sink, stats[3])),
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            # 任一阶段失败时取消其余阶段，避免它们永远阻塞在队列上
+            for task in tasks:
+                task.cancel()
+            raise
+    
+    print_pipeline_stats(stats)
+    if METRICS is not None:
+        # 解析阶段即 extract；使用实际处理时间，不含排队等待
+        for stage, name in zip(stats, ('fetch', 'extract', 'dedup', 'sink')):
+            METRICS.add_stage(name, stage.busy, stage.items)
+    return sink, stats
+
+
+def iter_dump_messages(path):
+    """
+    逐行读取本地消息导出文件（JSONL/NDJSON），每行一条消息：
+    {"id": 123, "date": "2025-05-23T10:48:00+00:00", "text": "..."}
+    
+    text 字段也可以叫 message（与 Telethon Message.to_dict() 一致）。
+    
+    Yields:
+        (message_id, msg_date, text)，msg_date 为 YYYY-MM-DD
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        for line_no, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError as e:
+                print(f"⚠️ 警告：{path} 第 {line_no} 行不是有效的 JSON（{e}），跳过")
+                continue
+            text = record.get('text') or record.get('message')
+            if not text:
+                continue
+            yield record.get('id'), str(record.get('date', ''))[:10], text
+
+
+async def replay_dump(path, incremental=False, workers=EXTRACT_WORKERS, chunk_size=EXTRACT_CHUNK_SIZE):
+    """
+    离线回放：从本地消息导出文件解析 listing 并生成输出，不需要连接 Telegram
+    
+    Args:
+        path: JSONL/NDJSON 消息导出文件
+        incremental: 是否与已有 cex_listings.json 合并（同 scrape_channel）
+        workers: 解析进程数，0 表示串行
+        chunk_size: 每次分发给进程池的消息条数
+    """
+    print(f"正在回放消息文件 {path} ...\n")
+    
+    index = ListingIndex.load() if incremental else ListingIndex()
+    if incremental:
+        load_extract_cache()
+    sink, stats = await run_pipeline(_iterate(iter_dump_messages(path)), index,
+                                     workers=workers, chunk_size=chunk_size)
+    
+    print(f"总共处理了 {stats[0].items} 条消息")
+    print(f"找到 {stats[2].items} 个 CEX listing 信息")
+    save_extract_cache(persist=incremental)
+    print()
+    
+    return merge_and_save(index, sink.listings, incremental=incremental)
+
+
+class MessageCache:
+    """
+    原始消息缓存（SQLite），每个频道的每条消息一行，文本用 zlib 压缩
+    
+    同一条消息再次写入时（重复抓取或编辑），只有 edit_date 变化才更新。
+    写入先缓冲，每 batch_size 条或 flush() 时提交一次。
+    """
+
+    def __init__(self, path=MESSAGE_CACHE, batch_size=500):
+        self.path = path
+        self.batch_size = batch_size
+        self._rows = []
+        self.conn = sqlite3.connect(path)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS messages (
+                source TEXT NOT NULL,
+                id INTEGER NOT NULL,
+                date TEXT NOT NULL,
+                edit_date TEXT,
+                text BLOB NOT NULL,
+                PRIMARY KEY (source, id)
+            ) WITHOUT ROWID
+        """)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        self.flush()
+        return self.conn.execute('SELECT COUNT(*) FROM messages').fetchone()[0]
+
+    def add(self, source, message):
+        """缓存一条 Telethon 消息（没有文本的消息不缓存）"""
+        if not message.text:
+            return
+        edit_date = getattr(message, 'edit_date', None)
+        self._rows.append((
+            source,
+            message.id,
+            message.date.isoformat(),
+            edit_date.isoformat() if edit_date else None,
+            zlib.compress(message.text.encode('utf-8')),
+        ))
+        if len(self._rows) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if not self._rows:
+            return
+        with self.conn:
+            self.conn.executemany("""
+                INSERT INTO messages (source, id, date, edit_date, text) VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT (source, id) DO UPDATE SET
+                    date = excluded.date, edit_date = excluded.edit_date, text = excluded.text
+                WHERE excluded.edit_date IS NOT messages.edit_date
+            """, self._rows)
+        self._rows = []
+
+    def close(self):
+        self.flush()
+        self.conn.close()
+
+    def iter_messages(self, sources=None):
+        """
+        按频道、消息 ID 从新到旧（与抓取顺序一致）读取缓存的消息
+        
+        Yields:
+            (message_id, msg_date, text, source)，msg_date 为 YYYY-MM-DD
+        """
+        self.flush()
+        query = 'SELECT source, id, date, text FROM messages'
+        params = ()
+        if sources:
+            query += f" WHERE source IN ({', '.join('?' * len(sources))})"
+            params = tuple(sources)
+        query += ' ORDER BY source, id DESC'
+        for source, message_id, date, text in self.conn.execute(query, params):
+            yield message_id, date[:10], zlib.decompress(text).decode('utf-8'), source
+
+
+def open_message_cache():
+    """打开原始消息缓存；MESSAGE_CACHE 为空时返回 None（不缓存）"""
+    return MessageCache(MESSAGE_CACHE) if MESSAGE_CACHE else None
+
+
+class ListingDatabase:
+    """
+    listing 数据库（SQLite），每个去重键 (日期, 代币, 交易所, 类型) 一行
+    
+    - record 列保存完整的 listing（与 cex_listings.json 中的记录相同），导出时原样读出
+    - seq 记录首次加入的顺序，同一天内按 seq 排序，与 ListingIndex.listings() 的顺序一致；
+      替换已有记录时保留原来的 seq
+    - source、message_id 指向来源消息（与 MessageCache 同一个文件时可以直接关联 messages 表）
+    - first_seen_at / updated_at 记录首次写入和最近一次内容变化的时间
+    """
+
+    def __init__(self, path=LISTING_DB):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        with self.conn:
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS listings (
+                    date TEXT NOT NULL,
+                    token TEXT NOT NULL,
+                    exchange TEXT NOT NULL,
+                    type TEXT NOT NULL,
+                    seq INTEGER NOT NULL,
+                    source TEXT,
+                    message_id INTEGER,
+                    record TEXT NOT NULL,
+                    first_seen_at TEXT NOT NULL,
+                    updated_at TEXT NOT NULL,
+                    UNIQUE (date, token, exchange, type)
+                )
+            """)
+            self.conn.execute('CREATE INDEX IF NOT EXISTS listings_date ON listings (date, seq)')
+            self.conn.execute('CREATE INDEX IF NOT EXISTS listings_exchange_date ON listings (exchange, date)')
+            self.conn.execute('CREATE INDEX IF NOT EXISTS listings_message ON listings (source, message_id)')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        return self.conn.execute('SELECT COUNT(*) FROM listings').fetchone()[0]
+
+    def close(self):
+        self.conn.close()
+
+    def _rows(self, listings, first_seq):
+        now = datetime.now().isoformat(timespec='seconds')
+        for seq, listing in enumerate(listings, first_seq):
+            yield (*listing_key(listing), seq, listing.get('source'), listing.get('message_id'),
+                   json.dumps(listing_dict(listing), ensure_ascii=False), now, now)
+
+    def upsert(self, listings, removed=()):
+        """
+        在一个事务中写入新增或替换的 listing、删除 removed 中的 listing，只涉及这些行
+        已有的键只更新内容（内容没变时不写），保留原来的 seq 和 first_seen_at
+        """
+        with self.conn:
+            self.conn.executemany('DELETE FROM listings WHERE date = ? AND token = ? AND exchange = ? AND type = ?',
+                                  map(listing_key, removed))
+            next_seq = self.conn.execute('SELECT COALESCE(MAX(seq), 0) + 1 FROM listings').fetchone()[0]
+            self.conn.executemany("""
+                INSERT INTO listings (date, token, exchange, type, seq, source, message_id, record,
+                                      first_seen_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (date, token, exchange, type) DO UPDATE SET
+                    source = excluded.source, message_id = excluded.message_id,
+                    record = excluded.record, updated_at = excluded.updated_at
+                WHERE excluded.record IS NOT listings.record
+            """, self._rows(listings, next_seq))
+
+    def replace_all(self, listings):
+        """在一个事务中用 listings（按输出顺序）替换全部记录，用于全量爬取和首次导入"""
+        with self.conn:
+            self.conn.execute('DELETE FROM listings')
+            self.conn.executemany("""
+                INSERT INTO listings (date, token, exchange, type, seq, source, message_id, record,
+                                      first_seen_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, self._rows(listings, 1))
+
+    def iter_listings(self, date_from=None, date_to=None, exchange=None):
+        """
+        按日期（同一天内按 seq）读取 listing，可以按日期闭区间和交易所过滤，走索引，不需要全部载入内存
+        
+        Args:
+            date_from / date_to: YYYY-MM-DD，None 表示不限
+            exchange: 交易所（不区分大小写）
+        """
+        conditions, params = [], []
+        if exchange:
+            conditions.append('exchange = ?')
+            params.append(exchange.lower())
+        if date_from:
+            conditions.append('date >= ?')
+            params.append(date_from)
+        if date_to:
+            conditions.append('date <= ?')
+            params.append(date_to)
+        query = 'SELECT record FROM listings'
+        if conditions:
+            query += ' WHERE ' + ' AND '.join(conditions)
+        query += ' ORDER BY date, seq'
+        for (record,) in self.conn.execute(query, params):
+            yield json.loads(record)
+
+
+@contextmanager
+def open_listing_db():
+    """打开 listing 数据库；LISTING_DB 为空时得到 None"""
+    if not LISTING_DB:
+        yield None
+        return
+    with ListingDatabase(LISTING_DB) as db:
+        yield db
+
+
+def sync_listing_db(listings, changed_listings, incremental, removed_listings=()):
+    """
+    把本次的结果写入 listing 数据库（未启用时什么都不做）
+    
+    增量模式下只 upsert 新增或替换的记录、删除被删除的记录；全量模式或数据库为空（首次启用）时整体替换
+    """
+    with open_listing_db() as db:
+        if db is None:
+            return
+        with timed('write.db', len(changed_listings) if incremental else len(listings)):
+            if incremental and len(db):
+                db.upsert(changed_listings, removed_listings)
+                print(f"✓ 已写入 {len(changed_listings)} 条到 {LISTING_DB}")
+            else:
+                db.replace_all(listings)
+                print(f"✓ 已保存 {len(listings)} 条到 {LISTING_DB}")
+
+
+def export_listing_db():
+    """
+    从已保存的 listing 重新生成 cex_listings.json、data.js、月份分片和 index.html 引用
+    
+    与 ListingIndex.load 相同：启用了 LISTING_DB 且数据库不为空时从数据库读取，否则读取 cex_listings.json
+    
+    Returns:
+        导出的 listing 列表，没有任何 listing 时返回 None
+    """
+    with open_listing_db() as db:
+        source = LISTING_DB if db is not None and len(db) else OUTPUT_JSON
+    listings = ListingIndex.load().listings()
+    if not listings:
+        print(f"❌ {source} 中没有 listing，请先正常爬取一次")
+        return None
+    print(f"从 {source} 读取了 {len(listings)} 个 listing\n")
+    save_outputs(listings)
+    return listings
+
+
+async def reprocess(workers=EXTRACT_WORKERS, chunk_size=EXTRACT_CHUNK_SIZE, channels=None):
+    """
+    离线重新解析：只读取原始消息缓存，用当前的解析规则重新生成全部输出，不连接 Telegram
+    
+    Args:
+        workers: 解析进程数，0 表示串行
+        chunk_size: 每次分发给进程池的消息条数
+        channels: 只重新解析这些频道，默认缓存中的全部频道
+    
+    Returns:
+        全部 listing，没有消息缓存时返回 None
+    """
+    if not MESSAGE_CACHE or not Path(MESSAGE_CACHE).exists():
+        print(f"❌ 没有找到原始消息缓存 {MESSAGE_CACHE or '（MESSAGE_CACHE 未启用）'}，请先正常爬取一次")
+        return None
+    
+    with MessageCache(MESSAGE_CACHE) as cache:
+        print(f"正在重新解析 {MESSAGE_CACHE} 中的 {len(cache)} 条消息...\n")
+        index = ListingIndex()
+        load_extract_cache()
+        sink, stats = await run_pipeline(_iterate(cache.iter_messages(channels)), index,
+                                         workers=workers, chunk_size=chunk_size)
+    
+    print(f"总共处理了 {stats[0].items} 条消息")
+    print(f"找到 {stats[2].items} 个 CEX listing 信息")
+    save_extract_cache()
+    print()
+    
+    return merge_and_save(index, sink.listings)
+
+
+def import_telethon():
+    """
+    按需导入 telethon：只有连接 Telegram 的模式需要，离线解析、导出、统计和解析进程都不导入
+    未安装时提示并退出
+    """
+    try:
+        import telethon
+        import telethon.errors
+    except ImportError:
+        print("请先安装 telethon: pip install telethon")
+        sys.exit(1)
+    return telethon
+
+
+async def connect_client():
+    """连接 Telegram，必要时走登录流程；登录失败或取消时返回 None"""
+    telethon = import_telethon()
+    print(f"正在连接 Telegram...")
+    
+    # 创建客户端
+    client = telethon.TelegramClient(SESSION_FILE, API_ID, API_HASH)
+    
+    # 检查是否已有会话
+    if Path(SESSION_FILE).exists():
+        print("发现已有会话文件，尝试使用...")
+    
+    # 尝试连接，如果会话有效则不需要输入
+    await client.connect()
+    if not await client.is_user_authorized():
+        await client.disconnect()
+        print("\n⚠️  会话已过期，需要重新登录。")
+        print("\n开始登录流程...")
+        print("=" * 50)
+        
+        # 重新连接以进行登录
+        await client.connect()
+        
+        # 获取手机号
+        try:
+            phone = input("\n请输入你的手机号（带国家代码，如 +86138xxxxxxxx）: ")
+            print(f"\n正在向 {phone} 发送验证码...")
+            await client.send_code_request(phone)
+            print("✓ 验证码已发送！")
+            
+            # 获取验证码
+            code = input("\n请输入收到的验证码: ")
+            
+            try:
+                await client.sign_in(phone, code)
+                print("✓ 登录成功！")
+            except telethon.errors.SessionPasswordNeededError:
+                print("\n检测到两步验证...")
+                password = input("请输入两步验证密码: ")
+                await client.sign_in(password=password)
+                print("✓ 登录成功！")
+                
+        except (EOFError, KeyboardInterrupt):
+            print("\n\n❌ 登录被取消。")
+            await client.disconnect()
+            return None
+        except Exception as e:
+            print(f"\n❌ 登录失败: {e}")
+            await client.disconnect()
+            return None
+    
+    print("✓ 连接成功！")
+    return client
+
+
+async def channel_messages(client, channel, progress, incremental=False, cache=None):
+    """
+    单个频道的消息源，yield (message_id, msg_date, text, channel)
+    
+    Args:
+        client: 已连接的客户端
+        channel: 频道用户名
+        progress: 该频道的进度字典（last_message_id/message_count/max_message_id/edits），原地更新
+        incremental: 增量模式，只获取检查点之后的消息
+        cache: MessageCache，同时保存原始消息
+    """
+    entity = await client.get_entity(channel)
+    print(f"频道 @{channel}: {entity.title}（ID: {entity.id}）")
+    
+    last_message_id = progress['last_message_id']
+    if incremental and last_message_id:
+        # 只获取检查点之后的消息
+        print(f"增量模式：@{channel} 从消息 #{last_message_id} 之后开始获取")
+        iter_kwargs = {'min_id': last_message_id, 'limit': None}
+    else:
+        if incremental:
+            print(f"增量模式：@{channel} 没有检查点，执行完整爬取")
+        iter_kwargs = {'limit': MESSAGE_LIMIT}
+    
+    async for message in client.iter_messages(entity, **iter_kwargs):
+        progress['message_count'] += 1
+        progress['max_message_id'] = max(progress['max_message_id'], message.id)
+        record_edit(progress, message)
+        if cache is not None:
+            cache.add(channel, message)
+        if message.text:
+            # 获取消息发布日期，用于 Alpha Coin 等没有明确日期的消息
+            yield message.id, message.date.strftime('%Y-%m-%d'), message.text, channel
+
+
+def record_edit(progress, message):
+    """记录消息的编辑时间（没有编辑过的消息不记录）"""
+    edit_date = getattr(message, 'edit_date', None)
+    if edit_date and EDIT_LOOKBACK:
+        progress['edits'][str(message.id)] = edit_date.isoformat()
+
+
+async def merge_sources(sources, progress, concurrency=CHANNEL_CONCURRENCY):
+    """
+    并发读取多个频道的消息源，合并成一个消息源（最多 concurrency 个频道同时抓取）
+    
+    单个频道出错时记录到 progress[频道]['error'] 并继续其他频道。
+    """
+    queue = asyncio.Queue(PIPELINE_QUEUE_SIZE)
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    
+    async def pump(channel, source):
+        try:
+            async with semaphore:
+                async for message in source:
+                    await queue.put(message)
+        except Exception as e:
+            progress[channel]['error'] = e
+            print(f"❌ @{channel} 获取失败: {e}")
+        finally:
+            await queue.put(_END)
+    
+    tasks = [asyncio.create_task(pump(channel, source)) for channel, source in sources]
+    try:
+        remaining = len(tasks)
+        while remaining:
+            message = await queue.get()
+            if message is _END:
+                remaining -= 1
+            else:
+                yield message
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+async def fetch_messages(client, channels, index, checkpoint, incremental=False,
+                         workers=EXTRACT_WORKERS, chunk_size=EXTRACT_CHUNK_SIZE,
+                         concurrency=CHANNEL_CONCURRENCY, cache=None):
+    """
+    并发获取多个频道的消息，通过同一条流水线合并到索引
+    
+    Args:
+        client: 已连接的客户端
+        channels: 频道用户名列表
+        index: ListingIndex
+        checkpoint: 检查点（每个频道各自的 last_message_id）
+        incremental: 增量模式，每个频道只获取各自检查点之后的消息
+        workers: 解析进程数
+        chunk_size: 每次分发给进程池的消息条数
+        concurrency: 同时抓取的频道数
+        cache: MessageCache，同时保存原始消息
+    
+    Returns:
+        (sink, {频道: 进度字典})
+    """
+    progress = {}
+    for channel in channels:
+        last_message_id = checkpoint.get(channel, {}).get('last_message_id', 0)
+        progress[channel] = {
+            'last_message_id': last_message_id,
+            'message_count': 0,
+            'max_message_id': last_message_id,
+            'edit_dates': checkpoint.get(channel, {}).get('edit_dates', {}),  # 上次记录的编辑时间
+            'edits': {},  # 本次看到的编辑时间，检查点推进时合并到 edit_dates
+            # 上次检查编辑时的检查点位置；与 last_message_id 相同说明检查范围没有移动
+            'edits_checked_id': checkpoint.get(channel, {}).get('edits_checked_id', 0),
+            'error': None,
+        }
+    
+    sources = [(channel, channel_messages(client, channel, progress[channel], incremental, cache))
+               for channel in channels]
+    sink, stats = await run_pipeline(merge_sources(sources, progress, concurrency), index,
+                                     workers=workers, chunk_size=chunk_size)
+    
+    for channel in channels:
+        print(f"@{channel}: 处理了 {progress[channel]['message_count']} 条消息")
+    print(f"总共处理了 {sum(p['message_count'] for p in progress.values())} 条消息")
+    print(f"找到 {stats[2].items} 个 CEX listing 信息\n")
+    return sink, progress
+
+
+async def refresh_edited(client, index, progress, cache=None, lookback=EDIT_LOOKBACK, force=False):
+    """
+    增量模式下重新解析被编辑过的旧消息，替换（而不是重复加入）由这些消息得到的 listing
+    
+    Telegram 不能按编辑时间查询消息，公告一般在发布后不久被修改，所以只检查每个频道
+    检查点之前最近 lookback 条消息，其中 edit_date 与上次记录的不同的才重新解析。
+    重新获取这些消息需要 lookback / 100 次请求，所以默认只在检查点移动过（上次检查之后
+    有新消息）时检查；检查点没有变化的频道跳过，除非 force。
+    
+    Args:
+        client: 已连接的客户端
+        index: ListingIndex
+        progress: fetch_messages 返回的各频道进度，本次看到的编辑时间记录到其中
+        cache: MessageCache，同时更新缓存的原始消息
+        lookback: 每个频道检查的消息数，0 表示不检查
+        force: 检查点没有移动的频道也重新检查
+    
+    Returns:
+        (新增或替换的 listing, 被删除的 listing)
+    """
+    changed = []
+    removed = []
+    if not lookback:
+        return changed, removed
+    for channel, state in progress.items():
+        if state['error'] is not None or not state['last_message_id']:
+            continue
+        if not force and state['edits_checked_id'] == state['last_message_id']:
+            continue
+        edited = 0
+        try:
+            entity = await client.get_entity(channel)
+            async for message in client.iter_messages(entity, limit=lookback,
+                                                      offset_id=state['last_message_id'] + 1):
+                edit_date = getattr(message, 'edit_date', None)
+                if not edit_date or state['edit_dates'].get(str(message.id)) == edit_date.isoformat():
+                    continue
+                record_edit(state, message)
+                if cache is not None:
+                    cache.add(channel, message)
+                listings = []
+                if message.text:
+                    listings = collect_message_listings(message.id, message.date.strftime('%Y-%m-%d'),
+                                                        message.text, channel)
+                replaced, dropped = index.replace_message(channel, message.id, listings)
+                changed.extend(replaced)
+                removed.extend(dropped)
+                edited += 1
+        except Exception as e:
+            state['error'] = e
+            print(f"❌ @{channel} 检查编辑过的消息失败: {e}")
+            continue
+        state['edits_checked_id'] = state['last_message_id']
+        if edited:
+            print(f"@{channel}: 重新解析了 {edited} 条编辑过的消息")
+    return changed, removed
+
+
+def advance_checkpoint(checkpoint, progress):
+    """
+    把各频道的检查点推进到本次处理的最大消息 ID，并保存看到的消息编辑时间（应在输出写入成功之后调用）
+    出错的频道不推进，下次从原来的位置重新获取
+    """
+    advanced = []
+    edits = False
+    for channel, state in progress.items():
+        if state['error'] is not None:
+            continue
+        if state['edits']:
+            # 只保留最近的消息的编辑时间，更早的消息不会再被检查
+            edit_dates = {**state['edit_dates'], **state['edits']}
+            keep = sorted(edit_dates, key=int)[-2 * EDIT_LOOKBACK:]
+            state['edit_dates'] = {message_id: edit_dates[message_id] for message_id in keep}
+            state['edits'] = {}
+            checkpoint.setdefault(channel, {})['edit_dates'] = state['edit_dates']
+            edits = True
+        if state['edits_checked_id'] != checkpoint.get(channel, {}).get('edits_checked_id', 0):
+            checkpoint.setdefault(channel, {})['edits_checked_id'] = state['edits_checked_id']
+            edits = True
+        if state['max_message_id'] > state['last_message_id']:
+            checkpoint.setdefault(channel, {}).update({
+                'last_message_id': state['max_message_id'],
+                'updated_at': datetime.now().isoformat(timespec='seconds'),
+            })
+            state['last_message_id'] = state['max_message_id']
+            advanced.append(f"@{channel} #{state['max_message_id']}")
+    if advanced or edits:
+        save_checkpoint(checkpoint)
+    if advanced:
+        print(f"✓ 检查点已更新到 {', '.join(advanced)}")
+
+
+async def scrape_channel(incremental=False, workers=EXTRACT_WORKERS, chunk_size=EXTRACT_CHUNK_SIZE,
+                         channels=None, concurrency=CHANNEL_CONCURRENCY, check_edits=False):
+    """
+    爬取频道消息
+    
+    Args:
+        incremental: 增量模式。只获取检查点之后的新消息，合并到已有的
+            cex_listings.json 中，只有新增 listing 时才重写输出文件
+        workers: 解析进程数，0 表示在事件循环中串行解析
+        chunk_size: 每次分发给进程池的消息条数
+        channels: 频道列表，默认 CHANNELS。多个频道通过同一个连接并发抓取，
+            每个频道有各自的检查点，listing 统一去重并记录来源频道（source）
+        concurrency: 同时抓取的频道数
+        check_edits: 增量模式下检查点没有移动的频道也重新检查编辑过的消息（见 refresh_edited）
+    
+    Returns:
+        全部 listing，连接失败或出错时返回 None
+    """
+    channels = channels or CHANNELS
+    client = await connect_client()
+    if client is None:
+        return None
+    
+    cache = open_message_cache()
+    try:
+        print(f"\n正在获取频道 {', '.join('@' + channel for channel in channels)} 的消息...\n")
+        
+        checkpoint = load_checkpoint()
+        index = ListingIndex.load() if incremental else ListingIndex()
+        if incremental:
+            load_extract_cache()
+        sink, progress = await fetch_messages(client, channels, index, checkpoint, incremental,
+                                              workers=workers, chunk_size=chunk_size,
+                                              concurrency=concurrency, cache=cache)
+        changed_listings, removed_listings = sink.listings, []
+        if incremental:
+            replaced, removed_listings = await refresh_edited(client, index, progress, cache, force=check_edits)
+            changed_listings = changed_listings + replaced
+        if cache is not None:
+            cache.flush()
+        save_extract_cache(persist=incremental)
+        
+        unique_listings = merge_and_save(index, changed_listings, incremental=incremental,
+                                         removed_listings=removed_listings)
+        
+        # 输出写入成功后再推进检查点，避免中途失败丢数据
+        advance_checkpoint(checkpoint, progress)
+        
+        return unique_listings
+        
+    except Exception as e:
+        print(f"❌ 错误: {e}")
+        import traceback
+        traceback.print_exc()
+    finally:
+        if cache is not None:
+            cache.close()
+        await client.disconnect()
+
+
+class FloodThrottle:
+    """
+    请求限速：遇到 FloodWait 时按 Telegram 要求的秒数等待，并加大之后每页之间的间隔；
+    请求成功时间隔逐渐缩小
+    
+    flood_wait_error 是 FloodWait 的异常类型（需要 seconds 属性），默认为 telethon.errors.FloodWaitError；
+    使用假客户端测试时可以传入自己的异常类型，不需要安装 telethon
+    """
+
+    def __init__(self, min_delay=0.0, max_delay=30.0, flood_wait_error=None):
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.delay = min_delay
+        self.flood_waits = 0
+        self.flood_wait_error = flood_wait_error
 
-# 输出文件
-OUTPUT_JSON = 'cex_listings.json'
-OUTPUT_JS = 'data.js'
+    def flood_wait_seconds(self, error):
+        """error 是 FloodWait 时返回需要等待的秒数，否则返回 None"""
+        error_type = self.flood_wait_error
+        if error_type is None:
+            # 没有导入 telethon 时，异常不可能来自 telethon，也就不需要导入它
+            errors = sys.modules.get('telethon.errors')
+            error_type = errors.FloodWaitError if errors is not None else None
+        if error_type is not None and isinstance(error, error_type):
+            return error.seconds
+        return None
+
+    async def wait(self):
+        """每次请求前调用"""
+        if self.delay > 0:
+            await asyncio.sleep(self.delay)
+
+    def success(self):
+        self.delay = max(self.min_delay, self.delay * 0.8)
 
+    async def flood_wait(self, seconds):
+        self.flood_waits += 1
+        self.delay = min(self.max_delay, max(1.0, self.delay * 2))
+        print(f"⏳ 触发 FloodWait，等待 {seconds} 秒（之后每页间隔 {self.delay:.1f} 秒）")
+        await asyncio.sleep(seconds + 1)
 
-def extract_listing_info(text, message_date=None):
+
+async def fetch_page(client, entity, offset_id, limit, throttle, retries=5, min_id=0):
     """
-    从消息文本中提取 CEX listing 信息
-    只提取 new listing，过滤掉活动相关的消息
+    获取 offset_id 之前（更早）的一页消息，FloodWait 时等待后重试，网络错误时退避重试
     
     Args:
-        text: 消息文本
-        message_date: 消息发布日期（可选），用于 Alpha Coin 等没有明确日期的消息
+        min_id: 只获取 ID 大于 min_id 的消息（并行回填时限定范围）
+    
+    Returns:
+        按 ID 从新到旧排列的消息列表
+    """
+    attempt = 0
+    while True:
+        await throttle.wait()
+        try:
+            page = [message async for message in
+                    client.iter_messages(entity, limit=limit, offset_id=offset_id, min_id=min_id)]
+        except (ConnectionError, OSError, asyncio.TimeoutError) as e:
+            attempt += 1
+            if attempt > retries:
+                raise
+            print(f"⚠️ 获取失败（{e}），{2 ** attempt} 秒后第 {attempt} 次重试")
+            await asyncio.sleep(2 ** attempt)
+            continue
+        except Exception as e:
+            seconds = throttle.flood_wait_seconds(e)
+            if seconds is None:
+                raise
+            await throttle.flood_wait(seconds)
+            continue
+        throttle.success()
+        return page
+
+
+async def sequential_pages(client, entity, state, page_size, target, throttle):
     """
-    listings = []
+    从 state['offset_id'] 开始逐页向更早的消息获取
     
-    text_lower = text.lower()
+    Yields:
+        按 ID 从新到旧排列的非空页，总条数不超过 target（0 表示不限）
+    """
+    offset_id, fetched = state['offset_id'], state['fetched']
+    while not target or fetched < target:
+        limit = page_size if not target else min(page_size, target - fetched)
+        with timed('fetch', limit):
+            page = await fetch_page(client, entity, offset_id, limit, throttle)
+        if page:
+            yield page
+            offset_id = page[-1].id
+            fetched += len(page)
+        if len(page) < limit:
+            return
+
+
+async def parallel_pages(client, entity, state, page_size, target, throttle, parallel, semaphore,
+                         range_pages=BACKFILL_RANGE_PAGES):
+    """
+    并行回填：把 state['offset_id'] 以下的 ID 空间切成每段 page_size * range_pages 个 ID 的范围
+    （[lo, hi)，用 min_id/offset_id 限定），同时获取多个范围，按 ID 从新到旧的顺序合并输出，
+    与 sequential_pages 的输出相同
     
-    # 优先过滤掉 delist（下架）相关的消息，无论是否包含 listing 关键词
-    delist_keywords = [
-        r'\bdelisting\b', r'\bdelist\b', r'下架', r'removal', r'暂停交易', r'suspend.*trading',
-        r'停止交易', r'停止.*交易', r'终止.*交易', r'取消.*交易', r'remove.*trading',
-        r'will.*delist', r'to.*delist', r'going.*to.*delist', r'停止.*上市'
-    ]
+    - semaphore 限制同一个会话上同时进行的请求数（所有频道共用）
+    - 最多 2 * parallel 个范围已开始但还没输出，每个范围的队列最多缓存 range_pages 页
+      （队列满时该范围暂停获取），内存上限为 2 * parallel * range_pages 页
+    - 达到 target 条后取消其余范围；中断时只有已经输出的页算作完成（检查点格式与顺序回填相同）
+    """
+    upper = state['offset_id']
+    if not upper:
+        with timed('fetch', 1):
+            newest = await fetch_page(client, entity, 0, 1, throttle)
+        if not newest:
+            return
+        upper = newest[0].id + 1
     
-    # 如果包含 delist 关键词，直接返回空列表
-    if any(re.search(keyword, text_lower) for keyword in delist_keywords):
-        return listings
+    def ranges():
+        hi = upper
+        while hi > 1:
+            lo = max(1, hi - page_size * range_pages)
+            yield lo, hi
+            hi = lo
     
-    # 先检查是否是 listing 消息（优先级最高）
-    is_listing = re.search(r'\blisting\b|\blist\b|上市|上线|alpha\s+coin|new.*coin|add.*trading', text_lower)
-    
-    # 过滤掉纯活动/促销消息（但如果同时是 listing，则保留）
-    exclude_keywords = [
-        r'^.*campaign\s*$', r'^.*promotion\s*$', r'^.*contest\s*$', r'^.*giveaway\s*$',
-        r'^.*bonus\s*$', r'^.*discount\s*$', r'^.*reward\s*$',
-        r'maintenance', r'upgrade'
-    ]
-    
-    # 如果是 listing 消息，即使包含活动关键词也保留（比如 listing + 空投活动）
-    # 但如果是纯活动消息（没有 listing），则过滤
-    if not is_listing:
-        # 检查是否是纯活动消息
-        is_pure_activity = any(re.search(keyword, text_lower) for keyword in [
-            r'^.*airdrop\s*$', r'^.*空投\s*$', r'^.*campaign\s*$', r'^.*promotion\s*$',
-            r'^.*giveaway\s*$', r'^.*contest\s*$', r'^.*reward\s*$'
-        ])
-        if is_pure_activity:
-            return listings
-    
-    # 必须包含 listing 相关的关键词（放宽条件，包括更多变体）
-    listing_keywords = [
-        r'\blisting\b', r'\blist\b', r'上市', r'上线', r'add.*spot', r'add.*perpetual',
-        r'new.*trading', r'launch.*trading', r'will.*list', r'to.*list',
-        r'list.*spot', r'list.*perpetual', r'list.*perp', r'add.*trading',
-        r'opens.*trading', r'start.*trading', r'available.*trading',
-        r'alpha\s+coin', r'new.*coin', r'introducing.*on', r'마켓.*추가', r'新增.*资产',
-        r'important\s+notice.*list', r'重要通知.*上线'
-    ]
-    
-    # 检查是否包含 listing 关键词
-    if not any(re.search(keyword, text_lower) for keyword in listing_keywords):
-        return listings
+    async def walk(lo, hi, queue):
+        offset_id = hi
+        while True:
+            async with semaphore:
+                with timed('fetch', page_size):
+                    page = await fetch_page(client, entity, offset_id, page_size, throttle, min_id=lo - 1)
+            if page:
+                await queue.put(page)
+            if len(page) < page_size:
+                break
+            offset_id = page[-1].id
+        await queue.put(None)
     
-    # 必须包含交易所名称（扩展更多交易所，包括韩文交易所）
-    exchange_patterns = [
-        r'\b(binance|coinbase|okx|okex|kraken|bybit|huobi|gate\.io|gateio|kucoin|bitfinex|bitstamp|mexc|bitget|bitmart|coinlist|gemini|bithumb|upbit|hyperliquid)\b',
-        r'(币安|欧易|火币|gate|库币)',  # 中文交易所名称
-    ]
-    
-    exchanges = []
-    exchange_map = {
-        '币安': 'Binance',
-        '欧易': 'OKX',
-        '火币': 'Huobi',
-        'gate': 'Gate',
-        '库币': 'KuCoin',
-    }
+    pending = deque()  # 按 ID 从新到旧排列的 (task, queue)
+    remaining = ranges()
     
-    for pattern in exchange_patterns:
-        matches = re.findall(pattern, text_lower)
-        for match in matches:
-            # 如果是中文交易所名称，转换为英文
-            if match in exchange_map:
-                exchanges.append(exchange_map[match].lower())
-            else:
-                exchanges.append(match)
+    def start_next():
+        bounds = next(remaining, None)
+        if bounds is not None:
+            queue = asyncio.Queue(range_pages)
+            pending.append((asyncio.ensure_future(walk(*bounds, queue)), queue))
     
-    if not exchanges:
-        return listings
+    for _ in range(2 * parallel):
+        start_next()
+    fetched = state['fetched']
+    try:
+        while pending:
+            task, queue = pending[0]
+            getter = asyncio.ensure_future(queue.get())
+            await asyncio.wait((getter, task), return_when=asyncio.FIRST_COMPLETED)
+            if not getter.done():
+                # 范围在放入结束标记之前失败
+                getter.cancel()
+                task.result()
+            page = getter.result()
+            if page is None:
+                pending.popleft()
+                start_next()
+                continue
+            if target:
+                page = page[:target - fetched]
+            fetched += len(page)
+            yield page
+            if target and fetched >= target:
+                return
+    finally:
+        for task, _ in pending:
+            task.cancel()
+        await asyncio.gather(*(task for task, _ in pending), return_exceptions=True)
+
+
+async def backfill_channel(client, channel, index, checkpoint, extractor, throttle,
+                           target=0, page_size=BACKFILL_PAGE_SIZE, save_every=BACKFILL_SAVE_EVERY,
+                           cache=None, parallel=1, semaphore=None):
+    """
+    按页（offset_id）从新到旧回填一个频道的历史消息，可中断后续传
     
-    # 识别交易类型：perp（永续合约）、spot（现货）、alpha 或 pre-market
-    # 一条消息可能同时包含多个类型，需要识别所有类型
-    listing_types = []
+    进度保存在检查点的 checkpoint[频道]['backfill'] 中（下一页的 offset_id、已获取条数、
+    开始时最新的消息 ID）。每 save_every 页把已解析的 listing 写入输出并保存进度，
+    出错或中断时也会先保存已完成的页，重新运行时从最后一页继续。
     
-    # Pre-Market 检测（优先级最高，因为它是特殊的市场类型）
-    is_premarket = re.search(r'pre-market|premarket|预上市|预市', text_lower)
+    Args:
+        target: 最多回填的消息条数，0 表示直到频道开头
+        cache: MessageCache，同时保存原始消息
+        parallel: 大于 1 时按 ID 范围并行获取（见 parallel_pages），页仍按 ID 从新到旧的顺序解析
+        semaphore: 并行获取时限制同时进行的请求数
+    """
+    entity = await client.get_entity(channel)
+    print(f"频道 @{channel}: {entity.title}（ID: {entity.id}）")
     
-    # Coinbase 默认都是 spot
-    if 'coinbase' in text_lower:
-        if is_premarket:
-            listing_types.append('pre-market')
-        else:
-            listing_types.append('spot')
-    # Binance Alpha Coin（优先级最高，如果是 Alpha Coin，只识别为 alpha 类型）
-    # 暂时过滤掉 Alpha Coin，只保留其他类型的 listing
-    is_alpha_coin = re.search(r'new\s+binance\s+alpha\s+coin|binance\s+alpha\s+coin|alpha\s+coin|binance\s+alpha', text_lower)
-    if is_alpha_coin:
-        # 如果是 Alpha Coin，直接返回空列表（不提取）
-        return []
-    # Pre-Market Perpetual（非 Alpha Coin）
-    elif is_premarket and re.search(r'perpetual|perp|futures|永续|合约', text_lower):
-        listing_types.append('pre-market')
-    # Pre-Market Spot（非 Alpha Coin）
-    elif is_premarket:
-        listing_types.append('pre-market')
-    # Perp 相关关键词（非 Pre-Market，非 Alpha Coin）
-    elif re.search(r'perpetual\s+futures|perpetual\s+contract|perp\s+contract|永续合约|futures.*perpetual|contract.*api|合约.*api', text_lower):
-        listing_types.append('perp')
-    # Bybit Convert 是 spot
-    elif re.search(r'convert', text_lower) and 'bybit' in text_lower:
-        listing_types.append('spot')
-    # Bybit contract 是 perp
-    elif re.search(r'contract', text_lower) and 'bybit' in text_lower and 'convert' not in text_lower:
-        listing_types.append('perp')
-    # Binance Futures 是 perp（但如果是 Alpha Coin，已经识别为 alpha 了）
-    elif re.search(r'binance\s+futures|futures.*will\s+launch', text_lower) and not is_alpha_coin:
-        listing_types.append('perp')
-    # Binance Earn/Buy/Convert/Margin 是 spot（但如果是 Alpha Coin，已经识别为 alpha 了）
-    elif re.search(r'earn|buy\s+crypto|convert.*margin|margin', text_lower) and 'binance' in text_lower and not is_alpha_coin:
-        listing_types.append('spot')
-    # OKX spot trading
-    elif re.search(r'spot\s+trading|list.*for\s+spot', text_lower) and 'okx' in text_lower:
-        listing_types.append('spot')
-    # OKX perpetual futures（非 pre-market）
-    elif re.search(r'perpetual\s+futures|list.*perpetual', text_lower) and 'okx' in text_lower and not is_premarket:
-        listing_types.append('perp')
-    # Hyperliquid 永续合约
-    elif re.search(r'永续合约', text_lower) and 'hyperliquid' in text_lower:
-        listing_types.append('perp')
-    # 其他 perp 关键词（非 Pre-Market）
-    elif re.search(r'perpetual|perp|futures|swap|合约', text_lower) and 'spot' not in text_lower and not is_premarket:
-        if 'perp' not in listing_types:
-            listing_types.append('perp')
-    # 其他 spot 关键词
-    elif re.search(r'spot|现货|roadmap|마켓.*추가|新增.*资产', text_lower):
-        if 'spot' not in listing_types:
-            listing_types.append('spot')
-    
-    # 如果没有识别到任何类型，默认是 spot
-    if not listing_types:
-        listing_types = ['spot']
-    
-    # 提取日期（多种格式，优先提取消息中的日期）
-    date_patterns = [
-        # ISO 格式（优先，因为更准确）
-        r'(\d{4})[-\/](\d{1,2})[-\/](\d{1,2})',  # 2024-12-15 或 2024/12/15
-        # 英文月份格式 - 支持逗号
-        r'(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[\s\.\/,-]+(\d{1,2})[\s\.\/,-]+(\d{4})',  # Oct 23, 2025 或 Oct 23 2025
-        r'(\d{1,2})[\s\.\/,-]+(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[\s\.\/,-]+(\d{4})',  # 23 Oct 2025
-        # 中文日期格式
-        r'(\d{4})\s*年\s*(\d{1,2})\s*月\s*(\d{1,2})\s*日',  # 2025年11月14日
-        # 其他格式
-        r'(\d{1,2})[-\/](\d{1,2})[-\/](\d{4})',  # 12-15-2024
-        r'(\d{1,2})\s+月\s+(\d{1,2})\s+日',      # 12月15日
-    ]
-    
-    date_match = None
-    for pattern in date_patterns:
-        # 使用原始文本（不转小写）来匹配日期，因为英文月份名称需要保持大小写
-        # 但对于已经转小写的模式（如月份名称），使用 text_lower
-        if 'jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec' in pattern.lower():
-            date_match = re.search(pattern, text_lower)
+    channel_state = checkpoint.setdefault(channel, {})
+    state = channel_state.get('backfill')
+    if state:
+        print(f"继续上次的回填：从消息 #{state['offset_id']} 之前开始，已获取 {state['fetched']} 条")
+    else:
+        state = {'offset_id': 0, 'fetched': 0, 'top_message_id': 0}
+    
+    changed = []
+    unsaved_pages = 0
+    done = bool(target) and state['fetched'] >= target
+    
+    def save_progress():
+        nonlocal changed, unsaved_pages
+        if cache is not None:
+            cache.flush()
+        merge_and_save(index, changed, incremental=True)
+        changed, unsaved_pages = [], 0
+        if done:
+            channel_state.pop('backfill', None)
+            if state['top_message_id'] > channel_state.get('last_message_id', 0):
+                channel_state['last_message_id'] = state['top_message_id']
         else:
-            date_match = re.search(pattern, text)
-        if date_match:
-            break
+            channel_state['backfill'] = dict(state)
+        channel_state['updated_at'] = datetime.now().isoformat(timespec='seconds')
+        save_checkpoint(checkpoint)
     
-    # 提取代币名称（通常是大写字母组合，排除常见单词）
-    exclude_tokens = {'THE', 'AND', 'FOR', 'ARE', 'BUT', 'NOT', 'YOU', 'ALL', 'CAN', 'HER', 'WAS', 'ONE', 'OUR', 'OUT', 'DAY', 'GET', 'HAS', 'HIM', 'HIS', 'HOW', 'ITS', 'MAY', 'NEW', 'NOW', 'OLD', 'SEE', 'TWO', 'WHO', 'WAY', 'USE', 'HER', 'SHE', 'PUT', 'END', 'WHY', 'ASK', 'MEN', 'TURN', 'WANT', 'TELL', 'WENT', 'WERE', 'WHAT', 'WHEN', 'WITH', 'YOUR', 'FROM', 'HAVE', 'THIS', 'THAT', 'WILL', 'MORE', 'VERY', 'WHAT', 'KNOW', 'JUST', 'LIKE', 'LONG', 'MAKE', 'MANY', 'OVER', 'SUCH', 'TAKE', 'THAN', 'THEM', 'WELL', 'WERE', 'WILL', 'YEAR', 'YOUR', 'ABOUT', 'AFTER', 'AGAIN', 'BEING', 'BELOW', 'BETWEEN', 'BOTH', 'CAME', 'CARRY', 'CHANGE', 'CHILDREN', 'CLOSE', 'COME', 'COULD', 'DOES', 'DON\'T', 'DURING', 'EACH', 'EARLY', 'EARTH', 'EIGHT', 'EVERY', 'EXAMPLE', 'EYES', 'FACE', 'FAMILY', 'FAR', 'FATHER', 'FEET', 'FEW', 'FIND', 'FIRST', 'FOUND', 'FOUR', 'GAVE', 'GET', 'GIRL', 'GIVE', 'GOES', 'GOOD', 'GOT', 'GREAT', 'GROUP', 'GROW', 'HAD', 'HAND', 'HARD', 'HAS', 'HAVE', 'HEAD', 'HEAR', 'HELP', 'HERE', 'HIGH', 'HOME', 'HOUR', 'HOUSE', 'HOW', 'INTO', 'ITS', 'JUST', 'KEEP', 'KIND', 'KNEW', 'KNOW', 'LARGE', 'LAST', 'LATE', 'LEARN', 'LEFT', 'LESS', 'LIFE', 'LIGHT', 'LINE', 'LIST', 'LITTLE', 'LIVE', 'LONG', 'LOOK', 'LOOKED', 'MADE', 'MAKE', 'MAN', 'MANY', 'MAY', 'MEAN', 'MEN', 'MIGHT', 'MILES', 'MISS', 'MONEY', 'MORNING', 'MOST', 'MOTHER', 'MOVE', 'MUCH', 'MUST', 'NAME', 'NEAR', 'NEED', 'NEVER', 'NEW', 'NEXT', 'NIGHT', 'NOON', 'NOTE', 'NOTHING', 'NOW', 'NUMBER', 'OFF', 'OFTEN', 'ONCE', 'ONLY', 'OPEN', 'ORDER', 'OTHER', 'OUR', 'OUT', 'OVER', 'OWN', 'PAGE', 'PAPER', 'PART', 'PASS', 'PAST', 'PEOPLE', 'PER', 'PICTURE', 'PLACE', 'PLAN', 'PLAY', 'POINT', 'PUT', 'READ', 'REAL', 'RIGHT', 'ROOM', 'ROUND', 'SAID', 'SAME', 'SAW', 'SAY', 'SCHOOL', 'SEA', 'SECOND', 'SEE', 'SEEM', 'SENT', 'SET', 'SHE', 'SHIP', 'SHORT', 'SHOULD', 'SHOW', 'SIDE', 'SINCE', 'SING', 'SIT', 'SIX', 'SIZE', 'SLOW', 'SMALL', 'SOON', 'SOUND', 'SOUTH', 'SPACE', 'SPEAK', 'SPELL', 'STAND', 'START', 'STATE', 'STILL', 'STOP', 'STORY', 'SUCH', 'SURE', 'TAKE', 'TALK', 'TELL', 'TEN', 'TEST', 'THAN', 'THAT', 'THEIR', 'THEM', 'THEN', 'THERE', 'THESE', 'THEY', 'THING', 'THINK', 'THIS', 'THOSE', 'THREE', 'THROUGH', 'TIME', 'TOLD', 'TOOK', 'TOO', 'TOOK', 'TOOL', 'TOP', 'TOWARD', 'TOWN', 'TREE', 'TRIED', 'TRUE', 'TRY', 'TURN', 'TWO', 'UNDER', 'UNTIL', 'UPON', 'USED', 'USING', 'USUAL', 'VALUE', 'VERY', 'VOICE', 'WALK', 'WANT', 'WARM', 'WATCH', 'WATER', 'WAVE', 'WAYS', 'WEAR', 'WEEK', 'WEIGHT', 'WELL', 'WENT', 'WERE', 'WEST', 'WHAT', 'WHEEL', 'WHEN', 'WHERE', 'WHICH', 'WHILE', 'WHITE', 'WHO', 'WHOLE', 'WHOSE', 'WHY', 'WIDE', 'WIFE', 'WILD', 'WILL', 'WIND', 'WINDOW', 'WISH', 'WITH', 'WITHIN', 'WITHOUT', 'WOMAN', 'WOMEN', 'WON\'T', 'WONDER', 'WOOD', 'WORD', 'WORE', 'WORK', 'WORLD', 'WOULD', 'WRITE', 'WRONG', 'WROTE', 'YARD', 'YEAR', 'YELLOW', 'YES', 'YESTERDAY', 'YET', 'YOU', 'YOUNG', 'YOUR', 'YOURSELF'}
-    
-    # 提取代币名称（更精确的模式，支持更多格式）
-    # 注意：更具体的模式要放在前面
-    token_patterns = [
-        # 特定格式：list pre-market perpetual futures for TOKEN (Name) - 最具体
-        r'list\s+pre-market\s+perpetual\s+futures\s+for\s+([A-Z]{2,10})\s*\(([A-Z][A-Za-z]+)\)',  # "list pre-market perpetual futures for SENT (Sentient)"
-        r'to\s+list\s+pre-market\s+perpetual\s+futures\s+for\s+([A-Z]{2,10})\s*\(([A-Z][A-Za-z]+)\)',  # "to list pre-market perpetual futures for SENT (Sentient)"
-        # 特定格式：list perpetual futures for TOKEN (Name)
-        r'list\s+perpetual\s+futures\s+for\s+([A-Z]{2,10})\s*\(([A-Z][A-Za-z]+)\)',  # "list perpetual futures for TOKEN (Name)"
-        # 优先匹配带括号的格式，如 "Rayls (RLS)" 或 "APRO (AT)" 或 "SENT (Sentient)"
-        r'([A-Z][A-Za-z]+)\s*\(([A-Z]{2,10})\)',  # "Rayls (RLS)" 或 "APRO (AT)"
-        r'([A-Z]{2,10})\s*\(([A-Z][A-Za-z]+)\)',  # "SENT (Sentient)" - 代币代码在前
-        # 特定格式：list perpetual futures for TOKEN
-        r'list\s+perpetual\s+futures\s+for\s+([A-Z]{2,10})',  # "list perpetual futures for SEI"
-        r'to\s+list\s+perpetual\s+futures\s+for\s+([A-Z]{2,10})',  # "to list perpetual futures for SEI"
-        r'list\s+([A-Z]{2,10})\s+for\s+spot',  # "list SEI for spot"
-        r'list\s+([A-Z]{2,10})\s+for\s+perpetual',  # "list SEI for perpetual"
-        # 中文格式：上线TOKEN（Name）代币的预市永续期货
-        r'上线([A-Z]{2,10})\s*\(([A-Z][A-Za-z]+)\)',  # "上线SENT（Sentient）"
-        # 交易对格式
-        r'\b([A-Z]{2,10})[/\-](USD|USDT|BTC|ETH|EUR|GBP|KRW|USDC)',  # "IRYSUSDT" 或 "AERO/USDC"
-        # Alpha Coin 格式（优先匹配，因为更具体）
-        r'new\s+binance\s+alpha\s+coin[:\s]+([A-Z]{2,10})',  # "New Binance Alpha Coin: VSN"
-        r'binance\s+alpha\s+coin[:\s]+([A-Z]{2,10})',  # "Binance Alpha Coin: VSN"
-        r'alpha\s+coin[:\s]+([A-Z]{2,10})',  # "Alpha Coin: VSN"
-        # 韩文格式
-        r'([A-Z]{2,10})\s*\([^)]+\)\s*원화',  # "아이리스(IRYS) 원화"
-        r'플룸\s*\(([A-Z]{2,10})\)',  # "플룸(PLUME)"
-        r'([A-Z]{2,10})\s+KRW',  # "PLUME KRW"
-        # 标准 listing 格式
-        r'list\s+([A-Z]{2,10})\s+for',  # "list DASH for"
-        r'list\s+([A-Z]{2,10})',  # "list DASH"
-        r'listing\s+of\s+([A-Z]{2,10})',  # "listing of BTC"
-        r'to\s+list\s+([A-Z]{2,10})',  # "to list TRUTH"
-        r'上线\s+([A-Z]{2,10})',  # "上线 SEI"
-        r'add\s+([A-Z]{2,10})',  # "add BTC"
-        # 其他格式
-        r'\$([A-Z]{2,10})\b',  # $BTC 格式
-        r'\b([A-Z]{3,10})\s+(?:will|to|is|are|has|have|listing|list|on|for)',  # 代币名称后跟 listing 相关词
-        r'introducing\s+([A-Z]{2,10})',  # "Introducing APRO"
-        r'\(([A-Z]{2,10})\)',  # "(IRYS)" 或 "(PLUME)"
-        r'([A-Z]{2,10})\s*\(',  # "IRYS (" 或 "PLUME ("
-        # 从交易对中提取，如 "IRYSUSDT" -> "IRYS"
-        r'([A-Z]{2,10})(?:USDT|USD|BTC|ETH|EUR|GBP|KRW|USDC)',  # "IRYSUSDT" -> "IRYS"
-    ]
-    
-    tokens = []
-    token_display = {}  # 存储代币的显示名称，如 {"RLS": "Rayls (RLS)"}
-    bracket_tokens = {}  # 存储括号内的代币，如 {"BOBBOB": "BOB"}
-    
-    # 先提取带括号的格式，支持两种格式：
-    # 1. "Name (TOKEN)" - 如 "Rayls (RLS)" 或 "BOB (BOBBOB)"
-    # 2. "TOKEN (Name)" - 如 "SENT (Sentient)"
-    bracket_pattern1 = r'([A-Z][A-Za-z]+)\s*\(([A-Z]{2,10})\)'  # Name (TOKEN)
-    bracket_pattern2 = r'([A-Z]{2,10})\s*\(([A-Z][A-Za-z]+)\)'  # TOKEN (Name)
-    bracket_matches1 = re.findall(bracket_pattern1, text)
-    bracket_matches2 = re.findall(bracket_pattern2, text)
-    
-    # 记录已处理的代币，避免重复
-    processed_tokens = set()
-    
-    for display_name, token in bracket_matches1:
-        token_upper = token.upper()
-        if token_upper not in processed_tokens:
-            bracket_tokens[token_upper] = display_name
-            token_display[token_upper] = f"{display_name} ({token})"
-            tokens.append(token_upper)
-            processed_tokens.add(token_upper)
-    
-    for token, display_name in bracket_matches2:
-        token_upper = token.upper()
-        if token_upper not in processed_tokens:
-            token_display[token_upper] = f"{token} ({display_name})"  # 修正：应该是 "SENT (Sentient)" 而不是 "Sentient (SENT)"
-            tokens.append(token_upper)
-            processed_tokens.add(token_upper)
-    
-    # 然后提取其他格式的代币
-    for pattern in token_patterns:
-        matches = re.findall(pattern, text)
-        for match in matches:
-            if isinstance(match, tuple):
-                # 处理带括号的格式（已经在上面处理过了，跳过）
-                if len(match) == 2:
-                    token1, token2 = match
-                    token1_upper = token1.upper()
-                    token2_upper = token2.upper()
-                    # 检查是否已经处理过（避免重复）
-                    # 如果第一个是大写字母（可能是 TOKEN (Name) 格式），检查是否已处理
-                    if len(token1) >= 2 and token1.isupper() and len(token2) >= 2 and not token2.isupper():
-                        if token1_upper in processed_tokens:
-                            continue
-                    # 如果第二个是大写字母（可能是 Name (TOKEN) 格式），检查是否已处理
-                    elif len(token2) >= 2 and token2.isupper() and len(token1) >= 2 and not token1.isupper():
-                        if token2_upper in processed_tokens:
-                            continue
-                    # 其他情况，跳过所有带括号的格式（已经在上面处理过了）
-                    continue
-                else:
-                    token = match[0]
-            else:
-                token = match
-            
-            # 过滤掉常见单词和交易所名称
-            exchange_names = ['BINANCE', 'COINBASE', 'OKX', 'OKEX', 'KRAKEN', 'BYBIT', 'HUOBI', 'KUCOIN', 
-                            'BITFINEX', 'BITSTAMP', 'GATE', 'BITHUMB', 'UPBIT', 'MEXC', 'BITGET', 'BITMART',
-                            'HYPERLIQUID', 'USD', 'USDT', 'USDC', 'KRW', 'BTC', 'ETH', 'EUR', 'GBP']
-            
-            token_upper = token.upper()
-            # 如果这个代币已经在括号中出现过（如 BOB 在 "BOB (BOBBOB)" 中），跳过
-            if token_upper in bracket_tokens.values():
-                continue
-            # 如果已经处理过，跳过
-            if token_upper in processed_tokens:
-                continue
-            if token_upper not in exclude_tokens and token_upper not in exchange_names:
-                if len(token) >= 2 and token_upper not in tokens:
-                    tokens.append(token_upper)
-    
-    # 如果从交易对中提取（如 IRYSUSDT），需要清理
-    cleaned_tokens = []
-    for token in tokens:
-        # 移除交易对后缀
-        for suffix in ['USDT', 'USD', 'USDC', 'BTC', 'ETH', 'EUR', 'GBP', 'KRW']:
-            if token.endswith(suffix) and len(token) > len(suffix):
-                token = token[:-len(suffix)]
-                break
-        # 如果这个代币是括号内代币的显示名称（如 BOB 是 BOBBOB 的显示名称），跳过
-        if token in bracket_tokens.values():
-            continue
-        if token not in cleaned_tokens:
-            cleaned_tokens.append(token)
-    tokens = cleaned_tokens
-    
-    # 提取时间
-    time_pattern = r'(\d{1,2}):(\d{2})\s*(?:AM|PM|am|pm)?\s*(UTC|utc|GMT|gmt)?'
-    time_match = re.search(time_pattern, text)
-    
-    # 提取交易对
-    pairs_pattern = r'([A-Z]{2,10})[/\-](USD|USDT|BTC|ETH|EUR|GBP)'
-    pairs = re.findall(pairs_pattern, text)
-    
-    # 如果找到代币和交易所，创建 listing 对象
-    if tokens and exchanges:
-        # 处理日期
-        listing_date = None
-        if date_match:
-            try:
-                groups = date_match.groups()
-                if len(groups) == 3:
-                    # 月份名称映射
-                    month_names = {
-                        'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
-                        'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12
-                    }
-                    
-                    # 判断日期格式
-                    # 先检查是否是中文日期格式（2025年10月23日）
-                    if '年' in text or '月' in text or '日' in text:
-                        # 检查是否是中文日期格式
-                        chinese_pattern = r'(\d{4})\s*年\s*(\d{1,2})\s*月\s*(\d{1,2})\s*日'
-                        chinese_match = re.search(chinese_pattern, text)
-                        if chinese_match:
-                            year, month, day = chinese_match.groups()
-                            year = int(year)
-                            month = int(month)
-                            day = int(day)
-                        elif len(groups[0]) == 4:  # YYYY-MM-DD
-                            year, month, day = groups
-                            year = int(year)
-                            month = int(month)
-                            day = int(day)
-                        else:
-                            # 其他格式
-                            year, month, day = groups
-                            year = int(year)
-                            month = int(month)
-                            day = int(day)
-                    elif len(groups[0]) == 4:  # YYYY-MM-DD
-                        year, month, day = groups
-                        year = int(year)
-                        month = int(month)
-                        day = int(day)
-                    elif len(groups[2]) == 4:  # MM-DD-YYYY 或 英文月份格式
-                        # 检查是否是英文月份格式
-                        if groups[0].lower() in month_names:  # Oct 23, 2025
-                            month_name, day, year = groups
-                            year = int(year)
-                            month = month_names[month_name.lower()]
-                            day = int(day)
-                        elif groups[1].lower() in month_names:  # 23 Oct 2025
-                            day, month_name, year = groups
-                            year = int(year)
-                            month = month_names[month_name.lower()]
-                            day = int(day)
-                        else:  # MM-DD-YYYY
-                            month, day, year = groups
-                            year = int(year)
-                            month = int(month)
-                            day = int(day)
-                    else:
-                        # 可能是其他格式，尝试解析
-                        year, month, day = groups
-                        year = int(year)
-                        month = int(month)
-                        day = int(day)
-                    
-                    # 验证日期有效性
-                    if 2000 <= year <= 2100 and 1 <= month <= 12 and 1 <= day <= 31:
-                        listing_date = f"{year}-{str(month).zfill(2)}-{str(day).zfill(2)}"
-            except (ValueError, IndexError, KeyError):
-                pass
-        
-        # 如果没有从消息文本中提取到日期
-        # 对于 Alpha Coin，可以使用消息发布日期（因为 Alpha Coin 通常是即时上线的）
-        # 对于其他类型，如果没有日期则跳过（因为消息发布日期可能不是上币日期）
-        if not listing_date:
-            if 'alpha' in listing_types:
-                if message_date:
-                    # Alpha Coin 使用消息发布日期
-                    listing_date = message_date
-                else:
-                    # Alpha Coin 但没有消息发布日期，跳过
-                    return []
-            else:
-                # 非 Alpha Coin 必须有日期
-                return []
-        
-        # 处理时间
-        listing_time = None
-        if time_match:
-            listing_time = f"{time_match.group(1)}:{time_match.group(2)}"
-            if time_match.group(3):
-                listing_time += f" {time_match.group(3).upper()}"
-        
-        # 处理交易对
-        listing_pairs = None
-        if pairs:
-            listing_pairs = '/'.join(pairs[0]) if pairs else None
-        
-        # 为每个代币和交易所组合创建 listing
-        # 先统一交易所名称为英文（在创建 listing 时就转换，避免重复）
-        exchange_name_map = {
-            '币安': 'Binance',
-            '欧易': 'OKX',
-            '火币': 'Huobi',
-            'gate': 'Gate',
-            '库币': 'KuCoin',
-        }
-        
-        for token in tokens[:5]:  # 最多取前5个代币
-            for exchange in list(set(exchanges))[:2]:  # 去重，最多取前2个交易所
-                # 统一交易所名称为英文
-                exchange_normalized = exchange_name_map.get(exchange, exchange).title()
-                
-                # 使用显示名称（如果有），否则使用代币代码
-                display_token = token_display.get(token, token)
+    if parallel > 1:
+        pages = parallel_pages(client, entity, state, page_size, target, throttle, parallel,
+                               semaphore or asyncio.Semaphore(parallel))
+    else:
+        pages = sequential_pages(client, entity, state, page_size, target, throttle)
+    
+    try:
+        if not done:
+            async for page in pages:
+                for message in page:
+                    if cache is not None:
+                        cache.add(channel, message)
+                    if message.text:
+                        extractor.submit(message.id, message.date.strftime('%Y-%m-%d'), message.text,
+                                         channel)
+                with timed('extract', len(page)):
+                    results = await extractor.drain_async()
+                with timed('dedup'):
+                    for _, listings in results:
+                        for listing in listings:
+                            if index.add(listing):
+                                changed.append(listing)
                 
-                # 为每个类型创建 listing（如果一条消息包含多个类型）
-                for listing_type in listing_types:
-                    listing = {
-                        'date': listing_date,
-                        'token': token,  # 代币代码
-                        'token_display': display_token,  # 显示名称，如 "Rayls (RLS)"
-                        'exchange': exchange_normalized,  # 已转换为英文
-                        'type': listing_type,  # perp, spot 或 alpha
-                        'text': text[:300]  # 保存原始文本的前300字符
-                    }
-                    
-                    if listing_time:
-                        listing['time'] = listing_time
-                    if pairs:
-                        # 找到匹配的交易对
-                        for pair in pairs:
-                            if pair[0].upper() == token.upper():
-                                listing['pairs'] = f"{pair[0]}/{pair[1]}"
-                                break
-                    
-                    listings.append(listing)
+                state['top_message_id'] = max(state['top_message_id'], page[0].id)
+                state['offset_id'] = page[-1].id
+                state['fetched'] += len(page)
+                unsaved_pages += 1
+                print(f"@{channel}: 已获取 {state['fetched']} 条（到消息 #{state['offset_id']}），"
+                      f"共 {len(index)} 个 listing")
+                if unsaved_pages >= save_every:
+                    save_progress()
+        done = True
+        save_progress()
+    except BaseException:
+        if unsaved_pages:
+            print(f"⚠️ @{channel} 回填中断，保存已完成的 {state['fetched']} 条消息的进度")
+            save_progress()
+        raise
+    finally:
+        await pages.aclose()
     
-    return listings
+    print(f"✓ @{channel} 回填完成，共获取 {state['fetched']} 条消息")
 
 
-async def scrape_channel():
-    """爬取频道消息"""
-    print(f"正在连接 Telegram...")
+async def backfill(target=0, page_size=BACKFILL_PAGE_SIZE, save_every=BACKFILL_SAVE_EVERY,
+                   workers=EXTRACT_WORKERS, chunk_size=EXTRACT_CHUNK_SIZE, channels=None, client=None,
+                   parallel=BACKFILL_PARALLEL, throttle=None):
+    """
+    可续传的历史回填：逐个频道按页获取，结果与已有的 cex_listings.json 合并
     
-    # 创建客户端
-    client = TelegramClient(SESSION_FILE, API_ID, API_HASH)
+    Args:
+        target: 每个频道最多回填的消息条数，0 表示全部历史
+        page_size: 每页消息数
+        save_every: 每多少页保存一次进度和结果
+        workers: 解析进程数
+        chunk_size: 每次分发给进程池的消息条数
+        channels: 频道列表，默认 CHANNELS
+        client: 已连接的客户端，默认调用 connect_client()
+        parallel: 同时获取的 ID 范围数（所有频道共用这个请求数上限），1 表示逐页顺序获取
+        throttle: FloodThrottle，默认新建（假客户端可以传入识别自己 FloodWait 异常的实例）
     
+    Returns:
+        全部 listing，连接失败或出错时返回 None
+    """
+    channels = channels or CHANNELS
+    if client is None:
+        client = await connect_client()
+        if client is None:
+            return None
+    
+    cache = open_message_cache()
+    checkpoint = {}
     try:
-        # 检查是否已有会话
-        if Path(SESSION_FILE).exists():
-            print("发现已有会话文件，尝试使用...")
+        checkpoint = load_checkpoint()
+        index = ListingIndex.load()
+        load_extract_cache()
+        throttle = throttle or FloodThrottle()
+        semaphore = asyncio.Semaphore(max(1, parallel))
+        with ChunkedExtractor(workers, chunk_size) as extractor:
+            # 同一个账号的请求共用限额，频道逐个回填
+            for channel in channels:
+                await backfill_channel(client, channel, index, checkpoint, extractor, throttle,
+                                       target=target, page_size=page_size, save_every=save_every,
+                                       cache=cache, parallel=parallel, semaphore=semaphore)
+        if throttle.flood_waits:
+            print(f"回填期间触发了 {throttle.flood_waits} 次 FloodWait")
+        return index.listings()
+    
+    except Exception as e:
+        print(f"❌ 错误: {e}")
+        import traceback
+        traceback.print_exc()
+        # 已完成的页在 backfill_channel 中保存过，这里报告续传的位置
+        for channel in channels:
+            state = checkpoint.get(channel, {}).get('backfill')
+            if state:
+                print(f"@{channel}: 进度已保存（已获取 {state['fetched']} 条，到消息 #{state['offset_id']}）")
+        print("再次运行同样的命令即可从保存的进度继续回填")
+    finally:
+        save_extract_cache()
+        if cache is not None:
+            cache.close()
+        await client.disconnect()
+
+
+class ListingWatcher:
+    """
+    守护模式下的状态：接收推送的新消息/编辑消息，解析后合并到索引（编辑消息替换原来的 listing），
+    第一个新 listing 到达后等待 debounce 秒再发布，期间到达的 listing 一起写出
+    
+    发布在 run() 的任务中进行，写文件在线程中执行，事件循环照常接收消息（在队列中等待）；
+    写出期间不解析新消息，所以线程读取的索引不会同时被修改。发布失败时保留待发布的 listing，
+    debounce 秒后重试，连续失败 max_failures 次时 run() 抛出异常
+    """
+
+    def __init__(self, index, checkpoint, debounce=WATCH_DEBOUNCE, cache=None, max_failures=3):
+        self.index = index
+        self.checkpoint = checkpoint
+        self.cache = cache
+        self.debounce = debounce
+        self.progress = {}  # 频道 -> 进度字典（同 fetch_messages）
+        self.messages = asyncio.Queue()  # (频道, 消息, 是否为编辑)
+        self.pending = []  # 尚未发布的新 listing
+        self.removed = []  # 尚未发布的删除（消息编辑后不再包含的 listing）
+        self.deadline = None  # 待发布 listing 的发布时间（loop.time()）
+        self.first_arrival = None  # 第一条待发布 listing 的到达时间
+        self.publish_count = 0
+        self.failures = 0  # 连续发布失败的次数
+        self.max_failures = max_failures
+        self.writing = None  # 正在线程中进行的写出
+
+    def handler(self, channel, edited=False):
+        """返回频道的 Telethon 事件回调：只入队，解析在 run() 中进行"""
+        async def on_event(event):
+            self.messages.put_nowait((channel, event.message, edited))
+        return on_event
+
+    def process(self, channel, message, edited=False):
+        """解析一条消息，返回新增、替换和删除的 listing 数"""
+        state = self.progress[channel]
+        state['max_message_id'] = max(state['max_message_id'], message.id)
+        record_edit(state, message)
+        if self.cache is not None:
+            self.cache.add(channel, message)
+        msg_date = message.date.strftime('%Y-%m-%d')
+        if edited:
+            listings = []
+            if message.text:
+                listings = collect_message_listings(message.id, msg_date, message.text, channel)
+            changed, removed = self.index.replace_message(channel, message.id, listings)
+            self.pending.extend(changed)
+            self.removed.extend(removed)
+            added = len(changed) + len(removed)
+        else:
+            if not message.text:
+                return 0
+            added = 0
+            for listing in collect_message_listings(message.id, msg_date, message.text, channel):
+                if self.index.add(listing):
+                    self.pending.append(listing)
+                    added += 1
+        if added and self.first_arrival is None:
+            self.first_arrival = time.monotonic()
+        return added
+
+    async def publish(self):
+        """
+        写出待发布的 listing 并推进检查点（写文件在线程中进行）
         
-        # 尝试连接，如果会话有效则不需要输入
-        await client.connect()
-        if not await client.is_user_authorized():
-            await client.disconnect()
-            print("\n⚠️  会话已过期，需要重新登录。")
-            print("\n开始登录流程...")
-            print("=" * 50)
-            
-            # 重新连接以进行登录
-            await client.connect()
-            
-            # 获取手机号
+        Returns:
+            是否成功；失败时待发布的 listing 放回，debounce 秒后重试
+        """
+        changed, self.pending = self.pending, []
+        removed, self.removed = self.removed, []
+        first_arrival, self.first_arrival = self.first_arrival, None
+        self.deadline = None
+        if self.cache is not None:
+            self.cache.flush()
+        if changed or removed:
+            self.writing = asyncio.ensure_future(asyncio.to_thread(
+                merge_and_save, self.index, changed, incremental=True, removed_listings=removed))
             try:
-                phone = input("\n请输入你的手机号（带国家代码，如 +86138xxxxxxxx）: ")
-                print(f"\n正在向 {phone} 发送验证码...")
-                await client.send_code_request(phone)
-                print("✓ 验证码已发送！")
-                
-                # 获取验证码
-                code = input("\n请输入收到的验证码: ")
-                
-                try:
-                    await client.sign_in(phone, code)
-                    print("✓ 登录成功！")
-                except SessionPasswordNeededError:
-                    print("\n检测到两步验证...")
-                    password = input("请输入两步验证密码: ")
-                    await client.sign_in(password=password)
-                    print("✓ 登录成功！")
-                    
-            except (EOFError, KeyboardInterrupt):
-                print("\n\n❌ 登录被取消。")
-                await client.disconnect()
-                return []
+                # 外层被取消（Ctrl+C）时写出继续进行，由 wait_writing() 等待
+                await asyncio.shield(self.writing)
+            except asyncio.CancelledError:
+                raise
             except Exception as e:
-                print(f"\n❌ 登录失败: {e}")
-                await client.disconnect()
-                return []
-        
-        print("✓ 连接成功！")
-        
-        print(f"\n正在获取频道 @{CHANNEL_USERNAME} 的消息...")
-        
-        # 获取频道实体
-        entity = await client.get_entity(CHANNEL_USERNAME)
-        print(f"频道名称: {entity.title}")
-        print(f"频道ID: {entity.id}\n")
-        
-        # 获取消息
-        all_listings = []
-        message_count = 0
-        
-        async for message in client.iter_messages(entity, limit=MESSAGE_LIMIT):
-            message_count += 1
-            if message.text:
-                # 获取消息发布日期，用于 Alpha Coin 等没有明确日期的消息
-                msg_date = message.date.strftime('%Y-%m-%d')
-                listings = extract_listing_info(message.text, message_date=msg_date)
-                if listings:
-                    # 添加消息日期作为参考
-                    for listing in listings:
-                        # 确保日期有效（extract_listing_info 已经确保日期存在）
-                        date = listing.get('date', '')
-                        if not date or len(date) != 10 or date.count('-') != 2:
-                            # 如果日期无效，跳过这条 listing（不应该发生，因为 extract_listing_info 已经检查过）
-                            print(f"⚠️ 警告：消息 #{message.id} 的 listing 日期无效: {date}，跳过")
-                            continue
-                        listing['message_id'] = message.id
-                        listing['message_date'] = msg_date
-                        all_listings.append(listing)
-                    if listings:
-                        print(f"✓ 找到 {len([l for l in listings if l.get('date')])} 个 listing (消息 #{message.id})")
-        
-        print(f"\n总共处理了 {message_count} 条消息")
-        print(f"找到 {len(all_listings)} 个 CEX listing 信息\n")
-        
-        # 去重（基于日期、代币、交易所和类型）
-        # 先统一交易所名称为英文（避免中英文重复）
-        exchange_name_map = {
-            '币安': 'Binance',
-            '欧易': 'OKX',
-            '火币': 'Huobi',
-            'Gate': 'Gate',
-            '库币': 'KuCoin',
-        }
-        
-        for listing in all_listings:
-            exchange = listing.get('exchange', '')
-            if exchange in exchange_name_map:
-                listing['exchange'] = exchange_name_map[exchange]
-        
-        # 代币名称规范化（处理 BOBBOB/BOB 这种情况）
-        def normalize_token(token, token_display):
-            """规范化代币名称，处理变体"""
-            token_upper = token.upper()
-            # 如果代币显示名称包含括号，优先使用括号内的代码
-            if token_display and '(' in token_display:
-                # 提取括号内的代码，如 "BOB (BOBBOB)" -> "BOBBOB"
-                import re
-                match = re.search(r'\(([A-Z0-9]+)\)', token_display)
-                if match:
-                    return match.group(1).upper()
-            return token_upper
-        
-        # 处理重复的代币（如 BOB 和 BOBBOB）
-        # 如果两个代币中一个是另一个的子串，且较长的在 token_display 的括号中，使用较长的
-        token_groups = {}
-        for listing in all_listings:
-            token = listing.get('token', '').upper()
-            token_display = listing.get('token_display', token)
-            normalized = normalize_token(token, token_display)
-            
-            # 如果规范化后的代币与原始不同，更新
-            if normalized != token:
-                listing['token'] = normalized
-                if token_display and '(' in token_display:
-                    import re
-                    # 更新显示名称，确保括号内是规范化后的代码
-                    token_display = re.sub(r'\([^)]+\)', f'({normalized})', token_display)
-                    listing['token_display'] = token_display
-        
-        # 去重（先规范化所有代币）
-        for listing in all_listings:
-            token = listing.get('token', '').upper()
-            token_display = listing.get('token_display', token)
-            normalized_token = normalize_token(token, token_display)
-            
-            # 如果规范化后的代币与原始不同，更新
-            if normalized_token != token:
-                listing['token'] = normalized_token
-                if token_display and '(' in token_display:
-                    import re
-                    # 更新显示名称，确保括号内是规范化后的代码
-                    token_display = re.sub(r'\([^)]+\)', f'({normalized_token})', token_display)
-                    listing['token_display'] = token_display
-                elif token_display and token_display != token:
-                    # 如果 token_display 是 "BOB" 但 token 应该是 "BOBBOB"，更新显示名称
-                    # 这种情况需要从原始文本中查找
-                    pass
-        
-        # 去重
-        unique_listings = []
-        seen = set()
-        for listing in all_listings:
-            # 确保日期格式正确
-            date = listing.get('date', '')
-            if date and len(date) == 10 and date.count('-') == 2:
-                # 统一交易所名称为小写进行比较
-                exchange_lower = listing['exchange'].lower()
-                token = listing.get('token', '').upper()
-                key = (date, token, exchange_lower, listing.get('type', 'spot'))
-                if key not in seen:
-                    seen.add(key)
-                    unique_listings.append(listing)
-        
-        print(f"去重后剩余 {len(unique_listings)} 个 listing\n")
-        
-        # 按日期排序
-        unique_listings.sort(key=lambda x: x['date'])
-        
-        # 保存为 JSON
-        with open(OUTPUT_JSON, 'w', encoding='utf-8') as f:
-            json.dump(unique_listings, f, ensure_ascii=False, indent=2)
-        print(f"✓ 已保存到 {OUTPUT_JSON}")
+                self.failures += 1
+                print(f"❌ 发布失败（连续第 {self.failures} 次，{len(changed)} 个 listing 等待重试）: {e}")
+                import traceback
+                traceback.print_exc()
+                self.pending[:0] = changed
+                self.removed[:0] = removed
+                self.first_arrival = first_arrival
+                self.deadline = asyncio.get_running_loop().time() + self.debounce
+                return False
+            self.failures = 0
+            self.publish_count += 1
+            if first_arrival is not None:
+                print(f"✓ 已发布 {len(changed)} 个新 listing（到达后 {time.monotonic() - first_arrival:.1f} 秒）")
+        advance_checkpoint(self.checkpoint, self.progress)
+        return True
+
+    async def wait_writing(self):
+        """等待正在进行的写出结束（结果已由 publish 处理）"""
+        if self.writing is not None:
+            await asyncio.gather(self.writing, return_exceptions=True)
+
+    def stop(self):
+        """让 run() 处理完队列中已有的消息后返回（不取消任务，避免取消打断进行中的发布）"""
+        self.messages.put_nowait(None)
+
+    async def run(self):
+        """处理消息队列并按 debounce 发布，直到 stop()；连续发布失败 max_failures 次时抛出 RuntimeError"""
+        loop = asyncio.get_running_loop()
+        while True:
+            timeout = None if self.deadline is None else max(0.0, self.deadline - loop.time())
+            try:
+                item = await asyncio.wait_for(self.messages.get(), timeout)
+            except asyncio.TimeoutError:
+                if not await self.publish() and self.failures >= self.max_failures:
+                    raise RuntimeError(f"连续 {self.failures} 次发布失败")
+                continue
+            if item is None:
+                return
+            channel, message, edited = item
+            if self.process(channel, message, edited) and self.deadline is None:
+                self.deadline = loop.time() + self.debounce
+
+
+async def watch_channel(client=None, debounce=WATCH_DEBOUNCE, workers=EXTRACT_WORKERS,
+                        chunk_size=EXTRACT_CHUNK_SIZE, channels=None, concurrency=CHANNEL_CONCURRENCY,
+                        events=None):
+    """
+    守护模式：保持连接，订阅频道的新消息和编辑消息，到达后立即解析，按 debounce 合并发布
+    
+    启动时先按检查点补齐离线期间的消息（同 --incremental），之后只处理推送的事件，
+    不再重复抓取。断开连接时发布尚未写出的 listing。
+    
+    Args:
+        client: 已连接的客户端，默认调用 connect_client()（测试时可传入注入事件的假客户端）
+        debounce: 第一个新 listing 到达后等待的秒数
+        workers: 补齐阶段的解析进程数
+        chunk_size: 补齐阶段每次分发给进程池的消息条数
+        channels: 频道列表，默认 CHANNELS
+        concurrency: 补齐阶段同时抓取的频道数
+        events: 提供 NewMessage、MessageEdited 事件类型的模块，默认 telethon.events
+            （假客户端可以传入自己的事件类型，不需要安装 telethon）
+    
+    Returns:
+        断开连接后的 ListingWatcher，连接失败或出错时返回 None
+    """
+    channels = channels or CHANNELS
+    if client is None:
+        client = await connect_client()
+        if client is None:
+            return None
+    if events is None:
+        events = import_telethon().events
+    
+    watcher = None
+    consumer = None
+    cache = open_message_cache()
+    try:
+        checkpoint = load_checkpoint()
+        index = ListingIndex.load()
+        load_extract_cache()
+        watcher = ListingWatcher(index, checkpoint, debounce, cache)
         
-        # 更新 data.js
-        update_data_js(unique_listings)
-        print(f"✓ 已更新 {OUTPUT_JS}")
+        # 先订阅再补齐：补齐期间推送的消息在队列中等待，不会漏掉
+        for channel in channels:
+            client.add_event_handler(watcher.handler(channel), events.NewMessage(chats=channel))
+            client.add_event_handler(watcher.handler(channel, edited=True), events.MessageEdited(chats=channel))
         
-        return unique_listings
+        sink, watcher.progress = await fetch_messages(client, channels, index, checkpoint, True,
+                                                      workers=workers, chunk_size=chunk_size,
+                                                      concurrency=concurrency, cache=cache)
+        replaced, removed = await refresh_edited(client, index, watcher.progress, cache)
+        watcher.pending.extend(sink.listings + replaced)
+        watcher.removed.extend(removed)
+        if not await watcher.publish():
+            return None
         
+        consumer = asyncio.create_task(watcher.run())
+        # run() 出错（连续发布失败）时断开连接，结束监听
+        consumer.add_done_callback(
+            lambda task: task.cancelled() or task.exception() is None or asyncio.ensure_future(client.disconnect()))
+        print(f"\n正在监听 {', '.join('@' + channel for channel in channels)} 的新消息"
+              f"（合并 {debounce} 秒内的更新，Ctrl+C 退出）...")
+        await client.run_until_disconnected()
+        if consumer.done() and not consumer.cancelled() and consumer.exception() is not None:
+            raise consumer.exception()
+        return watcher
+    
     except Exception as e:
         print(f"❌ 错误: {e}")
         import traceback
         traceback.print_exc()
     finally:
+        if consumer is not None:
+            watcher.stop()
+            await asyncio.gather(consumer, return_exceptions=True)
+        if watcher is not None and watcher.progress:
+            # 等待进行中的写出，处理队列中剩余的消息并发布
+            await watcher.wait_writing()
+            while not watcher.messages.empty():
+                item = watcher.messages.get_nowait()
+                if item is not None:
+                    watcher.process(*item)
+            await watcher.publish()
+            save_extract_cache()
+        if cache is not None:
+            cache.close()
         await client.disconnect()
 
 
+DATA_JS_HEADER = (
+    "// CEX Listing 数据\n"
+    "// 格式：{ date: 'YYYY-MM-DD', token: '代币代码', token_display: '显示名称', exchange: '交易所', "
+    "type: 'perp/spot/alpha', time: '时间', pairs: '交易对', notes: '备注' }\n"
+    "// 自动从 @news6551 爬取的数据\n\n"
+    "const cexListings = [\n"
+)
+# 数组结尾和水位线（已发布的记录数、每个来源频道的最大消息 ID、距上次整体重写的追加次数）
+DATA_JS_FOOTER = "];\n// watermark: "
+
+
+def _js_record(listing):
+    """单条记录的 JS 字面量（JSON 是合法的 JS，转义由 json 处理）"""
+    text = json.dumps(listing_record(listing), ensure_ascii=False)
+    # U+2028/U+2029 在旧版 JS 字符串中不合法
+    return text.replace('\u2028', '\\u2028').replace('\u2029', '\\u2029')
+
+
+def _data_js_footer(watermark):
+    return f"{DATA_JS_FOOTER}{json.dumps(watermark, sort_keys=True)}\n"
+
+
+def _watermark(listings, count, appends, message_ids=None):
+    """水位线；message_ids 按来源频道记录最大消息 ID（没有来源的记录为 ''），在已有的基础上更新"""
+    message_ids = dict(message_ids or {})
+    for listing in listings:
+        source = listing.get('source') or ''
+        message_ids[source] = max(message_ids.get(source, 0), listing.get('message_id') or 0)
+    return {'count': count, 'message_ids': message_ids, 'appends': appends}
+
+
+def read_data_js_watermark(path=None):
+    """
+    读取 data.js 末尾的水位线
+    
+    Returns:
+        水位线字典（offset 为数组结尾在文件中的字节位置），文件不存在或格式不对时返回 None
+    """
+    try:
+        with open(path or OUTPUT_JS, 'rb') as f:
+            size = f.seek(0, os.SEEK_END)
+            # 水位线随频道数增长，频道很多时也在末尾 4KB 之内
+            f.seek(max(0, size - 4096))
+            tail = f.read()
+    except OSError:
+        return None
+    position = tail.rfind(DATA_JS_FOOTER.encode('utf-8'))
+    if position < 0:
+        return None
+    try:
+        watermark = json.loads(tail[position + len(DATA_JS_FOOTER):])
+    except ValueError:
+        return None
+    watermark['offset'] = size - len(tail) + position
+    return watermark
+
+
 def update_data_js(listings):
-    """更新 data.js 文件"""
-    js_content = "// CEX Listing 数据\n"
-    js_content += "// 格式：{ date: 'YYYY-MM-DD', token: '代币代码', token_display: '显示名称', exchange: '交易所', type: 'perp/spot/alpha', time: '时间', pairs: '交易对', notes: '备注' }\n"
-    js_content += "// 自动从 @news6551 爬取的数据\n\n"
-    js_content += "const cexListings = [\n"
+    """整体重写 data.js：逐条写入文件，不在内存中拼接整个文件（预压缩版本由 save_outputs 生成）"""
+    count = 0
+    with atomic_open(OUTPUT_JS) as f:
+        f.write(DATA_JS_HEADER.encode('utf-8'))
+        for listing in listings:
+            f.write(f"    {_js_record(listing)},\n".encode('utf-8'))
+            count += 1
+        f.write(_data_js_footer(_watermark(listings, count, 0)).encode('utf-8'))
+
+
+def append_data_js(new_listings, watermark):
+    """在 data.js 的数组结尾前追加记录，并更新水位线（预压缩版本由 save_outputs 生成）"""
+    with atomic_open(OUTPUT_JS, copy_existing=True) as f:
+        f.seek(watermark['offset'])
+        f.truncate()
+        for listing in new_listings:
+            f.write(f"    {_js_record(listing)},\n".encode('utf-8'))
+        f.write(_data_js_footer(_watermark(new_listings, watermark['count'] + len(new_listings),
+                                           watermark['appends'] + 1, watermark['message_ids'])).encode('utf-8'))
+
+
+def _json_item(listing):
+    """cex_listings.json 中的一条记录，与 json.dump(listings, indent=2) 的输出一致"""
+    return json.dumps(listing_dict(listing), ensure_ascii=False, indent=2).replace('\n', '\n  ')
+
+
+def write_listings_json(listings):
+    """整体重写 cex_listings.json：逐条写入文件"""
+    with atomic_open(OUTPUT_JSON) as f:
+        separator = '\n  '
+        empty = True
+        for listing in listings:
+            f.write(f"{'[' if empty else ','}{separator}{_json_item(listing)}".encode('utf-8'))
+            empty = False
+        f.write(b'[]' if empty else b'\n]')
+
+
+def append_listings_json(new_listings):
+    """在 cex_listings.json 的数组结尾前追加记录；文件为空数组或格式不对时返回 False"""
+    path = Path(OUTPUT_JSON)
+    try:
+        with open(path, 'rb') as f:
+            size = f.seek(0, os.SEEK_END)
+            f.seek(max(0, size - 2))
+            tail = f.read()
+    except OSError:
+        return False
+    if tail != b'\n]':
+        return False
+    with atomic_open(path, copy_existing=True) as f:
+        f.seek(size - 2)
+        f.truncate()
+        for listing in new_listings:
+            f.write(f",\n  {_json_item(listing)}".encode('utf-8'))
+        f.write(b'\n]')
+    return True
+
+
+def listing_record(listing):
+    """导出给前端的记录，字段与 data.js 一致"""
+    listing = listing_dict(listing)
+    record = {
+        'date': listing['date'],
+        'token': listing['token'],
+        # 使用显示名称（如果有），否则使用代币代码
+        'token_display': listing.get('token_display', listing['token']),
+        'exchange': listing['exchange'],
+        'type': listing.get('type', 'spot'),
+    }
+    if listing.get('time'):
+        record['time'] = listing['time']
+    if listing.get('pairs'):
+        record['pairs'] = listing['pairs']
+    if listing.get('text'):
+        record['notes'] = listing['text'].replace('\n', ' ')[:150]
+    return record
+
+
+def _intern(table, index, value):
+    """把字符串放入表中（已存在则复用），返回下标；None 返回 -1"""
+    if value is None:
+        return -1
+    position = index.get(value)
+    if position is None:
+        position = index[value] = len(table)
+        table.append(value)
+    return position
+
+
+def encode_compact(listings):
+    """
+    把 listing 编码为紧凑的字典编码格式
+    
+    - exchanges / types：交易所和类型的字符串表
+    - strings：日期、代币、显示名称、时间、交易对共用的字符串表
+    - notes：相同的 notes 只存一次（按文本去重），记录通过下标引用
+    - columns：每个字段一列等长的整数数组，-1 表示没有该字段；
+      display 为 -1 表示显示名称与代币代码相同
+    
+    decode_compact（以及 script.js 中的 decodeCompactListings）还原为 data.js 的记录格式。
+    """
+    exchanges, types, strings, notes = [], [], [], []
+    exchange_index, type_index, string_index, note_index = {}, {}, {}, {}
+    columns = {name: [] for name in ('date', 'token', 'display', 'exchange', 'type', 'time', 'pairs', 'note')}
     
     for listing in listings:
-        js_content += "    {\n"
-        js_content += f"        date: '{listing['date']}',\n"
-        js_content += f"        token: '{listing['token']}',\n"
-        # 使用显示名称（如果有），否则使用代币代码
-        token_display = listing.get('token_display', listing['token'])
-        js_content += f"        token_display: '{token_display}',\n"
-        js_content += f"        exchange: '{listing['exchange']}',\n"
-        js_content += f"        type: '{listing.get('type', 'spot')}',\n"
-        if listing.get('time'):
-            js_content += f"        time: '{listing['time']}',\n"
-        if listing.get('pairs'):
-            js_content += f"        pairs: '{listing['pairs']}',\n"
-        if listing.get('text'):
-            # 清理文本，移除换行和引号
-            text = listing['text'].replace('\n', ' ').replace("'", "\\'").replace('"', '\\"')
-            js_content += f"        notes: '{text[:150]}',\n"
-        js_content += "    },\n"
-    
-    js_content += "];\n"
-    
-    with open(OUTPUT_JS, 'w', encoding='utf-8') as f:
-        f.write(js_content)
+        record = listing_record(listing)
+        columns['date'].append(_intern(strings, string_index, record['date']))
+        columns['token'].append(_intern(strings, string_index, record['token']))
+        display = record['token_display']
+        columns['display'].append(-1 if display == record['token'] else _intern(strings, string_index, display))
+        columns['exchange'].append(_intern(exchanges, exchange_index, record['exchange']))
+        columns['type'].append(_intern(types, type_index, record['type']))
+        columns['time'].append(_intern(strings, string_index, record.get('time')))
+        columns['pairs'].append(_intern(strings, string_index, record.get('pairs')))
+        
+        note = record.get('notes')
+        if note is None:
+            columns['note'].append(-1)
+        else:
+            # 同一条消息拆分出的多条 listing（以及转发的相同公告）共用一份 notes；
+            # 不能按 message_id 去重，不同频道的消息 ID 会重复
+            position = note_index.get(note)
+            if position is None:
+                position = note_index[note] = len(notes)
+                notes.append(note)
+            columns['note'].append(position)
+    
+    return {
+        'v': COMPACT_FORMAT_VERSION,
+        'exchanges': exchanges,
+        'types': types,
+        'strings': strings,
+        'notes': notes,
+        'columns': columns,
+    }
 
 
-if __name__ == '__main__':
-    print("=" * 50)
-    print("Telegram Channel Scraper - @news6551")
-    print("=" * 50)
-    print()
+def decode_compact(payload):
+    """把 encode_compact 的结果还原为 data.js 的记录格式"""
+    strings = payload['strings']
+    columns = payload['columns']
+    records = []
+    for i in range(len(columns['date'])):
+        token = strings[columns['token'][i]]
+        display = columns['display'][i]
+        record = {
+            'date': strings[columns['date'][i]],
+            'token': token,
+            'token_display': token if display < 0 else strings[display],
+            'exchange': payload['exchanges'][columns['exchange'][i]],
+            'type': payload['types'][columns['type'][i]],
+        }
+        if columns['time'][i] >= 0:
+            record['time'] = strings[columns['time'][i]]
+        if columns['pairs'][i] >= 0:
+            record['pairs'] = strings[columns['pairs'][i]]
+        if columns['note'][i] >= 0:
+            record['notes'] = payload['notes'][columns['note'][i]]
+        records.append(record)
+    return records
+
+
+# listing 类型 -> 交易所统计中的键
+_STAT_KEYS = {'spot': 'spot', 'perp': 'perp', 'pre-market': 'premarket', 'alpha': 'alpha'}
+
+
+def build_month_index(listings):
+    """
+    为一个月份的 listing（按日期排序）预先计算前端需要的查找结构
+    
+    Returns:
+        (by_date, exchange_stats)
+        by_date: {日期: [起始下标, 条数]}，该日期的记录在分片中是连续的一段
+        exchange_stats: {交易所: {'total': n, 'spot': n, 'perp': n, 'premarket': n, 'alpha': n}}
+            （没有 type 的记录只计入 total；pre-market 类型计入 premarket，与前端的统计一致）
+    """
+    by_date = {}
+    exchange_stats = {}
+    for position, listing in enumerate(listings):
+        date = listing['date']
+        if date in by_date:
+            by_date[date][1] += 1
+        else:
+            by_date[date] = [position, 1]
+        
+        stats = exchange_stats.setdefault(
+            listing['exchange'], {'total': 0, 'spot': 0, 'perp': 0, 'premarket': 0, 'alpha': 0})
+        stats['total'] += 1
+        stat_key = _STAT_KEYS.get(listing.get('type'))
+        if stat_key:
+            stats[stat_key] += 1
+    return by_date, exchange_stats
+
+
+def _load_manifest(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+_SHARD_FILE = re.compile(r'(\d{4}-\d{2})(\.[0-9a-f]{16})?\.json(\.gz|\.br)?')
+_MANIFEST_VERSION_FILE = re.compile(r'manifest\.[0-9a-f]{16}\.json(\.gz|\.br)?')
+
+
+def export_month_shards(listings, out_dir=None, shard_format=None, changed_months=None):
+    """
+    按月输出分片 data/YYYY-MM.<哈希>.json 和清单 data/manifest.<哈希>.json
+    
+    清单记录每个月份的文件名、条数、内容哈希和各交易所的统计，前端据此只加载正在查看的
+    月份。compact 分片附带按日期的下标区间（by_date），前端渲染每个日期格子时直接查表。
+    
+    文件名带内容哈希，可以长期缓存（immutable）；内容没有变化的分片不会重写。
+    每个文件都原子写入并附带预压缩版本。清单另外写一份固定名字的 manifest.json 作为后备。
+    上一版清单引用的文件保留一轮，之后的旧文件会被删除，避免正在加载旧版本的页面取不到分片。
+    
+    Args:
+        listings: 按日期排序的 listing
+        out_dir: 输出目录，默认 DATA_DIR
+        shard_format: 'compact'（字典编码，见 encode_compact）或 'json'（记录数组），
+            默认 SHARD_FORMAT
+        changed_months: 只有这些月份（'YYYY-MM'）有变化时传入（追加发布），其他月份沿用上一版清单
+            中的分片，不再重新编码；默认全部重新生成
+    
+    Returns:
+        manifest 字典（file 字段为带哈希的清单文件名）
+    """
+    shard_format = shard_format or SHARD_FORMAT
+    out = Path(out_dir or DATA_DIR)
+    out.mkdir(parents=True, exist_ok=True)
+    previous = _load_manifest(out / MANIFEST_FILE)
+    
+    months = {}
+    for listing in listings:
+        months.setdefault(listing['date'][:7], []).append(listing)
+    
+    reusable = {}
+    if changed_months is not None and previous.get('format') == shard_format:
+        reusable = previous.get('months', {})
+    
+    entries = {}
+    for month in sorted(months):
+        entry = reusable.get(month)
+        if (entry is not None and month not in changed_months and entry.get('count') == len(months[month])
+                and (out / entry['file']).exists()):
+            entries[month] = entry
+            continue
+        records = sorted(months[month], key=lambda listing: listing['date'])
+        by_date, exchange_stats = build_month_index(records)
+        if shard_format == 'compact':
+            payload = encode_compact(records)
+            payload['by_date'] = by_date
+        else:
+            payload = [listing_record(listing) for listing in records]
+        content = json.dumps(payload, ensure_ascii=False, separators=(',', ':'))
+        digest = content_hash(content)
+        filename = f"{month}.{digest}.json"
+        if not (out / filename).exists():
+            publish_file(out / filename, content)
+        entries[month] = {
+            'file': filename,
+            'count': len(records),
+            'hash': digest,
+            'exchanges': exchange_stats,
+        }
+    
+    manifest = {
+        'total': len(listings),
+        'format': shard_format,
+        'exchanges': sorted({listing['exchange'] for listing in listings if listing.get('exchange')}),
+        'months': entries,
+    }
+    content = json.dumps(manifest, ensure_ascii=False, indent=2)
+    manifest['file'] = f"manifest.{content_hash(content)}.json"
+    publish_file(out / manifest['file'], content)
+    # 固定名字的清单额外记录带哈希的文件名，下次发布时据此保留上一版
+    publish_file(out / MANIFEST_FILE, json.dumps(manifest, ensure_ascii=False, indent=2))
+    
+    # 清理不再被当前和上一版清单引用的文件
+    keep = {manifest['file'], previous.get('file')}
+    keep.update(entry['file'] for entry in entries.values())
+    keep.update(entry.get('file') for entry in previous.get('months', {}).values())
+    for path in out.iterdir():
+        if not (_SHARD_FILE.fullmatch(path.name) or _MANIFEST_VERSION_FILE.fullmatch(path.name)):
+            continue
+        if path.name.rsplit('.json', 1)[0] + '.json' not in keep:
+            path.unlink()
+    return manifest
+
+
+def update_index_html(manifest_file, path=None):
+    """
+    改写 index.html 中的引用：数据清单指向带哈希的文件，静态资源的 ?v= 改为内容哈希
     
-    # 检查配置
+    Returns:
+        是否有改动
+    """
+    path = Path(path or INDEX_HTML)
+    if not path.exists():
+        return False
+    html = path.read_text(encoding='utf-8')
+    updated = re.sub(r'(<meta name="data-manifest" content=")[^"]*(")',
+                     lambda m: f'{m.group(1)}{DATA_DIR}/{manifest_file}{m.group(2)}', html)
+    for asset in STATIC_ASSETS:
+        asset_path = path.parent / asset
+        if asset_path.exists():
+            version = content_hash(asset_path.read_bytes(), 12)
+            updated = re.sub(rf'({re.escape(asset)})\?v=[^"\']*', rf'\g<1>?v={version}', updated)
+    if updated == html:
+        return False
+    atomic_write(path, updated)
+    return True
+
+
+def check_config():
+    """检查 Telegram API 凭证是否已配置"""
     if API_ID == 'YOUR_API_ID' or API_HASH == 'YOUR_API_HASH':
         print("⚠️  请先配置 API_ID 和 API_HASH！")
         print()
@@ -738,13 +2801,188 @@ if __name__ == '__main__':
         print("  2. 登录你的 Telegram 账号")
         print("  3. 创建应用，获取 api_id 和 api_hash")
         print()
-        exit(1)
+        return False
+    return True
+
+
+def print_stats(top=10):
+    """显示已有数据的概况：listing 数量和日期范围、各交易所/类型/月份的记录数、各频道的检查点和缓存"""
+    listings = ListingIndex.load().listings()
+    if listings:
+        print(f"listing：{len(listings)} 个（{listings[0]['date']} ~ {listings[-1]['date']}）")
+        for title, field, default in (('交易所', 'exchange', None), ('类型', 'type', None),
+                                      ('来源频道', 'source', CHANNEL_USERNAME)):
+            counts = Counter(listing.get(field) or default for listing in listings)
+            more = f" 等 {len(counts)} 个" if len(counts) > top else ''
+            print(f"按{title}：{', '.join(f'{name} {count}' for name, count in counts.most_common(top))}{more}")
+        months = Counter(listing['date'][:7] for listing in listings)
+        recent = sorted(months.items())[-6:]
+        print(f"最近的月份：{', '.join(f'{month} {count}' for month, count in recent)}")
+    else:
+        print(f"还没有 listing（{OUTPUT_JSON} 不存在或为空）")
+    
+    checkpoint = load_checkpoint()
+    for channel, state in checkpoint.items():
+        backfill = state.get('backfill')
+        pending = f"，回填进行中（已获取 {backfill['fetched']} 条）" if backfill else ''
+        print(f"检查点 @{channel}：消息 #{state.get('last_message_id', 0)}（更新于 {state.get('updated_at', '-')}）{pending}")
+    if MESSAGE_CACHE and Path(MESSAGE_CACHE).exists():
+        with MessageCache(MESSAGE_CACHE) as cache:
+            print(f"原始消息缓存 {MESSAGE_CACHE}：{len(cache)} 条消息")
+    if LISTING_DB and Path(LISTING_DB).exists():
+        with ListingDatabase(LISTING_DB) as db:
+            print(f"listing 数据库 {LISTING_DB}：{len(db)} 条记录")
+
+
+COMMANDS = ('fetch', 'parse', 'export', 'stats')
+
+
+def build_parser():
+    """命令行：fetch（连接 Telegram 抓取）、parse（离线解析）、export（重新生成输出）、stats（数据概况）"""
+    parser = argparse.ArgumentParser(
+        description='爬取 Telegram 频道的 CEX listing 信息',
+        epilog='不带子命令时兼容旧的参数：--replay/--reprocess 等同于 parse，--export 等同于 export，其余等同于 fetch')
+    commands = parser.add_subparsers(dest='command', metavar='{' + ','.join(COMMANDS) + '}', required=True)
+    
+    metrics = argparse.ArgumentParser(add_help=False)
+    metrics.add_argument('--metrics', metavar='PATH', default=METRICS_FILE or None,
+                         help='记录各阶段耗时和各条规则的命中统计，结束时写入 PATH'
+                              '（.prom 为 Prometheus textfile，其余为 JSON）')
+    extract = argparse.ArgumentParser(add_help=False)
+    extract.add_argument('--workers', type=int, default=EXTRACT_WORKERS,
+                         help='解析进程数，0 表示串行解析（默认：%(default)s）')
+    extract.add_argument('--chunk-size', type=int, default=EXTRACT_CHUNK_SIZE,
+                         help='每次分发给进程池的消息条数（默认：%(default)s）')
+    channels = argparse.ArgumentParser(add_help=False)
+    channels.add_argument('--channel', action='append', dest='channels', metavar='NAME',
+                          help='只处理这些频道，可重复指定多个（默认：config 中的 CHANNELS）')
+    
+    fetch = commands.add_parser('fetch', parents=[channels, extract, metrics],
+                                help='连接 Telegram 抓取频道消息（不带子命令时的默认行为）')
+    fetch.add_argument('--incremental', action='store_true',
+                       help=f'增量模式：只获取 {CHECKPOINT_FILE} 记录之后的新消息并合并到已有数据')
+    fetch.add_argument('--check-edits', action='store_true',
+                       help=f'增量模式下总是重新检查最近 {EDIT_LOOKBACK} 条消息是否被编辑'
+                            f'（默认只在检查点移动后检查）')
+    fetch.add_argument('--concurrency', type=int, default=CHANNEL_CONCURRENCY,
+                       help='同时抓取的频道数（默认：%(default)s）')
+    fetch.add_argument('--backfill', type=int, metavar='N',
+                       help='可续传的历史回填：按页获取每个频道最近 N 条消息（0 表示全部历史），'
+                            '中断后再次运行会从上次的位置继续')
+    fetch.add_argument('--page-size', type=int, default=BACKFILL_PAGE_SIZE,
+                       help='回填时每页的消息数（默认：%(default)s）')
+    fetch.add_argument('--parallel', type=int, default=BACKFILL_PARALLEL,
+                       help='回填时按消息 ID 范围同时获取的请求数，1 表示逐页顺序获取（默认：%(default)s）')
+    fetch.add_argument('--watch', action='store_true',
+                       help='守护模式：保持连接，订阅新消息和编辑消息并实时发布')
+    fetch.add_argument('--debounce', type=float, default=WATCH_DEBOUNCE,
+                       help='守护模式下合并发布的等待秒数（默认：%(default)s）')
+    
+    parse = commands.add_parser('parse', parents=[channels, extract, metrics],
+                                help=f'离线解析：用当前规则重新解析 {MESSAGE_CACHE} 中缓存的全部消息，'
+                                     f'或回放消息导出文件，不连接 Telegram')
+    parse.add_argument('--replay', metavar='DUMP',
+                       help='从 JSONL 消息导出文件（每行 id/date/text）解析，而不是消息缓存')
+    parse.add_argument('--incremental', action='store_true',
+                       help='回放时合并到已有数据，只有新增 listing 时才重写输出文件')
+    # 旧参数：parse 默认就是重新解析消息缓存
+    parse.add_argument('--reprocess', action='store_true', help=argparse.SUPPRESS)
+    
+    export = commands.add_parser('export', parents=[metrics],
+                                 help='从 LISTING_DB（未启用或为空时从 cex_listings.json）重新生成 '
+                                      'cex_listings.json、data.js 和月份分片，不连接 Telegram')
+    export.add_argument('--export', action='store_true', help=argparse.SUPPRESS)
+    
+    commands.add_parser('stats', help='显示已有数据的概况（listing 数、各交易所/类型的记录数、检查点），不连接 Telegram')
+    return parser
+
+
+def _legacy_command(argv):
+    """旧的命令行（没有子命令）对应的子命令，优先级与旧版相同：回放/重新解析 > 导出 > 抓取"""
+    if '--reprocess' in argv or any(arg == '--replay' or arg.startswith('--replay=') for arg in argv):
+        return 'parse'
+    if '--export' in argv:
+        return 'export'
+    return 'fetch'
+
+
+def parse_args(argv=None):
+    """解析命令行参数；没有子命令时按旧的参数推断（python scraper.py --incremental 等同于 fetch --incremental）"""
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if not argv or (argv[0] not in COMMANDS and argv[0] not in ('-h', '--help')):
+        argv = [_legacy_command(argv)] + argv
+    return build_parser().parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.command == 'stats':
+        print_stats()
+        return 0
+    
+    print("=" * 50)
+    print("Telegram Channel Scraper - @news6551")
+    print("=" * 50)
+    print()
+    
+    if args.metrics:
+        # 规则命中统计只覆盖主进程中的解析（--workers 0 时为全部消息）
+        enable_metrics()
+    
+    # 各模式失败时（没有数据、连接失败、出错）返回 None
+    try:
+        if args.command == 'parse':
+            # 离线解析不需要 Telegram 凭证，也不导入 telethon
+            if args.replay:
+                result = asyncio.run(replay_dump(args.replay, incremental=args.incremental,
+                                                 workers=args.workers, chunk_size=args.chunk_size))
+            else:
+                result = asyncio.run(reprocess(workers=args.workers, chunk_size=args.chunk_size,
+                                               channels=args.channels))
+        elif args.command == 'export':
+            result = export_listing_db()
+        else:
+            # 检查配置
+            if not check_config():
+                return 1
+            
+            if args.backfill is not None:
+                try:
+                    result = asyncio.run(backfill(target=args.backfill, page_size=args.page_size,
+                                                  workers=args.workers, chunk_size=args.chunk_size,
+                                                  channels=args.channels, parallel=args.parallel))
+                except KeyboardInterrupt:
+                    print("\n回填已中断，再次运行同样的命令即可继续")
+                    return 1
+            elif args.watch:
+                try:
+                    result = asyncio.run(watch_channel(debounce=args.debounce,
+                                                       workers=args.workers, chunk_size=args.chunk_size,
+                                                       channels=args.channels, concurrency=args.concurrency))
+                except KeyboardInterrupt:
+                    # Ctrl+C 是守护模式正常的退出方式
+                    print("\n已停止监听")
+                    result = True
+            else:
+                # 运行爬虫
+                result = asyncio.run(scrape_channel(incremental=args.incremental,
+                                                    workers=args.workers, chunk_size=args.chunk_size,
+                                                    channels=args.channels, concurrency=args.concurrency,
+                                                    check_edits=args.check_edits))
+    finally:
+        if args.metrics:
+            write_metrics(args.metrics)
     
-    # 运行爬虫
-    asyncio.run(scrape_channel())
+    if result is None:
+        print("\n❌ 运行失败，详见上面的错误信息")
+        return 1
     
     print()
     print("=" * 50)
     print("完成！")
     print("=" * 50)
+    return 0
 
+
+if __name__ == '__main__':
+    sys.exit(main())
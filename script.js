@@ -12,21 +12,192 @@ const monthNames = [
     '七月', '八月', '九月', '十月', '十一月', '十二月'
 ];
 
+// 数据按月分片：清单列出所有月份，日历只加载当前视图需要的月份
+// 清单和分片的文件名都带内容哈希，index.html 的 data-manifest 指向当前版本
+const DATA_DIR = 'data';
+const MANIFEST_URL = (document.querySelector('meta[name="data-manifest"]') || {}).content
+    || `${DATA_DIR}/manifest.json`;
+let manifest = null;
+const monthCache = {};    // 'YYYY-MM' -> { events, byDate, stats }
+const monthLoading = {};  // 'YYYY-MM' -> 正在加载的 Promise
+let renderToken = 0;      // 快速翻页时丢弃过期的渲染
+
 // 初始化日历
-function initCalendar() {
+async function initCalendar() {
+    await loadManifest();
     initExchangeFilter();
+    setupEventListeners();
+    await refreshCalendar();
+}
+
+// 加载月份清单；失败时（如直接用 file:// 打开）退回到整体加载 data.js
+async function loadManifest() {
+    try {
+        const response = await fetch(MANIFEST_URL, { cache: 'no-cache' });
+        if (!response.ok) throw new Error(`HTTP ${response.status}`);
+        manifest = await response.json();
+    } catch (error) {
+        console.warn('加载 manifest.json 失败，改为加载 data.js：', error);
+        await loadLegacyData();
+    }
+}
+
+// 整体加载 data.js，并按月份放入缓存
+function loadLegacyData() {
+    return new Promise(resolve => {
+        const script = document.createElement('script');
+        script.src = 'data.js';
+        script.onload = () => {
+            const grouped = {};
+            cexListings.forEach(event => {
+                const key = event.date.slice(0, 7);
+                (grouped[key] = grouped[key] || []).push(event);
+            });
+            const months = {};
+            Object.keys(grouped).forEach(key => {
+                monthCache[key] = indexMonth(grouped[key]);
+                months[key] = { count: grouped[key].length, exchanges: monthCache[key].stats };
+            });
+            const exchanges = [...new Set(cexListings.map(event => event.exchange).filter(Boolean))].sort();
+            manifest = { exchanges, months };
+            resolve();
+        };
+        script.onerror = () => {
+            manifest = { exchanges: [], months: {} };
+            resolve();
+        };
+        document.head.appendChild(script);
+    });
+}
+
+// 月份键 'YYYY-MM'（month 从 0 开始，允许越界，如 -1 表示上一年 12 月）
+function monthKey(year, month) {
+    const date = new Date(year, month, 1);
+    return `${date.getFullYear()}-${String(date.getMonth() + 1).padStart(2, '0')}`;
+}
+
+// 还原字典编码的分片（格式见 scraper.py 的 encode_compact）为 data.js 的记录格式
+function decodeCompactListings(payload) {
+    const { exchanges, types, strings, notes, columns } = payload;
+    const count = columns.date.length;
+    const events = new Array(count);
+    for (let i = 0; i < count; i++) {
+        const token = strings[columns.token[i]];
+        const display = columns.display[i];
+        const event = {
+            date: strings[columns.date[i]],
+            token: token,
+            token_display: display < 0 ? token : strings[display],
+            exchange: exchanges[columns.exchange[i]],
+            type: types[columns.type[i]]
+        };
+        if (columns.time[i] >= 0) event.time = strings[columns.time[i]];
+        if (columns.pairs[i] >= 0) event.pairs = strings[columns.pairs[i]];
+        if (columns.note[i] >= 0) event.notes = notes[columns.note[i]];
+        events[i] = event;
+    }
+    return events;
+}
+
+// 类型 -> 统计中的键（没有 type 的事件只计入 total）
+const STAT_KEYS = { spot: 'spot', perp: 'perp', 'pre-market': 'premarket', alpha: 'alpha' };
+
+// 统计每个交易所各类型的数量（manifest 没有提供统计时使用）
+function computeExchangeStats(events) {
+    const stats = {};
+    events.forEach(event => {
+        if (!event.exchange) return;
+        const stat = stats[event.exchange] = stats[event.exchange] ||
+            { total: 0, spot: 0, perp: 0, premarket: 0, alpha: 0 };
+        stat.total++;
+        const key = STAT_KEYS[event.type];
+        if (key) stat[key]++;
+    });
+    return stats;
+}
+
+// 建立月份的查找结构：byDate 为 日期 -> 当天的事件，stats 为各交易所统计
+// byDateRanges / stats 由 scraper.py 预先计算；没有时在加载时计算一次
+function indexMonth(events, byDateRanges, stats) {
+    const byDate = {};
+    if (byDateRanges) {
+        Object.keys(byDateRanges).forEach(date => {
+            const [start, count] = byDateRanges[date];
+            byDate[date] = events.slice(start, start + count);
+        });
+    } else {
+        events.forEach(event => {
+            (byDate[event.date] = byDate[event.date] || []).push(event);
+        });
+    }
+    return { events, byDate, stats: stats || computeExchangeStats(events) };
+}
+
+// 加载某个月份的分片（已缓存或没有数据时直接返回）
+function loadMonth(key) {
+    if (monthCache[key]) return Promise.resolve(monthCache[key]);
+    const entry = manifest && manifest.months[key];
+    if (!entry || !entry.file) {
+        monthCache[key] = indexMonth([]);
+        return Promise.resolve(monthCache[key]);
+    }
+    if (!monthLoading[key]) {
+        monthLoading[key] = fetch(`${DATA_DIR}/${entry.file}`)
+            .then(response => {
+                if (!response.ok) throw new Error(`HTTP ${response.status}`);
+                return response.json();
+            })
+            .then(payload => {
+                const compact = manifest.format === 'compact';
+                const events = compact ? decodeCompactListings(payload) : payload;
+                monthCache[key] = indexMonth(events, compact ? payload.by_date : null, entry.exchanges);
+                return monthCache[key];
+            })
+            .catch(error => {
+                console.warn(`加载 ${key} 数据失败：`, error);
+                return indexMonth([]);
+            })
+            .finally(() => {
+                delete monthLoading[key];
+            });
+    }
+    return monthLoading[key];
+}
+
+// 加载当前视图需要的月份（日历会显示上月末和下月初的日期）
+function loadVisibleMonths() {
+    return Promise.all([-1, 0, 1].map(offset => loadMonth(monthKey(currentYear, currentMonth + offset))));
+}
+
+// 空闲时预取前后相邻的月份，翻页时不用等待
+function prefetchAdjacentMonths() {
+    const prefetch = () => {
+        [-2, 2].forEach(offset => loadMonth(monthKey(currentYear, currentMonth + offset)));
+    };
+    if ('requestIdleCallback' in window) {
+        requestIdleCallback(prefetch);
+    } else {
+        setTimeout(prefetch, 200);
+    }
+}
+
+// 切换月份或加载完成后重新渲染
+async function refreshCalendar() {
+    const token = ++renderToken;
     updateCalendarHeader();
+    await loadVisibleMonths();
+    if (token !== renderToken) return;
     renderCalendar();
     updateExchangeStats();
-    setupEventListeners();
+    prefetchAdjacentMonths();
 }
 
 // 初始化交易所筛选下拉框
 function initExchangeFilter() {
     const filter = document.getElementById('exchangeFilter');
     
-    // 获取所有唯一的交易所
-    const exchanges = [...new Set(cexListings.map(event => event.exchange).filter(Boolean))].sort();
+    // 获取所有唯一的交易所（由 manifest 提供）
+    const exchanges = manifest.exchanges || [];
     
     // 添加选项
     exchanges.forEach(exchange => {
@@ -173,7 +344,8 @@ function getExchangeClass(exchange) {
 
 // 获取指定日期的事件
 function getEventsForDate(dateStr) {
-    let events = cexListings.filter(event => event.date === dateStr);
+    const month = monthCache[dateStr.slice(0, 7)];
+    let events = (month && month.byDate[dateStr]) || [];
     
     // 如果选择了交易所筛选，则进一步过滤
     if (selectedExchange) {
@@ -226,9 +398,7 @@ function setupEventListeners() {
             currentMonth = 11;
             currentYear--;
         }
-        updateCalendarHeader();
-        renderCalendar();
-        updateExchangeStats();
+        refreshCalendar();
     });
 
     // 下个月按钮
@@ -238,9 +408,7 @@ function setupEventListeners() {
             currentMonth = 0;
             currentYear++;
         }
-        updateCalendarHeader();
-        renderCalendar();
-        updateExchangeStats();
+        refreshCalendar();
     });
 
     // 关闭模态框
@@ -271,33 +439,12 @@ function updateExchangeStats() {
     const statsPanel = document.getElementById('exchangeStats');
     if (!statsPanel) return;
     
-    // 获取当前月份的第一天和最后一天
-    const firstDay = new Date(currentYear, currentMonth, 1);
-    const lastDay = new Date(currentYear, currentMonth + 1, 0);
-    const monthStart = formatDate(currentYear, currentMonth, 1);
-    const monthEnd = formatDate(currentYear, currentMonth, lastDay.getDate());
-    
-    // 筛选当前月份的数据
-    const monthEvents = cexListings.filter(event => {
-        const eventDate = event.date;
-        return eventDate >= monthStart && eventDate <= monthEnd;
-    });
+    // 当前月份各交易所的统计（预先计算好的）
+    const month = monthCache[monthKey(currentYear, currentMonth)];
+    const stats = month ? month.stats : {};
     
     // 获取所有交易所
-    const exchanges = [...new Set(monthEvents.map(event => event.exchange).filter(Boolean))].sort();
-    
-    // 计算每个交易所的统计
-    const stats = {};
-    exchanges.forEach(exchange => {
-        const exchangeEvents = monthEvents.filter(event => event.exchange === exchange);
-        stats[exchange] = {
-            total: exchangeEvents.length,
-            spot: exchangeEvents.filter(e => e.type === 'spot').length,
-            perp: exchangeEvents.filter(e => e.type === 'perp').length,
-            premarket: exchangeEvents.filter(e => e.type === 'pre-market').length,
-            alpha: exchangeEvents.filter(e => e.type === 'alpha').length
-        };
-    });
+    const exchanges = Object.keys(stats).sort();
     
     // 按总数排序
     const sortedExchanges = exchanges.sort((a, b) => stats[b].total - stats[a].total);
@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+"""
+用 benchmarks/load_harness.py 的假 Telegram 客户端检查回填和守护模式（不需要 telethon 和网络）：
+  - 守护模式按 debounce 合并发布，编辑消息替换原来的 listing
+  - 并行回填按 ID 从新到旧合并各个范围，遇到 FloodWait 后结果与顺序回填相同
+  - 回填出错时保存进度并返回 None
+
+运行：python -m pytest -q
+"""
+
+import asyncio
+import contextlib
+import io
+import json
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'benchmarks'))
+
+import load_harness  # noqa: E402
+from load_harness import (  # noqa: E402
+    CHANNEL,
+    FAKE_EVENTS,
+    AnnouncementGenerator,
+    FakeFloodWait,
+    FakeTelegramClient,
+    patched,
+    working_directory,
+)
+
+import scraper  # noqa: E402
+
+
+def harness_args(**overrides):
+    """load_harness 的命令行默认值"""
+    args = SimpleNamespace(latency=0.0, workers=0, message_cache=False, verbose=False,
+                           parallel=4, flood_waits=1, debounce=0.2, bursts=3, burst_size=20)
+    for name, value in overrides.items():
+        setattr(args, name, value)
+    return args
+
+
+def scraper_sandbox(size):
+    """在当前目录运行 scraper：不写消息缓存和 listing 数据库，使用新的解析缓存，不显示输出"""
+    stack = contextlib.ExitStack()
+    stack.enter_context(patched(MESSAGE_LIMIT=size, MESSAGE_CACHE='', LISTING_DB='',
+                                _EXTRACT_CACHE=scraper.ExtractionCache()))
+    stack.enter_context(contextlib.redirect_stdout(io.StringIO()))
+    return stack
+
+
+def test_watch_debounces_bursts():
+    args = harness_args()
+    result = load_harness.run_watch(1000, AnnouncementGenerator(), args)
+    assert result['same']
+    assert result['edited']
+    # 补齐一次，每批一次，编辑一次
+    assert result['publishes'] <= args.bursts + 2
+
+
+def test_watch_edit_replaces_listing(tmp_path):
+    client = FakeTelegramClient(300, AnnouncementGenerator())
+    message, token = load_harness.editable_message(client, 100)
+    assert message is not None
+
+    async def scenario():
+        task = asyncio.ensure_future(scraper.watch_channel(
+            client=client, debounce=0.1, channels=[CHANNEL], events=FAKE_EVENTS))
+        while not Path(scraper.CHECKPOINT_FILE).exists():
+            assert not task.done()
+            await asyncio.sleep(0.01)
+        await client.edit(CHANNEL, message.id, message.text.replace(token, token + 'Z'))
+        await asyncio.sleep(0.3)
+        await client.disconnect()
+        return await task
+
+    with working_directory(tmp_path), scraper_sandbox(300):
+        watcher = asyncio.run(scenario())
+        published = json.loads(Path(scraper.OUTPUT_JSON).read_text(encoding='utf-8'))
+    assert watcher is not None
+    tokens = {listing['token'] for listing in published if listing['message_id'] == message.id}
+    assert tokens == {token + 'Z'}
+
+
+async def collect_ids(pages):
+    return [message.id async for page in pages for message in page]
+
+
+def test_parallel_pages_merge_newest_first():
+    client = FakeTelegramClient(2345, AnnouncementGenerator(), flood_at={3, 9})
+    throttle = scraper.FloodThrottle(max_delay=0.05, flood_wait_error=FakeFloodWait)
+    state = {'offset_id': 0, 'fetched': 0, 'top_message_id': 0}
+    pages = scraper.parallel_pages(client, None, state, 100, 0, throttle, 4, asyncio.Semaphore(4),
+                                   range_pages=2)
+    ids = asyncio.run(collect_ids(pages))
+    assert ids == list(range(2345, 0, -1))
+    assert client.flood_waits == 2
+
+
+def test_parallel_backfill_matches_scrape():
+    for parallel in (1, 4):
+        result = load_harness.run_backfill(1000, AnnouncementGenerator(), harness_args(parallel=parallel))
+        assert result['same'], f"parallel={parallel}"
+        assert result['flood_waits'] == 1
+
+
+class FailingClient(FakeTelegramClient):
+    """第 fail_at 次请求抛出 RuntimeError"""
+
+    def __init__(self, *args, fail_at, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fail_at = fail_at
+
+    async def iter_messages(self, entity, **kwargs):
+        async for message in super().iter_messages(entity, **kwargs):
+            if self.requests >= self.fail_at:
+                raise RuntimeError('connection lost')
+            yield message
+
+
+def test_backfill_failure_keeps_progress(tmp_path):
+    client = FailingClient(1000, AnnouncementGenerator(), fail_at=4)
+    with working_directory(tmp_path), scraper_sandbox(1000):
+        result = asyncio.run(scraper.backfill(page_size=100, save_every=1, channels=[CHANNEL], client=client))
+        checkpoint = scraper.load_checkpoint()
+    assert result is None
+    assert checkpoint[CHANNEL]['backfill'] == {'offset_id': 701, 'fetched': 300, 'top_message_id': 1000}